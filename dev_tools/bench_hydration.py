@@ -0,0 +1,44 @@
+"""
+Micro-benchmark comparing the construction of Book instances from DB rows using
+__init__ (going through the column descriptors) and DBRow.from_row
+
+Usage: python dev_tools/bench_hydration.py [nr of rows] [repeats]
+"""
+import sys
+import os
+import timeit
+import sqlite3
+
+MODULE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+sys.path.insert(0, os.path.realpath(os.path.join(MODULE_DIR, '..')))
+sys.path.insert(0, os.path.realpath(os.path.join(MODULE_DIR, '..', 'tests')))
+
+from manga_db.manga import Book
+from utils import load_db_from_sql_file
+
+nr_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+db_con = load_db_from_sql_file(
+    os.path.join(MODULE_DIR, '..', 'tests', 'all_test_files', 'manga_db.sqlite.sql'),
+    ":memory:", True)
+rows = db_con.execute("SELECT * FROM Books").fetchall()
+rows = (rows * (nr_rows // len(rows) + 1))[:nr_rows]
+assert isinstance(rows[0], sqlite3.Row)
+
+
+def constructor():
+    return [Book(None, **row, in_db=True) for row in rows]
+
+
+def from_row():
+    return [Book.from_row(None, row) for row in rows]
+
+
+results = {}
+for name, func in (("__init__", constructor), ("from_row", from_row)):
+    results[name] = min(timeit.repeat(func, number=1, repeat=repeats))
+    print(f"{name:>10}: {results[name] * 1000:8.2f}ms for {nr_rows} rows "
+          f"({results[name] / nr_rows * 1e6:.2f}us per row)")
+print(f"Speedup: {results['__init__'] / results['from_row']:.1f}x")
@@ -49,7 +49,7 @@ for fn in [f for patt in ['tests/all_test_files/*.sql',
         # NOTE: IMPORTANT never migrate migration test sql file
         assert False
 
-    db_fn = os.path.join(tmpdir, fn.replace(os.sep, '_').replace(os.altsep, '_'))
+    db_fn = os.path.join(tmpdir, fn.replace(os.sep, '_').replace(os.altsep or os.sep, '_'))
     print('Migrating test sql file:', fn)
     # just needed to create a db file
     db_con = load_db_from_sql_file(fn, db_fn)
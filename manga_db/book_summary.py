@@ -0,0 +1,37 @@
+from typing import List, Optional, Any
+
+# Books columns listing pages display or sort by, read from Books itself so ordering
+# and keyset pagination can keep using the Books (col, id) indices
+SUMMARY_BOOK_COLUMNS = ("id", "title_eng", "title_foreign", "pages", "my_rating",
+                        "read_status", "cover_timestamp", "favorite", "last_change", "nsfw")
+SUMMARY_SELECT = f"""
+    SELECT {', '.join(f'Books.{col}' for col in SUMMARY_BOOK_COLUMNS)},
+           s.tags, s.artists, s.avg_ext_rating
+    FROM Books
+    JOIN BookSummary s ON s.book_id = Books.id"""
+# separator of the names in BookSummary's tags/artists columns
+SUMMARY_NAME_SEP = ";"
+
+
+def _split_names(joined: Optional[str]) -> List[str]:
+    return joined.split(SUMMARY_NAME_SEP) if joined else []
+
+
+class BookSummary:
+    """
+    Read-only subset of a Book's values that listing pages need, including the
+    tag/artist names and the average external rating that are precomputed in
+    the BookSummary table (kept current by triggers)
+    """
+
+    __slots__ = SUMMARY_BOOK_COLUMNS + ("tag", "artist", "avg_ext_rating")
+
+    def __init__(self, row: Any):
+        for col in SUMMARY_BOOK_COLUMNS:
+            setattr(self, col, row[col])
+        self.tag = _split_names(row["tags"])
+        self.artist = _split_names(row["artists"])
+        self.avg_ext_rating = row["avg_ext_rating"]
+
+    def __repr__(self):
+        return f"BookSummary(id={self.id}, title_eng={self.title_eng!r})"
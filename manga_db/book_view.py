@@ -0,0 +1,185 @@
+import sqlite3
+
+from collections import namedtuple
+from typing import Dict, Tuple, Type, Sequence, List, Mapping, Any, Union
+
+from .manga import Book
+from .ext_info import ExternalInfo
+from .constants import CENSOR_IDS, STATUS_IDS
+from .extractor import SUPPORTED_SITES, find_by_site_id, MANUAL_ADD
+
+# columns of the Books row and the associated columns (incl. ext_infos) that can be
+# requested, in the order Book declares them
+BOOK_VIEW_COLUMNS = tuple(Book.PRIMARY_KEY_COLUMNS + Book.COLUMNS)
+BOOK_VIEW_ASSOCIATIONS = tuple(Book.ASSOCIATED_COLUMNS)
+# Column default is returned instead of NULL, see Column.__get__
+_COLUMN_DEFAULTS = {col: getattr(Book, col).default for col in BOOK_VIEW_COLUMNS
+                    if getattr(Book, col).default is not None}
+
+
+class ExtInfoView(namedtuple("ExtInfoView",
+                             ExternalInfo.PRIMARY_KEY_COLUMNS + ExternalInfo.COLUMNS)):
+    """Immutable copy of an ExternalInfo row"""
+
+    __slots__ = ()
+
+    @property
+    def censorship(self) -> str:
+        return CENSOR_IDS[self.censor_id]
+
+    @property
+    def site(self) -> str:
+        return SUPPORTED_SITES[self.imported_from]
+
+    @property
+    def url(self) -> str:
+        if self.imported_from == MANUAL_ADD:
+            return self.id_onpage
+        else:
+            return find_by_site_id(self.imported_from).url_from_ext_info(self)
+
+    @property
+    def read_url(self) -> str:
+        if self.imported_from == MANUAL_ADD:
+            return self.id_onpage
+        else:
+            return find_by_site_id(self.imported_from).read_url_from_ext_info(self)
+
+    def to_export_string(self) -> str:
+        lines = []
+        for col in ExternalInfo.COLUMNS:
+            val = getattr(self, col)
+            col_name = col
+            if col == "censor_id":
+                val = CENSOR_IDS[val]
+                col_name = "censorship"
+            elif col == "imported_from":
+                val = SUPPORTED_SITES[val]
+            lines.append(f"{col_name}: {val}")
+        return "\n".join(lines)
+
+
+class BookView(tuple):
+    """
+    Base class of the immutable, tuple-backed records MangaDB.get_book_views returns
+    They only contain the requested columns (as fields with the column's name) and
+    associated columns (as tuples of names or ExtInfoViews), so they're a lot cheaper
+    than Book instances but can't be modified or saved
+    """
+
+    __slots__ = ()
+
+    @property
+    def title(self) -> str:
+        return Book.build_title(self.title_eng, self.title_foreign)
+
+    def to_export_string(self, language_map: Mapping[Union[int, str], Union[int, str]]) -> str:
+        """Same as Book.to_export_string, needs all columns and associated columns"""
+        lines = []
+        for col in Book.COLUMNS:
+            val = getattr(self, col)
+            col_name = col
+            if col == "language_id":
+                val = language_map[val]
+                col_name = "language"
+            elif col == "status_id":
+                val = STATUS_IDS[val]
+                col_name = "status"
+            lines.append(f"{col_name}: {val}")
+        for col in Book.ASSOCIATED_COLUMNS:
+            if col == "ext_infos":
+                continue
+            lines.append(f"{col}: {', '.join(getattr(self, col))}")
+
+        for ei in self.ext_infos:
+            lines.append("\n")
+            lines.append(f"External link:")
+            lines.append(ei.to_export_string())
+
+        return "\n".join(lines)
+
+
+# (columns, associations) -> BookView subclass
+_view_classes: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Type[BookView]] = {}
+
+
+def book_view_class(columns: Sequence[str], associations: Sequence[str] = ()) -> Type[BookView]:
+    """
+    Returns the BookView subclass for the columns and associations, which is only
+    created once per combination
+    """
+    key = (tuple(columns), tuple(associations))
+    try:
+        return _view_classes[key]
+    except KeyError:
+        pass
+    for col in key[0]:
+        if col not in BOOK_VIEW_COLUMNS:
+            raise ValueError(f"Unknown column: {col}")
+    for col in key[1]:
+        if col not in BOOK_VIEW_ASSOCIATIONS:
+            raise ValueError(f"Unknown associated column: {col}")
+    fields = namedtuple("BookViewFields", key[0] + key[1])
+    view_cls = _view_classes[key] = type("BookView", (fields, BookView), {"__slots__": ()})
+    return view_cls
+
+
+def fetch_book_views(db_con: sqlite3.Connection, book_ids: Sequence[int],
+                     columns: Sequence[str], associations: Sequence[str] = ()) -> List[BookView]:
+    """
+    Returns the BookViews of book_ids in the same order, ids that aren't in the DB
+    are skipped; takes one query for the rows and one per associated column
+    """
+    if "id" not in columns:
+        columns = ("id", *columns)
+    view_cls = book_view_class(columns, associations)
+    id_placeholders = ', '.join(['?'] * len(book_ids))
+    c = db_con.cursor()
+    # plain tuples since we don't need to access the rows by name
+    c.row_factory = None
+    c.execute(
+        f"SELECT {', '.join(columns)} FROM Books WHERE id IN ({id_placeholders})", book_ids)
+    rows_by_id: Dict[int, Tuple[Any, ...]] = {}
+    id_idx = columns.index("id")
+    defaults = [(i, _COLUMN_DEFAULTS[col]) for i, col in enumerate(columns)
+                if col in _COLUMN_DEFAULTS]
+    for row in c.fetchall():
+        if defaults:
+            row = list(row)
+            for i, default in defaults:
+                if row[i] is None:
+                    row[i] = default
+        rows_by_id[row[id_idx]] = tuple(row)
+
+    found_ids = [bid for bid in book_ids if bid in rows_by_id]
+    assoc_values = [_fetch_association(db_con, col, found_ids) for col in associations]
+    return [view_cls._make(
+                (*rows_by_id[bid], *(values.get(bid, ()) for values in assoc_values)))
+            for bid in found_ids]
+
+
+def _fetch_association(db_con: sqlite3.Connection, col_name: str,
+                       book_ids: Sequence[int]) -> Dict[int, Tuple[Any, ...]]:
+    if not book_ids:
+        return {}
+    if col_name != "ext_infos":
+        return {bid: tuple(names) for bid, names in
+                Book.fetch_associated_names_bulk(db_con, col_name, book_ids).items()}
+
+    id_placeholders = ', '.join(['?'] * len(book_ids))
+    c = db_con.cursor()
+    c.row_factory = None
+    c.execute(f"""
+            SELECT {', '.join(ExtInfoView._fields)}
+            FROM ExternalInfo
+            WHERE book_id IN ({id_placeholders})
+            -- matches idx_externalinfo_book_id so no sorting is needed
+            ORDER BY book_id, id""", book_ids)
+    ext_infos: Dict[int, List[ExtInfoView]] = {}
+    for row in c.fetchall():
+        ei = ExtInfoView._make(row)
+        try:
+            ext_infos[ei.book_id].append(ei)
+        except KeyError:
+            ext_infos[ei.book_id] = [ei]
+    return {bid: tuple(eis) for bid, eis in ext_infos.items()}
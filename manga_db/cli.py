@@ -7,8 +7,17 @@ from typing import Optional
 
 from .webGUI import create_app
 from .manga_db import MangaDB, update_cookies_from_file
-from .db.export import export_csv_from_sql
+from .manga import Book
+from .book_view import BOOK_VIEW_ASSOCIATIONS
+from .db.export import (
+    export_csv_from_sql, export_to_sql, compression_from_filename, COMPRESSION_FORMATS
+)
+from .db.backup import backup_db, snapshot_db
+from .db.query_stats import query_plan_report
+from .db.search import validate_order_by_str
 from .link_collector import LinkCollector
+from .thumbnails import backfill_derivatives
+from . import http_cache
 
 logger = logging.getLogger(__name__)
 
@@ -62,8 +71,47 @@ def main() -> None:
     export = subparsers.add_parser("export", aliases=["exp"])
     export.add_argument("csv_path", type=str, help="Path/Filename of csv file the db should be "
                         "exported to")
+    export.add_argument("-f", "--format", choices=("csv", "sql"), default="csv",
+                        help="Export a csv file or an sql script that re-creates the db")
+    export.add_argument("-c", "--compress", choices=COMPRESSION_FORMATS, default=None,
+                        help="Compress the output (default: based on the file extension "
+                             "'.gz' or '.zst')")
+    export.add_argument("--parallel", action="store_true",
+                        help="Dump the tables concurrently (sql format only)")
     export.set_defaults(func=_cl_export)
 
+    backup = subparsers.add_parser("backup", aliases=["bu"])
+    backup.add_argument("backup_path", type=str, help="Path/Filename of the backup file, "
+                        "an existing file will be replaced")
+    backup.add_argument("-s", "--snapshot", action="store_true",
+                        help="Write a compacted snapshot (VACUUM INTO) instead of a page by "
+                             "page copy; backup_path must not exist")
+    backup.set_defaults(func=_cl_backup)
+
+    thumbs = subparsers.add_parser("thumbs")
+    thumbs.add_argument("--overwrite", action="store_true",
+                        help="Re-generate the thumbnails of all covers instead of only the "
+                             "missing ones")
+    thumbs.set_defaults(func=_cl_thumbs)
+
+    search = subparsers.add_parser("search")
+    search.add_argument("search", type=str,
+                        help="Search string (same syntax as the webGUI's search)")
+    search.add_argument("-o", "--order-by", type=str, default="Books.id DESC",
+                        help="Column and order to sort by e.g. 'Books.pages ASC'")
+    search.set_defaults(func=_cl_search)
+
+    query_plan = subparsers.add_parser("query_plan")
+    query_plan.add_argument("search", nargs="?", default=None, type=str,
+                            help="Search string (same syntax as the webGUI's search) whose "
+                                 "statements should be explained; first page of the "
+                                 "main listing if omitted")
+    query_plan.add_argument("-o", "--order-by", type=str, default="Books.id DESC",
+                            help="Column and order to sort by e.g. 'Books.pages ASC'")
+    query_plan.add_argument("-n", "--nr-statements", type=int, default=10,
+                            help="Number of slowest statements to show")
+    query_plan.set_defaults(func=_cl_query_plan)
+
     args: argparse.Namespace = parser.parse_args()
     if len(sys.argv) == 1:
         # default to stdout, but stderr would be better (use sys.stderr, then exit(1))
@@ -86,6 +134,7 @@ def main() -> None:
         mdb_path = mdb_path if mdb_path else os.path.join(os.path.dirname(sys.argv[0]), "instance")
         os.makedirs(mdb_path, exist_ok=True)
         mdb = MangaDB(mdb_path, os.path.join(mdb_path, "manga_db.sqlite"))
+        http_cache.configure(os.path.join(mdb_path, "http_cache"))
 
         # load cookies file
         if args.cookies:
@@ -114,9 +163,9 @@ def _cl_get_info(args: argparse.Namespace, mdb: MangaDB) -> None:
 
 
 def _cl_show_book(args: argparse.Namespace, mdb: MangaDB) -> None:
-    b = mdb.get_book(args.id)
+    b = mdb.get_book_view(args.id, associations=BOOK_VIEW_ASSOCIATIONS)
     if b:
-        print(b.to_export_string())
+        print(b.to_export_string(mdb.language_map))
     else:
         print("No book with that id!")
 
@@ -130,23 +179,85 @@ def _cl_collector(args: argparse.Namespace, mdb: MangaDB) -> None:
     lc.cmdloop()
 
 
+def _print_export_progress(table_name: str, written: int, total: int) -> None:
+    if written == total:
+        print(f"Exported {table_name}: {total} row(s)")
+
+
 def _cl_export(args: argparse.Namespace, mdb: MangaDB) -> None:
-    export_csv_from_sql(args.csv_path, mdb.db_con)
+    compression = args.compress or compression_from_filename(args.csv_path)
+    if args.format == "sql":
+        export_to_sql(args.csv_path, mdb.db_con, compression=compression,
+                      progress=_print_export_progress, parallel=args.parallel)
+    else:
+        export_csv_from_sql(args.csv_path, mdb.db_con, compression=compression,
+                            progress=_print_export_progress)
     logger.info(f"Exported database at {os.path.join(mdb.root_dir, 'manga_db.sqlite')} to "
                 f"{os.path.abspath(args.csv_path)}!")
 
 
+def _print_backup_progress(copied: int, total: int) -> None:
+    print(f"\rBacked up {copied}/{total} pages", end="" if copied < total else "\n")
+
+
+def _cl_backup(args: argparse.Namespace, mdb: MangaDB) -> None:
+    # uses a separate connection so this also works while the webGUI is running
+    db_filename = os.path.join(mdb.root_dir, "manga_db.sqlite")
+    if args.snapshot:
+        snapshot_db(db_filename, args.backup_path)
+    else:
+        backup_db(db_filename, args.backup_path, progress=_print_backup_progress)
+    logger.info(f"Backed up database at {db_filename} to "
+                f"{os.path.abspath(args.backup_path)}!")
+
+
+def _print_thumbs_progress(done: int, total: int) -> None:
+    print(f"\rGenerated thumbnails for {done}/{total} covers", end="" if done < total else "\n")
+
+
+def _cl_thumbs(args: argparse.Namespace, mdb: MangaDB) -> None:
+    written = backfill_derivatives(os.path.join(mdb.root_dir, "thumbs"), mdb.db_con,
+                                   overwrite=args.overwrite, progress=_print_thumbs_progress)
+    print(f"Wrote {written} thumbnail(s)")
+
+
+def _cl_search(args: argparse.Namespace, mdb: MangaDB) -> None:
+    if not validate_order_by_str(args.order_by):
+        print("Invalid order by string:", args.order_by)
+        return
+    nr_books = 0
+    # streams the rows so even huge results don't have to fit into memory
+    for row in mdb.iter_search(args.search, order_by=args.order_by):
+        print(f"{row['id']}: {Book.build_title(row['title_eng'], row['title_foreign'])}")
+        nr_books += 1
+    print(f"Found {nr_books} book(s)")
+
+
+def _cl_query_plan(args: argparse.Namespace, mdb: MangaDB) -> None:
+    # only interested in the statements of the search not the ones from opening the db
+    if not validate_order_by_str(args.order_by):
+        print("Invalid order by string:", args.order_by)
+        return
+    mdb.db_con.reset_statement_stats()
+    if args.search:
+        mdb.search(args.search, order_by=args.order_by)
+    else:
+        mdb.get_x_books(60, order_by=args.order_by)
+    print(query_plan_report(mdb.db_con, args.nr_statements))
+
+
 def _cl_webgui(args: argparse.Namespace, instance_path: Optional[str] = None) -> None:
     # use terminal environment vars to set debug etc.
     # windows: set FLASK_ENV=development -> enables debug or set FLASK_DEBUG=1
     app = create_app(instance_path=instance_path)
-    # use threaded=False so we can leverage MangaDB's id_map
-    # also makes sense since we only want to support one user (at least with write access)
+    # requests that only read use a pool of read-only connections and the ones that
+    # write share a single writer connection (one request at a time) so page loads
+    # don't have to wait for e.g. an import
     # use host='0.0.0.0' or ip to run on machine's ip address and be accessible over lan
     if args.open:
-        app.run(threaded=False, host='0.0.0.0', port=args.port)
+        app.run(threaded=True, host='0.0.0.0', port=args.port)
     else:
-        app.run(threaded=False, port=args.port)
+        app.run(threaded=True, port=args.port)
 
 
 def cli_yes_no(question_str: str) -> bool:
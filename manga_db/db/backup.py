@@ -0,0 +1,134 @@
+import os
+import sqlite3
+import logging
+
+from typing import Optional, Callable, Union, Tuple
+
+logger = logging.getLogger(__name__)
+
+# nr of pages copied per backup step, locks on the source db are released between
+# steps so other connections (e.g. the webGUI's writer) can keep working
+BACKUP_PAGES_PER_STEP = 1024
+# seconds to sleep between steps when the source was busy or locked
+BACKUP_STEP_SLEEP = 0.05
+# max nr of free pages that get released after a migration if the db uses
+# incremental auto-vacuum
+MAX_INCREMENTAL_VACUUM_PAGES = 16384
+# fraction of free pages at which a db that doesn't use incremental auto-vacuum yet
+# gets a (one-time) full VACUUM that also enables it
+MIN_FREE_PAGES_FULL_VACUUM = 0.25
+AUTO_VACUUM_INCREMENTAL = 2
+
+# called with (nr of pages copied, total nr of pages)
+BackupProgress = Callable[[int, int], None]
+ConnectionOrFilename = Union[sqlite3.Connection, str]
+
+
+def _connect(db: ConnectionOrFilename, read_only: bool) -> Tuple[sqlite3.Connection, bool]:
+    """:return: Connection and whether we opened it ourselves"""
+    if isinstance(db, sqlite3.Connection):
+        return db, False
+    if read_only:
+        return sqlite3.connect(f"file:{db}?mode=ro", uri=True), True
+    return sqlite3.connect(db), True
+
+
+def backup_db(source: ConnectionOrFilename, dest: ConnectionOrFilename,
+              pages: int = BACKUP_PAGES_PER_STEP,
+              progress: Optional[BackupProgress] = None,
+              sleep: float = BACKUP_STEP_SLEEP) -> None:
+    """
+    Copies the db source to dest using sqlite's online backup API, pages pages at
+    a time, so the source can be used by other connections during the backup
+    (changes by other connections restart the backup, changes made through the
+    source connection are copied to dest)
+    Unlike copying the file this includes the contents of the WAL file
+
+    If dest is a filename the backup is written to a temporary file that replaces
+    dest once the backup is complete, so an existing file never ends up half-written
+
+    :param source: Connection or filename of the db to back up
+    :param dest: Connection or filename of the db that gets overwritten
+    :param progress: Called with (pages copied, total pages) after every step
+    """
+    if pages < 1:
+        raise ValueError("pages has to be >= 1")
+    # don't hand sqlite3 our callback directly since it reports the remaining pages
+    callback = None
+    if progress is not None:
+        def callback(status: int, remaining: int, total: int) -> None:
+            progress(total - remaining, total)
+
+    src_con, close_src = _connect(source, read_only=True)
+    tmp_filename = None
+    try:
+        if isinstance(dest, sqlite3.Connection):
+            dest_con = dest
+        else:
+            tmp_filename = f"{dest}.tmp"
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            dest_con = sqlite3.connect(tmp_filename)
+        try:
+            src_con.backup(dest_con, pages=pages, progress=callback, sleep=sleep)
+        finally:
+            if tmp_filename is not None:
+                dest_con.close()
+    except BaseException:
+        if tmp_filename is not None and os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+    finally:
+        if close_src:
+            src_con.close()
+
+    if tmp_filename is not None:
+        os.replace(tmp_filename, dest)  # type: ignore
+
+
+def snapshot_db(source: ConnectionOrFilename, dest_filename: str) -> None:
+    """
+    Writes a compacted copy of source to dest_filename (which must not exist yet)
+    using VACUUM INTO, all inside one read transaction so the snapshot is consistent
+    even while other connections are writing
+    Falls back to backup_db for sqlite versions prior to 3.27.0
+    """
+    if os.path.exists(dest_filename):
+        raise FileExistsError(f"Snapshot destination '{dest_filename}' already exists!")
+    if sqlite3.sqlite_version_info < (3, 27, 0):
+        backup_db(source, dest_filename)
+        return
+
+    src_con, close_src = _connect(source, read_only=True)
+    try:
+        src_con.execute("VACUUM INTO ?", (dest_filename,))
+    finally:
+        if close_src:
+            src_con.close()
+
+
+def compact_db(db_con: sqlite3.Connection,
+               max_pages: int = MAX_INCREMENTAL_VACUUM_PAGES,
+               min_free_full_vacuum: float = MIN_FREE_PAGES_FULL_VACUUM) -> None:
+    """
+    Releases free pages without rebuilding the whole db every time:
+    dbs using incremental auto-vacuum release at most max_pages free pages, others
+    only get a full VACUUM (switching them to incremental auto-vacuum) once at least
+    min_free_full_vacuum of their pages are free
+    NOTE: can't be used inside a transaction
+    """
+    auto_vacuum = db_con.execute("PRAGMA auto_vacuum").fetchone()[0]
+    if auto_vacuum == AUTO_VACUUM_INCREMENTAL:
+        # every step of the statement frees one page, but the sqlite3 module stops
+        # stepping statements that return no rows after the first step
+        # -> executescript steps through it completely
+        db_con.executescript(f"PRAGMA incremental_vacuum({int(max_pages)});")
+        return
+
+    free_pages = db_con.execute("PRAGMA freelist_count").fetchone()[0]
+    total_pages = db_con.execute("PRAGMA page_count").fetchone()[0]
+    if total_pages and free_pages / total_pages >= min_free_full_vacuum:
+        logger.info("Running a one-time full VACUUM to enable incremental auto-vacuum!")
+        # auto_vacuum can only be changed on existing dbs by a VACUUM
+        db_con.execute(f"PRAGMA auto_vacuum={AUTO_VACUUM_INCREMENTAL}")
+        db_con.execute("VACUUM")
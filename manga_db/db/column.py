@@ -12,6 +12,11 @@ def committed_state_callback(instance, col_name: str, was_uninitialized: bool, b
             instance._committed_state[col_name] = before
 
 
+def needs_committed_state(instance, col_name: str) -> bool:
+    # only the first change gets recorded by committed_state_callback
+    return col_name not in instance._committed_state
+
+
 # NOTE: this will only be raised when we try to access the column's value
 # when it hasn't been initialized yet which should only ever happen in the
 # owning classes' __init__ (or some derivative)
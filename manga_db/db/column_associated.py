@@ -1,60 +1,87 @@
 from typing import (
     Generic, TypeVar, Dict, Any, Callable, Optional, Union, Type,
-    Set, overload, List, Iterable, Sequence
+    Set, overload, List, Iterable, Sequence, Tuple
 )
 
-from .column import committed_state_callback, UninitializedColumn
-from .constants import Relationship
+from .column import committed_state_callback, needs_committed_state, UninitializedColumn
+from .constants import Relationship, NOT_LOADED
+
+
+# methods that can modify a list, only those need to be tracked
+# NOTE: __init__ is excluded so when we initialize the instance it wont call the
+# callback/count as change -> otherwise loading from db would count as change
+TRACKED_LIST_METHODS = (
+    'append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+    '__setitem__', '__delitem__', '__iadd__', '__imul__',
+)
+
+# (owner class, attribute name, base, on_change_callback, needs_before) -> trackable class
+_trackable_classes: Dict[Tuple[Type, str, Type, Callable, Optional[Callable]], Type] = {}
 
 
 # adapted from https://stackoverflow.com/a/8859168 Andrew Clark
 def trackable_type(instance: Any, name: str, base: Type,
                    on_change_callback: Callable[[Any, str, bool, Any, Any], None],
-                   *init_args, **init_kwargs) -> Any:
+                   *init_args,
+                   needs_before: Optional[Callable[[Any, str], bool]] = None,
+                   **init_kwargs) -> Any:
+    """
+    Returns an instance of base (initialized with init_args/init_kwargs) that calls
+    on_change_callback(instance, name, was_uninitialized, before, after) whenever
+    it gets modified
+
+    The class is only created once per (owner class, name) and then re-used
+    :param needs_before: Optional func(instance, name) that returns False if the
+                         callback doesn't need to know about further changes
+                         e.g. since the committed state was already recorded so we
+                         don't have to copy the old value
+    """
+    key = (type(instance), name, base, on_change_callback, needs_before)
+    try:
+        trackable_cls = _trackable_classes[key]
+    except KeyError:
+        trackable_cls = _trackable_classes[key] = _create_trackable_class(
+            name, base, on_change_callback, needs_before)
+
+    # initialize TrackableObject (uses base.__init__) with init_args/kwargs
+    obj = trackable_cls(*init_args, **init_kwargs)
+    obj._tracked_instance = instance
+    return obj
+
+
+def _create_trackable_class(name: str, base: Type,
+                            on_change_callback: Callable[[Any, str, bool, Any, Any], None],
+                            needs_before: Optional[Callable[[Any, str], bool]]) -> Type:
     def func_add_callback(func):
         def wrapped(self, *args, **kwargs):
+            instance = self._tracked_instance
+            if needs_before is not None and not needs_before(instance, name):
+                return func(self, *args, **kwargs)
             before = base(self)
             result = func(self, *args, **kwargs)
-            after = base(self)
-            if before != after:
+            # only copied the value before the change, compare against ourselves
+            # instead of making another copy
+            if before != self:
                 # on_change_callback(instance, name, was_uninitialized, before, after)
                 # can access an uninitialized value here?
-                on_change_callback(instance, name, False, before, after)
+                on_change_callback(instance, name, False, before, self)
             return result
         return wrapped
 
-    # (<class 'method_descriptor'>, <class 'wrapper_descriptor'>)
-    methods = (type(list.append), type(list.__setitem__))
-    # we also exclude __init__ here so when we initialize the instance
-    # it wont call the callback/count as change
-    # -> otherwise loading from db would count as change
-    # if __init__ is also wrapped it also tracks when item is assigned to
-    # a trackable type e.g. instance.tag = ["Tag1", "Tag2"] would add the prev
-    # val to _committed_state
-    skip = set(['__iter__', '__len__', '__getattribute__', '__init__'])
-
-    # ceate Metaclass for trackable class
-    class TrackableMeta(type):
-        def __new__(cls, name, bases, dct):
-            for attr in dir(base):
-                if attr not in skip:
-                    func = getattr(base, attr)
-                    # wrap method call so we get a callback
-                    if isinstance(func, methods):
-                        dct[attr] = func_add_callback(func)
-            return type.__new__(cls, name, bases, dct)
-
-    # inherit from base class and use metaclass TrackableMeta
-    # to apply callback to base class methods
-    # NOTE: mypy can't check this since Base class base is dynamic
-    class TrackableObject(base, metaclass=TrackableMeta):  # type: ignore
-        # metaclass kwarg -> py3
-        # py2: __metaclass__ = TrackableMeta
-        pass
-    TrackableObject.__name__ = f"{name}_{base.__name__}"
+    if base is list:
+        tracked = TRACKED_LIST_METHODS
+    else:
+        # (<class 'method_descriptor'>, <class 'wrapper_descriptor'>)
+        methods = (type(list.append), type(list.__setitem__))
+        skip = set(['__iter__', '__len__', '__getattribute__', '__init__', '__new__'])
+        tracked = tuple(attr for attr in dir(base)
+                        if attr not in skip and isinstance(getattr(base, attr), methods))
 
-    # initialize TrackableObject (uses base.__init__) with init_args/kwargs
-    return TrackableObject(*init_args, **init_kwargs)
+    dct: Dict[str, Any] = {attr: func_add_callback(getattr(base, attr)) for attr in tracked}
+    # instance that owns the tracked value gets set per object by trackable_type
+    dct['__slots__'] = ('_tracked_instance',)
+    # inherit from base class with the wrapped methods added
+    return type(f"{name}_{base.__name__}", (base,), dct)
 
 
 # type of tracked column
@@ -70,9 +97,13 @@ class AssociatedColumnBase(Generic[T]):
     # name -> callabck (instance, name, before, after)
     callbacks: Dict[str, Set[Callable[[T, str, bool, Any, Any], None]]]
 
-    def __init__(self, table_name: str, relationship: Relationship, **kwargs):
+    def __init__(self, table_name: str, relationship: Relationship, lazy: bool = False,
+                 **kwargs):
         self.table_name = table_name
         self.relationship = relationship
+        # lazy columns are only fetched from the DB when they're first accessed
+        # the owning class has to implement fetch_associated_column(col_name)
+        self.lazy = lazy
         self.callbacks = {}
 
     # new in py3.6: Called at the time the owning class owner is created. The descriptor has been
@@ -102,13 +133,58 @@ class AssociatedColumnBase(Generic[T]):
             # use name (== name of assigned attribute) to access value on INSTANCE's __dict__
             # so we can have unhashable types as instances (e.g. subclass of list or classes that
             # define __eq__ but not __hash__ (ExternalInfo)
-            return vars(instance)[self.name]
+            val = vars(instance)[self.name]
         except KeyError:
             raise UninitializedColumn
+        if val is NOT_LOADED:
+            val = self.load(instance)
+        return val
 
     def __set__(self, instance, value):
         raise NotImplementedError
 
+    def _wrap_loaded(self, instance: Any, value: Any) -> Any:
+        return value
+
+    def load(self, instance: Any) -> Any:
+        """
+        Fetches the column's value from the DB and stores it on the instance
+        Loading doesn't count as change so neither _committed_state nor the callbacks
+        are touched
+        """
+        return self.set_loaded(instance, instance.fetch_associated_column(self.name))
+
+    def set_loaded(self, instance: Any, value: Any) -> Any:
+        """
+        Stores a value that was fetched from the DB on the instance, used when
+        loading multiple instances at once
+        """
+        value = self._wrap_loaded(instance, value)
+        vars(instance)[self.name] = value
+        return value
+
+    def set_unloaded(self, instance: Any) -> None:
+        """
+        Marks the column as not loaded so it will be re-fetched on next access, this also
+        discards all changes to the column that haven't been saved yet
+        """
+        vars(instance)[self.name] = NOT_LOADED
+        instance._committed_state.pop(self.name, None)
+
+    def is_loaded(self, instance: Any) -> bool:
+        return vars(instance).get(self.name, NOT_LOADED) is not NOT_LOADED
+
+    def _get_before(self, instance: Any) -> Tuple[bool, Any]:
+        try:
+            before = vars(instance)[self.name]
+        except KeyError:
+            return True, None
+        if before is NOT_LOADED:
+            # need the value from the DB as committed state otherwise we can't
+            # diff against it when saving
+            before = self.load(instance)
+        return False, before
+
     def __delete__(self, instance):
         del instance.__dict__[self.name]
 
@@ -146,18 +222,10 @@ class AssociatedColumnMany(AssociatedColumnBase[T]):
         self.assoc_table = assoc_table
 
     def __set__(self, instance: Any, value: Iterable[T]) -> None:
-        if value:
-            value = trackable_type(instance, self.name, list, committed_state_callback, value)
-        else:
-            # dont set to None or other unwanted type use our trackable set instead
-            value = trackable_type(instance, self.name, list, committed_state_callback)
+        # dont set to None or other unwanted type use our trackable list instead
+        value = self._wrap_loaded(instance, value)
 
-        was_uninitialized = False
-        try:
-            before = self.__get__(instance, instance.__class__)
-        except UninitializedColumn:
-            was_uninitialized = True
-            before = None
+        was_uninitialized, before = self._get_before(instance)
 
         committed_state_callback(instance, self.name, was_uninitialized, before, value)
 
@@ -168,18 +236,21 @@ class AssociatedColumnMany(AssociatedColumnBase[T]):
         for callback in self.callbacks.get(self.name, []):
             callback(instance, self.name, was_uninitialized, before, value)
 
+    def _wrap_loaded(self, instance: Any, value: Optional[Iterable[T]]) -> Any:
+        if value:
+            return trackable_type(instance, self.name, list, committed_state_callback, value,
+                                  needs_before=needs_committed_state)
+        else:
+            return trackable_type(instance, self.name, list, committed_state_callback,
+                                  needs_before=needs_committed_state)
+
 
 class AssociatedColumnOne(AssociatedColumnBase[T]):
 
     callbacks: Dict[str, Set[Callable[[T, str, bool, Optional[T], Optional[T]], None]]]
 
     def __set__(self, instance: Any, value: Optional[T]):
-        was_uninitialized = False
-        try:
-            before = self.__get__(instance, instance.__class__)
-        except UninitializedColumn:
-            was_uninitialized = True
-            before = None
+        was_uninitialized, before = self._get_before(instance)
 
         committed_state_callback(instance, self.name, was_uninitialized, before, value)
         # call registered callback and inform them of new value
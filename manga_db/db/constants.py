@@ -8,6 +8,20 @@ class Relationship(enum.Enum):
     MANYTOMANY = 3
 
 
+class Symbol:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+# placeholder value for a lazy associated column that hasn't been fetched from the DB yet
+# uses a Symbol instance so it can't compare equal to any value that could be stored in a cell
+# see below
+NOT_LOADED = Symbol("NOT_LOADED")
+
+
 # could also use a helper class instance to represent my constants
 # since they wont compare true against values that could be stored in a cell
 # >>> a=1
@@ -1,21 +1,85 @@
 import csv
+import io
+import os
+import gzip
+import shutil
 import sqlite3
 import datetime
+import tempfile
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, IO, List, Tuple
 
-def export_csv_from_sql(filename, db_con):
+# nr of rows fetched from a table cursor at once
+EXPORT_CHUNK_SIZE = 1000
+# size of the write buffer in front of the (compressed) output file
+EXPORT_BUFFER_SIZE = 1 << 20
+MAX_EXPORT_WORKERS = 4
+COMPRESSION_FORMATS = ("gzip", "zstd")
+
+# called with (table name, nr of rows written, total nr of rows)
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def open_export_file(filename: str, compression: Optional[str] = None,
+                     newline: Optional[str] = None) -> IO[str]:
+    """
+    Opens filename for writing text (UTF-8) through a buffer of EXPORT_BUFFER_SIZE
+    bytes, optionally compressing the output
+
+    :param compression: None, 'gzip' or 'zstd' (needs the zstandard package)
+    """
+    if compression is None:
+        return open(filename, "w", encoding="utf-8", newline=newline,
+                    buffering=EXPORT_BUFFER_SIZE)
+    elif compression == "gzip":
+        raw = gzip.open(filename, "wb")
+    elif compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd compression needs the 'zstandard' package to be "
+                             "installed!") from None
+        raw = zstandard.ZstdCompressor().stream_writer(open(filename, "wb"))
+    else:
+        raise ValueError(f"Unknown compression format: {compression}")
+    return io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=EXPORT_BUFFER_SIZE),
+                            encoding="utf-8", newline=newline)
+
+
+def compression_from_filename(filename: str) -> Optional[str]:
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == ".gz":
+        return "gzip"
+    elif ext == ".zst":
+        return "zstd"
+    return None
+
+
+def export_csv_from_sql(filename: str, db_con: sqlite3.Connection,
+                        compression: Optional[str] = None,
+                        progress: Optional[ProgressCallback] = None) -> None:
     """
     Fetches and writes all rows (with all cols) in db_con's database to the file filename using
     writerows() from the csv module
+    Rows are streamed from the cursor in chunks of EXPORT_CHUNK_SIZE so memory use
+    doesn't grow with the size of the db
 
     writer kwargs: dialect='excel', delimiter=";"
 
     :param filename: Filename or path to file
     :param db_con: Connection to sqlite db
+    :param compression: None, 'gzip' or 'zstd'
+    :param progress: Called with ('Books', rows written, total rows) after every chunk
     :return: None
     """
+    total = 0
+    if progress is not None:
+        total = db_con.execute("""
+            SELECT count(*) FROM Books
+            LEFT JOIN ExternalInfo ei ON Books.id = ei.book_id""").fetchone()[0]
     # newline="" <- important otherwise weird behaviour with multiline cells (adding \r) etc.
-    with open(filename, "w", newline="", encoding="utf-8") as csvfile:
+    with open_export_file(filename, compression, newline="") as csvfile:
         # excel dialect -> which line terminator(\r\n), delimiter(,) to use, when to quote
         # cells etc.
         csvwriter = csv.writer(csvfile, dialect="excel", delimiter=";")
@@ -96,14 +160,19 @@ def export_csv_from_sql(filename, db_con):
                 LEFT JOIN ExternalInfo ei ON Books.id = ei.book_id
                 GROUP BY Books.id, ei.id
             """)
-        rows = c.fetchall()
-
         # cursor.description -> sequence of 7-item sequences each containing info describing
         # one result column
         col_names = [description[0] for description in c.description]
         csvwriter.writerow(col_names)  # header
-        # write the all the rows to the file
-        csvwriter.writerows(rows)
+        written = 0
+        while True:
+            rows = c.fetchmany(EXPORT_CHUNK_SIZE)
+            if not rows:
+                break
+            csvwriter.writerows(rows)
+            written += len(rows)
+            if progress is not None:
+                progress("Books", written, total)
 
 # also possible using FULL LEFT OUTER JOIN but subqueries is surprisingly faster
 # -- inner join would only select rows that have an entry in both tables -> use left outer join
@@ -160,20 +229,104 @@ def convert_or_escape_to_str(column_value):
         return str(column_value)
 
 
-def export_to_sql(filename, db_con):
+def _write_table_rows(out: IO[str], db_con: sqlite3.Connection, tbl_name: str,
+                      progress: Optional[ProgressCallback] = None) -> None:
+    """
+    Writes a single multi-row INSERT statement containing all rows of tbl_name
+    (nothing for empty tables), every line is prefixed with a newline
+    """
+    total = db_con.execute(f"SELECT count(*) FROM \"{tbl_name}\"").fetchone()[0]
+    if not total:
+        if progress is not None:
+            progress(tbl_name, 0, 0)
+        return
+
+    out.write(f"\nINSERT INTO \"{tbl_name}\" VALUES")
+    # separate cursor so we don't interfere with the caller's
+    c = db_con.execute(f"SELECT * FROM \"{tbl_name}\"")
+    written = 0
+    sep = "\n"
+    while True:
+        rows = c.fetchmany(EXPORT_CHUNK_SIZE)
+        if not rows:
+            break
+        for tr in rows:
+            out.write(f"{sep}({','.join(convert_or_escape_to_str(c) for c in tr)})")
+            sep = ",\n"
+        written += len(rows)
+        if progress is not None:
+            progress(tbl_name, written, total)
+    out.write(";")
+
+
+def _db_filename(db_con: sqlite3.Connection) -> Optional[str]:
+    # empty for in-memory and temporary dbs
+    for _, name, filename in db_con.execute("PRAGMA database_list").fetchall():
+        if name == "main":
+            return filename or None
+    return None
+
+
+def _dump_table_to_file(db_filename: str, tbl_name: str, dump_filename: str,
+                        progress: Optional[ProgressCallback]) -> None:
+    # sqlite3 connections can't be shared between threads -> every worker uses its
+    # own read-only one
+    db_con = sqlite3.connect(f"file:{db_filename}?mode=ro", uri=True,
+                             detect_types=sqlite3.PARSE_DECLTYPES)
+    try:
+        with open(dump_filename, "w", encoding="utf-8",
+                  buffering=EXPORT_BUFFER_SIZE) as out:
+            _write_table_rows(out, db_con, tbl_name, progress)
+    finally:
+        db_con.close()
+
+
+def export_to_sql(filename: str, db_con: sqlite3.Connection,
+                  compression: Optional[str] = None,
+                  progress: Optional[ProgressCallback] = None,
+                  parallel: bool = False, max_workers: int = MAX_EXPORT_WORKERS) -> None:
+    """
+    Dumps the schema and all rows of db_con's database as an sql script to filename
+    Table rows are streamed from their cursors in chunks and written through a buffered
+    file object, so memory use doesn't grow with the size of the db
+
+    :param compression: None, 'gzip' or 'zstd'
+    :param progress: Called with (table name, rows written, total rows) while dumping
+                     a table's rows; in parallel mode it gets called from the worker
+                     threads
+    :param parallel: Dump the rows of independent tables concurrently over separate
+                     read-only connections into temporary files which then get
+                     concatenated in order; falls back to dumping serially for
+                     in-memory dbs
+                     NOTE: every connection reads its own snapshot so the db must not
+                     be written to during the export
+    """
     row_fac_bu = db_con.row_factory
     db_con.row_factory = sqlite3.Row
+    try:
+        _export_to_sql(filename, db_con, compression, progress, parallel, max_workers)
+    finally:
+        db_con.row_factory = row_fac_bu
+
 
+def _export_to_sql(filename: str, db_con: sqlite3.Connection, compression: Optional[str],
+                   progress: Optional[ProgressCallback], parallel: bool,
+                   max_workers: int) -> None:
     c = db_con.execute(
             "SELECT type, name, tbl_name, sql FROM sqlite_master ORDER BY name")
     sql_master = c.fetchall()
 
     # sql statement is exactly the same as when table/index/trigger was
     # created, including comments
-    index_creation_statements = []
-    table_names = []
-    trigger_creation_statements = []
-    result = ["PRAGMA foreign_keys=off;", "BEGIN TRANSACTION;"]
+    index_creation_statements: List[Tuple[str, str]] = []
+    table_names: List[str] = []
+    trigger_creation_statements: List[Tuple[str, str]] = []
+    # virtual (fts5) tables create their own shadow tables named {vt_name}_{suffix}
+    # -> only the virtual table gets exported and its index gets rebuilt after
+    # all the rows have been inserted
+    virtual_table_names = [row['name'] for row in sql_master if row['type'] == 'table' and
+                           row['sql'].upper().startswith("CREATE VIRTUAL TABLE")]
+    table_creation_statements = []
     for row in sql_master:
         if row['name'].startswith("sqlite_autoindex_"):
             continue
@@ -183,30 +336,48 @@ def export_to_sql(filename, db_con):
         elif type_name == 'index':
             index_creation_statements.append((row['name'], row['sql']))
         elif type_name == 'table':
-            table_names.append(row['name'])
+            if any(row['name'].startswith(f"{vt}_") for vt in virtual_table_names):
+                continue
+            if row['name'] not in virtual_table_names:
+                table_names.append(row['name'])
             # create all tables first
-            result.append(f"{row['sql']};")
+            table_creation_statements.append(f"{row['sql']};")
         else:
             assert 0
 
-    # insert all the values
-    for tbl_name in table_names:
-        result.append(f"INSERT INTO \"{tbl_name}\" VALUES")
-        table_rows = c.execute(f"SELECT * FROM {tbl_name}").fetchall()
-        for i, tr in enumerate(table_rows):
-            result.append(f"({','.join(convert_or_escape_to_str(c) for c in tr)})"
-                          f"{';' if i == len(table_rows)-1 else ','}")
+    db_filename = _db_filename(db_con) if parallel else None
+    with open_export_file(filename, compression) as f:
+        f.write("PRAGMA foreign_keys=off;\nBEGIN TRANSACTION;")
+        for stmt in table_creation_statements:
+            f.write(f"\n{stmt}")
 
-    for idx_name, idx_statement in index_creation_statements:
-        result.append(f"{idx_statement};")
+        # insert all the values
+        if db_filename is not None and len(table_names) > 1:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                dump_filenames = [os.path.join(tmpdir, f"{i}.sql")
+                                  for i in range(len(table_names))]
+                with ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="export") as executor:
+                    futures = [executor.submit(_dump_table_to_file, db_filename, tbl_name,
+                                               dump_fn, progress)
+                               for tbl_name, dump_fn in zip(table_names, dump_filenames)]
+                    # re-raise exceptions from the workers
+                    for future in futures:
+                        future.result()
+                for dump_fn in dump_filenames:
+                    with open(dump_fn, "r", encoding="utf-8") as dump:
+                        shutil.copyfileobj(dump, f, EXPORT_BUFFER_SIZE)
+        else:
+            for tbl_name in table_names:
+                _write_table_rows(f, db_con, tbl_name, progress)
 
-    for trigger_name, trigger_statement in trigger_creation_statements:
-        result.append(f"{trigger_statement};")
+        for vt_name in virtual_table_names:
+            f.write(f"\nINSERT INTO \"{vt_name}\"(\"{vt_name}\") VALUES ('rebuild');")
 
-    result.append("COMMIT;")
-    result.append("PRAGMA foreign_keys=on;")
+        for idx_name, idx_statement in index_creation_statements:
+            f.write(f"\n{idx_statement};")
 
-    with open(filename, 'w', encoding='UTF-8') as f:
-        f.write("\n".join(result))
+        for trigger_name, trigger_statement in trigger_creation_statements:
+            f.write(f"\n{trigger_statement};")
 
-    db_con.row_factory = row_fac_bu
+        f.write("\nCOMMIT;\nPRAGMA foreign_keys=on;")
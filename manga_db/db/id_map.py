@@ -1,13 +1,52 @@
+import time
 import weakref
 
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
 
 class IndentityMap:
+    """
+    Makes sure there's only ever one instance per row (key) by mapping keys to weakly
+    referenced instances
+
+    Optionally the lru_size most recently used instances are also kept strongly
+    referenced, so they're not gc'd (and re-hydrated on the next access) as soon as
+    the last outside reference is gone; instances that weren't used for lru_max_age
+    secs lose their strong reference
+    """
 
-    def __init__(self):
+    def __init__(self, lru_size: int = 0, lru_max_age: Optional[float] = None):
         # d[key] directly returns acutal object (not weakref)
         # if value gets gc'd key/entry gets autmatically removed from WeakValueDictionary
         # if we retrieved and assigned the obj to a var then it wont be collected by gc anymore
         self._dict = weakref.WeakValueDictionary()
+        self.lru_size = lru_size
+        self.lru_max_age = lru_max_age
+        # key -> (obj, time it was last used) least recently used first
+        self._lru: "OrderedDict[Any, tuple[Any, float]]" = OrderedDict()
+        # lookups using get
+        self.hits = 0
+        self.misses = 0
+
+    def _keep(self, key, obj):
+        if not self.lru_size:
+            return
+        self._lru[key] = (obj, time.monotonic())
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def _drop_expired(self):
+        if self.lru_max_age is None:
+            return
+        oldest_allowed = time.monotonic() - self.lru_max_age
+        lru = self._lru
+        while lru:
+            key, (obj, last_used) = next(iter(lru.items()))
+            if last_used >= oldest_allowed:
+                break
+            del lru[key]
 
     def add(self, obj):
         if not obj._in_db:
@@ -20,6 +59,7 @@ class IndentityMap:
                                 "an instance present for this key!")
             else:
                 self._dict[key] = obj
+                self._keep(key, obj)
                 return True
 
     def add_unprecedented(self, obj):
@@ -28,10 +68,15 @@ class IndentityMap:
         else:
             key = obj.key
             self._dict[key] = obj
+            self._keep(key, obj)
             return True
 
     def remove(self, key):
+        # keep the strong ref till it's removed from _dict, otherwise the entry would
+        # already be gone when the lru held the last reference
+        kept = self._lru.pop(key, None)
         del self._dict[key]
+        del kept
 
     def discard(self, key):
         try:
@@ -40,6 +85,10 @@ class IndentityMap:
         except KeyError:
             return False
 
+    def clear(self):
+        self._lru.clear()
+        self._dict.clear()
+
     def __getitem__(self, key):
         return self._dict[key]
 
@@ -47,11 +96,20 @@ class IndentityMap:
         return key in self._dict
 
     def get(self, key, default=None):
+        if self._lru:
+            self._drop_expired()
         try:
             obj = self._dict[key]
-            return obj
         except KeyError:
+            self.misses += 1
             return default
+        self.hits += 1
+        self._keep(key, obj)
+        return obj
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._dict),
+                "lru_size": len(self._lru)}
 
     def items(self):
         return self._dict.items()
@@ -1,3 +1,8 @@
+from typing import Iterable, Sequence, List, Any
+
+# max nr of ids we pass to a single IN (...) clause when eager loading
+# SQLITE_MAX_VARIABLE_NUMBER defaults to 999 for sqlite versions prior to 3.32.0
+EAGER_LOAD_BATCH_SIZE = 500
 
 
 def load_instance(manga_db, cls, row, *args, **kwargs):
@@ -7,10 +12,33 @@ def load_instance(manga_db, cls, row, *args, **kwargs):
     # when we have lazy loading we have to populate cls instance with parts that havent been loaded
     # yet
     if instance is None:
-        instance = cls(manga_db, *args, **row, in_db=True, **kwargs)
+        # skips the descriptors, the values come straight from the db
+        instance = cls.from_row(manga_db, row, *args, **kwargs)
         id_map.add(instance)
     return instance
 
 
+def load_instances(manga_db, cls, rows: Iterable[Any], *args,
+                   eager: Sequence[str] = (), **kwargs) -> List[Any]:
+    """
+    Loads instances of cls from rows like load_instance does, but also fills the
+    associated columns named in eager for all instances at once, so it takes one query
+    per column (and batch of EAGER_LOAD_BATCH_SIZE rows) instead of one query per
+    column and row
+    """
+    manga_db._sync_cached_instances()
+    instances = [load_instance(manga_db, cls, row, *args, **kwargs) for row in rows]
+    for col in eager:
+        descriptor = getattr(cls, col)
+        # instances from the id_map might already have the column loaded
+        to_load = [inst for inst in instances if not descriptor.is_loaded(inst)]
+        for start in range(0, len(to_load), EAGER_LOAD_BATCH_SIZE):
+            batch = to_load[start:start + EAGER_LOAD_BATCH_SIZE]
+            values = cls.fetch_associated_column_bulk(manga_db, col, batch)
+            for inst, value in zip(batch, values):
+                descriptor.set_loaded(inst, value)
+    return instances
+
+
 def build_key_dictlike(cls, dictlike):
     return (cls, tuple((dictlike[col] for col in cls.PRIMARY_KEY_COLUMNS)))
@@ -2,14 +2,15 @@ import os
 import importlib
 import sqlite3
 import logging
-import shutil
+
+from .backup import backup_db, compact_db
 
 logger = logging.getLogger(__name__)
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # so we don't have to read all migration scripts every time
-LATEST_VERSION = 6
+LATEST_VERSION = 11
 VERSION_TABLE = 'MDB_Version'
 MIGRATIONS_DIRNAME = 'migrations'
 # migrations dir has to be a sub-folder of the MODULE_DIR
@@ -41,6 +42,18 @@ UPDATE {VERSION_TABLE} SET
     dirty = :dirty"""
 
 
+def is_up_to_date(db_con: sqlite3.Connection) -> bool:
+    """
+    Cheap check whether the db is on LATEST_VERSION, so opening a db doesn't need the
+    migration machinery (Database opens its own connection etc.) unless an upgrade
+    is actually needed
+    PRAGMA user_version is stored in the db header and gets set to the version after
+    a successful upgrade (dbs that were migrated by older versions have 0), so a
+    False doesn't necessarily mean the db needs to be upgraded
+    """
+    return db_con.execute("PRAGMA user_version").fetchone()[0] == LATEST_VERSION
+
+
 class MigrationError(Exception):
     pass
 
@@ -140,6 +153,12 @@ class Database:
         else:
             raise DatabaseError("No transaction in progress")
 
+    def _stamp_version(self):
+        # mirror the version in the db header for is_up_to_date
+        # NOTE: PRAGMAs don't support parameters
+        self.db_con.execute(f"PRAGMA user_version = {int(self.version)}")
+        self.db_con.commit()
+
     def _close(self):
         self.db_con.close()
 
@@ -204,10 +223,11 @@ class Database:
             if os.path.isfile(backup_filename):
                 logger.error("DB is dirty! Restoring from back-up!")
                 self.db_con.rollback()
+                # copying through the connection also resets the WAL unlike
+                # replacing the file
+                backup_db(backup_filename, self.db_con)
                 self.db_con.close()
                 self.db_con = None
-                os.remove(self.filename)
-                shutil.copy(backup_filename, self.filename)
                 self.__init__(self.filename)
             else:
                 raise DatabaseError("Previous upgrade failed and there is no backup available!"
@@ -215,11 +235,11 @@ class Database:
         else:
             # make a backup just to be sure
             if self.version != LATEST_VERSION:
-                # might have an old backup -> delete
-                if os.path.exists(backup_filename):
-                    os.remove(backup_filename)
-                shutil.copy(self.filename, backup_filename)
+                # replaces an old backup once it's complete
+                # NOTE: copying the file would miss changes that are still in the WAL
+                backup_db(self.db_con, backup_filename)
             else:
+                self._stamp_version()
                 return True
 
         assert not self.is_dirty
@@ -240,18 +260,13 @@ class Database:
             if not self._upgrade_to_version(new_version):
                 return False
         else:
-            # trigger manual VACUUM so db gets optimized after migrating it
-            # The VACUUM command does not change the content of the database
-            # except the rowid values. If you use INTEGER PRIMARY KEY column,
-            # the VACUUM does not change the values of that column
-            # good practice to run manually after deleting alot etc. -> so good
-            # after migration
-            # SQLite first copies data within a database file to a temporary
-            # database. This operation defragments the database objects,
-            # ignores the free spaces, and repacks individual pages.
-            # then the result is copied back overwriting the original DB
+            # release the pages that were freed by the migrations
+            # a full VACUUM (copies the whole db to a temporary db, then back) is only
+            # needed once to switch the db to incremental auto-vacuum, so upgrading big
+            # dbs doesn't take time proportional to their size every time
             logger.info("Optimizing DB after migration!")
-            self.db_con.execute("VACUUM")
+            compact_db(self.db_con)
+            self._stamp_version()
 
             return True
 
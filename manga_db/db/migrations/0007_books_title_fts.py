@@ -0,0 +1,46 @@
+import sqlite3
+
+date = '2026-10-18'
+requires_foreign_keys_off = False
+
+
+def upgrade(db_con: sqlite3.Connection, db_filename: str):
+    c = db_con.cursor()
+
+    # trigram tokenizer (substring matching like LIKE '%x%' does) needs sqlite 3.34+
+    # otherwise fall back to unicode61 with prefix indices -> token prefix matching
+    if sqlite3.sqlite_version_info >= (3, 34, 0):
+        tokenize = "tokenize='trigram'"
+    else:
+        tokenize = "tokenize='unicode61 remove_diacritics 2', prefix='2 3'"
+
+    # external content table so the titles aren't stored twice
+    c.execute(f"""
+    CREATE VIRTUAL TABLE BooksTitleFts USING fts5(
+        title_eng, title_foreign, content='Books', content_rowid='id', {tokenize}
+    )""")
+    c.execute("INSERT INTO BooksTitleFts(BooksTitleFts) VALUES ('rebuild')")
+
+    c.execute("""
+    CREATE TRIGGER books_title_fts_insert
+        AFTER INSERT ON Books
+        BEGIN
+            INSERT INTO BooksTitleFts(rowid, title_eng, title_foreign)
+            VALUES (NEW.id, NEW.title_eng, NEW.title_foreign);
+        END""")
+    c.execute("""
+    CREATE TRIGGER books_title_fts_delete
+        AFTER DELETE ON Books
+        BEGIN
+            INSERT INTO BooksTitleFts(BooksTitleFts, rowid, title_eng, title_foreign)
+            VALUES ('delete', OLD.id, OLD.title_eng, OLD.title_foreign);
+        END""")
+    c.execute("""
+    CREATE TRIGGER books_title_fts_update
+        AFTER UPDATE OF title_eng, title_foreign ON Books
+        BEGIN
+            INSERT INTO BooksTitleFts(BooksTitleFts, rowid, title_eng, title_foreign)
+            VALUES ('delete', OLD.id, OLD.title_eng, OLD.title_foreign);
+            INSERT INTO BooksTitleFts(rowid, title_eng, title_foreign)
+            VALUES (NEW.id, NEW.title_eng, NEW.title_foreign);
+        END""")
@@ -0,0 +1,21 @@
+date = '2026-10-18'
+requires_foreign_keys_off = False
+
+
+def upgrade(db_con, db_filename):
+    # bridge tables only have a PRIMARY KEY (book_id, x_id) so looking up the books
+    # for a tag etc. had to scan the whole table
+    bridge_tables = [
+        ("BookArtist", "artist_id"),
+        ("BookCategory", "category_id"),
+        ("BookCharacter", "character_id"),
+        ("BookCollection", "collection_id"),
+        ("BookGroups", "group_id"),
+        ("BookList", "list_id"),
+        ("BookParody", "parody_id"),
+        ("BookTag", "tag_id"),
+    ]
+    for table_name, col_name in bridge_tables:
+        db_con.execute(f"""
+        CREATE INDEX idx_{table_name.lower()}_{col_name}_book_id
+        ON {table_name} ({col_name}, book_id)""")
@@ -0,0 +1,13 @@
+date = '2026-10-18'
+requires_foreign_keys_off = False
+
+
+def upgrade(db_con, db_filename):
+    # (col, id) so sorting by any of the columns the books can be ordered by (with the
+    # id as tiebreaker for keyset pagination) can walk the index instead of sorting
+    # the whole table in a temp b-tree
+    for col_name in ("title_eng", "title_foreign", "pages", "my_rating", "last_change"):
+        db_con.execute(f"CREATE INDEX idx_books_{col_name}_id ON Books ({col_name}, id)")
+
+    # external infos are always fetched by their book's id
+    db_con.execute("CREATE INDEX idx_externalinfo_book_id ON ExternalInfo (book_id)")
@@ -0,0 +1,100 @@
+import sqlite3
+
+date = '2026-10-18'
+requires_foreign_keys_off = False
+
+
+def upgrade(db_con: sqlite3.Connection, db_filename: str):
+    c = db_con.cursor()
+
+    # values of a book that listing pages need but that would take additional queries
+    # per book (or a computation over all external infos) to get
+    # kept up-to-date by triggers so it doesn't matter where the changes come from
+    c.execute("""
+    CREATE TABLE BookSummary(
+            book_id INTEGER PRIMARY KEY,
+            -- names are ordered and separated by ';'
+            tags TEXT NOT NULL DEFAULT '',
+            artists TEXT NOT NULL DEFAULT '',
+            avg_ext_rating REAL,
+            FOREIGN KEY (book_id) REFERENCES Books(id)
+               ON DELETE CASCADE
+        )""")
+
+    c.execute("""
+    CREATE TRIGGER book_summary_books_insert
+        AFTER INSERT ON Books
+        BEGIN
+            INSERT OR REPLACE INTO BookSummary(book_id) VALUES (NEW.id);
+        END""")
+    c.execute("""
+    CREATE TRIGGER book_summary_books_delete
+        AFTER DELETE ON Books
+        BEGIN
+            DELETE FROM BookSummary WHERE book_id = OLD.id;
+        END""")
+
+    for table_name, bridge_col_name, summary_col in (("Tag", "tag_id", "tags"),
+                                                      ("Artist", "artist_id", "artists")):
+        names_sql = f"""
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM Book{table_name} bx, {table_name} x
+                    WHERE bx.book_id = {{book_id}} AND x.id = bx.{bridge_col_name}
+                    ORDER BY x.name
+                )
+            ), '')"""
+        for action, row in (("INSERT", "NEW"), ("DELETE", "OLD")):
+            c.execute(f"""
+            CREATE TRIGGER book_summary_book{table_name.lower()}_{action.lower()}
+                AFTER {action} ON Book{table_name}
+                BEGIN
+                    UPDATE BookSummary SET {summary_col} = {names_sql.format(
+                        book_id=f'{row}.book_id')}
+                    WHERE book_id = {row}.book_id;
+                END""")
+        c.execute(f"""
+        CREATE TRIGGER book_summary_{table_name.lower()}_rename
+            AFTER UPDATE OF name ON {table_name}
+            BEGIN
+                UPDATE BookSummary SET {summary_col} = {names_sql.format(
+                    book_id='BookSummary.book_id')}
+                WHERE book_id IN (
+                    SELECT book_id FROM Book{table_name} WHERE {bridge_col_name} = NEW.id);
+            END""")
+
+    avg_sql = """(
+        SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo WHERE book_id = {book_id})"""
+    for action, row in (("INSERT", "NEW"), ("DELETE", "OLD")):
+        c.execute(f"""
+        CREATE TRIGGER book_summary_externalinfo_{action.lower()}
+            AFTER {action} ON ExternalInfo
+            BEGIN
+                UPDATE BookSummary SET avg_ext_rating = {avg_sql.format(
+                    book_id=f'{row}.book_id')}
+                WHERE book_id = {row}.book_id;
+            END""")
+    c.execute(f"""
+    CREATE TRIGGER book_summary_externalinfo_update
+        AFTER UPDATE OF rating, book_id ON ExternalInfo
+        BEGIN
+            UPDATE BookSummary SET avg_ext_rating = {avg_sql.format(book_id='OLD.book_id')}
+            WHERE book_id = OLD.book_id;
+            UPDATE BookSummary SET avg_ext_rating = {avg_sql.format(book_id='NEW.book_id')}
+            WHERE book_id = NEW.book_id;
+        END""")
+
+    c.execute("INSERT INTO BookSummary(book_id) SELECT id FROM Books")
+    for table_name, bridge_col_name, summary_col in (("Tag", "tag_id", "tags"),
+                                                      ("Artist", "artist_id", "artists")):
+        c.execute(f"""
+        UPDATE BookSummary SET {summary_col} = COALESCE((
+            SELECT group_concat(name, ';') FROM (
+                SELECT x.name AS name FROM Book{table_name} bx, {table_name} x
+                WHERE bx.book_id = BookSummary.book_id AND x.id = bx.{bridge_col_name}
+                ORDER BY x.name
+            )
+        ), '')""")
+    c.execute("""
+    UPDATE BookSummary SET avg_ext_rating = (
+        SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo WHERE book_id = BookSummary.book_id)""")
@@ -0,0 +1,42 @@
+import sqlite3
+
+date = '2026-10-18'
+requires_foreign_keys_off = False
+
+# tag table -> id column name in its bridge table Book{table}
+TAG_TABLES = {
+    "List": "list_id",
+    "Tag": "tag_id",
+    "Category": "category_id",
+    "Collection": "collection_id",
+    "Groups": "group_id",
+    "Artist": "artist_id",
+    "Parody": "parody_id",
+    "Character": "character_id",
+}
+
+
+def upgrade(db_con: sqlite3.Connection, db_filename: str):
+    c = db_con.cursor()
+
+    # nr of books that have the tag etc., kept up-to-date by triggers on the bridge tables
+    for table_name, bridge_col_name in TAG_TABLES.items():
+        c.execute(f"ALTER TABLE {table_name} ADD COLUMN book_count INTEGER NOT NULL DEFAULT 0")
+        c.execute(f"""
+        UPDATE {table_name} SET book_count = (
+            SELECT COUNT(*) FROM Book{table_name} WHERE {bridge_col_name} = {table_name}.id)""")
+
+        c.execute(f"""
+        CREATE TRIGGER book{table_name.lower()}_count_insert
+            AFTER INSERT ON Book{table_name}
+            BEGIN
+                UPDATE {table_name} SET book_count = book_count + 1
+                WHERE id = NEW.{bridge_col_name};
+            END""")
+        c.execute(f"""
+        CREATE TRIGGER book{table_name.lower()}_count_delete
+            AFTER DELETE ON Book{table_name}
+            BEGIN
+                UPDATE {table_name} SET book_count = book_count - 1
+                WHERE id = OLD.{bridge_col_name};
+            END""")
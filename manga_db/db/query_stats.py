@@ -0,0 +1,229 @@
+import re
+import time
+import sqlite3
+import threading
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Iterable
+
+# sqlite3's default of 128 cached statements is too small for all the different
+# shapes of the search queries we generate
+STATEMENT_CACHE_SIZE = 512
+
+# string literals, quoted identifiers and comments need to be matched as a whole
+# so we don't touch whitespace inside of them
+SQL_TOKEN_RE = re.compile(
+    r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|--[^\n]*|/\*.*?\*/|\s+|[^'"\s/-]+|.""", re.DOTALL)
+# parameter lists of IN (?, ?, ?) only differ in length
+PARAM_LIST_RE = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def normalize_sql(sql: str) -> str:
+    """
+    Strips comments and collapses whitespace (outside of literals) so statements
+    that only differ in formatting share one entry in sqlite3's statement cache
+    """
+    parts: List[str] = []
+    space = False
+    for match in SQL_TOKEN_RE.finditer(sql):
+        token = match.group(0)
+        if token[0].isspace() or token.startswith("--") or token.startswith("/*"):
+            space = True
+            continue
+        if space and parts:
+            parts.append(" ")
+        space = False
+        parts.append(token)
+    return "".join(parts)
+
+
+def statement_shape(normalized_sql: str) -> str:
+    return PARAM_LIST_RE.sub("?, ...", normalized_sql)
+
+
+class StatementStats:
+
+    __slots__ = ("count", "total_time", "max_time", "sql", "params")
+
+    def __init__(self, sql: str):
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        # sql and parameters of the slowest execution, used for EXPLAIN QUERY PLAN
+        self.sql = sql
+        self.params: Optional[Any] = None
+
+    @property
+    def avg_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+
+class ProfilingConnection(sqlite3.Connection):
+    """
+    Connection that normalizes the SQL of all statements executed through its cursors
+    (this includes Connection.execute) and records how often each statement shape
+    was executed and how much time was spent executing and fetching it
+
+    NOTE: time spent iterating over a cursor directly is not recorded
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # statement shape -> stats
+        self.statement_stats: Dict[str, StatementStats] = {}
+        self._stats_lock = threading.Lock()
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or ProfilingCursor)
+
+    # Connection.execute* doesn't use our cursor method to create its cursor
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def record_statement(self, sql: str, params: Optional[Any], elapsed: float,
+                         executed: bool = True) -> None:
+        shape = statement_shape(sql)
+        with self._stats_lock:
+            try:
+                stats = self.statement_stats[shape]
+            except KeyError:
+                stats = self.statement_stats[shape] = StatementStats(sql)
+            if executed:
+                stats.count += 1
+            stats.total_time += elapsed
+            if elapsed > stats.max_time:
+                stats.max_time = elapsed
+                if executed:
+                    stats.sql = sql
+                    stats.params = params
+
+    def reset_statement_stats(self) -> None:
+        with self._stats_lock:
+            self.statement_stats = {}
+
+
+class ProfilingCursor(sqlite3.Cursor):
+
+    _last_sql: Optional[str] = None
+
+    def execute(self, sql, parameters=()):
+        sql = normalize_sql(sql)
+        self._last_sql = sql
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self.connection.record_statement(sql, parameters, time.perf_counter() - start)
+
+    def executemany(self, sql, seq_of_parameters):
+        sql = normalize_sql(sql)
+        self._last_sql = None
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            # can't explain without a single set of parameters
+            self.connection.record_statement(sql, None, time.perf_counter() - start)
+
+    def _timed_fetch(self, fetch, *args):
+        start = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            if self._last_sql is not None:
+                self.connection.record_statement(
+                    self._last_sql, None, time.perf_counter() - start, executed=False)
+
+    def fetchone(self):
+        return self._timed_fetch(super().fetchone)
+
+    def fetchmany(self, *args):
+        return self._timed_fetch(super().fetchmany, *args)
+
+    def fetchall(self):
+        return self._timed_fetch(super().fetchall)
+
+
+def connect(database: str, **kwargs) -> sqlite3.Connection:
+    kwargs.setdefault("factory", ProfilingConnection)
+    kwargs.setdefault("cached_statements", STATEMENT_CACHE_SIZE)
+    return sqlite3.connect(database, **kwargs)
+
+
+def explain_query_plan(db_con: sqlite3.Connection, sql: str,
+                       params: Optional[Any] = None) -> List[str]:
+    """
+    Returns the lines of the query plan tree for sql, full table scans and temporary
+    b-trees used for sorting/grouping are marked
+    """
+    # plain cursor so explaining doesn't get recorded
+    c = db_con.cursor(sqlite3.Cursor)
+    rows = c.execute(f"EXPLAIN QUERY PLAN {sql}", params or ()).fetchall()
+    depth = {0: -1}
+    lines = []
+    # id, parent, notused, detail
+    for row in rows:
+        node_id, parent, _, detail = tuple(row)
+        depth[node_id] = depth.get(parent, -1) + 1
+        # SCAN x USING (COVERING) INDEX only reads an index
+        full_scan = detail.startswith("SCAN") and "USING" not in detail
+        marker = "  <- full scan" if full_scan else (
+                 "  <- temp b-tree" if "TEMP B-TREE" in detail else "")
+        lines.append(f"{'   ' * depth[node_id]}|--{detail}{marker}")
+    return lines
+
+
+def merge_statement_stats(
+        all_stats: Iterable[Dict[str, StatementStats]]) -> Dict[str, StatementStats]:
+    merged: Dict[str, StatementStats] = {}
+    for stats_dict in all_stats:
+        # copy since the connections might still be recording
+        for shape, stats in list(stats_dict.items()):
+            try:
+                m = merged[shape]
+            except KeyError:
+                m = merged[shape] = StatementStats(stats.sql)
+            m.count += stats.count
+            m.total_time += stats.total_time
+            if stats.max_time >= m.max_time:
+                m.max_time = stats.max_time
+                m.sql = stats.sql
+                m.params = stats.params
+    return merged
+
+
+def query_plan_report(db_con: sqlite3.Connection, nr_statements: int = 10,
+                      statement_stats: Optional[Dict[str, StatementStats]] = None) -> str:
+    """
+    Formats the recorded stats of the nr_statements statement shapes that took the most
+    time in total along with their EXPLAIN QUERY PLAN
+    :param statement_stats: Stats to use instead of the ones recorded by db_con
+    """
+    all_stats = (getattr(db_con, "statement_stats", None) if statement_stats is None
+                 else statement_stats)
+    if all_stats is None:
+        return "Statement stats are not recorded for this connection!"
+    if not all_stats:
+        return "No statements recorded yet!"
+
+    slowest = sorted(all_stats.items(), key=lambda kv: kv[1].total_time,
+                     reverse=True)[:nr_statements]
+    result = []
+    for shape, stats in slowest:
+        result.append(f"{stats.total_time * 1000:.2f}ms total | {stats.count}x | "
+                      f"{stats.avg_time * 1000:.2f}ms avg | {stats.max_time * 1000:.2f}ms max")
+        result.append(shape)
+        if stats.params is None and "?" in stats.sql:
+            result.append("|--(no query plan: statement was only run using executemany)")
+        else:
+            try:
+                result.extend(explain_query_plan(db_con, stats.sql, stats.params))
+            except sqlite3.Error as e:
+                result.append(f"|--(no query plan: {e})")
+        result.append("")
+
+    return "\n".join(result)
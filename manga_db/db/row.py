@@ -1,8 +1,14 @@
-from typing import List, Dict, Any, Tuple, Mapping, ClassVar, TYPE_CHECKING, Union, Type
+from typing import (
+    List, Dict, Any, Tuple, Mapping, ClassVar, TYPE_CHECKING, Union, Type, Sequence, TypeVar
+)
+
+from .constants import NOT_LOADED
 
 if TYPE_CHECKING:
     from ..manga_db import MangaDB
 
+R = TypeVar('R', bound='DBRow')
+
 
 class DBRow:
 
@@ -23,6 +29,43 @@ class DBRow:
         # it might just have the same title as the book whose id was returned
         self._in_db: bool = in_db
 
+    @classmethod
+    def from_row(cls: Type[R], manga_db: 'MangaDB', row: Mapping[str, Any],
+                 *args: Any, **kwargs: Any) -> R:
+        """
+        Creates an instance from a row that was just loaded from the DB
+
+        Other than __init__ this writes the values straight into the instance's __dict__
+        so the column descriptors' type checks and change tracking are skipped and the
+        committed state starts out clean; lazy associated columns are marked as not loaded
+        and the others are fetched right away
+        Columns that are missing from the row are set to None like __init__ would
+        Subclasses set up their remaining attributes in _init_from_row(*args, **kwargs)
+        """
+        instance = cls.__new__(cls)
+        values = instance.__dict__
+        values["manga_db"] = manga_db
+        values["_committed_state"] = {}
+        values["_in_db"] = True
+        for col in cls.PRIMARY_KEY_COLUMNS:
+            values[col] = row[col]
+        for col in cls.COLUMNS:
+            try:
+                values[col] = row[col]
+            except (KeyError, IndexError):
+                # IndexError: sqlite3.Row
+                values[col] = None
+        # only set on classes that have associated columns
+        for col in getattr(cls, "ASSOCIATED_COLUMNS", ()):
+            values[col] = NOT_LOADED
+        instance._init_from_row(*args, **kwargs)
+        instance._load_eager_associated_columns()
+        return instance
+
+    def _init_from_row(self, *args: Any, **kwargs: Any) -> None:
+        """Sets the attributes that aren't columns on instances created by from_row"""
+        pass
+
     # Tuple[T, ...] => variable length tuple
     @property
     def key(self) -> Tuple[Type['DBRow'], Tuple[Union[str, int, float], ...]]:
@@ -64,6 +107,40 @@ class DBRow:
         """
         raise NotImplementedError
 
+    def fetch_associated_column(self, col_name: str) -> Any:
+        """
+        Fetches the value of the associated column col_name from the DB, used by
+        lazy associated columns on first access
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def fetch_associated_column_bulk(cls, manga_db: 'MangaDB', col_name: str,
+                                     instances: Sequence['DBRow']) -> List[Any]:
+        """
+        Fetches the values of the associated column col_name for all instances at once,
+        returns the values in the same order as instances
+        """
+        raise NotImplementedError
+
+    def expire_associated_columns(self) -> None:
+        """
+        Marks all associated columns as not loaded so they get (re-)fetched from
+        the DB on next access (or right away if they're not lazy); discards unsaved
+        changes to those columns
+        """
+        cls = self.__class__
+        for col in self.ASSOCIATED_COLUMNS:
+            getattr(cls, col).set_unloaded(self)
+        self._load_eager_associated_columns()
+
+    def _load_eager_associated_columns(self) -> None:
+        cls = self.__class__
+        for col in getattr(cls, "ASSOCIATED_COLUMNS", ()):
+            descriptor = getattr(cls, col)
+            if not descriptor.lazy:
+                descriptor.load(self)
+
     def diff_normal_cols(self, row: Mapping[str, Any]) -> Tuple[str, List[str]]:
         changed_str = []
         changed_cols = []
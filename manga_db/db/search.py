@@ -1,11 +1,18 @@
 import logging
+import sqlite3
 
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Sequence
 
-from .util import joined_col_name_to_query_names, prod
+from .util import joined_col_name_to_query_names, table_name_to_bridge_id_col
 
 logger = logging.getLogger(__name__)
 
+# temporary table that search_in_ids uses for passing the ids to the DB
+SEARCH_IDS_TABLE = "search_result_ids"
+# default SELECT/FROM of the search functions, e.g. book_summary.SUMMARY_SELECT reads
+# the values listing pages need instead
+BOOKS_SELECT = "SELECT Books.*\nFROM Books"
+
 
 def search_assoc_col_string_parse(valuestring, delimiter=";") -> Tuple[List[str], List[str]]:
     # is list comprehension faster even though we have to iterate over the list twice?
@@ -27,6 +34,10 @@ VALID_ORDER_BY = {"ASC", "DESC", "Books.id", "Books.title_eng", "Books.title_for
                   "title_eng", "title_foreign", "pages", "my_rating"}
 
 
+# sortable columns that can't be NULL, so keyset pagination doesn't need to account for NULLs
+NOT_NULL_ORDER_BY_COLS = {"pages", "last_change"}
+
+
 def validate_order_by_str(order_by) -> bool:
     for part in order_by.split(" "):
         if part not in VALID_ORDER_BY:
@@ -34,10 +45,64 @@ def validate_order_by_str(order_by) -> bool:
     return True
 
 
+TITLE_FTS_TABLE = "BooksTitleFts"
+# trigram tokenizer can't match anything shorter than 3 chars
+MIN_TRIGRAM_QUERY_LEN = 3
+
+
+def title_fts_tokenize_option() -> str:
+    # trigram tokenizer (substring matching like LIKE '%x%' does) needs sqlite 3.34+
+    # otherwise fall back to unicode61 with prefix indices -> token prefix matching
+    if sqlite3.sqlite_version_info >= (3, 34, 0):
+        return "tokenize='trigram'"
+    else:
+        return "tokenize='unicode61 remove_diacritics 2', prefix='2 3'"
+
+
+def title_fts_tokenizer(db_con) -> Optional[str]:
+    """
+    Returns the tokenizer ('trigram' or 'unicode61') the title full-text index
+    was created with or None if there is no such index
+    """
+    row = db_con.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                         (TITLE_FTS_TABLE,)).fetchone()
+    if row is None:
+        return None
+    return "trigram" if "trigram" in row[0] else "unicode61"
+
+
+def title_fts_match_query(title: str, tokenizer: Optional[str]) -> Optional[str]:
+    """
+    Builds the fts5 MATCH expression for searching title or returns None if the
+    full-text index can't be used so the caller has to fall back to LIKE
+    trigram: whole title as one phrase -> matches substrings like LIKE '%title%'
+    unicode61: every word is a prefix query -> 'wor' matches 'words' but not 'sword'
+    """
+    # fts5 strings are enclosed in double quotes; escape them by doubling
+    if tokenizer == "trigram":
+        title = title.strip()
+        if len(title) < MIN_TRIGRAM_QUERY_LEN:
+            return None
+        return '"{}"'.format(title.replace('"', '""'))
+    elif tokenizer == "unicode61":
+        words = title.split()
+        if not words:
+            return None
+        return " ".join('"{}"*'.format(w.replace('"', '""')) for w in words)
+    else:
+        return None
+
+
 def search_book_by_title(db_con,
                          title,
                          order_by="Books.id DESC",
                          limit=-1, last_id=None):
+    """
+    Searches title_eng and title_foreign for title using the full-text index
+    (if present) otherwise falls back to LIKE '%title%'
+    :param order_by: Passing "rank" orders by fts5 relevance (best first); keyset
+                     pagination (last_id) is not supported with that order
+    """
     # search title or title_eng?
     # '%?%' doesnt work since ' disable ? and :name as placeholder
     # You should use query parameters where possible, but query parameters can't be used to
@@ -45,8 +110,30 @@ def search_book_by_title(db_con,
     # In this case you need to use plain string formatting to build your query. If your
     # parameters (in this case sort criterium and order) come from user input you need to
     # validate it first
-    title_wildcarded = f"%{title}%"
-    vals_in_order = [title_wildcarded, title_wildcarded]
+    match_query = title_fts_match_query(title, title_fts_tokenizer(db_con))
+    if order_by == "rank":
+        if last_id is not None:
+            raise ValueError("Keyset pagination is not supported when ordering by rank!")
+        if match_query is None:
+            # can't rank without the full-text index
+            order_by = "Books.id DESC"
+        else:
+            c = db_con.execute(f"""
+                      SELECT Books.* FROM {TITLE_FTS_TABLE}
+                      JOIN Books ON Books.id = {TITLE_FTS_TABLE}.rowid
+                      WHERE {TITLE_FTS_TABLE} MATCH ?
+                      ORDER BY {TITLE_FTS_TABLE}.rank
+                      LIMIT ?""", (match_query, limit))
+            return c.fetchall()
+
+    if match_query is None:
+        title_wildcarded = f"%{title}%"
+        title_cond = "(title_eng LIKE ? OR title_foreign LIKE ?)"
+        vals_in_order = [title_wildcarded, title_wildcarded]
+    else:
+        title_cond = (f"id IN (SELECT rowid FROM {TITLE_FTS_TABLE} "
+                      f"WHERE {TITLE_FTS_TABLE} MATCH ?)")
+        vals_in_order = [match_query]
     if last_id is not None:
         keyset_pagination = f"AND id {'<' if order_by.endswith('DESC') else '>'} ?"
         vals_in_order.append(last_id)
@@ -55,8 +142,7 @@ def search_book_by_title(db_con,
 
     c = db_con.execute(f"""
                   SELECT * FROM Books
-                  WHERE title_eng LIKE ?
-                  OR title_foreign LIKE ?
+                  WHERE {title_cond}
                   {keyset_pagination}
                   ORDER BY {order_by}
                   LIMIT ?""", (*vals_in_order, limit))
@@ -71,52 +157,118 @@ def search_normal_mult_assoc(
         limit: int = -1,  # no row limit when limit is neg. nr
         # TODO type prob incorrect since sometimes (13,) is passed etc.
         after: Optional[Tuple[str, str]] = None,
-        before: Optional[Tuple[str, str]] = None):
+        before: Optional[Tuple[str, str]] = None,
+        select: str = BOOKS_SELECT):
     """Can search in normal columns as well as multiple associated columns
     (connected via bridge table) and both include and exclude them
     :param normal_col_values: Dict that maps column names to search value
     :param int_col_values: Dict that maps column names to search value
+    :param select: SELECT and FROM (Books has to be in it unaliased) of the query
+    """
+    cond_statements, vals_in_order = search_conditions(
+        db_con, normal_col_values, int_col_values_dict, ex_col_values_dict)
+    cond_statements_str = "\n".join(cond_statements)
+
+    query = [select]
+    query.append(cond_statements_str)
+    query.append(f"ORDER BY {order_by}")
+    query.append("LIMIT ?")
+
+    # important to do this last and limit mustnt be in vals_in_order (since its after
+    # keyset param in sql substitution)
+    final_query, vals_in_order = keyset_pagination_statment(
+            query, vals_in_order, after=after, before=before,
+            order_by=order_by, first_cond=not bool(cond_statements)
+            )
+    c = db_con.execute(final_query, (*vals_in_order, limit))
+    rows = c.fetchall()
+
+    return rows
+
+
+def search_in_ids(
+        db_con, book_ids: Sequence[int], normal_col_values: Dict[str, str],
+        order_by: str = "Books.id DESC", limit: int = -1,
+        after: Optional[Tuple[str, str]] = None,
+        before: Optional[Tuple[str, str]] = None,
+        select: str = BOOKS_SELECT):
+    """
+    Same as search_normal_mult_assoc but only considers the books with the passed ids
+    (e.g. the result of evaluating the associated column values using a TagIndex)
+    The ids are passed using a temporary table, which also works on read-only
+    connections since the temp database is separate
+    """
+    was_in_transaction = db_con.in_transaction
+    db_con.execute(
+        f"CREATE TEMP TABLE IF NOT EXISTS {SEARCH_IDS_TABLE}(id INTEGER PRIMARY KEY)")
+    try:
+        db_con.execute(f"DELETE FROM temp.{SEARCH_IDS_TABLE}")
+        db_con.executemany(f"INSERT INTO temp.{SEARCH_IDS_TABLE}(id) VALUES (?)",
+                           ((book_id,) for book_id in book_ids))
+
+        cond_statements, vals_in_order = search_conditions(db_con, normal_col_values, {}, {})
+        query = [
+            select,
+            "\n".join(cond_statements),
+            f"{'AND' if cond_statements else 'WHERE'} Books.id IN ("
+            f"SELECT id FROM temp.{SEARCH_IDS_TABLE})",
+            f"ORDER BY {order_by}",
+            "LIMIT ?",
+        ]
+        final_query, vals_in_order = keyset_pagination_statment(
+                query, vals_in_order, after=after, before=before,
+                order_by=order_by, first_cond=False)
+        rows = db_con.execute(final_query, (*vals_in_order, limit)).fetchall()
+    finally:
+        # filling the temp table started a transaction, which would keep us from seeing
+        # changes of other connections (unless it's part of the caller's transaction)
+        if not was_in_transaction:
+            db_con.commit()
+    return rows
+
+
+def search_conditions(
+        db_con, normal_col_values: Dict[str, str], int_col_values_dict: Dict[str, List[str]],
+        ex_col_values_dict: Dict[str, List[str]]) -> Tuple[List[str], List[str]]:
+    """
+    Builds the WHERE/AND conditions on Books for search_normal_mult_assoc
+    :return: Tuple of the condition statements and their values in order
     """
-    # @Cleanup mb split into multiple funcs that just return the conditional string
-    # like: WHERE title LIKE ? and the value, from_table_names etc.?
-    # @Cleanup convert this to use joins
-
-    grp_by: List[str] = []
-    having: List[str] = []
-    if int_col_values_dict:
-        # nr of items in values multiplied is nr of rows returned needed to match
-        # all conditions !! only include intersection vals
-        mul_values = prod((len(vals) for vals in int_col_values_dict.values()))
-        grp_by.append("Books.id")
-        having.append(f"COUNT(Books.id) = {mul_values}")
-
-    # containing table names for FROM .. stmt
-    table_bridge_names: List[str] = []
     # conditionals
     cond_statements: List[str] = []
     # vals in order the stmts where inserted for sql param sub
     vals_in_order: List[str] = []
-    # build conditionals for select string
+
+    # included assoc values: one (non-correlated) compound select that intersects the book
+    # ids of every single value; these use the (x_id, book_id) indices on the bridge tables
+    # instead of joining all bridge tables which builds the cartesian product of all
+    # matching rows before grouping them
+    intersect_selects: List[str] = []
     for col, vals in int_col_values_dict.items():
         table_name, bridge_col_name = joined_col_name_to_query_names(col)
-        table_bridge_names.append(table_name)
-        table_bridge_names.append(f"Book{table_name}")
-
-        cond_statements.append(f"{'AND' if cond_statements else 'WHERE'} "
-                               f"Books.id = Book{table_name}.book_id")
-        cond_statements.append(f"AND {table_name}.id = Book{table_name}.{bridge_col_name}")
-        cond_statements.append(f"AND {table_name}.name IN ({','.join(['?']*len(vals))})")
-        vals_in_order.extend(vals)
+        for val in vals:
+            intersect_selects.append(
+                f"SELECT book_id FROM Book{table_name} WHERE {bridge_col_name} = "
+                f"(SELECT id FROM {table_name} WHERE name = ?)")
+            vals_in_order.append(val)
+    if intersect_selects:
+        intersect = "\n                    INTERSECT ".join(intersect_selects)
+        cond_statements.append(f"""
+                {'AND' if cond_statements else 'WHERE'} Books.id IN (
+                    {intersect}
+                )""")
 
+    # excluded assoc values: only probe the bridge tables' primary key (book_id, x_id)
+    # for the books that would be returned
     for col, vals in ex_col_values_dict.items():
         table_name, bridge_col_name = joined_col_name_to_query_names(col)
         cond_statements.append(f"""
-                 {'AND' if cond_statements else 'WHERE'} Books.id NOT IN (
-                          SELECT Books.id
-                          FROM Book{table_name} bx, Books, {table_name}
-                          WHERE Books.id = bx.book_id
-                          AND bx.{bridge_col_name} = {table_name}.id
-                          AND {table_name}.name IN ({', '.join(['?']*len(vals))})
+                {'AND' if cond_statements else 'WHERE'} NOT EXISTS (
+                    SELECT 1 FROM Book{table_name} bx
+                    WHERE bx.book_id = Books.id
+                    AND bx.{bridge_col_name} IN (
+                        SELECT id FROM {table_name} WHERE name IN ({', '.join(['?']*len(vals))})
+                    )
                 )""")
         vals_in_order.extend(vals)
 
@@ -124,11 +276,18 @@ def search_normal_mult_assoc(
     for col, val in normal_col_values.items():
         # use pattern match for title
         if col.startswith("title"):
-            title_wildcarded = f"%{val}%"
-            cond_statements.append(
-                    f"{'AND' if cond_statements else 'WHERE'} (Books.title_eng LIKE ? "
-                    "OR Books.title_foreign LIKE ?)")
-            vals_in_order.extend([title_wildcarded]*2)
+            match_query = title_fts_match_query(val, title_fts_tokenizer(db_con))
+            if match_query is None:
+                title_wildcarded = f"%{val}%"
+                cond_statements.append(
+                        f"{'AND' if cond_statements else 'WHERE'} (Books.title_eng LIKE ? "
+                        "OR Books.title_foreign LIKE ?)")
+                vals_in_order.extend([title_wildcarded]*2)
+            else:
+                cond_statements.append(
+                        f"{'AND' if cond_statements else 'WHERE'} Books.id IN ("
+                        f"SELECT rowid FROM {TITLE_FTS_TABLE} WHERE {TITLE_FTS_TABLE} MATCH ?)")
+                vals_in_order.append(match_query)
         elif col == "read_status":
             # TODO include chapter_status?
             if val == "read":
@@ -156,31 +315,46 @@ def search_normal_mult_assoc(
             cond_statements.append(f"{'AND' if cond_statements else 'WHERE'} Books.{col} = ?")
             vals_in_order.append(val)
 
-    table_bridge_names_str = ", ".join(table_bridge_names)
-    cond_statements_str = "\n".join(cond_statements)
+    return cond_statements, vals_in_order
 
-    query = [
-        "SELECT Books.*",
-        f"FROM Books{',' if table_bridge_names_str else ''} {table_bridge_names_str}",
-    ]
-    query.append(cond_statements_str)
-    if grp_by:
-        query.append(f"GROUP BY {', '.join(grp_by)}")
-    if having:
-        query.append(f"HAVING {' AND '.join(having)}")
-    query.append(f"ORDER BY {order_by}")
-    query.append("LIMIT ?")
 
-    # important to do this last and limit mustnt be in vals_in_order (since its after
-    # keyset param in sql substitution)
-    final_query, vals_in_order = keyset_pagination_statment(
-            query, vals_in_order, after=after, before=before,
-            order_by=order_by, first_cond=not bool(cond_statements)
-            )
-    c = db_con.execute(final_query, (*vals_in_order, limit))
-    rows = c.fetchall()
+def search_facet_counts(
+        db_con, normal_col_values: Dict[str, str], int_col_values_dict: Dict[str, List[str]],
+        ex_col_values_dict: Dict[str, List[str]],
+        table_names: Sequence[str]) -> Dict[str, List[Tuple[int, str, int]]]:
+    """
+    Counts how many of the books matching the search have each tag etc. of the tag
+    tables in table_names using one grouped query over the result's ids
+    !! table_names are inserted into the query and must not come from user input !!
+    :return: Dict of table name -> [(id, name, book_count), ...] most used first
+    """
+    cond_statements, vals_in_order = search_conditions(
+        db_con, normal_col_values, int_col_values_dict, ex_col_values_dict)
+    cond_statements_str = "\n".join(cond_statements)
 
-    return rows
+    facet_selects = []
+    for table_name in table_names:
+        bridge_col_name = table_name_to_bridge_id_col(table_name)
+        facet_selects.append(f"""
+            SELECT '{table_name}' AS facet, x.id, x.name, COUNT(*) AS book_count
+            FROM result_ids r
+            JOIN Book{table_name} bx ON bx.book_id = r.id
+            JOIN {table_name} x ON x.id = bx.{bridge_col_name}
+            GROUP BY x.id""")
+    facet_selects_str = "\n            UNION ALL".join(facet_selects)
+    query = f"""
+        WITH result_ids(id) AS (
+            SELECT Books.id FROM Books
+            {cond_statements_str}
+        )
+        {facet_selects_str}
+        ORDER BY facet, book_count DESC, name"""
+
+    facets: Dict[str, List[Tuple[int, str, int]]] = {
+        table_name: [] for table_name in table_names}
+    for facet, _id, name, book_count in db_con.execute(query, vals_in_order).fetchall():
+        facets[facet].append((_id, name, book_count))
+    return facets
 
 
 def insert_order_by_id(query: List[str], order_by="Books.id DESC") -> str:
@@ -201,7 +375,8 @@ def insert_order_by_id(query: List[str], order_by="Books.id DESC") -> str:
 def keyset_pagination_statment(query: List[str], vals_in_order: List[str],
                                after: Optional[Tuple[str, str]] = None,
                                before: Optional[Tuple[str, str]] = None,
-                               order_by="Books.id DESC", first_cond=False):
+                               order_by="Books.id DESC", first_cond=False,
+                               wrap_before=True):
     """Finalizes query by inserting keyset pagination statement
     Must be added/called last!
     !! Assumes SQL statements are written in UPPER CASE !!
@@ -210,6 +385,10 @@ def keyset_pagination_statment(query: List[str], vals_in_order: List[str],
                           substitution; Might be None if caller wants to handle it himself
     :param order_by: primary column to sort by and the sorting order e.g. Books.id DESC
     :param first_cond: If the clause were inserting will be the first condition in the statment
+    :param wrap_before: When passing before the rows have to be retrieved in reversed order,
+                        by default the query gets wrapped in another query that restores the
+                        order. If False the caller has to reverse the rows instead, which saves
+                        sqlite from sorting them in a temp b-tree
     :return: Returns finalized query and vals_in_order"""
     # CAREFUL order_by needs to be unique for keyset pagination, possible to add rnd cols
     # to make it unique
@@ -276,18 +455,27 @@ def keyset_pagination_statment(query: List[str], vals_in_order: List[str],
             # DESC: include NOT NULLs when going backwards unless we already had a
             #       NOT NULL on the page
             null_clause = f"OR ({order_by_col} IS NOT NULL)" if primary is None else ""
+        if order_by_col.split(".")[-1] in NOT_NULL_ORDER_BY_COLS:
+            null_clause = ""
 
         # since we sort by both the primary order by and the id to make the sort unique
         # we need to check for rows matching the value of the sort col -> then we use the id to
         # have a correct sort
         # parentheses around the whole statement important otherwise rows fullfilling the OR
         # statement will get included when searching even if they dont fullfill the rest
-        keyset_pagination = (f"{'WHERE' if first_cond else 'AND'} ({order_by_col} {comp} ? "
-                             f"OR ({order_by_col} {equal_comp} AND Books.id {comp} ?) "
-                             f"{null_clause})")
-        # we only need primare 2 times if we compare by a value with ==
-        vals_in_order.extend((primary, primary, secondary) if equal_comp.startswith("==")  # type: ignore
-                             else (primary, secondary))
+        if primary is not None and not null_clause:
+            # same as below but using row values lets sqlite seek to the position in the
+            # (col, id) index instead of walking the index from the start
+            keyset_pagination = (f"{'WHERE' if first_cond else 'AND'} "
+                                 f"({order_by_col}, Books.id) {comp} (?, ?)")
+            vals_in_order.extend((primary, secondary))
+        else:
+            keyset_pagination = (f"{'WHERE' if first_cond else 'AND'} ({order_by_col} {comp} ? "
+                                 f"OR ({order_by_col} {equal_comp} AND Books.id {comp} ?) "
+                                 f"{null_clause})")
+            # we only need primare 2 times if we compare by a value with ==
+            vals_in_order.extend((primary, primary, secondary) if equal_comp.startswith("==")  # type: ignore
+                                 else (primary, secondary))
     else:
         keyset_pagination = f"{'WHERE' if first_cond else 'AND'} Books.id {comp} ?"
         # if vals_in_order is not None:
@@ -304,6 +492,8 @@ def keyset_pagination_statment(query: List[str], vals_in_order: List[str],
         # need to reverse order in query to not get results starting from first one possible
         # to before(id) but rather to get limit nr of results starting from before(id)
         result = result.replace(f"{' ASC' if asc else ' DESC'}", f"{' DESC' if asc else ' ASC'}")
+        if not wrap_before:
+            return result, vals_in_order
         result = f"""
             SELECT *
             FROM (
@@ -0,0 +1,288 @@
+import sqlite3
+import threading
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union, cast
+
+from .util import table_name_to_bridge_id_col
+
+# values (tags, artists, ...) are stored as a set of book ids as long as they're used
+# by at most this many books, after that as a bitmap (python int, bit n set -> book
+# with id n is included) which gets us fast AND/ANDNOT implemented in C
+# (roaring bitmaps use the same trick of switching between sparse and dense containers)
+# NOTE: a bitmap takes max_book_id / 8 bytes no matter how many books are included
+SPARSE_MAX_BOOKS = 256
+
+BookIds = Union[Set[int], int]
+
+
+def ids_to_bitmap(ids: Iterable[int]) -> int:
+    ids = list(ids)
+    if not ids:
+        return 0
+    buf = bytearray(max(ids) // 8 + 1)
+    for book_id in ids:
+        buf[book_id >> 3] |= 1 << (book_id & 7)
+    return int.from_bytes(buf, "little")
+
+
+def bitmap_to_ids(bitmap: int) -> List[int]:
+    """Returns the ids of all set bits in ascending order"""
+    ids = []
+    buf = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for byte_idx, byte in enumerate(buf):
+        if not byte:
+            continue
+        base = byte_idx << 3
+        for bit in range(8):
+            if byte & (1 << bit):
+                ids.append(base + bit)
+    return ids
+
+
+class TagIndex:
+    """
+    In-memory index of the book ids per value of the tag tables, so searches that
+    include/exclude tags, artists etc. can be evaluated without joining the bridge
+    tables
+
+    Changes that are committed by the owning connection have to be applied using
+    add/remove (MangaDB does that in notify_tags_committed), changes by other
+    connections are detected using PRAGMA data_version and lead to a rebuild
+    """
+
+    def __init__(self, table_names: Sequence[str]):
+        self.table_names = tuple(table_names)
+        # table name -> tag id -> book ids
+        self._values: Dict[str, Dict[int, BookIds]] = {}
+        # table name -> tag id -> nr of books
+        self._counts: Dict[str, Dict[int, int]] = {}
+        self.data_version: Optional[int] = None
+        # set when we can't apply a change incrementally e.g. when a book was deleted
+        self.stale = True
+
+    def build(self, db_con: sqlite3.Connection) -> None:
+        self.data_version = db_con.execute("PRAGMA data_version").fetchone()[0]
+        self._values = {}
+        self._counts = {}
+        for table_name in self.table_names:
+            bridge_col_name = table_name_to_bridge_id_col(table_name)
+            by_value: Dict[int, List[int]] = {}
+            # uses the (x_id, book_id) index -> rows are already grouped by value
+            c = db_con.execute(
+                f"SELECT {bridge_col_name}, book_id FROM Book{table_name} "
+                f"ORDER BY {bridge_col_name}")
+            for tag_id, book_id in c.fetchall():
+                try:
+                    by_value[tag_id].append(book_id)
+                except KeyError:
+                    by_value[tag_id] = [book_id]
+            values: Dict[int, BookIds] = {}
+            for tag_id, book_ids in by_value.items():
+                values[tag_id] = (set(book_ids) if len(book_ids) <= SPARSE_MAX_BOOKS
+                                  else ids_to_bitmap(book_ids))
+            self._values[table_name] = values
+            self._counts[table_name] = {tag_id: len(book_ids)
+                                        for tag_id, book_ids in by_value.items()}
+        self.stale = False
+
+    def ensure_current(self, db_con: sqlite3.Connection) -> None:
+        """Rebuilds the index if it's stale or the DB was changed by another connection"""
+        if (self.stale or
+                db_con.execute("PRAGMA data_version").fetchone()[0] != self.data_version):
+            self.build(db_con)
+
+    def add(self, table_name: str, rows: Iterable[Tuple[int, int]]) -> None:
+        """:param rows: (book_id, tag_id) of the inserted bridge table rows"""
+        values = self._values[table_name]
+        counts = self._counts[table_name]
+        for book_id, tag_id in rows:
+            book_ids = values.get(tag_id)
+            if book_ids is None:
+                values[tag_id] = {book_id}
+                counts[tag_id] = 1
+            elif isinstance(book_ids, set):
+                if book_id not in book_ids:
+                    book_ids.add(book_id)
+                    counts[tag_id] += 1
+                    if counts[tag_id] > SPARSE_MAX_BOOKS:
+                        values[tag_id] = ids_to_bitmap(book_ids)
+            else:
+                bit = 1 << book_id
+                if not book_ids & bit:
+                    values[tag_id] = book_ids | bit
+                    counts[tag_id] += 1
+
+    def remove(self, table_name: str, rows: Iterable[Tuple[int, int]]) -> None:
+        """:param rows: (book_id, tag_id) of the deleted bridge table rows"""
+        values = self._values[table_name]
+        counts = self._counts[table_name]
+        for book_id, tag_id in rows:
+            book_ids = values.get(tag_id)
+            if book_ids is None:
+                continue
+            if isinstance(book_ids, set):
+                if book_id not in book_ids:
+                    continue
+                book_ids.discard(book_id)
+            else:
+                bit = 1 << book_id
+                if not book_ids & bit:
+                    continue
+                values[tag_id] = book_ids & ~bit
+            counts[tag_id] -= 1
+            if not counts[tag_id]:
+                del values[tag_id]
+                del counts[tag_id]
+
+    def remove_value(self, table_name: str, tag_id: int) -> None:
+        self._values[table_name].pop(tag_id, None)
+        self._counts[table_name].pop(tag_id, None)
+
+    def evaluate(self, include: Sequence[Tuple[str, int]],
+                 exclude: Sequence[Tuple[str, int]] = ()) -> List[int]:
+        """
+        Returns the ids (ascending) of the books that have all the values in include
+        but none of the values in exclude
+        :param include: (table name, tag id) pairs, at least one is needed
+        :param exclude: (table name, tag id) pairs
+        """
+        if not include:
+            raise ValueError("At least one value to include is needed!")
+        included = []
+        for table_name, tag_id in include:
+            book_ids = self._values[table_name].get(tag_id)
+            if book_ids is None:
+                # no book has this value
+                return []
+            included.append((self._counts[table_name][tag_id], book_ids))
+        # start with the smallest set so intermediate results stay small
+        included.sort(key=lambda c_ids: c_ids[0])
+        excluded = [self._values[table_name].get(tag_id) for table_name, tag_id in exclude]
+        excluded_ids = [book_ids for book_ids in excluded if book_ids is not None]
+
+        result = included[0][1]
+        if isinstance(result, set):
+            # sparse: filter the ids by testing bits of the other values
+            result_ids = set(result)
+            for _, book_ids in included[1:]:
+                if isinstance(book_ids, set):
+                    result_ids &= book_ids
+                else:
+                    result_ids = {i for i in result_ids if book_ids >> i & 1}
+                if not result_ids:
+                    return []
+            for book_ids in excluded_ids:
+                if isinstance(book_ids, set):
+                    result_ids -= book_ids
+                else:
+                    result_ids = {i for i in result_ids if not book_ids >> i & 1}
+            return sorted(result_ids)
+
+        # all included values are bitmaps since the smallest one is
+        bitmap = result
+        for _, book_ids in included[1:]:
+            bitmap &= book_ids  # type: ignore
+        for book_ids in excluded_ids:
+            bitmap &= ~(ids_to_bitmap(book_ids) if isinstance(book_ids, set) else book_ids)
+        return bitmap_to_ids(bitmap)
+
+
+class SharedTagIndex(TagIndex):
+    """
+    TagIndex that is shared by the writer and the read-only instances of a process
+    (e.g. the ones of the webGUI's MangaDBPool), so the changes the writer applies
+    incrementally are seen by the readers without rebuilding the index
+
+    Changes by other processes can't be told apart from the writer's by the readers'
+    connections, only the writer's PRAGMA data_version doesn't change for its own
+    commits -> whoever holds the writer has to call sync_writer to notice them
+    The index itself gets built and checked using its own read-only connection
+    """
+
+    def __init__(self, table_names: Sequence[str], db_path: str):
+        super().__init__(table_names)
+        self.db_path = db_path
+        # used by the writer and the readers from different threads
+        self.lock = threading.RLock()
+        self._con: Optional[sqlite3.Connection] = None
+        self._writer_con: Optional[sqlite3.Connection] = None
+        self._writer_data_version: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._con is None:
+            self._con = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True,
+                                        check_same_thread=False)
+        return self._con
+
+    def _current_data_version(self) -> int:
+        return self._connection().execute("PRAGMA data_version").fetchone()[0]
+
+    def attach_writer(self, writer_con: sqlite3.Connection) -> None:
+        """Builds the index, only writer_con's changes will be applied incrementally"""
+        with self.lock:
+            self._writer_con = writer_con
+            # read before building so commits of other processes in between are noticed
+            self._writer_data_version = writer_con.execute(
+                "PRAGMA data_version").fetchone()[0]
+            self.build()
+
+    def changed(self) -> bool:
+        """Whether the DB was changed since the index was last brought up to date"""
+        with self.lock:
+            return self.stale or self._current_data_version() != self.data_version
+
+    def sync_writer(self) -> None:
+        """
+        Marks the index as stale if another process committed changes, otherwise the
+        changes are the writer's own, which were already applied
+        NOTE: the caller has to hold the writer, since we use its connection
+        """
+        with self.lock:
+            # read first: a commit after it will still change our data_version and
+            # one before also changed the writer's
+            data_version = self._current_data_version()
+            writer_data_version = cast(sqlite3.Connection, self._writer_con).execute(
+                "PRAGMA data_version").fetchone()[0]
+            if writer_data_version != self._writer_data_version:
+                self._writer_data_version = writer_data_version
+                self.stale = True
+            elif not self.stale:
+                self.data_version = data_version
+
+    def build(self, db_con: Optional[sqlite3.Connection] = None) -> None:
+        with self.lock:
+            super().build(self._connection())
+
+    def ensure_current(self, db_con: Optional[sqlite3.Connection] = None) -> None:
+        """
+        Rebuilds the index if it's stale, changes by other processes are only checked
+        for when db_con is the writer's connection (see sync_writer)
+        """
+        with self.lock:
+            if db_con is not None and db_con is self._writer_con:
+                self.sync_writer()
+            if self.stale:
+                self.build()
+
+    def add(self, table_name: str, rows: Iterable[Tuple[int, int]]) -> None:
+        with self.lock:
+            super().add(table_name, rows)
+
+    def remove(self, table_name: str, rows: Iterable[Tuple[int, int]]) -> None:
+        with self.lock:
+            super().remove(table_name, rows)
+
+    def remove_value(self, table_name: str, tag_id: int) -> None:
+        with self.lock:
+            super().remove_value(table_name, tag_id)
+
+    def evaluate(self, include: Sequence[Tuple[str, int]],
+                 exclude: Sequence[Tuple[str, int]] = ()) -> List[int]:
+        with self.lock:
+            return super().evaluate(include, exclude)
+
+    def close(self) -> None:
+        with self.lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
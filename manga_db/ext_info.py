@@ -73,6 +73,10 @@ class ExternalInfo(DBRow):
         if self.last_update is None:
             self.set_updated()
 
+    def _init_from_row(self, book):
+        self.book = book
+        self._extr_cls = find_by_site_id(self.imported_from)
+
     def __eq__(self, other):
         return all((self.id_onpage == other.id_onpage, self.imported_from == other.imported_from,
                     self.uploader == other.uploader, self.upload_date == other.upload_date,
@@ -122,13 +126,16 @@ class ExternalInfo(DBRow):
             else:
                 setattr(self, col, new)
 
-    def update_from_url(self, force=False) -> Tuple[str, Optional['Book']]:
+    def update_from_url(self, force=False,
+                        extr_data: Optional['MangaExtractorData'] = None) -> Tuple[str, Optional['Book']]:
+        """:param extr_data: Data that was already retrieved from the url (e.g. by a job)"""
         if not self.id or not self.book:
             logger.info("Cant update external info without id and assoicated book!")
             return "id_or_book_missing", None
         # TODO mb propagate updates to Book?
         # TODO handle 503 http code
-        extr_data, _, _ = self.manga_db.retrieve_book_data(self.url)
+        if extr_data is None:
+            extr_data, _, _ = self.manga_db.retrieve_book_data(self.url)
         if not extr_data:
             return "no_data", None
 
@@ -169,6 +176,17 @@ class ExternalInfo(DBRow):
             return self._update_entry(downloaded_null=downloaded_null, manual=manual)
 
     def _add_entry(self):
+        with self.manga_db.db_con:
+            outdated = self._insert_entry()
+        self._mark_added()
+
+        return self.id, outdated
+
+    def _insert_entry(self):
+        """
+        Inserts the row into ExternalInfo and sets self.id, doesn't commit
+        Returns the (id, id_onpage) rows of external infos that are outdated now
+        """
         if self.downloaded is None:
             self.downloaded = 0
         if self.outdated is None:
@@ -199,19 +217,22 @@ class ExternalInfo(DBRow):
         db_dict = self.export_for_db()
         cols = [col for col in self.COLUMNS if col != "id"]
 
-        with self.manga_db.db_con:
-            c = self.manga_db.db_con.execute(f"""
-                    INSERT INTO ExternalInfo ({','.join(cols)})
-                    VALUES ({','.join((f':{col}' for col in cols))}
-                    )""", db_dict)
-            self.id = c.lastrowid
-
-            if outdated:
-                # set invalid_link on external infos with same id_onpage,imported_from
-                # save to insert them like this since vals are from the db
-                c.execute(f"""
-                    UPDATE ExternalInfo SET outdated = 1
-                    WHERE ExternalInfo.id in ({', '.join((str(o[0]) for o in outdated))})""")
+        c = self.manga_db.db_con.execute(f"""
+                INSERT INTO ExternalInfo ({','.join(cols)})
+                VALUES ({','.join((f':{col}' for col in cols))}
+                )""", db_dict)
+        self.id = c.lastrowid
+
+        if outdated:
+            # set invalid_link on external infos with same id_onpage,imported_from
+            # save to insert them like this since vals are from the db
+            c.execute(f"""
+                UPDATE ExternalInfo SET outdated = 1
+                WHERE ExternalInfo.id in ({', '.join((str(o[0]) for o in outdated))})""")
+        return outdated
+
+    def _mark_added(self):
+        """Needs to be called once the inserted row was committed"""
         self._in_db = True
         # add self to id_map so we always work on the same instance even if we re-fetch this
         # row from db
@@ -219,8 +240,6 @@ class ExternalInfo(DBRow):
         # we just commited the values -> reset _committed_state
         self._committed_state = {}
 
-        return self.id, outdated
-
     def _update_entry(self, downloaded_null=None, manual=False):
         if not self._committed_state:
             logger.debug("There were no changes when updating external info with id %d", self.id)
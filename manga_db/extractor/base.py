@@ -6,6 +6,9 @@ import datetime
 from dataclasses import dataclass
 from typing import Dict, Tuple, Optional, TYPE_CHECKING, Literal, List, ClassVar
 
+from .. import http_session
+from .. import http_cache
+
 if TYPE_CHECKING:
     from ..ext_info import ExternalInfo
 
@@ -75,6 +78,18 @@ class BaseMangaExtractor:
     site_name: ClassVar[str] = ""
     site_id: ClassVar[int] = 0
 
+    # limits used when importing multiple books, every extractor gets its own limiters
+    # so a slow site doesn't hold back imports from other sites
+    # max nr of requests to the site that can be in flight at the same time
+    max_concurrency: ClassVar[int] = 2
+    # token bucket: requests per second on average (<= 0 means unlimited) and the nr
+    # of requests that can be made in a burst
+    rate_limit: ClassVar[float] = 1.0
+    rate_limit_burst: ClassVar[int] = 2
+    # secs a cached response (see http_cache) is used without asking the site
+    # whether it changed
+    cache_ttl: ClassVar[float] = 3600
+
     url: str
 
     def __init__(self, url: str):
@@ -110,6 +125,38 @@ class BaseMangaExtractor:
     def read_url_from_ext_info(cls, ext_info: 'ExternalInfo') -> str:
         raise NotImplementedError
 
+    def extract_cached(self) -> Tuple[Optional[MangaExtractorData], Optional[str]]:
+        """
+        Returns the results of extract and get_cover, re-using the ones from a
+        previous extraction if all responses they were parsed from are unchanged
+        (possible only if the http_cache is configured)
+        """
+        cache = http_cache.get_cache()
+        if cache is None:
+            data = self.extract()
+            return data, (self.get_cover() if data else None)
+
+        parsed = cache.get_parsed(self.url)
+        if parsed is not None:
+            deps, result = parsed
+            # revalidates the responses that are older than the ttl
+            for url in deps:
+                if self.get_html(url) is None:
+                    # e.g. the book was removed, the stale result must not be used
+                    logger.warning("Revalidating '%s' failed, not re-using the parse result "
+                                   "for '%s'", url, self.url)
+                    return None, None
+            if all(cache.version(url) == version for url, version in deps.items()):
+                logger.debug("Responses for '%s' unchanged, re-using parse result", self.url)
+                return result
+
+        with cache.record() as deps:
+            data = self.extract()
+            cover = self.get_cover() if data else None
+        if data and deps:
+            cache.store_parsed(self.url, deps, (data, cover))
+        return data, cover
+
     @classmethod
     def get_html(cls, url: str, add_headers: Optional[Dict[str, str]] = None) -> Optional[str]:
         res = None
@@ -118,6 +165,18 @@ class BaseMangaExtractor:
         if add_headers is not None:
             headers.update(add_headers)
 
+        cache = http_cache.get_cache() if url.startswith(("http://", "https://")) else None
+        cached = cache.get(url) if cache is not None else None
+        if cached is not None:
+            if cached.age < cls.cache_ttl:
+                cache.note_used(url, cached.version)  # type: ignore
+                return cached.text
+            # conditional request -> server answers with 304 if it's unchanged
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
         # NOTE: passing the headers kwarg means we will stil use the headers from the opener
         # but names that already exist in the opener's headers will be overwritten
         req = urllib.request.Request(url, headers=headers)
@@ -128,9 +187,14 @@ class BaseMangaExtractor:
         # added by the opener, and req.headers will then contain all the headers including
 
         try:
-            # site = cls.opener.open(req)
-            site = urllib.request.urlopen(req)
+            # shared session -> re-uses connections to the same host
+            site = http_session.default_session.open(req)
         except urllib.error.HTTPError as err:
+            if err.code == 304 and cached is not None:
+                logger.debug("Cached response for '%s' is still valid", url)
+                cache.revalidated(url)  # type: ignore
+                cache.note_used(url, cached.version)  # type: ignore
+                return cached.text
             # 503 is also sent by cloudflare if we don't pass the js/captcha challenge
             # @Hack only re-raising 503 so we can conviently pass that on and tell
             # a webGUI user to create/update the cookies.txt
@@ -139,12 +203,17 @@ class BaseMangaExtractor:
             logger.warning("HTTP Error %s: %s: \"%s\"", err.code, err.reason, url)
         else:
             # leave the decoding up to bs4
-            res = site.read()
+            body = site.read()
             site.close()
 
             # try to read encoding from headers otherwise use utf-8 as fallback
             encoding = site.headers.get_content_charset()
-            res = res.decode(encoding.lower() if encoding else "utf-8")
+            res = body.decode(encoding.lower() if encoding else "utf-8")
+            if cache is not None and "no-store" not in site.headers.get("Cache-Control", ""):
+                version = cache.store(url, body, charset=encoding,
+                                      etag=site.headers.get("ETag"),
+                                      last_modified=site.headers.get("Last-Modified"))
+                cache.note_used(url, version)
             logger.debug("Getting html done!")
 
         return res
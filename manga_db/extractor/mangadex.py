@@ -19,6 +19,12 @@ logger = logging.getLogger(__name__)
 class MangaDexExtractor(BaseMangaExtractor):
     site_name = "MangaDex"
     site_id = 3
+    # the API allows ~5 requests per second per IP
+    max_concurrency = 4
+    rate_limit = 5.0
+    rate_limit_burst = 5
+    # chapter counts etc. of ongoing series change often
+    cache_ttl = 600
 
     # MangaDex said official domains are mangadex.com|org|cc but com redirects
     # somewhere else
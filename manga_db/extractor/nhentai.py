@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class NhentaiExtractor(BaseMangaExtractor):
     site_name = "nhentai.net"
     site_id = 2
+    # galleries rarely change after they've been uploaded
+    cache_ttl = 24 * 3600
     URL_PATTERN_RE = re.compile(r"^(?:https?://)?(?:www\.)?nhentai\.net/g/(\d+)/?")
     URL_FORMAT = "https://nhentai.net/g/{id_onpage}/"
     READ_URL_FORMAT = "https://nhentai.net/g/{id_onpage}/1/"
@@ -19,6 +19,12 @@ logger = logging.getLogger(__name__)
 class TsuminoExtractor(BaseMangaExtractor):
     site_name = "tsumino.com"
     site_id = 1
+    # cloudflare starts answering with 503 challenges when making requests too fast
+    max_concurrency = 1
+    rate_limit = 0.5
+    rate_limit_burst = 1
+    # entries rarely change after they've been uploaded
+    cache_ttl = 24 * 3600
     URL_PATTERN_RE = re.compile(r"^(?:https?:\/\/)?(?:www\.)?tsumino\.com\/"
                                 r"(?:entry|Read\/Index)\/(\d+)\/?")
     TITLE_RE = re.compile(r"^(.+) \/ (.+)")
@@ -0,0 +1,232 @@
+import os
+import time
+import json
+import pickle
+import sqlite3
+import hashlib
+import logging
+import threading
+import contextlib
+
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+# max size of all response bodies and parse results that are kept in the cache
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+CACHE_FILENAME = "http_cache.sqlite"
+
+CACHE_SQL = """
+CREATE TABLE IF NOT EXISTS Responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    charset TEXT,
+    body BLOB NOT NULL,
+    body_hash TEXT NOT NULL,
+    -- bumped every time a different body was received
+    version INTEGER NOT NULL DEFAULT 1,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+-- results of parsing the responses of the urls in deps (url -> version)
+CREATE TABLE IF NOT EXISTS Parsed (
+    url TEXT PRIMARY KEY,
+    deps TEXT NOT NULL,
+    data BLOB NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON Responses (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_parsed_accessed ON Parsed (accessed_at);
+"""
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    charset: Optional[str]
+    body: bytes
+    version: int
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.charset.lower() if self.charset else "utf-8")
+
+
+class HTTPCache:
+    """
+    On-disk cache of response bodies keyed by url, that are revalidated using their
+    ETag/Last-Modified once they're older than the requesting extractor's TTL
+    Least recently used entries get evicted once the cache grows beyond max_size bytes
+
+    Also stores the results of parsing responses together with the versions of the
+    responses they were built from, so unchanged responses don't need to be parsed again
+
+    Can be shared between threads and processes (sqlite db in WAL mode)
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self.db_con = sqlite3.connect(os.path.join(cache_dir, CACHE_FILENAME),
+                                      check_same_thread=False, isolation_level=None)
+        self.db_con.execute("PRAGMA journal_mode=WAL")
+        self.db_con.execute("PRAGMA synchronous=NORMAL")
+        self.db_con.executescript(CACHE_SQL)
+        # url -> version of the responses that were used while recording, per thread
+        self._recording = threading.local()
+
+    def close(self) -> None:
+        with self._lock:
+            self.db_con.close()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self.db_con.execute(
+                "SELECT etag, last_modified, charset, body, version, stored_at "
+                "FROM Responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            self.db_con.execute("UPDATE Responses SET accessed_at = ? WHERE url = ?",
+                                (time.time(), url))
+        return CachedResponse(url, *row)
+
+    def revalidated(self, url: str) -> None:
+        """Marks the response as fresh again after the server answered 304"""
+        with self._lock:
+            now = time.time()
+            self.db_con.execute(
+                "UPDATE Responses SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url))
+
+    def store(self, url: str, body: bytes, charset: Optional[str] = None,
+              etag: Optional[str] = None, last_modified: Optional[str] = None) -> int:
+        """:return: Version of the stored response"""
+        body_hash = hashlib.sha1(body).hexdigest()
+        now = time.time()
+        with self._lock:
+            row = self.db_con.execute(
+                "SELECT version, body_hash FROM Responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                version = 1
+            else:
+                version = row[0] if row[1] == body_hash else row[0] + 1
+            self.db_con.execute(
+                "INSERT OR REPLACE INTO Responses (url, etag, last_modified, charset, body, "
+                "body_hash, version, stored_at, accessed_at, size) VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, charset, body, body_hash, version, now, now,
+                 len(body)))
+            self._evict()
+        return version
+
+    def version(self, url: str) -> Optional[int]:
+        with self._lock:
+            row = self.db_con.execute(
+                "SELECT version FROM Responses WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def get_parsed(self, url: str) -> Optional[Any]:
+        """:return: (deps: url -> version, data) or None"""
+        with self._lock:
+            row = self.db_con.execute(
+                "SELECT deps, data FROM Parsed WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            self.db_con.execute("UPDATE Parsed SET accessed_at = ? WHERE url = ?",
+                                (time.time(), url))
+        try:
+            return json.loads(row[0]), pickle.loads(row[1])
+        except Exception:
+            # e.g. classes changed since it was pickled
+            logger.debug("Discarding unreadable parse result of '%s'", url)
+            return None
+
+    def store_parsed(self, url: str, deps: Dict[str, int], data: Any) -> None:
+        blob = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self.db_con.execute(
+                "INSERT OR REPLACE INTO Parsed (url, deps, data, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, json.dumps(deps), blob, time.time(), len(blob)))
+            self._evict()
+
+    def total_size(self) -> int:
+        with self._lock:
+            return self._total_size()
+
+    def _total_size(self) -> int:
+        return self.db_con.execute(
+            "SELECT (SELECT IFNULL(SUM(size), 0) FROM Responses) + "
+            "(SELECT IFNULL(SUM(size), 0) FROM Parsed)").fetchone()[0]
+
+    def _evict(self) -> None:
+        # NOTE: caller has to hold the lock
+        excess = self._total_size() - self.max_size
+        if excess <= 0:
+            return
+        # least recently used first, no matter whether it's a response or a parse result
+        c = self.db_con.execute("""
+            SELECT 'Responses', url, size, accessed_at FROM Responses
+            UNION ALL
+            SELECT 'Parsed', url, size, accessed_at FROM Parsed
+            ORDER BY accessed_at""")
+        to_delete = []
+        for table_name, url, size, _ in c:
+            to_delete.append((table_name, url))
+            excess -= size
+            if excess <= 0:
+                break
+        c.close()
+        for table_name, url in to_delete:
+            self.db_con.execute(f"DELETE FROM {table_name} WHERE url = ?", (url,))
+
+    @contextlib.contextmanager
+    def record(self) -> Iterator[Dict[str, int]]:
+        """
+        Collects url -> version of all responses that are returned by the cache (using
+        note_used) in the current thread while the context is active
+        """
+        prev = getattr(self._recording, "deps", None)
+        deps: Dict[str, int] = {}
+        self._recording.deps = deps
+        try:
+            yield deps
+        finally:
+            self._recording.deps = prev
+
+    def note_used(self, url: str, version: int) -> None:
+        deps = getattr(self._recording, "deps", None)
+        if deps is not None:
+            deps[url] = version
+
+
+_cache: Optional[HTTPCache] = None
+
+
+def configure(cache_dir: Optional[str], max_size: int = DEFAULT_MAX_SIZE) -> Optional[HTTPCache]:
+    """
+    Sets up the process-wide cache used by the extractors
+    Passing None as cache_dir or a max_size of 0 disables it
+    """
+    global _cache
+    if _cache is not None:
+        _cache.close()
+    _cache = HTTPCache(cache_dir, max_size) if cache_dir and max_size > 0 else None
+    return _cache
+
+
+def get_cache() -> Optional[HTTPCache]:
+    return _cache
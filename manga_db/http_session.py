@@ -0,0 +1,252 @@
+import io
+import gzip
+import zlib
+import time
+import threading
+import logging
+import http.client
+import http.cookiejar
+import urllib.request
+import urllib.response
+import urllib.error
+
+from typing import Dict, List, Tuple, Optional, Union, Any
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:12.0) Gecko/20100101 Firefox/12.0'
+# secs till connecting/reading times out
+DEFAULT_TIMEOUT = 30
+# max nr of idle connections that are kept open per host
+MAX_IDLE_PER_HOST = 4
+# secs after which an idle connection gets closed instead of re-used, since most
+# servers close keep-alive connections after a few seconds anyway
+MAX_IDLE_SECS = 30
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+# requests that can be safely re-sent when a re-used connection turned out to be
+# closed by the server already
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# (scheme, host, tunnel host)
+PoolKey = Tuple[str, str, Optional[str]]
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of idle http.client connections per host
+    A connection is only ever used by one thread: it's taken out of the pool for
+    the duration of a request and put back once the response was read completely
+    """
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST,
+                 max_idle_secs: float = MAX_IDLE_SECS):
+        self.max_idle_per_host = max_idle_per_host
+        self.max_idle_secs = max_idle_secs
+        # key -> (connection, time it was put back) most recently used last
+        self._idle: Dict[PoolKey, List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        # nr of connections that were opened; mostly for testing
+        self.nr_opened = 0
+
+    def get(self, key: PoolKey) -> Optional[http.client.HTTPConnection]:
+        now = time.monotonic()
+        expired = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key)
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used > self.max_idle_secs:
+                    expired.append(candidate)
+                else:
+                    conn = candidate
+                    break
+        for c in expired:
+            c.close()
+        return conn
+
+    def put(self, key: PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def opened(self) -> None:
+        with self._lock:
+            self.nr_opened += 1
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+
+def decode_content(body: bytes, content_encoding: Optional[str]) -> bytes:
+    if not content_encoding:
+        return body
+    # encodings are listed in the order they were applied
+    for encoding in reversed([e.strip().lower() for e in content_encoding.split(",")]):
+        if encoding in ("gzip", "x-gzip"):
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            try:
+                body = zlib.decompress(body)
+            except zlib.error:
+                # some servers send raw deflate streams without the zlib header
+                body = zlib.decompress(body, -zlib.MAX_WBITS)
+        elif encoding == "br" and brotli is not None:
+            body = brotli.decompress(body)
+        elif encoding != "identity":
+            raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+    return body
+
+
+class KeepAliveHandlerMixin:
+    """
+    Replaces AbstractHTTPHandler.do_open, which opens a new connection for every
+    request and sends 'Connection: close', with one that re-uses the connections
+    of a ConnectionPool and decodes compressed responses
+    NOTE: the response body is read completely before returning, so the connection
+    can be put back into the pool right away
+    """
+
+    pool: ConnectionPool
+
+    def do_open(self, http_class: Any, req: urllib.request.Request,
+                **http_conn_args: Any) -> urllib.response.addinfourl:
+        host = req.host
+        if not host:
+            raise urllib.error.URLError("no host given")
+        tunnel_host = getattr(req, "_tunnel_host", None)
+        key: PoolKey = (req.type, host, tunnel_host)
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update((k, v) for k, v in req.headers.items() if k not in headers)
+        headers = {name.title(): val for name, val in headers.items()}
+        # persistent connections are the default for HTTP/1.1
+        headers.pop("Connection", None)
+        headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
+        tunnel_headers = {}
+        if "Proxy-Authorization" in headers:
+            tunnel_headers["Proxy-Authorization"] = headers.pop("Proxy-Authorization")
+
+        can_retry = req.get_method() in IDEMPOTENT_METHODS and req.data is None
+        while True:
+            conn = self.pool.get(key)
+            reused = conn is not None
+            if conn is None:
+                conn = http_class(host, timeout=req.timeout, **http_conn_args)
+                if tunnel_host:
+                    conn.set_tunnel(tunnel_host, headers=tunnel_headers)
+                self.pool.opened()
+            else:
+                conn.timeout = req.timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(req.timeout)
+            try:
+                conn.request(req.get_method(), req.selector, req.data, headers,
+                             encode_chunked=req.has_header("Transfer-encoding"))
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    BrokenPipeError) as err:
+                conn.close()
+                if reused and can_retry:
+                    # server closed the idle connection in the meantime
+                    logger.debug("Re-used connection to %s was closed, retrying", host)
+                    continue
+                raise urllib.error.URLError(err)
+            except OSError as err:
+                conn.close()
+                raise urllib.error.URLError(err)
+            except BaseException:
+                conn.close()
+                raise
+            break
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self.pool.put(key, conn)
+
+        msg = resp.msg
+        content_encoding = msg.get("Content-Encoding")
+        if content_encoding:
+            body = decode_content(body, content_encoding)
+            del msg["Content-Encoding"]
+            del msg["Content-Length"]
+            msg["Content-Length"] = str(len(body))
+
+        r = urllib.response.addinfourl(io.BytesIO(body), msg, req.get_full_url(), resp.status)
+        # HTTPErrorProcessor expects the reason in msg
+        r.msg = resp.reason  # type: ignore
+        return r
+
+
+class KeepAliveHTTPHandler(KeepAliveHandlerMixin, urllib.request.HTTPHandler):
+    def __init__(self, pool: ConnectionPool, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.pool = pool
+
+
+class KeepAliveHTTPSHandler(KeepAliveHandlerMixin, urllib.request.HTTPSHandler):
+    def __init__(self, pool: ConnectionPool, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.pool = pool
+
+
+class HTTPSession:
+    """
+    Thread-safe urllib OpenerDirector with a shared cookie jar, default headers
+    (User-Agent) and keep-alive connection pools per host
+    """
+
+    def __init__(self, cookie_jar: Optional[http.cookiejar.CookieJar] = None,
+                 user_agent: str = DEFAULT_USER_AGENT, timeout: float = DEFAULT_TIMEOUT,
+                 max_idle_per_host: int = MAX_IDLE_PER_HOST):
+        # cookiejar stores the cookies and the filecookiejar is able to save/load them
+        # to/from a file; FileCookieJar is a kind of abstract class -> MozillaCookieJar
+        self.cookie_jar = (cookie_jar if cookie_jar is not None
+                           else http.cookiejar.MozillaCookieJar())
+        self.timeout = timeout
+        self.pool = ConnectionPool(max_idle_per_host=max_idle_per_host)
+        # our handlers replace the default HTTP(S)Handlers since they're subclasses
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookie_jar),
+            KeepAliveHTTPHandler(self.pool),
+            KeepAliveHTTPSHandler(self.pool))
+        # these get automatically added to every request that use the opener
+        # but will be overwritten by headers that are passed to Request explicitly
+        self.opener.addheaders = [('User-Agent', user_agent)]
+
+    def open(self, url: Union[str, urllib.request.Request],
+             timeout: Optional[float] = None) -> Any:
+        return self.opener.open(url, timeout=self.timeout if timeout is None else timeout)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None) -> bytes:
+        req = urllib.request.Request(url, headers=headers or {})
+        with self.open(req, timeout=timeout) as resp:
+            return resp.read()
+
+    def download(self, url: str, filename: str, headers: Optional[Dict[str, str]] = None,
+                 timeout: Optional[float] = None) -> None:
+        data = self.get(url, headers=headers, timeout=timeout)
+        with open(filename, "wb") as f:
+            f.write(data)
+
+    def close(self) -> None:
+        self.pool.close_all()
+
+
+# session used by the extractors and for downloading covers
+default_session = HTTPSession()
@@ -0,0 +1,448 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import datetime
+import threading
+import dataclasses
+import urllib.error
+
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, List
+
+from . import extractor
+from .extractor import NoExtractorFound
+from .extractor.base import MangaExtractorData
+
+logger = logging.getLogger(__name__)
+
+JOBS_FILENAME = "jobs.sqlite"
+# nr of threads that work on jobs
+DEFAULT_WORKERS = 4
+# a job that failed is tried again after BACKOFF_BASE * 2**(attempts - 1) secs
+# but at most after BACKOFF_MAX secs
+DEFAULT_MAX_ATTEMPTS = 3
+BACKOFF_BASE = 5.0
+BACKOFF_MAX = 300.0
+# secs an idle worker waits before checking the table for jobs again, e.g. for jobs
+# that were submitted by another process
+POLL_SECS = 5.0
+# a running job is only re-run by another queue (e.g. of another process) once its lease
+# ran out, the queue that runs it renews the lease every LEASE_SECS / 3 secs
+LEASE_SECS = 60.0
+# finished jobs are deleted once they're older than this (secs)
+KEEP_FINISHED_SECS = 7 * 24 * 3600
+# http status codes that are worth retrying
+RETRY_HTTP_CODES = (408, 429, 500, 502, 504)
+
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+JOB_IMPORT, JOB_DOWNLOAD_COVER, JOB_UPDATE_EXT_INFO = "import", "download_cover", "update_ext_info"
+
+JOBS_SQL = """
+CREATE TABLE IF NOT EXISTS Jobs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    -- json
+    payload TEXT NOT NULL,
+    -- jobs of the same site count towards the site's concurrency limit
+    site_id INTEGER,
+    status TEXT NOT NULL DEFAULT 'pending',
+    -- queue that runs the job and till when it may do so without renewing the lease
+    owner TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    -- don't run before this timestamp, used for the backoff
+    run_after REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    -- json
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_run_after ON Jobs (status, run_after);
+"""
+# columns that were added after the table was first created
+JOBS_ADDED_COLUMNS = {"owner": "TEXT", "lease_until": "REAL"}
+
+
+class JobError(Exception):
+    """
+    Raised by job handlers when the job failed; retry=True means it might succeed
+    when it's tried again later, result gets stored on the job either way
+    """
+
+    def __init__(self, msg: str, retry: bool = False, result: Optional[Dict[str, Any]] = None):
+        super().__init__(msg)
+        self.retry = retry
+        self.result = result
+
+
+@dataclass
+class Job:
+    id: int
+    kind: str
+    payload: Dict[str, Any]
+    site_id: Optional[int]
+    status: str
+    attempts: int
+    max_attempts: int
+    run_after: float
+    created_at: float
+    updated_at: float
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'Job':
+        return cls(
+            id=row["id"], kind=row["kind"], payload=json.loads(row["payload"]),
+            site_id=row["site_id"], status=row["status"], attempts=row["attempts"],
+            max_attempts=row["max_attempts"], run_after=row["run_after"],
+            created_at=row["created_at"], updated_at=row["updated_at"],
+            result=json.loads(row["result"]) if row["result"] is not None else None,
+            error=row["error"])
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+
+# returns the json-serializable result of the job or raises JobError
+JobHandler = Callable[[Job], Optional[Dict[str, Any]]]
+
+
+def backoff_delay(attempts: int, base: float = BACKOFF_BASE, maximum: float = BACKOFF_MAX) -> float:
+    return min(maximum, base * 2 ** max(0, attempts - 1))
+
+
+def site_concurrency(site_id: int) -> int:
+    try:
+        return max(1, extractor.find_by_site_id(site_id).max_concurrency)
+    except NoExtractorFound:
+        return 1
+
+
+class JobQueue:
+    """
+    Persistent queue of jobs (e.g. importing a book) in a sqlite table that are worked
+    on by a pool of threads, so slow or rate-limited sites don't block the caller,
+    which can poll the job's status using get
+
+    Jobs that raise JobError(retry=True) or any other exception are retried with an
+    exponential backoff till they used up max_attempts. At most
+    site_concurrency(site_id) jobs of the same site run at the same time
+
+    Running jobs hold a lease that their queue renews, so jobs of a queue whose process
+    exited are started again once their lease ran out (jobs.sqlite might be shared with
+    other processes whose jobs must not be run twice)
+    With inline=True jobs are run right away in the thread that submits them (for testing)
+    """
+
+    def __init__(self, db_path: str, handlers: Dict[str, JobHandler],
+                 workers: int = DEFAULT_WORKERS, inline: bool = False,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, backoff_base: float = BACKOFF_BASE,
+                 concurrency: Callable[[int], int] = site_concurrency,
+                 lease_secs: float = LEASE_SECS):
+        self.db_path = db_path
+        self.handlers = handlers
+        self.nr_workers = workers
+        self.inline = inline
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.concurrency = concurrency
+        self.lease_secs = lease_secs
+        # identifies the jobs this queue is running
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self.db_con = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self.db_con.row_factory = sqlite3.Row
+        self.db_con.execute("PRAGMA journal_mode=WAL")
+        self.db_con.execute("PRAGMA synchronous=NORMAL")
+        self.db_con.executescript(JOBS_SQL)
+        columns = {row["name"] for row in self.db_con.execute("PRAGMA table_info(Jobs)")}
+        for name, col_type in JOBS_ADDED_COLUMNS.items():
+            if name not in columns:
+                self.db_con.execute(f"ALTER TABLE Jobs ADD COLUMN {name} {col_type}")
+        self._lock = threading.Lock()
+        # notified when jobs were submitted or finished
+        self._changed = threading.Condition(self._lock)
+        # site_id -> nr of running jobs
+        self._running: Dict[int, int] = {}
+        self._workers: List[threading.Thread] = []
+        self._heartbeat: Optional[threading.Thread] = None
+        self._stopping = False
+        # own event for the heartbeat so it doesn't take notifications meant for workers
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        with self._lock:
+            self.db_con.execute("DELETE FROM Jobs WHERE status IN (?, ?) AND updated_at < ?",
+                                (DONE, FAILED, time.time() - KEEP_FINISHED_SECS))
+        self._heartbeat = threading.Thread(target=self._renew_leases, name="Job-Heartbeat",
+                                           daemon=True)
+        self._heartbeat.start()
+        if self.inline:
+            return
+        for i in range(self.nr_workers):
+            t = threading.Thread(target=self._work, name=f"Job-Worker-{i}", daemon=True)
+            t.start()
+            self._workers.append(t)
+
+    def stop(self) -> None:
+        """Waits till the workers finished their current job and closes the db"""
+        with self._lock:
+            self._stopping = True
+            self._changed.notify_all()
+        self._stopped.set()
+        for t in self._workers:
+            t.join()
+        self._workers = []
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+        with self._lock:
+            self.db_con.close()
+
+    def submit(self, kind: str, payload: Dict[str, Any], site_id: Optional[int] = None,
+               max_attempts: Optional[int] = None) -> Job:
+        if kind not in self.handlers:
+            raise ValueError(f"No handler for jobs of kind '{kind}'")
+        now = time.time()
+        with self._lock:
+            c = self.db_con.execute(
+                "INSERT INTO Jobs (kind, payload, site_id, max_attempts, run_after, created_at, "
+                "updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, json.dumps(payload), site_id,
+                 self.max_attempts if max_attempts is None else max_attempts, now, now, now))
+            job_id = c.lastrowid
+            self._changed.notify()
+        if self.inline:
+            self._run_inline(job_id)
+        job = self.get(job_id)
+        assert job is not None
+        return job
+
+    def get(self, job_id: int) -> Optional[Job]:
+        with self._lock:
+            row = self.db_con.execute("SELECT * FROM Jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job.from_row(row) if row is not None else None
+
+    def counts(self) -> Dict[str, int]:
+        """:return: status -> nr of jobs"""
+        with self._lock:
+            return {status: nr for status, nr in self.db_con.execute(
+                "SELECT status, COUNT(*) FROM Jobs GROUP BY status")}
+
+    def _run_inline(self, job_id: int) -> None:
+        # retries right away since there is no worker that would pick it up later
+        while True:
+            with self._lock:
+                job = self._claim(job_id=job_id)
+            if job is None:
+                return
+            self._run(job)
+
+    def _claim(self, job_id: Optional[int] = None) -> Optional[Job]:
+        """
+        Marks the next job that is due and whose site isn't at its limit as running
+        :param job_id: Claim this job no matter when it's due or the site's limit (inline)
+        """
+        # NOTE: caller has to hold the lock
+        now = time.time()
+        # left over from a queue that stopped renewing its leases e.g. since its process exited
+        self.db_con.execute(
+            "UPDATE Jobs SET status = ?, owner = NULL WHERE status = ? AND "
+            "(lease_until IS NULL OR lease_until < ?)", (PENDING, RUNNING, now))
+        if job_id is not None:
+            rows = self.db_con.execute(
+                "SELECT * FROM Jobs WHERE id = ? AND status = ?", (job_id, PENDING)).fetchall()
+        else:
+            rows = self.db_con.execute(
+                "SELECT * FROM Jobs WHERE status = ? AND run_after <= ? ORDER BY run_after, id",
+                (PENDING, now)).fetchall()
+        for row in rows:
+            site_id = row["site_id"]
+            if (job_id is None and site_id is not None and
+                    self._running.get(site_id, 0) >= self.concurrency(site_id)):
+                continue
+            # another process might have claimed it in the meantime
+            c = self.db_con.execute(
+                "UPDATE Jobs SET status = ?, owner = ?, lease_until = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ? AND status = ?",
+                (RUNNING, self.owner, now + self.lease_secs, now, row["id"], PENDING))
+            if c.rowcount != 1:
+                continue
+            if site_id is not None:
+                self._running[site_id] = self._running.get(site_id, 0) + 1
+            job = Job.from_row(row)
+            job.status = RUNNING
+            job.attempts += 1
+            return job
+        return None
+
+    def _next_run_after(self, now: float) -> Optional[float]:
+        """
+        :return: When the next job that isn't due yet becomes due or the lease of another
+                 queue's job runs out; jobs that are due but blocked by their site's limit
+                 are claimed when a running job finishes
+        """
+        # NOTE: caller has to hold the lock
+        return self.db_con.execute(
+            "SELECT MIN(t) FROM ("
+            "SELECT MIN(run_after) AS t FROM Jobs WHERE status = ? AND run_after > ? "
+            "UNION ALL "
+            "SELECT MIN(lease_until) FROM Jobs WHERE status = ? AND owner != ?)",
+            (PENDING, now, RUNNING, self.owner)).fetchone()[0]
+
+    def _renew_leases(self) -> None:
+        while not self._stopped.wait(self.lease_secs / 3):
+            with self._lock:
+                self.db_con.execute(
+                    "UPDATE Jobs SET lease_until = ? WHERE status = ? AND owner = ?",
+                    (time.time() + self.lease_secs, RUNNING, self.owner))
+
+    def _work(self) -> None:
+        while True:
+            with self._lock:
+                job = None
+                while not self._stopping:
+                    job = self._claim()
+                    if job is not None:
+                        break
+                    timeout = POLL_SECS
+                    now = time.time()
+                    next_run_after = self._next_run_after(now)
+                    if next_run_after is not None:
+                        timeout = max(0.01, min(timeout, next_run_after - now))
+                    self._changed.wait(timeout)
+                if job is None:
+                    return
+            self._run(job)
+
+    def _run(self, job: Job) -> None:
+        handler = self.handlers[job.kind]
+        result = None
+        error = None
+        retry = False
+        try:
+            result = handler(job)
+        except JobError as err:
+            error = str(err)
+            retry = err.retry
+            result = err.result
+        except Exception as err:
+            logger.exception("Job %d (%s) failed!", job.id, job.kind)
+            error = f"{type(err).__name__}: {err}"
+            retry = True
+
+        now = time.time()
+        if error is None:
+            status, run_after = DONE, job.run_after
+        elif retry and job.attempts < job.max_attempts:
+            # inline jobs are retried right away
+            status, run_after = PENDING, now + (
+                0 if self.inline else backoff_delay(job.attempts, self.backoff_base))
+            logger.info("Job %d (%s) failed, retrying in %.0fs: %s", job.id, job.kind,
+                        run_after - now, error)
+        else:
+            status, run_after = FAILED, job.run_after
+            logger.warning("Job %d (%s) failed: %s", job.id, job.kind, error)
+        with self._lock:
+            if job.site_id is not None:
+                self._running[job.site_id] -= 1
+            c = self.db_con.execute(
+                "UPDATE Jobs SET status = ?, owner = NULL, lease_until = NULL, run_after = ?, "
+                "updated_at = ?, result = ?, error = ? WHERE id = ? AND owner = ?",
+                (status, run_after, now, json.dumps(result) if result is not None else None,
+                 error, job.id, self.owner))
+            if c.rowcount != 1:
+                logger.warning("Lease of job %d (%s) ran out while it was running, it was "
+                               "taken over by another queue", job.id, job.kind)
+            self._changed.notify_all()
+
+
+def extr_data_to_json(data: MangaExtractorData) -> Dict[str, Any]:
+    result = dataclasses.asdict(data)
+    result["upload_date"] = data.upload_date.isoformat()
+    return result
+
+
+def extr_data_from_json(data: Dict[str, Any]) -> MangaExtractorData:
+    return MangaExtractorData(**{
+        **data, "upload_date": datetime.date.fromisoformat(data["upload_date"])})
+
+
+def site_id_for_url(url: str) -> Optional[int]:
+    try:
+        return extractor.find(url).site_id
+    except NoExtractorFound:
+        return None
+
+
+def retrieve_book_data_job(job: Job) -> Dict[str, Any]:
+    """
+    Retrieves the book data at payload['url']
+    :return: {"extr_data": extr_data_to_json(..), "thumb_url": str}
+    """
+    url = job.payload["url"]
+    try:
+        extractor_cls = extractor.find(url)
+    except NoExtractorFound as err:
+        raise JobError(str(err))
+    try:
+        data, thumb_url = extractor_cls(url).extract_cached()
+    except urllib.error.HTTPError as err:
+        logger.warning("HTTP Error %s: %s: \"%s\"", err.code, err.reason, url)
+        raise JobError(f"HTTP Error {err.code}: {err.reason}", retry=err.code in RETRY_HTTP_CODES,
+                       result={"http_code": err.code})
+    except (urllib.error.URLError, OSError) as err:
+        # e.g. timeouts or the connection was reset
+        raise JobError(f"Retrieving the book data failed: {err}", retry=True)
+    except Exception as err:
+        logger.exception("Exception while extracting '%s'", url)
+        raise JobError(f"Extraction failed: {type(err).__name__}: {err}")
+    if not data:
+        raise JobError("No book data received!")
+    return {"extr_data": extr_data_to_json(data), "thumb_url": thumb_url}
+
+
+def download_cover_job(job: Job) -> Dict[str, Any]:
+    """
+    Downloads the cover at payload['url'] like MangaDB.download_cover using the
+    payload's dir_path, book_id and optionally forced_filename, overwrite
+    """
+    # avoid circular import
+    from .manga_db import MangaDB
+
+    payload = job.payload
+    try:
+        downloaded = MangaDB.download_cover(
+            payload["url"], payload["dir_path"], payload.get("book_id"),
+            overwrite=payload.get("overwrite", False),
+            forced_filename=payload.get("forced_filename"))
+    except (urllib.error.URLError, OSError) as err:
+        raise JobError(f"Downloading the cover failed: {err}", retry=True)
+    if downloaded is False:
+        raise JobError("Downloading the cover failed!")
+    return {"path": os.path.join(
+        payload["dir_path"], payload.get("forced_filename") or f"{payload.get('book_id')}_0")}
+
+
+# updating an external info only retrieves the data here since applying it needs the DB,
+# the webGUI uses its own handler that also applies it
+DEFAULT_HANDLERS: Dict[str, JobHandler] = {
+    JOB_IMPORT: retrieve_book_data_job,
+    JOB_DOWNLOAD_COVER: download_cover_job,
+    JOB_UPDATE_EXT_INFO: retrieve_book_data_job,
+}
+
+
+def open_job_queue(dir_path: str, handlers: Optional[Dict[str, JobHandler]] = None,
+                   **kwargs: Any) -> JobQueue:
+    """Opens and starts the queue that stores its jobs in dir_path"""
+    queue = JobQueue(os.path.join(dir_path, JOBS_FILENAME),
+                     DEFAULT_HANDLERS if handlers is None else handlers, **kwargs)
+    queue.start()
+    return queue
@@ -43,23 +43,23 @@ class Book(DBRow):
     # this relationship properly; currently just loading the name columns
     category: AssociatedColumnMany[str] = AssociatedColumnMany(
             "Category", Relationship.MANYTOMANY,
-            assoc_table="BookCategory")
+            assoc_table="BookCategory", lazy=True)
     collection: AssociatedColumnMany[str] = AssociatedColumnMany(
-            "Collection", Relationship.MANYTOMANY, assoc_table="BookCollection")
+            "Collection", Relationship.MANYTOMANY, assoc_table="BookCollection", lazy=True)
     groups: AssociatedColumnMany[str] = AssociatedColumnMany(
-            "Groups", Relationship.MANYTOMANY, assoc_table="BookGroups")
+            "Groups", Relationship.MANYTOMANY, assoc_table="BookGroups", lazy=True)
     artist: AssociatedColumnMany[str] = AssociatedColumnMany(
-            "Artist", Relationship.MANYTOMANY, assoc_table="BookArtist")
+            "Artist", Relationship.MANYTOMANY, assoc_table="BookArtist", lazy=True)
     parody: AssociatedColumnMany[str] = AssociatedColumnMany(
-            "Parody", Relationship.MANYTOMANY, assoc_table="BookParody")
+            "Parody", Relationship.MANYTOMANY, assoc_table="BookParody", lazy=True)
     character: AssociatedColumnMany[str] = AssociatedColumnMany(
-            "Character", Relationship.MANYTOMANY, assoc_table="BookCharacter")
+            "Character", Relationship.MANYTOMANY, assoc_table="BookCharacter", lazy=True)
     list: AssociatedColumnMany[str] = AssociatedColumnMany(
-            "List", Relationship.MANYTOMANY, assoc_table="BookList")
+            "List", Relationship.MANYTOMANY, assoc_table="BookList", lazy=True)
     tag: AssociatedColumnMany[str] = AssociatedColumnMany(
-            "Tag", Relationship.MANYTOMANY, assoc_table="BookTag")
+            "Tag", Relationship.MANYTOMANY, assoc_table="BookTag", lazy=True)
     ext_infos: AssociatedColumnMany[ExternalInfo] = AssociatedColumnMany(
-            "ExternalInfo", Relationship.ONETOMANY)
+            "ExternalInfo", Relationship.ONETOMANY, lazy=True)
     last_change = Column(datetime.date, nullable=False)
     note = Column(str)
     favorite = Column(int, nullable=False)
@@ -104,24 +104,24 @@ class Book(DBRow):
         self.chapter_status = chapter_status
         self.read_status = read_status
         self.my_rating = my_rating
-        self.category = category
-        self.collection = collection
-        self.groups = groups
-        self.artist = artist
-        self.parody = parody
-        self.character = character
-        self.list = list
-        self.tag = tag
-        self.ext_infos = ext_infos
+        if in_db:
+            # associated columns are loaded lazily on first access
+            self.expire_associated_columns()
+        else:
+            self.category = category
+            self.collection = collection
+            self.groups = groups
+            self.artist = artist
+            self.parody = parody
+            self.character = character
+            self.list = list
+            self.tag = tag
+            self.ext_infos = ext_infos
         self.last_change = last_change
         self.note = note
         self.favorite = favorite
         self.cover_timestamp = cover_timestamp
         self.nsfw = nsfw
-        if in_db:
-            # load associated columns
-            # TODO lazy loading
-            self.update_assoc_columns_from_db()
 
         if self.last_change is None:
             self.set_last_change()
@@ -162,8 +162,8 @@ class Book(DBRow):
             self.favorite = fav
 
     def update_ext_infos(self):
-        self._ext_infos = self._fetch_external_infos()
-        return self._ext_infos
+        Book.ext_infos.set_unloaded(self)
+        return self.ext_infos
 
     @property
     def avg_ext_rating(self):
@@ -189,11 +189,14 @@ class Book(DBRow):
         return ext_infos
 
     def update_assoc_columns_from_db(self):
-        for col, val in self.get_associated_columns().items():
-            setattr(self, col, val)
-        # possible changes overwritten -> remove assoc cols from _committed_state
-        self._committed_state = {k: v for k, v in self._committed_state.items() if k not in
-                                 self.ASSOCIATED_COLUMNS}
+        # discards possible changes -> columns will be re-fetched on next access
+        self.expire_associated_columns()
+
+    def fetch_associated_column(self, col_name):
+        if col_name == "ext_infos":
+            return self._fetch_external_infos()
+        else:
+            return self._fetch_associated_column(col_name)
 
     def get_associated_columns(self):
         """
@@ -229,6 +232,45 @@ class Book(DBRow):
         result = c.fetchone()
         return result[0].split(";") if result else []
 
+    @classmethod
+    def fetch_associated_column_bulk(cls, manga_db, col_name, books):
+        book_ids = [b.id for b in books]
+        id_placeholders = ', '.join(['?'] * len(book_ids))
+        if col_name == "ext_infos":
+            book_by_id = {b.id: b for b in books}
+            ext_infos = {bid: [] for bid in book_ids}
+            c = manga_db.db_con.execute(f"""
+                            SELECT ei.*
+                            FROM ExternalInfo ei
+                            WHERE ei.book_id IN ({id_placeholders})
+                            -- per book in id order, matches idx_externalinfo_book_id
+                            -- (which implicitly ends in the rowid) so no sorting is needed
+                            ORDER BY ei.book_id, ei.id""", book_ids)
+            for row in c.fetchall():
+                book_id = row["book_id"]
+                ext_infos[book_id].append(
+                    load_instance(manga_db, ExternalInfo, row, book_by_id[book_id]))
+            return [ext_infos[bid] for bid in book_ids]
+
+        names = cls.fetch_associated_names_bulk(manga_db.db_con, col_name, book_ids)
+        return [names.get(bid, []) for bid in book_ids]
+
+    @staticmethod
+    def fetch_associated_names_bulk(db_con, col_name, book_ids):
+        """
+        Returns book id -> names of the associated column col_name (e.g. tag) for all
+        book_ids at once, books without any names are missing from the result
+        """
+        # group_concat like _fetch_associated_column but grouped for all books at once
+        table_name, bridge_col_name = joined_col_name_to_query_names(col_name)
+        id_placeholders = ', '.join(['?'] * len(book_ids))
+        c = db_con.execute(f"""SELECT bx.book_id, group_concat(x.name, ';')
+                               FROM {table_name} x, Book{table_name} bx
+                               WHERE bx.book_id IN ({id_placeholders})
+                               AND bx.{bridge_col_name} = x.id
+                               GROUP BY bx.book_id""", book_ids)
+        return {book_id: concat.split(";") for book_id, concat in c.fetchall()}
+
     def get_all_options_for_assoc_columns(self):
         result = {
             "list": None,
@@ -241,13 +283,11 @@ class Book(DBRow):
             "character": None
             }
         for col in result:
-            c = self.manga_db.db_con.execute(f"SELECT id, name FROM {col.capitalize()}")
-            result[col] = c.fetchall()
+            result[col] = self.manga_db.get_tag_options(col.capitalize())
         return result
 
     def get_all_options_for_assoc_column(self, col_name):
-        c = self.manga_db.db_con.execute(f"SELECT id, name FROM {col_name.capitalize()}")
-        return c.fetchall()
+        return self.manga_db.get_tag_options(col_name.capitalize())
 
     def update(self):
         """Discards changes and updates from DB"""
@@ -304,22 +344,37 @@ class Book(DBRow):
                 return None, None
         return self._update_entry()
 
-    def _add_entry(self):
-        """Commits changes to db"""
+    def _insert_entry(self):
+        """
+        Inserts the row into Books and sets self.id, doesn't commit and doesn't add
+        associated columns or ext_infos
+        """
         if self.favorite is None:
             self.favorite = 0
         db_dict = self.export_for_db()
         cols = [col for col in self.COLUMNS if col != "id"]
+        c = self.manga_db.db_con.execute(f"""
+                INSERT INTO Books ({','.join(cols)})
+                VALUES ({','.join((f':{col}' for col in cols))}
+                )""", db_dict)
+        self.id = c.lastrowid
+
+    def _mark_added(self):
+        """Needs to be called once the inserted row was committed"""
+        self._in_db = True
+        # add self to id_map so we always work on the same instance even if we re-fetch this
+        # book from db
+        self.manga_db.id_map.add_unprecedented(self)
+        # reset committed state since we just committed
+        self._committed_state = {}
 
+    def _add_entry(self):
+        """Commits changes to db"""
         # since were saving ext_infos we also have to pass along if we had
         # outdated links
         outdated_on_ei_ids = []
-        with self.manga_db.db_con:
-            c = self.manga_db.db_con.execute(f"""
-                    INSERT INTO Books ({','.join(cols)})
-                    VALUES ({','.join((f':{col}' for col in cols))}
-                    )""", db_dict)
-            self.id = c.lastrowid
+        with self.manga_db.transaction():
+            self._insert_entry()
 
             for col in self.ASSOCIATED_COLUMNS:
                 if col == "ext_infos":
@@ -339,12 +394,7 @@ class Book(DBRow):
                     self._add_associated_column_values(col, value)
 
         logger.info("Added book with title \"%s\"  as id '%d' to database!", self.title, self.id)
-        self._in_db = True
-        # add self to id_map so we always work on the same instance even if we re-fetch this
-        # book from db
-        self.manga_db.id_map.add_unprecedented(self)
-        # reset committed state since we just committed
-        self._committed_state = {}
+        self._mark_added()
 
         return self.id, outdated_on_ei_ids
 
@@ -369,6 +419,8 @@ class Book(DBRow):
         self._in_db = False
         # delete from id_map
         self.manga_db.id_map.remove(self.key)
+        # the bridge table rows were deleted by the DB
+        self.manga_db.invalidate_tag_index()
 
         # also delete book thumb
         try:
@@ -400,10 +452,8 @@ class Book(DBRow):
 
     def _add_associated_column_values(self, col_name, values):
         table_name, bridge_col_name = joined_col_name_to_query_names(col_name)
-        # values gotta be list/tuple of lists/tuples
-        li_of_tup = [(val,) for val in values]
-        c = self.manga_db.db_con.executemany(
-                f"INSERT OR IGNORE INTO {table_name}(name) VALUES (?)", li_of_tup)
+        tag_ids = self.manga_db.get_tag_ids(table_name, values, create_unpresent=True)
+        rows = [(self.id, tag_id) for tag_id in tag_ids]
 
         # NOTE: careful! since OR IGNORE ignores the insert if sth. like a unique constraint
         # is violated it also doesn't raise an exception etc. and a bug of not adding
@@ -414,31 +464,29 @@ class Book(DBRow):
         # TODO @Hack need to treat this specially since we need the max in_collection_idx
         if col_name == "collection":
             # use max in_collection_idx + 1 for a collection that was newly added
-            c.executemany("""INSERT INTO BookCollection(book_id, collection_id, in_collection_idx)
-                             SELECT ?, Collection.id, (
-                                SELECT MAX(bc.in_collection_idx) + 1
-                                FROM BookCollection bc
-                             )
-                             FROM Collection
-                             WHERE Collection.name = ?""", zip([self.id] * len(values), values))
+            self.manga_db.db_con.executemany("""
+                INSERT INTO BookCollection(book_id, collection_id, in_collection_idx)
+                VALUES (?, ?, (
+                    SELECT MAX(bc.in_collection_idx) + 1
+                    FROM BookCollection bc
+                ))""", rows)
         else:
-            c.executemany(f"""INSERT INTO Book{table_name}(book_id, {bridge_col_name})
-                              SELECT ?, {table_name}.id
-                              FROM {table_name}
-                              WHERE {table_name}.name = ?""", zip([self.id] * len(values), values))
+            self.manga_db.db_con.executemany(f"""
+                INSERT INTO Book{table_name}(book_id, {bridge_col_name})
+                VALUES (?, ?)""", rows)
+        self.manga_db.track_bridge_rows(table_name, rows, added=True)
         logger.debug("Added '%s' to associated column '%s'", ", ".join(values), table_name)
 
     def _remove_associated_column_values(self, col_name, values):
         table_name, bridge_col_name = joined_col_name_to_query_names(col_name)
+        tag_ids = [tag_id for tag_id in self.manga_db.get_tag_ids(table_name, values)
+                   if tag_id is not None]
         self.manga_db.db_con.execute(f"""
                 DELETE FROM Book{table_name}
-                WHERE Book{table_name}.{bridge_col_name} IN
-                   (
-                   SELECT {table_name}.id FROM {table_name}
-                   WHERE
-                   ({table_name}.name IN ({', '.join(['?']*len(values))}))
-                   )
-                AND Book{table_name}.book_id = ?""", (*values, self.id))
+                WHERE Book{table_name}.{bridge_col_name} IN ({', '.join(['?']*len(tag_ids))})
+                AND Book{table_name}.book_id = ?""", (*tag_ids, self.id))
+        self.manga_db.track_bridge_rows(
+            table_name, [(self.id, tag_id) for tag_id in tag_ids], added=False)
         logger.debug("Removed '%s' from associated column '%s'", values, table_name)
 
     def _update_entry(self):
@@ -458,7 +506,7 @@ class Book(DBRow):
         update_dic = self.export_for_db()
         changed_cols = [col for col in self._committed_state if col in self.COLUMNS]
 
-        with db_con:
+        with self.manga_db.transaction():
             db_con.execute(f"""UPDATE Books SET
                           {','.join((f'{col} = :{col}' for col in changed_cols))}
                           WHERE id = :id""", update_dic)
@@ -594,17 +642,14 @@ class Book(DBRow):
             del book._committed_state[col_name]
 
         table_name, bridge_col_name = joined_col_name_to_query_names(col_name)
-        # values gotta be list/tuple of lists/tuples
-        li_of_tup = [(val,) for val in values]
-        with mdb.db_con:
+        with mdb.transaction():
+            tag_ids = mdb.get_tag_ids(table_name, values, create_unpresent=True)
+            rows = [(book_id, tag_id) for tag_id in tag_ids]
             c = mdb.db_con.executemany(
-                    f"INSERT OR IGNORE INTO {table_name}(name) VALUES (?)", li_of_tup)
+                f"""INSERT OR IGNORE INTO Book{table_name}(book_id, {bridge_col_name})
+                    VALUES (?, ?)""", rows)
+            mdb.track_bridge_rows(table_name, rows, added=True)
 
-            c.executemany(f"""INSERT OR IGNORE INTO Book{table_name}(book_id, {bridge_col_name})
-                              SELECT ?, {table_name}.id
-                              FROM {table_name}
-                              WHERE {table_name}.name = ?""", zip([book_id] * len(values), values))
-            
             c.execute("UPDATE Books SET last_change = DATE('now', 'localtime') WHERE id = ?",
                       (book_id,))
 
@@ -621,16 +666,16 @@ class Book(DBRow):
             del book._committed_state[col_name]
 
         table_name, bridge_col_name = joined_col_name_to_query_names(col_name)
-        with mdb.db_con:
+        tag_ids = [tag_id for tag_id in mdb.get_tag_ids(table_name, values)
+                   if tag_id is not None]
+        with mdb.transaction():
             c = mdb.db_con.execute(f"""
                     DELETE FROM Book{table_name}
                     WHERE Book{table_name}.{bridge_col_name} IN
-                       (
-                       SELECT {table_name}.id FROM {table_name}
-                       WHERE
-                       ({table_name}.name IN ({', '.join(['?']*len(values))}))
-                       )
-                    AND Book{table_name}.book_id = ?""", (*values, book_id))
+                        ({', '.join(['?']*len(tag_ids))})
+                    AND Book{table_name}.book_id = ?""", (*tag_ids, book_id))
+            mdb.track_bridge_rows(table_name, [(book_id, tag_id) for tag_id in tag_ids],
+                                  added=False)
 
             c.execute("UPDATE Books SET last_change = DATE('now', 'localtime') WHERE id = ?",
                       (book_id,))
@@ -2,25 +2,34 @@ import os
 import logging
 import sqlite3
 import re
+import threading
+import contextlib
 import urllib.request
 import urllib.error
 import http.cookiejar
 
 from typing import (
     Optional, Tuple, Any, List, overload, TypedDict,
-    ClassVar, cast, Dict, Sequence, Union, Type
+    ClassVar, cast, Dict, Sequence, Union, Type, Iterator
 )
 
 from .logging_setup import configure_logging
 from . import extractor
+from . import http_session
 from .extractor.base import MangaExtractorData, BaseMangaExtractor
 from .exceptions import MangaDBException
 from .db import migrate
 from .db import search
-from .db.loading import load_instance
+from .db.search import BOOKS_SELECT
+from .db import query_stats
+from .db.loading import load_instance, load_instances, EAGER_LOAD_BATCH_SIZE
 from .db.id_map import IndentityMap
-from .db.util import table_name_to_bridge_id_col
+from .db.tag_index import TagIndex
+from .db.util import table_name_to_bridge_id_col, joined_col_name_to_query_names
 from .manga import Book
+from .book_summary import BookSummary, SUMMARY_SELECT
+from .book_view import BookView, BOOK_VIEW_COLUMNS, fetch_book_views
+from .thumbnails import schedule_derivatives
 from .ext_info import ExternalInfo
 from .constants import CENSOR_IDS, STATUS_IDS, LANG_IDS
 
@@ -28,23 +37,37 @@ from .constants import CENSOR_IDS, STATUS_IDS, LANG_IDS
 configure_logging("manga_db.log")
 logger = logging.getLogger(__name__)
 
-# setup OpenerDirector to be used for all requests
+# OpenerDirector of the shared HTTP session (keep-alive connection pools per host)
+# that is used for all requests
 # cookiejar stores the cookies and the filecookiejar is able to save/load them to/from a file
-# FileCookieJar is a kind of abstract class (i.e. it has some functionality unimplemented)
-# have to use a specific subclass like MozillaCookieJar
-cookie_jar = http.cookiejar.MozillaCookieJar()
-# handles sending and setting cookies
-cookie_handler = urllib.request.HTTPCookieProcessor(cookie_jar)
-url_opener = urllib.request.build_opener(cookie_handler)
-# these get automatically added to every request that use the opener
-# but will be overwritten by headers that are passed to Request explicitly
-url_opener.addheaders = [
-    ('User-Agent', 'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:12.0) Gecko/20100101 Firefox/12.0'),
-]
+cookie_jar = http_session.default_session.cookie_jar
+url_opener = http_session.default_session.opener
 # Installing an opener is only necessary if you want urlopen to use that
 # opener; otherwise, simply call OpenerDirector.open() instead of urlopen().
 urllib.request.install_opener(url_opener)
 
+# pragmas that get set on every connection (they're not persistent)
+CONNECTION_PRAGMAS = (
+    # in WAL mode NORMAL is still safe from corruption, only the most recent
+    # transactions might get rolled back after a power loss
+    "PRAGMA synchronous=NORMAL",
+    # negative values are in KiB -> ~32MiB page cache instead of the default ~2MiB
+    "PRAGMA cache_size=-32000",
+    # read the db file using memory-mapped I/O (up to 256MiB)
+    "PRAGMA mmap_size=268435456",
+)
+
+# nr of rows MangaDB.iter_search reads at once
+ITER_SEARCH_BATCH_SIZE = 500
+
+# tables of the tag-like associated columns whose name<->id maps are cached per MangaDB
+TAG_TABLES = ("List", "Tag", "Category", "Collection", "Groups", "Artist", "Parody", "Character")
+# (db file, tag table) -> generation, it is bumped after a tag table was modified so the
+# cached maps of all MangaDB instances (e.g. the webGUI's per-thread connections) that
+# use the same file know that theirs are outdated
+_tag_map_generations: Dict[Tuple[str, str], int] = {}
+_tag_map_generations_lock = threading.Lock()
+
 # part of lexical analysis
 # This expression states that a "word" is either (1) non-quote, non-whitespace text
 # surrounded by whitespace, or (2) non-quote text surrounded by quotes (followed by some
@@ -116,13 +139,44 @@ class MangaDB:
     VALID_SEARCH_COLS = {"title", "language", "language_id", "status", "favorite",
                          "category", "artist", "parody", "character", "collection", "groups",
                          "tag", "list", "status", "status_id", "nsfw", "read_status", "downloaded"}
-
-    def __init__(self, root_dir, db_path, read_only=False, settings=None):
-        self.db_con, _ = self._load_or_create_sql_db(db_path, read_only)
+    # associated columns that get loaded for a whole page of books at once
+    # since the listing of books (show_entries.html) displays them
+    LISTING_EAGER_COLUMNS = ("tag", "artist", "ext_infos")
+
+    def __init__(self, root_dir, db_path, read_only=False, settings=None,
+                 connect_kwargs: Optional[Dict[str, Any]] = None,
+                 tag_index: Union[bool, TagIndex] = False,
+                 id_map_lru_size: int = 0, id_map_lru_max_age: Optional[float] = None):
+        # connect_kwargs are passed to sqlite3.connect e.g. check_same_thread=False
+        # if the instance is shared between threads (one thread at a time)
+        # tag_index: keep an in-memory index of the book ids per tag etc. that is used
+        # for evaluating the included/excluded tags etc. of searches, pass a TagIndex
+        # to use one that's shared with other instances (it's built by its owner)
+        # id_map_lru_size: nr of recently used books/ext infos that are kept in memory
+        # even if they're not referenced anymore, see IndentityMap
+        self.db_con, _ = self._load_or_create_sql_db(db_path, read_only, **(connect_kwargs or {}))
         self.root_dir = os.path.abspath(os.path.normpath(root_dir))
         # TODO if we have mutliple users in e.g. webgui we need to have separate IdentityMaps
-        self.id_map = IndentityMap()
+        self.id_map = IndentityMap(lru_size=id_map_lru_size, lru_max_age=id_map_lru_max_age)
+        # changes when another connection commits changes to the db
+        self._data_version = self.db_con.execute("PRAGMA data_version").fetchone()[0]
         self.language_map = self._get_language_map()
+        # key for _tag_map_generations, in-memory dbs are never shared
+        self._db_key = (os.path.realpath(db_path) if db_path != ":memory:"
+                        else f":memory:{id(self)}")
+        # tag table -> (generation, map like language_map)
+        self._tag_maps: Dict[str, Tuple[int, Dict[Union[int, str], Union[int, str]]]] = {}
+        # tag tables with inserts that the other instances haven't been notified about
+        self._tag_tables_changed: set = set()
+        self.tag_index: Optional[TagIndex] = None
+        # (table name, (book_id, tag_id) rows, added) that get applied to the tag_index
+        # once they were committed
+        self._tag_index_pending: List[Tuple[str, List[Tuple[int, int]], bool]] = []
+        if isinstance(tag_index, TagIndex):
+            self.tag_index = tag_index
+        elif tag_index:
+            self.tag_index = TagIndex(TAG_TABLES)
+            self.tag_index.build(self.db_con)
         self.settings = {}
         if settings is not None:
             self.settings.update(settings)
@@ -146,6 +200,30 @@ class MangaDB:
     def close(self):
         self.db_con.close()
 
+    def sync_external_changes(self) -> bool:
+        """
+        Drops the cached books etc. if the DB was changed by another connection since
+        the last check, since they might be stale
+
+        :return: True if there were changes
+        """
+        data_version = self.db_con.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return False
+        self._data_version = data_version
+        self.id_map.clear()
+        self.language_map = self._get_language_map()
+        # changes from our own instances already bumped the generation of the tag maps
+        # but the DB might have been changed by another process
+        self._tag_maps.clear()
+        return True
+
+    def _sync_cached_instances(self) -> None:
+        # without the lru the instances are only cached as long as they're in use
+        # -> we keep that behaviour and don't check on every access
+        if self.id_map.lru_size:
+            self.sync_external_changes()
+
     def _get_language_map(self):
         c = self.db_con.execute("SELECT id, name FROM Languages")
         result = {}
@@ -160,9 +238,15 @@ class MangaDB:
             return self.language_map[language]
         except KeyError:
             if create_unpresent:
-                with self.db_con:
+                if self.db_con.in_transaction:
+                    # part of the caller's transaction (e.g. when importing in batches)
+                    # so it has to refresh the language_map if it gets rolled back
                     c = self.db_con.execute("INSERT OR IGNORE INTO Languages (name) VALUES (?)",
                                             (language,))
+                else:
+                    with self.db_con:
+                        c = self.db_con.execute(
+                            "INSERT OR IGNORE INTO Languages (name) VALUES (?)", (language,))
                 if c.lastrowid:
                     self.language_map[language] = c.lastrowid
                     self.language_map[c.lastrowid] = language
@@ -170,6 +254,126 @@ class MangaDB:
             else:
                 return None
 
+    def get_tag_map(self, table_name: str) -> Dict[Union[int, str], Union[int, str]]:
+        """
+        Returns the cached map of id -> name and name -> id for one of the TAG_TABLES
+        NOTE: don't modify the returned map
+        """
+        generation = _tag_map_generations.get((self._db_key, table_name), 0)
+        try:
+            cached_generation, tag_map = self._tag_maps[table_name]
+        except KeyError:
+            pass
+        else:
+            if cached_generation == generation:
+                return tag_map
+
+        if table_name not in TAG_TABLES:
+            raise ValueError(f"'{table_name}' is not a tag table!")
+        c = self.db_con.execute(f"SELECT id, name FROM {table_name} ORDER BY id")
+        tag_map = {}
+        for _id, name in c.fetchall():
+            tag_map[_id] = name
+            tag_map[name] = _id
+        # uses the generation from before reading so we re-read if it changed in between
+        self._tag_maps[table_name] = (generation, tag_map)
+        return tag_map
+
+    def get_tag_options(self, table_name: str) -> List[Tuple[int, str]]:
+        """Returns (id, name) of all rows in the tag table ordered by id"""
+        return [(_id, name) for _id, name in self.get_tag_map(table_name).items()
+                if type(_id) == int]
+
+    def get_tag_ids(self, table_name: str, names: Sequence[str],
+                    create_unpresent: bool = False) -> List[Optional[int]]:
+        """
+        Resolves names of the tag table to ids using the cached map, names that aren't
+        in the map are looked up (and with create_unpresent inserted) in the DB
+        NOTE: when inserting, the caller has to call notify_tags_committed once its
+        transaction was committed
+        """
+        tag_map = self.get_tag_map(table_name)
+        ids = [cast(Optional[int], tag_map.get(name)) for name in names]
+        missing = [name for name, _id in zip(names, ids) if _id is None]
+        if not missing:
+            return ids
+
+        if create_unpresent:
+            self.db_con.executemany(f"INSERT OR IGNORE INTO {table_name}(name) VALUES (?)",
+                                    [(name,) for name in missing])
+            self._tag_tables_changed.add(table_name)
+        # NOTE: not cached since they might get rolled back, also names are compared
+        # case-insensitively by the DB so this also finds names that only differ in case
+        c = self.db_con.execute(f"""
+            SELECT id, name FROM {table_name}
+            WHERE name IN ({', '.join(['?'] * len(missing))})""", missing)
+        found = {name.lower(): _id for _id, name in c.fetchall()}
+        return [_id if _id is not None else found.get(name.lower())
+                for name, _id in zip(names, ids)]
+
+    def notify_tags_committed(self) -> None:
+        """
+        Invalidates the maps of tag tables that had inserts and applies the changes
+        to the bridge tables to the tag_index
+        """
+        if self._tag_tables_changed:
+            self.invalidate_tag_maps(*self._tag_tables_changed)
+            self._tag_tables_changed.clear()
+        if self._tag_index_pending:
+            tag_index = cast(TagIndex, self.tag_index)
+            for table_name, rows, added in self._tag_index_pending:
+                if added:
+                    tag_index.add(table_name, rows)
+                else:
+                    tag_index.remove(table_name, rows)
+            self._tag_index_pending.clear()
+
+    def discard_tag_changes(self) -> None:
+        """Forgets the changes that were tracked since the transaction was rolled back"""
+        self._tag_tables_changed.clear()
+        self._tag_index_pending.clear()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Same as using db_con as context manager (commits or rolls back) but also
+        applies the tracked changes to the tag tables (notify_tags_committed) once it
+        was committed or discards them when it was rolled back
+        """
+        try:
+            with self.db_con:
+                yield self.db_con
+        except BaseException:
+            self.discard_tag_changes()
+            raise
+        self.notify_tags_committed()
+
+    def track_bridge_rows(self, table_name: str, rows: Sequence[Tuple[int, int]],
+                          added: bool) -> None:
+        """
+        Records (book_id, tag_id) rows that were inserted into (or deleted from) the
+        bridge table of table_name so they can be applied to the tag_index once the
+        caller calls notify_tags_committed after committing
+        """
+        if self.tag_index is not None:
+            self._tag_index_pending.append((table_name, list(rows), added))
+
+    def invalidate_tag_index(self) -> None:
+        """Rebuilds the tag_index on next use e.g. after books were deleted"""
+        if self.tag_index is not None:
+            self.tag_index.stale = True
+
+    def invalidate_tag_maps(self, *table_names: str) -> None:
+        """
+        Invalidates the cached maps of the passed tag tables (or all) of all MangaDB
+        instances using the same DB file
+        """
+        with _tag_map_generations_lock:
+            for table_name in table_names or TAG_TABLES:
+                key = (self._db_key, table_name)
+                _tag_map_generations[key] = _tag_map_generations.get(key, 0) + 1
+                self._tag_maps.pop(table_name, None)
+
     def get_language_by_id(self, lang_id: int) -> Optional[str]:
         try:
             return self.language_map[lang_id]
@@ -179,23 +383,29 @@ class MangaDB:
 
     @staticmethod
     def download_cover(url: str, dir_path: str, book_id: int, overwrite: bool = False,
-                       forced_filename: Optional[str] = None) -> Optional[bool]:
+                       forced_filename: Optional[str] = None,
+                       generate_thumbs: bool = True) -> Optional[bool]:
+        """
+        :param generate_thumbs: Generate the thumbnail derivatives in the background
+                                (only for covers without a forced_filename)
+        """
         # NOTE: _0 appended to filename due to filename requirements imposed by the webGUI
         if forced_filename is None:
-            cover_path = os.path.join(dir_path, f"{book_id}_0")
+            cover_fn = f"{book_id}_0"
         else:
-            cover_path = os.path.join(dir_path, forced_filename)
+            cover_fn = forced_filename
+        cover_path = os.path.join(dir_path, cover_fn)
 
-        # TODO use urlopen and add headers
         if not os.path.isfile(cover_path) or overwrite:
             try:
-                urllib.request.urlretrieve(url,
-                                           cover_path)
+                http_session.default_session.download(url, cover_path)
             except urllib.error.HTTPError as err:
                 logger.warning("HTTP Error %s: %s: \"%s\"",
                                err.code, err.reason, url)
                 return False
             else:
+                if generate_thumbs and forced_filename is None:
+                    schedule_derivatives(dir_path, cover_fn, overwrite=overwrite)
                 return True
         else:
             logger.debug("Thumb at '%s' was skipped since the path already exists: '%s'",
@@ -208,7 +418,8 @@ class MangaDB:
         try:
             extractor_cls = extractor_cls if extractor_cls is not None else extractor.find(url)
             extr = extractor_cls(url)
-            data = extr.extract()
+            # re-uses the previous result if the site's responses didn't change
+            data, cover_url = extr.extract_cached()
         except urllib.error.HTTPError as err:
             # NOTE: the only error that we should get is on code 503 others will
             # not be re-raised
@@ -222,7 +433,7 @@ class MangaDB:
             return None, None, None
 
         if data:
-            return data, extr.get_cover(), None
+            return data, cover_url, None
         else:
             logger.warning("No book data recieved! URL was '%s'!", url)
             # @Hack this should also return an error code: enum or http code
@@ -247,7 +458,7 @@ class MangaDB:
                     extr_data: MangaExtractorData, thumb_url: str) -> Tuple[
                             Optional[int], Optional[Book], Optional[int]]: ...
 
-    # NOTE: !IMPORTANT also change single_thread_import in threads when this
+    # NOTE: !IMPORTANT also change AsyncImporter.import_book in threads when this
     # gets changed as well as webGUI/webGUI.py:import_book
     def import_book(self, url: str, lists: List[str],
                     extr_data: Optional[MangaExtractorData] = None,
@@ -290,22 +501,85 @@ class MangaDB:
         return bid, book, outdated_on_ei_id
 
     def get_x_books(self, x: int, after: Optional[Tuple[str, str]]=None,
-                    before: Optional[Tuple[str, str]]=None, order_by="Books.id DESC") -> Optional[
-                            List[sqlite3.Row]]:
+                    before: Optional[Tuple[str, str]]=None, order_by="Books.id DESC",
+                    eager: Sequence[str] = LISTING_EAGER_COLUMNS) -> Optional[List[Book]]:
+        rows = self._get_x_book_rows(x, after=after, before=before, order_by=order_by)
+        if rows:
+            return load_instances(self, Book, rows, eager=eager)
+        else:
+            return None
+
+    def _get_x_book_rows(self, x: int, after: Optional[Tuple[str, str]] = None,
+                         before: Optional[Tuple[str, str]] = None,
+                         order_by="Books.id DESC") -> List[sqlite3.Row]:
         # order by has to come b4 limit/offset
         query = ["SELECT * FROM Books",
                  f"ORDER BY {order_by}",
                  "LIMIT ?"]
         query, vals_in_order = search.keyset_pagination_statment(
                 query, [], after=after, before=before,
-                order_by=order_by, first_cond=True)
+                order_by=order_by, first_cond=True, wrap_before=False)
         c = self.db_con.execute(query, (*vals_in_order, x))
         rows = c.fetchall()
+        if before is not None:
+            # retrieved in reverse order
+            rows.reverse()
+        return rows
+
+    def get_x_book_summaries(self, x: int, after: Optional[Tuple[str, str]] = None,
+                             before: Optional[Tuple[str, str]] = None,
+                             order_by="Books.id DESC") -> List[BookSummary]:
+        """
+        Same as get_x_books but returns BookSummary instances which only need
+        one row per book
+        """
+        query = [SUMMARY_SELECT,
+                 f"ORDER BY {order_by}",
+                 "LIMIT ?"]
+        query, vals_in_order = search.keyset_pagination_statment(
+                query, [], after=after, before=before,
+                order_by=order_by, first_cond=True, wrap_before=False)
+        rows = self.db_con.execute(query, (*vals_in_order, x)).fetchall()
+        if before is not None:
+            # retrieved in reverse order
+            rows.reverse()
+        return [BookSummary(row) for row in rows]
+
+    def get_book_summaries(self, ids: Sequence[int]) -> List[BookSummary]:
+        """
+        Returns the BookSummary instances of the books with ids in the same order,
+        ids that aren't in the DB are skipped
+        """
+        by_id = {}
+        for start in range(0, len(ids), EAGER_LOAD_BATCH_SIZE):
+            batch = ids[start:start + EAGER_LOAD_BATCH_SIZE]
+            c = self.db_con.execute(
+                f"{SUMMARY_SELECT} WHERE Books.id IN ({', '.join('?' * len(batch))})",
+                batch)
+            for row in c.fetchall():
+                by_id[row["id"]] = BookSummary(row)
+        return [by_id[_id] for _id in ids if _id in by_id]
+
+    def get_book_views(self, ids: Sequence[int], columns: Sequence[str] = BOOK_VIEW_COLUMNS,
+                       associations: Sequence[str] = ()) -> List[BookView]:
+        """
+        Returns immutable BookView records of the books with ids in the same order
+        for read-only uses, ids that aren't in the DB are skipped
+        They bypass the id_map so unsaved changes to loaded Books aren't reflected
 
-        if rows:
-            return [load_instance(self, Book, row) for row in rows]
-        else:
-            return None
+        :param columns: Columns of Books the views contain, id is always included
+        :param associations: Associated columns (e.g. tag, ext_infos) the views contain
+        """
+        views: List[BookView] = []
+        for start in range(0, len(ids), EAGER_LOAD_BATCH_SIZE):
+            views.extend(fetch_book_views(
+                self.db_con, ids[start:start + EAGER_LOAD_BATCH_SIZE], columns, associations))
+        return views
+
+    def get_book_view(self, _id: int, columns: Sequence[str] = BOOK_VIEW_COLUMNS,
+                      associations: Sequence[str] = ()) -> Optional[BookView]:
+        views = self.get_book_views([_id], columns, associations)
+        return views[0] if views else None
 
     def get_outdated(self, id_onpage=None, imported_from=None, order_by="Books.id DESC"):
         if id_onpage and imported_from:
@@ -325,7 +599,7 @@ class MangaDB:
                     AND ei.outdated = 1
                     ORDER BY {order_by}""")
         rows = c.fetchall()
-        return [load_instance(self, Book, row) for row in rows] if rows else None
+        return load_instances(self, Book, rows) if rows else None
 
     def _validate_indentifiers_types(self, identifiers_types):
         if "url" in identifiers_types:
@@ -379,6 +653,7 @@ class MangaDB:
     def get_book(self, _id=None, title_eng=None, title_foreign=None):
         """Only id or title can guarantee uniqueness and querying using the title
            would be slower"""
+        self._sync_cached_instances()
         if _id:
             # try to get instance from id_map first
             instance = self.id_map.get((Book, (_id,)))
@@ -441,11 +716,10 @@ class MangaDB:
         """
         tag_table = col_name.capitalize()
         # NOTE: does not account for non-existant tag_id
-        c = self.db_con.execute(f"SELECT name FROM {tag_table} WHERE id = ?", (tag_id,))
-        tag_name, = c.fetchone()
+        tag_name = self.get_tag_map(tag_table)[tag_id]
 
         bridge_id_col = table_name_to_bridge_id_col(tag_table)
-        c.execute(f"SELECT book_id FROM Book{tag_table} WHERE {bridge_id_col} = ?", (tag_id,))
+        c = self.db_con.execute(f"SELECT book_id FROM Book{tag_table} WHERE {bridge_id_col} = ?", (tag_id,))
         book_ids_with_tag = c.fetchall()
 
         # NOTE: @Hack need to update books in id_map deleting the tag
@@ -455,7 +729,8 @@ class MangaDB:
         col_name = tag_table.lower()
         for (book_id,) in book_ids_with_tag:
             book = id_map.get((Book, (book_id,)))
-            if book is None:
+            # unloaded columns will be fetched from the DB after the change anyway
+            if book is None or not getattr(Book, col_name).is_loaded(book):
                 continue
 
             tag_was_dirty = col_name in book._committed_state
@@ -474,6 +749,9 @@ class MangaDB:
             # actually delete tag
             c.execute(f"DELETE FROM Book{tag_table} WHERE {bridge_id_col} = ?", (tag_id,))
             c.execute(f"DELETE FROM {tag_table} WHERE id = ?", (tag_id,))
+        self.invalidate_tag_maps(tag_table)
+        if self.tag_index is not None:
+            self.tag_index.remove_value(tag_table, tag_id)
 
     def update_tag_name(self, col_name: str, tag_id: int, new_tag_name: str, /) -> bool:
         """
@@ -481,13 +759,10 @@ class MangaDB:
         """
         tag_table = col_name.capitalize()
         db_con = self.db_con
-        c = db_con.execute(
-                f"SELECT name FROM {tag_table} WHERE id = ?", (tag_id,))
-        # value, = to unpack 1-tuple
-        old_tag_name, = c.fetchone()
+        old_tag_name = self.get_tag_map(tag_table)[tag_id]
 
         bridge_id_col = table_name_to_bridge_id_col(tag_table)
-        c.execute(f"SELECT book_id FROM Book{tag_table} WHERE {bridge_id_col} = ?", (tag_id,))
+        c = db_con.execute(f"SELECT book_id FROM Book{tag_table} WHERE {bridge_id_col} = ?", (tag_id,))
         book_ids_with_tag = c.fetchall()
 
         # rename tag first so we see if we violate a constraint
@@ -500,6 +775,7 @@ class MangaDB:
                 "Could not rename %s '%s' to '%s' since the new name already exists",
                 col_name, old_tag_name, new_tag_name)
             return False
+        self.invalidate_tag_maps(tag_table)
 
         # NOTE: @Hack need to update books in id_map with the new tag name
         # and also update their _committed_state since we don't have proper
@@ -507,7 +783,8 @@ class MangaDB:
         id_map = self.id_map
         for (book_id,) in book_ids_with_tag:
             book = id_map.get((Book, (book_id,)))
-            if book is None:
+            # unloaded columns will be fetched from the DB after the change anyway
+            if book is None or not getattr(Book, col_name).is_loaded(book):
                 continue
 
             tag_was_dirty = col_name in book._committed_state
@@ -578,13 +855,17 @@ class MangaDB:
         #     temp_move_to_cidx = new_in_cidx
 
     @overload
-    def get_books_in_collection(self, collection_identifier: str) -> Optional[List[Book]]: ...
+    def get_books_in_collection(self, collection_identifier: str,
+                                eager: Sequence[str] = ...) -> Optional[List[Book]]: ...
 
     @overload
-    def get_books_in_collection(self, collection_identifier: int) -> Optional[List[Book]]: ...
+    def get_books_in_collection(self, collection_identifier: int,
+                                eager: Sequence[str] = ...) -> Optional[List[Book]]: ...
 
     def get_books_in_collection(
-            self, collection_identifier: Union[str, int]) -> Optional[List[Book]]:
+            self, collection_identifier: Union[str, int],
+            eager: Sequence[str] = ()) -> Optional[List[Book]]:
+        # NOTE: collection listings only display normal columns -> nothing eager by default
 
         if isinstance(collection_identifier, str):
             id_name = 'name'
@@ -600,12 +881,13 @@ class MangaDB:
                 ORDER BY bc.in_collection_idx ASC""", (collection_identifier,))
         rows = c.fetchall()
         if rows:
-            books = [load_instance(self, Book, row) for row in rows]
+            books = load_instances(self, Book, rows, eager=eager)
             return books
         else:
             return None
 
     def get_ext_info(self, _id):
+        self._sync_cached_instances()
         c = self.db_con.execute("SELECT * FROM ExternalInfo WHERE id = ?", (_id,))
         row = c.fetchone()
         return load_instance(self, ExternalInfo, row, None) if row else None
@@ -617,7 +899,180 @@ class MangaDB:
                               search_str: str,
                               order_by: str = "Books.id DESC",
                               delimiter: str = ";",
+                              eager: Sequence[str] = LISTING_EAGER_COLUMNS,
                               **kwargs):
+        normal_col_values, assoc_col_values_incl, assoc_col_values_excl = \
+            self._parse_search_string(search_str, delimiter=delimiter)
+
+        # validate order_by from user input
+        if not search.validate_order_by_str(order_by):
+            logger.warning("Sorting %s is not supported", order_by)
+            order_by = "Books.id DESC"
+
+        if assoc_col_values_incl and self.tag_index is not None:
+            rows = self._search_tag_index(
+                normal_col_values, assoc_col_values_incl, assoc_col_values_excl,
+                order_by=order_by, **kwargs)
+            return load_instances(self, Book, rows, eager=eager)
+        elif normal_col_values or assoc_col_values_incl or assoc_col_values_excl:
+            rows = search.search_normal_mult_assoc(
+                    self.db_con, normal_col_values,
+                    assoc_col_values_incl, assoc_col_values_excl,
+                    order_by=order_by, **kwargs)
+            return load_instances(self, Book, rows, eager=eager)
+        else:
+            return self.get_x_books(kwargs.pop("limit", 60), order_by=order_by, eager=eager,
+                                    **kwargs)
+
+    def search_summaries(self, search_str: str, order_by: str = "Books.id DESC",
+                         delimiter: str = ";", **kwargs) -> List[BookSummary]:
+        """
+        Same as search but returns BookSummary instances that are read using a
+        single query with one row per book
+        """
+        normal_col_values, assoc_col_values_incl, assoc_col_values_excl = \
+            self._parse_search_string(search_str, delimiter=delimiter)
+
+        if not search.validate_order_by_str(order_by):
+            logger.warning("Sorting %s is not supported", order_by)
+            order_by = "Books.id DESC"
+
+        if assoc_col_values_incl and self.tag_index is not None:
+            rows = self._search_tag_index(
+                normal_col_values, assoc_col_values_incl, assoc_col_values_excl,
+                order_by=order_by, select=SUMMARY_SELECT, **kwargs)
+        elif normal_col_values or assoc_col_values_incl or assoc_col_values_excl:
+            rows = search.search_normal_mult_assoc(
+                    self.db_con, normal_col_values,
+                    assoc_col_values_incl, assoc_col_values_excl,
+                    order_by=order_by, select=SUMMARY_SELECT, **kwargs)
+        else:
+            return self.get_x_book_summaries(kwargs.pop("limit", 60), order_by=order_by,
+                                             **kwargs)
+        return [BookSummary(row) for row in rows]
+
+    def iter_search(self, search_str: str, order_by: str = "Books.id DESC",
+                    batch_size: int = ITER_SEARCH_BATCH_SIZE, books: bool = False,
+                    eager: Sequence[str] = (),
+                    delimiter: str = ";") -> Iterator[Union[sqlite3.Row, Book]]:
+        """
+        Generator version of search that yields all matching books but only reads
+        batch_size rows at a time, so memory use doesn't depend on the size of the result
+        Every batch is a separate keyset paginated query, so no statement is kept open
+        while the caller processes the rows
+
+        :param books: Yield Book instances instead of sqlite3.Row, which are only created
+                      for one batch at a time (with the columns in eager loaded per batch)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1!")
+        normal_col_values, assoc_col_values_incl, assoc_col_values_excl = \
+            self._parse_search_string(search_str, delimiter=delimiter)
+        if not search.validate_order_by_str(order_by):
+            logger.warning("Sorting %s is not supported", order_by)
+            order_by = "Books.id DESC"
+        if " " not in order_by:
+            order_by = f"{order_by} ASC"
+        order_by_col, direction = order_by.split(" ")
+        sort_by_id = order_by_col.lower() in ("books.id", "id")
+        if sort_by_id:
+            # keyset pagination only recognizes the qualified name as unique
+            order_by = f"Books.id {direction}"
+        order_by_col = order_by_col.split(".")[-1]
+
+        after: Optional[Tuple[Any, ...]] = None
+        while True:
+            if assoc_col_values_incl and self.tag_index is not None:
+                rows = self._search_tag_index(
+                    normal_col_values, assoc_col_values_incl, assoc_col_values_excl,
+                    order_by=order_by, limit=batch_size, after=after)
+            elif normal_col_values or assoc_col_values_incl or assoc_col_values_excl:
+                rows = search.search_normal_mult_assoc(
+                    self.db_con, normal_col_values, assoc_col_values_incl,
+                    assoc_col_values_excl, order_by=order_by, limit=batch_size, after=after)
+            else:
+                rows = self._get_x_book_rows(batch_size, after=after, order_by=order_by)
+            if not rows:
+                return
+
+            if books:
+                yield from load_instances(self, Book, rows, eager=eager)
+            else:
+                yield from rows
+            if len(rows) < batch_size:
+                return
+            last = rows[-1]
+            after = (last["id"],) if sort_by_id else (last[order_by_col], last["id"])
+
+    def _search_tag_index(self, normal_col_values: Dict[str, str],
+                          assoc_col_values_incl: Dict[str, List[str]],
+                          assoc_col_values_excl: Dict[str, List[str]],
+                          order_by: str = "Books.id DESC", limit: int = -1,
+                          after: Optional[Tuple[str, str]] = None,
+                          before: Optional[Tuple[str, str]] = None,
+                          select: str = BOOKS_SELECT) -> List[sqlite3.Row]:
+        """
+        Same as search.search_normal_mult_assoc but evaluates the included/excluded
+        associated column values using the tag_index so only the rows of the requested
+        page are read from the DB
+        """
+        tag_index = cast(TagIndex, self.tag_index)
+        tag_index.ensure_current(self.db_con)
+        include: List[Tuple[str, int]] = []
+        exclude: List[Tuple[str, int]] = []
+        for col_values, pairs in ((assoc_col_values_incl, include),
+                                  (assoc_col_values_excl, exclude)):
+            for col, values in col_values.items():
+                table_name, _ = joined_col_name_to_query_names(col)
+                for tag_id in self.get_tag_ids(table_name, values):
+                    if tag_id is None:
+                        if pairs is include:
+                            # no book can have a tag that doesn't exist
+                            return []
+                        continue
+                    pairs.append((table_name, tag_id))
+
+        book_ids = tag_index.evaluate(include, exclude)
+        if not book_ids:
+            return []
+        if normal_col_values or not order_by.lower().startswith("books.id"):
+            # the DB has to filter/sort them
+            return search.search_in_ids(self.db_con, book_ids, normal_col_values,
+                                        order_by=order_by, limit=limit,
+                                        after=after, before=before, select=select)
+
+        # sorted by id -> we can pick the page ourselves
+        asc = order_by.lower().endswith("asc")
+        ids = book_ids if asc else book_ids[::-1]
+        if after is not None:
+            cursor = int(after[0])
+            ids = [i for i in ids if (i > cursor if asc else i < cursor)]
+        elif before is not None:
+            cursor = int(before[0])
+            ids = [i for i in ids if (i < cursor if asc else i > cursor)]
+            if limit >= 0:
+                # closest to the cursor
+                ids = ids[max(len(ids) - limit, 0):]
+        if limit >= 0:
+            ids = ids[:limit]
+
+        rows_by_id = {}
+        for start in range(0, len(ids), EAGER_LOAD_BATCH_SIZE):
+            batch = ids[start:start + EAGER_LOAD_BATCH_SIZE]
+            c = self.db_con.execute(
+                f"{select} WHERE Books.id IN ({', '.join('?' * len(batch))})", batch)
+            for row in c.fetchall():
+                rows_by_id[row["id"]] = row
+        return [rows_by_id[i] for i in ids if i in rows_by_id]
+
+    def _parse_search_string(
+            self, search_str: str, delimiter: str = ";"
+            ) -> Tuple[Dict[str, str], Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+        Parses a search string like 'tag:Foo;!Bar artist:"Some Artist" title words'
+        :return: Tuple of normal column values, included and excluded associated
+                 column values
+        """
         normal_col_values: Dict[str, str] = {}
         assoc_col_values_incl: Dict[str, List[str]] = {}
         assoc_col_values_excl: Dict[str, List[str]] = {}
@@ -670,29 +1125,54 @@ class MangaDB:
                 incl, excl = search.search_assoc_col_string_parse(part, delimiter=delimiter)
                 # make sure not to add an empty list otherwise we wont get an empty dic
                 # that evaluates to false for testing in search_normal_mult_assoc
+                # extend so the same column can be used multiple times e.g. when
+                # refining a search
                 if incl:
-                    assoc_col_values_incl[search_col] = incl
+                    assoc_col_values_incl.setdefault(search_col, []).extend(incl)
                 if excl:
-                    assoc_col_values_excl[search_col] = excl
+                    assoc_col_values_excl.setdefault(search_col, []).extend(excl)
             else:
                 normal_col_values[search_col] = part
 
         # convert name of Censorship, Language etc. to id
         self.convert_names_to_ids(normal_col_values)
 
-        # validate order_by from user input
-        if not search.validate_order_by_str(order_by):
-            logger.warning("Sorting %s is not supported", order_by)
-            order_by = "Books.id DESC"
+        return normal_col_values, assoc_col_values_incl, assoc_col_values_excl
 
-        if normal_col_values or assoc_col_values_incl or assoc_col_values_excl:
-            rows = search.search_normal_mult_assoc(
-                    self.db_con, normal_col_values,
-                    assoc_col_values_incl, assoc_col_values_excl,
-                    order_by=order_by, **kwargs)
-            return [load_instance(self, Book, row) for row in rows]
-        else:
-            return self.get_x_books(kwargs.pop("limit", 60), order_by=order_by, **kwargs)
+    def get_facet_counts(self, table_name: str,
+                         min_count: int = 1) -> List[Tuple[int, str, int]]:
+        """
+        Returns (id, name, book_count) of all the tags etc. of one of the TAG_TABLES
+        with at least min_count books, most used first
+        book_count is maintained by triggers on the bridge tables
+        """
+        if table_name not in TAG_TABLES:
+            raise ValueError(f"'{table_name}' is not a tag table!")
+        c = self.db_con.execute(f"""
+            SELECT id, name, book_count FROM {table_name}
+            WHERE book_count >= ?
+            ORDER BY book_count DESC, name""", (min_count,))
+        return [tuple(row) for row in c.fetchall()]
+
+    def get_search_facets(
+            self, search_str: str, tables: Sequence[str] = TAG_TABLES,
+            delimiter: str = ";") -> Dict[str, List[Tuple[int, str, int]]]:
+        """
+        Returns table name -> [(id, name, book_count), ...] (most used first) counting
+        only the books that match search_str, computed for all tables using
+        one grouped query over the ids of the whole result set
+        """
+        for table_name in tables:
+            if table_name not in TAG_TABLES:
+                raise ValueError(f"'{table_name}' is not a tag table!")
+        normal_col_values, assoc_col_values_incl, assoc_col_values_excl = \
+            self._parse_search_string(search_str, delimiter=delimiter)
+        if not (normal_col_values or assoc_col_values_incl or assoc_col_values_excl):
+            # whole library
+            return {table_name: self.get_facet_counts(table_name) for table_name in tables}
+        return search.search_facet_counts(
+            self.db_con, normal_col_values, assoc_col_values_incl, assoc_col_values_excl,
+            tables)
 
     def convert_names_to_ids(self, dictlike):
         try:
@@ -718,7 +1198,7 @@ class MangaDB:
             pass
 
     @staticmethod
-    def _load_or_create_sql_db(filename, read_only=False):
+    def _load_or_create_sql_db(filename, read_only=False, **connect_kwargs):
         """
         Creates connection to sqlite3 db and a cursor object. Creates the DB if
         it doesn't exist yet.
@@ -727,26 +1207,33 @@ class MangaDB:
 
         :param filename: Filename string/path to file
         :param read_only: Whether to return a read-only database connection
+        :param connect_kwargs: Additional kwargs for sqlite3.connect
         :return: connection to sqlite3 db and cursor instance
         """
         if not os.path.isfile(filename):
             if read_only is True:
                 raise MangaDBException("Can't create new database in read-only mode!")
             else:
-                return MangaDB._create_sql_db(filename)
+                return MangaDB._create_sql_db(filename, **connect_kwargs)
 
         if read_only is True:
             # enable uri mode so we can pass mode ro for read-only access
-            conn = sqlite3.connect(f"file:{filename}?mode=ro", uri=True,
-                                   detect_types=sqlite3.PARSE_DECLTYPES)
+            conn = query_stats.connect(f"file:{filename}?mode=ro", uri=True,
+                                       detect_types=sqlite3.PARSE_DECLTYPES, **connect_kwargs)
         else:
             # PARSE_DECLTYPES -> parse types and search for converter function for
             # it instead of searching for converter func for specific column name
-            conn = sqlite3.connect(filename, detect_types=sqlite3.PARSE_DECLTYPES)
+            # uses a bigger statement cache than the default and records stats
+            # about all executed statements
+            conn = query_stats.connect(filename, detect_types=sqlite3.PARSE_DECLTYPES,
+                                       **connect_kwargs)
 
             # NOTE: migrate DB; context manager automatically closes connection
-            with migrate.Database(filename) as migration:
-                migration_success = migration.upgrade_to_latest()
+            # only reads the version from the db header when it's current already
+            migration_success = True
+            if not migrate.is_up_to_date(conn):
+                with migrate.Database(filename) as migration:
+                    migration_success = migration.upgrade_to_latest()
             if not migration_success:
                 conn.close()
                 raise MangaDBException("Could not migrate DB! Open an issue at "
@@ -765,13 +1252,29 @@ class MangaDB:
         # an effect on the current connection
         # => so this also does not need to be commited
         c.execute("PRAGMA foreign_keys=on")
+        MangaDB._configure_connection(conn, read_only)
 
         return conn, c
 
     @staticmethod
-    def _create_sql_db(filename, read_only=False):
-        conn = sqlite3.connect(filename, detect_types=sqlite3.PARSE_DECLTYPES)
+    def _configure_connection(conn: sqlite3.Connection, read_only: bool = False) -> None:
+        if not read_only:
+            # WAL: readers don't block the writer and the writer doesn't block readers
+            # journal_mode is persistent (stored in the db file) so read-only connections
+            # will use it as well; it can't be changed from inside a transaction
+            # NOTE: in-memory dbs stay in journal_mode memory
+            conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
+    @staticmethod
+    def _create_sql_db(filename, read_only=False, **connect_kwargs):
+        conn = query_stats.connect(filename, detect_types=sqlite3.PARSE_DECLTYPES,
+                                   **connect_kwargs)
         c = conn.cursor()
+        # lets migrations release free pages in bounded time (see backup.compact_db)
+        # has to be set before the first table is created
+        c.execute("PRAGMA auto_vacuum=INCREMENTAL")
 
         c.executescript("""
             CREATE TABLE Sites (
@@ -845,7 +1348,8 @@ class MangaDB:
             -- insensitive comparison when using '=' operator etc.
             CREATE TABLE List(
                     id INTEGER PRIMARY KEY ASC,
-                    name TEXT UNIQUE NOT NULL COLLATE NOCASE
+                    name TEXT UNIQUE NOT NULL COLLATE NOCASE,
+                    book_count INTEGER NOT NULL DEFAULT 0
                 );
             CREATE TABLE BookList(
                     book_id INTEGER NOT NULL,
@@ -858,7 +1362,8 @@ class MangaDB:
                 );
             CREATE TABLE Tag(
                     id INTEGER PRIMARY KEY ASC,
-                    name TEXT UNIQUE NOT NULL COLLATE NOCASE
+                    name TEXT UNIQUE NOT NULL COLLATE NOCASE,
+                    book_count INTEGER NOT NULL DEFAULT 0
                 );
             CREATE TABLE BookTag(
                     book_id INTEGER NOT NULL,
@@ -892,7 +1397,8 @@ class MangaDB:
                 );
             CREATE TABLE Collection(
                     id INTEGER PRIMARY KEY ASC,
-                    name TEXT UNIQUE NOT NULL COLLATE NOCASE
+                    name TEXT UNIQUE NOT NULL COLLATE NOCASE,
+                    book_count INTEGER NOT NULL DEFAULT 0
                 );
             CREATE TABLE BookCollection(
                     book_id INTEGER NOT NULL,
@@ -907,7 +1413,8 @@ class MangaDB:
                 );
             CREATE TABLE Category(
                     id INTEGER PRIMARY KEY ASC,
-                    name TEXT UNIQUE NOT NULL COLLATE NOCASE
+                    name TEXT UNIQUE NOT NULL COLLATE NOCASE,
+                    book_count INTEGER NOT NULL DEFAULT 0
                 );
             CREATE TABLE BookCategory(
                     book_id INTEGER NOT NULL,
@@ -921,7 +1428,8 @@ class MangaDB:
             -- Group protected keyword in sql
             CREATE TABLE Groups(
                     id INTEGER PRIMARY KEY ASC,
-                    name TEXT UNIQUE NOT NULL COLLATE NOCASE
+                    name TEXT UNIQUE NOT NULL COLLATE NOCASE,
+                    book_count INTEGER NOT NULL DEFAULT 0
                 );
             CREATE TABLE BookGroups(
                     book_id INTEGER NOT NULL,
@@ -935,7 +1443,8 @@ class MangaDB:
             CREATE TABLE Artist(
                     id INTEGER PRIMARY KEY ASC,
                     name TEXT UNIQUE NOT NULL COLLATE NOCASE,
-                    favorite INTEGER NOT NULL DEFAULT 0
+                    favorite INTEGER NOT NULL DEFAULT 0,
+                    book_count INTEGER NOT NULL DEFAULT 0
                 );
             CREATE TABLE BookArtist(
                     book_id INTEGER NOT NULL,
@@ -948,7 +1457,8 @@ class MangaDB:
                 );
             CREATE TABLE Parody(
                     id INTEGER PRIMARY KEY ASC,
-                    name TEXT UNIQUE NOT NULL COLLATE NOCASE
+                    name TEXT UNIQUE NOT NULL COLLATE NOCASE,
+                    book_count INTEGER NOT NULL DEFAULT 0
                 );
             CREATE TABLE BookParody(
                     book_id INTEGER NOT NULL,
@@ -961,7 +1471,8 @@ class MangaDB:
                 );
             CREATE TABLE Character(
                     id INTEGER PRIMARY KEY ASC,
-                    name TEXT UNIQUE NOT NULL COLLATE NOCASE
+                    name TEXT UNIQUE NOT NULL COLLATE NOCASE,
+                    book_count INTEGER NOT NULL DEFAULT 0
                 );
             CREATE TABLE BookCharacter(
                     book_id INTEGER NOT NULL,
@@ -979,6 +1490,7 @@ class MangaDB:
             -- -> append semicolon manually here
             {migrate.VERSION_TABLE_SQL};
             INSERT INTO '{migrate.VERSION_TABLE}' VALUES ({migrate.LATEST_VERSION}, 0);
+            PRAGMA user_version = {migrate.LATEST_VERSION};
 
             CREATE INDEX idx_id_onpage_imported_from ON
             ExternalInfo (id_onpage, imported_from);
@@ -995,6 +1507,27 @@ class MangaDB:
             CREATE UNIQUE INDEX idx_tag_name ON Tag (name COLLATE NOCASE);
             CREATE UNIQUE INDEX idx_title_eng_foreign
                 ON Books (title_eng, title_foreign);
+            -- bridge tables' primary keys are (book_id, x_id) -> reverse indices
+            -- for looking up the books that have a tag etc.
+            CREATE INDEX idx_bookartist_artist_id_book_id ON BookArtist (artist_id, book_id);
+            CREATE INDEX idx_bookcategory_category_id_book_id
+                ON BookCategory (category_id, book_id);
+            CREATE INDEX idx_bookcharacter_character_id_book_id
+                ON BookCharacter (character_id, book_id);
+            CREATE INDEX idx_bookcollection_collection_id_book_id
+                ON BookCollection (collection_id, book_id);
+            CREATE INDEX idx_bookgroups_group_id_book_id ON BookGroups (group_id, book_id);
+            CREATE INDEX idx_booklist_list_id_book_id ON BookList (list_id, book_id);
+            CREATE INDEX idx_bookparody_parody_id_book_id ON BookParody (parody_id, book_id);
+            CREATE INDEX idx_booktag_tag_id_book_id ON BookTag (tag_id, book_id);
+            -- (col, id) for all columns books can be sorted by, id is the tiebreaker
+            -- for keyset pagination
+            CREATE INDEX idx_books_title_eng_id ON Books (title_eng, id);
+            CREATE INDEX idx_books_title_foreign_id ON Books (title_foreign, id);
+            CREATE INDEX idx_books_pages_id ON Books (pages, id);
+            CREATE INDEX idx_books_my_rating_id ON Books (my_rating, id);
+            CREATE INDEX idx_books_last_change_id ON Books (last_change, id);
+            CREATE INDEX idx_externalinfo_book_id ON ExternalInfo (book_id);
 
             CREATE TRIGGER set_books_last_change
                                  AFTER UPDATE ON Books
@@ -1003,6 +1536,245 @@ class MangaDB:
                                     SET last_change = DATE('now', 'localtime')
                                     WHERE id = NEW.id;
                                  END
+;
+
+            -- full-text index on the titles; external content table so the titles
+            -- aren't stored twice -> has to be kept in sync using triggers
+            CREATE VIRTUAL TABLE BooksTitleFts USING fts5(
+                title_eng, title_foreign, content='Books', content_rowid='id',
+                {search.title_fts_tokenize_option()}
+            );
+
+            CREATE TRIGGER books_title_fts_insert
+                AFTER INSERT ON Books
+                BEGIN
+                    INSERT INTO BooksTitleFts(rowid, title_eng, title_foreign)
+                    VALUES (NEW.id, NEW.title_eng, NEW.title_foreign);
+                END;
+            CREATE TRIGGER books_title_fts_delete
+                AFTER DELETE ON Books
+                BEGIN
+                    INSERT INTO BooksTitleFts(BooksTitleFts, rowid, title_eng, title_foreign)
+                    VALUES ('delete', OLD.id, OLD.title_eng, OLD.title_foreign);
+                END;
+            CREATE TRIGGER books_title_fts_update
+                AFTER UPDATE OF title_eng, title_foreign ON Books
+                BEGIN
+                    INSERT INTO BooksTitleFts(BooksTitleFts, rowid, title_eng, title_foreign)
+                    VALUES ('delete', OLD.id, OLD.title_eng, OLD.title_foreign);
+                    INSERT INTO BooksTitleFts(rowid, title_eng, title_foreign)
+                    VALUES (NEW.id, NEW.title_eng, NEW.title_foreign);
+                END;
+
+            -- book_count of the tag tables: nr of books that have the tag etc.
+            CREATE TRIGGER booklist_count_insert
+                AFTER INSERT ON BookList
+                BEGIN
+                    UPDATE List SET book_count = book_count + 1
+                    WHERE id = NEW.list_id;
+                END;
+            CREATE TRIGGER booklist_count_delete
+                AFTER DELETE ON BookList
+                BEGIN
+                    UPDATE List SET book_count = book_count - 1
+                    WHERE id = OLD.list_id;
+                END;
+            CREATE TRIGGER booktag_count_insert
+                AFTER INSERT ON BookTag
+                BEGIN
+                    UPDATE Tag SET book_count = book_count + 1
+                    WHERE id = NEW.tag_id;
+                END;
+            CREATE TRIGGER booktag_count_delete
+                AFTER DELETE ON BookTag
+                BEGIN
+                    UPDATE Tag SET book_count = book_count - 1
+                    WHERE id = OLD.tag_id;
+                END;
+            CREATE TRIGGER bookcategory_count_insert
+                AFTER INSERT ON BookCategory
+                BEGIN
+                    UPDATE Category SET book_count = book_count + 1
+                    WHERE id = NEW.category_id;
+                END;
+            CREATE TRIGGER bookcategory_count_delete
+                AFTER DELETE ON BookCategory
+                BEGIN
+                    UPDATE Category SET book_count = book_count - 1
+                    WHERE id = OLD.category_id;
+                END;
+            CREATE TRIGGER bookcollection_count_insert
+                AFTER INSERT ON BookCollection
+                BEGIN
+                    UPDATE Collection SET book_count = book_count + 1
+                    WHERE id = NEW.collection_id;
+                END;
+            CREATE TRIGGER bookcollection_count_delete
+                AFTER DELETE ON BookCollection
+                BEGIN
+                    UPDATE Collection SET book_count = book_count - 1
+                    WHERE id = OLD.collection_id;
+                END;
+            CREATE TRIGGER bookgroups_count_insert
+                AFTER INSERT ON BookGroups
+                BEGIN
+                    UPDATE Groups SET book_count = book_count + 1
+                    WHERE id = NEW.group_id;
+                END;
+            CREATE TRIGGER bookgroups_count_delete
+                AFTER DELETE ON BookGroups
+                BEGIN
+                    UPDATE Groups SET book_count = book_count - 1
+                    WHERE id = OLD.group_id;
+                END;
+            CREATE TRIGGER bookartist_count_insert
+                AFTER INSERT ON BookArtist
+                BEGIN
+                    UPDATE Artist SET book_count = book_count + 1
+                    WHERE id = NEW.artist_id;
+                END;
+            CREATE TRIGGER bookartist_count_delete
+                AFTER DELETE ON BookArtist
+                BEGIN
+                    UPDATE Artist SET book_count = book_count - 1
+                    WHERE id = OLD.artist_id;
+                END;
+            CREATE TRIGGER bookparody_count_insert
+                AFTER INSERT ON BookParody
+                BEGIN
+                    UPDATE Parody SET book_count = book_count + 1
+                    WHERE id = NEW.parody_id;
+                END;
+            CREATE TRIGGER bookparody_count_delete
+                AFTER DELETE ON BookParody
+                BEGIN
+                    UPDATE Parody SET book_count = book_count - 1
+                    WHERE id = OLD.parody_id;
+                END;
+            CREATE TRIGGER bookcharacter_count_insert
+                AFTER INSERT ON BookCharacter
+                BEGIN
+                    UPDATE Character SET book_count = book_count + 1
+                    WHERE id = NEW.character_id;
+                END;
+            CREATE TRIGGER bookcharacter_count_delete
+                AFTER DELETE ON BookCharacter
+                BEGIN
+                    UPDATE Character SET book_count = book_count - 1
+                    WHERE id = OLD.character_id;
+                END;
+
+            -- values listing pages need per book that would otherwise take additional
+            -- queries, kept up-to-date by the triggers below
+            CREATE TABLE BookSummary(
+                    book_id INTEGER PRIMARY KEY,
+                    -- names are ordered and separated by ';'
+                    tags TEXT NOT NULL DEFAULT '',
+                    artists TEXT NOT NULL DEFAULT '',
+                    avg_ext_rating REAL,
+                    FOREIGN KEY (book_id) REFERENCES Books(id)
+                       ON DELETE CASCADE
+                );
+            CREATE TRIGGER book_summary_books_insert
+                AFTER INSERT ON Books
+                BEGIN
+                    INSERT OR REPLACE INTO BookSummary(book_id) VALUES (NEW.id);
+                END;
+            CREATE TRIGGER book_summary_books_delete
+                AFTER DELETE ON Books
+                BEGIN
+                    DELETE FROM BookSummary WHERE book_id = OLD.id;
+                END;
+            CREATE TRIGGER book_summary_booktag_insert
+                AFTER INSERT ON BookTag
+                BEGIN
+                    UPDATE BookSummary SET tags = COALESCE((
+                        SELECT group_concat(name, ';') FROM (
+                            SELECT x.name AS name FROM BookTag bx, Tag x
+                            WHERE bx.book_id = NEW.book_id AND x.id = bx.tag_id
+                            ORDER BY x.name)), '')
+                    WHERE book_id = NEW.book_id;
+                END;
+            CREATE TRIGGER book_summary_booktag_delete
+                AFTER DELETE ON BookTag
+                BEGIN
+                    UPDATE BookSummary SET tags = COALESCE((
+                        SELECT group_concat(name, ';') FROM (
+                            SELECT x.name AS name FROM BookTag bx, Tag x
+                            WHERE bx.book_id = OLD.book_id AND x.id = bx.tag_id
+                            ORDER BY x.name)), '')
+                    WHERE book_id = OLD.book_id;
+                END;
+            CREATE TRIGGER book_summary_tag_rename
+                AFTER UPDATE OF name ON Tag
+                BEGIN
+                    UPDATE BookSummary SET tags = COALESCE((
+                        SELECT group_concat(name, ';') FROM (
+                            SELECT x.name AS name FROM BookTag bx, Tag x
+                            WHERE bx.book_id = BookSummary.book_id AND x.id = bx.tag_id
+                            ORDER BY x.name)), '')
+                    WHERE book_id IN (
+                        SELECT book_id FROM BookTag WHERE tag_id = NEW.id);
+                END;
+            CREATE TRIGGER book_summary_bookartist_insert
+                AFTER INSERT ON BookArtist
+                BEGIN
+                    UPDATE BookSummary SET artists = COALESCE((
+                        SELECT group_concat(name, ';') FROM (
+                            SELECT x.name AS name FROM BookArtist bx, Artist x
+                            WHERE bx.book_id = NEW.book_id AND x.id = bx.artist_id
+                            ORDER BY x.name)), '')
+                    WHERE book_id = NEW.book_id;
+                END;
+            CREATE TRIGGER book_summary_bookartist_delete
+                AFTER DELETE ON BookArtist
+                BEGIN
+                    UPDATE BookSummary SET artists = COALESCE((
+                        SELECT group_concat(name, ';') FROM (
+                            SELECT x.name AS name FROM BookArtist bx, Artist x
+                            WHERE bx.book_id = OLD.book_id AND x.id = bx.artist_id
+                            ORDER BY x.name)), '')
+                    WHERE book_id = OLD.book_id;
+                END;
+            CREATE TRIGGER book_summary_artist_rename
+                AFTER UPDATE OF name ON Artist
+                BEGIN
+                    UPDATE BookSummary SET artists = COALESCE((
+                        SELECT group_concat(name, ';') FROM (
+                            SELECT x.name AS name FROM BookArtist bx, Artist x
+                            WHERE bx.book_id = BookSummary.book_id AND x.id = bx.artist_id
+                            ORDER BY x.name)), '')
+                    WHERE book_id IN (
+                        SELECT book_id FROM BookArtist WHERE artist_id = NEW.id);
+                END;
+            CREATE TRIGGER book_summary_externalinfo_insert
+                AFTER INSERT ON ExternalInfo
+                BEGIN
+                    UPDATE BookSummary SET avg_ext_rating =
+                        (SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo
+                         WHERE book_id = NEW.book_id)
+                    WHERE book_id = NEW.book_id;
+                END;
+            CREATE TRIGGER book_summary_externalinfo_delete
+                AFTER DELETE ON ExternalInfo
+                BEGIN
+                    UPDATE BookSummary SET avg_ext_rating =
+                        (SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo
+                         WHERE book_id = OLD.book_id)
+                    WHERE book_id = OLD.book_id;
+                END;
+            CREATE TRIGGER book_summary_externalinfo_update
+                AFTER UPDATE OF rating, book_id ON ExternalInfo
+                BEGIN
+                    UPDATE BookSummary SET avg_ext_rating =
+                        (SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo
+                         WHERE book_id = OLD.book_id)
+                    WHERE book_id = OLD.book_id;
+                    UPDATE BookSummary SET avg_ext_rating =
+                        (SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo
+                         WHERE book_id = NEW.book_id)
+                    WHERE book_id = NEW.book_id;
+                END
                  """
         c.executescript(create_db_sql)
         # commit changes
@@ -1012,5 +1784,6 @@ class MangaDB:
         conn.row_factory = sqlite3.Row
         # get new cursor after row factory change otherwise cursor will still use tuples!
         c = conn.cursor()
+        MangaDB._configure_connection(conn)
 
         return conn, c
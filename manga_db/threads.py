@@ -1,127 +1,432 @@
 import os
 import time
+import asyncio
 import logging
-from threading import Thread, current_thread
-from queue import Queue
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 
-from typing import TYPE_CHECKING, Tuple, Union, Optional
+from typing import TYPE_CHECKING, Dict, Tuple, Type, Optional, List, Any, cast
 
 from .manga_db import MangaDB
 from .manga import Book
 from .ext_info import ExternalInfo
-from .extractor.base import MangaExtractorData
+from .db.util import joined_col_name_to_query_names
+from .extractor import find as find_extractor, NoExtractorFound
+from .extractor.base import BaseMangaExtractor, MangaExtractorData
 
 if TYPE_CHECKING:
-    from .link_collector import UrlList, ImportData
+    from .link_collector import UrlList
 
 logger = logging.getLogger(__name__)
 
-NUMBER_OF_THREADS = 3
-URL_WORKER_SLEEP = 1
+# threads that do the blocking network I/O, the actual nr of requests that are
+# in flight is limited per site by BaseMangaExtractor.max_concurrency
+MAX_RETRIEVE_WORKERS = 16
+# nr of covers that can be downloaded at the same time, independent of the
+# limits for retrieving book data
+COVER_DOWNLOAD_CONCURRENCY = 4
+# lanes that each get their own set of limiters per extractor
 RETRIEVE_BOOK_DATA, DOWNLOAD_COVER = 0, 1
+# imported books are committed once a batch has this many books or once the
+# first book of the batch was added this many ms ago
+IMPORT_BATCH_SIZE = 50
+IMPORT_BATCH_MS = 500
 
 
-def thread_retrieve_data_or_cover(url_queue: Queue, book_queue: Queue) -> None:
-    while True:
-        # will block on the statement .get() until the queue has something to return, so it
-        # is safe to start the threads before there is anything in the queue
-        task, data = url_queue.get()
-        if task is None:
-            break
-        if task == RETRIEVE_BOOK_DATA:
-            try:
-                url = data
-                print(f"{current_thread().name}: Getting data for url {url}")
-                extr_data, thumb_url_opt, _ = MangaDB.retrieve_book_data(url)
-                # also put None in the queue so importer know the link was processed
-                book_queue.put((url, extr_data, thumb_url_opt))
-            except Exception:
-                # communicate to importer that failed link was processed
-                # so importer can terminate properly
-                book_queue.put((None, None, None))
-                raise
-            finally:
-                # wrap task_done in finally so even when we get an exception (thread wont exit)
-                # the task will be marked as done
-                # otherwise there could be mixups
-
-                # Indicate that a formerly enqueued task is complete.
-                # Used by queue consumer threads.
-                # For each get() used to fetch a task, a subsequent call to task_done()
-                # tells the queue that the processing on the task is complete.
-                url_queue.task_done()
-        elif task == DOWNLOAD_COVER:
-            try:
-                book_id: int
-                # 'thumb_url: str' was defined from ln34 in other if branch
-                # since a function is one scope -> need to rename
-                thumb_url: str
-                cover_dir_path: str
-                book_id, thumb_url, cover_dir_path = data
-                print(f"{current_thread().name}: Downloading cover from {thumb_url}")
-                MangaDB.download_cover(thumb_url, cover_dir_path, book_id)
-            finally:
-                url_queue.task_done()
-        else:
-            print("Didnt recognize task {task}!")
-        time.sleep(URL_WORKER_SLEEP)
+class TokenBucket:
+    """
+    Allows rate requests per second on average and bursts of up to capacity requests
+    Has to be used from a single event loop
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
 
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
 
-def single_thread_import(data_path: str, url_lists: 'UrlList', to_process: int,
-                         url_queue: Queue, book_queue: Queue) -> None:
-    # only the thread that created the sqlite conn can use it!!
-    mdb = MangaDB(data_path, os.path.join(data_path, "manga_db.sqlite"))
+    async def acquire(self) -> None:
+        # rate <= 0 means unlimited
+        if self.rate <= 0:
+            return
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
 
-    processed = 0
-    while True:
-        # check on top so it doesnt get skipped if we continue
-        if processed == to_process:
-            # send url workers signal to stop
-            for _ in range(NUMBER_OF_THREADS):
-                url_queue.put((None, None))
-            break
-        time.sleep(0.1)
 
+class SiteLimiter:
+    """
+    Limits the concurrency and the request rate for a single extractor class
+    using the limits the extractor declares
+    """
+
+    def __init__(self, extractor_cls: Type[BaseMangaExtractor]):
+        self.semaphore = asyncio.Semaphore(max(1, extractor_cls.max_concurrency))
+        self.bucket = TokenBucket(extractor_cls.rate_limit, extractor_cls.rate_limit_burst)
+
+    async def __aenter__(self) -> 'SiteLimiter':
+        await self.semaphore.acquire()
         try:
-            url, extr_data, thumb_url = book_queue.get()
-            if extr_data is None:
-                continue
-            print(f"{current_thread().name}: Adding book at {url}")
+            await self.bucket.acquire()
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.semaphore.release()
+
+
+class BatchImporter:
+    """
+    Adds books to the DB in batches of up to batch_size books or batch_ms ms of work
+    per transaction, instead of committing (and thus syncing) once per book
+
+    Every book is added inside its own savepoint, so a book that fails only rolls
+    back its own rows. Tag-like names are resolved to ids using an in-memory cache
+    and the bridge rows of a book are inserted using one executemany per table
+
+    NOTE: has to be the only one writing with mdb's connection while a batch is open
+    """
+
+    def __init__(self, mdb: MangaDB, batch_size: int = IMPORT_BATCH_SIZE,
+                 batch_ms: float = IMPORT_BATCH_MS):
+        self.mdb = mdb
+        self.batch_size = batch_size
+        self.batch_ms = batch_ms
+        # table name -> name -> id of names that were inserted by this importer, names
+        # that are already in the DB are resolved using mdb's tag maps
+        self.name_ids: Dict[str, Dict[str, int]] = {}
+        # names inserted by the current book/batch, need to be removed from the cache
+        # when they're rolled back
+        self._book_new_names: List[Tuple[str, str]] = []
+        self._batch_new_names: List[Tuple[str, str]] = []
+        # bridge table -> rows inserted by the current book/batch, they're passed on to
+        # the tag index once the batch is committed
+        self._book_bridge_rows: Dict[str, List[Tuple[Any, ...]]] = {}
+        self._bridge_rows: Dict[str, List[Tuple[Any, ...]]] = {}
+        # (url, rows of book and ext_info that were added in this batch)
+        self._added: List[Tuple[str, Optional[Book], ExternalInfo]] = []
+        # id -> book added in this batch, they're only added to the id_map once committed
+        self._batch_books: Dict[int, Book] = {}
+        self._batch_start: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._added)
 
-            book, ext_info = mdb.book_and_ei_from_data(extr_data)
-            book.list = url_lists[url]["lists"]
-            ext_info.downloaded = 1 if url_lists[url]["downloaded"] else 0
+    @property
+    def due(self) -> bool:
+        return bool(self._added) and (
+            len(self._added) >= self.batch_size or
+            self._batch_start is not None and
+            (time.perf_counter() - self._batch_start) * 1000 >= self.batch_ms)
 
-            bid, outdated_on_ei_id = book.save(block_update=True)
+    def add(self, url: str, extr_data: MangaExtractorData, lists: List[str],
+            downloaded: bool) -> bool:
+        """
+        Adds the book (or only the external info if the book is already in the DB)
+        to the current batch, the caller has to commit it once it's due
+        Returns False if adding the book failed
+        """
+        db_con = self.mdb.db_con
+        if self._batch_start is None:
+            db_con.execute("BEGIN")
+            self._batch_start = time.perf_counter()
+
+        db_con.execute("SAVEPOINT import_book")
+        book: Optional[Book] = None
+        ext_info: Optional[ExternalInfo] = None
+        try:
+            book, ext_info = self.mdb.book_and_ei_from_data(extr_data)
+            book.list = lists
+            ext_info.downloaded = 1 if downloaded else 0
+            added = self._add_book(url, book, ext_info)
         except Exception:
-            # except needed for else
-            raise
+            logger.exception("Adding the book at url '%s' failed!", url)
+            db_con.execute("ROLLBACK TO import_book")
+            db_con.execute("RELEASE import_book")
+            self._discard_new_names(self._book_new_names)
+            self._book_new_names = []
+            self._book_bridge_rows = {}
+            for row in (book, ext_info):
+                if row is not None:
+                    row.id = None
+            # might have added the language
+            self.mdb.language_map = self.mdb._get_language_map()
+            return False
+        else:
+            db_con.execute("RELEASE import_book")
+            self._batch_new_names.extend(self._book_new_names)
+            self._book_new_names = []
+            for table_name, rows in self._book_bridge_rows.items():
+                self._bridge_rows.setdefault(table_name, []).extend(rows)
+            self._book_bridge_rows = {}
+            if added is not None:
+                self._added.append(added)
+                if added[1] is not None:
+                    self._batch_books[book.id] = book
+        return True
+
+    def _add_book(self, url: str, book: Book,
+                  ext_info: ExternalInfo) -> Optional[Tuple[str, Optional[Book], ExternalInfo]]:
+        bid = None
+        # books with both titles are kept unique by idx_title_eng_foreign, but since NULLs
+        # are distinct in UNIQUE indices we have to check the others ourselves
+        if book.title_eng is None or book.title_foreign is None:
+            bid = self.mdb.get_book_id(book.title_eng, book.title_foreign)
+        if bid is None:
+            try:
+                book._insert_entry()
+            except sqlite3.IntegrityError:
+                bid = self.mdb.get_book_id(book.title_eng, book.title_foreign)
+                if bid is None:
+                    raise
+
+        if bid is None:
+            for col in Book.ASSOCIATED_COLUMNS:
+                if col == "ext_infos":
+                    continue
+                values = getattr(book, col)
+                if values and self._add_bridge_rows(book.id, col, values) != len(values):
+                    # duplicates were dropped -> re-fetch from the DB on next access
+                    getattr(Book, col).set_unloaded(book)
+            # inside the book's savepoint so a failing row only discards this book
+            self._insert_bridge_rows(self._book_bridge_rows)
+            ext_info._insert_entry()
+            logger.info("Added book with title \"%s\"  as id '%d' to database!",
+                        book.title, book.id)
+            return url, book, ext_info
+
+        logger.info("Book at url '%s' was already in DB!", url)
+        # try to add ext_info to the book thats already in db if its not already on it
+        c = self.mdb.db_con.execute("""
+                SELECT 1 FROM ExternalInfo
+                WHERE book_id = ? AND id_onpage = ? AND imported_from = ?""",
+                                    (bid, ext_info.id_onpage, ext_info.imported_from))
+        if c.fetchone() is not None:
+            return None
+        ext_info.book = self._batch_books.get(bid) or self.mdb.get_book(_id=bid)
+        ext_info.book_id = bid
+        ext_info._insert_entry()
+        logger.info("Added external info at url '%s' to book instead!", url)
+        return url, None, ext_info
+
+    def _name_id(self, table_name: str, name: str) -> int:
+        cache = self.name_ids.setdefault(table_name, {})
+        try:
+            return cache[name]
+        except KeyError:
+            pass
+        _id = cast(Optional[int], self.mdb.get_tag_map(table_name).get(name))
+        if _id is not None:
+            return _id
+        # NOTE: safe to use table_name in the query since it's derived from our columns
+        # names are compared case-insensitively by the DB
+        c = self.mdb.db_con.execute(f"SELECT id FROM {table_name} WHERE name = ?", (name,))
+        row = c.fetchone()
+        if row is None:
+            c.execute(f"INSERT INTO {table_name}(name) VALUES (?)", (name,))
+            _id = cast(int, c.lastrowid)
+            self._book_new_names.append((table_name, name))
         else:
-            if bid is None:
-                logger.info("Book at url '%s' was already in DB!",
-                            url if url is not None else book.ext_infos[0].url)
-                # load book thats already in db and try to add ext_info to it
-                # if its not already on the book
-                b = mdb.get_book(title_eng=book.title_eng, title_foreign=book.title_foreign)
-                if not any(ei for ei in b.ext_infos if ei.id_onpage == ext_info.id_onpage
-                           and ei.imported_from == ext_info.imported_from):
-                    ext_info.book = b
-                    ext_info.book_id = b.id
-                    b.ext_infos.append(ext_info)
-                    ext_info.save()
-                    logger.info("Added external info at url '%s' to book instead!",
-                                url if url is not None else book.ext_infos[0].url)
-                # also counts as processed/done
-                # book_done called in finally
+            _id = row[0]
+        cache[name] = _id
+        return _id
+
+    def _add_bridge_rows(self, book_id: int, col_name: str, values: List[str]) -> int:
+        """:return: Nr of rows that were added"""
+        table_name, _ = joined_col_name_to_query_names(col_name)
+        # duplicates or names only differing in case resolve to the same id
+        name_ids = dict.fromkeys(self._name_id(table_name, val) for val in values)
+        self._book_bridge_rows.setdefault(table_name, []).extend(
+            (book_id, name_id) for name_id in name_ids)
+        return len(name_ids)
+
+    def _discard_new_names(self, new_names: List[Tuple[str, str]]) -> None:
+        for table_name, name in new_names:
+            self.name_ids[table_name].pop(name, None)
+
+    def _insert_bridge_rows(self, bridge_rows: Dict[str, List[Tuple[Any, ...]]]) -> None:
+        db_con = self.mdb.db_con
+        for table_name, rows in bridge_rows.items():
+            if not rows:
+                continue
+            _, bridge_col_name = joined_col_name_to_query_names(table_name.lower())
+            # TODO @Hack need to treat this specially since we need the max in_collection_idx
+            if table_name == "Collection":
+                db_con.executemany("""
+                    INSERT INTO BookCollection(book_id, collection_id, in_collection_idx)
+                    VALUES (?, ?, (
+                        SELECT MAX(bc.in_collection_idx) + 1
+                        FROM BookCollection bc
+                    ))""", rows)
             else:
-                cover_dir_path = os.path.join(mdb.root_dir, "thumbs")
-                url_queue.put((DOWNLOAD_COVER, (book.id, thumb_url, cover_dir_path)))
+                db_con.executemany(f"""
+                    INSERT INTO Book{table_name}(book_id, {bridge_col_name})
+                    VALUES (?, ?)""", rows)
+
+    def commit(self) -> List[Tuple[str, int]]:
+        """
+        Commits the current batch
+        Returns (url, book_id) of all books that were newly added, so their covers
+        can be downloaded
+        """
+        if self._batch_start is None:
+            return []
+        db_con = self.mdb.db_con
+        added, self._added = self._added, []
+        new_name_tables = {table_name for table_name, _ in self._batch_new_names}
+        try:
+            db_con.commit()
+            if new_name_tables:
+                self.mdb.invalidate_tag_maps(*new_name_tables)
+            for table_name, rows in self._bridge_rows.items():
+                self.mdb.track_bridge_rows(table_name, rows, added=True)
+            self.mdb.notify_tags_committed()
+        except Exception:
+            logger.exception("Committing a batch of %d books failed! Rolling it back!",
+                             len(added))
+            db_con.rollback()
+            self.mdb.discard_tag_changes()
+            self._discard_new_names(self._batch_new_names)
+            self.mdb.language_map = self.mdb._get_language_map()
+            for _, book, ext_info in added:
+                ext_info.id = None
+                if book is not None:
+                    book.id = None
+            return []
         finally:
-            processed += 1
-            # wrap task_done in finally so even when we get an exception (thread wont exit)
-            # the task will be marked as done
-            # otherwise there could be mixups esp. with the covers and their filenames
-            book_queue.task_done()
+            self._bridge_rows = {}
+            self._batch_books = {}
+            self._batch_new_names = []
+            self._batch_start = None
+
+        new_books = []
+        for url, book, ext_info in added:
+            ext_info._mark_added()
+            if book is not None:
+                book._mark_added()
+                new_books.append((url, book.id))
+            else:
+                ext_info.book.ext_infos.append(ext_info)
+        return new_books
+
+
+class AsyncImporter:
+    """
+    Retrieves the book data of all urls concurrently (respecting the limits of every
+    extractor separately) and imports the books in batches on the loop's thread, since
+    only the thread that created the sqlite connection can use it
+
+    Covers are downloaded in a separate lane once their book was committed, so they
+    neither use up a site's limit for retrieving book data nor hold back the import
+    """
+
+    # created in run so they're bound to the running loop (py3.8 binds on creation)
+    loop: asyncio.AbstractEventLoop
+    executor: ThreadPoolExecutor
+    cover_lane: asyncio.Semaphore
+    batch: BatchImporter
+
+    def __init__(self, data_path: str, url_lists: 'UrlList'):
+        self.data_path = data_path
+        self.url_lists = url_lists
+        self.cover_dir_path = os.path.join(data_path, "thumbs")
+        # (lane, extractor class) -> limiter
+        self.limiters: Dict[Tuple[int, Type[BaseMangaExtractor]], SiteLimiter] = {}
+        # url -> (extractor class, thumb url) of books that haven't been committed yet
+        self.pending_covers: Dict[str, Tuple[Type[BaseMangaExtractor], str]] = {}
+        self.cover_tasks: List['asyncio.Future[None]'] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def limiter(self, lane: int, extractor_cls: Type[BaseMangaExtractor]) -> SiteLimiter:
+        key = (lane, extractor_cls)
+        try:
+            return self.limiters[key]
+        except KeyError:
+            limiter = self.limiters[key] = SiteLimiter(extractor_cls)
+            return limiter
+
+    async def run(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        # created in the thread running the loop, all imports happen on this thread
+        mdb = MangaDB(self.data_path, os.path.join(self.data_path, "manga_db.sqlite"))
+        self.batch = BatchImporter(mdb)
+        self.cover_lane = asyncio.Semaphore(COVER_DOWNLOAD_CONCURRENCY)
+        self.executor = ThreadPoolExecutor(max_workers=MAX_RETRIEVE_WORKERS,
+                                           thread_name_prefix="URL-Worker")
+        try:
+            await asyncio.gather(*(self.process_url(url) for url in self.url_lists))
+            self.flush()
+            await asyncio.gather(*self.cover_tasks)
+        finally:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self.executor.shutdown(wait=True)
+            mdb.close()
+
+    async def process_url(self, url: str) -> None:
+        try:
+            extractor_cls = find_extractor(url)
+        except NoExtractorFound:
+            logger.warning("No extractor found for url '%s'!", url)
+            return
+
+        try:
+            async with self.limiter(RETRIEVE_BOOK_DATA, extractor_cls):
+                print(f"Getting data for url {url}")
+                extr_data, thumb_url, _ = await self.loop.run_in_executor(
+                    self.executor, MangaDB.retrieve_book_data, url, extractor_cls)
+        except Exception:
+            # don't let one url cancel the whole import
+            logger.exception("Retrieving the book data at url '%s' failed!", url)
+            return
+        if extr_data is None:
+            return
+
+        print(f"Adding book at {url}")
+        if thumb_url:
+            self.pending_covers[url] = (extractor_cls, thumb_url)
+        self.batch.add(url, extr_data, self.url_lists[url]["lists"],
+                       self.url_lists[url]["downloaded"])
+        if self.batch.due:
+            self.flush()
+        elif len(self.batch) and self._flush_handle is None:
+            # make sure the batch gets committed in time even if no other book is added
+            self._flush_handle = self.loop.call_later(self.batch.batch_ms / 1000, self.flush)
+
+    def flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._download_covers(self.batch.commit())
+
+    def _download_covers(self, new_books: List[Tuple[str, int]]) -> None:
+        for url, book_id in new_books:
+            try:
+                extractor_cls, thumb_url = self.pending_covers.pop(url)
+            except KeyError:
+                continue
+            self.cover_tasks.append(asyncio.ensure_future(
+                self.download_cover(extractor_cls, book_id, thumb_url)))
+
+    async def download_cover(self, extractor_cls: Type[BaseMangaExtractor],
+                             book_id: int, thumb_url: str) -> None:
+        try:
+            async with self.cover_lane, self.limiter(DOWNLOAD_COVER, extractor_cls):
+                print(f"Downloading cover from {thumb_url}")
+                await self.loop.run_in_executor(self.executor, MangaDB.download_cover,
+                                                thumb_url, self.cover_dir_path, book_id)
+        except Exception:
+            logger.exception("Downloading the cover at '%s' failed!", thumb_url)
 
 
 def import_multiple(data_path: str, url_lists: 'UrlList') -> None:
@@ -132,38 +437,6 @@ def import_multiple(data_path: str, url_lists: 'UrlList') -> None:
         return
     os.makedirs(os.path.join(data_path, "thumbs"), exist_ok=True)
 
-    # type annotation not possible without putting it in str
-    # errors with type obj not subscriptable
-    url_queue: "Queue[Tuple[Optional[int], Optional[Union[str, Tuple[int, str, str]]]]]" = Queue()
-    book_queue: "Queue[Tuple[Optional[str], Optional[MangaExtractorData], Optional[str]]]" = Queue()
-    print("** Filling URL Queue! **")
-    for url, url_data in url_lists.items():
-        url_queue.put((RETRIEVE_BOOK_DATA, url))
-
-    print("** Starting threads! **")
-    url_workers = []
-    for i in range(NUMBER_OF_THREADS):
-        t = Thread(
-                name=f"URL-Worker {i}", target=thread_retrieve_data_or_cover,
-                args=(url_queue, book_queue)
-                )
-        url_workers.append(t)
-        t.start()
-
-    # importer thread counts process urls/books and stops
-    to_process = len(url_lists)
-    # only one thread writes to db
-    importer = Thread(
-            name="Importer", target=single_thread_import,
-            # program may exit if there are only daemon threads left
-            args=(data_path, url_lists, to_process, url_queue, book_queue)
-            )
-    importer.start()
-
-    print("** Waiting for threads to finish! **")
-
-    for t in url_workers:
-        print(f"** Waiting on thread {t.name} **")
-        t.join()
-
+    print("** Starting import! **")
+    asyncio.run(AsyncImporter(data_path, url_lists).run())
     print("** Done! **")
@@ -0,0 +1,186 @@
+import os
+import sqlite3
+import logging
+import threading
+
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Tuple, List, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+# max (width, height) of the derivatives; aspect ratio is kept
+THUMB_SIZES: Dict[str, Tuple[int, int]] = {
+    # covers in the book grids of the listing pages
+    "grid": (240, 360),
+    # cover on the book's page
+    "detail": (400, 600),
+}
+# pillow format name -> file extension, mime type
+THUMB_FORMATS: Dict[str, Tuple[str, str]] = {
+    "WEBP": ("webp", "image/webp"),
+    "JPEG": ("jpg", "image/jpeg"),
+}
+THUMB_QUALITY = 80
+# derivatives are stored in a sub-folder of the thumbs folder
+DERIVATIVES_DIRNAME = "derived"
+MAX_THUMB_WORKERS = 2
+
+
+def cover_filename(book_id: int, cover_timestamp: float) -> str:
+    # NOTE: the webGUI requires the cover timestamp to be appended
+    return f"{book_id}_{cover_timestamp:.0f}"
+
+
+def derivative_path(thumbs_dir: str, cover_fn: str, size: str, fmt: str) -> str:
+    ext = THUMB_FORMATS[fmt][0]
+    return os.path.join(thumbs_dir, DERIVATIVES_DIRNAME, f"{cover_fn}.{size}.{ext}")
+
+
+def all_derivative_paths(thumbs_dir: str, cover_fn: str) -> List[str]:
+    return [derivative_path(thumbs_dir, cover_fn, size, fmt)
+            for size in THUMB_SIZES for fmt in THUMB_FORMATS]
+
+
+def has_derivatives(thumbs_dir: str, cover_fn: str) -> bool:
+    return all(os.path.isfile(p) for p in all_derivative_paths(thumbs_dir, cover_fn))
+
+
+def generate_derivatives(thumbs_dir: str, cover_fn: str, overwrite: bool = False) -> int:
+    """
+    Writes all sizes of THUMB_SIZES in all formats of THUMB_FORMATS for the cover
+    at thumbs_dir/cover_fn
+
+    Files are written to a temporary name first and then moved into place so they
+    can be served while (re-)generating them
+
+    :return: Nr of derivatives that were written
+    """
+    # only needed here so the rest of the package can be used without pillow
+    from PIL import Image
+
+    os.makedirs(os.path.join(thumbs_dir, DERIVATIVES_DIRNAME), exist_ok=True)
+    written = 0
+    with Image.open(os.path.join(thumbs_dir, cover_fn)) as img:
+        # gifs etc. -> neither WebP nor JPEG support palette images with transparency
+        img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info
+                          else "RGB")
+        for size, max_dims in THUMB_SIZES.items():
+            resized = img.copy()
+            # in-place and never enlarges the image
+            resized.thumbnail(max_dims, Image.LANCZOS)
+            for fmt in THUMB_FORMATS:
+                path = derivative_path(thumbs_dir, cover_fn, size, fmt)
+                if not overwrite and os.path.isfile(path):
+                    continue
+                out = resized
+                if fmt == "JPEG" and out.mode != "RGB":
+                    out = out.convert("RGB")
+                tmp_path = f"{path}.tmp"
+                out.save(tmp_path, format=fmt, quality=THUMB_QUALITY)
+                os.replace(tmp_path, path)
+                written += 1
+    return written
+
+
+def remove_derivatives(thumbs_dir: str, cover_fn: str) -> None:
+    for path in all_derivative_paths(thumbs_dir, cover_fn):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class ThumbnailWorker:
+    """
+    Generates the derivatives of covers in a background thread pool so downloading
+    or uploading a cover doesn't have to wait for it
+    A cover that's already waiting to be processed won't be queued again
+    """
+
+    def __init__(self, max_workers: int = MAX_THUMB_WORKERS):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="thumbs")
+        self._pending: Dict[Tuple[str, str], 'Future[int]'] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, thumbs_dir: str, cover_fn: str, overwrite: bool = False) -> 'Future[int]':
+        key = (thumbs_dir, cover_fn)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            future = self.executor.submit(self._generate, thumbs_dir, cover_fn, overwrite)
+            self._pending[key] = future
+        return future
+
+    def _generate(self, thumbs_dir: str, cover_fn: str, overwrite: bool) -> int:
+        try:
+            return generate_derivatives(thumbs_dir, cover_fn, overwrite=overwrite)
+        except Exception:
+            # cover might have been replaced/deleted in the meantime or isn't an image
+            logger.exception("Generating the thumbnails of '%s' failed!", cover_fn)
+            return 0
+        finally:
+            with self._lock:
+                self._pending.pop((thumbs_dir, cover_fn), None)
+
+    def wait(self) -> None:
+        """Blocks till all currently queued covers have been processed"""
+        with self._lock:
+            futures = list(self._pending.values())
+        for future in futures:
+            future.result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait)
+
+
+_worker: Optional[ThumbnailWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_thumbnail_worker() -> ThumbnailWorker:
+    """Returns the process-wide ThumbnailWorker (created on first use)"""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = ThumbnailWorker()
+        return _worker
+
+
+def schedule_derivatives(thumbs_dir: str, cover_fn: str,
+                         overwrite: bool = False) -> 'Future[int]':
+    return get_thumbnail_worker().submit(thumbs_dir, cover_fn, overwrite=overwrite)
+
+
+def backfill_derivatives(thumbs_dir: str, db_con: sqlite3.Connection,
+                         overwrite: bool = False, max_workers: int = MAX_THUMB_WORKERS,
+                         progress: Optional[Callable[[int, int], None]] = None) -> int:
+    """
+    Generates the missing derivatives (all of them if overwrite is True) for the
+    current covers of all books
+
+    :param progress: Called with (nr of covers processed, total nr of covers)
+    :return: Nr of derivatives that were written
+    """
+    cover_fns = []
+    for book_id, cover_timestamp in db_con.execute(
+            "SELECT id, cover_timestamp FROM Books ORDER BY id"):
+        cover_fn = cover_filename(book_id, cover_timestamp)
+        if not os.path.isfile(os.path.join(thumbs_dir, cover_fn)):
+            continue
+        if overwrite or not has_derivatives(thumbs_dir, cover_fn):
+            cover_fns.append(cover_fn)
+
+    worker = ThumbnailWorker(max_workers=max_workers)
+    written = 0
+    try:
+        futures = [worker.submit(thumbs_dir, cover_fn, overwrite=overwrite)
+                   for cover_fn in cover_fns]
+        for done, future in enumerate(futures, 1):
+            written += future.result()
+            if progress is not None:
+                progress(done, len(futures))
+    finally:
+        worker.shutdown()
+    return written
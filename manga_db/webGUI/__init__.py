@@ -8,10 +8,13 @@ from typing import Pattern
 from flask import Flask
 
 from ..manga_db import update_cookies_from_file
+from .. import http_cache
+from .. import jobs
 
 from .webGUI import main_bp
 from .csrf import init_app as csrf_init_app
 from .auth import auth_bp, init_app as auth_init_app
+from .mdb import init_app as mdb_init_app, READ_POOL_SIZE
 
 
 EXTRACT_DOMAIN_RE: Pattern = re.compile(
@@ -89,7 +92,19 @@ def create_app(instance_path=None, test_config=None, **kwargs):
         # path to thumbs folder
         THUMBS_FOLDER=os.path.join(app.instance_path, "thumbs"),
         # limit upload size to 0,5MB
-        MAX_CONTENT_LENGTH=0.5 * 1024 * 1024
+        MAX_CONTENT_LENGTH=0.5 * 1024 * 1024,
+        # max nr of read-only db connections used by GET routes
+        READ_POOL_SIZE=READ_POOL_SIZE,
+        # evaluate included/excluded tags etc. of searches using an in-memory index
+        TAG_INDEX=False,
+        # nr of recently used books every read-only db instance keeps in memory, 0 disables it
+        ID_MAP_LRU_SIZE=256,
+        # max size in bytes of the on-disk cache of the sites' responses, 0 disables it
+        HTTP_CACHE_SIZE=http_cache.DEFAULT_MAX_SIZE,
+        # nr of threads that import books, download covers etc. in the background
+        JOB_WORKERS=jobs.DEFAULT_WORKERS,
+        # run jobs right away in the request that submits them (for testing)
+        JOBS_INLINE=False,
     )
 
     # ensure the instance folder exists
@@ -142,8 +157,11 @@ def create_app(instance_path=None, test_config=None, **kwargs):
     app.register_blueprint(main_bp)
     app.register_blueprint(auth_bp)
     auth_init_app(app)
+    mdb_init_app(app)
 
     # reload cookies.txt on startup
     update_cookies_from_file(os.path.join(app.instance_path, 'cookies.txt'))
+    http_cache.configure(os.path.join(app.instance_path, "http_cache"),
+                         app.config["HTTP_CACHE_SIZE"])
 
     return app
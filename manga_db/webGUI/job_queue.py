@@ -0,0 +1,103 @@
+import threading
+import functools
+
+from typing import Dict, Any
+
+from flask import current_app
+
+from .mdb import get_mdb
+from ..constants import STATUS_IDS
+from ..manga import Book
+from ..jobs import (
+    Job, JobQueue, JobError, DEFAULT_HANDLERS, JOB_UPDATE_EXT_INFO, open_job_queue,
+    retrieve_book_data_job, extr_data_from_json
+)
+
+_queue_creation_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """
+    Returns the app's queue for slow work like importing books, that gets created and
+    started on first use (so its workers aren't started for every app that gets created)
+    """
+    try:
+        return current_app.extensions["job_queue"]
+    except KeyError:
+        with _queue_creation_lock:
+            if "job_queue" not in current_app.extensions:
+                handlers = {**DEFAULT_HANDLERS, JOB_UPDATE_EXT_INFO: functools.partial(
+                    update_ext_info_job, current_app._get_current_object())}
+                current_app.extensions["job_queue"] = open_job_queue(
+                    current_app.instance_path, handlers,
+                    workers=current_app.config["JOB_WORKERS"],
+                    inline=current_app.config["JOBS_INLINE"])
+        return current_app.extensions["job_queue"]
+
+
+def close_job_queue(app) -> None:
+    queue = app.extensions.pop("job_queue", None)
+    if queue is not None:
+        queue.stop()
+
+
+def update_ext_info_job(app, job: Job) -> Dict[str, Any]:
+    """
+    Retrieves the data at the external info's url and applies it using the app's writer,
+    so the update only happens once no matter how often its result page gets loaded
+    :return: {"site": name of the external info's site,
+              "ext_info_changes": change str of ExternalInfo.save,
+              "book_upd_changes": differences from the book at the url (to choose which
+                                  ones to apply) or None}
+    """
+    extr_data = extr_data_from_json(retrieve_book_data_job(job)["extr_data"])
+    book_id, ext_info_id = job.payload["book_id"], job.payload["ext_info_id"]
+    # own app context so the writer gets released by its teardown
+    with app.app_context():
+        mdb = get_mdb()
+        old_book = mdb.get_book(book_id)
+        ext_info = None if old_book is None else next(
+            (ei for ei in old_book.ext_infos if ei.id == ext_info_id), None)
+        if ext_info is None:
+            raise JobError(f"No external link with id {ext_info_id} was found on book {book_id}!")
+        status, new_book = ext_info.update_from_url(extr_data=extr_data)
+        if status == "title_missmatch":
+            raise JobError(f"Title of book at URL didn't match title '{old_book.title}'",
+                           result={"status": status})
+        elif status != "updated":
+            raise JobError("Updating the external link failed!")
+
+        _, ext_info_chstr = ext_info.save()
+        return {"site": ext_info.site, "ext_info_changes": ext_info_chstr,
+                "book_upd_changes": _book_upd_changes(mdb, old_book, new_book)}
+
+
+def _book_upd_changes(mdb, old_book: Book, new_book: Book):
+    changes, _ = old_book.diff(new_book)
+    # filter changes and convert to jinja friendlier format
+    changes = {key: changes[key] for key in changes if key not in {"id", "last_change",
+                                                                   "note", "title",
+                                                                   "favorite", "list"}}
+    if not changes:
+        return None
+    # added/removed are sets which can't be stored as json
+    converted = {"normal": {col: changes[col] for col in changes
+                            if col in Book.COLUMNS},
+                 "added_removed": {col: [sorted(v) if v else None for v in changes[col]]
+                                   for col in changes if col in Book.ASSOCIATED_COLUMNS}
+                 }
+    # convert to status/lang name instead of id
+    try:
+        status_id = converted["normal"]["status_id"]
+        converted["normal"]["status"] = STATUS_IDS[status_id]
+        del converted["normal"]["status_id"]
+    except KeyError:
+        pass
+    try:
+        # TODO leave normal lang col without id since this adds a lang if its not present
+        language_id = converted["normal"]["language_id"]
+        converted["normal"]["language"] = mdb.language_map[language_id]
+        del converted["normal"]["language"]
+    except KeyError:
+        pass
+    return converted
@@ -1,27 +1,173 @@
+import queue
 import threading
 
-from flask import current_app
+from typing import List, Optional
 
-from ..manga_db import MangaDB
+from flask import current_app, g
 
+from ..manga_db import MangaDB, TAG_TABLES
+from ..db.tag_index import SharedTagIndex
 
-# Thread-local data is data whose values are thread specific. To manage thread-local data, just #
-# create an instance of local (or a subclass) and store attributes on it
-# t_local = threading.local()
-# we get AttributeError: '_thread._local' object has no attribute 'mdb' if we didnt assign attr yet
-# and it needs to be assigned for every thread separately -> better to subclass threading.local
-class app_thread_data(threading.local):
-    def __init__(self):
-        super().__init__()
-        self.mdb_init = False
+# max nr of read-only connections that are open at the same time
+READ_POOL_SIZE = 4
+# secs a request waits for a read-only connection to become available
+READ_POOL_TIMEOUT = 30
 
+_pool_creation_lock = threading.Lock()
 
-t_local = app_thread_data()
 
+class MangaDBPool:
+    """
+    Bounded pool of read-only MangaDB instances for requests that only read and a
+    single writer instance that can only be used by one request at a time
+    With the db in WAL mode the readers keep working while the writer (or another
+    process e.g. an import) holds a write transaction
 
-def get_mdb():
-    if not t_local.mdb_init:
-        # cant store in app.config since thread specific and app config isnt
-        t_local.mdb = MangaDB(current_app.instance_path, current_app.config["DATABASE_PATH"])
-        t_local.mdb_init = True
-    return t_local.mdb
+    The instances are shared between threads (but only ever used by one thread at
+    a time) so the connections are opened with check_same_thread=False
+    """
+
+    def __init__(self, root_dir: str, db_path: str, max_readers: int = READ_POOL_SIZE,
+                 tag_index: bool = False, id_map_lru_size: int = 0):
+        self.root_dir = root_dir
+        self.db_path = db_path
+        self.max_readers = max_readers
+        # in-memory index of the book ids per tag etc. for searching that's shared by
+        # all instances, the writer's changes are applied incrementally, it only gets
+        # rebuilt when another process changed the DB
+        self.tag_index = SharedTagIndex(TAG_TABLES, db_path) if tag_index else None
+        # nr of recently used books every reader keeps in memory
+        # not used for the writer since routes might modify its instances without
+        # saving them, which would then show up in later requests
+        self.id_map_lru_size = id_map_lru_size
+        # writer gets created first so the db gets created/migrated before we
+        # open it in read-only mode
+        self.writer = self._open(read_only=False)
+        self.writer_lock = threading.Lock()
+        if self.tag_index is not None:
+            self.tag_index.attach_writer(self.writer.db_con)
+        self.readers: List[MangaDB] = []
+        # LIFO so we re-use the connections that have the warmest caches
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._readers_available = threading.BoundedSemaphore(max_readers)
+        self._lock = threading.Lock()
+
+    def _open(self, read_only: bool) -> MangaDB:
+        return MangaDB(self.root_dir, self.db_path, read_only=read_only,
+                       connect_kwargs={"check_same_thread": False},
+                       tag_index=self.tag_index or False,
+                       id_map_lru_size=self.id_map_lru_size if read_only else 0)
+
+    def acquire_reader(self, timeout: Optional[float] = READ_POOL_TIMEOUT) -> MangaDB:
+        if not self._readers_available.acquire(timeout=timeout):
+            raise TimeoutError("Timed out waiting for a read-only database connection!")
+        try:
+            mdb = self._idle.get_nowait()
+        except queue.Empty:
+            try:
+                mdb = self._open(read_only=True)
+            except Exception:
+                self._readers_available.release()
+                raise
+            with self._lock:
+                self.readers.append(mdb)
+        # cached books might be stale if another connection committed changes to the db
+        mdb.sync_external_changes()
+        self._sync_tag_index()
+        return mdb
+
+    def _sync_tag_index(self) -> None:
+        if self.tag_index is None or not self.tag_index.changed():
+            return
+        # only the writer's connection can tell whether the changes came from another
+        # process, if it's in use the request holding it will check on release
+        if self.writer_lock.acquire(blocking=False):
+            try:
+                self.tag_index.sync_writer()
+            finally:
+                self.writer_lock.release()
+
+    def release_reader(self, mdb: MangaDB) -> None:
+        self._idle.put(mdb)
+        self._readers_available.release()
+
+    def acquire_writer(self) -> MangaDB:
+        self.writer_lock.acquire()
+        return self.writer
+
+    def release_writer(self) -> None:
+        try:
+            if self.tag_index is not None:
+                self.tag_index.sync_writer()
+        finally:
+            self.writer_lock.release()
+
+    def close(self) -> None:
+        with self._lock:
+            for mdb in self.readers:
+                mdb.close()
+            self.readers = []
+        self.writer.close()
+        if self.tag_index is not None:
+            self.tag_index.close()
+
+
+def get_pool() -> MangaDBPool:
+    try:
+        return current_app.extensions["mdb_pool"]
+    except KeyError:
+        with _pool_creation_lock:
+            if "mdb_pool" not in current_app.extensions:
+                current_app.extensions["mdb_pool"] = MangaDBPool(
+                    current_app.instance_path, current_app.config["DATABASE_PATH"],
+                    current_app.config["READ_POOL_SIZE"],
+                    tag_index=current_app.config.get("TAG_INDEX", False),
+                    id_map_lru_size=current_app.config["ID_MAP_LRU_SIZE"])
+        return current_app.extensions["mdb_pool"]
+
+
+def get_mdb(read_only: bool = False) -> MangaDB:
+    """
+    Returns the MangaDB instance for the current request
+    :param read_only: Use an instance from the read-only pool, the writer is returned
+                      if it was already acquired by the current request so we see our
+                      own changes
+    """
+    if "mdb" in g:
+        return g.mdb
+    pool = get_pool()
+    if read_only:
+        if "mdb_ro" not in g:
+            g.mdb_ro = pool.acquire_reader()
+        return g.mdb_ro
+    g.mdb = pool.acquire_writer()
+    return g.mdb
+
+
+def release_mdb(exc: Optional[BaseException] = None) -> None:
+    mdb_ro = g.pop("mdb_ro", None)
+    mdb = g.pop("mdb", None)
+    pool = current_app.extensions.get("mdb_pool")
+    if pool is None:
+        return
+    if mdb_ro is not None:
+        pool.release_reader(mdb_ro)
+    if mdb is not None:
+        # don't leave a transaction open (holding the write lock) when the request failed
+        if exc is not None:
+            if mdb.db_con.in_transaction:
+                mdb.db_con.rollback()
+            mdb.discard_tag_changes()
+            # instances might have been modified without being saved
+            mdb.id_map.clear()
+        pool.release_writer()
+
+
+def close_mdb_pool(app) -> None:
+    pool = app.extensions.pop("mdb_pool", None)
+    if pool is not None:
+        pool.close()
+
+
+def init_app(app) -> None:
+    app.teardown_appcontext(release_mdb)
@@ -8,6 +8,7 @@ import json
 import re
 import time
 import datetime
+import dataclasses
 
 import werkzeug
 
@@ -20,21 +21,38 @@ from flask import (
 )
 from markupsafe import Markup
 
-from .mdb import get_mdb
+from .mdb import get_mdb, get_pool
+from .job_queue import get_job_queue
 from .json_custom import to_serializable
 from ..constants import STATUS_IDS
 from ..manga_db import MangaDB, update_cookies_from_file
 from ..manga import Book
+from ..book_view import BOOK_VIEW_ASSOCIATIONS
 from ..extractor.base import MangaExtractorData
 from ..import extractor
 from ..db.search import validate_order_by_str
+from ..db.query_stats import query_plan_report, merge_statement_stats
 from ..ext_info import ExternalInfo
+from ..jobs import (
+    Job, DONE, FAILED, JOB_IMPORT, JOB_DOWNLOAD_COVER, JOB_UPDATE_EXT_INFO, site_id_for_url,
+    extr_data_from_json
+)
+from ..thumbnails import (
+    THUMB_SIZES, THUMB_FORMATS, DERIVATIVES_DIRNAME, derivative_path, schedule_derivatives,
+    remove_derivatives
+)
 from .. import extractor
 
 BOOKS_PER_PAGE = 60
+# tag tables whose counts are shown for refining a search and the max nr of
+# names shown per table
+SEARCH_FACET_TABLES = ("Tag", "Artist", "Parody", "Character", "Groups", "Category")
+FACET_VALUES_SHOWN = 15
 
 # thumb extensions
 ALLOWED_THUMB_EXTENSIONS = set(('png', 'jpg', 'jpeg', 'gif'))
+# covers are versioned by their cover_timestamp -> a url never changes its content
+THUMB_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
 # no url prefix
 main_bp = Blueprint("main", __name__)
@@ -46,8 +64,46 @@ URL_RE = re.compile(r"(?:https?://)?(?:\w+\.)?(\w+\.\w+)/")
 @main_bp.route('/thumbs/<path:filename>')
 def thumb_static(filename):
     cover_timestamp = request.args.get("cover_timestamp", 0, type=float)
+    # optional: name of a size in THUMB_SIZES
+    size = request.args.get("size", None)
+    thumbs_dir = current_app.config['THUMBS_FOLDER']
     fn = f"{filename}_{cover_timestamp:.0f}"
-    return send_from_directory(current_app.config['THUMBS_FOLDER'], fn)
+    is_temp = filename.startswith("temp_cover")
+
+    served_fn, mimetype, etag_variant = fn, None, "orig"
+    if size in THUMB_SIZES and not is_temp:
+        # browsers that don't support webp still send */* for images
+        # -> has to be listed explicitly
+        accepts_webp = any(mt == "image/webp" and q > 0 for mt, q in request.accept_mimetypes)
+        fmt = "WEBP" if accepts_webp else "JPEG"
+        path = derivative_path(thumbs_dir, fn, size, fmt)
+        if os.path.isfile(path):
+            served_fn = f"{DERIVATIVES_DIRNAME}/{os.path.basename(path)}"
+            mimetype = THUMB_FORMATS[fmt][1]
+            etag_variant = f"{size}-{fmt.lower()}"
+        elif os.path.isfile(os.path.join(thumbs_dir, fn)):
+            # fall back to the original till the derivatives have been generated
+            schedule_derivatives(thumbs_dir, fn)
+
+    resp = send_from_directory(thumbs_dir, served_fn, mimetype=mimetype)
+    if size is not None:
+        resp.vary.add("Accept")
+    if is_temp:
+        return resp
+    # strong etag: the file for a book's cover_timestamp and variant never changes
+    try:
+        mtime = os.path.getmtime(os.path.join(thumbs_dir, served_fn))
+    except OSError:
+        mtime = 0
+    resp.set_etag(f"{fn}-{etag_variant}-{mtime:.0f}")
+    if "cover_timestamp" in request.args:
+        if size is None or etag_variant != "orig":
+            resp.headers["Cache-Control"] = THUMB_CACHE_CONTROL
+        else:
+            # original served in place of a derivative that isn't generated yet
+            # -> revalidate so the browser picks up the derivative once it's there
+            resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
 
 
 @main_bp.route('/refresh_cookie')
@@ -108,18 +164,33 @@ def get_books(query=None):
     elif before is not None and len(before) == 1 and order_by_col != "id":
         before = (None, before[0])
 
+    mdb = get_mdb(read_only=True)
+    # listing only needs BookSummary's one row per book
     if query:
         # get 1 entry more than BOOKS_PER_PAGE so we know if we need btn in that direction
-        books = get_mdb().search(query, order_by=order_by, limit=BOOKS_PER_PAGE+1,
-                                 after=after, before=before)
+        books = mdb.search_summaries(query, order_by=order_by, limit=BOOKS_PER_PAGE+1,
+                                     after=after, before=before) or None
     else:
-        books = get_mdb().get_x_books(BOOKS_PER_PAGE+1, after=after, before=before,
-                                      order_by=order_by)
+        books = mdb.get_x_book_summaries(BOOKS_PER_PAGE+1, after=after,
+                                         before=before, order_by=order_by)
     first, last, more = first_last_more(books, order_by_col, after, before)
 
     return books, order_by_col, asc_desc, first, last, more
 
 
+@main_bp.route('/debug/query_plans', methods=["GET"])
+def show_query_plans():
+    # stats are recorded per connection since it was opened -> merge the stats of
+    # all the pool's connections
+    nr_statements = request.args.get("n", 10, type=int)
+    pool = get_pool()
+    stats = merge_statement_stats(
+        [mdb.db_con.statement_stats for mdb in [pool.writer] + pool.readers])
+    report = query_plan_report(get_mdb(read_only=True).db_con, nr_statements,
+                               statement_stats=stats)
+    return current_app.response_class(report, mimetype="text/plain")
+
+
 @main_bp.route('/', methods=["GET"])
 def show_entries():
     books, order_by_col, asc_desc, first, last, more = get_books()
@@ -136,7 +207,8 @@ def show_entries():
 @main_bp.route('/book/<int:book_id>')
 def show_info(book_id, book=None, book_upd_changes=None, show_outdated=None,
               add_ei_or_new_book_prompt=None):
-    mdb = get_mdb()
+    # returns the writer if we were called from a view that modified the book
+    mdb = get_mdb(read_only=True)
     # enable passing book obj over optional param while keeping url route option
     # with required param
     if book is None:
@@ -171,8 +243,7 @@ def show_info(book_id, book=None, book_upd_changes=None, show_outdated=None,
         # rather than spend a lot of time/code to replace title_eng and _foreign with title in
         # rows make title func available to jinja by passing it in as param
         build_title=Book.build_title,
-        lists=[row["name"]
-               for row in book.get_all_options_for_assoc_column("list")],
+        lists=[name for _, name in book.get_all_options_for_assoc_column("list")],
         book_upd_changes=book_upd_changes,
         outdated=outdated,
         add_ei_or_new_book_prompt=add_ei_or_new_book_prompt)
@@ -192,40 +263,27 @@ def import_book(url: Optional[str] = None, force_new: bool = False):
     if url is None:
         url = request.form['ext_url']
 
+    if "extr_data_json" not in request.form:
+        # retrieving the book data can take a while (slow or rate-limited sites) so it's
+        # done by a job whose status page redirects to import_book_result once it's done
+        job = get_job_queue().submit(JOB_IMPORT, {"url": url}, site_id=site_id_for_url(url))
+        return redirect(url_for("main.show_job", job_id=job.id))
+
     mdb = get_mdb()
-    extr_data: Optional[Dict[str, Any]]
-    thumb_url: Optional[str]
-    extr_data, thumb_url = None, None
-    book: Book
-
-    # whether the import should be added as external link to an existing book instead
-    add_ext_info = False
-    if "extr_data_json" in request.form:
-        # coming from add as external or new book prompt!!
-        extr_data = json.loads(request.form['extr_data_json'])
-        thumb_url = request.form['thumb_url']
-        # during json conversion datetime was converted to a str (in isoformat)
-        extr_data["upload_date"] = datetime.date.fromisoformat(
-            extr_data['upload_date'])
-        if request.form['action'] == "add_new":
-            force_new = True
-        else:
-            add_ext_info = True
-        # @CleanUp indirection needed here?
-        book = mdb.book_from_data(MangaExtractorData(**extr_data))
+    # coming from add as external or new book prompt!!
+    extr_data = json.loads(request.form['extr_data_json'])
+    thumb_url = request.form['thumb_url']
+    # during json conversion datetime was converted to a str (in isoformat)
+    extr_data["upload_date"] = datetime.date.fromisoformat(
+        extr_data['upload_date'])
+    if request.form['action'] == "add_new":
+        force_new = True
+        add_ext_info = False
     else:
-        extr_data, thumb_url, err_code = mdb.retrieve_book_data(url)
-        if extr_data is None:
-            if err_code == 503:
-                flash_cookie_update_msg()
-            else:
-                flash("Failed getting book!", "title warning")
-                flash("Either there was something wrong with the url or the extraction failed!",
-                      "info")
-                flash(f"URL was: {url}")
-                flash("Check the logs for more details!", "info")
-            return redirect(url_for("main.show_entries"))
-        book = mdb.book_from_data(extr_data)
+        # the import should be added as external link to an existing book
+        add_ext_info = True
+    # @CleanUp indirection needed here?
+    book = mdb.book_from_data(MangaExtractorData(**extr_data))
 
     bid = mdb.get_book_id(
         book.title_eng, book.title_foreign) if not force_new else None
@@ -241,6 +299,35 @@ def import_book(url: Optional[str] = None, force_new: bool = False):
         flash(f"Added external link at '{ext_info.url}' to book!")
         return show_info(bid, show_outdated=eid if outdated else None)
 
+    return _show_import(url, book, extr_data, thumb_url, bid)
+
+
+@main_bp.route('/import/<int:job_id>')
+def import_book_result(job_id):
+    job = get_job_queue().get(job_id)
+    if job is None or job.kind != JOB_IMPORT or not job.finished:
+        return redirect(url_for("main.show_job", job_id=job_id))
+    url = job.payload["url"]
+    if job.status == FAILED:
+        if job.result and job.result.get("http_code") == 503:
+            flash_cookie_update_msg()
+        else:
+            flash("Failed getting book!", "title warning")
+            flash("Either there was something wrong with the url or the extraction failed!",
+                  "info")
+            flash(f"URL was: {url}")
+            flash("Check the logs for more details!", "info")
+        return redirect(url_for("main.show_entries"))
+
+    mdb = get_mdb()
+    extr_data = extr_data_from_json(job.result["extr_data"])
+    book = mdb.book_from_data(extr_data)
+    bid = mdb.get_book_id(book.title_eng, book.title_foreign)
+    return _show_import(url, book, dataclasses.asdict(extr_data), job.result["thumb_url"], bid)
+
+
+def _show_import(url: str, book: Book, extr_data: Dict[str, Any], thumb_url: Optional[str],
+                 bid: Optional[int]):
     # convert data to json so we can rebuilt ext_info when we add it to DB
     # as we have to take all data from edit_info page or store a json serialized ExternalInfo
     # in session; jsonify return flask.Response i just need a str
@@ -253,17 +340,58 @@ def import_book(url: Optional[str] = None, force_new: bool = False):
         # dl cover as temp and display add book page
         # only allow one temp cover
         # change this to temp_cover_{username} if we add multiple user support
-        cover_dled = mdb.download_cover(
-            thumb_url, current_app.config["THUMBS_FOLDER"], bid,
-            overwrite=True, forced_filename="temp_cover_0")
-        if not cover_dled:
-            current_app.logger.error(
-                "Could not download cover for book at %s with thumb url %s",
-                url, thumb_url)
-            flash("Thumb couldnt be downloaded!")
+        # remove the temp cover of an abandoned import so it's never mistaken for this one's
+        try:
+            os.remove(os.path.join(current_app.config["THUMBS_FOLDER"], "temp_cover_0"))
+        except FileNotFoundError:
+            pass
+        cover_job = get_job_queue().submit(
+            JOB_DOWNLOAD_COVER,
+            {"url": thumb_url, "dir_path": current_app.config["THUMBS_FOLDER"],
+             "book_id": None, "overwrite": True, "forced_filename": "temp_cover_0"},
+            site_id=site_id_for_url(url))
+        # the page polls the job and shows the cover once it's downloaded
+        return show_add_book(book=book, cover_uploaded=time.time(), extr_data=extr_data_json,
+                             cover_job_id=cover_job.id)
+
+
+def _job_result_url(job: Job) -> Optional[str]:
+    """:return: Url of the page that shows the result of the finished job"""
+    if job.kind == JOB_IMPORT:
+        return url_for("main.import_book_result", job_id=job.id)
+    elif job.kind == JOB_UPDATE_EXT_INFO:
+        return url_for("main.update_book_ext_info_result", book_id=job.payload["book_id"],
+                       ext_info_id=job.payload["ext_info_id"], job_id=job.id)
+    else:
+        # e.g. cover downloads are only polled by the page that submitted them
+        return None
+
 
-        return show_add_book(book=book, cover_uploaded=time.time() if cover_dled else 0,
-                             extr_data=extr_data_json)
+@main_bp.route('/jobs/<int:job_id>')
+def show_job(job_id):
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return render_template(
+            'show_info.html',
+            error_msg=f"No job with id {job_id} was found!")
+    result_url = _job_result_url(job) if job.finished else None
+    if result_url is not None:
+        return redirect(result_url)
+    title = {JOB_IMPORT: "Importing book", JOB_UPDATE_EXT_INFO: "Updating external link",
+             JOB_DOWNLOAD_COVER: "Downloading cover"}.get(job.kind, job.kind)
+    return render_template('job_status.html', job=job, title=title)
+
+
+@main_bp.route('/jobs/<int:job_id>/status')
+def job_status(job_id):
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return jsonify({"error": f"No job with id {job_id} was found!"}), 404
+    return jsonify({
+        "id": job.id, "kind": job.kind, "status": job.status, "attempts": job.attempts,
+        "finished": job.finished, "error": job.error,
+        "result_url": _job_result_url(job) if job.finished else None,
+    })
 
 
 @main_bp.route('/jump', methods=["GET"])
@@ -275,7 +403,7 @@ def jump_to_book_by_url():
     imported_from = extr_cls.site_id
     # ids can get re-used by external sites so theyre not guaranteed to be unique
     # or even link to the correct extinfo/book
-    books = list(get_mdb().get_books(
+    books = list(get_mdb(read_only=True).get_books(
         {"id_onpage": id_onpage, "imported_from": imported_from}))
 
     if not books:
@@ -311,56 +439,46 @@ def jump_to_book_by_url():
 
 @main_bp.route('/book/<int:book_id>/ext_info/<int:ext_info_id>/update', methods=("POST",))
 def update_book_ext_info(book_id, ext_info_id):
-    mdb = get_mdb()
-    old_book = mdb.get_book(book_id)
-    # could also pass in url using post or get
-    ext_info = [ei for ei in old_book.ext_infos if ei.id == ext_info_id][0]
-    status, new_book = ext_info.update_from_url()
-    if status == "no_data":
-        flash("Updating failed!", "title warning")
-        flash("Either there was something wrong with the url or the extraction failed!", "info")
-        flash(f"URL was: {ext_info.url}")
-        flash("Check the logs for more details!", "info")
-        return redirect(url_for("main.show_info", book_id=book_id))
-    elif status == "title_missmatch":
-        flash("Update failed!", "title warning")
-        flash(
-            f"Title of book at URL didn't match title '{old_book.title}'", "info")
+    mdb = get_mdb(read_only=True)
+    ext_info = mdb.get_ext_info(ext_info_id)
+    if ext_info is None or ext_info.book_id != book_id:
+        return render_template(
+            'show_info.html',
+            error_msg=f"No external link with id {ext_info_id} was found on book {book_id}!")
+    job = get_job_queue().submit(
+        JOB_UPDATE_EXT_INFO, {"url": ext_info.url, "book_id": book_id, "ext_info_id": ext_info_id},
+        site_id=ext_info.imported_from)
+    return redirect(url_for("main.show_job", job_id=job.id))
+
+
+# the update was already applied by the job (see job_queue.update_ext_info_job) so this
+# only shows its result
+@main_bp.route('/book/<int:book_id>/ext_info/<int:ext_info_id>/update/<int:job_id>')
+def update_book_ext_info_result(book_id, ext_info_id, job_id):
+    job = get_job_queue().get(job_id)
+    if (job is None or job.kind != JOB_UPDATE_EXT_INFO or not job.finished or
+            job.payload["book_id"] != book_id or job.payload["ext_info_id"] != ext_info_id):
+        return redirect(url_for("main.show_job", job_id=job_id))
+    if job.status == FAILED:
+        if job.result and job.result.get("status") == "title_missmatch":
+            flash("Update failed!", "title warning")
+            flash(job.error, "info")
+        else:
+            flash("Updating failed!", "title warning")
+            flash("Either there was something wrong with the url or the extraction failed!",
+                  "info")
+            flash(f"URL was: {job.payload['url']}")
+            flash("Check the logs for more details!", "info")
         return redirect(url_for("main.show_info", book_id=book_id))
 
-    changes, _ = old_book.diff(new_book)
-    # filter changes and convert to jinja friendlier format
-    changes = {key: changes[key] for key in changes if key not in {"id", "last_change",
-                                                                   "note", "title",
-                                                                   "favorite", "list"}}
-    converted = {"normal": {col: changes[col] for col in changes
-                            if col in Book.COLUMNS},
-                 "added_removed": {col: changes[col] for col in changes
-                                   if col in Book.ASSOCIATED_COLUMNS}
-                 }
-    # convert to status/lang name instead of id
-    try:
-        status_id = converted["normal"]["status_id"]
-        converted["normal"]["status"] = STATUS_IDS[status_id]
-        del converted["normal"]["status_id"]
-    except KeyError:
-        pass
-    try:
-        # TODO leave normal lang col without id since this adds a lang if its not present
-        language_id = converted["normal"]["language_id"]
-        converted["normal"]["language"] = mdb.language_map[language_id]
-        del converted["normal"]["language"]
-    except KeyError:
-        pass
-
     flash("External link was updated!", "title")
 
-    _, ext_info_chstr = ext_info.save()
+    ext_info_chstr = job.result["ext_info_changes"]
     if ext_info_chstr:
         # :re_dl_warning
         if ext_info_chstr.startswith("Please re-download"):
             flash("WARNING", "warning")
-        flash(f"Changes on external link on {ext_info.site}:", "info")
+        flash(f"Changes on external link on {job.result['site']}:", "info")
         for change in ext_info_chstr.splitlines():
             if change.startswith("last_update"):
                 continue
@@ -368,7 +486,7 @@ def update_book_ext_info(book_id, ext_info_id):
 
     # putting the converted changes on g doesnt work since we redirect
     # and thats a new request and g only stays valid for the current one
-    return show_info(book_id, book_upd_changes=converted if changes else None)
+    return show_info(book_id, book_upd_changes=job.result["book_upd_changes"])
 
 
 @main_bp.route('/book/<int:book_id>/apply_update', methods=["POST"])
@@ -405,8 +523,14 @@ def apply_upd_changes(book_id):
 
 @main_bp.route('/book/<int:book_id>/get_info_txt')
 def get_info_txt(book_id):
-    book = get_mdb().get_book(book_id)
-    exp_str = book.to_export_string()
+    mdb = get_mdb(read_only=True)
+    # only reading -> no need for a full Book
+    book = mdb.get_book_view(book_id, associations=BOOK_VIEW_ASSOCIATIONS)
+    if book is None:
+        return render_template(
+            'show_info.html',
+            error_msg=f"No book with id {book_id} was found in DB!")
+    exp_str = book.to_export_string(mdb.language_map)
     import io
     # or use tempfile.SpooledTemporaryFile
     mem = io.BytesIO()
@@ -490,6 +614,8 @@ def search_books():
         return redirect(url_for("main.jump_to_book_by_url", ext_url=searchstr))
 
     books, order_by_col, asc_desc, first, last, more = get_books(searchstr)
+    # counts of the whole result set not just the current page
+    facets = get_mdb(read_only=True).get_search_facets(searchstr, tables=SEARCH_FACET_TABLES)
 
     return render_template(
         'show_entries.html',
@@ -498,6 +624,8 @@ def search_books():
         first=first,
         last=last,
         search_field=searchstr,
+        facets=facets,
+        facets_shown=FACET_VALUES_SHOWN,
         order_col=order_by_col,
         asc_desc=asc_desc)
 
@@ -563,9 +691,9 @@ def show_outdated_links():
     id_onpage = request.args.get("id_onpage", None, type=str)
     imported_from = request.args.get("imported_from", None, type=int)
     if id_onpage and imported_from:
-        books = get_mdb().get_outdated(id_onpage, imported_from)
+        books = get_mdb(read_only=True).get_outdated(id_onpage, imported_from)
     else:
-        books = get_mdb().get_outdated()
+        books = get_mdb(read_only=True).get_outdated()
 
     flash("Showing books with outdated links!", "title")
     flash("Newest first!", "info")
@@ -624,7 +752,7 @@ def add_ext_info(book_id):
 
 
 @main_bp.route("/book/add")
-def show_add_book(book=None, cover_uploaded=None, extr_data=None):
+def show_add_book(book=None, cover_uploaded=None, extr_data=None, cover_job_id=None):
     mdb = get_mdb()
     if book is None:
         # @Hack
@@ -645,7 +773,8 @@ def show_add_book(book=None, cover_uploaded=None, extr_data=None):
         book=book,
         available_options=available_options,
         cover_uploaded=cover_uploaded,
-        extr_data=extr_data)
+        extr_data=extr_data,
+        cover_job_id=cover_job_id)
 
 
 @main_bp.route("/book/add/submit", methods=["POST"])
@@ -667,10 +796,23 @@ def add_book():
     outdated_on_ei_id = outdated_on_ei_id[0] if outdated_on_ei_id else None
 
     # rename book cover if one was uploaded
-    if request.form.get("cover_uploaded", None):
+    cover_job_id = request.form.get("cover_job_id", None, type=int)
+    if cover_job_id is not None:
+        # cover of an imported book, only there if the job finished downloading it
+        cover_job = get_job_queue().get(cover_job_id)
+        cover_uploaded = cover_job is not None and cover_job.status == DONE
+        if not cover_uploaded:
+            # the page blocks saving till the job finished so it most likely failed
+            flash("Cover was not added since it couldn't be downloaded!", "warning")
+            flash("You can upload one by editing the book!", "info")
+    else:
+        cover_uploaded = bool(request.form.get("cover_uploaded", None))
+    if cover_uploaded:
         # first cover will always have timestamp 0
         os.replace(os.path.join(current_app.config["THUMBS_FOLDER"], "temp_cover_0"),
                    os.path.join(current_app.config["THUMBS_FOLDER"], f"{bid}_0"))
+        schedule_derivatives(current_app.config["THUMBS_FOLDER"], f"{bid}_0",
+                             overwrite=True)
 
     return show_info(bid, book=book, show_outdated=outdated_on_ei_id)
 
@@ -694,8 +836,12 @@ def cancel_add_book():
     # del temp book cover file if we dont add book
     cover_uploaded = request.data
     if cover_uploaded:
-        os.remove(os.path.join(
-            current_app.config["THUMBS_FOLDER"], "temp_cover_0"))
+        try:
+            os.remove(os.path.join(
+                current_app.config["THUMBS_FOLDER"], "temp_cover_0"))
+        except FileNotFoundError:
+            # download job of an imported book's cover failed or didn't finish yet
+            pass
     # js takes care of the redirection
     return url_for("main.show_entries")
 
@@ -778,16 +924,19 @@ def edit_book(book_id):
         thumb_dir = current_app.config['THUMBS_FOLDER']
 
         # delete old cover if present
+        old_cover_fn = f"{book_id}_{book.cover_timestamp:.0f}"
         try:
-            os.remove(os.path.join(
-                thumb_dir, f"{book_id}_{book.cover_timestamp:.0f}"))
+            os.remove(os.path.join(thumb_dir, old_cover_fn))
         except FileNotFoundError:
             pass
+        remove_derivatives(thumb_dir, old_cover_fn)
 
         # replace with new one and update timestamp
         # rename instead of os.replace so it crashes on existing file
+        new_cover_fn = f"{book_id}_{cover_timestamp:.0f}"
         os.rename(os.path.join(thumb_dir, "temp_cover_0"),
-                  os.path.join(thumb_dir, f"{book_id}_{cover_timestamp:.0f}"))
+                  os.path.join(thumb_dir, new_cover_fn))
+        schedule_derivatives(thumb_dir, new_cover_fn, overwrite=True)
         book.cover_timestamp = cover_timestamp
 
     book.save()
@@ -1035,10 +1184,12 @@ def manage_tags():
         flash("Got invalid value for tag type abbreviation", "title warning")
         return render_template('manage_tags.html')
 
-    mdb = get_mdb()
-    c = mdb.db_con.execute(
-        f"SELECT id, name FROM {tag_tbl_name} WHERE name LIKE '%{search_str}%'")
-    tags = c.fetchall()
+    mdb = get_mdb(read_only=True)
+    search_str_lower = search_str.lower()
+    # most used first
+    tags = [(_id, name, book_count) for _id, name, book_count
+            in mdb.get_facet_counts(tag_tbl_name, min_count=0)
+            if search_str_lower in name.lower()]
 
     return render_template(
         'manage_tags.html',
@@ -4,7 +4,7 @@ CREATE TABLE Artist(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE,
             favorite INTEGER NOT NULL DEFAULT 0
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE BookArtist(
             book_id INTEGER NOT NULL,
             artist_id INTEGER NOT NULL,
@@ -70,6 +70,15 @@ CREATE TABLE BookParody(
             ON DELETE CASCADE,
             PRIMARY KEY (book_id, parody_id)
         );
+CREATE TABLE BookSummary(
+            book_id INTEGER PRIMARY KEY,
+            -- names are ordered and separated by ';'
+            tags TEXT NOT NULL DEFAULT '',
+            artists TEXT NOT NULL DEFAULT '',
+            avg_ext_rating REAL,
+            FOREIGN KEY (book_id) REFERENCES Books(id)
+               ON DELETE CASCADE
+        );
 CREATE TABLE BookTag(
         book_id INTEGER NOT NULL,
         tag_id INTEGER NOT NULL,
@@ -96,10 +105,13 @@ CREATE TABLE Books(
                         FOREIGN KEY (status_id) REFERENCES Status(id)
                            ON DELETE RESTRICT
                     );
+CREATE VIRTUAL TABLE BooksTitleFts USING fts5(
+        title_eng, title_foreign, content='Books', content_rowid='id', tokenize='trigram'
+    );
 CREATE TABLE Category(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE Censorship (
                     id INTEGER PRIMARY KEY ASC,
                     name TEXT UNIQUE NOT NULL
@@ -107,11 +119,11 @@ CREATE TABLE Censorship (
 CREATE TABLE Character(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE Collection(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE ExternalInfo(
         id INTEGER PRIMARY KEY ASC,
         book_id INTEGER NOT NULL,
@@ -136,7 +148,7 @@ CREATE TABLE ExternalInfo(
 CREATE TABLE Groups(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE Languages (
                      id INTEGER PRIMARY KEY ASC,
                      name TEXT UNIQUE NOT NULL
@@ -144,7 +156,7 @@ CREATE TABLE Languages (
 CREATE TABLE List(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE MDB_Version (
     version_id INTEGER PRIMARY KEY ASC,
     dirty INTEGER NOT NULL
@@ -152,7 +164,7 @@ CREATE TABLE MDB_Version (
 CREATE TABLE Parody(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE Sites (
                     id INTEGER PRIMARY KEY ASC,
                     name TEXT UNIQUE NOT NULL
@@ -164,24 +176,24 @@ CREATE TABLE Status(
 CREATE TABLE Tag(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 INSERT INTO "Artist" VALUES
-(1,'Ayano Naoto',0),
-(2,'SAKULA',0),
-(3,'Fan no Hitori',0),
-(4,'Jirou',0),
-(5,'Kirisaki Byakko',0),
-(6,'Korotsuke',0),
-(7,'DATE',0),
-(8,'ryuno',0),
-(9,'Tanabe Kyou',0),
-(10,'Yamamoto Zenzen',0),
-(11,'Taniguchi-san',0),
-(12,'Kaneda Asou',0),
-(13,'Fei',0),
-(14,'Sirokuma',0),
-(15,'bariun',0),
-(16,'Tawara Hiryuu',0);
+(1,'Ayano Naoto',0,1),
+(2,'SAKULA',0,1),
+(3,'Fan no Hitori',0,2),
+(4,'Jirou',0,1),
+(5,'Kirisaki Byakko',0,1),
+(6,'Korotsuke',0,1),
+(7,'DATE',0,1),
+(8,'ryuno',0,1),
+(9,'Tanabe Kyou',0,1),
+(10,'Yamamoto Zenzen',0,1),
+(11,'Taniguchi-san',0,1),
+(12,'Kaneda Asou',0,1),
+(13,'Fei',0,1),
+(14,'Sirokuma',0,1),
+(15,'bariun',0,1),
+(16,'Tawara Hiryuu',0,1);
 INSERT INTO "BookArtist" VALUES
 (1,1),
 (2,2),
@@ -260,6 +272,24 @@ INSERT INTO "BookParody" VALUES
 (6,5),
 (13,6),
 (16,7);
+INSERT INTO "BookSummary" VALUES
+(1,'Anal;Chastity Belt;Femdom;Footjob;Gokkun;Handjob;Large Breasts;Masturbation;Nakadashi;Orgasm Denial;Pantyhose;Straight Shota;Sweating;Urethra Insertion','Ayano Naoto',3.85),
+(2,'Blowjob;Decensored;Drugs;Nakadashi;X-ray','SAKULA',4.67),
+(3,'Ahegao;Anal;Big Ass;Blowjob;Collar;Deepthroat;Large Breasts;Leg Lock;Megane;MILF;Mind Break;Nakadashi;Ponytail;Rape;Slave;Snuff;Symbol Shaped Pupils;Virginity (Male)','Fan no Hitori',3.84),
+(4,'Big Ass;Cunnilingus;Face Sitting;Femdom;Foot Fetish;Footjob;Hairy;Large Breasts;Licking;Nakadashi;Pantyhose;Short Hair;Smell','Jirou',4.7),
+(5,'Collar;Dragon Girl;Fangs;Femdom;Futa on Female;Futanari;Gender Bender;Hat;Large Breasts;Leotard;Monster Girl;Nakadashi;Royalty','Kirisaki Byakko',4.23),
+(6,'Ahegao;Exhibitionism;Happy Sex;Impregnation;Large Breasts;Nakadashi;Ponytail;School Uniform;Sweating','Korotsuke',4.52),
+(7,'Fingering;Gender Bender;Masturbation;Possession;Solo Action','DATE',3.8),
+(8,'Anal;Big Ass;Blowjob;Comedy;Dark Skin;Gyaru;Happy Sex;Large Breasts;Megane;Nakadashi;Paizuri;School Uniform;Shared Senses','ryuno',4.23),
+(9,'Ahegao;Anal;Blowjob;Huge Penis;Incest;Loli;Maledom;Nakadashi;Niece;Slut;Stockings;X-ray','Tanabe Kyou',4.69),
+(10,'Ahegao;Big Areola;Dark Skin;Drugs;Elf;Huge Breasts;Huge Penis;MILF;Nakadashi;Rape;Tattoo;Threesome','Yamamoto Zenzen',4.15),
+(11,'Ahegao;Body Swap;Bondage;Dark Skin;Defloration;Elf;Filming;Futa on Female;Futanari;Gender Bender;Large Breasts;Nakadashi','Taniguchi-san',4.13),
+(12,'Anal;Big Areola;Big Ass;Dark Skin;Defloration;Double Penetration;Elder Sister;Femdom;Hat;Huge Penis;Large Breasts;Nakadashi;Royalty;Short Hair;Straight Shota;Tall Girl','Kaneda Asou',3.86),
+(13,'Bikini;Blowjob;Group Sex;Large Breasts;Nakadashi;Swimsuit;Threesome','Fei',3.76),
+(14,'Ahegao;Anal;Collar;Large Breasts;Maid;Mind Break;Mind Control;Nakadashi;Office Lady;Pantyhose;Rape;Stockings;X-ray','Fan no Hitori',3.79),
+(15,'Ahegao;Blowjob;Femdom;Hairy;Handjob;Huge Penis;Large Breasts;Nakadashi;Nurse;Symbol Shaped Pupils','Sirokuma',4.33),
+(16,'Ahegao;Blowjob;Group Sex;Happy Sex;Layer Cake;Megane;Selfcest;Threesome','bariun',4.49),
+(17,'Ahegao;BBW;Big Areola;Big Ass;Bikini;Blowjob;Cunnilingus;Dark Skin;Femdom;Hairy;Huge Breasts;Huge Penis;Kimono / Yukata;Large Breasts;MILF;Nakadashi;Onsen;Paizuri;Swimsuit;Symbol Shaped Pupils;Virginity (Male);Widow','Tawara Hiryuu',4.64);
 INSERT INTO "BookTag" VALUES
 (1,1),
 (1,2),
@@ -482,27 +512,27 @@ INSERT INTO "Books" VALUES
 (16,'Futari no Futaba','フタリノフタバ',2,26,1,NULL,NULL,NULL,'2021-02-03',0,0.0,NULL,1),
 (17,'Toshiue Zukushi Jukushita Sanshimai 1 -Hoshigari Miboujin to Ore- | The Three Older, Mature Sisters Next Door 1 -The Frustrated Widow and Me-','年上づくし熟した三姉妹1 -欲しがり未亡人と俺-',2,27,1,NULL,NULL,NULL,'2021-02-03',0,0.0,NULL,1);
 INSERT INTO "Category" VALUES
-(1,'Doujinshi'),
-(2,'Manga');
+(1,'Doujinshi',9),
+(2,'Manga',8);
 INSERT INTO "Censorship" VALUES
 (1,'Unknown'),
 (2,'Censored'),
 (3,'Decensored'),
 (4,'Uncensored');
 INSERT INTO "Character" VALUES
-(1,'Darjeeling'),
-(2,'Handler'),
-(3,'Mario'),
-(4,'Princess Peach'),
-(5,'Super Crown Bowser | Bowsette'),
-(6,'Martina'),
-(7,'Momiji'),
-(8,'Nyotengu'),
-(9,'Akira Kurusu'),
-(10,'Futaba Sakura');
+(1,'Darjeeling',1),
+(2,'Handler',1),
+(3,'Mario',1),
+(4,'Princess Peach',1),
+(5,'Super Crown Bowser | Bowsette',1),
+(6,'Martina',1),
+(7,'Momiji',1),
+(8,'Nyotengu',1),
+(9,'Akira Kurusu',1),
+(10,'Futaba Sakura',1);
 INSERT INTO "Collection" VALUES
-(1,'Dolls'),
-(2,'Takabisha Elf Kyousei Konin!!');
+(1,'Dolls',2),
+(2,'Takabisha Elf Kyousei Konin!!',1);
 INSERT INTO "ExternalInfo" VALUES
 (1,1,'43559',1,'2018-10-20','gezio',2,3.85,34,353,0,'2018-10-24',0),
 (2,2,'43551',1,'2018-10-20','MrOverlord12',3,4.67,55,709,0,'2018-10-24',0),
@@ -523,14 +553,14 @@ INSERT INTO "ExternalInfo" VALUES
 (17,17,'43418',1,'2018-10-10','gezio',2,4.64,141,1857,0,'2018-10-24',0),
 (18,16,'43454',1,'2018-10-11','DiceOL',2,4.49,81,930,0,'2018-10-24',0);
 INSERT INTO "Groups" VALUES
-(1,'Kaiki Nisshoku'),
-(2,'IRON GRIMOIRE'),
-(3,'Fan no Hitori'),
-(4,'SeaFox'),
-(5,'Mousou Engine'),
-(6,'Senpenbankashiki'),
-(7,'Dokumushi Shokeitai'),
-(8,'Maidoll');
+(1,'Kaiki Nisshoku',1),
+(2,'IRON GRIMOIRE',1),
+(3,'Fan no Hitori',1),
+(4,'SeaFox',1),
+(5,'Mousou Engine',1),
+(6,'Senpenbankashiki',1),
+(7,'Dokumushi Shokeitai',1),
+(8,'Maidoll',1);
 INSERT INTO "Languages" VALUES
 (1,'Unknown'),
 (2,'English'),
@@ -569,17 +599,17 @@ INSERT INTO "Languages" VALUES
 (35,'Ukrainian'),
 (36,'Vietnamese');
 INSERT INTO "List" VALUES
-(1,'to-read');
+(1,'to-read',9);
 INSERT INTO "MDB_Version" VALUES
-(6,0);
+(11,0);
 INSERT INTO "Parody" VALUES
-(1,'Girls und Panzer / ガールズ&パンツァー'),
-(2,'Monster Hunter World / モンスターハンター：ワールド'),
-(3,'Super Mario Bros. / スーパーマリオブラザーズ'),
-(4,'Dragon Quest / ドラゴンクエスト'),
-(5,'Dragon Quest XI (11) / ドラゴンクエストXI'),
-(6,'Dead or Alive / デッド・オア・アライブ'),
-(7,'Persona 5 / ペルソナ5');
+(1,'Girls und Panzer / ガールズ&パンツァー',1),
+(2,'Monster Hunter World / モンスターハンター：ワールド',1),
+(3,'Super Mario Bros. / スーパーマリオブラザーズ',1),
+(4,'Dragon Quest / ドラゴンクエスト',1),
+(5,'Dragon Quest XI (11) / ドラゴンクエストXI',1),
+(6,'Dead or Alive / デッド・オア・アライブ',1),
+(7,'Persona 5 / ペルソナ5',1);
 INSERT INTO "Sites" VALUES
 (1,'tsumino.com'),
 (2,'nhentai.net'),
@@ -596,102 +626,125 @@ INSERT INTO "Status" VALUES
 (5,'Hiatus'),
 (6,'Cancelled');
 INSERT INTO "Tag" VALUES
-(1,'Anal'),
-(2,'Chastity Belt'),
-(3,'Femdom'),
-(4,'Footjob'),
-(5,'Gokkun'),
-(6,'Handjob'),
-(7,'Large Breasts'),
-(8,'Masturbation'),
-(9,'Nakadashi'),
-(10,'Orgasm Denial'),
-(11,'Pantyhose'),
-(12,'Straight Shota'),
-(13,'Sweating'),
-(14,'Urethra Insertion'),
-(15,'Blowjob'),
-(16,'Decensored'),
-(17,'Drugs'),
-(18,'X-ray'),
-(19,'Ahegao'),
-(20,'Big Ass'),
-(21,'Collar'),
-(22,'Deepthroat'),
-(23,'Leg Lock'),
-(24,'Megane'),
-(25,'MILF'),
-(26,'Mind Break'),
-(27,'Ponytail'),
-(28,'Rape'),
-(29,'Slave'),
-(30,'Snuff'),
-(31,'Symbol Shaped Pupils'),
-(32,'Virginity (Male)'),
-(33,'Cunnilingus'),
-(34,'Face Sitting'),
-(35,'Foot Fetish'),
-(36,'Hairy'),
-(37,'Licking'),
-(38,'Short Hair'),
-(39,'Smell'),
-(40,'Dragon Girl'),
-(41,'Fangs'),
-(42,'Futa on Female'),
-(43,'Futanari'),
-(44,'Gender Bender'),
-(45,'Hat'),
-(46,'Leotard'),
-(47,'Monster Girl'),
-(48,'Royalty'),
-(49,'Exhibitionism'),
-(50,'Happy Sex'),
-(51,'Impregnation'),
-(52,'School Uniform'),
-(53,'Fingering'),
-(54,'Possession'),
-(55,'Solo Action'),
-(56,'Comedy'),
-(57,'Dark Skin'),
-(58,'Gyaru'),
-(59,'Paizuri'),
-(60,'Shared Senses'),
-(61,'Huge Penis'),
-(62,'Incest'),
-(63,'Loli'),
-(64,'Maledom'),
-(65,'Niece'),
-(66,'Slut'),
-(67,'Stockings'),
-(68,'Big Areola'),
-(69,'Elf'),
-(70,'Huge Breasts'),
-(71,'Tattoo'),
-(72,'Threesome'),
-(73,'Body Swap'),
-(74,'Bondage'),
-(75,'Defloration'),
-(76,'Filming'),
-(77,'Double Penetration'),
-(78,'Elder Sister'),
-(79,'Tall Girl'),
-(80,'Bikini'),
-(81,'Group Sex'),
-(82,'Swimsuit'),
-(83,'Maid'),
-(84,'Mind Control'),
-(85,'Office Lady'),
-(86,'Nurse'),
-(87,'Layer Cake'),
-(88,'Selfcest'),
-(89,'BBW'),
-(90,'Kimono / Yukata'),
-(91,'Onsen'),
-(92,'Widow');
+(1,'Anal',6),
+(2,'Chastity Belt',1),
+(3,'Femdom',6),
+(4,'Footjob',2),
+(5,'Gokkun',1),
+(6,'Handjob',2),
+(7,'Large Breasts',12),
+(8,'Masturbation',2),
+(9,'Nakadashi',15),
+(10,'Orgasm Denial',1),
+(11,'Pantyhose',3),
+(12,'Straight Shota',2),
+(13,'Sweating',2),
+(14,'Urethra Insertion',1),
+(15,'Blowjob',8),
+(16,'Decensored',1),
+(17,'Drugs',2),
+(18,'X-ray',3),
+(19,'Ahegao',9),
+(20,'Big Ass',5),
+(21,'Collar',3),
+(22,'Deepthroat',1),
+(23,'Leg Lock',1),
+(24,'Megane',3),
+(25,'MILF',3),
+(26,'Mind Break',2),
+(27,'Ponytail',2),
+(28,'Rape',3),
+(29,'Slave',1),
+(30,'Snuff',1),
+(31,'Symbol Shaped Pupils',3),
+(32,'Virginity (Male)',2),
+(33,'Cunnilingus',2),
+(34,'Face Sitting',1),
+(35,'Foot Fetish',1),
+(36,'Hairy',3),
+(37,'Licking',1),
+(38,'Short Hair',2),
+(39,'Smell',1),
+(40,'Dragon Girl',1),
+(41,'Fangs',1),
+(42,'Futa on Female',2),
+(43,'Futanari',2),
+(44,'Gender Bender',3),
+(45,'Hat',2),
+(46,'Leotard',1),
+(47,'Monster Girl',1),
+(48,'Royalty',2),
+(49,'Exhibitionism',1),
+(50,'Happy Sex',3),
+(51,'Impregnation',1),
+(52,'School Uniform',2),
+(53,'Fingering',1),
+(54,'Possession',1),
+(55,'Solo Action',1),
+(56,'Comedy',1),
+(57,'Dark Skin',5),
+(58,'Gyaru',1),
+(59,'Paizuri',2),
+(60,'Shared Senses',1),
+(61,'Huge Penis',5),
+(62,'Incest',1),
+(63,'Loli',1),
+(64,'Maledom',1),
+(65,'Niece',1),
+(66,'Slut',1),
+(67,'Stockings',2),
+(68,'Big Areola',3),
+(69,'Elf',2),
+(70,'Huge Breasts',2),
+(71,'Tattoo',1),
+(72,'Threesome',3),
+(73,'Body Swap',1),
+(74,'Bondage',1),
+(75,'Defloration',2),
+(76,'Filming',1),
+(77,'Double Penetration',1),
+(78,'Elder Sister',1),
+(79,'Tall Girl',1),
+(80,'Bikini',2),
+(81,'Group Sex',2),
+(82,'Swimsuit',2),
+(83,'Maid',1),
+(84,'Mind Control',1),
+(85,'Office Lady',1),
+(86,'Nurse',1),
+(87,'Layer Cake',1),
+(88,'Selfcest',1),
+(89,'BBW',1),
+(90,'Kimono / Yukata',1),
+(91,'Onsen',1),
+(92,'Widow',1);
+INSERT INTO "BooksTitleFts"("BooksTitleFts") VALUES ('rebuild');
 CREATE UNIQUE INDEX idx_artist_name ON Artist (name COLLATE NOCASE);
+CREATE INDEX idx_bookartist_artist_id_book_id
+        ON BookArtist (artist_id, book_id);
+CREATE INDEX idx_bookcategory_category_id_book_id
+        ON BookCategory (category_id, book_id);
+CREATE INDEX idx_bookcharacter_character_id_book_id
+        ON BookCharacter (character_id, book_id);
+CREATE INDEX idx_bookcollection_collection_id_book_id
+        ON BookCollection (collection_id, book_id);
+CREATE INDEX idx_bookgroups_group_id_book_id
+        ON BookGroups (group_id, book_id);
+CREATE INDEX idx_booklist_list_id_book_id
+        ON BookList (list_id, book_id);
+CREATE INDEX idx_bookparody_parody_id_book_id
+        ON BookParody (parody_id, book_id);
+CREATE INDEX idx_books_last_change_id ON Books (last_change, id);
+CREATE INDEX idx_books_my_rating_id ON Books (my_rating, id);
+CREATE INDEX idx_books_pages_id ON Books (pages, id);
+CREATE INDEX idx_books_title_eng_id ON Books (title_eng, id);
+CREATE INDEX idx_books_title_foreign_id ON Books (title_foreign, id);
+CREATE INDEX idx_booktag_tag_id_book_id
+        ON BookTag (tag_id, book_id);
 CREATE UNIQUE INDEX idx_category_name ON Category (name COLLATE NOCASE);
 CREATE UNIQUE INDEX idx_character_name ON Character (name COLLATE NOCASE);
 CREATE UNIQUE INDEX idx_collection_name ON Collection (name COLLATE NOCASE);
+CREATE INDEX idx_externalinfo_book_id ON ExternalInfo (book_id);
 CREATE UNIQUE INDEX idx_groups_name ON Groups (name COLLATE NOCASE);
 CREATE INDEX idx_id_onpage_imported_from ON ExternalInfo (id_onpage, imported_from);
 CREATE UNIQUE INDEX idx_list_name ON List (name COLLATE NOCASE);
@@ -701,6 +754,236 @@ CREATE UNIQUE INDEX "idx_title_eng_foreign" ON "Books" (
 	"title_eng",
 	"title_foreign"
 );
+CREATE TRIGGER book_summary_artist_rename
+            AFTER UPDATE OF name ON Artist
+            BEGIN
+                UPDATE BookSummary SET artists = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookArtist bx, Artist x
+                    WHERE bx.book_id = BookSummary.book_id AND x.id = bx.artist_id
+                    ORDER BY x.name
+                )
+            ), '')
+                WHERE book_id IN (
+                    SELECT book_id FROM BookArtist WHERE artist_id = NEW.id);
+            END;
+CREATE TRIGGER book_summary_bookartist_delete
+                AFTER DELETE ON BookArtist
+                BEGIN
+                    UPDATE BookSummary SET artists = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookArtist bx, Artist x
+                    WHERE bx.book_id = OLD.book_id AND x.id = bx.artist_id
+                    ORDER BY x.name
+                )
+            ), '')
+                    WHERE book_id = OLD.book_id;
+                END;
+CREATE TRIGGER book_summary_bookartist_insert
+                AFTER INSERT ON BookArtist
+                BEGIN
+                    UPDATE BookSummary SET artists = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookArtist bx, Artist x
+                    WHERE bx.book_id = NEW.book_id AND x.id = bx.artist_id
+                    ORDER BY x.name
+                )
+            ), '')
+                    WHERE book_id = NEW.book_id;
+                END;
+CREATE TRIGGER book_summary_books_delete
+        AFTER DELETE ON Books
+        BEGIN
+            DELETE FROM BookSummary WHERE book_id = OLD.id;
+        END;
+CREATE TRIGGER book_summary_books_insert
+        AFTER INSERT ON Books
+        BEGIN
+            INSERT OR REPLACE INTO BookSummary(book_id) VALUES (NEW.id);
+        END;
+CREATE TRIGGER book_summary_booktag_delete
+                AFTER DELETE ON BookTag
+                BEGIN
+                    UPDATE BookSummary SET tags = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookTag bx, Tag x
+                    WHERE bx.book_id = OLD.book_id AND x.id = bx.tag_id
+                    ORDER BY x.name
+                )
+            ), '')
+                    WHERE book_id = OLD.book_id;
+                END;
+CREATE TRIGGER book_summary_booktag_insert
+                AFTER INSERT ON BookTag
+                BEGIN
+                    UPDATE BookSummary SET tags = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookTag bx, Tag x
+                    WHERE bx.book_id = NEW.book_id AND x.id = bx.tag_id
+                    ORDER BY x.name
+                )
+            ), '')
+                    WHERE book_id = NEW.book_id;
+                END;
+CREATE TRIGGER book_summary_externalinfo_delete
+            AFTER DELETE ON ExternalInfo
+            BEGIN
+                UPDATE BookSummary SET avg_ext_rating = (
+        SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo WHERE book_id = OLD.book_id)
+                WHERE book_id = OLD.book_id;
+            END;
+CREATE TRIGGER book_summary_externalinfo_insert
+            AFTER INSERT ON ExternalInfo
+            BEGIN
+                UPDATE BookSummary SET avg_ext_rating = (
+        SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo WHERE book_id = NEW.book_id)
+                WHERE book_id = NEW.book_id;
+            END;
+CREATE TRIGGER book_summary_externalinfo_update
+        AFTER UPDATE OF rating, book_id ON ExternalInfo
+        BEGIN
+            UPDATE BookSummary SET avg_ext_rating = (
+        SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo WHERE book_id = OLD.book_id)
+            WHERE book_id = OLD.book_id;
+            UPDATE BookSummary SET avg_ext_rating = (
+        SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo WHERE book_id = NEW.book_id)
+            WHERE book_id = NEW.book_id;
+        END;
+CREATE TRIGGER book_summary_tag_rename
+            AFTER UPDATE OF name ON Tag
+            BEGIN
+                UPDATE BookSummary SET tags = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookTag bx, Tag x
+                    WHERE bx.book_id = BookSummary.book_id AND x.id = bx.tag_id
+                    ORDER BY x.name
+                )
+            ), '')
+                WHERE book_id IN (
+                    SELECT book_id FROM BookTag WHERE tag_id = NEW.id);
+            END;
+CREATE TRIGGER bookartist_count_delete
+            AFTER DELETE ON BookArtist
+            BEGIN
+                UPDATE Artist SET book_count = book_count - 1
+                WHERE id = OLD.artist_id;
+            END;
+CREATE TRIGGER bookartist_count_insert
+            AFTER INSERT ON BookArtist
+            BEGIN
+                UPDATE Artist SET book_count = book_count + 1
+                WHERE id = NEW.artist_id;
+            END;
+CREATE TRIGGER bookcategory_count_delete
+            AFTER DELETE ON BookCategory
+            BEGIN
+                UPDATE Category SET book_count = book_count - 1
+                WHERE id = OLD.category_id;
+            END;
+CREATE TRIGGER bookcategory_count_insert
+            AFTER INSERT ON BookCategory
+            BEGIN
+                UPDATE Category SET book_count = book_count + 1
+                WHERE id = NEW.category_id;
+            END;
+CREATE TRIGGER bookcharacter_count_delete
+            AFTER DELETE ON BookCharacter
+            BEGIN
+                UPDATE Character SET book_count = book_count - 1
+                WHERE id = OLD.character_id;
+            END;
+CREATE TRIGGER bookcharacter_count_insert
+            AFTER INSERT ON BookCharacter
+            BEGIN
+                UPDATE Character SET book_count = book_count + 1
+                WHERE id = NEW.character_id;
+            END;
+CREATE TRIGGER bookcollection_count_delete
+            AFTER DELETE ON BookCollection
+            BEGIN
+                UPDATE Collection SET book_count = book_count - 1
+                WHERE id = OLD.collection_id;
+            END;
+CREATE TRIGGER bookcollection_count_insert
+            AFTER INSERT ON BookCollection
+            BEGIN
+                UPDATE Collection SET book_count = book_count + 1
+                WHERE id = NEW.collection_id;
+            END;
+CREATE TRIGGER bookgroups_count_delete
+            AFTER DELETE ON BookGroups
+            BEGIN
+                UPDATE Groups SET book_count = book_count - 1
+                WHERE id = OLD.group_id;
+            END;
+CREATE TRIGGER bookgroups_count_insert
+            AFTER INSERT ON BookGroups
+            BEGIN
+                UPDATE Groups SET book_count = book_count + 1
+                WHERE id = NEW.group_id;
+            END;
+CREATE TRIGGER booklist_count_delete
+            AFTER DELETE ON BookList
+            BEGIN
+                UPDATE List SET book_count = book_count - 1
+                WHERE id = OLD.list_id;
+            END;
+CREATE TRIGGER booklist_count_insert
+            AFTER INSERT ON BookList
+            BEGIN
+                UPDATE List SET book_count = book_count + 1
+                WHERE id = NEW.list_id;
+            END;
+CREATE TRIGGER bookparody_count_delete
+            AFTER DELETE ON BookParody
+            BEGIN
+                UPDATE Parody SET book_count = book_count - 1
+                WHERE id = OLD.parody_id;
+            END;
+CREATE TRIGGER bookparody_count_insert
+            AFTER INSERT ON BookParody
+            BEGIN
+                UPDATE Parody SET book_count = book_count + 1
+                WHERE id = NEW.parody_id;
+            END;
+CREATE TRIGGER books_title_fts_delete
+        AFTER DELETE ON Books
+        BEGIN
+            INSERT INTO BooksTitleFts(BooksTitleFts, rowid, title_eng, title_foreign)
+            VALUES ('delete', OLD.id, OLD.title_eng, OLD.title_foreign);
+        END;
+CREATE TRIGGER books_title_fts_insert
+        AFTER INSERT ON Books
+        BEGIN
+            INSERT INTO BooksTitleFts(rowid, title_eng, title_foreign)
+            VALUES (NEW.id, NEW.title_eng, NEW.title_foreign);
+        END;
+CREATE TRIGGER books_title_fts_update
+        AFTER UPDATE OF title_eng, title_foreign ON Books
+        BEGIN
+            INSERT INTO BooksTitleFts(BooksTitleFts, rowid, title_eng, title_foreign)
+            VALUES ('delete', OLD.id, OLD.title_eng, OLD.title_foreign);
+            INSERT INTO BooksTitleFts(rowid, title_eng, title_foreign)
+            VALUES (NEW.id, NEW.title_eng, NEW.title_foreign);
+        END;
+CREATE TRIGGER booktag_count_delete
+            AFTER DELETE ON BookTag
+            BEGIN
+                UPDATE Tag SET book_count = book_count - 1
+                WHERE id = OLD.tag_id;
+            END;
+CREATE TRIGGER booktag_count_insert
+            AFTER INSERT ON BookTag
+            BEGIN
+                UPDATE Tag SET book_count = book_count + 1
+                WHERE id = NEW.tag_id;
+            END;
 CREATE TRIGGER set_books_last_change
     AFTER UPDATE ON Books
     BEGIN
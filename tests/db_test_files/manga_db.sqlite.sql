@@ -4,7 +4,7 @@ CREATE TABLE Artist(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE,
             favorite INTEGER NOT NULL DEFAULT 0
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE BookArtist(
             book_id INTEGER NOT NULL,
             artist_id INTEGER NOT NULL,
@@ -70,6 +70,15 @@ CREATE TABLE BookParody(
             ON DELETE CASCADE,
             PRIMARY KEY (book_id, parody_id)
         );
+CREATE TABLE BookSummary(
+            book_id INTEGER PRIMARY KEY,
+            -- names are ordered and separated by ';'
+            tags TEXT NOT NULL DEFAULT '',
+            artists TEXT NOT NULL DEFAULT '',
+            avg_ext_rating REAL,
+            FOREIGN KEY (book_id) REFERENCES Books(id)
+               ON DELETE CASCADE
+        );
 CREATE TABLE BookTag(
         book_id INTEGER NOT NULL,
         tag_id INTEGER NOT NULL,
@@ -96,10 +105,13 @@ CREATE TABLE Books(
                         FOREIGN KEY (status_id) REFERENCES Status(id)
                            ON DELETE RESTRICT
                     );
+CREATE VIRTUAL TABLE BooksTitleFts USING fts5(
+        title_eng, title_foreign, content='Books', content_rowid='id', tokenize='trigram'
+    );
 CREATE TABLE Category(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE Censorship
                         (
                             id INTEGER PRIMARY KEY ASC,
@@ -108,11 +120,11 @@ CREATE TABLE Censorship
 CREATE TABLE Character(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE Collection(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE ExternalInfo(
         id INTEGER PRIMARY KEY ASC,
         book_id INTEGER NOT NULL,
@@ -137,14 +149,14 @@ CREATE TABLE ExternalInfo(
 CREATE TABLE Groups(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE Languages (
                  id INTEGER PRIMARY KEY ASC,
                  name TEXT UNIQUE NOT NULL);
 CREATE TABLE List(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE MDB_Version (
     version_id INTEGER PRIMARY KEY ASC,
     dirty INTEGER NOT NULL
@@ -152,7 +164,7 @@ CREATE TABLE MDB_Version (
 CREATE TABLE Parody(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 CREATE TABLE Sites (
                  id INTEGER PRIMARY KEY ASC,
                  name TEXT UNIQUE NOT NULL);
@@ -164,1327 +176,1327 @@ CREATE TABLE Status
 CREATE TABLE Tag(
             id INTEGER PRIMARY KEY ASC,
             name TEXT UNIQUE NOT NULL COLLATE NOCASE
-        );
+        , book_count INTEGER NOT NULL DEFAULT 0);
 INSERT INTO "Artist" VALUES
-(1,'Isao',0),
-(2,'Yojouhan Shobou',0),
-(3,'Shiwasu No Okina',0),
-(4,'Noumiso',0),
-(5,'Yamashita Kurowo',0),
-(6,'212',0),
-(7,'Yumeno Tanuki',0),
-(8,'Chiba Toshirou',0),
-(9,'Mikoyan',0),
-(10,'Sasamori Tomoe',0),
-(11,'Mizuryu Kei',0),
-(12,'Bubuzuke',0),
-(13,'SGK',0),
-(14,'ShindoL',0),
-(15,'Kamina Koharu',0),
-(16,'Uruujima Call',0),
-(17,'Gentle Sasaki',0),
-(18,'BANG-YOU | Didori',0),
-(19,'Shinkuu Tatsuya',0),
-(20,'KONKIT',0),
-(21,'Meme 50',0),
-(22,'Ribyuhki',0),
-(23,'Unou',0),
-(24,'Kei.',0),
-(25,'Butcha U',0),
-(26,'nuezou',0),
-(27,'Denki Shougun',0),
-(28,'Komusou',0),
-(29,'Kazuhiro',0),
-(30,'Orange Bull',0),
-(31,'WindArt',0),
-(32,'Z-Ton',0),
-(33,'Nemu',0),
-(34,'Mizone',0),
-(35,'Tamatsuyada',0),
-(36,'Satou Kimiatsu',0),
-(37,'Bonten',0),
-(38,'Tokimachi Eisei',0),
-(39,'Saranaru Takami',0),
-(40,'Orutoro',0),
-(41,'Morikoke',0),
-(42,'Akuochisukii Sensei',0),
-(43,'Koaya Aco',0),
-(44,'Erect Sawaru',0),
-(45,'Yuuki Ray',0),
-(46,'Jabara Tornado',0),
-(47,'hari',0),
-(48,'Ruuen Rouga',0),
-(49,'Kaitou Yuuhi',0),
-(50,'Jyura',0),
-(51,'luku',0),
-(52,'Pandain',0),
-(53,'Akutabin',0),
-(54,'Hakaba Yodomu',0),
-(55,'Soborogo',0),
-(56,'Peso',0),
-(57,'Dibi',0),
-(58,'Asanagi',0),
-(59,'Hikoma Hiroyuki',0),
-(60,'ooyun',0),
-(61,'Equal',0),
-(62,'Sahara Wataru',0),
-(63,'Pony R',0),
-(64,'Koume Keito',0),
-(65,'Nekometaru',0),
-(66,'TANABE',0),
-(67,'Ijima Yuu',0),
-(68,'Hroz',0),
-(69,'Nico Pun Nise',0),
-(70,'Jyoka',0),
-(71,'Mogiki Hayami',0),
-(72,'The Amanoja9',0),
-(73,'Booch',0),
-(74,'Jeanne DA''ck',0),
-(75,'SAVAN',0),
-(76,'Ao Banana',0),
-(77,'Hyouju Issei',0),
-(78,'Arinotowatari',0),
-(79,'Gegera Toshikazu',0),
-(80,'Kurotama',0),
-(81,'Kloah',0),
-(82,'Motsu Aki',0),
-(83,'Zhen Lu',0),
-(84,'Eno Yukimi',0),
-(85,'774 / Nanashi',0),
-(86,'Haru Yukiko',0),
-(87,'Ichiko',0),
-(88,'Jairou | Xil',0),
-(89,'Morishima Kon',0),
-(90,'Fue',0),
-(91,'Kishizuka Kenji',0),
-(92,'Momofuki Rio',0),
-(93,'Teterun',0),
-(94,'Usubeni Sakurako',0),
-(95,'sian',0),
-(96,'Uo Denim',0),
-(97,'Sakazaki Freddie',0),
-(98,'Ikameshi',0),
-(99,'Igumox',0),
-(100,'Fan no Hitori',0),
-(101,'Kito Sakeru',0),
-(102,'Satou Kuuki',0),
-(103,'Ten no Katsuraya',0),
-(104,'Aimaitei Umami',0),
-(105,'Yunioshi',0),
-(106,'Nishi Shizumu / Popuran',0),
-(107,'Sexyturkey',0),
-(108,'Tonnosuke',0),
-(109,'Morochin-san',0),
-(110,'Itsutsuse',0),
-(111,'Rama',0),
-(112,'Okumoto Yuuta',0),
-(113,'Marui Maru',0),
-(114,'mogg',0),
-(115,'Puyocha | YO',0),
-(116,'Kotoyoshi Yumisuke',0),
-(117,'Yamazaki Kana',0),
-(118,'HANABi',0),
-(119,'Enomoto Hidehira',0),
-(120,'ICHIGAN',0),
-(121,'Henkuma',0),
-(122,'John K. Pe-ta',0),
-(123,'Sugi G',0),
-(124,'Nekomimi Kanon',0),
-(125,'Aichi Shiho',0),
-(126,'Matashita Kintama',0),
-(127,'ishimura | ishimiso',0),
-(128,'ryuno',0),
-(129,'SOLOPIPB',0),
-(130,'Marimo',0),
-(131,'NOQ / Shimotsuki Juugo',0),
-(132,'Stealth Kaigyou',0),
-(133,'Jean Louis',0),
-(134,'Sakai Nayuta',0),
-(135,'Kuroneko Gata',0),
-(136,'Nokoppa',0),
-(137,'Migumigu',0),
-(138,'Karaage Toiu Mei no Inu',0),
-(139,'Wakino Yoshifumi (new)',0),
-(140,'JUNNY | Gantai Penguin',0),
-(141,'Korisei',0),
-(142,'Amane Hasuhito',0),
-(143,'Maririn',0),
-(144,'Ai Souji',0),
-(145,'Kouki Kuu',0),
-(146,'Kurokawa Otogi',0),
-(147,'Nukunuku',0),
-(148,'Mikemono Yuu',0),
-(149,'Akatsuki Kochi',0),
-(150,'Yumano Yuuki',0),
-(151,'Nikusoukyuu.',0),
-(152,'Suzuhane Suzu',0),
-(153,'Shimantogawa',0),
-(154,'Takunomi',0),
-(155,'Pochi.',0),
-(156,'mil',0),
-(157,'Yokkora',0),
-(158,'Atte7kusa',0),
-(159,'Kuroneko Smith',0),
-(160,'Takasugi Kou',0),
-(161,'Shigemiya Kyouhei',0),
-(162,'Minazuki Tsuyuha',0),
-(163,'Herio',0),
-(164,'LEYMEI',0),
-(165,'Blast',0),
-(166,'Natsume Eri',0),
-(167,'sugarBt',0),
-(168,'Shiki Takuto',0),
-(169,'stem',0),
-(170,'Seanji Sariel',0),
-(171,'Isawa Nohri',0),
-(172,'Kirin Kakeru',0),
-(173,'Shimaji',0),
-(174,'Sakurafubuki Nel',0),
-(175,'Katou Jun',0),
-(176,'Maruneko',0),
-(177,'Kemonono',0),
-(178,'Makigai Ikko',0),
-(179,'Danchino',0),
-(180,'Poccora',0),
-(181,'Kirimoto Yuuji',0),
-(182,'Ayano Naoto',0),
-(183,'Kemigawa Mondo',0),
-(184,'Tsubaki Jushiro',0),
-(185,'Kunaboto',0),
-(186,'R-Wade',0),
-(187,'Kotoko',0),
-(188,'Mifune Seijirou',0),
-(189,'Gengorou',0),
-(190,'Shiomaneki',0),
-(191,'Gesundheit',0),
-(192,'Hiroshiki',0),
-(193,'Usuki',0),
-(194,'Nagi Ichi',0),
-(195,'Jun',0),
-(196,'Konshin',0),
-(197,'Seto Yuki',0),
-(198,'Aji Pontarou',0),
-(199,'wotasu',0),
-(200,'Matsutou Tomoki',0),
-(201,'INAZUMA.',0),
-(202,'Tamanosuke',0),
-(203,'Shono Kotaro',0),
-(204,'aho / AHOBAKA',0),
-(205,'Takato Kurosuke',0),
-(206,'Hakkyou Daioujou',0),
-(207,'Suemitsu Dicca',0),
-(208,'Zanzi',0),
-(209,'Shinooka Homare',0),
-(210,'Chimosaku',0),
-(211,'Sugiura Sen',0),
-(212,'Kosuke Haruhito',0),
-(213,'Sumisuzu',0),
-(214,'Ajishio',0),
-(215,'Miyamoto Issa',0),
-(216,'Amagi Michihito',0),
-(217,'Hisui',0),
-(218,'Psycho Jenny',0),
-(219,'Suihei Sen',0),
-(220,'Una-don',0),
-(221,'Ketsuyuki Tamon',0),
-(222,'Iroito',0),
-(223,'Ootsuka Mahiro',0),
-(224,'Azukiko',0),
-(225,'Yomoyama Akira',0),
-(226,'MA-SA',0),
-(227,'Gumumu',0),
-(228,'Momoiro Manjiru',0),
-(229,'Kanaisei Jitenshasougyou',0),
-(230,'Kakashi Asahiro',0),
-(231,'Kakuzatou',0),
-(232,'Toumasu | Kanemaki Thomas',0),
-(233,'Kanten',0),
-(234,'Fumizuki Misoka',0),
-(235,'Kurenai Yuuji',0),
-(236,'Menoko',0),
-(237,'Okunoha',0),
-(238,'Momonosuke',0),
-(239,'Hozumi Kenji',0),
-(240,'ClownCulture',0),
-(241,'mega w',0),
-(242,'Kabuki Shigeyuki',0),
-(243,'Kamita',0),
-(244,'chunlieater',0),
-(245,'Shinama',0),
-(246,'Katase Minami',0),
-(247,'Katsurai Yoshiaki',0),
-(248,'Akiduki Akina',0),
-(249,'Mitarashi Kousei',0),
-(250,'Tachikawa Negoro',0),
-(251,'Aoi Masami',0),
-(252,'Kiya Shii',0),
-(253,'Minarai Zouhyou',0),
-(254,'Tsukiyo',0),
-(255,'Kasuga Tousen',0),
-(256,'Kasuga',0),
-(257,'Tarakan',0),
-(258,'Tenken',0),
-(259,'Aoi Nagisa',0),
-(260,'Tomonaga Kenji',0),
-(261,'uraura',0),
-(262,'Makari Tohru',0),
-(263,'Dagashi',0),
-(264,'bobobo',0),
-(265,'Azuma Tesshin',0),
-(266,'Atage',0),
-(267,'Ashiomi Masato',0),
-(268,'Akino Sora',0),
-(269,'Akagi Asahito',0),
-(270,'Minami',0),
-(271,'Karoti',0),
-(272,'Uehasu',0),
-(273,'Kanetsuki Masayoshi',0),
-(274,'Kiriyama Taichi',0),
-(275,'Motsu',0),
-(276,'Sunagawa Tara',0),
-(277,'Neromashin',0),
-(278,'Aki Matsuri',0),
-(279,'Doumou',0),
-(280,'Amatake Akewo',0),
-(281,'Mahiruno Kagerou',0),
-(282,'Dozamura',0),
-(283,'Maguro Teikoku',0),
-(284,'Numahana',0),
-(285,'Daigo',0),
-(286,'Mayonnaise.',0),
-(287,'Karma Tatsurou',0),
-(288,'Gura Nyuutou',0),
-(289,'Inoue Kiyoshirou',0),
-(290,'Isako Rokurou',0),
-(291,'Dynamite Moca',0),
-(292,'Kai Hiroyuki',0),
-(293,'Matsumoto Katsuya',0),
-(294,'Soine',0),
-(295,'Takatsu',0),
-(296,'Nakagami Takashi',0),
-(297,'nenemaru',0),
-(298,'Yuugiri',0),
-(299,'Martan',0),
-(300,'Mine Mura',0),
-(301,'Collagen',0),
-(302,'Double Deck',0),
-(303,'Scotch',0),
-(304,'Ishikawa Shisuke',0),
-(305,'Muronaga Chaashuu',0),
-(306,'Chinbotsu',0),
-(307,'Rebis',0),
-(308,'KEN',0),
-(309,'Kishikaisei',0),
-(310,'Kakugari Kyoudai',0),
-(311,'Katou Chakichi',0),
-(312,'Agata',0),
-(313,'zunta',0),
-(314,'Takase Yuu',0),
-(315,'GENSHI',0),
-(316,'Tamagoro',0),
-(317,'Inari',0),
-(318,'Gujira',0),
-(319,'DATE',0),
-(320,'Kuroiwa Menou',0),
-(321,'ElectricSheep',0),
-(322,'Dairoku Tenmaou Great',0),
-(323,'JACKASSS',0),
-(324,'Ookubo Matagi',0),
-(325,'Nezumi',0),
-(326,'Q Doukei',0),
-(327,'Sannyuutei Shinta',0),
-(328,'Kishinosato Satoshi',0),
-(329,'Sawada Daisuke',0),
-(330,'Wamusato Haru',0),
-(331,'Fujihan',0),
-(332,'Coconoe Ricoco',0),
-(333,'Zenra QQ',0),
-(334,'Riko',0),
-(335,'Saigado',0),
-(336,'NemuNemu',0),
-(337,'Erodezain Koubou',0),
-(338,'Buchou Chinke',0),
-(339,'Toguchi Masaya',0),
-(340,'locon',0),
-(341,'Deep Valley',0),
-(342,'Tonikaku',0),
-(343,'Blmanian',0),
-(344,'Haikawa Hemlen',0),
-(345,'Makurou',0),
-(346,'kinntarou',0),
-(347,'Karasu',0),
-(348,'Mizuyan',0),
-(349,'Musashino Sekai',0),
-(350,'Nyuu',0),
-(351,'Cr-R',0),
-(352,'Kizuki Rei',0),
-(353,'Nagashima Chousuke',0),
-(354,'Fuetakishi',0),
-(355,'Chinzuriina',0),
-(356,'Bajou Takurou',0),
-(357,'Shindou',0),
-(358,'Sakaki Utamaru',0),
-(359,'Kusui Aruta',0),
-(360,'Mikuni Mizuki',0),
-(361,'Saiyazumi',0),
-(362,'type.90',0),
-(363,'Fukumaaya',0),
-(364,'RADIOHEAD',0),
-(365,'Nise',0),
-(366,'Wanao',0),
-(367,'Psycho',0),
-(368,'Akazawa RED',0),
-(369,'Nyx',0),
-(370,'Sabusuka',0),
-(371,'Sugar Milk',0),
-(372,'Akikusa Peperon',0),
-(373,'Zucchini',0),
-(374,'Abubu',0),
-(375,'Kuroshiki',0),
-(376,'Nakamura Regura',0),
-(377,'Heiqing Langjun',0),
-(378,'Otoo',0),
-(379,'Tokisana',0),
-(380,'Shotenin Matori',0),
-(381,'Amatarou',0),
-(382,'Gen',0),
-(383,'Bundosuiko',0),
-(384,'SeN',0),
-(385,'Karei | Hirame',0),
-(386,'Takemura Sesshu',0),
-(387,'Orikuchi',0),
-(388,'Jingrock',0),
-(389,'Tomotsuka Haruomi',0),
-(390,'Uesugi Kyoushirou',0),
-(391,'Tsuttsu',0),
-(392,'Itou Eight',0),
-(393,'Kikunosukemaru',0),
-(394,'TEL',0),
-(395,'Jitsuma',0),
-(396,'Tokoyo Akashi',0),
-(397,'Amano Kazumi',0),
-(398,'Aoki Kanji',0),
-(399,'Dynamite Kit',0),
-(400,'Suzuki Akoni',0),
-(401,'Otochichi',0),
-(402,'Rocket Monkey',0),
-(403,'Oouso',0),
-(404,'Shirota Dai',0),
-(405,'Kanimaru',0),
-(406,'Drill Jill',0),
-(407,'Ere 2 Earo',0),
-(408,'Yamada Gogogo',0),
-(409,'Royal Koyanagi',0),
-(410,'Jinsuke',0),
-(411,'Azi Dahaka',0),
-(412,'makki',0),
-(413,'Denkichi',0),
-(414,'Taihei Tengoku',0),
-(415,'Porika',0),
-(416,'Ulrich',0),
-(417,'Takahashi Note',0),
-(418,'Aoyama Akira',0),
-(419,'Napata',0),
-(420,'majoccoid',0),
-(421,'Umakuchi Shouyu',0),
-(422,'E-Musu Aki',0),
-(423,'kanbe',0),
-(424,'utu',0),
-(425,'Coin RAND',0),
-(426,'Palco Nagashima',0),
-(427,'Soranosuzume',0),
-(428,'Hanamaki Kaeru',0),
-(429,'Amu',0),
-(430,'Odd',0),
-(431,'Ayato Ayari',0),
-(432,'Inochi Wazuka',0),
-(433,'Akatsuki Myuuto',0),
-(434,'Thomas',0),
-(435,'Minamida Usuke',0),
-(436,'Shinagawa Mikuzu',0),
-(437,'Kuroiwa Madoka',0),
-(438,'Murasaki☆Nyaa',0),
-(439,'Pija',0),
-(440,'Runrun',0),
-(441,'RIR',0),
-(442,'Shiroo',0),
-(443,'Kiyokawa Nijiko',0),
-(444,'Sugaishi',0),
-(445,'Yumoteliuce',0),
-(446,'144',0),
-(447,'Yosuke',0),
-(448,'Akitsuki Itsuki',0),
-(449,'Maumen',0),
-(450,'Rico',0),
-(451,'Toritora',0),
-(452,'Hyji',0),
-(453,'Ozy',0),
-(454,'13.',0),
-(455,'Bakuya',0),
-(456,'Nishi Iori',0),
-(457,'Shinozuka Yuuji',0),
-(458,'CyoCyoPolice',0),
-(459,'Erotibot',0),
-(460,'Shomu',0),
-(461,'Mafuyu Hemp',0),
-(462,'Akatsuki Katsuie',0),
-(463,'Mizusaki.',0),
-(464,'Meicha',0),
-(465,'Saida Kazuaki',0),
-(466,'Sanbaizu',0),
-(467,'Ogata Mamimi',0),
-(468,'Navier Haruka 2T',0),
-(469,'Nise Kurosaki',0),
-(470,'Aian',0),
-(471,'Hinahara Yashiki',0),
-(472,'Kousuke',0),
-(473,'Nanamatsu Kenji',0),
-(474,'Omecho',0),
-(475,'Binto',0),
-(476,'Soundvillage',0),
-(477,'Hayuta',0),
-(478,'Tsukuru',0),
-(479,'Kuroishi Ringo',0),
-(480,'Kozi',0),
-(481,'Shuffle',0),
-(482,'Nyorutarou',0),
-(483,'Ikezaki Misa',0),
-(484,'Komezawa',0),
-(485,'Satome',0),
-(486,'Takayama Non',0),
-(487,'Wataya',0),
-(488,'Yuzuha',0),
-(489,'Mario',0),
-(490,'Kanbayashi Takaki',0),
-(491,'Amin',0),
-(492,'Naokame',0),
-(493,'Aoiro Ichigou',0),
-(494,'KONBOI',0),
-(495,'Kougami Eri',0),
-(496,'Shinya',0),
-(497,'Hayashida Toranosuke',0),
-(498,'Ichimura',0),
-(499,'Binbi',0),
-(500,'Chiku',0),
-(501,'Necrosmos',0),
-(502,'NONAME',0),
-(503,'Negishiomeron',0),
-(504,'Shibusawa Hayato',0),
-(505,'Magenta Rose',0),
-(506,'Gomabura',0),
-(507,'Lew',0),
-(508,'Akiha@',0),
-(509,'Makuro',0),
-(510,'Namiko',0),
-(511,'Tomatojigoku',0),
-(512,'Minokichi',0),
-(513,'Herohero Tom',0),
-(514,'Isaki',0),
-(515,'Matou',0),
-(516,'Kira Hiroyoshi',0),
-(517,'ICE',0),
-(518,'Obyaa',0),
-(519,'Goya',0),
-(520,'Magifuro Konnyaku',0),
-(521,'Alpha Alf Layla',0),
-(522,'Kasuga Mayu',0),
-(523,'trump',0),
-(524,'Nmasse',0),
-(525,'RED-RUM',0),
-(526,'Kito',0),
-(527,'Mumumu',0),
-(528,'Nyuuhin',0),
-(529,'Lucie',0),
-(530,'Messy',0),
-(531,'Kuraki Hiro',0),
-(532,'Somejima',0),
-(533,'Nippa Takahide',0),
-(534,'obmas',0),
-(535,'TRY',0),
-(536,'Rokusyou Kokuu',0),
-(537,'Waero',0),
-(538,'KANZUME',0),
-(539,'Koppamu',0),
-(540,'Shion',0),
-(541,'Suterii',0),
-(542,'Umetarou',0),
-(543,'Asahina Hikage',0),
-(544,'clover',0),
-(545,'Homare',0),
-(546,'Suruga Kuroitsu',0),
-(547,'Bu-chan',0),
-(548,'Fei',0),
-(549,'Hinahara Emi',0),
-(550,'Ohkami Ryosuke',0),
-(551,'Matsukawa',0),
-(552,'Suisen Toilet',0),
-(553,'DAWY',0),
-(554,'Shikitani Asuka',0),
-(555,'Misonou',0),
-(556,'OuchiKaeru',0),
-(557,'Nonaka Tama',0),
-(558,'Cool Kyou Shinja',0),
-(559,'Onomeshin',0),
-(560,'Ichihaya',0),
-(561,'Kobayashi Oukei',0),
-(562,'Tsukino Jyogi',0),
-(563,'Satou Kana',0),
-(564,'Saijou Satoru',0),
-(565,'Polinky',0),
-(566,'Nanao Yukiji',0),
-(567,'Nakano Sora',0),
-(568,'Musashimaru',0),
-(569,'Mozu',0),
-(570,'Kiryu Manzoku',0),
-(571,'Momoduki Suzu',0),
-(572,'Mojarin',0),
-(573,'Kotengu',0),
-(574,'Kasugano Tobari',0),
-(575,'Kamiya Zuzu',0),
-(576,'Kakao',0),
-(577,'Kaitenfude',0),
-(578,'Inoue Makito',0),
-(579,'DISTANCE',0),
-(580,'Ikuhana Niro',0),
-(581,'Hakui Ami | Ichinose Land',0),
-(582,'Ichigou',0),
-(583,'Homunculus',0),
-(584,'Hinasaki Yo',0),
-(585,'Hardboiled Yoshiko',0),
-(586,'Hamao',0),
-(587,'Hoyoyo',0),
-(588,'Honda Arima',0),
-(589,'Teri-Terio',0),
-(590,'Sagattoru',0),
-(591,'Sakiyo Cake | Sakiyoshi Tukune',0),
-(592,'Shaa',0),
-(593,'gy',0),
-(594,'Hazuki Yuuto',0),
-(595,'Eisuke',0),
-(596,'Sakuma Tsukasa',0),
-(597,'Tsuge Yasuna',0),
-(598,'Shiba Nanasei',0),
-(599,'Shinozuka Jouji',0),
-(600,'sorani',0),
-(601,'Tachibana Aruto',0),
-(602,'Taira Issui',0),
-(603,'Takashi',0),
-(604,'Rakko',0),
-(605,'Arsenal',0),
-(606,'Tsutsumi',0),
-(607,'Gin-Blade',0),
-(608,'Agawa Ryo',0),
-(609,'Norinko',0),
-(610,'Kamoshireya',0),
-(611,'Ooshima Ryou',0),
-(612,'ManbooRerere',0),
-(613,'Kusatsu Terunyo',0),
-(614,'Tamano Kedama',0),
-(615,'Kotee',0),
-(616,'Bontenkarasu',0),
-(617,'Hontoku',0),
-(618,'Bosshi',0),
-(619,'Yukian',0),
-(620,'UmiUshi',0),
-(621,'Tsukitokage',0),
-(622,'Nora Higuma',0),
-(623,'Maihara Matsuge',0),
-(624,'Seibee',0),
-(625,'Kiken Shisou',0),
-(626,'Chirumakuro',0),
-(627,'Oretto',0),
-(628,'Shiogochi',0),
-(629,'Kurisu',0),
-(630,'Himekuri',0),
-(631,'Kuno Touya',0),
-(632,'Kumoi Takashi',0),
-(633,'Shimazu Tekko',0),
-(634,'ISUTOSHI',0),
-(635,'Oobanburumai',0),
-(636,'Ashimoto Yoika',0),
-(637,'Takayuki Hiyori',0),
-(638,'Modaetei Imojirou',0),
-(639,'Modaetei Anetarou',0),
-(640,'Ueda John',0),
-(641,'Ogadenmon',0),
-(642,'SIRPENT',0),
-(643,'Wokasiya',0),
-(644,'Yutakame',0),
-(645,'PIero',0),
-(646,'FCT',0),
-(647,'Tamaki Nozomu',0),
-(648,'Monaka',0),
-(649,'Spiritus Tarou',0),
-(650,'Koza',0),
-(651,'Satetsu',0),
-(652,'Imotoka Tsuyuki',0),
-(653,'soda',0),
-(654,'Takurou',0),
-(655,'Giu',0),
-(656,'Michiking',0),
-(657,'Yuuki Hagure',0),
-(658,'Sioyaki Ayu',0),
-(659,'Takeyuu',0),
-(660,'Kitsuneko Anko',0),
-(661,'Ichitaka',0),
-(662,'Yukibuster-Z',0),
-(663,'Matsuri Miko',0),
-(664,'Shinogiri Zun',0),
-(665,'Hashida Mamoru',0),
-(666,'ABO',0),
-(667,'Kurokawa IZUMI',0),
-(668,'Clone Ningen',0),
-(669,'henrik',0),
-(670,'Take Calcium',0),
-(671,'Yukiusagi.',0),
-(672,'Akitsuchi Shien',0),
-(673,'Reitoumikan',0),
-(674,'Amulai',0),
-(675,'Kamelie',0),
-(676,'Syoukaki',0),
-(677,'Misaoka',0),
-(678,'YD',0),
-(679,'Moketa',0),
-(680,'Diisuke',0),
-(681,'Chouzetsu Bishoujo mine',0),
-(682,'Kujou Shirei',0),
-(683,'Mutsuki',0),
-(684,'Nanase Mizuho',0),
-(685,'Miyashita Miki',0),
-(686,'Yoshida Inuhito',0),
-(687,'7zu7',0),
-(688,'Tougarashi Hideyu',0),
-(689,'Shou-san Bouzu',0),
-(690,'Kazuma Muramasa',0),
-(691,'Asami Asami',0),
-(692,'Kitani Sai',0),
-(693,'Izumi Yuujiro',0),
-(694,'Isada',0),
-(695,'Midoh Tsukasa',0),
-(696,'Takane Nohana',0),
-(697,'Noi',0),
-(698,'Hanafuda Sakurano',0),
-(699,'Yukitaka',0),
-(700,'Kaenuco',0),
-(701,'Nanakagi Satoshi',0),
-(702,'Maeshima Ryou',0),
-(703,'Kasei',0),
-(704,'Miyamoto Liz',0),
-(705,'Kouri',0),
-(706,'Nanahara Fuyuki',0),
-(707,'Chipokan',0),
-(708,'Nukkoru',0),
-(709,'Ponsuke',0),
-(710,'Inukai',0),
-(711,'YASSY',0),
-(712,'Watanuki Ron',0),
-(713,'santa',0),
-(714,'Ikuya Daikokudou',0),
-(715,'Kuroharuto',0),
-(716,'Tsukiwani',0),
-(717,'Giuniu',0),
-(718,'Hirotake Awataka',0),
-(719,'Bon-3000',0),
-(720,'SAIGA dou',0),
-(721,'Electric_Dragon',0),
-(722,'Miyamoto Yuu',0),
-(723,'Ayakawa Riku',0),
-(724,'Yamamoto Zenzen',0),
-(725,'Shindou Hajime',0),
-(726,'Shinogi A-Suke',0),
-(727,'Haruharutei',0),
-(728,'Yoshimura Tatsumaki',0),
-(729,'Magatama',0),
-(730,'Nori',0),
-(731,'Maho',0),
-(732,'Maka Fushigi',0),
-(733,'Makinosaka Shin''ichi',0),
-(734,'Aiue Oka',0),
-(735,'Fukuyama Naoto',0),
-(736,'Kyockcho',0),
-(737,'Numa',0),
-(738,'Nora Shinji',0),
-(739,'Emua',0),
-(740,'Mucha',0),
-(741,'Mikami Hokuto',0),
-(742,'Okuni Yoshinobu',0),
-(743,'Kasumi',0),
-(744,'Tomohiro Kai',0),
-(745,'Uekan',0),
-(746,'Iwasaki Yuuki',0),
-(747,'Danbo',0),
-(748,'Miyano Kintarou',0),
-(749,'Noise',0),
-(750,'Souji Hougu',0),
-(751,'Tachibana Omina',0),
-(752,'Yuushi Tessen | Yuzu Machi',0),
-(753,'Izumi',0),
-(754,'Reizei',0),
-(755,'Himeno Mikan',0),
-(756,'Taropun',0),
-(757,'Nanjou Asuka',0),
-(758,'Paja',0),
-(759,'tokyo',0),
-(760,'atahuta',0),
-(761,'Powfoo',0),
-(762,'Shinoda Kazuhiro',0),
-(763,'Urakuso',0),
-(764,'Matsukasa',0),
-(765,'Sugayama',0),
-(766,'Kichirock',0),
-(767,'Mamezou',0),
-(768,'Koji',0),
-(769,'Key',0),
-(770,'Toudori',0),
-(771,'Dorachefu',0),
-(772,'Umekichi',0),
-(773,'Hideo',0),
-(774,'hr tsu',0),
-(775,'Chabo',0),
-(776,'Mitsudoue',0),
-(777,'Kinomoto Anzu',0),
-(778,'Tanishi',0),
-(779,'Etuzan Jakusui',0),
-(780,'Tsumetoro',0),
-(781,'Mizuyoukan',0),
-(782,'Misaki Yukihiro',0),
-(783,'Matsumoto Mitohi.',0),
-(784,'Tukinowagamo',0),
-(785,'Kimagu',0),
-(786,'Dorei Jackie',0),
-(787,'Takahama Tarou',0),
-(788,'Nekodanshaku',0),
-(789,'Ujiie Moku',0),
-(790,'Ogata Zen',0),
-(791,'Tsurui',0),
-(792,'hiro',0),
-(793,'Ginhaha',0),
-(794,'Nanao',0),
-(795,'Norakuro Nero',0),
-(796,'Tachibana Yuu',0),
-(797,'Kotatsu',0),
-(798,'Menyoujan',0),
-(799,'Sindoll',0),
-(800,'Nonki',0),
-(801,'Hoshino Ryuichi',0),
-(802,'Junkie',0),
-(803,'Mikami Cannon',0),
-(804,'yudg',0),
-(805,'MARUTA',0),
-(806,'doxy',0),
-(807,'Hitomasu Modoru',0),
-(808,'Dulce Q',0),
-(809,'Minority',0),
-(810,'Miyabi Tsuzuru',0),
-(811,'Minakami Sakura',0),
-(812,'Shimanto Shisakugata',0),
-(813,'ryoma',0),
-(814,'ro',0),
-(815,'Shika Yuno',0),
-(816,'Yoshiyuki',0),
-(817,'Cru',0),
-(818,'Arino Hiroshi',0),
-(819,'Tsubakiyama Parry',0),
-(820,'Shibari Kana',0),
-(821,'Lockheart',0),
-(822,'Izuki Jirou',0),
-(823,'Bismarcho',0),
-(824,'Yuya',0),
-(825,'Hakaba',0),
-(826,'Amayui Kisa',0),
-(827,'Wabara Hiro',0),
-(828,'Accho | Accio',0),
-(829,'Yaki Tomato',0),
-(830,'Amano Ameno',0),
-(831,'Kyougoku Shin',0),
-(832,'Campbell Gichou',0),
-(833,'Miitoban | Nikuman Umeew',0),
-(834,'Tekorun',0),
-(835,'Ame Arare',0),
-(836,'Yasui Riosuke',0),
-(837,'Mokufuu',0),
-(838,'momi',0),
-(839,'Goban',0),
-(840,'Kutani',0),
-(841,'Sakawaki Herodai',0),
-(842,'Hiyoshi Hana',0),
-(843,'Moyatto',0),
-(844,'Kemuri Haku',0),
-(845,'SAKULA',0),
-(846,'Yukimi',0),
-(847,'D@i',0),
-(848,'Hiura R',0),
-(849,'Harukichi',0),
-(850,'Fujiyama',0),
-(851,'Eguchi Jaws',0),
-(852,'Chika',0),
-(853,'Fooyuta',0),
-(854,'Sanwaribiki',0),
-(855,'Arekusa Mahone',0),
-(856,'7ten Paoki',0),
-(857,'bowcan',0),
-(858,'BeNantoka',0),
-(859,'Ban Kazuyasu',0),
-(860,'Ayuma Sayu',0),
-(861,'Ash Yokoshima',0),
-(862,'Aoi Miharu',0),
-(863,'Akuma',0),
-(864,'Akiya Akira',0),
-(865,'Yomogi Ringo',0),
-(866,'Mokkouyou Bond',0),
-(867,'SWA',0),
-(868,'Yuzuki N Dash',0),
-(869,'MAMO',0),
-(870,'U-hi',0),
-(871,'orico',0),
-(872,'Takuwan',0),
-(873,'Hairou',0),
-(874,'Akisu',0),
-(875,'Haitoku Sensei',0),
-(876,'Sakura Puchilo',0),
-(877,'Hisasi',0),
-(878,'Karube Giri',0),
-(879,'Kohsaka Donten',0),
-(880,'Konchiki',0),
-(881,'Maki Daikichi',0),
-(882,'Itou Ei',0),
-(883,'Aoi Hitori',0),
-(884,'Utamaro',0),
-(885,'Hakuyagen',0),
-(886,'Yamamoto Yoshifumi',0),
-(887,'Kintama Ookami',0),
-(888,'Suzurame',0),
-(889,'Lolicept',0),
-(890,'Oroneko',0),
-(891,'Ahemaru',0),
-(892,'Malcorond',0),
-(893,'Horieros',0),
-(894,'Kanbayashi Chiko',0),
-(895,'Mda Starou',0),
-(896,'108 Gou',0),
-(897,'Simon',0),
-(898,'Amazon',0),
-(899,'Nagai Wataru',0),
-(900,'Kotoba Ai',0),
-(901,'Fujishima Sei1go',0),
-(902,'Fishine',0),
-(903,'Ireading',0),
-(904,'Satozaki',0),
-(905,'Soramame-san',0),
-(906,'Suzushiro Nazuna',0),
-(907,'Syowmaru',0),
-(908,'Sakofu',0),
-(909,'Shinonome Ryu',0),
-(910,'Rokkaku Yasosuke',0),
-(911,'RAITA',0),
-(912,'Ashika',0),
-(913,'Horsetail',0),
-(914,'Korotsuke',0),
-(915,'Nokin',0),
-(916,'Noragami Souta',0),
-(917,'Nozi',0),
-(918,'Niimaru Yuu',0),
-(919,'Mutsuki Haru',0),
-(920,'Mutou Mato',0),
-(921,'Momoco',0),
-(922,'Mogudan',0),
-(923,'WLHO',0),
-(924,'Mikarin',0),
-(925,'MGMEE',0),
-(926,'SABUROU',0),
-(927,'Satuyo',0),
-(928,'Daichi',0),
-(929,'Sanrokumaru',0),
-(930,'Suzuki Dogezaemon',0),
-(931,'Mugen no Ossan',0),
-(932,'Mukoujima Tenro',0),
-(933,'wakamesan',0),
-(934,'Waves',0),
-(935,'Yamada Yuuya',0),
-(936,'Yuzuriha',0),
-(937,'zasha',0),
-(938,'Ushino Kandume',0),
-(939,'Toyo',0),
-(940,'Tetsuyama Kaya',0),
-(941,'Tabigarasu',0),
-(942,'Rou',0),
-(943,'Izayoi no Kiki',0),
-(944,'MUK',0),
-(945,'Kurokoshi You',0),
-(946,'Jorori',0),
-(947,'Narusawa Kei',0),
-(948,'Oomori Makoto',0),
-(949,'Minase Seri',0),
-(950,'Matsunoan',0),
-(951,'Sakurazari Hotori',0),
-(952,'Okara',0),
-(953,'Takemasa Takeshi',0),
-(954,'fu-ta',0),
-(955,'Emily',0),
-(956,'Kikaider Reijhiro',0),
-(957,'Reco',0),
-(958,'Shuten Douji',0),
-(959,'UNp',0),
-(960,'Naruhodo',0),
-(961,'Hiyo Hiyo',0),
-(962,'Kawaisaw',0),
-(963,'Yasha',0),
-(964,'Ikeshita Maue',0),
-(965,'ron',0),
-(966,'Nishida',0),
-(967,'MM',0),
-(968,'Lantana',0),
-(969,'Satou Souji',0),
-(970,'Ando Hiroyuki',0),
-(971,'Natsume Tsuna',0),
-(972,'Survival Knife',0),
-(973,'Nyu',0),
-(974,'ML',0),
-(975,'Shiokonbu',0),
-(976,'Usagi Nagomu',0),
-(977,'Itoh Kani',0),
-(978,'Vanilla Type',0),
-(979,'846gou',0),
-(980,'Ashima Takumi',0),
-(981,'soba',0),
-(982,'Gin Jyuji',0),
-(983,'Natsu no Oyatsu',0),
-(984,'Itami',0),
-(985,'Mizuiro Megane',0),
-(986,'Erutasuku',0),
-(987,'Gorgonzola',0),
-(988,'Rikka Kai',0),
-(989,'Carn',0),
-(990,'Carburetor',0),
-(991,'Yoshiie',0),
-(992,'Uno Ryoku',0),
-(993,'RCA',0),
-(994,'Woruto',0),
-(995,'Gui Fu Shen Nai',0),
-(996,'Ahemaru | henrik',0),
-(997,'Taro',0),
-(998,'Yokoyama Naoki',0),
-(999,'Kizaru',0),
-(1000,'gemu555',0),
-(1001,'Nuku Nuku Orange',0),
-(1002,'chin',0),
-(1003,'Ao Madousi',0),
-(1004,'Tsunamushi',0),
-(1005,'Inoue Nanaki',0),
-(1006,'Esora Koto',0),
-(1007,'Kobanya Koban',0),
-(1008,'Chipa',0),
-(1009,'Nectar',0),
-(1010,'Nekomata Naomi',0),
-(1011,'Toribami Sasami',0),
-(1012,'Akaiguppy',0),
-(1013,'Youta',0),
-(1014,'AZASUKE',0),
-(1015,'Eisen',0),
-(1016,'Yamanashi Yuuya',0),
-(1017,'Micchan',0),
-(1018,'Lemon Keiki',0),
-(1019,'Tenzen Miyabi',0),
-(1020,'Ekakibit',0),
-(1021,'Rakujin',0),
-(1022,'Shimimaru',0),
-(1023,'Onodera',0),
-(1024,'Juna Juna Juice',0),
-(1025,'SHUKO',0),
-(1026,'Nankai no Sizimi',0),
-(1027,'Sakomae Aichi',0),
-(1028,'Aogiri Penta',0),
-(1029,'Ryoji',0),
-(1030,'Sakurayu Haru',0),
-(1031,'Mizoguchi Gelatin',0),
-(1032,'Ameyama Denshin',0),
-(1033,'JP06',0),
-(1034,'Hidebou',0),
-(1035,'Toshiyuki',0),
-(1036,'Uradoori no Nukemichi',0),
-(1037,'Kamaros',0),
-(1038,'Rikose',0),
-(1039,'Blue_Gk',0),
-(1040,'Po-ju / Monty',0),
-(1041,'Kakkuu',0),
-(1042,'Komagata',0),
-(1043,'Gonzaburo',0),
-(1044,'Fujimaru',0),
-(1045,'Yokoshima Nikki',0),
-(1046,'Pirontan',0),
-(1047,'Ikematsu',0),
-(1048,'BLADE',0),
-(1049,'Mitsugi',0),
-(1050,'Haga Yui',0),
-(1051,'Oota Yuuichi',0),
-(1052,'Ichinomiya Yuu',0),
-(1053,'Morisugi',0),
-(1054,'Asaki Takayuki',0),
-(1055,'FAN',0),
-(1056,'aoin',0),
-(1057,'Mochi',0),
-(1058,'Tempo Gensui',0),
-(1059,'Miyabi',0),
-(1060,'Muneshiro',0),
-(1061,'PiyoPiyo',0),
-(1062,'dam',0),
-(1063,'Tanabe Kyou',0),
-(1064,'Ookawada Nan',0),
-(1065,'Izuminoaru',0),
-(1066,'Shinozaki Rei',0),
-(1067,'Michian Ruu',0),
-(1068,'Sage Joh',0),
-(1069,'Bota Mochito',0),
-(1070,'Doko Tetora',0),
-(1071,'Sarunote Isao',0),
-(1072,'EO Masaka',0),
-(1073,'Takeshi',0),
-(1074,'Greco Roman',0),
-(1075,'Carmine',0),
-(1076,'Misaka Nyuumen',0),
-(1077,'Poriuretan',0),
-(1078,'AKYS Honpo',0),
-(1079,'miya9',0),
-(1080,'Hattori Mitsuka',0),
-(1081,'Kauti',0),
-(1082,'Itou Yuuji',0),
-(1083,'Misao.',0),
-(1084,'EGAMI',0),
-(1085,'Haitukun',0),
-(1086,'Nekotasou',0),
-(1087,'Itou Life',0),
-(1088,'mmm',0),
-(1089,'Kamishiro Ryuu',0),
-(1090,'Azusa Norihee',0),
-(1091,'Edo Shigezu',0),
-(1092,'Menea the Dog',0),
-(1093,'Bizen',0),
-(1094,'Taji',0),
-(1095,'Katou Fuguo',0),
-(1096,'Fushoku',0),
-(1097,'Yukiyoshi Mamizu',0),
-(1098,'Tanaka Aji',0),
-(1099,'Mitsuru Nakata',0),
-(1100,'Acbin''s',0),
-(1101,'Kazakura',0),
-(1102,'Toilet Komoru',0),
-(1103,'Takanaga Kouhei',0),
-(1104,'Nme',0),
-(1105,'Yuki Tomoshi',0),
-(1106,'Petenshi',0),
-(1107,'Koto',0),
-(1108,'Shiroobi',0),
-(1109,'Eshimoto',0),
-(1110,'Unagimaru',0),
-(1111,'Minatoya Shunsaku',0),
-(1112,'Kai Maruko',0),
-(1113,'Yano Toshinori',0),
-(1114,'Kaiou',0),
-(1115,'Takaharu',0),
-(1116,'Setouchi Kurage',0),
-(1117,'Mikezoutei',0),
-(1118,'Araki Mitsuru',0),
-(1119,'Arumajiki',0),
-(1120,'Mimizu',0),
-(1121,'Enoshima Iki',0),
-(1122,'Darumasan Koronda',0),
-(1123,'Yukisiro Arte',0),
-(1124,'Ibukichi',0),
-(1125,'Usashiro Mani',0),
-(1126,'xxzero',0),
-(1127,'Yoshida',0),
-(1128,'Oryou',0),
-(1129,'Kitahara Eiji',0),
-(1130,'JACKASSS | Sorahati Midoro',0),
-(1131,'Inanaki Shiki',0),
-(1132,'Mimonel',0),
-(1133,'Akizora Momidi',0),
-(1134,'Uchi-Uchi Keyaki',0),
-(1135,'Gustav',0),
-(1136,'Gentsuki',0),
-(1137,'Hashimoto',0),
-(1138,'Ooyama Kina',0),
-(1139,'Kurona',0),
-(1140,'Asuhiro',0),
-(1141,'Kumano Tooru | Kumada',0),
-(1142,'Utatane Hiroyuki',0),
-(1143,'Shiashiya',0),
-(1144,'Kikuchi',0),
-(1145,'REI',0),
-(1146,'Haruno Suzune',0),
-(1147,'Iburo.',0),
-(1148,'Fumi Miyabi',0),
-(1149,'Tsukai You',0),
-(1150,'Picao',0),
-(1151,'Arui Ryou',0),
-(1152,'Tomose Shunsaku',0),
-(1153,'Kageshio',0),
-(1154,'Senbazuru',0),
-(1155,'UNIKURA',0),
-(1156,'Gunnjou',0),
-(1157,'Oshii Rei',0),
-(1158,'Sakai Ringo',0),
-(1159,'Shibuki Oroshi',0),
-(1160,'ShAKe',0),
-(1161,'Bifidus',0),
-(1162,'Son Yohsyu',0),
-(1163,'Asazuki Norito',0),
-(1164,'Koppori Nama Beer',0),
-(1165,'Oohira Sunset',0),
-(1166,'Aoi Manabu',0),
-(1167,'Negurie',0),
-(1168,'Yo-shu Ohepe',0),
-(1169,'Ootsuki Wataru',0),
-(1170,'Morimiya Masayuki',0),
-(1171,'Nishikawa Kou',0),
-(1172,'Takahashiya Takabee',0),
-(1173,'YOSHIKI | Endo Yoshiki',0),
-(1174,'Piririnegi',0),
-(1175,'EBA',0),
-(1176,'Ninoko',0),
-(1177,'Yukiyanagi',0),
-(1178,'Yuran',0),
-(1179,'Higashino Mikan',0),
-(1180,'Fuurai',0),
-(1181,'Shimetta Seiya',0),
-(1182,'Apocrine.',0),
-(1183,'Ponfaz',0),
-(1184,'Kawase Seiki',0),
-(1185,'J-MAX JAPAN',0),
-(1186,'Chonko',0),
-(1187,'Tukisiro Saya',0),
-(1188,'Natsumikan',0),
-(1189,'Saki Chisuzu',0),
-(1190,'Ryome Gantai',0),
-(1191,'Amamitu Kousuke',0),
-(1192,'Hori Hiroaki',0),
-(1193,'Zonda',0),
-(1194,'Ootsuka Reika',0),
-(1195,'Sankuro',0),
-(1196,'Kanno Takanori | Minamino Sazan',0),
-(1197,'Meganei',0),
-(1198,'Hakaishin',0),
-(1199,'Jino',0),
-(1200,'Chicken',0),
-(1201,'Hissatsukun',0),
-(1202,'Honryou Hanaru',0),
-(1203,'Tokie Hirohito',0),
-(1204,'Sasachinn',0),
-(1205,'Kanta.',0),
-(1206,'Pocchi',0),
-(1207,'Uguisu Kagura',0),
-(1208,'Dekosuke 18gou',0),
-(1209,'Saemon',0),
-(1210,'Iso Nogi',0),
-(1211,'Miyama',0),
-(1212,'Kazushi',0),
-(1213,'Rojione',0),
-(1214,'Hijiri Tsukasa',0),
-(1215,'Kizuka Kazuki',0),
-(1216,'Hirota',0),
-(1217,'Kawazuko Chouji',0),
-(1218,'Aoi Takayuki',0),
-(1219,'Okyuuri',0),
-(1220,'Mareo',0),
-(1221,'Ryo',0),
-(1222,'Art Post',0),
-(1223,'Harenochiame',0),
-(1224,'581',0),
-(1225,'Okino Matsushiro',0),
-(1226,'Hisama Kumako',0),
-(1227,'Summer',0),
-(1228,'Yoshiura Kazuya',0),
-(1229,'Takatsu | Takatsu Keita',0),
-(1230,'Haritama Hiroki',0),
-(1231,'Punita',0),
-(1232,'Shiraha Mato',0),
-(1233,'Shimao Kazu',0),
-(1234,'Souichi | Watanabe Souichi',0),
-(1235,'Tokiwa Midori',0),
-(1236,'Takenaka Hideo',0),
-(1237,'Hiru Okita',0),
-(1238,'Shirane Taito',0),
-(1239,'Leonard 16 Sei',0),
-(1240,'Shinkai',0),
-(1241,'St.germain-sal',0),
-(1242,'Kenpi',0),
-(1243,'nalvas',0),
-(1244,'H9',0),
-(1245,'Molokonomi | Hiraya Nobori',0),
-(1246,'Kousaka Jun',0),
-(1247,'Kogaku Kazuya',0),
-(1248,'Hatimoto',0),
-(1249,'Sameda Koban',0),
-(1250,'TRY | Hougen',0),
-(1251,'Sukiyoshi Shinji',0),
-(1252,'Maru.',0),
-(1253,'Kid',0),
-(1254,'Uron Rei',0),
-(1255,'Shigekix',0),
-(1256,'Yukiu Con',0),
-(1257,'Kirihara Yuu',0),
-(1258,'Maki Tatsuki',0),
-(1259,'Iketaki Ganguten',0),
-(1260,'Abe Manabu',0),
-(1261,'Barakey',0),
-(1262,'Uraha',0),
-(1263,'Sanom',0),
-(1264,'Uchuu Ika',0),
-(1265,'Harukaze Unipo',0),
-(1266,'Tama',0),
-(1267,'Kekocha',0),
-(1268,'VT',0),
-(1269,'Akai Mato',0),
-(1270,'Mushi',0),
-(1271,'Tsukimiya Tsutomu',0),
-(1272,'Takeda Aranobu',0),
-(1273,'Mizuki Haruto',0),
-(1274,'Mikawaya',0),
-(1275,'Suzutsuki Kurara',0),
-(1276,'Suzune Rai',0),
-(1277,'Hinotsuki Neko',0),
-(1278,'Kanyapyi',0),
-(1279,'Inue Shinsuke',0),
-(1280,'Opanchu',0),
-(1281,'Henrybird',0),
-(1282,'Haruhisky',0),
-(1283,'Yoshida Gorou',0),
-(1284,'Nabenco',0),
-(1285,'Gekka Kaguya',0),
-(1286,'Chinzurena',0),
-(1287,'Sakura Puchilo | Nanahoshi Suama',0),
-(1288,'Doskoinpo',0),
-(1289,'Tachiroku',0),
-(1290,'Akitsuki Karasu',0),
-(1291,'Anda',0),
-(1292,'Momio',0),
-(1293,'Hirno',0),
-(1294,'Naha 78',0),
-(1295,'Nimu',0),
-(1296,'Fukunaga Yukito',0),
-(1297,'Kimura Naoki',0),
-(1298,'Yuuki Homura',0),
-(1299,'Horitomo',0),
-(1300,'Yamayo',0),
-(1301,'Taniguchi-san',0),
-(1302,'bariun',0),
-(1303,'Kakenari',0),
-(1304,'Yuuka Kazami',0),
-(1305,'Utako',0),
-(1306,'Tenamaru',0),
-(1307,'Mizuyuki',0),
-(1308,'TrickSter',0),
-(1309,'Ikura Nagisa',0),
-(1310,'Yasuyuki',0),
-(1311,'Harasaki',0),
-(1312,'Kamitani',0),
-(1313,'Heigani',0),
-(1314,'Kirome',0),
-(1315,'Nunnu',0),
-(1316,'Kirisaki Byakko',0),
-(1317,'Haguruma',0),
-(1318,'Bizen Dorobune',0),
-(1319,'Metal Owl',0);
+(1,'Isao',0,2),
+(2,'Yojouhan Shobou',0,2),
+(3,'Shiwasu No Okina',0,4),
+(4,'Noumiso',0,1),
+(5,'Yamashita Kurowo',0,1),
+(6,'212',0,2),
+(7,'Yumeno Tanuki',0,2),
+(8,'Chiba Toshirou',0,4),
+(9,'Mikoyan',0,4),
+(10,'Sasamori Tomoe',0,9),
+(11,'Mizuryu Kei',0,29),
+(12,'Bubuzuke',0,3),
+(13,'SGK',0,2),
+(14,'ShindoL',0,12),
+(15,'Kamina Koharu',0,1),
+(16,'Uruujima Call',0,2),
+(17,'Gentle Sasaki',0,1),
+(18,'BANG-YOU | Didori',0,6),
+(19,'Shinkuu Tatsuya',0,2),
+(20,'KONKIT',0,4),
+(21,'Meme 50',0,7),
+(22,'Ribyuhki',0,4),
+(23,'Unou',0,2),
+(24,'Kei.',0,1),
+(25,'Butcha U',0,9),
+(26,'nuezou',0,5),
+(27,'Denki Shougun',0,1),
+(28,'Komusou',0,1),
+(29,'Kazuhiro',0,1),
+(30,'Orange Bull',0,1),
+(31,'WindArt',0,1),
+(32,'Z-Ton',0,9),
+(33,'Nemu',0,1),
+(34,'Mizone',0,15),
+(35,'Tamatsuyada',0,6),
+(36,'Satou Kimiatsu',0,6),
+(37,'Bonten',0,3),
+(38,'Tokimachi Eisei',0,8),
+(39,'Saranaru Takami',0,2),
+(40,'Orutoro',0,3),
+(41,'Morikoke',0,2),
+(42,'Akuochisukii Sensei',0,2),
+(43,'Koaya Aco',0,1),
+(44,'Erect Sawaru',0,2),
+(45,'Yuuki Ray',0,4),
+(46,'Jabara Tornado',0,2),
+(47,'hari',0,1),
+(48,'Ruuen Rouga',0,2),
+(49,'Kaitou Yuuhi',0,4),
+(50,'Jyura',0,8),
+(51,'luku',0,2),
+(52,'Pandain',0,1),
+(53,'Akutabin',0,1),
+(54,'Hakaba Yodomu',0,5),
+(55,'Soborogo',0,2),
+(56,'Peso',0,2),
+(57,'Dibi',0,14),
+(58,'Asanagi',0,9),
+(59,'Hikoma Hiroyuki',0,1),
+(60,'ooyun',0,1),
+(61,'Equal',0,1),
+(62,'Sahara Wataru',0,6),
+(63,'Pony R',0,1),
+(64,'Koume Keito',0,2),
+(65,'Nekometaru',0,1),
+(66,'TANABE',0,3),
+(67,'Ijima Yuu',0,2),
+(68,'Hroz',0,1),
+(69,'Nico Pun Nise',0,1),
+(70,'Jyoka',0,4),
+(71,'Mogiki Hayami',0,14),
+(72,'The Amanoja9',0,2),
+(73,'Booch',0,7),
+(74,'Jeanne DA''ck',0,6),
+(75,'SAVAN',0,3),
+(76,'Ao Banana',0,4),
+(77,'Hyouju Issei',0,1),
+(78,'Arinotowatari',0,3),
+(79,'Gegera Toshikazu',0,1),
+(80,'Kurotama',0,1),
+(81,'Kloah',0,2),
+(82,'Motsu Aki',0,6),
+(83,'Zhen Lu',0,1),
+(84,'Eno Yukimi',0,3),
+(85,'774 / Nanashi',0,5),
+(86,'Haru Yukiko',0,3),
+(87,'Ichiko',0,2),
+(88,'Jairou | Xil',0,3),
+(89,'Morishima Kon',0,6),
+(90,'Fue',0,1),
+(91,'Kishizuka Kenji',0,2),
+(92,'Momofuki Rio',0,4),
+(93,'Teterun',0,5),
+(94,'Usubeni Sakurako',0,1),
+(95,'sian',0,4),
+(96,'Uo Denim',0,5),
+(97,'Sakazaki Freddie',0,3),
+(98,'Ikameshi',0,3),
+(99,'Igumox',0,2),
+(100,'Fan no Hitori',0,12),
+(101,'Kito Sakeru',0,3),
+(102,'Satou Kuuki',0,2),
+(103,'Ten no Katsuraya',0,2),
+(104,'Aimaitei Umami',0,5),
+(105,'Yunioshi',0,6),
+(106,'Nishi Shizumu / Popuran',0,2),
+(107,'Sexyturkey',0,4),
+(108,'Tonnosuke',0,2),
+(109,'Morochin-san',0,1),
+(110,'Itsutsuse',0,1),
+(111,'Rama',0,3),
+(112,'Okumoto Yuuta',0,2),
+(113,'Marui Maru',0,11),
+(114,'mogg',0,7),
+(115,'Puyocha | YO',0,6),
+(116,'Kotoyoshi Yumisuke',0,1),
+(117,'Yamazaki Kana',0,1),
+(118,'HANABi',0,3),
+(119,'Enomoto Hidehira',0,1),
+(120,'ICHIGAN',0,1),
+(121,'Henkuma',0,6),
+(122,'John K. Pe-ta',0,27),
+(123,'Sugi G',0,9),
+(124,'Nekomimi Kanon',0,1),
+(125,'Aichi Shiho',0,8),
+(126,'Matashita Kintama',0,2),
+(127,'ishimura | ishimiso',0,2),
+(128,'ryuno',0,3),
+(129,'SOLOPIPB',0,1),
+(130,'Marimo',0,1),
+(131,'NOQ / Shimotsuki Juugo',0,1),
+(132,'Stealth Kaigyou',0,1),
+(133,'Jean Louis',0,3),
+(134,'Sakai Nayuta',0,1),
+(135,'Kuroneko Gata',0,1),
+(136,'Nokoppa',0,6),
+(137,'Migumigu',0,2),
+(138,'Karaage Toiu Mei no Inu',0,1),
+(139,'Wakino Yoshifumi (new)',0,1),
+(140,'JUNNY | Gantai Penguin',0,1),
+(141,'Korisei',0,1),
+(142,'Amane Hasuhito',0,1),
+(143,'Maririn',0,1),
+(144,'Ai Souji',0,1),
+(145,'Kouki Kuu',0,1),
+(146,'Kurokawa Otogi',0,1),
+(147,'Nukunuku',0,1),
+(148,'Mikemono Yuu',0,2),
+(149,'Akatsuki Kochi',0,1),
+(150,'Yumano Yuuki',0,1),
+(151,'Nikusoukyuu.',0,2),
+(152,'Suzuhane Suzu',0,4),
+(153,'Shimantogawa',0,2),
+(154,'Takunomi',0,1),
+(155,'Pochi.',0,6),
+(156,'mil',0,1),
+(157,'Yokkora',0,2),
+(158,'Atte7kusa',0,2),
+(159,'Kuroneko Smith',0,5),
+(160,'Takasugi Kou',0,4),
+(161,'Shigemiya Kyouhei',0,1),
+(162,'Minazuki Tsuyuha',0,1),
+(163,'Herio',0,4),
+(164,'LEYMEI',0,1),
+(165,'Blast',0,1),
+(166,'Natsume Eri',0,1),
+(167,'sugarBt',0,5),
+(168,'Shiki Takuto',0,1),
+(169,'stem',0,1),
+(170,'Seanji Sariel',0,1),
+(171,'Isawa Nohri',0,1),
+(172,'Kirin Kakeru',0,2),
+(173,'Shimaji',0,5),
+(174,'Sakurafubuki Nel',0,1),
+(175,'Katou Jun',0,4),
+(176,'Maruneko',0,1),
+(177,'Kemonono',0,1),
+(178,'Makigai Ikko',0,1),
+(179,'Danchino',0,2),
+(180,'Poccora',0,3),
+(181,'Kirimoto Yuuji',0,4),
+(182,'Ayano Naoto',0,1),
+(183,'Kemigawa Mondo',0,3),
+(184,'Tsubaki Jushiro',0,4),
+(185,'Kunaboto',0,4),
+(186,'R-Wade',0,2),
+(187,'Kotoko',0,2),
+(188,'Mifune Seijirou',0,4),
+(189,'Gengorou',0,2),
+(190,'Shiomaneki',0,3),
+(191,'Gesundheit',0,5),
+(192,'Hiroshiki',0,2),
+(193,'Usuki',0,1),
+(194,'Nagi Ichi',0,8),
+(195,'Jun',0,10),
+(196,'Konshin',0,2),
+(197,'Seto Yuki',0,4),
+(198,'Aji Pontarou',0,1),
+(199,'wotasu',0,1),
+(200,'Matsutou Tomoki',0,2),
+(201,'INAZUMA.',0,3),
+(202,'Tamanosuke',0,4),
+(203,'Shono Kotaro',0,1),
+(204,'aho / AHOBAKA',0,9),
+(205,'Takato Kurosuke',0,1),
+(206,'Hakkyou Daioujou',0,1),
+(207,'Suemitsu Dicca',0,2),
+(208,'Zanzi',0,3),
+(209,'Shinooka Homare',0,7),
+(210,'Chimosaku',0,2),
+(211,'Sugiura Sen',0,3),
+(212,'Kosuke Haruhito',0,2),
+(213,'Sumisuzu',0,1),
+(214,'Ajishio',0,2),
+(215,'Miyamoto Issa',0,4),
+(216,'Amagi Michihito',0,1),
+(217,'Hisui',0,3),
+(218,'Psycho Jenny',0,1),
+(219,'Suihei Sen',0,3),
+(220,'Una-don',0,2),
+(221,'Ketsuyuki Tamon',0,1),
+(222,'Iroito',0,1),
+(223,'Ootsuka Mahiro',0,6),
+(224,'Azukiko',0,2),
+(225,'Yomoyama Akira',0,1),
+(226,'MA-SA',0,2),
+(227,'Gumumu',0,1),
+(228,'Momoiro Manjiru',0,1),
+(229,'Kanaisei Jitenshasougyou',0,6),
+(230,'Kakashi Asahiro',0,4),
+(231,'Kakuzatou',0,3),
+(232,'Toumasu | Kanemaki Thomas',0,4),
+(233,'Kanten',0,2),
+(234,'Fumizuki Misoka',0,1),
+(235,'Kurenai Yuuji',0,4),
+(236,'Menoko',0,4),
+(237,'Okunoha',0,1),
+(238,'Momonosuke',0,4),
+(239,'Hozumi Kenji',0,2),
+(240,'ClownCulture',0,3),
+(241,'mega w',0,2),
+(242,'Kabuki Shigeyuki',0,1),
+(243,'Kamita',0,2),
+(244,'chunlieater',0,3),
+(245,'Shinama',0,3),
+(246,'Katase Minami',0,1),
+(247,'Katsurai Yoshiaki',0,3),
+(248,'Akiduki Akina',0,3),
+(249,'Mitarashi Kousei',0,20),
+(250,'Tachikawa Negoro',0,6),
+(251,'Aoi Masami',0,1),
+(252,'Kiya Shii',0,10),
+(253,'Minarai Zouhyou',0,1),
+(254,'Tsukiyo',0,1),
+(255,'Kasuga Tousen',0,1),
+(256,'Kasuga',0,1),
+(257,'Tarakan',0,1),
+(258,'Tenken',0,1),
+(259,'Aoi Nagisa',0,3),
+(260,'Tomonaga Kenji',0,1),
+(261,'uraura',0,2),
+(262,'Makari Tohru',0,12),
+(263,'Dagashi',0,2),
+(264,'bobobo',0,10),
+(265,'Azuma Tesshin',0,4),
+(266,'Atage',0,3),
+(267,'Ashiomi Masato',0,4),
+(268,'Akino Sora',0,7),
+(269,'Akagi Asahito',0,3),
+(270,'Minami',0,2),
+(271,'Karoti',0,1),
+(272,'Uehasu',0,3),
+(273,'Kanetsuki Masayoshi',0,1),
+(274,'Kiriyama Taichi',0,1),
+(275,'Motsu',0,6),
+(276,'Sunagawa Tara',0,5),
+(277,'Neromashin',0,9),
+(278,'Aki Matsuri',0,1),
+(279,'Doumou',0,5),
+(280,'Amatake Akewo',0,14),
+(281,'Mahiruno Kagerou',0,2),
+(282,'Dozamura',0,3),
+(283,'Maguro Teikoku',0,4),
+(284,'Numahana',0,3),
+(285,'Daigo',0,2),
+(286,'Mayonnaise.',0,8),
+(287,'Karma Tatsurou',0,4),
+(288,'Gura Nyuutou',0,1),
+(289,'Inoue Kiyoshirou',0,2),
+(290,'Isako Rokurou',0,1),
+(291,'Dynamite Moca',0,4),
+(292,'Kai Hiroyuki',0,2),
+(293,'Matsumoto Katsuya',0,4),
+(294,'Soine',0,1),
+(295,'Takatsu',0,12),
+(296,'Nakagami Takashi',0,1),
+(297,'nenemaru',0,2),
+(298,'Yuugiri',0,2),
+(299,'Martan',0,4),
+(300,'Mine Mura',0,5),
+(301,'Collagen',0,4),
+(302,'Double Deck',0,1),
+(303,'Scotch',0,3),
+(304,'Ishikawa Shisuke',0,2),
+(305,'Muronaga Chaashuu',0,5),
+(306,'Chinbotsu',0,17),
+(307,'Rebis',0,32),
+(308,'KEN',0,5),
+(309,'Kishikaisei',0,1),
+(310,'Kakugari Kyoudai',0,8),
+(311,'Katou Chakichi',0,12),
+(312,'Agata',0,6),
+(313,'zunta',0,1),
+(314,'Takase Yuu',0,3),
+(315,'GENSHI',0,1),
+(316,'Tamagoro',0,9),
+(317,'Inari',0,7),
+(318,'Gujira',0,9),
+(319,'DATE',0,3),
+(320,'Kuroiwa Menou',0,6),
+(321,'ElectricSheep',0,1),
+(322,'Dairoku Tenmaou Great',0,1),
+(323,'JACKASSS',0,1),
+(324,'Ookubo Matagi',0,2),
+(325,'Nezumi',0,2),
+(326,'Q Doukei',0,2),
+(327,'Sannyuutei Shinta',0,1),
+(328,'Kishinosato Satoshi',0,1),
+(329,'Sawada Daisuke',0,2),
+(330,'Wamusato Haru',0,4),
+(331,'Fujihan',0,1),
+(332,'Coconoe Ricoco',0,1),
+(333,'Zenra QQ',0,11),
+(334,'Riko',0,1),
+(335,'Saigado',0,8),
+(336,'NemuNemu',0,9),
+(337,'Erodezain Koubou',0,3),
+(338,'Buchou Chinke',0,2),
+(339,'Toguchi Masaya',0,2),
+(340,'locon',0,5),
+(341,'Deep Valley',0,1),
+(342,'Tonikaku',0,7),
+(343,'Blmanian',0,3),
+(344,'Haikawa Hemlen',0,5),
+(345,'Makurou',0,3),
+(346,'kinntarou',0,2),
+(347,'Karasu',0,3),
+(348,'Mizuyan',0,1),
+(349,'Musashino Sekai',0,9),
+(350,'Nyuu',0,1),
+(351,'Cr-R',0,1),
+(352,'Kizuki Rei',0,2),
+(353,'Nagashima Chousuke',0,1),
+(354,'Fuetakishi',0,5),
+(355,'Chinzuriina',0,5),
+(356,'Bajou Takurou',0,1),
+(357,'Shindou',0,9),
+(358,'Sakaki Utamaru',0,1),
+(359,'Kusui Aruta',0,1),
+(360,'Mikuni Mizuki',0,3),
+(361,'Saiyazumi',0,2),
+(362,'type.90',0,4),
+(363,'Fukumaaya',0,4),
+(364,'RADIOHEAD',0,1),
+(365,'Nise',0,1),
+(366,'Wanao',0,1),
+(367,'Psycho',0,1),
+(368,'Akazawa RED',0,4),
+(369,'Nyx',0,1),
+(370,'Sabusuka',0,1),
+(371,'Sugar Milk',0,3),
+(372,'Akikusa Peperon',0,3),
+(373,'Zucchini',0,2),
+(374,'Abubu',0,3),
+(375,'Kuroshiki',0,7),
+(376,'Nakamura Regura',0,3),
+(377,'Heiqing Langjun',0,1),
+(378,'Otoo',0,2),
+(379,'Tokisana',0,1),
+(380,'Shotenin Matori',0,1),
+(381,'Amatarou',0,1),
+(382,'Gen',0,1),
+(383,'Bundosuiko',0,2),
+(384,'SeN',0,3),
+(385,'Karei | Hirame',0,1),
+(386,'Takemura Sesshu',0,3),
+(387,'Orikuchi',0,1),
+(388,'Jingrock',0,2),
+(389,'Tomotsuka Haruomi',0,1),
+(390,'Uesugi Kyoushirou',0,1),
+(391,'Tsuttsu',0,1),
+(392,'Itou Eight',0,5),
+(393,'Kikunosukemaru',0,3),
+(394,'TEL',0,1),
+(395,'Jitsuma',0,1),
+(396,'Tokoyo Akashi',0,2),
+(397,'Amano Kazumi',0,1),
+(398,'Aoki Kanji',0,2),
+(399,'Dynamite Kit',0,1),
+(400,'Suzuki Akoni',0,1),
+(401,'Otochichi',0,17),
+(402,'Rocket Monkey',0,1),
+(403,'Oouso',0,3),
+(404,'Shirota Dai',0,1),
+(405,'Kanimaru',0,1),
+(406,'Drill Jill',0,1),
+(407,'Ere 2 Earo',0,1),
+(408,'Yamada Gogogo',0,1),
+(409,'Royal Koyanagi',0,2),
+(410,'Jinsuke',0,1),
+(411,'Azi Dahaka',0,1),
+(412,'makki',0,1),
+(413,'Denkichi',0,2),
+(414,'Taihei Tengoku',0,2),
+(415,'Porika',0,1),
+(416,'Ulrich',0,1),
+(417,'Takahashi Note',0,2),
+(418,'Aoyama Akira',0,1),
+(419,'Napata',0,6),
+(420,'majoccoid',0,1),
+(421,'Umakuchi Shouyu',0,1),
+(422,'E-Musu Aki',0,2),
+(423,'kanbe',0,4),
+(424,'utu',0,7),
+(425,'Coin RAND',0,3),
+(426,'Palco Nagashima',0,7),
+(427,'Soranosuzume',0,2),
+(428,'Hanamaki Kaeru',0,10),
+(429,'Amu',0,2),
+(430,'Odd',0,1),
+(431,'Ayato Ayari',0,5),
+(432,'Inochi Wazuka',0,9),
+(433,'Akatsuki Myuuto',0,1),
+(434,'Thomas',0,2),
+(435,'Minamida Usuke',0,4),
+(436,'Shinagawa Mikuzu',0,2),
+(437,'Kuroiwa Madoka',0,1),
+(438,'Murasaki☆Nyaa',0,2),
+(439,'Pija',0,3),
+(440,'Runrun',0,3),
+(441,'RIR',0,2),
+(442,'Shiroo',0,2),
+(443,'Kiyokawa Nijiko',0,1),
+(444,'Sugaishi',0,2),
+(445,'Yumoteliuce',0,4),
+(446,'144',0,2),
+(447,'Yosuke',0,1),
+(448,'Akitsuki Itsuki',0,2),
+(449,'Maumen',0,3),
+(450,'Rico',0,3),
+(451,'Toritora',0,1),
+(452,'Hyji',0,3),
+(453,'Ozy',0,3),
+(454,'13.',0,3),
+(455,'Bakuya',0,2),
+(456,'Nishi Iori',0,2),
+(457,'Shinozuka Yuuji',0,2),
+(458,'CyoCyoPolice',0,1),
+(459,'Erotibot',0,1),
+(460,'Shomu',0,2),
+(461,'Mafuyu Hemp',0,1),
+(462,'Akatsuki Katsuie',0,2),
+(463,'Mizusaki.',0,1),
+(464,'Meicha',0,2),
+(465,'Saida Kazuaki',0,2),
+(466,'Sanbaizu',0,1),
+(467,'Ogata Mamimi',0,2),
+(468,'Navier Haruka 2T',0,5),
+(469,'Nise Kurosaki',0,1),
+(470,'Aian',0,5),
+(471,'Hinahara Yashiki',0,1),
+(472,'Kousuke',0,3),
+(473,'Nanamatsu Kenji',0,6),
+(474,'Omecho',0,5),
+(475,'Binto',0,7),
+(476,'Soundvillage',0,5),
+(477,'Hayuta',0,1),
+(478,'Tsukuru',0,5),
+(479,'Kuroishi Ringo',0,1),
+(480,'Kozi',0,3),
+(481,'Shuffle',0,3),
+(482,'Nyorutarou',0,1),
+(483,'Ikezaki Misa',0,3),
+(484,'Komezawa',0,3),
+(485,'Satome',0,1),
+(486,'Takayama Non',0,1),
+(487,'Wataya',0,2),
+(488,'Yuzuha',0,1),
+(489,'Mario',0,6),
+(490,'Kanbayashi Takaki',0,3),
+(491,'Amin',0,1),
+(492,'Naokame',0,1),
+(493,'Aoiro Ichigou',0,1),
+(494,'KONBOI',0,2),
+(495,'Kougami Eri',0,1),
+(496,'Shinya',0,2),
+(497,'Hayashida Toranosuke',0,2),
+(498,'Ichimura',0,1),
+(499,'Binbi',0,1),
+(500,'Chiku',0,1),
+(501,'Necrosmos',0,3),
+(502,'NONAME',0,1),
+(503,'Negishiomeron',0,1),
+(504,'Shibusawa Hayato',0,1),
+(505,'Magenta Rose',0,1),
+(506,'Gomabura',0,2),
+(507,'Lew',0,3),
+(508,'Akiha@',0,1),
+(509,'Makuro',0,1),
+(510,'Namiko',0,1),
+(511,'Tomatojigoku',0,1),
+(512,'Minokichi',0,2),
+(513,'Herohero Tom',0,2),
+(514,'Isaki',0,1),
+(515,'Matou',0,2),
+(516,'Kira Hiroyoshi',0,1),
+(517,'ICE',0,1),
+(518,'Obyaa',0,4),
+(519,'Goya',0,1),
+(520,'Magifuro Konnyaku',0,8),
+(521,'Alpha Alf Layla',0,4),
+(522,'Kasuga Mayu',0,2),
+(523,'trump',0,4),
+(524,'Nmasse',0,3),
+(525,'RED-RUM',0,1),
+(526,'Kito',0,1),
+(527,'Mumumu',0,4),
+(528,'Nyuuhin',0,1),
+(529,'Lucie',0,1),
+(530,'Messy',0,1),
+(531,'Kuraki Hiro',0,1),
+(532,'Somejima',0,1),
+(533,'Nippa Takahide',0,2),
+(534,'obmas',0,5),
+(535,'TRY',0,1),
+(536,'Rokusyou Kokuu',0,1),
+(537,'Waero',0,1),
+(538,'KANZUME',0,2),
+(539,'Koppamu',0,1),
+(540,'Shion',0,1),
+(541,'Suterii',0,1),
+(542,'Umetarou',0,1),
+(543,'Asahina Hikage',0,2),
+(544,'clover',0,2),
+(545,'Homare',0,2),
+(546,'Suruga Kuroitsu',0,2),
+(547,'Bu-chan',0,2),
+(548,'Fei',0,1),
+(549,'Hinahara Emi',0,1),
+(550,'Ohkami Ryosuke',0,1),
+(551,'Matsukawa',0,1),
+(552,'Suisen Toilet',0,1),
+(553,'DAWY',0,1),
+(554,'Shikitani Asuka',0,1),
+(555,'Misonou',0,2),
+(556,'OuchiKaeru',0,1),
+(557,'Nonaka Tama',0,1),
+(558,'Cool Kyou Shinja',0,1),
+(559,'Onomeshin',0,4),
+(560,'Ichihaya',0,4),
+(561,'Kobayashi Oukei',0,2),
+(562,'Tsukino Jyogi',0,3),
+(563,'Satou Kana',0,1),
+(564,'Saijou Satoru',0,1),
+(565,'Polinky',0,3),
+(566,'Nanao Yukiji',0,3),
+(567,'Nakano Sora',0,7),
+(568,'Musashimaru',0,1),
+(569,'Mozu',0,2),
+(570,'Kiryu Manzoku',0,1),
+(571,'Momoduki Suzu',0,1),
+(572,'Mojarin',0,2),
+(573,'Kotengu',0,1),
+(574,'Kasugano Tobari',0,1),
+(575,'Kamiya Zuzu',0,3),
+(576,'Kakao',0,1),
+(577,'Kaitenfude',0,2),
+(578,'Inoue Makito',0,1),
+(579,'DISTANCE',0,2),
+(580,'Ikuhana Niro',0,1),
+(581,'Hakui Ami | Ichinose Land',0,2),
+(582,'Ichigou',0,1),
+(583,'Homunculus',0,2),
+(584,'Hinasaki Yo',0,1),
+(585,'Hardboiled Yoshiko',0,1),
+(586,'Hamao',0,2),
+(587,'Hoyoyo',0,5),
+(588,'Honda Arima',0,1),
+(589,'Teri-Terio',0,2),
+(590,'Sagattoru',0,1),
+(591,'Sakiyo Cake | Sakiyoshi Tukune',0,1),
+(592,'Shaa',0,1),
+(593,'gy',0,3),
+(594,'Hazuki Yuuto',0,2),
+(595,'Eisuke',0,2),
+(596,'Sakuma Tsukasa',0,1),
+(597,'Tsuge Yasuna',0,1),
+(598,'Shiba Nanasei',0,2),
+(599,'Shinozuka Jouji',0,1),
+(600,'sorani',0,2),
+(601,'Tachibana Aruto',0,2),
+(602,'Taira Issui',0,2),
+(603,'Takashi',0,3),
+(604,'Rakko',0,1),
+(605,'Arsenal',0,1),
+(606,'Tsutsumi',0,1),
+(607,'Gin-Blade',0,1),
+(608,'Agawa Ryo',0,2),
+(609,'Norinko',0,2),
+(610,'Kamoshireya',0,1),
+(611,'Ooshima Ryou',0,1),
+(612,'ManbooRerere',0,1),
+(613,'Kusatsu Terunyo',0,2),
+(614,'Tamano Kedama',0,3),
+(615,'Kotee',0,1),
+(616,'Bontenkarasu',0,2),
+(617,'Hontoku',0,3),
+(618,'Bosshi',0,1),
+(619,'Yukian',0,1),
+(620,'UmiUshi',0,1),
+(621,'Tsukitokage',0,3),
+(622,'Nora Higuma',0,1),
+(623,'Maihara Matsuge',0,2),
+(624,'Seibee',0,1),
+(625,'Kiken Shisou',0,1),
+(626,'Chirumakuro',0,6),
+(627,'Oretto',0,3),
+(628,'Shiogochi',0,5),
+(629,'Kurisu',0,6),
+(630,'Himekuri',0,1),
+(631,'Kuno Touya',0,1),
+(632,'Kumoi Takashi',0,1),
+(633,'Shimazu Tekko',0,1),
+(634,'ISUTOSHI',0,1),
+(635,'Oobanburumai',0,1),
+(636,'Ashimoto Yoika',0,1),
+(637,'Takayuki Hiyori',0,2),
+(638,'Modaetei Imojirou',0,1),
+(639,'Modaetei Anetarou',0,1),
+(640,'Ueda John',0,1),
+(641,'Ogadenmon',0,2),
+(642,'SIRPENT',0,6),
+(643,'Wokasiya',0,1),
+(644,'Yutakame',0,1),
+(645,'PIero',0,3),
+(646,'FCT',0,1),
+(647,'Tamaki Nozomu',0,2),
+(648,'Monaka',0,3),
+(649,'Spiritus Tarou',0,4),
+(650,'Koza',0,3),
+(651,'Satetsu',0,4),
+(652,'Imotoka Tsuyuki',0,1),
+(653,'soda',0,1),
+(654,'Takurou',0,1),
+(655,'Giu',0,1),
+(656,'Michiking',0,3),
+(657,'Yuuki Hagure',0,1),
+(658,'Sioyaki Ayu',0,1),
+(659,'Takeyuu',0,1),
+(660,'Kitsuneko Anko',0,1),
+(661,'Ichitaka',0,1),
+(662,'Yukibuster-Z',0,2),
+(663,'Matsuri Miko',0,1),
+(664,'Shinogiri Zun',0,1),
+(665,'Hashida Mamoru',0,1),
+(666,'ABO',0,1),
+(667,'Kurokawa IZUMI',0,1),
+(668,'Clone Ningen',0,2),
+(669,'henrik',0,1),
+(670,'Take Calcium',0,1),
+(671,'Yukiusagi.',0,2),
+(672,'Akitsuchi Shien',0,2),
+(673,'Reitoumikan',0,2),
+(674,'Amulai',0,1),
+(675,'Kamelie',0,1),
+(676,'Syoukaki',0,5),
+(677,'Misaoka',0,2),
+(678,'YD',0,3),
+(679,'Moketa',0,1),
+(680,'Diisuke',0,2),
+(681,'Chouzetsu Bishoujo mine',0,1),
+(682,'Kujou Shirei',0,1),
+(683,'Mutsuki',0,1),
+(684,'Nanase Mizuho',0,2),
+(685,'Miyashita Miki',0,1),
+(686,'Yoshida Inuhito',0,2),
+(687,'7zu7',0,1),
+(688,'Tougarashi Hideyu',0,3),
+(689,'Shou-san Bouzu',0,5),
+(690,'Kazuma Muramasa',0,1),
+(691,'Asami Asami',0,1),
+(692,'Kitani Sai',0,1),
+(693,'Izumi Yuujiro',0,1),
+(694,'Isada',0,1),
+(695,'Midoh Tsukasa',0,1),
+(696,'Takane Nohana',0,1),
+(697,'Noi',0,1),
+(698,'Hanafuda Sakurano',0,1),
+(699,'Yukitaka',0,1),
+(700,'Kaenuco',0,2),
+(701,'Nanakagi Satoshi',0,7),
+(702,'Maeshima Ryou',0,5),
+(703,'Kasei',0,1),
+(704,'Miyamoto Liz',0,1),
+(705,'Kouri',0,1),
+(706,'Nanahara Fuyuki',0,3),
+(707,'Chipokan',0,1),
+(708,'Nukkoru',0,1),
+(709,'Ponsuke',0,1),
+(710,'Inukai',0,1),
+(711,'YASSY',0,1),
+(712,'Watanuki Ron',0,2),
+(713,'santa',0,2),
+(714,'Ikuya Daikokudou',0,1),
+(715,'Kuroharuto',0,1),
+(716,'Tsukiwani',0,1),
+(717,'Giuniu',0,1),
+(718,'Hirotake Awataka',0,1),
+(719,'Bon-3000',0,1),
+(720,'SAIGA dou',0,1),
+(721,'Electric_Dragon',0,1),
+(722,'Miyamoto Yuu',0,1),
+(723,'Ayakawa Riku',0,2),
+(724,'Yamamoto Zenzen',0,1),
+(725,'Shindou Hajime',0,3),
+(726,'Shinogi A-Suke',0,1),
+(727,'Haruharutei',0,2),
+(728,'Yoshimura Tatsumaki',0,2),
+(729,'Magatama',0,1),
+(730,'Nori',0,1),
+(731,'Maho',0,2),
+(732,'Maka Fushigi',0,17),
+(733,'Makinosaka Shin''ichi',0,4),
+(734,'Aiue Oka',0,7),
+(735,'Fukuyama Naoto',0,3),
+(736,'Kyockcho',0,3),
+(737,'Numa',0,1),
+(738,'Nora Shinji',0,1),
+(739,'Emua',0,4),
+(740,'Mucha',0,1),
+(741,'Mikami Hokuto',0,1),
+(742,'Okuni Yoshinobu',0,1),
+(743,'Kasumi',0,1),
+(744,'Tomohiro Kai',0,2),
+(745,'Uekan',0,3),
+(746,'Iwasaki Yuuki',0,2),
+(747,'Danbo',0,1),
+(748,'Miyano Kintarou',0,1),
+(749,'Noise',0,3),
+(750,'Souji Hougu',0,1),
+(751,'Tachibana Omina',0,3),
+(752,'Yuushi Tessen | Yuzu Machi',0,9),
+(753,'Izumi',0,1),
+(754,'Reizei',0,1),
+(755,'Himeno Mikan',0,1),
+(756,'Taropun',0,1),
+(757,'Nanjou Asuka',0,2),
+(758,'Paja',0,2),
+(759,'tokyo',0,3),
+(760,'atahuta',0,1),
+(761,'Powfoo',0,3),
+(762,'Shinoda Kazuhiro',0,1),
+(763,'Urakuso',0,2),
+(764,'Matsukasa',0,1),
+(765,'Sugayama',0,1),
+(766,'Kichirock',0,1),
+(767,'Mamezou',0,2),
+(768,'Koji',0,1),
+(769,'Key',0,2),
+(770,'Toudori',0,3),
+(771,'Dorachefu',0,2),
+(772,'Umekichi',0,3),
+(773,'Hideo',0,4),
+(774,'hr tsu',0,1),
+(775,'Chabo',0,1),
+(776,'Mitsudoue',0,1),
+(777,'Kinomoto Anzu',0,1),
+(778,'Tanishi',0,3),
+(779,'Etuzan Jakusui',0,6),
+(780,'Tsumetoro',0,3),
+(781,'Mizuyoukan',0,1),
+(782,'Misaki Yukihiro',0,2),
+(783,'Matsumoto Mitohi.',0,3),
+(784,'Tukinowagamo',0,2),
+(785,'Kimagu',0,1),
+(786,'Dorei Jackie',0,1),
+(787,'Takahama Tarou',0,1),
+(788,'Nekodanshaku',0,2),
+(789,'Ujiie Moku',0,1),
+(790,'Ogata Zen',0,2),
+(791,'Tsurui',0,2),
+(792,'hiro',0,1),
+(793,'Ginhaha',0,2),
+(794,'Nanao',0,4),
+(795,'Norakuro Nero',0,3),
+(796,'Tachibana Yuu',0,1),
+(797,'Kotatsu',0,1),
+(798,'Menyoujan',0,1),
+(799,'Sindoll',0,1),
+(800,'Nonki',0,1),
+(801,'Hoshino Ryuichi',0,1),
+(802,'Junkie',0,1),
+(803,'Mikami Cannon',0,1),
+(804,'yudg',0,1),
+(805,'MARUTA',0,2),
+(806,'doxy',0,1),
+(807,'Hitomasu Modoru',0,1),
+(808,'Dulce Q',0,1),
+(809,'Minority',0,1),
+(810,'Miyabi Tsuzuru',0,1),
+(811,'Minakami Sakura',0,1),
+(812,'Shimanto Shisakugata',0,2),
+(813,'ryoma',0,2),
+(814,'ro',0,2),
+(815,'Shika Yuno',0,1),
+(816,'Yoshiyuki',0,1),
+(817,'Cru',0,1),
+(818,'Arino Hiroshi',0,1),
+(819,'Tsubakiyama Parry',0,1),
+(820,'Shibari Kana',0,1),
+(821,'Lockheart',0,1),
+(822,'Izuki Jirou',0,1),
+(823,'Bismarcho',0,1),
+(824,'Yuya',0,1),
+(825,'Hakaba',0,1),
+(826,'Amayui Kisa',0,1),
+(827,'Wabara Hiro',0,1),
+(828,'Accho | Accio',0,1),
+(829,'Yaki Tomato',0,1),
+(830,'Amano Ameno',0,1),
+(831,'Kyougoku Shin',0,1),
+(832,'Campbell Gichou',0,1),
+(833,'Miitoban | Nikuman Umeew',0,5),
+(834,'Tekorun',0,2),
+(835,'Ame Arare',0,1),
+(836,'Yasui Riosuke',0,1),
+(837,'Mokufuu',0,1),
+(838,'momi',0,2),
+(839,'Goban',0,1),
+(840,'Kutani',0,1),
+(841,'Sakawaki Herodai',0,1),
+(842,'Hiyoshi Hana',0,1),
+(843,'Moyatto',0,1),
+(844,'Kemuri Haku',0,3),
+(845,'SAKULA',0,4),
+(846,'Yukimi',0,2),
+(847,'D@i',0,4),
+(848,'Hiura R',0,1),
+(849,'Harukichi',0,1),
+(850,'Fujiyama',0,1),
+(851,'Eguchi Jaws',0,1),
+(852,'Chika',0,1),
+(853,'Fooyuta',0,1),
+(854,'Sanwaribiki',0,1),
+(855,'Arekusa Mahone',0,1),
+(856,'7ten Paoki',0,1),
+(857,'bowcan',0,1),
+(858,'BeNantoka',0,1),
+(859,'Ban Kazuyasu',0,1),
+(860,'Ayuma Sayu',0,1),
+(861,'Ash Yokoshima',0,1),
+(862,'Aoi Miharu',0,1),
+(863,'Akuma',0,3),
+(864,'Akiya Akira',0,1),
+(865,'Yomogi Ringo',0,1),
+(866,'Mokkouyou Bond',0,1),
+(867,'SWA',0,1),
+(868,'Yuzuki N Dash',0,1),
+(869,'MAMO',0,1),
+(870,'U-hi',0,1),
+(871,'orico',0,2),
+(872,'Takuwan',0,1),
+(873,'Hairou',0,1),
+(874,'Akisu',0,1),
+(875,'Haitoku Sensei',0,4),
+(876,'Sakura Puchilo',0,3),
+(877,'Hisasi',0,1),
+(878,'Karube Giri',0,1),
+(879,'Kohsaka Donten',0,1),
+(880,'Konchiki',0,2),
+(881,'Maki Daikichi',0,1),
+(882,'Itou Ei',0,1),
+(883,'Aoi Hitori',0,2),
+(884,'Utamaro',0,1),
+(885,'Hakuyagen',0,1),
+(886,'Yamamoto Yoshifumi',0,2),
+(887,'Kintama Ookami',0,1),
+(888,'Suzurame',0,1),
+(889,'Lolicept',0,4),
+(890,'Oroneko',0,5),
+(891,'Ahemaru',0,1),
+(892,'Malcorond',0,1),
+(893,'Horieros',0,1),
+(894,'Kanbayashi Chiko',0,1),
+(895,'Mda Starou',0,4),
+(896,'108 Gou',0,1),
+(897,'Simon',0,2),
+(898,'Amazon',0,1),
+(899,'Nagai Wataru',0,1),
+(900,'Kotoba Ai',0,1),
+(901,'Fujishima Sei1go',0,1),
+(902,'Fishine',0,1),
+(903,'Ireading',0,1),
+(904,'Satozaki',0,1),
+(905,'Soramame-san',0,2),
+(906,'Suzushiro Nazuna',0,1),
+(907,'Syowmaru',0,2),
+(908,'Sakofu',0,1),
+(909,'Shinonome Ryu',0,2),
+(910,'Rokkaku Yasosuke',0,2),
+(911,'RAITA',0,1),
+(912,'Ashika',0,1),
+(913,'Horsetail',0,1),
+(914,'Korotsuke',0,2),
+(915,'Nokin',0,1),
+(916,'Noragami Souta',0,1),
+(917,'Nozi',0,1),
+(918,'Niimaru Yuu',0,1),
+(919,'Mutsuki Haru',0,2),
+(920,'Mutou Mato',0,2),
+(921,'Momoco',0,1),
+(922,'Mogudan',0,4),
+(923,'WLHO',0,1),
+(924,'Mikarin',0,1),
+(925,'MGMEE',0,1),
+(926,'SABUROU',0,1),
+(927,'Satuyo',0,1),
+(928,'Daichi',0,1),
+(929,'Sanrokumaru',0,1),
+(930,'Suzuki Dogezaemon',0,1),
+(931,'Mugen no Ossan',0,1),
+(932,'Mukoujima Tenro',0,2),
+(933,'wakamesan',0,5),
+(934,'Waves',0,2),
+(935,'Yamada Yuuya',0,1),
+(936,'Yuzuriha',0,2),
+(937,'zasha',0,2),
+(938,'Ushino Kandume',0,1),
+(939,'Toyo',0,4),
+(940,'Tetsuyama Kaya',0,1),
+(941,'Tabigarasu',0,3),
+(942,'Rou',0,1),
+(943,'Izayoi no Kiki',0,1),
+(944,'MUK',0,3),
+(945,'Kurokoshi You',0,1),
+(946,'Jorori',0,1),
+(947,'Narusawa Kei',0,3),
+(948,'Oomori Makoto',0,1),
+(949,'Minase Seri',0,1),
+(950,'Matsunoan',0,1),
+(951,'Sakurazari Hotori',0,1),
+(952,'Okara',0,1),
+(953,'Takemasa Takeshi',0,2),
+(954,'fu-ta',0,5),
+(955,'Emily',0,1),
+(956,'Kikaider Reijhiro',0,1),
+(957,'Reco',0,1),
+(958,'Shuten Douji',0,2),
+(959,'UNp',0,1),
+(960,'Naruhodo',0,3),
+(961,'Hiyo Hiyo',0,1),
+(962,'Kawaisaw',0,1),
+(963,'Yasha',0,1),
+(964,'Ikeshita Maue',0,2),
+(965,'ron',0,1),
+(966,'Nishida',0,1),
+(967,'MM',0,1),
+(968,'Lantana',0,1),
+(969,'Satou Souji',0,2),
+(970,'Ando Hiroyuki',0,1),
+(971,'Natsume Tsuna',0,1),
+(972,'Survival Knife',0,1),
+(973,'Nyu',0,1),
+(974,'ML',0,1),
+(975,'Shiokonbu',0,1),
+(976,'Usagi Nagomu',0,1),
+(977,'Itoh Kani',0,1),
+(978,'Vanilla Type',0,1),
+(979,'846gou',0,1),
+(980,'Ashima Takumi',0,2),
+(981,'soba',0,2),
+(982,'Gin Jyuji',0,1),
+(983,'Natsu no Oyatsu',0,3),
+(984,'Itami',0,2),
+(985,'Mizuiro Megane',0,10),
+(986,'Erutasuku',0,1),
+(987,'Gorgonzola',0,1),
+(988,'Rikka Kai',0,1),
+(989,'Carn',0,1),
+(990,'Carburetor',0,1),
+(991,'Yoshiie',0,5),
+(992,'Uno Ryoku',0,2),
+(993,'RCA',0,1),
+(994,'Woruto',0,2),
+(995,'Gui Fu Shen Nai',0,1),
+(996,'Ahemaru | henrik',0,3),
+(997,'Taro',0,1),
+(998,'Yokoyama Naoki',0,1),
+(999,'Kizaru',0,1),
+(1000,'gemu555',0,1),
+(1001,'Nuku Nuku Orange',0,2),
+(1002,'chin',0,1),
+(1003,'Ao Madousi',0,1),
+(1004,'Tsunamushi',0,1),
+(1005,'Inoue Nanaki',0,1),
+(1006,'Esora Koto',0,6),
+(1007,'Kobanya Koban',0,1),
+(1008,'Chipa',0,1),
+(1009,'Nectar',0,1),
+(1010,'Nekomata Naomi',0,1),
+(1011,'Toribami Sasami',0,1),
+(1012,'Akaiguppy',0,1),
+(1013,'Youta',0,1),
+(1014,'AZASUKE',0,1),
+(1015,'Eisen',0,1),
+(1016,'Yamanashi Yuuya',0,1),
+(1017,'Micchan',0,1),
+(1018,'Lemon Keiki',0,1),
+(1019,'Tenzen Miyabi',0,2),
+(1020,'Ekakibit',0,2),
+(1021,'Rakujin',0,5),
+(1022,'Shimimaru',0,2),
+(1023,'Onodera',0,1),
+(1024,'Juna Juna Juice',0,3),
+(1025,'SHUKO',0,1),
+(1026,'Nankai no Sizimi',0,1),
+(1027,'Sakomae Aichi',0,1),
+(1028,'Aogiri Penta',0,1),
+(1029,'Ryoji',0,1),
+(1030,'Sakurayu Haru',0,1),
+(1031,'Mizoguchi Gelatin',0,1),
+(1032,'Ameyama Denshin',0,2),
+(1033,'JP06',0,1),
+(1034,'Hidebou',0,1),
+(1035,'Toshiyuki',0,1),
+(1036,'Uradoori no Nukemichi',0,1),
+(1037,'Kamaros',0,1),
+(1038,'Rikose',0,1),
+(1039,'Blue_Gk',0,1),
+(1040,'Po-ju / Monty',0,1),
+(1041,'Kakkuu',0,1),
+(1042,'Komagata',0,1),
+(1043,'Gonzaburo',0,1),
+(1044,'Fujimaru',0,1),
+(1045,'Yokoshima Nikki',0,1),
+(1046,'Pirontan',0,1),
+(1047,'Ikematsu',0,1),
+(1048,'BLADE',0,1),
+(1049,'Mitsugi',0,1),
+(1050,'Haga Yui',0,1),
+(1051,'Oota Yuuichi',0,1),
+(1052,'Ichinomiya Yuu',0,2),
+(1053,'Morisugi',0,1),
+(1054,'Asaki Takayuki',0,2),
+(1055,'FAN',0,1),
+(1056,'aoin',0,1),
+(1057,'Mochi',0,2),
+(1058,'Tempo Gensui',0,1),
+(1059,'Miyabi',0,1),
+(1060,'Muneshiro',0,2),
+(1061,'PiyoPiyo',0,1),
+(1062,'dam',0,1),
+(1063,'Tanabe Kyou',0,2),
+(1064,'Ookawada Nan',0,1),
+(1065,'Izuminoaru',0,2),
+(1066,'Shinozaki Rei',0,1),
+(1067,'Michian Ruu',0,1),
+(1068,'Sage Joh',0,1),
+(1069,'Bota Mochito',0,1),
+(1070,'Doko Tetora',0,1),
+(1071,'Sarunote Isao',0,2),
+(1072,'EO Masaka',0,1),
+(1073,'Takeshi',0,1),
+(1074,'Greco Roman',0,7),
+(1075,'Carmine',0,1),
+(1076,'Misaka Nyuumen',0,1),
+(1077,'Poriuretan',0,1),
+(1078,'AKYS Honpo',0,1),
+(1079,'miya9',0,1),
+(1080,'Hattori Mitsuka',0,1),
+(1081,'Kauti',0,2),
+(1082,'Itou Yuuji',0,3),
+(1083,'Misao.',0,1),
+(1084,'EGAMI',0,3),
+(1085,'Haitukun',0,2),
+(1086,'Nekotasou',0,1),
+(1087,'Itou Life',0,1),
+(1088,'mmm',0,2),
+(1089,'Kamishiro Ryuu',0,5),
+(1090,'Azusa Norihee',0,1),
+(1091,'Edo Shigezu',0,1),
+(1092,'Menea the Dog',0,1),
+(1093,'Bizen',0,1),
+(1094,'Taji',0,1),
+(1095,'Katou Fuguo',0,5),
+(1096,'Fushoku',0,1),
+(1097,'Yukiyoshi Mamizu',0,1),
+(1098,'Tanaka Aji',0,1),
+(1099,'Mitsuru Nakata',0,1),
+(1100,'Acbin''s',0,1),
+(1101,'Kazakura',0,1),
+(1102,'Toilet Komoru',0,2),
+(1103,'Takanaga Kouhei',0,1),
+(1104,'Nme',0,4),
+(1105,'Yuki Tomoshi',0,1),
+(1106,'Petenshi',0,2),
+(1107,'Koto',0,1),
+(1108,'Shiroobi',0,1),
+(1109,'Eshimoto',0,1),
+(1110,'Unagimaru',0,1),
+(1111,'Minatoya Shunsaku',0,1),
+(1112,'Kai Maruko',0,2),
+(1113,'Yano Toshinori',0,1),
+(1114,'Kaiou',0,1),
+(1115,'Takaharu',0,2),
+(1116,'Setouchi Kurage',0,1),
+(1117,'Mikezoutei',0,1),
+(1118,'Araki Mitsuru',0,1),
+(1119,'Arumajiki',0,1),
+(1120,'Mimizu',0,2),
+(1121,'Enoshima Iki',0,1),
+(1122,'Darumasan Koronda',0,1),
+(1123,'Yukisiro Arte',0,1),
+(1124,'Ibukichi',0,1),
+(1125,'Usashiro Mani',0,1),
+(1126,'xxzero',0,2),
+(1127,'Yoshida',0,1),
+(1128,'Oryou',0,1),
+(1129,'Kitahara Eiji',0,1),
+(1130,'JACKASSS | Sorahati Midoro',0,2),
+(1131,'Inanaki Shiki',0,1),
+(1132,'Mimonel',0,2),
+(1133,'Akizora Momidi',0,2),
+(1134,'Uchi-Uchi Keyaki',0,1),
+(1135,'Gustav',0,1),
+(1136,'Gentsuki',0,1),
+(1137,'Hashimoto',0,1),
+(1138,'Ooyama Kina',0,1),
+(1139,'Kurona',0,1),
+(1140,'Asuhiro',0,1),
+(1141,'Kumano Tooru | Kumada',0,1),
+(1142,'Utatane Hiroyuki',0,1),
+(1143,'Shiashiya',0,1),
+(1144,'Kikuchi',0,1),
+(1145,'REI',0,1),
+(1146,'Haruno Suzune',0,1),
+(1147,'Iburo.',0,1),
+(1148,'Fumi Miyabi',0,1),
+(1149,'Tsukai You',0,1),
+(1150,'Picao',0,1),
+(1151,'Arui Ryou',0,1),
+(1152,'Tomose Shunsaku',0,2),
+(1153,'Kageshio',0,2),
+(1154,'Senbazuru',0,1),
+(1155,'UNIKURA',0,1),
+(1156,'Gunnjou',0,1),
+(1157,'Oshii Rei',0,1),
+(1158,'Sakai Ringo',0,1),
+(1159,'Shibuki Oroshi',0,1),
+(1160,'ShAKe',0,1),
+(1161,'Bifidus',0,1),
+(1162,'Son Yohsyu',0,1),
+(1163,'Asazuki Norito',0,1),
+(1164,'Koppori Nama Beer',0,1),
+(1165,'Oohira Sunset',0,1),
+(1166,'Aoi Manabu',0,1),
+(1167,'Negurie',0,2),
+(1168,'Yo-shu Ohepe',0,1),
+(1169,'Ootsuki Wataru',0,1),
+(1170,'Morimiya Masayuki',0,1),
+(1171,'Nishikawa Kou',0,1),
+(1172,'Takahashiya Takabee',0,1),
+(1173,'YOSHIKI | Endo Yoshiki',0,1),
+(1174,'Piririnegi',0,1),
+(1175,'EBA',0,1),
+(1176,'Ninoko',0,1),
+(1177,'Yukiyanagi',0,1),
+(1178,'Yuran',0,2),
+(1179,'Higashino Mikan',0,1),
+(1180,'Fuurai',0,1),
+(1181,'Shimetta Seiya',0,1),
+(1182,'Apocrine.',0,1),
+(1183,'Ponfaz',0,1),
+(1184,'Kawase Seiki',0,2),
+(1185,'J-MAX JAPAN',0,1),
+(1186,'Chonko',0,1),
+(1187,'Tukisiro Saya',0,1),
+(1188,'Natsumikan',0,1),
+(1189,'Saki Chisuzu',0,1),
+(1190,'Ryome Gantai',0,1),
+(1191,'Amamitu Kousuke',0,1),
+(1192,'Hori Hiroaki',0,1),
+(1193,'Zonda',0,1),
+(1194,'Ootsuka Reika',0,1),
+(1195,'Sankuro',0,1),
+(1196,'Kanno Takanori | Minamino Sazan',0,1),
+(1197,'Meganei',0,2),
+(1198,'Hakaishin',0,1),
+(1199,'Jino',0,1),
+(1200,'Chicken',0,1),
+(1201,'Hissatsukun',0,1),
+(1202,'Honryou Hanaru',0,1),
+(1203,'Tokie Hirohito',0,1),
+(1204,'Sasachinn',0,1),
+(1205,'Kanta.',0,1),
+(1206,'Pocchi',0,1),
+(1207,'Uguisu Kagura',0,1),
+(1208,'Dekosuke 18gou',0,1),
+(1209,'Saemon',0,2),
+(1210,'Iso Nogi',0,1),
+(1211,'Miyama',0,1),
+(1212,'Kazushi',0,1),
+(1213,'Rojione',0,1),
+(1214,'Hijiri Tsukasa',0,1),
+(1215,'Kizuka Kazuki',0,2),
+(1216,'Hirota',0,1),
+(1217,'Kawazuko Chouji',0,1),
+(1218,'Aoi Takayuki',0,1),
+(1219,'Okyuuri',0,1),
+(1220,'Mareo',0,1),
+(1221,'Ryo',0,1),
+(1222,'Art Post',0,1),
+(1223,'Harenochiame',0,1),
+(1224,'581',0,2),
+(1225,'Okino Matsushiro',0,1),
+(1226,'Hisama Kumako',0,1),
+(1227,'Summer',0,1),
+(1228,'Yoshiura Kazuya',0,2),
+(1229,'Takatsu | Takatsu Keita',0,2),
+(1230,'Haritama Hiroki',0,1),
+(1231,'Punita',0,1),
+(1232,'Shiraha Mato',0,1),
+(1233,'Shimao Kazu',0,3),
+(1234,'Souichi | Watanabe Souichi',0,3),
+(1235,'Tokiwa Midori',0,1),
+(1236,'Takenaka Hideo',0,3),
+(1237,'Hiru Okita',0,1),
+(1238,'Shirane Taito',0,1),
+(1239,'Leonard 16 Sei',0,1),
+(1240,'Shinkai',0,1),
+(1241,'St.germain-sal',0,1),
+(1242,'Kenpi',0,3),
+(1243,'nalvas',0,1),
+(1244,'H9',0,3),
+(1245,'Molokonomi | Hiraya Nobori',0,4),
+(1246,'Kousaka Jun',0,11),
+(1247,'Kogaku Kazuya',0,1),
+(1248,'Hatimoto',0,1),
+(1249,'Sameda Koban',0,1),
+(1250,'TRY | Hougen',0,1),
+(1251,'Sukiyoshi Shinji',0,1),
+(1252,'Maru.',0,1),
+(1253,'Kid',0,1),
+(1254,'Uron Rei',0,2),
+(1255,'Shigekix',0,1),
+(1256,'Yukiu Con',0,1),
+(1257,'Kirihara Yuu',0,1),
+(1258,'Maki Tatsuki',0,1),
+(1259,'Iketaki Ganguten',0,1),
+(1260,'Abe Manabu',0,1),
+(1261,'Barakey',0,2),
+(1262,'Uraha',0,1),
+(1263,'Sanom',0,1),
+(1264,'Uchuu Ika',0,1),
+(1265,'Harukaze Unipo',0,1),
+(1266,'Tama',0,1),
+(1267,'Kekocha',0,1),
+(1268,'VT',0,1),
+(1269,'Akai Mato',0,1),
+(1270,'Mushi',0,1),
+(1271,'Tsukimiya Tsutomu',0,1),
+(1272,'Takeda Aranobu',0,1),
+(1273,'Mizuki Haruto',0,1),
+(1274,'Mikawaya',0,1),
+(1275,'Suzutsuki Kurara',0,2),
+(1276,'Suzune Rai',0,2),
+(1277,'Hinotsuki Neko',0,1),
+(1278,'Kanyapyi',0,1),
+(1279,'Inue Shinsuke',0,3),
+(1280,'Opanchu',0,1),
+(1281,'Henrybird',0,1),
+(1282,'Haruhisky',0,2),
+(1283,'Yoshida Gorou',0,2),
+(1284,'Nabenco',0,1),
+(1285,'Gekka Kaguya',0,1),
+(1286,'Chinzurena',0,1),
+(1287,'Sakura Puchilo | Nanahoshi Suama',0,2),
+(1288,'Doskoinpo',0,2),
+(1289,'Tachiroku',0,1),
+(1290,'Akitsuki Karasu',0,1),
+(1291,'Anda',0,1),
+(1292,'Momio',0,1),
+(1293,'Hirno',0,1),
+(1294,'Naha 78',0,1),
+(1295,'Nimu',0,1),
+(1296,'Fukunaga Yukito',0,1),
+(1297,'Kimura Naoki',0,1),
+(1298,'Yuuki Homura',0,1),
+(1299,'Horitomo',0,1),
+(1300,'Yamayo',0,1),
+(1301,'Taniguchi-san',0,1),
+(1302,'bariun',0,1),
+(1303,'Kakenari',0,1),
+(1304,'Yuuka Kazami',0,1),
+(1305,'Utako',0,1),
+(1306,'Tenamaru',0,1),
+(1307,'Mizuyuki',0,1),
+(1308,'TrickSter',0,1),
+(1309,'Ikura Nagisa',0,1),
+(1310,'Yasuyuki',0,1),
+(1311,'Harasaki',0,0),
+(1312,'Kamitani',0,1),
+(1313,'Heigani',0,1),
+(1314,'Kirome',0,1),
+(1315,'Nunnu',0,1),
+(1316,'Kirisaki Byakko',0,1),
+(1317,'Haguruma',0,1),
+(1318,'Bizen Dorobune',0,2),
+(1319,'Metal Owl',0,1);
 INSERT INTO "BookArtist" VALUES
 (1,1),
 (2,2),
@@ -17007,6 +17019,2796 @@ INSERT INTO "BookParody" VALUES
 (2799,239),
 (2800,239),
 (2802,242);
+INSERT INTO "BookSummary" VALUES
+(1,'Ahegao;BBM / Fat Man;Blowjob;Bukkake;Cunnilingus;Full Color;Group Sex;Harem;Large Breasts;Magical Girl;Prostitution;Virginity (Male)','Isao',4.27),
+(2,'BBM / Fat Man;Blowjob;Condom;Defloration;Full Color;Group Sex;Large Breasts;Loli;MILF;Oppai Loli;Prostitution;Rape;School Uniform;Tanlines;Teacher;Virginity (Male)','Yojouhan Shobou',4.01),
+(3,'BBM / Fat Man;Blowjob;Nakadashi;Prostitution;School Uniform;Threesome','Shiwasu No Okina',4.61),
+(4,'Ahegao;Blowjob;Condom;Crotchless / Breastless;Nakadashi;Pantyhose;Prostitution;Short Hair;Slut;Smug','Noumiso',4.5),
+(5,'Anal;Dark Skin;Elf;Gyaru;Happy Sex;Nakadashi;Pettanko;Prostitution','Yamashita Kurowo',4.62),
+(6,'Condom;Dark Skin;Gyaru;Happy Sex;Large Breasts;Nakadashi;Prostitution;School Uniform;Short Hair;Virginity (Male)','212',4.52),
+(7,'Ahegao;Anal;Bathroom Sex;Big Ass;Blindfold;Blowjob;Body Painting;Bukkake;Cheating;Condom;Crotchless / Breastless;Dark Skin;Double Penetration;Freckles;Gokkun;Group Sex;Gyaru;Hairy;Handjob;Hotpants;Lactation;Large Breasts;Layer Cake;Megane;Mouth Gag;Nakadashi;Paizuri;Prostitution;Sex Toys;Short Hair;Slut;Sweating;Transparent Clothing;Twintails;Waitress','BANG-YOU | Didori;Bubuzuke;Butcha U;Chiba Toshirou;Denki Shougun;Gentle Sasaki;Kamina Koharu;Kei.;Komusou;KONKIT;Meme 50;Mikoyan;Mizuryu Kei;nuezou;Ribyuhki;Sasamori Tomoe;SGK;ShindoL;Shinkuu Tatsuya;Unou;Uruujima Call;Yumeno Tanuki',4.47),
+(8,'Ahegao;Anal;Big Ass;Birth;Body Modification;Corruption;Dark Skin;Dick Growth;Double Penetration;Egg Laying;Elf;Futanari;Huge Breasts;Huge Penis;Impregnation;Lactation;Large Breasts;Mind Break;Monster;Nakadashi;Pregnant;Rape;Stockings;Stomach Bulge;Threesome;Yuri','Kazuhiro',3.81),
+(9,'Anilingus;Centaur;Fisting;Huge Penis;Large Breasts;Monster Girl','Orange Bull',4.27),
+(10,'Ahegao;Big Ass;Blowjob;Comedy;Deepthroat;Femdom;Huge Penis;Large Breasts;Monster Girl;Nakadashi;Prostitution;Squirting;Stockings;Tengu;Tsundere;Twintails;X-ray','WindArt',4.63),
+(11,'Anal;Animal Girl;BBM / Fat Man;Centaur;Cervical Penetration;Collar;Cow Girl;Dark Skin;Defloration;Devil;Enema;Femdom;Futanari;Group Sex;Imouto;Impregnation;Incest;Kimono / Yukata;Large Breasts;Megane;MILF;Monster Girl;Mother;Nakadashi;Netorare;Oni;Parasite;Prostate Massage;Ryona;Sex Toys;Short Hair;Story Arc;Tankoubon;Uncensored;X-ray;Yaoi','Z-Ton',4.09),
+(12,'Hairy;Happy Sex;Inverted Nipples;Large Breasts;Monster Girl;Oni;Paizuri;Tall Girl','Nemu',4.64),
+(13,'Centaur;Happy Sex;Monster Girl;Office Lady;Uncensored','Mizone',4.61),
+(14,'Ahegao;Anilingus;BBM / Fat Man;Big Ass;Blowjob;Comedy;Condom;Dark Skin;Elder Sister;Fangs;Group Sex;Gyaru;Hairy Armpits;Incest;Large Breasts;Lingerie;Loli;MILF;Nakadashi;Prostitution;Slut;Smegma;Soushuuhen;Story Arc;Straight Shota;Swinging / Netorase;Threesome;Urethra Insertion;Virginity (Male);Waitress;Yandere','Satou Kimiatsu;Tamatsuyada',4.53),
+(15,'Big Areola;Big Ass;Defloration;Gangbang;Hairy;Huge Breasts;Large Breasts;Mind Control;Nakadashi;Rape','Bonten',3.65),
+(16,'Anal;Bondage;CBT;Face Sitting;Femdom;Footjob;Freckles;Kimono / Yukata;Mouth Gag;Pettanko;School Uniform;Sex Toys;Shibari;Short Hair;Spanking;Threesome;Twintails;Urethra Insertion;X-ray','Tokimachi Eisei',2.95),
+(17,'Ahegao;Anal;Anilingus;Big Ass;Blowjob;Deepthroat;Elf;Face Sitting;Femdom;French Kissing;Gokkun;Handjob;Leg Lock;Maledom;Nakadashi;Pantyhose;Royalty;Sweating;Torn Clothing;Tsundere','nuezou',4.55),
+(18,'Assjob;Big Ass;Femdom;Huge Breasts;Large Breasts;Megane;MILF;Nakadashi;Paizuri;Reverse NTR;Stockings;Teacher;Virginity (Male)','Saranaru Takami',4.32),
+(19,'Ahegao;Anal;Big Ass;Blowjob;Cheating;Deepthroat;French Kissing;Hairy;Large Breasts;MILF;Nakadashi;Netori;X-ray','Orutoro',4.43),
+(20,'Ahegao;Big Ass;Blowjob;Defloration;Elf;Femdom;French Kissing;Happy Sex;Large Breasts;Masturbation;Nakadashi;Pantyhose;Virginity (Male);X-ray','Morikoke',4.65),
+(21,'Ahegao;BDSM;Body Modification;Breast Expansion;Crossdressing;Dick Growth;Futanari;Huge Breasts;Huge Penis;Large Breasts;Male on Futa;Rape;Stomach Bulge;X-ray','Akuochisukii Sensei',2.71),
+(22,'Huge Breasts;Inverted Nipples;Large Breasts;Paizuri','Koaya Aco',4.36),
+(23,'Ahegao;BBM / Fat Man;Bukkake;Bunnygirl;Corruption;Devil;Exhibitionism;Femdom;Group Sex;Huge Penis;Mind Control;Monster;Monster Girl;Nakadashi;Paizuri;Slut;Stomach Bulge;Symbol Shaped Pupils;Threesome','Mizuryu Kei',4.29),
+(24,'Anal;BBW;Blowjob;Bukkake;Double Penetration;Elf;Gangbang;Group Sex;Large Breasts;Muscle;Paizuri;Plump;Scat;Tentacles;Threesome','Erect Sawaru',3.72),
+(25,'Big Ass;Breast Sucking;Elder Sister;Femdom;Handjob;Incest;Large Breasts;Muscle;Nakadashi;Short Hair;Straight Shota;Tan;Tanlines;Tomboy;X-ray','Yuuki Ray',4.35),
+(26,'Anal;Bikini;Blowjob;Dark Skin;Deepthroat;Double Penetration;Drunk;Femdom;Group Sex;Gyaru;Huge Penis;Inverted Nipples;Large Breasts;Nakadashi;Nipple Penetration;Paizuri;Piercings;Stomach Bulge;Straight Shota;Swimsuit;Threesome','Yuuki Ray',4.18),
+(27,'Ahegao;Anal;Anilingus;Bikini;Face Sitting;Idol;Large Breasts','Jabara Tornado',4.12),
+(28,'Anal;Blowjob;Collar;Demon | Incubus;Group Sex;Huge Penis;Males only;Monster;Multiple Penises;Shota;Tentacles;Yaoi','hari',4.12),
+(29,'Anal;Anilingus;Bisexual;Enema;Femdom;Gender Bender;Group Sex;Humiliation;Short Hair;Tribadism;Yuri','Ruuen Rouga',4.06),
+(30,'Anal;Blowjob;Crossdressing;Lingerie;Males only;Sex Toys;Shota;Stockings;Trap;Yaoi','Kaitou Yuuhi',4.65),
+(31,'Blowjob;Bondage;Bunnygirl;Corruption;Fingering;Group Sex;Large Breasts;Monster;Nakadashi;Paizuri;Rape;Stockings;Torn Clothing','Jyura',3.85),
+(32,'Ahegao;Animal Girl;Corruption;Dark Skin;Dick Growth;Femdom;Footjob;Fox Girl;Full Color;Futa on Female;Futanari;Impregnation;Masturbation;Pregnant;Tentacles;Urethra Insertion','luku',3.71),
+(33,'Ahegao;Animal Girl;Body Modification;Catgirl;Females only;Futa on Female;Futanari;Huge Breasts;Huge Penis;Large Breasts;Leotard;Miko;Short Hair;Stomach Bulge;Tentacles','Pandain',4.0),
+(34,'Anal;Anilingus;Armpit;BBM / Fat Man;Dark Skin;Devil;Futanari;Group Sex;Hairy;Hairy Armpits;Hypnosis;Large Breasts;Smell;Twintails','Akutabin',3.67),
+(35,'Bukkake;Decensored;Femdom;Futanari;Futanari on Futanari;Huge Penis;Masturbation;Onahole;Stockings;Yuri','Hakaba Yodomu',4.13),
+(36,'Ahegao;Anal;Asphyxiation;BBW;Big Ass;Bloomers;Blowjob;CBT;Condom;Crossdressing;Dark Skin;Deepthroat;Drugs;Femdom;Fingering;French Kissing;Full Color;Futa on Male;Futanari;Futanari on Futanari;Group Sex;Hairy Armpits;Huge Breasts;Lactation;Large Breasts;Masturbation;Mind Break;Nakadashi;Nose Hook;Nurse;Piercings;Rape;Shemale;Shota;Small Penis;Smegma;Spats;Spitroast;Stomach Bulge;Swimsuit;Symbol Shaped Pupils;Tan;Tanlines;Threesome;Trap;X-ray','Soborogo',3.5),
+(37,'Animal Girl;Cervical Penetration;Dick Growth;Futa on Female;Futanari;Lactation;Mouse Girl;Nakadashi;Pettanko;Rape;Short Hair;Sleeping;Stomach Bulge;X-ray;Yuri','Peso',3.67),
+(38,'Anal;Anilingus;Blowjob;Collar;Dick Growth;Exhibitionism;Femdom;Footjob;Futa on Male;Futanari;Huge Penis;Humiliation;Large Breasts;Mind Break;Tall Girl','Dibi',4.0),
+(39,'Animal Girl;Bunnygirl;Cheerleader;Decensored;Futanari;Futanari on Futanari;Happy Sex;School Uniform;Twintails;Yuri','Hakaba Yodomu',4.69),
+(40,'Ahegao;Defloration;DILF;Drugs;Impregnation;Loli;Maledom;Mind Break;Pantyhose;Rape;Sleeping;Smell;Stockings;X-ray','Asanagi',4.54),
+(41,'Anal;BBM / Fat Man;Bondage;Dark Skin;Defloration;Double Penetration;Drugs;Group Sex;Loli;Mind Break;Nakadashi;Oppai Loli;Rape;Tankoubon;Twintails','Hikoma Hiroyuki',3.78),
+(42,'Blowjob;Footjob;Full Color;Hat;Leg Lock;Loli;Masturbation;Nakadashi;Pantyhose;Stockings;Torn Clothing;Twintails;X-ray','ooyun',4.21),
+(43,'Blowjob;Catgirl;Cosplay;Defloration;Loli;Prostitution;Short Hair;Stockings;Witch','Equal',4.13),
+(44,'Ahegao;Big Ass;Blowjob;Cheating;Group Sex;Happy Sex;Huge Breasts;Huge Penis;Impregnation;Incest;Large Breasts;Loli;MILF;Nakadashi;Netori;Oyakodon;Stomach Bulge;Threesome','Sahara Wataru',4.32),
+(45,'Ahegao;Big Ass;Blowjob;Cheating;Collar;Deepthroat;Filming;Fingering;Gokkun;Group Sex;Happy Sex;Huge Breasts;Huge Penis;Impregnation;Large Breasts;Loli;Masturbation;Megane;MILF;Mother;Nakadashi;Netori;Oyakodon;Slave;Spanking;Stomach Bulge;Symbol Shaped Pupils','Sahara Wataru',4.47),
+(46,'Ahegao;Anal;Big Ass;Blowjob;Cheating;Daughter;Huge Breasts;Huge Penis;Incest;Large Breasts;Loli;Megane;MILF;Mother;Nakadashi;Netori;Oyakodon;Stockings;Stomach Bulge','Sahara Wataru',4.48),
+(47,'Ahegao;Anal;Big Ass;Blowjob;Breast Sucking;Cheating;Collar;Deepthroat;Defloration;Group Sex;Huge Penis;Impregnation;Kunoichi;Lactation;Large Breasts;Loli;Megane;MILF;Mind Break;Mother;Nakadashi;Netori;Oyakodon;Stomach Bulge','Sahara Wataru',4.49),
+(48,'Age Regression;Ahegao;Blowjob;Cheating;Group Sex;Harem;Loli;Megane;Netori;Short Hair;Symbol Shaped Pupils','Sahara Wataru',4.27),
+(49,'Bikini;Bisexual;Blowjob;Breast Sucking;Collar;French Kissing;Gokkun;Group Sex;Happy Sex;Hat;Impregnation;Large Breasts;Loli;Nakadashi;Paizuri;Swimsuit;Symbol Shaped Pupils;Threesome;Twintails;X-ray','Pony R',4.41),
+(50,'Anal;Bikini;Cervical Penetration;Happy Sex;Loli;Monster;Stockings;Swimsuit;Tentacles','Koume Keito',3.81),
+(51,'Collar;Idol;Loli;Maebari;Nakadashi;Stockings;Twintails','Nekometaru',4.19),
+(52,'BBW;Dark Skin;Huge Breasts;Large Breasts;Nakadashi;Paizuri;Plump;Possession','TANABE',4.55),
+(53,'Anal;Bisexual;Blackmail;Blowjob;Crossdressing;Defloration;Double Penetration;Group Sex;Handjob;Mind Break;Nakadashi;Rape;Spitroast;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Ijima Yuu',3.69),
+(54,'Big Ass;Collar;Dark Skin;Femdom;Huge Breasts;Lamia;Large Breasts;Long Tongue;MILF;Monster Girl;Paizuri;Prostitution;Straight Shota','Hroz',4.35),
+(55,'Ahegao;Birth;Blowjob;Breast Sucking;Daughter;Defloration;Exhibitionism;Fingering;Group Sex;Harem;Impregnation;Incest;Large Breasts;Leg Lock;MILF;Nakadashi;Naked Apron;Nun;Onahole;Paizuri;School Uniform;Shared Senses;Stockings;Stomach Bulge;Story Arc;Threesome;Transformation;X-ray','Nico Pun Nise',4.71),
+(56,'Giantess;Large Breasts;Long Tongue;Mermaid;MILF;Monster Girl','Jyoka',4.49),
+(57,'Anal;Big Ass;Crossdressing;French Kissing;Frotting;Large Breasts;Lingerie;Maid;Male on Futa;Sex Toys;Shemale;Stockings;Trap','Mogiki Hayami;The Amanoja9',4.36),
+(58,'Ahegao;Anal;Drunk;Males only;Nakadashi;Shota;Symbol Shaped Pupils;Trap;Yaoi','Booch',3.9),
+(59,'Age Progression;BBM / Fat Man;BBW;Big Areola;Big Ass;Blowjob;Cheating;Dark Skin;Deepthroat;Defloration;Dirty Old Man;Emotionless Sex;Gloves;Gokkun;Group Sex;Hairy;Huge Breasts;Huge Penis;Impregnation;Incest;Inseki;Invisible;Lactation;Large Breasts;Lingerie;Megane;MILF;Mother;Nakadashi;Nun;Pregnant;Rape;Stockings;Straight Shota;Swimsuit;Tankoubon;Threesome;Time Stop;Transparent Clothing;Virginity (Male)','Jeanne DA''ck',3.33),
+(60,'Anilingus;Blowjob;Cheating;Dark Skin;Group Sex;Large Breasts;Leg Lock;Lingerie;Nakadashi;Office Lady;Oyakodon;Stockings;Tanlines;Uncensored;X-ray','SAVAN',4.06),
+(61,'Anal;Big Ass;Blowjob;Exhibitionism;Ghost;Large Breasts;Nakadashi;School Uniform;Short Hair;Stockings;Uncensored;Watersports;X-ray','Ao Banana',4.48),
+(62,'Blowjob;Cervical Penetration;Dark Skin;Exhibitionism;Leotard;Nakadashi;Sex Toys;Sweating;X-ray','Hyouju Issei',4.65),
+(63,'Blowjob;Dark Skin;Gyaru;Large Breasts;Nakadashi;Paizuri;Slut;Stockings;Straight Shota;Uncensored','Arinotowatari',4.45),
+(64,'Anal;Crossdressing;Dark Skin;Gyaru;Large Breasts;Straight Shota;Trap;Uncensored','Arinotowatari',4.16),
+(65,'Big Areola;Blowjob;Cosplay;Devil;Full Color;Large Breasts;Licking;Nakadashi;Paizuri;Succubus;Uncensored','Gegera Toshikazu',4.17),
+(66,'Ahegao;BBW;Big Ass;Blowjob;Collar;Dark Skin;Deepthroat;Eyepatch;Group Sex;Humiliation;Large Breasts;Mind Break;Nakadashi;Plump;Slave;Spanking;Tattoo','Kurotama',3.79),
+(67,'Big Areola;Femdom;Full Color;Group Sex;Huge Breasts;Large Breasts;Mind Break;Oni;Paizuri;Reverse Rape;Straight Shota;Threesome','Kloah',4.07),
+(68,'Big Ass;Blowjob;Elder Sister;Emotionless Sex;Incest;Large Breasts;Nakadashi;Short Hair;Stockings;Straight Shota;X-ray','Motsu Aki',4.26),
+(69,'Ahegao;Bikini;Blowjob;Bukkake;Condom;French Kissing;Happy Sex;Large Breasts;Nakadashi;Nurse;Paizuri;Stockings;Swimsuit;X-ray','Zhen Lu',4.74),
+(70,'Animal Boy;Animal Girl;BBW;Big Ass;Bikini;Blowjob;Breast Sucking;Cow Girl;Cunnilingus;Deepthroat;Defloration;Full Color;Happy Sex;Huge Breasts;Large Breasts;Plump;Short Hair;Swimsuit;Tsundere;X-ray','Eno Yukimi',4.56),
+(71,'Ahegao;Anal;Bestiality;Birth;Blowjob;Bukkake;Deepthroat;Double Penetration;Exhibitionism;Gokkun;Group Sex;Impregnation;Loli;Mind Break;Mind Control;Nakadashi;Pregnant;Rape;Smegma;X-ray','774 / Nanashi',4.03),
+(72,'Ahegao;Bestiality;Bondage;Defloration;Drugs;Huge Penis;Impregnation;Large Breasts;Loli;Magical Girl;Mind Break;Nakadashi;Pettanko;Pig;Rape;Sex Toys;Squirting;Stomach Bulge;Symbol Shaped Pupils;Vomit;X-ray','774 / Nanashi',4.25),
+(73,'Ahegao;Bestiality;Exhibitionism;Humiliation;Impregnation;Loli;Mind Break;Nakadashi;Pig;Rape;School Uniform;Stomach Bulge;Symbol Shaped Pupils;Vomit','774 / Nanashi',3.71),
+(74,'Blowjob;Cunnilingus;Defloration;Gyaru;Happy Sex;Nakadashi;School Uniform;Uncensored','TANABE',4.72),
+(75,'Big Ass;Blowjob;Cosplay;Filming;Large Breasts;Nakadashi;Uncensored;X-ray','Haru Yukiko',4.52),
+(76,'Anal;Big Ass;Femdom;Handjob;Happy Sex;Large Breasts;Pegging;School Uniform;Sex Toys;Strap-on;Teacher;Uncensored','Ichiko',3.8),
+(77,'Anal;Animal Boy;Blowjob;Crossdressing;Filming;Full Color;Males only;Shota;Symbol Shaped Pupils;Trap;Uncensored;Yaoi','Jairou | Xil',4.45),
+(78,'Big Ass;Blowjob;Exhibitionism;Femdom;Large Breasts;Nakadashi;Straight Shota;Uncensored','Morishima Kon',4.64),
+(79,'Breast Sucking;Handjob;Large Breasts;Nakadashi;Straight Shota;Uncensored;X-ray','Morishima Kon',4.48),
+(80,'Ahegao;Anal;Big Ass;Blowjob;Cervical Penetration;Collar;Crotchless / Breastless;Cunnilingus;Decensored;Deepthroat;Demon Girl | Succubus;Demon | Incubus;Drugs;Fangs;Femdom;French Kissing;Glory Hole;Gokkun;Group Sex;Handjob;Happy Sex;Harem;Huge Penis;Impregnation;Large Breasts;Layer Cake;Legal Loli;Loli;Megane;Oyakodon;Paizuri;Shimaidon;Short Hair;Sixty-Nine;Stockings;Stomach Bulge;Story Arc;Sweating;Tankoubon;Threesome;Virginity (Male);Watersports;X-ray','Fue',4.8),
+(81,'Cheating;Dark Skin;Large Breasts;Nakadashi;Symbol Shaped Pupils;Tan;Tanlines','Kishizuka Kenji',4.08),
+(82,'Ahegao;Anal;Big Ass;Double Penetration;Group Sex;Hat;Huge Breasts;Huge Penis;Large Breasts;Loli;MILF;Piercings;Sex Toys;Witch','Momofuki Rio',3.56),
+(83,'Ahegao;Anal;Bondage;Crotchless / Breastless;Frotting;Futanari;Futanari on Futanari;Huge Breasts;Huge Penis;Large Breasts;Nakadashi;Prolapse;School Uniform;Sex Toys;Stomach Bulge;Swimsuit;Urethra Insertion','Teterun',4.03),
+(84,'Ahegao;Anal;Decensored;Double Penetration;Femdom;Group Sex;Happy Sex;Incest;Multiple Insertion;Reverse Harem;Short Hair;Stockings;Straight Shota;Symbol Shaped Pupils;Tan;Tanlines;Trap;Virginity (Male)','Jairou | Xil',4.23),
+(85,'Bondage;Chastity Belt;Cunnilingus;Face Sitting;Femdom;Handjob;Kimono / Yukata;Onahole;School Uniform;Short Hair;Twintails','Tokimachi Eisei',2.83),
+(86,'Bondage;Defloration;Femdom;Hairy;Mouth Gag;Reverse Rape;Symbol Shaped Pupils;Twintails;X-ray;Yandere','Usubeni Sakurako',4.39),
+(87,'Ahegao;Anal;Bondage;Brain Fuck;Cervical Penetration;Collar;Double Penetration;Huge Penis;Large Breasts;Monster;Mouth Gag;Nakadashi;Rape;Stomach Bulge;Tentacles','sian',4.18),
+(88,'Amputee;Collar;Crossdressing;Fangs;Frotting;Gender Bender;Guro;Large Breasts;Loli;Maledom;Piercings;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Asanagi',4.17),
+(89,'BBM / Fat Man;Bikini;Breast Sucking;Bunnygirl;Face Sitting;Gloves;Hat;Large Breasts;Nakadashi;Paizuri;Short Hair;Stockings;Sweating;Swimsuit;X-ray','Uo Denim',4.64),
+(90,'Bikini;Face Sitting;Group Sex;Large Breasts;Nakadashi;Paizuri;Stockings;Swimsuit;Threesome','Uo Denim',4.65),
+(91,'Anal;BBW;Big Areola;Big Ass;Blowjob;Frotting;Futanari;Futanari on Futanari;Gaping;Huge Breasts;Huge Penis;Large Breasts;Leg Lock;Masturbation;Paizuri;Spreading;Stomach Bulge;Sweating','Teterun',3.68),
+(92,'Age Progression;Ahegao;Anal;Band-Aid / Pasties;BBW;Blowjob;Dark Skin;Dick Growth;Elf;Frotting;Futanari;Futanari on Futanari;Gaping;Huge Penis;Large Breasts;Mind Break;Nakadashi;Prolapse;Spreading;Stomach Bulge;Tall Girl;Urethra Insertion;X-ray','Teterun',4.03),
+(93,'Ahegao;Anilingus;Blindfold;Bondage;Breast Sucking;Cervical Penetration;Childhood Friend;Defloration;Enema;Fingering;Group Sex;Harem;Impregnation;Kimono / Yukata;Large Breasts;Megane;Miko;Nakadashi;Pregnant;Stomach Bulge;Sweating;X-ray','Sakazaki Freddie',4.61),
+(94,'Blowjob;Devil;Happy Sex;Megane;School Uniform;Succubus;Uncensored','Sasamori Tomoe',4.73),
+(95,'Blowjob;Deepthroat;Femdom;Happy Sex;Large Breasts;Leg Lock;Licking;Megane;Nakadashi;Paizuri;Reverse Rape;School Uniform;Succubus;Uncensored;X-ray','Sasamori Tomoe',4.6),
+(96,'Anal;Futanari;Lamia;Large Breasts;Mind Break;Monster Girl;Multiple Insertion;Multiple Penises;Nakadashi;Nipple Penetration;Rape;Snuff;X-ray','Ikameshi',4.04),
+(97,'Big Ass;Blowjob;Bondage;Cunnilingus;Deepthroat;Defloration;Exhibitionism;Face Sitting;Femdom;Handjob;Kimono / Yukata;Large Breasts;Mouth Gag;Nakadashi;Reverse Rape;School Uniform;Stockings;Virginity (Male);Yandere','Igumox',4.54),
+(98,'Ahegao;Anal;Anilingus;Big Ass;Defloration;Elder Sister;Femdom;Group Sex;Handjob;Incest;Large Breasts;Long Tongue;Masturbation;Megane;Nakadashi;Reverse Rape;School Uniform;Smell;Stockings;Straight Shota;Sweating;Threesome;Twins;Virginity (Male)','Igumox',4.58),
+(99,'Ahegao;Anal;Birth;Bodysuit;Defloration;Double Penetration;Group Sex;Human Cattle;Impregnation;Large Breasts;Mind Break;Mind Control;Multiple Insertion;Nakadashi;Orc;Parasite;Pet Girl;Pregnant;Prolapse;Rape;School Uniform;Snuff;Spats;Stomach Bulge;Story Arc;Tankoubon;Tanlines;Urethra Insertion;Zombie','Fan no Hitori',3.8),
+(100,'Ahegao;Diaper;Femdom;Group Sex;Handjob;Happy Sex;Large Breasts;Masturbation;Megane;Paizuri;Pegging;Pettanko;Sex Toys;Straight Shota;Tankoubon;Uncensored','Kito Sakeru',4.0),
+(101,'Ahegao;BBM / Fat Man;Bikini;Blowjob;Bondage;Corruption;Crossdressing;Defloration;Devil;Dick Growth;Femdom;French Kissing;Group Sex;Huge Penis;Lingerie;Magical Girl;Mind Control;Monster;Monster Girl;Nakadashi;Paizuri;Prostitution;School Uniform;Stockings;Symbol Shaped Pupils;Tattoo;Tentacles;Threesome;Trap;Virginity (Male);X-ray','Satou Kuuki',4.21),
+(102,'Ahegao;Anal;Blowjob;Crossdressing;Deepthroat;Double Penetration;Fingering;Full Color;Futa on Male;Gangbang;Group Sex;Handjob;Large Breasts;Licking;Lingerie;Pantyhose;Scat;Shemale;Slut;Spitroast;Stockings;Trap;Watersports;Yaoi','Ten no Katsuraya',4.04),
+(103,'Ahegao;Anal;Chastity Belt;Dark Skin;Futa on Male;Futanari;Hairy;Handjob;Happy Sex;Huge Penis;Large Breasts;Megane;Nakadashi;School Uniform;Sex Toys;Urethra Insertion;X-ray','Aimaitei Umami',3.86),
+(104,'Ahegao;Armpit;Band-Aid / Pasties;BBW;BDSM;Body Writing;Bodysuit;Bondage;Collar;Crotchless / Breastless;Dark Skin;Elf;Fingering;Gloves;Group Sex;Huge Breasts;Lactation;Large Breasts;Licking;Lowleg;Maledom;Megane;Mouth Gag;Nakadashi;Paizuri;Prostitution;School Uniform;Shimapan;Spanking;Stockings;Threesome;Twintails;X-ray','Yunioshi',3.66),
+(105,'Blowjob;Crossdressing;Elder Sister;Femdom;Footjob;Handjob;Humiliation;Incest;Large Breasts;Reverse Rape;School Uniform;Trap','Nishi Shizumu / Popuran',3.8),
+(106,'Blowjob;Crossdressing;Elder Sister;Femdom;Group Sex;Incest;Large Breasts;Nakadashi;Threesome;Trap','Nishi Shizumu / Popuran',3.94),
+(107,'Anal;Anilingus;Blindfold;Blowjob;Bondage;Crossdressing;Deepthroat;Dick Growth;Drugs;Elder Sister;Femdom;Futa on Male;Futanari;Incest;Large Breasts;Latex;Mind Break;Nakadashi;Reverse Rape;Royalty;Slut;Straight Shota;Trap','Sexyturkey',4.0),
+(108,'Ahegao;Anal;Bukkake;Chastity Belt;Defloration;Footjob;Hairy;Large Breasts;Nakadashi;Paizuri;Sex Toys;Story Arc;Sweating;X-ray','Tonnosuke',4.69),
+(109,'Anal;Corruption;Dark Skin;Deepthroat;Devil;Femdom;Futa on Male;Futanari;Futanari on Futanari;Gender Bender;Hairy;Hairy Armpits;Large Breasts;Monster Girl;Stockings;Tattoo;Transformation;Wings','Aimaitei Umami',4.02),
+(110,'Ahegao;Big Ass;Collar;Corruption;Exhibitionism;Femdom;Group Sex;Human Toilet;Large Breasts;MILF;Stockings','Mizuryu Kei',4.39),
+(111,'Anal;Crossdressing;Lingerie;Males only;Megane;Mind Control;Shota;Stockings;Trap;Yaoi','Morochin-san',4.19),
+(112,'Blowjob;Deepthroat;Exhibitionism;Large Breasts;Nakadashi;Spats;Uncensored','Itsutsuse',4.31),
+(113,'Blowjob;Incest;Inseki;Large Breasts;Nakadashi;School Uniform;Stockings;Uncensored;Yandere','Rama',4.64),
+(114,'Big Ass;Blowjob;Breast Sucking;Large Breasts;MILF;Nakadashi;Sweating;Teacher;Uncensored;X-ray','Okumoto Yuuta',4.65),
+(115,'Blowjob;Group Sex;Happy Sex;Large Breasts;MILF;Nakadashi;Oyakodon;School Uniform;Threesome;Tsundere;Tutor;Uncensored','Okumoto Yuuta',4.61),
+(116,'Breast Sucking;Femdom;Group Sex;Gyaru;Inverted Nipples;Large Breasts;Nakadashi;Short Hair;Stockings;Straight Shota;Tan;Tanlines;Threesome;Uncensored','Marui Maru',4.35),
+(117,'Ahegao;BBM / Fat Man;Blowjob;Cunnilingus;Dark Skin;Happy Sex;Large Breasts;Long Tongue;Monster Girl;Nakadashi;Oni;Sweating;Uncensored','Mizone',4.49),
+(118,'Blowjob;Cheating;Cunnilingus;Exhibitionism;Fangs;Handjob;Happy Sex;Monster Girl;Nakadashi;Paizuri;Short Hair;Stockings;Uncensored;Vampire','mogg',4.61),
+(119,'Blowjob;Devil;Layer Cake;Megane;Pettanko;Rape;Short Hair;Stockings;Tentacles;Uncensored;Wings','mogg',3.81),
+(120,'Anal;Big Ass;Dark Skin;French Kissing;Gyaru;Happy Sex;Large Breasts;Masturbation;School Uniform;Sex Toys;Short Hair;Symbol Shaped Pupils;Uncensored;X-ray','Puyocha | YO',4.63),
+(121,'Ahegao;Anal;Big Areola;Big Ass;Bikini;Bondage;Breast Sucking;Cheating;Decensored;Double Penetration;Enema;Femdom;Fisting;Gangbang;Group Sex;Hairy;Huge Breasts;Lactation;Large Breasts;Megane;MILF;Mind Control;Multiple Insertion;Netori;Pantyhose;Rape;Sex Toys;Story Arc;Strap-on;Swimsuit;Tankoubon;Threesome;Watersports','Kotoyoshi Yumisuke',4.16),
+(122,'Amputee;Anal;BBM / Fat Man;Bikini;Blindfold;Blowjob;Daughter;Deepthroat;DILF;Double Penetration;Femdom;Footjob;Gokkun;Group Sex;Imouto;Incest;Leg Lock;Loli;Mind Break;Rape;Reverse Rape;Short Hair;Spats;Spitroast;Stockings;Straight Shota;Swimsuit;Symbol Shaped Pupils;Tankoubon;Threesome;Virginity (Male);X-ray','Yamazaki Kana',3.84),
+(123,'Breast Sucking;Femdom;Nurse;Onahole;Paizuri;Pegging;Shota;Smug;Stockings;Straight Shota;Uncensored','HANABi',4.16),
+(124,'Big Ass;Defloration;Huge Breasts;Large Breasts;Lingerie;Nakadashi;School Uniform;Stockings','Enomoto Hidehira',4.47),
+(125,'Big Ass;Blowjob;Deepthroat;Large Breasts;Short Hair;Swimsuit;Uncensored;X-ray','ICHIGAN',4.72),
+(126,'Ahegao;Anilingus;Animal Girl;Bikini;Bloomers;Cervical Penetration;Collar;Defloration;Dog Girl;Femdom;Fox Girl;Group Sex;Huge Penis;Large Breasts;Nakadashi;Possession;School Uniform;Straight Shota;Swimsuit;Symbol Shaped Pupils;Threesome;X-ray;Yandere','Henkuma',4.07),
+(127,'Anal;Hairy;Huge Penis;Nakadashi;Squirting;Stomach Bulge;Vomit','John K. Pe-ta',4.06),
+(128,'Bikini;Cheating;Large Breasts;MILF;Straight Shota;Swimsuit;Virginity (Male)','Sugi G',4.56),
+(129,'Ahegao;Anal;Anilingus;Bathroom Sex;BBM / Fat Man;Blowjob;Bukkake;Dark Skin;Double Penetration;Gangbang;Group Sex;Gyaru;Lingerie;Loli;Nakadashi;Rape;Scat;Sex Toys;Slut;Squirting;Stomach Bulge;Symbol Shaped Pupils;Twintails;Virginity (Male);Watersports;X-ray','Nekomimi Kanon',3.9),
+(130,'Ahegao;Anal;Blowjob;Dark Skin;Group Sex;Large Breasts;Lingerie;Loli;Pantyhose;Stockings','Erect Sawaru',3.83),
+(131,'Anal;Crossdressing;Dark Skin;Devil;Gender Bender;Males only;Shota;Stockings;Succubus;Trap;Yaoi','Aichi Shiho',4.12),
+(132,'Anal;Crossdressing;Devil;Full Color;Males only;Shota;Stockings;Succubus;Trap;Yaoi','Aichi Shiho',3.87),
+(133,'Anal;Crossdressing;Dark Skin;Devil;Males only;Pantyhose;Shota;Succubus;Trap;Yaoi','Aichi Shiho',4.02),
+(134,'Anal;Crossdressing;Dark Skin;Devil;Males only;Shota;Succubus;Trap;Yaoi','Aichi Shiho',3.93),
+(135,'Anal;Crossdressing;Dark Skin;Devil;Males only;Shota;Trap;Yaoi','Aichi Shiho',4.35),
+(136,'Anal;Bondage;Crossdressing;Lingerie;Males only;Rape;Shota;Stockings;Trap;Yaoi','Matashita Kintama',4.15),
+(137,'Anal;Crossdressing;Lingerie;Males only;Shota;Trap;Yaoi','Mogiki Hayami',4.0),
+(138,'Ahegao;Anal;BDSM;Blowjob;Deepthroat;Elf;Huge Penis;Maebari;Maledom;Nakadashi;Sex Toys;Stockings','ishimura | ishimiso',4.34),
+(139,'Bukkake;Devil;Femdom;Full Color;Group Sex;Hat;Reverse Harem;Straight Shota;Succubus;Virginity (Male);Witch','ryuno',3.64),
+(140,'Femdom;Impregnation;Monster Girl;Reverse Rape;Straight Shota;Yandere','SOLOPIPB',4.56),
+(141,'Ahegao;Anal;Birth;Blowjob;Bodysuit;Bondage;Cervical Penetration;Double Penetration;Impregnation;Large Breasts;Mask;Mind Break;Monster;Mouth Gag;Multiple Insertion;Nakadashi;Parasite;Pregnant;Rape;Sex Toys;Stomach Bulge;Tentacles;Torn Clothing;X-ray','Marimo',2.94),
+(142,'Anal;Bestiality;Bondage;Collar;Defloration;DILF;Dog;Double Penetration;Gangbang;Group Sex;Incest;Large Breasts;Loli;Megane;Mind Break;Multiple Insertion;Pantyhose;Rape;School Uniform;Sex Toys;Stockings;Straight Shota;Tankoubon;Teacher','NOQ / Shimotsuki Juugo',3.33),
+(143,'Ahegao;Animal Girl;Asphyxiation;Blowjob;Collar;Fangs;Fox Girl;Loli;Maledom;Rape;Slave;Spanking;Stockings;Twins','Asanagi',3.65),
+(144,'Elf;Happy Sex;Large Breasts;Nakadashi;Paizuri;Piercings;Slave;Straight Shota;Symbol Shaped Pupils','Stealth Kaigyou',4.26),
+(145,'Ahegao;Anal;BBW;Blowjob;Deepthroat;Defloration;Drugs;French Kissing;Hotpants;Huge Penis;Large Breasts;Maledom;Nakadashi;Plump;Stockings;Symbol Shaped Pupils;Twintails;Yandere','Henkuma',4.47),
+(146,'Anal;BBW;Big Ass;Blowjob;Bride;Cheating;Childhood Friend;Cunnilingus;Deepthroat;Femdom;Footjob;Group Sex;Hairy;Hairy Armpits;Handjob;Happy Sex;Harem;Huge Breasts;Large Breasts;Licking;Masturbation;Megane;MILF;Nakadashi;Netorare;Paizuri;Plump;Reverse NTR;Short Hair;Squirting;Story Arc;Straight Shota;Sweating;Tankoubon;Teacher;Uncensored;Watersports;X-ray','Meme 50',4.24),
+(147,'BBW;Big Areola;Big Ass;Blowjob;Giantess;Grandmother;Group Sex;Huge Breasts;Incest;Large Breasts;Megane;MILF;Mind Control;Mother;Swimsuit','Jeanne DA''ck',3.52),
+(148,'Blowjob;Cheating;Dark Skin;Freckles;Group Sex;Large Breasts;Loli;MILF;Oyakodon;Swimsuit;Threesome','Jean Louis',4.07),
+(149,'Ahegao;Anal;Angel;BBM / Fat Man;Blowjob;Cheating;Condom;Elf;Happy Sex;Huge Penis;Large Breasts;Maid;Monster;Nakadashi;Orc;Paizuri;School Uniform;Slut;Stockings;Stomach Bulge;Story Arc;Symbol Shaped Pupils;Teacher;Virginity (Male);Voyeurism;Wings;X-ray','Sakai Nayuta',3.51),
+(150,'Femdom;Giantess;Incest;Large Breasts;Loli;Pantyhose;Watersports','Karaage Toiu Mei no Inu;Kuroneko Gata;Migumigu;Nokoppa',4.36),
+(151,'Full Color;Giantess;Large Breasts;Megane;MILF;Office Lady;Unbirthing','JUNNY | Gantai Penguin;Wakino Yoshifumi (new)',4.22),
+(152,'Elder Sister;Femdom;Footjob;Giantess;Incest;Large Breasts;School Uniform;Yuri','Amane Hasuhito;Korisei;Maririn',3.83),
+(153,'Femdom;Futa on Male;Futanari;Giantess;Large Breasts;Monster','Ai Souji;Kouki Kuu;Kurokawa Otogi;Migumigu',3.43),
+(154,'Femdom;Giantess;Large Breasts;School Uniform;Squirting','Mikemono Yuu;Nukunuku',4.33),
+(155,'BBW;Breast Sucking;Femdom;Giantess;Large Breasts;School Uniform;Unbirthing','Akatsuki Kochi;Yumano Yuuki',3.62),
+(156,'Ahegao;Anal;BBM / Fat Man;Blowjob;Cheating;Cunnilingus;Daughter;Defloration;Double Penetration;Face Sitting;Femdom;Footjob;Group Sex;Hairy;Harem;Hypnosis;Incest;Inverted Nipples;Lactation;Large Breasts;Maid;MILF;Mind Break;Mind Control;Nakadashi;Netori;Office Lady;Paizuri;Pantyhose;Rape;School Uniform;Sex Toys;Short Hair;Sixty-Nine;Spanking;Squirting;Stockings;Story Arc;Sweating;Symbol Shaped Pupils;Tankoubon;Threesome;Tomboy;Tutor;Watersports','Nikusoukyuu.',3.94),
+(157,'Ahegao;Animal Girl;Armpit;Blowjob;Catgirl;Collar;Cunnilingus;Dark Skin;Defloration;Fangs;Femdom;Foot Fetish;Footjob;Gyaru;Happy Sex;Impregnation;Kimono / Yukata;Large Breasts;Licking;Monster Girl;Nakadashi;Smell;Squirting;Sweating;Tall Girl;Watersports;X-ray','Suzuhane Suzu',4.41),
+(158,'Anal;Blowjob;Dark Skin;Deepthroat;Large Breasts;X-ray','Shimantogawa',4.31),
+(159,'Bikini;Collar;Dark Skin;Dragon Girl;Elf;Group Sex;Happy Sex;Harem;Lactation;Loli;Monster Girl;Stockings;Teacher','Takunomi',4.71),
+(160,'Anilingus;Bathroom Sex;Bikini;Devil;Femdom;Happy Sex;Large Breasts;Nakadashi;Prostate Massage;Straight Shota;Succubus;Swimsuit;Tentacles;X-ray','Pochi.',4.74),
+(161,'Ahegao;Defloration;Devil;Group Sex;Impregnation;Large Breasts;Loli;Mind Control;Monster Girl;Nakadashi;Netorare;Pregnant;Threesome;Vampire','mil',3.66),
+(162,'Ahegao;Anal;BBW;Big Ass;Blackmail;Exhibitionism;Hairy;Large Breasts;Masturbation;Sex Toys','Yokkora',3.68),
+(163,'Centaur;Comedy;Futa on Female;Futanari;Large Breasts;Maid;Monster Girl','ryuno',4.03),
+(164,'BBM / Fat Man;Blowjob;Fingering;Loli;Megane;Nakadashi;Prostitution;Slut;Small Penis;Smug;Stomach Bulge;Straight Shota;Twintails;Virginity (Male);X-ray','Atte7kusa',4.02),
+(165,'Aunt;Blackmail;Blowjob;Cheating;Condom;Full Color;Hairy;Incest;Large Breasts;MILF;Nakadashi;Short Hair;Story Arc;Straight Shota;X-ray','Kuroneko Smith',4.6),
+(166,'Anal;Aunt;Blowjob;Cheating;Condom;Emotionless Sex;Full Color;Hairy;Impregnation;Incest;Masturbation;Megane;MILF;Nakadashi;Pregnant;Stockings;Straight Shota;X-ray','Kuroneko Smith',4.55),
+(167,'Anal;Big Ass;Blindfold;Bondage;Crossdressing;Crotchless / Breastless;Femdom;Group Sex;Hairy;Harem;Kimono / Yukata;Large Breasts;Latex;Megane;MILF;Nakadashi;Paizuri;Sex Toys;Story Arc;Straight Shota;Tall Girl;Tankoubon;Threesome;Yuri','Takasugi Kou',4.46),
+(168,'Anal;Crossdressing;Father;Incest;Lingerie;Males only;Shota;Trap;Yaoi','Shigemiya Kyouhei',4.26),
+(169,'Ahegao;Blowjob;Crotchless / Breastless;Pantyhose;Sumata','Minazuki Tsuyuha',4.31),
+(170,'Bikini;Blowjob;Deepthroat;Happy Sex;Nakadashi;Paizuri;Swimsuit;X-ray','Herio',4.67),
+(171,'Bondage;Dark Skin;Femdom;Huge Penis;Lactation;Large Breasts;Nakadashi;Rape;Reverse Rape;Virginity (Male)','LEYMEI',4.41),
+(172,'Anal;Bondage;Full Color;Human Toilet;Nakadashi;Prostitution;Rape;Stockings;Stuck in Wall','Blast',4.02),
+(173,'Animal Girl;Bikini;Blowjob;Fox Girl;Happy Sex;Large Breasts;Nakadashi;Onsen;Swimsuit','Natsume Eri',4.68),
+(174,'Ahegao;Anal;Blackmail;Bondage;Bukkake;Collar;Deepthroat;Defloration;DILF;Double Penetration;Group Sex;Large Breasts;Nakadashi;Paizuri;Rape;Slave;Spats','sugarBt',3.82),
+(175,'Asphyxiation;BDSM;Blindfold;Bondage;Defloration;DILF;Exhibitionism;Large Breasts;Maledom;Nakadashi;Onsen;Prostitution;School Uniform;Spanking;X-ray','Shiki Takuto',4.12),
+(176,'Anilingus;Cosplay;Devil;Femdom;Large Breasts;Paizuri;School Uniform;Smug;Stockings;Succubus','stem',4.21),
+(177,'Gender Bender;Large Breasts;Leg Lock;X-ray','Seanji Sariel',3.88),
+(178,'BBM / Fat Man;Blowjob;Happy Sex;Incest;Loli;Nakadashi;Niece;Prostitution','Isawa Nohri',3.88),
+(179,'Ahegao;Breast Sucking;Defloration;Femdom;Imouto;Impregnation;Incest;Lactation;Large Breasts;Nakadashi;Stockings;Symbol Shaped Pupils;Watersports;Yandere','Kirin Kakeru',4.14),
+(180,'Anal;Blindfold;Bondage;Crossdressing;Crotchless / Breastless;Femdom;Group Sex;Hairy;Harem;Kimono / Yukata;Large Breasts;Latex;Megane;MILF;Paizuri;Pegging;Sex Toys;Strap-on;Tall Girl;Threesome;Yuri','Takasugi Kou',4.12),
+(181,'Anal;Crossdressing;Hotpants;Males only;Nakadashi;Shota;Slut;Symbol Shaped Pupils;Trap;X-ray;Yaoi','Shimaji',4.44),
+(182,'BBM / Fat Man;Blowjob;French Kissing;Happy Sex;Incest;Loli;Niece','Sakurafubuki Nel',3.88),
+(183,'Anal;Crossdressing;Males only;Shota;Trap;Yaoi','Katou Jun',4.37),
+(184,'Bikini;Gender Bender;Large Breasts;Maid;Stockings;Straight Shota;Swimsuit','Maruneko',3.67),
+(185,'Band-Aid / Pasties;Comedy;Devil;Furry;Large Breasts;Monster Girl;Prostitution','Kemonono',4.29),
+(186,'Ahegao;Anal;Blackmail;Blowjob;Bukkake;Defloration;Double Penetration;Drugs;Filming;Group Sex;Large Breasts;Nakadashi;Rape;School Uniform;Sleeping;X-ray','Makigai Ikko',1.67),
+(187,'Cow Girl;Dark Skin;Impregnation;Muscle','Danchino',4.2),
+(188,'Blowjob;Childhood Friend;Drunk;Happy Sex;Large Breasts;Lingerie;Nakadashi;Uncensored','Poccora',4.47),
+(189,'Anal;Cosplay;Crossdressing;Handjob;Incest;Males only;Nakadashi;Symbol Shaped Pupils;Trap;Uncle;Yaoi','Kirimoto Yuuji',4.59),
+(190,'Anal;Group Sex;Multiple Insertion;Nakadashi;Piercings;Straight Shota;Threesome','Ayano Naoto',3.0),
+(191,'Femdom;Footjob;Handjob;Large Breasts;Paizuri;Pantyhose;Smug;Swimsuit','Kemigawa Mondo',3.88),
+(192,'Anal;Cheating;Elder Sister;Femdom;Hairy;Incest;Netori;Straight Shota','Tsubaki Jushiro',3.72),
+(193,'BBM / Fat Man;BBW;Big Areola;Big Ass;Condom;Dark Skin;Full Color;Hairy;Hairy Armpits;Huge Breasts;Incest;Inverted Nipples;Large Breasts;MILF;Mother;Muscle;Spanking;Stomach Bulge','Kunaboto',3.55),
+(194,'BBM / Fat Man;Bikini;Bodysuit;Defloration;Full Color;Hairy;Huge Breasts;Large Breasts;Muscle','Kunaboto',3.07),
+(195,'Bestiality;Freckles;Full Color;Horse;Large Breasts;Stomach Bulge','Kunaboto',3.71),
+(196,'Ahegao;Anal;Blowjob;Bukkake;Double Penetration;Gangbang;Group Sex;Kunoichi;Lactation;Large Breasts;Latex;Mind Break;Nose Hook;Rape;Spitroast;Tentacles','R-Wade',3.47),
+(197,'Ahegao;Anal;Blowjob;Bodysuit;Breast Sucking;Double Penetration;Drugs;Gangbang;Group Sex;Horse;Impregnation;Kunoichi;Latex;Mind Break;Monster;Nakadashi;Orc;Paizuri;Rape;X-ray','R-Wade',3.36),
+(198,'Ahegao;Anal;Blowjob;Bondage;Christmas;Crossdressing;Exhibitionism;Group Sex;Males only;Megane;Mind Break;Mouth Gag;Rape;Sex Toys;Shota;Trap;Yaoi','Kotoko',3.78),
+(199,'Ahegao;Bestiality;Blindfold;Bondage;Defloration;Femdom;Group Sex;Lactation;Large Breasts;Mind Break;Monster;Nakadashi;Orgasm Denial;Rape;Sex Toys;Shibari;Tentacles;X-ray','Mifune Seijirou',4.0),
+(200,'Ahegao;Anal;Anilingus;Bikini;Bisexual;Bloomers;Blowjob;Bondage;Bukkake;Daughter;Defloration;DILF;Double Penetration;Face Sitting;Femdom;Foot Fetish;Footjob;Group Sex;Happy Sex;Imouto;Impregnation;Incest;Inseki;Loli;Maledom;Megane;Nakadashi;Niece;Oppai Loli;Pantyhose;Randoseru;School Uniform;Sixty-Nine;Slut;Smell;Spats;Spitroast;Squirting;Stockings;Swimsuit;Tankoubon;Tanlines;Teacher;Threesome;Tribadism;Twintails;Watersports;Yuri','Gengorou',4.43),
+(201,'Cheating;Childhood Friend;Dark Skin;Deepthroat;Defloration;Face Sitting;Femdom;Happy Sex;Incest;Kimono / Yukata;Large Breasts;MILF;Pettanko;School Uniform;Squirting;Tankoubon;Uncensored','Shiomaneki',4.64),
+(202,'Ahegao;Blowjob;Comedy;Crossdressing;Delusion;Futanari;Group Sex;Licking;Mind Break;Monster;Nakadashi;Rape;Spitroast;Squirting;Sweating;Symbol Shaped Pupils;Tankoubon;Threesome;Time Stop','Gesundheit',3.96),
+(203,'Blowjob;Condom;Decensored;Femdom;Group Sex;Large Breasts;Nakadashi;Swinging / Netorase','Hiroshiki',3.64),
+(204,'Ahegao;Anal;Brain Fuck;Corruption;Femdom;Futa on Male;Futanari;Group Sex;Mind Break;Muscle;Rape;Short Hair;Tentacles;Transformation','Akuochisukii Sensei',2.75),
+(205,'Ahegao;Chikan;Devil;Fangs;Gender Bender;Large Breasts;Mind Break;Monster Girl;Rape;Succubus;Symbol Shaped Pupils','Usuki',3.76),
+(206,'Anal;French Kissing;Handjob;Males only;Shota;Trap;X-ray;Yaoi','Nagi Ichi',4.2),
+(208,'Ahegao;Anal;Animal Girl;BBW;Big Ass;Bloomers;Condom;Happy Sex;Large Breasts','Jun',4.6),
+(210,'Ahegao;Animal Girl;BBM / Fat Man;Blowjob;Comedy;Dark Skin;Decensored;Happy Sex;Long Tongue;Megane;Spats;Squirting;Swimsuit;Symbol Shaped Pupils;Tan;Tanlines','Jun',4.54),
+(211,'Animal Boy;Defloration;Elf;Large Breasts;Straight Shota','Konshin',4.29),
+(212,'Blowjob;Decensored;Deepthroat;Defloration;Emotionless Sex;Gokkun;Maid;Paizuri;School Uniform;X-ray','Seto Yuki',4.31),
+(213,'Blackmail;Blowjob;Decensored;Deepthroat;Dirty Old Man;Large Breasts;Maid;Megane;Paizuri;School Uniform','Seto Yuki',4.23),
+(214,'Happy Sex;Large Breasts;Megane;School Uniform','Seto Yuki',4.42),
+(215,'Big Ass;Blowjob;Happy Sex;Large Breasts;Megane;Stockings;Watersports','Seto Yuki',3.92),
+(216,'Anal;Blowjob;Defloration;Gender Bender;Large Breasts;Rape;Tentacles;Transformation','Aji Pontarou',3.8),
+(217,'Ahegao;Anal;BBM / Fat Man;Body Writing;Dark Skin;Defloration;Double Penetration;Group Sex;Mind Break;Rape;Threesome;Twintails','774 / Nanashi',2.71),
+(218,'Anal;Double Penetration;Gyaru;Monster;Orc;Reverse Harem;Slut','ryuno',3.83),
+(219,'Ahegao;Anal;Anilingus;Bestiality;Blowjob;Dog;Fundoshi;Group Sex;Males only;Mind Break;Muscle;Nakadashi;Rape;Shota;Symbol Shaped Pupils;Yaoi','wotasu',3.59),
+(220,'Bisexual;Crossdressing;Dark Skin;Femdom;Futa on Male;Gender Bender;Group Sex;Pegging;Rape;Shemale;Sleeping;Stockings;Stomach Bulge;Story Arc;Tankoubon;Trap;Yaoi;Yuri','Matsutou Tomoki',3.92),
+(221,'Ahegao;Blowjob;Condom;Cousin;Cunnilingus;Drugs;Femdom;Filming;Group Sex;Happy Sex;Inseki;Large Breasts;Megane;Nakadashi;Paizuri;Pantyhose;School Uniform;Stockings;Story Arc;Tankoubon;Threesome;X-ray','Sasamori Tomoe',4.73),
+(222,'Anal;Bikini;Bukkake;Double Penetration;Gokkun;Group Sex;Lactation;Magical Girl;Piercings;Swimsuit','INAZUMA.',4.4),
+(223,'Ahegao;Armpit;Bikini;Blowjob;Bukkake;French Kissing;Group Sex;Handjob;Lactation;Large Breasts;Lingerie;Megane;Nakadashi;Paizuri;Stockings;Straight Shota;Virginity (Male);Watersports','INAZUMA.',3.93),
+(224,'Anal;Futanari;Futanari on Futanari;Group Sex;Large Breasts;Male on Futa;Megane;Nurse;Shemale;Stockings;Threesome','Mogiki Hayami;The Amanoja9',4.0),
+(225,'Catgirl;Furry;Happy Sex;Nakadashi;Short Hair','Tamanosuke',4.47),
+(226,'Group Sex;Large Breasts;Maid;Megane;Prostitution;Stockings;Threesome','Shono Kotaro',3.55),
+(227,'Ahegao;Anal;Crossdressing;Devil;Maledom;Males only;Mind Break;Orgasm Denial;Prostate Massage;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Dibi',3.85),
+(228,'Blowjob;Bondage;Femdom;Group Sex;Large Breasts;Monster Girl;Nakadashi;Reverse Rape;Slave;X-ray','aho / AHOBAKA',3.59),
+(229,'Ahegao;Anal;BBM / Fat Man;Blowjob;Deepthroat;Double Penetration;Human Toilet;Idol;Large Breasts;Nakadashi;Prostitution;Rape;Vomit;X-ray','Takato Kurosuke',2.75),
+(230,'Anal;Blackmail;Blowjob;Breast Sucking;Cheating;Decensored;Dirty Old Man;Double Penetration;Ghost;Hairy;Incest;Kimono / Yukata;Lactation;Large Breasts;Megane;MILF;Mind Control;Possession;Rape;Sleeping','KONKIT',3.73),
+(231,'Ahegao;Anal;Bikini;Blowjob;Cheating;Dark Skin;Hairy;Huge Penis;Lactation;Large Breasts;Megane;MILF;Swimsuit','KONKIT',3.97),
+(232,'Blowjob;Breast Sucking;Cheating;DILF;Kimono / Yukata;Large Breasts;Megane;MILF;Nakadashi;Paizuri;Rape;Smegma;Sweating;Virginity (Male);Voyeurism','KONKIT',3.45),
+(233,'Defloration;Elder Sister;Happy Sex;Huge Breasts;Incest;Large Breasts;Nakadashi;Paizuri;Tall Girl','Hakkyou Daioujou',4.69),
+(234,'Anal;Elf;Fingering;Males only;Prostate Massage;Shota;Trap;Yaoi','Dibi',3.46),
+(235,'Anal;Males only;Trap;Yaoi','Suemitsu Dicca',4.11),
+(236,'Blowjob;Cunnilingus;DILF;Exhibitionism;Loli;Nakadashi;Prostitution;Squirting;Transparent Clothing','Zanzi',3.97),
+(237,'Foot Fetish;Footjob;Happy Sex;Idol;Smell;Stockings;Sweating','Shinooka Homare',4.56),
+(238,'Femdom;Foot Fetish;Footjob;Idol;Nakadashi;Smell;Stockings','Shinooka Homare',4.57),
+(239,'Condom;Femdom;Footjob;French Kissing;Idol;Pantyhose;Smell;Sumata','Shinooka Homare',4.55),
+(240,'Armpit;Bloomers;Cosplay;Face Sitting;Femdom;Foot Fetish;Footjob;Handjob;Idol;Prostate Massage;Smell;Stockings;Sweating','Shinooka Homare',4.73),
+(241,'Defloration;Femdom;Footjob;Happy Sex;Idol;Short Hair;Symbol Shaped Pupils','Shinooka Homare',3.9),
+(242,'Ahegao;Body Modification;Brain Fuck;Breast Expansion;Bukkake;Cervical Penetration;Corruption;Dark Skin;Dick Growth;Ear Fuck;Futanari;Group Sex;Huge Penis;Large Breasts;Mind Break;Mind Control;Monster Girl;Nakadashi;Nipple Penetration;Rape;Spreading;Squirting;Stockings;Stomach Bulge;Tentacles','Chimosaku',3.77),
+(243,'Ahegao;Anal;BBW;Big Ass;Blowjob;Bunnygirl;Dark Skin;Double Penetration;Footjob;Group Sex;Gyaru;Large Breasts;Monster Girl;Nakadashi','Mizuryu Kei;Sugiura Sen',3.69),
+(244,'Ahegao;Anal;Bikini;Blowjob;Exhibitionism;Group Sex;Gyaru;Large Breasts;Loli;Short Hair;Slut;Stockings;Swimsuit;Tan;Tanlines','Mizuryu Kei;Sugiura Sen',4.06),
+(245,'Ahegao;Blowjob;Fairy;Group Sex;Gyaru;Lingerie;Monster Girl;Nakadashi;Short Hair;Slut;Stockings;Sweating;Symbol Shaped Pupils;Tan;Tengu','Mizuryu Kei;Sugiura Sen',3.83),
+(246,'Blowjob;Large Breasts;Nakadashi;Prostitution;Stockings','Kosuke Haruhito',4.0),
+(248,'Crossdressing;Femdom;Gender Bender;Impregnation;Large Breasts;Nakadashi;Stockings;Twintails;Yandere','Sumisuzu',3.84),
+(249,'Bondage;Full Color;Large Breasts;Sleeping;Stockings','Ajishio',4.38),
+(250,'Blowjob;Dark Skin;Elf;Filming;Nakadashi;Nun;Stockings','BANG-YOU | Didori',4.23),
+(251,'Anal;Anilingus;Big Ass;Blowjob;French Kissing;Happy Sex;Large Breasts;Leotard;MILF;Nakadashi;Stockings;Sweating','Miyamoto Issa',4.39),
+(252,'Ahegao;Amputee;Animal Girl;Catgirl;Elf;Fairy;Large Breasts;Mind Break;Monster;Petrification;Rape;Witch','Amagi Michihito',2.75),
+(253,'Ahegao;Anal;Bodysuit;Filming;Giantess;Group Sex;Mind Break;Nipple Penetration;Sex Toys;Time Stop','Hisui',3.6),
+(254,'Anal;BBW;Big Areola;Big Ass;Blowjob;Bondage;Double Penetration;Drugs;Fingering;Group Sex;Huge Breasts;Huge Penis;Lactation;Large Breasts;Stomach Bulge;Sweating;Tattoo','Bonten',3.8),
+(255,'Ahegao;BBW;Big Ass;Blowjob;Breast Sucking;Full Color;Group Sex;Huge Breasts;Lactation;Large Breasts;Leg Lock;Licking;MILF;Nakadashi;Paizuri;Rape;Straight Shota;Virginity (Male);X-ray','Psycho Jenny',3.81),
+(256,'Breast Sucking;Happy Sex;Lactation;Large Breasts;MILF;Nakadashi;Paizuri;Stockings;Straight Shota','Suihei Sen',4.5),
+(257,'Blowjob;Dirty Old Man;Loli;Nakadashi;Pet Girl','Atte7kusa',3.98),
+(258,'Blowjob;Elder Sister;Femdom;Happy Sex;Incest;Inseki;Large Breasts;Nakadashi;Sleeping;Spats;Straight Shota;Sweating;X-ray','Una-don',4.51),
+(259,'Blowjob;Childhood Friend;Defloration;Femdom;French Kissing;Happy Sex;Large Breasts;Nakadashi;Paizuri;Short Hair;Virginity (Male)','Ketsuyuki Tamon',4.65),
+(260,'Blowjob;Childhood Friend;Defloration;Gyaru;Happy Sex;Large Breasts;Nakadashi;School Uniform;Twintails;Virginity (Male);X-ray','Iroito',4.65),
+(261,'Blowjob;Freckles;Large Breasts','Ootsuka Mahiro',4.44),
+(262,'Ahegao;Big Ass;Blowjob;Bodysuit;Bondage;DILF;Group Sex;Hairy;Huge Penis;Large Breasts;Long Tongue;Mind Break;Monster;Multiple Penises;Nakadashi;Rape;Selfcest;Smell;Stomach Bulge;Threesome;Transformation','Azukiko',3.62),
+(263,'Blowjob;Defloration;Femdom;Nakadashi;Stockings','Yomoyama Akira',4.03),
+(264,'Femdom;Gloves;Hairy;Leg Lock;MILF;Nakadashi;Orgasm Denial;Straight Shota;Sweating;Trap','Yunioshi',4.27),
+(265,'Blowjob;Group Sex;Loli;Short Hair;Threesome','MA-SA',4.29),
+(266,'Ahegao;Big Ass;Bikini;Catgirl;Collar;Full Color;Hairy;Hairy Armpits;Huge Breasts;Huge Penis;Lactation;Large Breasts;Mind Control;Muscle;Nakadashi;Stockings;Stomach Bulge;Swimsuit','Kunaboto',3.25),
+(267,'Ahegao;Blowjob;Breast Sucking;Crossdressing;Femdom;Group Sex;Harem;Large Breasts;Paizuri;Smegma','Mifune Seijirou',4.0),
+(268,'Anal;Blowjob;Cheating;Full Color;Hairy;Handjob;Incest;Inseki;Large Breasts;MILF;Mother;Nakadashi;Naked Apron;Sleeping','',4.18),
+(269,'Anal;Big Ass;Crossdressing;Femdom;Full Color;Futa on Male;Futanari;Handjob;Huge Breasts;Huge Penis;Incest;Large Breasts;Masturbation;Megane;MILF;Mother;Pegging;Reverse Rape;Shota;Sleeping;Trap;Voyeurism','Gumumu',3.78),
+(270,'Ahegao;Anal;Blowjob;Cheating;Deepthroat;Double Penetration;Footjob;Gender Bender;Group Sex;Imouto;Incest;Inseki;Kimono / Yukata;Lactation;Nakadashi;Pettanko;School Uniform;Stockings;Story Arc;Threesome;Twins;Urethra Insertion;X-ray','Momoiro Manjiru',4.18),
+(271,'Femdom;Foot Fetish;Footjob;Giantess;Micro;Pantyhose;Stockings;Story Arc;Unbirthing;Yuri','Kanaisei Jitenshasougyou',3.48),
+(272,'CBT;Fangs;Femdom;Foot Fetish;Footjob;Giantess;Group Sex;Imouto;Incest;Micro;Mother;Oyakodon;Pegging;Reverse Rape;Smell;Threesome;Twintails;Witch','Kanaisei Jitenshasougyou',1.86),
+(273,'Anal;Bondage;Fangs;Femdom;Footjob;Monster Girl;Smug;Vampire;Wings','MA-SA',4.33),
+(274,'Ahegao;Defloration;Gender Bender;Group Sex;Large Breasts;Leg Lock;Teacher','Kakashi Asahiro',4.05),
+(275,'Blowjob;Body Swap;Gender Bender;Handjob;Pantyhose;Short Hair;Stockings;Sweating;Teacher;Virginity (Male)','Kakashi Asahiro',3.7),
+(276,'Ahegao;Dark Skin;Femdom;French Kissing;Full Color;Group Sex;Harem;Large Breasts;Nakadashi;Straight Shota;Sweating;Tall Girl;X-ray','Kakuzatou',3.64),
+(279,'Happy Sex;Insect Girl;Monster Girl;Nakadashi;Short Hair;Slave','Toumasu | Kanemaki Thomas',4.49),
+(280,'Anal;Big Ass;Dirty Old Man;Elf;Large Breasts;Military Uniform;Mind Break;Paizuri;Pantyhose;Rape;Sex Toys','Kanten',2.95),
+(281,'Anal;Blowjob;Double Penetration;Drugs;Fingering;Group Sex;Hairy;Huge Penis;Impregnation;Large Breasts;Mind Break;Monster;Orc;Paizuri;Pregnant;Rape;Stomach Bulge;Vampire;Witch;X-ray','Fumizuki Misoka',3.26),
+(282,'Anal;Blowjob;Fingering;Futanari;Futanari on Futanari;Group Sex;Handjob;Large Breasts;Male on Futa;Masturbation;Nakadashi;Short Hair;Spreading;Tan;Tanlines;Threesome;Tomboy;X-ray','Kurenai Yuuji',4.46),
+(283,'Anal;Blowjob;Cheating;Crossdressing;Maid;Males only;Nakadashi;Orgasm Denial;Shota;Stockings;Trap;Yaoi','Menoko',4.4),
+(284,'Ahegao;Breast Sucking;Gender Bender;Imouto;Incest;Inseki;Large Breasts;Masturbation;Nakadashi;Short Hair;Sweating','Kakashi Asahiro',3.74),
+(285,'Ahegao;Anal;Blowjob;Bukkake;Crotchless / Breastless;Defloration;Double Penetration;Group Sex;Huge Penis;Kunoichi;Large Breasts;Mind Break;Nakadashi;Netori;Possession;Sleeping;Spats;Symbol Shaped Pupils;Voyeurism','Sahara Wataru',4.31),
+(286,'Blowjob;Collar;Dark Skin;Dog Girl;Femdom;Gyaru;Huge Penis;Large Breasts;Latex;Leg Lock;Mind Control;Nakadashi;Pet Girl;Stockings;Threesome;Transformation;Virginity (Male);Witch;X-ray','Kakashi Asahiro',4.47),
+(287,'Condom;Femdom;Happy Sex;Insect Girl;Monster Girl;Short Hair','Toumasu | Kanemaki Thomas',4.57),
+(288,'Ahegao;Blowjob;Childhood Friend;Comedy;Footjob;Happy Sex;Impregnation;Incest;Large Breasts;Nakadashi;X-ray','Okunoha',4.68),
+(289,'Condom;Cunnilingus;Defloration;Filming;Happy Sex;Nakadashi;Pettanko;Spats;Sweating;Tan;Tanlines;Tomboy;Virginity (Male);X-ray','Momonosuke',4.34),
+(290,'Ahegao;Band-Aid / Pasties;DILF;Face Sitting;Full Color;Group Sex;Harem;Impregnation;Lactation;Leg Lock;Mind Control;Nakadashi;Netori;Pregnant;Short Hair;Stockings;Symbol Shaped Pupils;Threesome','Hozumi Kenji',3.55),
+(291,'Blowjob;Cosplay;Drunk;Filming;Full Color;Large Breasts;Megane;Nakadashi;Office Lady;Pantyhose;Short Hair','ClownCulture',4.05),
+(292,'Bisexual;Blackmail;Blowjob;Catgirl;Cheating;Collar;Cosplay;Filming;Full Color;Large Breasts;Megane;Reverse Rape;Short Hair;Tomboy;Watersports;Yuri','ClownCulture',4.05),
+(293,'Big Ass;Blowjob;Cosplay;Defloration;Full Color;Hotpants;Large Breasts;Megane;Nakadashi;Office Lady;Pantyhose;Short Hair;Stockings;Virginity (Male)','ClownCulture',4.41),
+(294,'Blowjob;Dark Skin;Full Color;Gyaru;Hairy Armpits;Handjob;Large Breasts;Megane;Muscle;Paizuri;Piercings;Short Hair;Smell;Sweating','mega w',3.56),
+(295,'Breast Expansion;Corruption;Dark Skin;Drugs;Full Color;Gyaru;Loli;Mind Control','',3.57),
+(296,'Blowjob;Collar;Dark Skin;Femdom;Footjob;Full Color;Group Sex;Gyaru;Hairy Armpits;Harem;Large Breasts;Loli;Megane;Mind Control;Nakadashi;Paizuri;Piercings;School Uniform;Slut;Tattoo','',3.5),
+(297,'Blowjob;Corruption;Dark Skin;Full Color;Gyaru;Imouto;Incest;Megane;Mind Break;Piercings;Prostitution;School Uniform','',3.55),
+(298,'Ahegao;Corruption;Dark Skin;Exhibitionism;Full Color;Gyaru;Loli;Mind Control;Piercings;Tattoo','',3.51),
+(299,'Ahegao;BBW;Big Areola;Big Ass;Body Modification;Breast Expansion;Dark Skin;Full Color;Gyaru;Hairy;Hairy Armpits;Huge Breasts;Large Breasts;Leg Lock;Mind Control;Nakadashi;Piercings;School Uniform;Smell;Stockings;Tattoo;Transformation','mega w',2.39),
+(300,'Bondage;Defloration;Femdom;Group Sex;Guro;Orgasm Denial;Snuff;Stockings;Story Arc;Threesome;Urethra Insertion;Yuri','Kabuki Shigeyuki',4.08),
+(301,'Animal Girl;Bisexual;Blowjob;Group Sex;Happy Sex;Lamia;Long Tongue;Monster Girl;Pettanko;Threesome','Toumasu | Kanemaki Thomas',4.48),
+(302,'BBM / Fat Man;Blowjob;Eyepatch;Fangs;Loli;Nakadashi;Stockings;Sweating;X-ray','Kamita',4.19),
+(303,'Blowjob;Full Color;Guro;Masturbation;Snuff;Stockings','chunlieater',3.23),
+(304,'Blowjob;Bondage;Full Color;Guro;Snuff;Yuri','chunlieater',3.07),
+(305,'Foot Fetish;Footjob;Full Color;Guro;Leotard;Masturbation;Office Lady;Pantyhose;Ryona;Snuff;Stockings','chunlieater',2.67),
+(306,'Femdom;Freckles;French Kissing;Giantess;Masturbation;Micro;School Uniform;Vore','Kanaisei Jitenshasougyou',3.27),
+(307,'Bondage;Collar;Femdom;Footjob;Giantess;Imouto;Micro;Orgasm Denial;Virginity (Male)','Kanaisei Jitenshasougyou',3.37),
+(308,'Anal;Bukkake;Collar;Double Penetration;Group Sex;Megane;Rape','Shinama',3.92),
+(309,'Bondage;Face Sitting;Femdom;Footjob;Group Sex;Maid;Short Hair;Straight Shota;Threesome','Kanaisei Jitenshasougyou',3.43),
+(310,'BDSM;Bondage;Collar;Dog Girl;Exhibitionism;Hairy;Happy Sex;Large Breasts;Maledom;Nakadashi;Pet Girl;Stockings;Watersports','Kanaisei Jitenshasougyou',3.6),
+(311,'Ahegao;Anal;Blowjob;Bukkake;Cervical Penetration;Dick Growth;Double Penetration;Futa on Female;Futanari;Group Sex;Huge Penis;Magical Girl;Multiple Insertion;Nakadashi;Pettanko;Rape;Stockings;Threesome;Voyeurism;Wings','Shinama',3.95),
+(312,'Blowjob;Collar;Fingering;Group Sex;Nakadashi;Stockings;Threesome','Katase Minami',3.82),
+(313,'Anal;BDSM;Blowjob;Bondage;Breast Expansion;Bukkake;Bunnygirl;Childhood Friend;Chinese Dress;Cosplay;Cunnilingus;Defloration;Elder Sister;Femdom;Group Sex;Harem;Impregnation;Incest;Large Breasts;Lingerie;Maid;Maledom;Nakadashi;Naked Apron;Office Lady;Paizuri;Pantyhose;Reverse Rape;School Uniform;Sex Toys;Sixty-Nine;Stalking;Voyeurism;X-ray;Yandere','Katsurai Yoshiaki',4.8),
+(314,'Bride;Cheating;Drunk;Elder Sister;Incest;Large Breasts;Nakadashi;Stockings','Katsurai Yoshiaki',4.57),
+(315,'Gloves;Kunoichi;Large Breasts;Nakadashi;Paizuri;Stockings','Akiduki Akina',4.42),
+(316,'Aunt;Blowjob;Cunnilingus;Decensored;Hairy;Happy Sex;Large Breasts;Lingerie;MILF;Nakadashi;Transparent Clothing;Voyeurism','Mitarashi Kousei',4.67),
+(317,'Large Breasts;Megane;Mind Control','Tachikawa Negoro',3.14),
+(318,'Ahegao;BBM / Fat Man;Condom;Corruption;Double Penetration;Group Sex;Loli;Magical Girl;Mind Control;Symbol Shaped Pupils;Tattoo;X-ray','Aoi Masami',3.8),
+(319,'Bathroom Sex;Decensored;French Kissing;Loli;Nakadashi;Prostitution;Short Hair','Kiya Shii',4.38),
+(320,'Anilingus;Cunnilingus;Decensored;Defloration;Fingering;Loli;Nakadashi;Prostitution;Rape;Stockings;Tsundere','Kiya Shii',4.36),
+(321,'Blowjob;Decensored;Defloration;Group Sex;Happy Sex;Licking;Loli;Prostitution;Short Hair;Sumata;Threesome','Kiya Shii',4.42),
+(322,'Armpit;Blowjob;Decensored;Footjob;Loli;Nakadashi;Prostitution;Short Hair;Sumata','Kiya Shii',4.39),
+(323,'Bathroom Sex;Condom;Decensored;Footjob;Handjob;Loli;Prostitution;Stockings','Kiya Shii',4.44),
+(324,'Anilingus;Blowjob;Cheating;Decensored;Femdom;Happy Sex;Loli;Megane;Prostate Massage;Swinging / Netorase','Kiya Shii',4.26),
+(325,'Decensored;Loli;Prostitution','Kiya Shii',4.24),
+(326,'Decensored;Loli;Prostitution;Watersports','Kiya Shii',4.03),
+(327,'Blowjob;Deepthroat;Femdom;Nakadashi;School Uniform;X-ray','Minarai Zouhyou',3.76),
+(328,'Big Areola;Dark Skin;Defloration;Hairy Armpits;Huge Breasts;Inverted Nipples;Lactation;Large Breasts;Leg Lock;Muscle;Smell;Tall Girl','Tsukiyo',3.63),
+(329,'Guro;Human Cattle;Impregnation;Megane;Pregnant;Rape;Snuff','Kasuga;Kasuga Tousen',2.9),
+(330,'Ahegao;Bondage;Cheating;Cunnilingus;Defloration;Exhibitionism;Femdom;Footjob;Group Sex;Happy Sex;Impregnation;Layer Cake;Leg Lock;Megane;Nakadashi;Orgasm Denial;Reverse Rape;School Uniform;Sex Toys;Story Arc;Sweating;Threesome;Voyeurism;X-ray;Yandere','Tarakan',4.43),
+(331,'Bikini;Blowjob;Dark Skin;Large Breasts;Nakadashi;Swimsuit','Tenken',4.44),
+(332,'Big Ass;Bodysuit;Dark Skin;Full Color;Happy Sex;Huge Breasts;Kunoichi;Large Breasts','Aoi Nagisa',4.6),
+(333,'Cunnilingus;Defloration;Emotionless Sex;Happy Sex;Large Breasts;Nakadashi;Paizuri;Robot Girl;School Uniform;Stockings','Tomonaga Kenji',4.51),
+(334,'Anilingus;BDSM;Dark Skin;Drugs;Femdom;Fisting;French Kissing;Hat;Large Breasts;Nakadashi;Piercings;Spanking;Stomach Bulge;Straight Shota;Voyeurism;X-ray','uraura',4.31),
+(335,'Ahegao;Drugs;Large Breasts;Masturbation;Mind Break;Monster;Rape;Squirting;Tentacles;Vore;Watersports;X-ray','Makari Tohru',3.89),
+(336,'Ahegao;Bondage;Mind Break;Monster;Squirting;Tentacles;Vore','Makari Tohru',4.14),
+(337,'Ahegao;Anal;Bondage;Breast Sucking;Double Penetration;Drugs;Fingering;Mind Break;Monster;Multiple Insertion;Rape;Squirting;Tentacles;Vore;Watersports;X-ray;Yuri','Makari Tohru',4.33),
+(338,'Ahegao;Anal;Birth;Cunnilingus;Double Penetration;Egg Laying;Face Sitting;Impregnation;Licking;Mind Break;Monster;Nakadashi;Pregnant;Squirting;Stomach Bulge;Tentacles;Vore;X-ray;Yuri','Makari Tohru',4.79),
+(339,'Ahegao;Masturbation;Monster;Sex Toys;Squirting;Vore;Watersports','Makari Tohru',4.4),
+(340,'Ahegao;Bondage;Drugs;Mind Break;Monster;Squirting;Stomach Bulge;Vore','Makari Tohru',3.78),
+(341,'Ahegao;Bondage;Drugs;Large Breasts;Mind Break;Monster;Squirting;Vore','Makari Tohru',3.78),
+(342,'Ahegao;Big Areola;Breast Sucking;Lactation;Large Breasts;Mind Break;Monster;X-ray','Makari Tohru',4.25),
+(343,'Ahegao;Bondage;Mind Break;Monster;Rape;Sixty-Nine;Tentacles;Watersports','Makari Tohru',4.25),
+(344,'Ahegao;Lactation;Masturbation;Mind Break;Monster','Makari Tohru',3.9),
+(345,'Ahegao;Dark Skin;Drugs;Masturbation;Mind Break;Monster;Rape;Torn Clothing','Makari Tohru',2.5),
+(346,'Blowjob;Hairy;Handjob;Happy Sex;Large Breasts;School Uniform;Uncensored','Dagashi',4.55),
+(347,'Bathroom Sex;BBW;Crossdressing;Dark Skin;Drunk;Huge Breasts;Large Breasts;Masturbation;Plump;Short Hair;Trap;Uncensored;X-ray','bobobo',4.57),
+(348,'Bathroom Sex;Blowjob;Crossdressing;Dark Skin;Femdom;Gokkun;Group Sex;Handjob;Huge Breasts;Large Breasts;Maid;Pettanko;Short Hair;Stockings;Threesome;Trap;Twintails;Uncensored;X-ray','bobobo',4.53),
+(349,'Breast Sucking;Crossdressing;Dark Skin;Defloration;Drunk;Group Sex;Huge Breasts;Inverted Nipples;Large Breasts;Megane;Nakadashi;Paizuri;Pettanko;Short Hair;Trap;Twintails;Uncensored;X-ray','bobobo',4.54),
+(350,'Anal;Bikini;Bisexual;Blowjob;Condom;Crossdressing;Cunnilingus;Dark Skin;Face Sitting;Gokkun;Group Sex;Harem;Huge Breasts;Inverted Nipples;Large Breasts;Megane;Pettanko;Short Hair;Swimsuit;Trap;Uncensored;X-ray','bobobo',4.54),
+(351,'BBW;Big Ass;Crossdressing;Dark Skin;Group Sex;Happy Sex;Harem;Huge Breasts;Impregnation;Large Breasts;Megane;Nakadashi;Pettanko;Trap;Twintails;Uncensored;X-ray','bobobo',4.37),
+(352,'Blowjob;Large Breasts;Small Penis;Straight Shota;Uncensored;X-ray','Azuma Tesshin',4.48),
+(353,'Blowjob;Cunnilingus;Loli;Nakadashi;Slut;Twintails;Uncensored','Atage',4.17),
+(354,'Big Ass;Blowjob;Fangs;Large Breasts;Monster Girl;Nurse;Twintails;Uncensored;Vampire;X-ray','Ashiomi Masato',4.59),
+(355,'Ahegao;Blowjob;Happy Sex;Nakadashi;Tsundere;Uncensored','Akino Sora',4.62),
+(356,'Ahegao;Blowjob;Femdom;Footjob;Happy Sex;Tsundere;Uncensored','Akino Sora',4.63),
+(357,'Femdom;Group Sex;Happy Sex;Large Breasts;Nakadashi;Threesome;Tsundere;Uncensored;X-ray','Akino Sora',4.62),
+(358,'Ahegao;Big Ass;Blowjob;Comedy;Happy Sex;Large Breasts;Legal Loli;Loli;Nakadashi;Squirting;Uncensored','Akino Sora',4.64),
+(359,'Big Ass;Blowjob;Cunnilingus;Group Sex;Happy Sex;Harem;Large Breasts;Nakadashi;Pettanko;Twintails;Uncensored','Akino Sora',4.45),
+(360,'Cunnilingus;Femdom;Large Breasts;School Uniform;Uncensored;X-ray','Akagi Asahito',3.48),
+(361,'Breast Sucking;Bukkake;Childhood Friend;Defloration;Fingering;French Kissing;Handjob;Happy Sex;Nakadashi;School Uniform;Uncensored;Virginity (Male);X-ray','Minami',4.66),
+(363,'Armpit;Bathroom Sex;Big Ass;Blowjob;Dark Skin;Inverted Nipples;Large Breasts;Licking;Megane;Military Uniform;Nakadashi;Paizuri;School Uniform','Rama',4.58),
+(364,'Fangs;Full Color;Happy Sex;Nakadashi;Pettanko;Swimsuit;Tanlines','Aoi Nagisa',4.48),
+(365,'Armpit;BBM / Fat Man;Bikini;Cow Girl;Large Breasts;Nakadashi;Netorare;Smell;Swimsuit','Suzuhane Suzu',3.33),
+(366,'Ahegao;Anilingus;Blowjob;Deepthroat;Drunk;Femdom;Group Sex;Huge Penis;Large Breasts;Maledom;Mind Break;Paizuri;Pantyhose;Tengu;X-ray','Karoti',2.88),
+(367,'Anal;Crossdressing;Males only;Nakadashi;School Uniform;Shota;Small Penis;Trap;Yaoi','Uehasu',4.61),
+(368,'Ahegao;Anal;Birth;Blowjob;Deepthroat;Defloration;Drugs;Group Sex;Impregnation;Lactation;Large Breasts;Mind Break;Monster;Nipple Penetration;Orc;Pregnant;Rape;Spats;Spitroast;Stomach Bulge;Threesome;X-ray','Fan no Hitori',4.35),
+(369,'Ahegao;Anal;Big Ass;Blowjob;Bodysuit;Brain Fuck;Collar;Double Penetration;Huge Penis;Impregnation;Large Breasts;Mind Break;Mind Control;Nakadashi;Parasite;Rape;Slave;Squirting;Stomach Bulge;X-ray','Fan no Hitori',3.95),
+(370,'Ahegao;Big Areola;Blowjob;Bukkake;Centaur;Femdom;Futa on Female;Futanari;Group Sex;Happy Sex;Harem;Huge Penis;Large Breasts;Mind Break;Mind Control;Monster;Monster Girl;Nakadashi;Reverse Rape;Shared Senses;Snuff;Stockings;Stomach Bulge;Sweating;Witch;X-ray;Yandere;Yuri','Fan no Hitori',4.5),
+(371,'Ahegao;Anal;Blowjob;Bukkake;Collar;Defloration;Double Penetration;Human Toilet;Mind Break;Mind Control;Nakadashi;Rape;School Uniform;Slave;Stuck in Wall;Symbol Shaped Pupils','Fan no Hitori',3.98),
+(372,'Anal;Cervical Penetration;Defloration;Nakadashi;Prolapse;School Uniform;Sex Toys;Smegma;Straight Shota;Voyeurism;Yuri','Kanetsuki Masayoshi;Shinama',3.36),
+(373,'Ahegao;Blowjob;Impregnation;Large Breasts;Nakadashi;Pregnant','Kiriyama Taichi',4.0),
+(374,'Band-Aid / Pasties;BDSM;Blackmail;Blowjob;Dark Skin;Defloration;Exhibitionism;Fingering;Gloves;Gyaru;Large Breasts;Leg Lock;Maledom;Masturbation;Mind Break;Muscle;School Uniform;Straight Shota;Sumata;X-ray','Yunioshi',4.24),
+(375,'Ahegao;Anilingus;Blowjob;Bodysuit;Cunnilingus;Dark Skin;Double Penetration;Futanari;Futanari on Futanari;Group Sex;Gyaru;Hairy;Hairy Armpits;Large Breasts;Masturbation;Prostitution;Stockings;Twintails','Motsu',3.96),
+(376,'Ahegao;Animal Girl;Band-Aid / Pasties;Big Ass;Bikini;Blowjob;Bodysuit;Breast Sucking;Catgirl;Cheating;Chikan;Collar;Condom;Cosplay;Defloration;Exhibitionism;Fingering;Gangbang;Gloves;Group Sex;Hairy;Handjob;Happy Sex;Large Breasts;Lingerie;Lowleg;Masturbation;Megane;Nakadashi;Slut;Spitroast;Stockings;Swimsuit;Swinging / Netorase;Symbol Shaped Pupils;Threesome;Virginity (Male);X-ray','Mizuryu Kei',4.61),
+(377,'Ahegao;Anal;Anilingus;Animal Girl;Armpit;Assjob;Big Ass;Bikini;Blowjob;Bondage;Breast Sucking;Bukkake;Catgirl;Cheating;Cheerleader;Childhood Friend;Christmas;Collar;Cosplay;Cousin;Crotchless / Breastless;Cunnilingus;Defloration;Dog Girl;Elder Sister;Exhibitionism;Face Sitting;Femdom;Fingering;Group Sex;Handjob;Happy Sex;Harem;Hat;Hotpants;Huge Penis;Imouto;Impregnation;Incest;Inseki;Inverted Nipples;Lactation;Large Breasts;Layer Cake;Licking;Lingerie;Maid;Maledom;Masturbation;Megane;MILF;Mother;Nakadashi;Netori;Nurse;Paizuri;Pantyhose;Pet Girl;Pettanko;Prostitution;Reverse Rape;School Uniform;Sex Toys;Shimaidon;Shimapan;Short Hair;Sixty-Nine;Sleeping;Spats;Stockings;Straight Shota;Sumata;Swimsuit;Tan;Tankoubon;Tanlines;Threesome;Twintails;Voyeurism;Waitress;Watersports;X-ray;Yuri','Marui Maru',4.51),
+(378,'Ahegao;Bathroom Sex;Blowjob;Bukkake;Dirty Old Man;Fingering;Gangbang;Group Sex;Handjob;Impregnation;Large Breasts;Masturbation;Nakadashi;School Uniform;Slut;Smegma;Squirting;Twintails;Watersports','Sunagawa Tara',3.84),
+(379,'Ahegao;Animal Boy;Animal Girl;Armpit;BBW;Bestiality;Big Areola;Big Ass;Blowjob;Bondage;Breast Expansion;Breast Sucking;Bukkake;Bunnygirl;Catgirl;Cervical Penetration;Cow Girl;Cunnilingus;Deepthroat;Defloration;Dick Growth;Dog;Dog Girl;Drugs;Exhibitionism;Fox Girl;Furry;Futanari;Gangbang;Group Sex;Hairy;Happy Sex;Horse;Huge Breasts;Huge Penis;Imouto;Impregnation;Incest;Inverted Nipples;Lactation;Large Breasts;Licking;Long Tongue;Megane;MILF;Mind Break;Multiple Breasts;Multiple Penises;Muscle;Nakadashi;Netorare;Paizuri;Pantyhose;Rape;Reverse Rape;School Uniform;Short Hair;Sleeping;Spitroast;Squirting;Stomach Bulge;Story Arc;Straight Shota;Sumata;Tankoubon;Threesome;Torn Clothing;Transformation;Twintails;Vomit;Vore;Watersports;X-ray','Jyoka',4.3),
+(380,'Ahegao;Anal;Bestiality;Birth;Group Sex;Hairy;Huge Penis;Human Cattle;Impregnation;Large Breasts;Mind Break;Monster;Nakadashi;Pettanko;Pregnant;Rape;Slave;Stomach Bulge;Torture','Neromashin',3.33),
+(381,'Ahegao;Anal;Anilingus;Big Ass;Blowjob;Crotchless / Breastless;Dark Skin;Group Sex;Impregnation;Large Breasts;Leg Lock;Nakadashi;Paizuri;Prostitution;Stockings;Threesome;X-ray','Motsu',4.17),
+(382,'Anal;Big Areola;Big Ass;Blowjob;Bondage;Catgirl;Dark Skin;Defloration;Double Penetration;Elf;Femdom;Group Sex;Harem;Huge Penis;Incest;Large Breasts;Licking;Maledom;Megane;Muscle;Paizuri;Rape;School Uniform;Squirting;Stockings;Tankoubon','Aki Matsuri',4.18),
+(383,'Big Ass;Bikini;Body Painting;Bride;Cunnilingus;Defloration;Elder Sister;Exhibitionism;Hairy;Happy Sex;Huge Breasts;Incest;Large Breasts;Squirting;Swimsuit;Tsundere;X-ray','Doumou',4.4),
+(384,'Ahegao;Collar;Defloration;Devil;Futanari;Huge Penis;Impregnation;Large Breasts;Lingerie;Male on Futa;Mind Break;Monster;Monster Girl;Nakadashi;Orgasm Denial;Rape;Slave;Stomach Bulge;Urethra Insertion;X-ray;Yandere','Amatake Akewo',4.37),
+(385,'Ahegao;Big Ass;Blowjob;Cunnilingus;Fingering;Happy Sex;Large Breasts;Nakadashi;School Uniform;Symbol Shaped Pupils;X-ray','Marui Maru',4.63),
+(386,'Ahegao;Anal;BDSM;Blowjob;Bondage;Defloration;Exhibitionism;Femdom;Fingering;Hairy;Handjob;Idol;Kimono / Yukata;Large Breasts;Onsen;Pettanko;Spanking;Twintails;X-ray','Mahiruno Kagerou',4.53),
+(387,'Ahegao;Anal;BDSM;Blackmail;Bloomers;Blowjob;Bondage;Bukkake;Cheating;Comedy;Cunnilingus;Dark Skin;Defloration;Dick Growth;Exhibitionism;Femdom;Fingering;Full Color;Futa on Female;Futanari;Gokkun;Group Sex;Happy Sex;Harem;Huge Penis;Impregnation;Licking;Loli;Masturbation;MILF;Mind Break;Nakadashi;Pantyhose;Pet Girl;Rape;School Swimsuit;School Uniform;Short Hair;Spats;Stalking;Stockings;Stomach Bulge;Swimsuit;Tan;Tanlines;Teacher;Tomboy;Twintails;Watersports;X-ray','Dozamura',4.45),
+(388,'Anal;Bathroom Sex;Blowjob;Body Writing;Bondage;Bukkake;Cheating;Collar;Defloration;Double Penetration;Drugs;Femdom;Fingering;Gangbang;Gokkun;Group Sex;Hairy;Handjob;Harem;Huge Breasts;Large Breasts;Lingerie;Masturbation;Megane;Multiple Insertion;Onsen;Piercings;Rape;School Uniform;Sex Toys;Slave;Spitroast;Stockings;Story Arc;Tan;Tankoubon;Tanlines;Teacher;Watersports','Maguro Teikoku',3.88),
+(389,'Big Ass;Blindfold;Bondage;Cunnilingus;Femdom;Fingering;Group Sex;Large Breasts;Nurse;Pegging;Sex Toys;Squirting;Stockings;Straight Shota;Symbol Shaped Pupils;Twintails;Watersports','Marui Maru',4.0),
+(390,'Ahegao;Blowjob;Bukkake;Cosplay;Futa on Female;Gangbang;Gokkun;Group Sex;Handjob;Hypnosis;Impregnation;Large Breasts;Magical Girl;Male on Futa;Masturbation;Megane;Mind Break;Mind Control;Nakadashi;Rape;Sex Toys;Shemale;Slut;Squirting;Teacher','Mizuryu Kei',4.2),
+(391,'Ahegao;Anal;Bestiality;Birth;Bondage;Defloration;Double Penetration;Gangbang;Group Sex;Huge Penis;Human Cattle;Impregnation;Large Breasts;Mind Break;Monster;Nakadashi;Pettanko;Pregnant;Rape;Slave;Stockings;X-ray','Neromashin',4.32),
+(392,'Ahegao;Armpit;Big Ass;Blowjob;Bukkake;Cunnilingus;Deepthroat;Femdom;French Kissing;Hairy;Handjob;Large Breasts;MILF;Nakadashi;Phimosis;Smegma;Straight Shota;X-ray','Numahana',4.76),
+(393,'Ahegao;Catgirl;Collar;Futanari;Group Sex;Mind Control;Pet Girl;Pettanko;Short Hair;Slut','Mizuryu Kei',3.44),
+(394,'Blowjob;Breast Sucking;Condom;Femdom;Hairy;Happy Sex;Impregnation;Incest;Large Breasts;Lingerie;Megane;MILF;Mother;Nakadashi;Stockings;Straight Shota;Tsundere;X-ray','Daigo',4.72),
+(395,'Anal;Bathroom Sex;BDSM;Blowjob;Bondage;Breast Sucking;Collar;Condom;Cosplay;Defloration;Double Penetration;Exhibitionism;Femdom;Fingering;Fisting;Gangbang;Group Sex;Huge Penis;Human Toilet;Licking;Maledom;Megane;Mind Break;Multiple Insertion;Pettanko;School Uniform;Sex Toys;Slave;Spitroast;Stomach Bulge;Tankoubon;Torture;Twintails;X-ray','Mayonnaise.',4.35),
+(396,'Bondage;Collar;Double Penetration;Exhibitionism;School Uniform;Sex Toys;Stomach Bulge;Twintails;X-ray','Mayonnaise.',3.67),
+(397,'Big Areola;Blowjob;Bondage;Femdom;Happy Sex;Lamia;Large Breasts;Mind Break;Monster Girl;Reverse Rape;Small Penis;Straight Shota;X-ray','aho / AHOBAKA',4.18),
+(398,'Ahegao;Anal;Big Ass;Blowjob;Body Writing;Bondage;Chastity Belt;Collar;Crossdressing;Dark Skin;Deepthroat;Devil;Double Penetration;Drugs;Gangbang;Gokkun;Group Sex;Gyaru;Handjob;Human Toilet;Lingerie;Males only;Mind Break;Multiple Insertion;Multiple Penises;Prostitution;Rape;Slave;Small Penis;Spitroast;Torture;Trap;Witch;Yaoi','Amatake Akewo',4.45),
+(399,'Blowjob;Bondage;Comedy;Cunnilingus;Exhibitionism;Fisting;Masturbation;Megane;MILF;Rape;Sex Toys;Stuck in Wall','Karma Tatsurou',4.44),
+(400,'Ahegao;Anal;Armpit;Big Areola;Blowjob;Bukkake;Dark Skin;Devil;Double Penetration;Drugs;Futanari;Gangbang;Group Sex;Handjob;Huge Breasts;Huge Penis;Large Breasts;Licking;Male on Futa;Miko;Mind Break;Multiple Penises;Muscle;Pettanko;Smegma;Yuri','Gura Nyuutou',4.5),
+(401,'Ahegao;BBW;Big Areola;Big Ass;Bikini;Blowjob;Cheating;Defloration;Dirty Old Man;Femdom;Fundoshi;Group Sex;Hairy;Huge Breasts;Huge Penis;Hypnosis;Impregnation;Incest;Kimono / Yukata;Kunoichi;Large Breasts;Maledom;Megane;MILF;Mind Control;Mother;Nakadashi;Netorare;Netori;Pregnant;School Swimsuit;School Uniform;Swimsuit;Tan;Tankoubon;Tanlines','Jeanne DA''ck',4.35),
+(402,'Ahegao;BBW;Big Areola;Big Ass;Blowjob;Cheating;Dark Skin;Defloration;Dirty Old Man;Elder Sister;Femdom;Group Sex;Hairy;Huge Breasts;Huge Penis;Incest;Large Breasts;Lingerie;Maledom;Megane;MILF;School Uniform;Sleeping;Tankoubon','Jeanne DA''ck',3.95),
+(403,'Ahegao;Anal;Blowjob;Chikan;Double Penetration;Drugs;Group Sex;Huge Penis;Large Breasts;Licking;Mind Break;Monster;Rape;Slave;Stomach Bulge;Vomit;X-ray','Inoue Kiyoshirou',3.88),
+(404,'Ahegao;Bikini;Blowjob;Breast Sucking;Exhibitionism;Group Sex;Hypnosis;Large Breasts;Licking;Megane;Mind Break;Mind Control;Nyotaimori;School Uniform;Slut;Stockings;Swimsuit;Teacher;Twins;Watersports','Mizuryu Kei',4.04),
+(405,'Ahegao;Anal;BBW;Big Areola;Big Ass;Blowjob;Deepthroat;Defloration;Femdom;Fundoshi;Group Sex;Gyaru;Hairy;Hairy Armpits;Handjob;Huge Breasts;Huge Penis;Incest;Lactation;Large Breasts;Maledom;Megane;MILF;Mind Control;Muscle;Netorare;Pregnant;School Uniform;Swimsuit;Tan;Tankoubon;Tanlines;Transparent Clothing;Twintails','Jeanne DA''ck',3.94),
+(406,'Anal;Bestiality;Big Ass;Blowjob;Bondage;Chikan;Crossdressing;Dark Skin;Exhibitionism;Fingering;Gangbang;Group Sex;Huge Penis;Magical Girl;Monster;Multiple Insertion;Rape;Small Penis;Spitroast;Stuck in Wall;Trap;Yaoi','Amatake Akewo',4.69),
+(407,'Ahegao;Animal Girl;Exhibitionism;Mind Break;Mind Control;Sex Toys;Slut','Mizuryu Kei',3.7),
+(408,'Ahegao;Exhibitionism;Fingering;Group Sex;Hypnosis;Large Breasts;Mind Break;Mind Control;Pantyhose;School Uniform;Sex Toys;Slut;Spats;Yuri','Mizuryu Kei',4.32),
+(409,'Ahegao;Catgirl;Futa on Female;Futanari;Hypnosis;Large Breasts;Mind Control;Pet Girl;Slut','Mizuryu Kei',3.29),
+(410,'Ahegao;Exhibitionism;Hypnosis;Large Breasts;Masturbation;Mind Break;Mind Control;Rape;School Uniform;Sex Toys;Slut;Stockings;Teacher','Mizuryu Kei',4.14),
+(411,'Bathroom Sex;Breast Sucking;Exhibitionism;Hairy;Lactation;Large Breasts;Straight Shota','Isako Rokurou',4.64),
+(412,'Ahegao;Anal;Exhibitionism;Futa on Male;Futanari;Group Sex;Handjob;Impregnation;Large Breasts;Masturbation;Nakadashi;Pegging;School Uniform;Shota;X-ray','Kurenai Yuuji',4.65),
+(413,'Anal;Blowjob;Bukkake;Cunnilingus;Double Penetration;Gangbang;Group Sex;Large Breasts;Licking;Monster;Muscle;Rape;Spats;Tan;Tanlines','BANG-YOU | Didori',4.4),
+(414,'Ahegao;Blowjob;Exhibitionism;Fingering;Gangbang;Group Sex;Hairy;Hypnosis;Large Breasts;Lingerie;MILF;Mind Break;Mind Control;Nun;Pantyhose;Rape;School Uniform;Slut;Stockings;Swimsuit;Symbol Shaped Pupils;Teacher;Transparent Clothing;Twins;X-ray','Mizuryu Kei',4.37),
+(415,'Ahegao;Birth;Dark Skin;Drugs;Huge Penis;Impregnation;Large Breasts;Mind Break;Monster;Nakadashi;Pregnant;Rape;Stockings;Stomach Bulge;X-ray','Amatake Akewo',3.93),
+(416,'Ahegao;Anal;Crossdressing;Drugs;Gangbang;Group Sex;Mind Break;Prostitution;Rape;Shota;Spitroast;Stockings;Trap;Twintails;Yaoi','Dynamite Moca',4.54),
+(417,'Ahegao;Anal;Bathroom Sex;Blowjob;Bukkake;Dark Skin;Double Penetration;Filming;Gangbang;Group Sex;Gyaru;Handjob;Large Breasts;Nakadashi;Prostitution;School Uniform;Slut;Urethra Insertion;Watersports','Sunagawa Tara',4.16),
+(418,'Ahegao;Anal;Anilingus;Aunt;Big Areola;Big Ass;Blowjob;Breast Sucking;Cervical Penetration;Dark Skin;Defloration;Doctor;Double Penetration;Drugs;Exhibitionism;Femdom;Group Sex;Hairy;Happy Sex;Harem;Huge Breasts;Huge Penis;Impregnation;Incest;Lactation;Large Breasts;Licking;Masturbation;Megane;MILF;Nakadashi;Nurse;Onsen;Paizuri;Pregnant;Reverse Rape;School Uniform;Sex Toys;Sixty-Nine;Squirting;Story Arc;Tankoubon;X-ray','Kai Hiroyuki',4.63),
+(419,'Ahegao;Anal;Big Ass;Bikini;Blowjob;Dark Skin;Devil;Eyepatch;Huge Breasts;Large Breasts;MILF;Paizuri;Straight Shota;Swimsuit','Matsumoto Katsuya',4.19),
+(420,'Ahegao;Bestiality;Blindfold;Bondage;Cervical Penetration;Defloration;Dog Girl;Femdom;Idol;Pig;Stomach Bulge;Symbol Shaped Pupils','Soine',3.5),
+(421,'Ahegao;Animal Girl;Blowjob;Bunnygirl;Catgirl;Collar;Exhibitionism;Gangbang;Gloves;Group Sex;Hairy;Large Breasts;Lingerie;Netori;Pantyhose;Pet Girl;Slut;Stockings;Swinging / Netorase;Voyeurism;Watersports;X-ray','Mizuryu Kei',4.55),
+(422,'Ahegao;BDSM;Big Areola;Blowjob;Bondage;Collar;Deepthroat;Gangbang;Group Sex;Huge Penis;Large Breasts;Mind Break;Monster;Rape;Scat;Slave;Squirting;Stomach Bulge;Tentacles','Sunagawa Tara',3.6),
+(423,'Ahegao;Anal;Big Areola;Blindfold;Dark Skin;Double Penetration;Drugs;Femdom;Fingering;Footjob;Gangbang;Group Sex;Gyaru;Huge Penis;Large Breasts;Multiple Insertion;Piercings;Sex Toys;Stockings;Threesome','Momofuki Rio',4.22),
+(424,'BBM / Fat Man;Dark Skin;Giantess;Harpy;Huge Penis;Lamia;Loli;Monster Girl;Rape;Sex Toys;Stockings','Nakagami Takashi;nenemaru;Takatsu;Z-Ton',4.18),
+(425,'Ahegao;Anal;Double Penetration;Gangbang;Group Sex;Large Breasts;Monster;Monster Girl;Multiple Insertion;Rape;Tentacles;X-ray','Yuugiri',3.69),
+(426,'Ahegao;Anal;Bestiality;Blowjob;Crossdressing;Double Penetration;Group Sex;Lingerie;Megane;Sex Toys;Shota;Spitroast;Stockings;Trap;X-ray;Yaoi','Shimaji',4.02),
+(427,'Ahegao;Anal;Body Writing;Crossdressing;Enema;Group Sex;Megane;Rape;School Uniform;Shota;Trap;Yaoi','Shimaji',4.12),
+(428,'Anal;Blackmail;Blowjob;Crossdressing;Double Penetration;Group Sex;Mind Break;Rape;Shota;Stockings;Trap;Yaoi','Shimaji',4.68),
+(429,'Anal;BBM / Fat Man;Blowjob;Bondage;Crossdressing;Deepthroat;Exhibitionism;Idol;Males only;Masturbation;Megane;Rape;Stockings;Trap;Yaoi','Martan',4.37),
+(430,'Ahegao;Anal;Bikini;Blackmail;Blowjob;Crossdressing;Dirty Old Man;Fingering;Handjob;Megane;Prostitution;Sex Toys;Shota;Swimsuit;Trap;Yaoi','Mine Mura',4.0),
+(431,'Anal;Blackmail;Blowjob;Comedy;Huge Breasts;Large Breasts;Masturbation;MILF;Reverse Rape;Straight Shota;Tomboy','bobobo',4.41),
+(432,'Anal;Anilingus;Blowjob;Bondage;Double Penetration;Enema;Gangbang;Group Sex;Impregnation;Large Breasts;Mind Break;Monster;Nakadashi;Rape;Stomach Bulge;Tan;Tanlines;Tentacles','Maguro Teikoku',3.48),
+(433,'Ahegao;Anal;Blackmail;Bukkake;Crossdressing;Dirty Old Man;Exhibitionism;Fingering;Full Color;Group Sex;Incest;Mind Break;Nakadashi;Rape;Sex Toys;Shimapan;Shota;Small Penis;Stockings;Trap;Uncle;Yaoi','Collagen',4.19),
+(434,'Big Ass;Blowjob;Large Breasts;Monster Girl;Muscle;Nurse;Zombie','Double Deck',4.56),
+(435,'Ahegao;Anal;Bisexual;Blackmail;Blowjob;Crossdressing;Deepthroat;Defloration;Double Penetration;Imouto;Impregnation;Incest;Mind Break;Nakadashi;Pantyhose;Rape;School Uniform;Shota;Trap;Twins;Twintails;Yaoi','Scotch',4.26),
+(436,'Dark Skin;Fingering;Group Sex;Happy Sex;Harem;Large Breasts;Pettanko;Swimsuit;Tan;Tanlines;Uncensored','Ishikawa Shisuke',4.55),
+(437,'BBW;Big Areola;Big Ass;Blowjob;Breast Sucking;Cheating;Dark Skin;Deepthroat;Gyaru;Handjob;Huge Breasts;Large Breasts;Paizuri;School Uniform','Muronaga Chaashuu',4.3),
+(438,'Ahegao;Aunt;Big Ass;Dark Skin;Daughter;Devil;Futanari;Futanari on Futanari;Group Sex;Huge Breasts;Incest;Lactation;Large Breasts;Loli;Monster Girl;Mother;Muscle;Niece;Nipple Penetration;Oppai Loli;Threesome;X-ray','Chinbotsu;Rebis',4.44),
+(439,'Ahegao;Anal;Armpit;Big Ass;Dark Skin;Futanari;Futanari on Futanari;Giantess;Group Sex;Huge Penis;Large Breasts;Mind Break;Paizuri;Rape;Sex Toys;X-ray','Katou Jun;Rebis',4.39),
+(440,'Ahegao;BBM / Fat Man;BBW;Big Areola;Big Ass;Crotchless / Breastless;Dark Skin;Double Penetration;Filming;Group Sex;Gyaru;Huge Breasts;Large Breasts;Paizuri;Prostitution;School Swimsuit;Smegma;Stockings;Swimsuit;Threesome;Twintails','KEN',3.0),
+(441,'Blowjob;Cunnilingus;Megane;Uncensored','Kishikaisei',4.45),
+(442,'Ahegao;Anal;BDSM;Bondage;Dark Skin;Decensored;Exhibitionism;Futanari;Hairy Armpits;Megane;Mouth Gag;Muscle;Sex Toys;Torture;Urethra Insertion','Kakugari Kyoudai',4.0),
+(443,'Ahegao;Band-Aid / Pasties;Big Areola;Big Ass;Bikini;Blowjob;Bukkake;Catgirl;Collar;Crotchless / Breastless;Gangbang;Group Sex;Handjob;Happy Sex;Huge Breasts;Idol;Large Breasts;Lingerie;Lowleg;Multiple Insertion;Paizuri;School Uniform;Stockings;Swimsuit;Threesome;Transparent Clothing;Twintails','KEN',3.0),
+(444,'Ahegao;Anal;Big Ass;Blowjob;Breast Sucking;Bukkake;Bunnygirl;Cosplay;Deepthroat;Double Penetration;Gangbang;Gloves;Group Sex;Handjob;Hat;Large Breasts;Masturbation;Multiple Insertion;Nurse;Paizuri;Slut;Swimsuit;Swinging / Netorase;Voyeurism;X-ray','KEN',3.75),
+(445,'Big Ass;Blowjob;Collar;Devil;Elder Sister;Femdom;Large Breasts;Licking;Nakadashi;Reverse Rape;Straight Shota;Succubus;Symbol Shaped Pupils;Tentacles;Virginity (Male)','Pochi.',4.58),
+(446,'Anal;Blowjob;Crossdressing;Dark Skin;Dirty Old Man;Gothic;Group Sex;Gyaru;Lingerie;Males only;Phimosis;Shota;Stockings;Trap;Twintails;Yaoi','Katou Chakichi',4.33),
+(447,'Ahegao;Defloration;Drugs;Fingering;Hairy;Maledom;Megane;Mind Break;Nakadashi;School Uniform','ShindoL',4.18),
+(448,'Ahegao;Blackmail;Blowjob;Cheating;Condom;Daughter;Dirty Old Man;Fingering;Incest;Megane;Mind Break;Nakadashi;Rape;School Uniform;X-ray','ShindoL',3.96),
+(449,'Ahegao;Big Ass;Drugs;Fingering;Hairy;Mind Break;Nakadashi;Piercings;Prostitution;Squirting;Torture;Watersports;X-ray','ShindoL',4.07),
+(450,'Ahegao;Big Ass;Blowjob;Dark Skin;Deepthroat;Dirty Old Man;Drugs;Fingering;Gangbang;Group Sex;Gyaru;Hotpants;Impregnation;Maledom;Mind Break;Nakadashi;Piercings;Pregnant;Prostitution;Slut;Squirting;Stockings;Symbol Shaped Pupils;Tattoo','ShindoL',3.97),
+(451,'Ahegao;Anal;Big Ass;Dark Skin;Dirty Old Man;Double Penetration;Drugs;Fingering;Group Sex;Gyaru;Hotpants;Impregnation;Masturbation;Mind Break;Nakadashi;Piercings;Rape;Smegma;Squirting;Stockings;Symbol Shaped Pupils;Tattoo;Vomit;X-ray','ShindoL',3.74),
+(452,'Ahegao;Anilingus;Bloomers;Blowjob;Cunnilingus;Dark Skin;Elder Sister;Face Sitting;Femdom;Group Sex;Hairy;Harem;Incest;Large Breasts;Megane;Nakadashi;Pettanko;Straight Shota;Threesome;Virginity (Male);Watersports','Agata',4.47),
+(453,'Ahegao;Big Ass;Collar;Cousin;Femdom;Freckles;Gyaru;Incest;Large Breasts;Megane;Squirting;Stockings;Straight Shota;Symbol Shaped Pupils;Virginity (Male)','zunta',4.6),
+(454,'Ahegao;Anal;Bestiality;Bukkake;Devil;Double Penetration;Huge Penis;Mind Break;School Uniform;Shota;Stomach Bulge;Tentacles;Yaoi','Takase Yuu',3.62),
+(455,'Anal;Anilingus;BBM / Fat Man;Blowjob;Collar;Crossdressing;Dark Skin;Deepthroat;DILF;Enema;Fox Girl;Frotting;Handjob;Impregnation;Maid;Males only;Nakadashi;Onahole;Pantyhose;Prostitution;Sex Toys;Spanking;Trap;Urethra Insertion;Watersports;Yaoi','GENSHI',4.19),
+(456,'Ahegao;Anal;BBM / Fat Man;BBW;Big Areola;Big Ass;Bikini;Blackmail;Bloomers;Blowjob;Breast Sucking;Bukkake;CBT;Condom;Cosplay;Crossdressing;Cunnilingus;Dark Skin;Deepthroat;Devil;Dirty Old Man;Elder Sister;Exhibitionism;Femdom;Fingering;Gangbang;Group Sex;Gyaru;Handjob;Happy Sex;Harem;Huge Breasts;Huge Penis;Impregnation;Large Breasts;Licking;Loli;Masturbation;Megane;MILF;Nakadashi;Pantyhose;Prostitution;School Swimsuit;School Uniform;Sixty-Nine;Slut;Spitroast;Stockings;Straight Shota;Succubus;Swimsuit;Symbol Shaped Pupils;Tan;Tankoubon;Teacher;Tsundere;Twintails;X-ray','Tamagoro',4.57),
+(457,'Ahegao;Anal;Bestiality;Birth;Blowjob;Body Writing;Bodysuit;Bondage;Centaur;Collar;Cow Girl;Dark Skin;Dog Girl;Drugs;Elf;Exhibitionism;Futanari;Human Toilet;Impregnation;Lactation;Large Breasts;Latex;Megane;Mind Break;Monster;Monster Girl;Nakadashi;Netori;Pet Girl;Piercings;Pregnant;Prolapse;Rape;School Uniform;Sex Toys;Shared Senses;Slave;Snuff;Spanking;Stockings;Stomach Bulge;Story Arc;Stuck in Wall;Tankoubon;Tentacles;Vomit;Watersports','Fan no Hitori',4.47),
+(458,'Ahegao;Anal;Anilingus;Blowjob;Bukkake;Crossdressing;Dark Skin;Devil;Femdom;Full Color;Futa on Male;Futanari;Large Breasts;Male on Futa;Masturbation;Mind Break;Monster Girl;Paizuri;Shimapan;Shota;Spitroast;Stockings;Succubus;Symbol Shaped Pupils;Threesome','Inari',4.29),
+(459,'Ahegao;Anal;BBW;Big Areola;Big Ass;Bondage;Cheating;Collar;Femdom;Gangbang;Group Sex;Hairy;Huge Breasts;Huge Penis;Impregnation;Incest;Large Breasts;Mind Break;Monster;Nakadashi;Netorare;Piercings;Pregnant;Rape;Reverse NTR;Slave;Stockings;Stomach Bulge;Tan;Tanlines;Twintails;X-ray','Neromashin',4.57),
+(460,'Anal;Anilingus;Big Ass;Blowjob;Cheating;Dark Skin;Gyaru;Hairy;Happy Sex;Hotpants;Large Breasts;Masturbation;School Uniform;Sex Toys;Squirting;Watersports','Jun',4.61),
+(461,'Ahegao;Anal;Blowjob;Crossdressing;Deepthroat;Gyaru;Handjob;Huge Penis;Males only;Muscle;Prostitution;School Uniform;Shimapan;Shota;Trap;Yaoi','Gujira',4.47),
+(462,'Anal;Bikini;Blowjob;Bukkake;Double Penetration;Exhibitionism;Filming;Fingering;Gokkun;Group Sex;Huge Penis;Idol;Masturbation;Nakadashi;Pettanko;Swimsuit;Twintails;Watersports','Shiwasu No Okina',4.22),
+(463,'Ahegao;Blowjob;Corruption;Face Sitting;Femdom;Group Sex;Large Breasts;Leg Lock;Megane;Mind Control;Monster Girl;Nakadashi;Paizuri;Rape;School Uniform;Shimapan;Snuff;Stockings;Teacher;Threesome;Twintails;X-ray','DATE',3.81),
+(464,'Big Ass;Blindfold;Blowjob;Bukkake;Collar;Delusion;Gangbang;Gokkun;Group Sex;Handjob;Large Breasts;Maid;Masturbation;Megane;Phimosis;Stockings;Teacher','KEN',2.9),
+(465,'Blowjob;Dark Skin;Defloration;Femdom;Hairy;Large Breasts;Leg Lock;MILF;Mind Break;Muscle;Nakadashi;Oyakodon;Short Hair;Spats;Squirting;Straight Shota;Symbol Shaped Pupils;Tomboy;Twintails;X-ray','Kuroiwa Menou',4.63),
+(466,'Ahegao;Band-Aid / Pasties;Big Ass;Blowjob;Group Sex;Harem;Impregnation;Large Breasts;Maid;Nakadashi;Stockings;Sumata;Symbol Shaped Pupils;X-ray','Marui Maru',4.67),
+(467,'Ahegao;Anal;Blowjob;Bukkake;Crossdressing;Deepthroat;Elf;Frotting;Masturbation;Nakadashi;Paizuri;Rape;Scat;Shota;Trap;Vomit;X-ray;Yaoi','Meme 50',4.15),
+(468,'Age Progression;Big Ass;Bikini;Blowjob;Collar;Cunnilingus;Dark Skin;Daughter;Defloration;Devil;Egg Laying;Face Sitting;Femdom;Fingering;Group Sex;Harem;Impregnation;Incest;Large Breasts;Loli;Nakadashi;Onahole;Oppai Loli;Stockings;Succubus;Swimsuit;Symbol Shaped Pupils;Tattoo;Threesome','Marui Maru',4.59),
+(469,'Ahegao;Anal;Anilingus;BBM / Fat Man;Blowjob;Bukkake;Cunnilingus;Dark Skin;Dirty Old Man;Doctor;Full Color;Group Sex;Large Breasts;Mind Break;Mind Control;Nakadashi;Netorare;Pantyhose;Slut;Squirting;Stockings;Teacher','ElectricSheep',4.03),
+(470,'Ahegao;Anal;Blowjob;Cunnilingus;Dark Skin;Drugs;Elf;Face Sitting;Fairy;Femdom;Fingering;Huge Penis;Impregnation;Large Breasts;Masturbation;Monster;Muscle;Nakadashi;Rape;Squirting;Stomach Bulge;Straight Shota;Tattoo;Tentacles;Tribadism;Vampire;Yuri','Chiba Toshirou;Dairoku Tenmaou Great;JACKASSS;Mikoyan;Nezumi;Ookubo Matagi;Q Doukei;Yunioshi',4.11),
+(471,'Ahegao;Anal;Autofellatio;Bisexual;Blowjob;CBT;Collar;Crossdressing;Enema;Face Sitting;Fisting;Group Sex;Huge Penis;Imouto;Incest;Loli;Mind Break;Rape;Ryona;Sex Toys;Slave;Stomach Bulge;Torture;Trap;Urethra Insertion;Watersports;Yaoi','Sannyuutei Shinta',2.76),
+(472,'Ahegao;Anal;Anilingus;Blowjob;Body Writing;Bukkake;Cheating;Crossdressing;Femdom;Masturbation;Megane;Pantyhose;Rape;School Swimsuit;School Uniform;Squirting;Stockings;Stomach Bulge;Straight Shota;Swimsuit;Teacher;X-ray','Kishinosato Satoshi',4.05),
+(473,'Anal;Bikini;Cheating;Collar;Condom;Cosplay;Crotchless / Breastless;Daughter;Defloration;DILF;Double Penetration;Drunk;Elder Sister;Exhibitionism;Filming;Fingering;Footjob;Group Sex;Hairy;Happy Sex;Hotpants;Imouto;Impregnation;Incest;Large Breasts;Leg Lock;Lingerie;Masturbation;Megane;MILF;Mother;Nakadashi;Netorare;Office Lady;Oyakodon;Pantyhose;Reverse NTR;Sex on the Phone;Sex Toys;Shimaidon;Slut;Stockings;Story Arc;Swimsuit;Tankoubon;Teacher;Transparent Clothing;Voyeurism','Mizuryu Kei',4.42),
+(474,'Anal;Bikini;Blowjob;Bukkake;Dark Skin;Double Penetration;Drugs;Gangbang;Group Sex;Gyaru;Impregnation;Large Breasts;Mind Break;Multiple Insertion;Nakadashi;Pregnant;Rape;Stockings;Stomach Bulge;Swimsuit','Sawada Daisuke',3.07),
+(475,'Animal Girl;Blowjob;Breast Sucking;Centaur;Cunnilingus;Defloration;Gloves;Handjob;Happy Sex;Imouto;Incest;Licking;Monster Girl;X-ray','Z-Ton',4.49),
+(476,'BBW;Big Ass;Blowjob;Cheating;Comedy;Dark Skin;Happy Sex;Huge Penis;Impregnation;Large Breasts;Nakadashi;Netori;Paizuri;Straight Shota;Swinging / Netorase;Voyeurism','Wamusato Haru',4.38),
+(477,'Anal;Bisexual;Blowjob;Condom;Crossdressing;Femdom;Fingering;Frotting;Group Sex;Handjob;Hotpants;Imouto;Incest;Masturbation;Megane;Mind Control;Monster Girl;Nakadashi;Otouto;Stockings;Threesome;Trap;Twins;Twintails;Yaoi','Z-Ton',4.23),
+(478,'Ahegao;Anal;Blowjob;Bondage;Centaur;Dark Skin;Double Penetration;Group Sex;Handjob;Monster Girl;Mouth Gag;Prostitution;Threesome','Z-Ton',4.09),
+(479,'Blowjob;Breast Sucking;Femdom;Happy Sex;Huge Breasts;Impregnation;Large Breasts;Monster Girl;Nakadashi;Straight Shota;X-ray','Z-Ton',4.5),
+(480,'Anal;Blowjob;Crossdressing;Fingering;Handjob;Happy Sex;Incest;Males only;Masturbation;Shota;Trap;Twintails;X-ray;Yaoi','Fujihan',4.5),
+(481,'BBM / Fat Man;Blowjob;Cheating;Dirty Old Man;Huge Penis;Kimono / Yukata;Kunoichi;Monster;Monster Girl;Nakadashi;Netorare;Rape;Snuff;Squirting;X-ray','Z-Ton',2.5),
+(482,'Anal;Blowjob;Crossdressing;Happy Sex;Males only;Nakadashi;Shota;Symbol Shaped Pupils;Trap;Yaoi','Coconoe Ricoco',3.97),
+(483,'Big Areola;Big Ass;Blowjob;Doctor;Femdom;Group Sex;Handjob;Huge Breasts;Large Breasts;Megane;Nurse;Paizuri;Pantyhose;Stockings;Straight Shota;Threesome;X-ray','Yunioshi',4.3),
+(484,'Anal;Blowjob;Bukkake;Cheating;Crossdressing;Group Sex;Males only;Multiple Insertion;Piercings;Shota;Tan;Tanlines;Trap;Yaoi','Zenra QQ',4.52),
+(485,'Anal;Anilingus;Bikini;Blowjob;Crossdressing;Fingering;Group Sex;Handjob;Incest;Otouto;Shota;Small Penis;Spitroast;Swimsuit;Symbol Shaped Pupils;Tan;Tanlines;Trap;Yaoi','Riko',4.49),
+(486,'Ahegao;Animal Girl;Bestiality;Big Areola;Birth;Collar;Cow Girl;Futanari;Group Sex;Harem;Huge Breasts;Huge Penis;Lactation;Large Breasts;Mind Break;Monster;Monster Girl;Multiple Breasts;Nipple Penetration;Pregnant;Rape;Slave;Spitroast;Tentacles','Neromashin',3.96),
+(487,'Bathroom Sex;Big Ass;Blowjob;Devil;Elder Sister;Femdom;Happy Sex;Large Breasts;Paizuri;Straight Shota;Succubus;Symbol Shaped Pupils;Tentacles','Pochi.',4.59),
+(488,'Anal;Big Ass;Bloomers;Blowjob;Breast Sucking;Condom;Cunnilingus;Femdom;Happy Sex;Huge Breasts;Incest;Large Breasts;Megane;MILF;Mother;Reverse NTR;School Uniform;Sixty-Nine;Straight Shota','Orutoro',4.56),
+(489,'Ahegao;Anal;Anilingus;Bisexual;Blowjob;Collar;Deepthroat;Defloration;Doll;Double Penetration;Fingering;Group Sex;Huge Penis;Human Toilet;Inverted Nipples;Large Breasts;Maid;Maledom;Masturbation;Megane;Mind Break;Mind Control;Pantyhose;Rape;School Uniform;Sex Toys;Slave;Stockings;Strap-on','Fan no Hitori',4.37),
+(490,'Bikini;Blowjob;Femdom;Hairy;Handjob;Impregnation;Large Breasts;MILF;Nakadashi;Straight Shota;Swimsuit;Twintails;X-ray','Saigado',4.66),
+(491,'Ahegao;BDSM;Bodysuit;Bondage;Breast Expansion;Drugs;Hairy Armpits;Kunoichi;Large Breasts;Mind Break;Scat;Spanking','Kakugari Kyoudai',3.86),
+(492,'Ahegao;Blowjob;Collar;Diaper;Dirty Old Man;Exhibitionism;Hairy Armpits;Lingerie;MILF;Piercings;Spanking;Stockings;Swinging / Netorase','Kakugari Kyoudai',3.88),
+(493,'Ahegao;Anal;Armpit;Bestiality;Defloration;Enema;Fisting;Futanari;Hairy Armpits;Lactation;Large Breasts;Monster;Pregnant;Scat;Smegma;Stockings;Stomach Bulge','Kakugari Kyoudai',3.9),
+(494,'Ahegao;Bondage;Drugs;Futanari;Group Sex;Hairy Armpits;Male on Futa','Kakugari Kyoudai',3.62),
+(495,'Ahegao;Anal;Band-Aid / Pasties;Bestiality;Bondage;Breast Expansion;CBT;Futanari;Futanari on Futanari;Group Sex;Hairy Armpits;Huge Penis;Nipple Penetration;Piercings;Sex Toys;Urethra Insertion','Kakugari Kyoudai',2.58),
+(496,'Big Ass;Defloration;Fingering;Handjob;Loli;Reverse Rape;School Uniform;Squirting;Stockings;Sumata;Teacher;Twintails','Shiomaneki',4.35),
+(497,'Anal;Crossdressing;Kunoichi;Mind Break;Rape;Shota;Stockings;Tentacles;Trap;Urethra Insertion;Yaoi','NemuNemu',3.64),
+(498,'Ahegao;Big Ass;Blowjob;Cheating;Collar;Deepthroat;Dirty Old Man;Exhibitionism;Full Color;Group Sex;Gyaru;Happy Sex;Harem;Huge Penis;Impregnation;Large Breasts;Loli;Masturbation;Megane;MILF;Nakadashi;School Uniform;Sex Toys;Stockings;Sweating;Tan;Tanlines;Teacher;Twintails;X-ray','Erodezain Koubou',4.43),
+(499,'Anal;Cosplay;Crossdressing;Incest;Males only;Masturbation;Sex Toys;Shota;Stockings;Trap;Uncle;Yaoi','Inari',4.5),
+(500,'Ahegao;Anal;BBW;Big Ass;Bikini;Bisexual;Blowjob;Bukkake;Catgirl;Cheating;Collar;Cunnilingus;Daughter;Deepthroat;Defloration;Dirty Old Man;Dog Girl;Femdom;Fingering;Gangbang;Group Sex;Gyaru;Handjob;Happy Sex;Harem;Imouto;Impregnation;Incest;Large Breasts;Licking;Lingerie;Loli;Megane;Mind Control;Nakadashi;Oppai Loli;Paizuri;Pantyhose;School Uniform;Sixty-Nine;Squirting;Stockings;Straight Shota;Swimsuit;Symbol Shaped Pupils;Tan;Tankoubon;Tanlines;Teacher;Twins;Twintails;Voyeurism;X-ray;Yuri','Marui Maru',4.6),
+(501,'Armpit;Cheating;Dark Skin;Group Sex;Large Breasts;MILF;Muscle;Smegma','Buchou Chinke',3.73),
+(502,'Dark Skin;Hairy;Hairy Armpits;Huge Penis;Large Breasts;Muscle;Straight Shota','Buchou Chinke',4.26),
+(503,'Blowjob;Bukkake;Cheating;Deepthroat;Elder Sister;Femdom;Fingering;Full Color;Handjob;Happy Sex;Incest;Large Breasts;Masturbation;Megane;Nakadashi;Netori;School Uniform;Straight Shota;Tan;Tanlines','Dozamura',4.38),
+(504,'Anal;BBM / Fat Man;Blackmail;Bondage;Crossdressing;Dirty Old Man;Males only;Rape;School Uniform;Shota;Trap;Yaoi','Tachikawa Negoro',4.39),
+(505,'Anal;Crossdressing;Dirty Old Man;Maid;Males only;Mind Break;Rape;School Uniform;Shota;Stockings;Trap;Yaoi','Tachikawa Negoro',4.57),
+(506,'Anal;Elder Sister;Happy Sex;Incest;Large Breasts;Male on Futa;Shemale;Short Hair;Shota','Mogiki Hayami',4.26),
+(507,'BBW;Big Ass;Cheating;Femdom;Large Breasts;MILF;Netori;Paizuri','Toguchi Masaya',4.07),
+(508,'Ahegao;BBM / Fat Man;Bikini;Blowjob;Cosplay;Deepthroat;Large Breasts;Leg Lock;Megane;Monster Girl;Nakadashi;Nurse;Paizuri;Smegma;Stockings;Swimsuit;Teacher','Jyura',4.24),
+(509,'Anal;Blowjob;Crossdressing;Dark Skin;Deepthroat;Drugs;Gloves;Handjob;Lingerie;Males only;Prostitution;Sex Toys;Stockings;Trap;Twintails;X-ray;Yaoi','locon',4.55),
+(510,'BBM / Fat Man;Blindfold;Humiliation;Large Breasts;Magical Girl;MILF;Paizuri;Prostitution','Jyura',3.53),
+(511,'Ahegao;Blowjob;Dark Skin;Group Sex;Gyaru;Large Breasts;Megane;Prostitution;School Uniform;Slut;Sumata','Jyura',3.93),
+(512,'Anal;Collar;Devil;Elf;Group Sex;Huge Penis;Large Breasts;Monster Girl;Shemale;Stockings;Swinging / Netorase;Threesome;Twintails','Mogiki Hayami',4.07),
+(513,'Anal;Anilingus;Crossdressing;Dark Skin;Frotting;Gyaru;Handjob;Males only;Muscle;School Uniform;Stockings;Trap;Virginity (Male);Yaoi','Mogiki Hayami',4.59),
+(514,'Ahegao;Anal;Big Ass;Blowjob;Bodysuit;Dark Skin;Deepthroat;Double Penetration;Drugs;Femdom;Gangbang;Group Sex;Guro;Lactation;Large Breasts;Maledom;Mind Break;Mind Control;Muscle;Rape;Reverse Rape;Slut;Snuff;Story Arc;Stuck in Wall;Vomit;X-ray;Zombie','Fan no Hitori',4.52),
+(515,'Big Ass;Blowjob;Cousin;Gyaru;Huge Penis;Impregnation;Incest;Large Breasts;Nakadashi;Phimosis;School Uniform;Smegma','Deep Valley',4.53),
+(516,'Anal;BBM / Fat Man;Crossdressing;DILF;Frotting;Group Sex;Males only;Prostitution;Shota;Spitroast;Stockings;Trap;Yaoi','locon',4.37),
+(517,'Ahegao;Anal;BBW;Big Ass;Blowjob;Deepthroat;Drunk;Hairy;Large Breasts;MILF;Vomit;X-ray','Yokkora',4.24),
+(518,'Ahegao;Cheating;Dark Skin;Femdom;Happy Sex;Harem;Impregnation;Large Breasts;Nakadashi;Paizuri;Straight Shota;Symbol Shaped Pupils','Wamusato Haru',4.5),
+(519,'Anal;Blowjob;Crossdressing;Exhibitionism;Gothic;Gyaru;Prostitution;Stockings;Trap;Twintails;Yaoi','Tonikaku',4.65),
+(520,'Ahegao;Blowjob;Deepthroat;Double Penetration;Gokkun;Piercings;School Uniform;Sex Toys;Teacher;X-ray','Blmanian',4.4),
+(521,'Ahegao;BBM / Fat Man;Bunnygirl;Impregnation;Large Breasts;Nakadashi;Pantyhose;Prostitution;Rape;X-ray','Haikawa Hemlen',3.14),
+(522,'Ahegao;Anal;Bloomers;Blowjob;Cheerleader;Crossdressing;Dark Skin;Defloration;Double Penetration;Drugs;Femdom;Futanari;Group Sex;Large Breasts;Male on Futa;Megane;Pantyhose;Rape;Ryona;School Uniform;Short Hair;Stockings;Story Arc;Straight Shota;Tankoubon;Teacher','Butcha U',4.68),
+(523,'Big Ass;Large Breasts;MILF;Paizuri','Sugi G',4.57),
+(524,'Anal;BBW;Blowjob;Cheating;Dirty Old Man;Double Penetration;Femdom;Foot Fetish;Footjob;Gangbang;Group Sex;Happy Sex;Huge Penis;Impregnation;Incest;Large Breasts;Maledom;Megane;Nakadashi;Paizuri;Pettanko;Prostitution;Rape;Reverse NTR;School Uniform;Sex Toys;Stockings;Teacher;Tsundere;Twintails;Uncensored;Yandere','Inoue Kiyoshirou',4.55),
+(525,'Anal;Blowjob;Double Penetration;Emotionless Sex;Fingering;Group Sex;Mind Control;Rape;Scat;Short Hair;Spitroast;Tengu;Threesome;Vampire;Vomit','Makurou',4.11),
+(526,'Big Ass;Breast Sucking;Dick Growth;Drunk;Femdom;Fisting;Giantess;Huge Penis;Kimono / Yukata;Large Breasts;Muscle;Oni;Straight Shota;Tall Girl','kinntarou',4.47),
+(527,'BBW;Big Ass;Blowjob;Hairy;Large Breasts;Megane;MILF;Paizuri;Virginity (Male)','Sugi G',4.55),
+(528,'Blowjob;Breast Sucking;Cunnilingus;Dark Skin;Gyaru;Inverted Nipples;Large Breasts;Megane;MILF;Stockings;Twintails','Sugi G',4.64),
+(529,'Anal;Big Ass;Breast Sucking;Defloration;Hairy;Handjob;Lingerie;Office Lady;Pettanko;Prostitution','Sugi G',4.59),
+(530,'Ahegao;Animal Girl;BBW;Big Ass;Catgirl;Collar;Egg Laying;Femdom;Group Sex;Impregnation;Large Breasts;Lingerie;Monster Girl;Nakadashi;School Uniform;Straight Shota;Sumata','Marui Maru',4.53),
+(531,'Ahegao;Anal;Blowjob;Crossdressing;Dirty Old Man;Males only;Megane;School Swimsuit;Shota;Swimsuit;Trap;Yaoi','Zenra QQ',4.03),
+(532,'Ahegao;Anal;Double Penetration;Gangbang;Group Sex;Large Breasts;Mind Break;Nakadashi;School Uniform;Sex Toys;Stockings;Teacher;Threesome','Karasu',3.84),
+(533,'Ahegao;Bikini;Blowjob;Dark Skin;Drugs;Group Sex;Gyaru;Large Breasts;Swimsuit','Haikawa Hemlen',3.4),
+(534,'Anal;Anilingus;Bondage;Dark Skin;Gangbang;Group Sex;Large Breasts;Mind Break;Multiple Insertion;Rape;Stockings;Stomach Bulge;Vomit;Watersports','Mizuyan',3.74),
+(535,'Anal;Crossdressing;Dark Skin;Futa on Male;Group Sex;Prostitution;Rape;Shemale;Shota;Stockings;Trap;Yaoi','Tonikaku',3.81),
+(536,'Ahegao;Anal;Blowjob;Breast Sucking;Futa on Male;Futanari;Group Sex;Handjob;Hat;Huge Penis;Large Breasts;Lingerie;Male on Futa;Megane;Nurse;Office Lady;Paizuri;Pegging;Reverse Rape;Shota;Stockings','Musashino Sekai',4.6),
+(537,'Blowjob;Dark Skin;Face Sitting;Group Sex;Gyaru;Handjob;Paizuri;Prostitution;School Uniform','Gujira',4.64),
+(538,'Ahegao;BBM / Fat Man;Bunnygirl;Fingering;Rape;Scat;Time Stop','Nyuu',4.25),
+(539,'Ahegao;Blowjob;Crotchless / Breastless;Exhibitionism;Filming;Gangbang;Gloves;Group Sex;Handjob;Happy Sex;Idol;Large Breasts;Leg Lock;Masturbation;Nakadashi;Pantyhose;Slut;Stockings;Transparent Clothing;X-ray','Mizuryu Kei',4.47),
+(540,'Anal;Breast Sucking;Handjob;Muscle;Shota;Spats;Trap;X-ray;Yaoi','Cr-R',3.91),
+(541,'Ahegao;BBM / Fat Man;Bestiality;Big Areola;Blowjob;Cheating;Deepthroat;Group Sex;Handjob;Horse;Huge Penis;Impregnation;Large Breasts;Nakadashi;Netorare;School Uniform','Kizuki Rei',3.02),
+(542,'Ahegao;Blowjob;Bukkake;Dirty Old Man;Exhibitionism;Filming;Gangbang;Group Sex;Hairy;Handjob;Large Breasts;Masturbation;Nakadashi;Slut;Stockings;Symbol Shaped Pupils;Transparent Clothing;Watersports;X-ray','Mizuryu Kei',4.62),
+(543,'Ahegao;BBM / Fat Man;Big Areola;Blackmail;Blowjob;Deepthroat;Gyaru;Hairy;Huge Penis;Large Breasts;Maledom;Mind Break;Rape;School Uniform;Stockings;Tan;Tanlines;Torture;X-ray','Kizuki Rei',3.95),
+(544,'Anal;Bestiality;Big Areola;Bondage;Breast Expansion;Dark Skin;Giantess;Group Sex;Hairy;Impregnation;Lactation;Large Breasts;Megane;MILF;Nakadashi;Netori;Reverse NTR;Story Arc;Threesome;Unbirthing;Vore','Nagashima Chousuke',4.62),
+(545,'Ahegao;Anal;Big Ass;Blowjob;Cervical Penetration;Dark Skin;Devil;Double Penetration;Drugs;Fangs;Femdom;Group Sex;Handjob;Huge Breasts;Huge Penis;Inverted Nipples;Large Breasts;Monster Girl;Nakadashi;Oni;Paizuri;Rape;Reverse Rape;Stockings;Straight Shota;Threesome','Yuuki Ray',4.28),
+(546,'Ahegao;Anilingus;BDSM;Bisexual;Blowjob;Breast Sucking;Dark Skin;Elf;Face Sitting;Filming;Fingering;French Kissing;Group Sex;Handjob;Happy Sex;Impregnation;Large Breasts;Maledom;Nakadashi;School Uniform;Sex Toys;Squirting;Stockings;Symbol Shaped Pupils;Threesome;Watersports;Yuri','Fuetakishi',4.51),
+(547,'Ahegao;Anal;Anilingus;Big Ass;Bikini;Blindfold;Blowjob;Bride;Cheerleader;Crossdressing;Dog Girl;Incest;Leg Lock;Lingerie;Males only;Masturbation;Nakadashi;Nurse;Otouto;School Uniform;Sex Toys;Shimapan;Shota;Sleeping;Stockings;Swimsuit;Symbol Shaped Pupils;Tankoubon;Trap;X-ray;Yaoi','Chinzuriina',4.64),
+(548,'Anal;Big Ass;Bikini;Collar;Cosplay;Dark Skin;Futanari;Futanari on Futanari;Group Sex;Gyaru;Happy Sex;Large Breasts;Megane;Swimsuit;Threesome;Tutor','Rebis',4.51),
+(549,'Ahegao;Anal;Group Sex;Males only;Megane;Rape;Shota;Trap;Yaoi','Matashita Kintama',4.47),
+(550,'Bodysuit;Bondage;Cosplay;Crossdressing;Dark Skin;Defloration;Elder Sister;Femdom;Group Sex;Gyaru;Harem;Incest;Large Breasts;Latex;Leg Lock;Maid;Megane;Mouth Gag;Nakadashi;Onahole;Pantyhose;Pegging;School Uniform;Sex Toys;Stockings;Story Arc;Straight Shota;Tankoubon;Threesome;Trap','Chiba Toshirou',4.61),
+(551,'Ahegao;Anal;Big Ass;Bikini;Blowjob;Collar;Cunnilingus;Dark Skin;Deepthroat;Dick Growth;Frotting;Futanari;Impregnation;Large Breasts;Male on Futa;Muscle;Paizuri;Sixty-Nine;Swimsuit;Symbol Shaped Pupils;Witch;X-ray','Bajou Takurou;Chinbotsu;Rebis',4.46),
+(552,'Ahegao;Anal;Big Ass;Bodysuit;Bunnygirl;Collar;Dark Skin;Defloration;Devil;Dick Growth;Futanari;Group Sex;Harem;Huge Breasts;Impregnation;Large Breasts;Male on Futa;Monster Girl;Muscle;Shemale','Rebis',4.28),
+(553,'Anal;Blowjob;Breast Sucking;Double Penetration;Gangbang;Group Sex;Handjob;Large Breasts;Licking;Megane;Multiple Insertion;Nakadashi;Pantyhose;Short Hair;Spitroast;Straight Shota;Symbol Shaped Pupils;Uncensored;X-ray','Shindou',4.43),
+(554,'Ahegao;Anal;Anilingus;Armpit;Bathroom Sex;BBW;Big Ass;Bikini;Blindfold;Bloomers;Blowjob;Body Writing;Breast Sucking;Bukkake;Childhood Friend;Collar;Cosplay;Cunnilingus;Defloration;Double Penetration;Elder Sister;Exhibitionism;Femdom;Filming;Gangbang;Group Sex;Hairy;Handjob;Happy Sex;Hotpants;Huge Breasts;Huge Penis;Impregnation;Incest;Large Breasts;Licking;Lowleg;Maid;Maledom;Masturbation;Megane;MILF;Mother;Nakadashi;Nurse;Paizuri;Pantyhose;Phimosis;School Uniform;Sixty-Nine;Slut;Smegma;Spats;Spitroast;Squirting;Stockings;Swimsuit;Tankoubon;Teacher;Threesome;Twins;Twintails;Virginity (Male);Voyeurism;Watersports;X-ray','Sakaki Utamaru',4.1),
+(555,'Ahegao;Anal;Bukkake;Crossdressing;Drugs;Group Sex;Lingerie;Males only;Royalty;Stockings;Trap;Yaoi','Katou Chakichi',4.19),
+(556,'Big Areola;Comedy;Elder Sister;Fangs;Femdom;Hairy;Handjob;Happy Sex;Hotpants;Incest;Large Breasts;Masturbation;Nakadashi;Straight Shota;Virginity (Male);X-ray','Agata',4.38),
+(557,'Blowjob;Elder Sister;Fingering;Hairy;Handjob;Happy Sex;Incest;Large Breasts;Licking;Stockings;X-ray','Kusui Aruta',4.51),
+(558,'Childhood Friend;Defloration;Happy Sex;Hotpants;Large Breasts;Nakadashi;Short Hair;Tan;Tanlines;Tomboy;X-ray','Mikuni Mizuki',4.61),
+(559,'Ahegao;BDSM;Blowjob;Bondage;Cunnilingus;Defloration;Face Sitting;Femdom;Group Sex;Hairy;Hairy Armpits;Large Breasts;Masturbation;Megane;MILF;Nakadashi;School Swimsuit;Sex Toys;Squirting;Stockings;Story Arc;Swimsuit;Teacher;Threesome;X-ray','Saiyazumi',4.19),
+(560,'Ahegao;Anal;Big Ass;Breast Sucking;Fingering;Happy Sex;Incest;Lactation;Large Breasts;MILF;Mother;Nakadashi;Pajamas;Straight Shota;X-ray','type.90',4.05),
+(561,'Ahegao;Anal;Bikini;Blowjob;Crossdressing;Exhibitionism;Futa on Male;Futanari;Futanari on Futanari;Group Sex;Humiliation;Large Breasts;Male on Futa;Masturbation;Megane;MILF;School Uniform;Story Arc;Swimsuit;Teacher','Kurenai Yuuji',4.57),
+(562,'Big Ass;Blowjob;Breast Sucking;Drunk;Femdom;French Kissing;Full Color;Handjob;Impregnation;Incest;Large Breasts;Leg Lock;MILF;Mother;Nakadashi;Reverse Rape;Sleeping;Squirting;Story Arc;Straight Shota;Virginity (Male);X-ray','Kuroneko Smith',4.59),
+(563,'BBW;Big Ass;Decensored;Defloration;Fangs;Femdom;Handjob;Happy Sex;Huge Breasts;Imouto;Incest;Large Breasts;Maledom;Nakadashi;NEET / Hikkikomori;Onahole;Prostitution;School Swimsuit;Sex Toys;Stockings;Sweating;Swimsuit;Tsundere;X-ray','Fukumaaya',4.56),
+(564,'Anal;Bathroom Sex;Cosplay;Crossdressing;Incest;Males only;Mind Break;Prostitution;Shota;Stockings;Trap;Uncle;Yaoi','Inari',4.63),
+(565,'Ahegao;Bondage;Elder Sister;Futanari;Futanari on Futanari;Hairy;Hairy Armpits;Huge Penis;Incest;Large Breasts;Multiple Penises;Pantyhose;Phimosis;School Uniform;Shemale;Smegma;Urethra Insertion;Virginity (Male)','Mikoyan;RADIOHEAD',2.91),
+(566,'Anal;Crossdressing;Happy Sex;Incest;Males only;Otouto;Sex Toys;Shota;Stockings;Trap;Yaoi','Nise',4.45),
+(567,'Ahegao;Anal;Big Ass;Blowjob;Dark Skin;Double Penetration;Gangbang;Group Sex;Gyaru;Huge Penis;Large Breasts;Multiple Insertion;Spitroast','nuezou',4.57),
+(568,'Blowjob;Breast Sucking;Comedy;Cunnilingus;Deepthroat;Femdom;French Kissing;Guro;Happy Sex;Monster Girl;Nakadashi;Reverse Rape;School Uniform;Slut;Zombie','Wanao',4.63),
+(569,'Anal;BBM / Fat Man;Big Ass;Blowjob;Bondage;Daughter;Deepthroat;Defloration;Dirty Old Man;Group Sex;Gyaru;Human Toilet;Incest;Large Breasts;Nakadashi;Prostitution;School Uniform;Stuck in Wall;Tan','Psycho',4.43),
+(570,'Anal;Bondage;Cheating;Collar;Crossdressing;Drunk;Femdom;Gangbang;Group Sex;Hairy;Hairy Armpits;Incest;Large Breasts;Megane;MILF;Mother;Office Lady;Pegging;Phimosis;Sex Toys;Sleeping;Spanking;Stockings;Story Arc;Straight Shota;Trap;Virginity (Male)','Kuroiwa Menou',4.3),
+(571,'Anal;Birth;Breast Sucking;Femdom;Futanari;Inverted Nipples;Large Breasts;Mind Break;Monster Girl;Nakadashi;Nurse;Penis Birth;Reverse Rape;Slime Girl;Snuff;Straight Shota;Tentacles;Urethra Insertion;Vore;X-ray','Akazawa RED',3.83),
+(572,'Band-Aid / Pasties;Birth;Collar;Corruption;Decensored;Devil;Dick Growth;Egg Laying;Futanari;Impregnation;Large Breasts;Magical Girl;Mind Break;Monster;Monster Girl;Pregnant;Rape;Stomach Bulge;Tentacles;Transformation;X-ray','Amatake Akewo',3.88),
+(573,'Anal;Cheerleader;Crossdressing;Gangbang;Group Sex;Huge Penis;Males only;Mind Break;Muscle;Nakadashi;Shota;Trap;Yaoi','Collagen',4.33),
+(574,'Anal;Crossdressing;Males only;Shota;Trap;Yaoi','Katou Jun',4.37),
+(575,'Big Areola;Big Ass;Blowjob;Double Penetration;Futanari;Group Sex;Huge Breasts;Huge Penis;Large Breasts;Male on Futa;Shota','Musashino Sekai',4.36),
+(576,'Anal;Anilingus;Crossdressing;Foot Fetish;Footjob;Futa on Male;Futanari;Happy Sex;Large Breasts;Pantyhose;School Swimsuit;Slime Girl','Nyx',4.18),
+(577,'Ahegao;Bloomers;Blowjob;Cunnilingus;Deepthroat;Exhibitionism;Fingering;Group Sex;Hairy;Happy Sex;Inverted Nipples;Invisible;Large Breasts;Leg Lock;Masturbation;Megane;Menstruation;Nakadashi;Netori;School Uniform;Spitroast;Story Arc;Threesome;X-ray','Sabusuka',4.66),
+(578,'Anal;BBW;Bikini;Bondage;Bukkake;Crotchless / Breastless;Femdom;Gokkun;Humiliation;Large Breasts;Megane;Military Uniform;Mind Break;Nakadashi;Pegging;Reverse Rape;Sex Toys;Swimsuit','Sugar Milk',3.91),
+(579,'Arachne;Bondage;Femdom;Monster Girl;Nakadashi;Orgasm Denial;Reverse Rape;Straight Shota','aho / AHOBAKA',4.15),
+(580,'Anal;BBW;Big Areola;Big Ass;Blowjob;Freckles;Hairy;Hairy Armpits;Huge Breasts;Large Breasts;Nakadashi;Rape;Sleeping;Straight Shota','Akikusa Peperon',4.28),
+(581,'BBW;Big Ass;Bloomers;Blowjob;Bondage;Breast Sucking;Bukkake;Comedy;Elder Sister;Exhibitionism;Femdom;Group Sex;Hairy;Handjob;Happy Sex;Harem;Huge Breasts;Huge Penis;Impregnation;Incest;Inverted Nipples;Kimono / Yukata;Lactation;Large Breasts;Legal Loli;Maledom;Megane;MILF;Mother;Nakadashi;Onahole;Onsen;Paizuri;Pettanko;Phimosis;Rape;Reverse Rape;School Uniform;Short Hair;Spitroast;Squirting;Straight Shota;Sweating;Swinging / Netorase;Tankoubon;Teacher;Threesome;Virginity (Male);Voyeurism;Widow;X-ray','Agata',4.6),
+(582,'BBW;Blowjob;Decensored;Elder Sister;Happy Sex;Huge Breasts;Incest;Inseki;Large Breasts;Masturbation;Nakadashi;Smegma;Stockings','bobobo',4.6),
+(583,'Bestiality;Blowjob;Breast Sucking;Cervical Penetration;Dark Skin;Deepthroat;Defloration;Handjob;Hotpants;Large Breasts;Nakadashi;Stomach Bulge;Sumata;X-ray','Zucchini',4.33),
+(584,'BBM / Fat Man;Bondage;Femdom;Gyaru;Lamia;Large Breasts;Monster Girl;Prostitution;Symbol Shaped Pupils;Tailjob;Tan;Teacher','aho / AHOBAKA',4.52),
+(585,'Anal;Big Ass;Bikini;Bisexual;Blowjob;Collar;Cosplay;Dark Skin;Fingering;Group Sex;Gyaru;Happy Sex;Huge Breasts;Huge Penis;Large Breasts;Megane;Paizuri;Slut;Stockings;Swimsuit;Threesome;Virginity (Male)','Rebis',4.53),
+(586,'Anal;Anilingus;BBW;Blackmail;Breast Sucking;Diaper;Femdom;Foot Fetish;Hairy Armpits;Handjob;Large Breasts;MILF;Pegging;Sex Toys;Smell','Sugar Milk',3.53),
+(587,'Dark Skin;Grandmother;Impregnation;Incest;Large Breasts;Nakadashi;Tattoo;Witch','Abubu',4.64),
+(588,'Ahegao;Anal;Big Ass;Blackmail;Blowjob;Large Breasts;Military Uniform;Stockings','nuezou',4.51),
+(589,'Big Ass;Drugs;Femdom;Footjob;Large Breasts;Long Tongue;Mind Break;Mind Control;Monster Girl;Reverse NTR;School Uniform;Stockings;Teacher;X-ray','aho / AHOBAKA',3.48),
+(590,'Bondage;Condom;Drugs;Femdom;Group Sex;Large Breasts;Mind Break;Monster Girl;Reverse Rape;Tentacles;X-ray','aho / AHOBAKA',4.07),
+(591,'Centaur;Gangbang;Group Sex;Handjob;Inverted Nipples;Monster Girl;Nakadashi;Straight Shota;Virginity (Male)','Kuroshiki',4.07),
+(592,'Armpit;Big Ass;Face Sitting;Femdom;Handjob;Large Breasts;Megane;Nakadashi;Nurse;Pantyhose;Slut;Stockings;Straight Shota;Succubus;Virginity (Male)','Yunioshi',4.21),
+(593,'Arachne;Big Ass;Blowjob;Drugs;Femdom;Happy Sex;Large Breasts;Monster Girl;Nakadashi;Stockings;Sweating;X-ray','Nakamura Regura',4.64),
+(594,'Ahegao;Birth;Crossdressing;Defloration;Devil;Dick Growth;Egg Laying;Footjob;Futanari;Huge Penis;Human Toilet;Impregnation;Lactation;Large Breasts;Male on Futa;Mind Break;Mind Control;Monster;Monster Girl;Nakadashi;Pregnant;Rape;Stomach Bulge','Amatake Akewo',3.89),
+(595,'Anal;Bisexual;Crossdressing;Defloration;Foot Fetish;Footjob;Group Sex;Impregnation;Leg Lock;Mind Break;Nakadashi;Pettanko;Reverse NTR;Snuff;Trap;Uncensored;X-ray;Yaoi','Heiqing Langjun',4.4),
+(596,'Ahegao;Anal;Anthology;Blowjob;Bodysuit;Bondage;Dark Skin;Deepthroat;Elf;Futanari;Gokkun;Group Sex;Large Breasts;Male on Futa;MILF;Mind Break;Mind Control;Mouth Gag;Paizuri;Police Uniform;Rape;Smegma;Tentacles','Kloah;Otoo;Shinkuu Tatsuya;Shotenin Matori;Tokisana',4.25),
+(597,'Ahegao;Bathroom Sex;Big Ass;Childhood Friend;Cunnilingus;Defloration;Dojikko;Handjob;Happy Sex;Large Breasts;Masturbation;Nakadashi;Short Hair;Squirting','Amatarou',4.65),
+(598,'Ahegao;Anilingus;BBM / Fat Man;Bikini;Blowjob;Dark Skin;Gyaru;Hairy Armpits;Large Breasts;Nakadashi;Paizuri;Prostitution;Swimsuit','Motsu',4.19),
+(599,'Dragon Girl;Happy Sex;Large Breasts;Monster Girl','Gen',4.61),
+(600,'Face Sitting;Footjob;Gyaru;Large Breasts;Nakadashi;School Uniform;Teacher;X-ray','Gujira',4.61),
+(601,'Ahegao;Anal;Animal Boy;Big Ass;Blowjob;Bunnygirl;Catgirl;Femdom;Fingering;Fisting;Furry;Futa on Male;Futanari;Harem;Huge Breasts;Huge Penis;Large Breasts;Lingerie;Muscle;Pegging;Reverse Rape;Ryona;Shemale;Shota;Sixty-Nine;Stockings;Stomach Bulge','Bundosuiko',3.67),
+(602,'Blowjob;Breast Expansion;Defloration;Doll;Happy Sex;Nakadashi;Paizuri;Pantyhose;School Uniform','SeN',4.57),
+(603,'Bloomers;Blowjob;Defloration;Fingering;Happy Sex;Nakadashi;School Uniform;Short Hair;Tall Girl;Tomboy','Bubuzuke',4.64),
+(604,'Blowjob;Cunnilingus;Handjob;Impregnation;Large Breasts;Nakadashi;Paizuri;School Uniform;Sixty-Nine;Straight Shota','Karei | Hirame',4.64),
+(605,'Ahegao;Exhibitionism;Group Sex;Human Toilet;Large Breasts;Megane;School Uniform;Slut;Virginity (Male)','Yumeno Tanuki',4.3),
+(606,'Big Ass;Blowjob;Crotchless / Breastless;Dark Skin;Defloration;Devil;Face Sitting;French Kissing;Gyaru;Happy Sex;Large Breasts;Leg Lock;Lingerie;Nakadashi;Paizuri;School Uniform;Small Penis;Tall Girl;Virginity (Male);X-ray','Miyamoto Issa',4.62),
+(607,'Decensored;Egg Laying;Group Sex;Harem;Impregnation;Monster Girl;Nakadashi;Pettanko;Shimaidon;Squirting;Sumata;X-ray','Mizone',4.63),
+(608,'Anal;Bikini;Exhibitionism;Group Sex;Happy Sex;Harem;Pettanko;Swimsuit;Threesome;Twins','Takemura Sesshu',4.65),
+(609,'Ahegao;Anal;Big Ass;Collar;Crossdressing;Hotpants;Huge Penis;Large Breasts;Male on Futa;Muscle;Prostitution;Shemale','Chinbotsu',4.1),
+(610,'Blowjob;Defloration;Femdom;Happy Sex;Lamia;Leg Lock;Long Tongue;Masturbation;Megane;Monster Girl;Nakadashi;Symbol Shaped Pupils;X-ray','Mizone',4.61),
+(611,'Ahegao;Anal;BBW;Blowjob;Collar;Group Sex;Huge Penis;Large Breasts;Male on Futa;Muscle;Prostitution;Shemale;Threesome','Chinbotsu',4.24),
+(612,'Blowjob;Condom;Dark Skin;Deepthroat;Gyaru;Happy Sex;Large Breasts;Nakadashi;Paizuri;School Uniform;Symbol Shaped Pupils;Teacher;X-ray','Orikuchi',4.65),
+(613,'Anal;Bisexual;Blowjob;Enema;Filming;Fingering;Group Sex;Harem;School Uniform;Voyeurism;Watersports;Yuri','Takemura Sesshu',4.71),
+(614,'BBM / Fat Man;Defloration;Hairy;Impregnation;Large Breasts;Nakadashi;School Uniform;Stockings;Teacher;Twintails;X-ray','Jingrock',4.29),
+(615,'Anal;Blowjob;Childhood Friend;Defloration;Drunk;Happy Sex;Large Breasts;Miko;Nakadashi;Short Hair;Tomboy','Tomotsuka Haruomi',4.58),
+(616,'Anal;Blowjob;Bondage;Cosplay;Crossdressing;Femdom;Fingering;Large Breasts;Pegging;Stockings;Strap-on;Trap;Witch','Uesugi Kyoushirou',4.26),
+(617,'Ahegao;Assjob;Bathroom Sex;Blowjob;Cunnilingus;Drunk;Nakadashi;Pettanko;Prostitution;School Uniform;Teacher;Twintails;Watersports','Tsuttsu',4.55),
+(618,'Big Ass;Cheating;Dark Skin;Elf;Large Breasts;Megane;School Uniform;Stockings;X-ray','Fuetakishi',4.37),
+(619,'Blowjob;Comedy;Drugs;Group Sex;Hat;Large Breasts;Nakadashi;Paizuri;Pantyhose;Shimapan;Short Hair;Spitroast','Itou Eight',4.13),
+(620,'Big Ass;Defloration;Elf;Large Breasts;Megane;School Uniform;Stockings','Fuetakishi',4.5),
+(621,'Ahegao;Anal;Big Areola;Blowjob;Bukkake;Crossdressing;Deepthroat;Face Sitting;Femdom;Fisting;Group Sex;Incest;Large Breasts;Mind Break;Pantyhose;Prostitution;Rape;Ryona;Sex Toys;Stockings;Stomach Bulge;Trap;Yaoi','Bundosuiko',3.0),
+(622,'Big Ass;Blowjob;Elf;Large Breasts;Megane;Paizuri;School Uniform;Stockings;X-ray','Fuetakishi',4.45),
+(623,'Happy Sex;Nakadashi;School Uniform;X-ray','Kikunosukemaru',4.48),
+(624,'Ahegao;Anal;BBM / Fat Man;Blowjob;Bondage;Bukkake;Cheating;Deepthroat;Defloration;Double Penetration;Group Sex;Happy Sex;Imouto;Impregnation;Incest;Inseki;Large Breasts;Maid;Megane;Mouth Gag;Nakadashi;Netorare;Prostitution;Rape;School Uniform;Shimaidon;Stockings;Story Arc;Tankoubon;Threesome;Watersports;X-ray','TEL',4.51),
+(625,'BBW;Big Ass;Cheating;French Kissing;Hairy;Incest;Large Breasts;Leg Lock;MILF;Mother;Nakadashi;Straight Shota;Virginity (Male);X-ray','Jitsuma',4.44),
+(626,'Ahegao;Anal;Anilingus;Birth;Bondage;Corruption;Cunnilingus;Double Penetration;Drugs;Egg Laying;Group Sex;Human Cattle;Impregnation;Inverted Nipples;Lactation;Large Breasts;Mind Break;Monster;Multiple Penises;Nakadashi;Pettanko;Pregnant;Slave;Stomach Bulge;Twintails','Tokoyo Akashi',3.86),
+(627,'Ahegao;Anal;Cosplay;Cunnilingus;Defloration;Devil;Enema;Face Sitting;Femdom;Footjob;Happy Sex;Imouto;Impregnation;Incest;Leg Lock;Nakadashi;Naked Apron;Pettanko;School Uniform;Sex Toys;Squirting;Stockings;Story Arc;Succubus;Tsundere;Watersports;X-ray','Amano Kazumi',4.64),
+(628,'Alien;Anal;Birth;Body Modification;Brain Fuck;Breast Expansion;Dark Skin;Double Penetration;Ear Fuck;Egg Laying;Elf;Impregnation;Large Breasts;Monster;Nakadashi;Rape;Stockings;Stomach Bulge;Tentacles;X-ray','Butcha U',3.98),
+(629,'Ahegao;Blowjob;Defloration;Elder Sister;Happy Sex;Incest;Large Breasts;Maledom;Nakadashi;NEET / Hikkikomori;Spanking;Sweating;Yandere','Aoki Kanji',4.56),
+(630,'Femdom;Kunoichi;Muscle;Straight Shota','Dynamite Kit',4.17),
+(631,'Blackmail;Blowjob;Defloration;Femdom;French Kissing;Happy Sex;Large Breasts;Leg Lock;Lingerie;Mouth Gag;Nakadashi;Stockings;Twintails','Suzuki Akoni',4.66),
+(632,'Ahegao;Anal;BDSM;Blowjob;Bodysuit;Bondage;Cervical Penetration;Crotchless / Breastless;Cunnilingus;Deepthroat;Defloration;Fingering;Group Sex;Hairy Armpits;Happy Sex;Inverted Nipples;Large Breasts;Latex;Maledom;MILF;Mouth Gag;Nakadashi;Oyakodon;School Uniform;Sex Toys;Slut;Spanking;Threesome;Virginity (Male)','Otochichi',4.58),
+(633,'Ahegao;Big Ass;Blowjob;Defloration;Drugs;Femdom;Gokkun;Large Breasts;Leg Lock;Nakadashi;Paizuri;Pantyhose;Symbol Shaped Pupils','Pochi.',4.54),
+(634,'Anal;Blowjob;Crossdressing;Males only;Scat;Shota;Swimsuit;Trap;Yaoi','Chinzuriina',3.81),
+(635,'Ahegao;Blowjob;Deepthroat;French Kissing;Group Sex;Impregnation;Mind Break;Nakadashi;Netorare;Rape;Spanking;Spitroast;Threesome;X-ray','Una-don',3.43),
+(636,'Ahegao;Big Ass;Bikini;Blowjob;Condom;Exhibitionism;Femdom;Happy Sex;Large Breasts;Paizuri;School Swimsuit;Swimsuit;Symbol Shaped Pupils;X-ray','Pochi.',4.62),
+(637,'BBW;Big Ass;Blowjob;Childhood Friend;Defloration;Femdom;French Kissing;Hairy;Happy Sex;Huge Penis;Large Breasts;Masturbation;Nakadashi;Paizuri;Sleeping;Sweating;Symbol Shaped Pupils','Rocket Monkey',4.58),
+(638,'Anal;Anilingus;Bondage;CBT;Collar;Face Sitting;Femdom;Foot Fetish;Footjob;Pantyhose;Slave;Symbol Shaped Pupils','Oouso',3.06),
+(639,'BBW;Big Ass;Blowjob;Dark Skin;Deepthroat;Elf;Hairy;Impregnation;Large Breasts;Lingerie;MILF;Nakadashi;Paizuri;Stockings','Orutoro',4.65),
+(640,'Ahegao;Anal;BBW;Bloomers;Blowjob;Bukkake;Double Penetration;Gangbang;Group Sex;Large Breasts;Paizuri;School Uniform;Slut;Squirting;Swimsuit','Shirota Dai',3.88),
+(641,'Anal;Blowjob;Cosplay;Crossdressing;Huge Penis;Males only;Shota;Stockings;Trap;Yaoi','Kanimaru',4.43),
+(642,'Ahegao;BBM / Fat Man;Dark Skin;Gyaru;Lactation;Nakadashi;Piercings;Pregnant;Prostitution;Ryona;Snuff;Tattoo;Uncensored','ShindoL',3.86),
+(643,'Ahegao;Anal;Breast Expansion;Crossdressing;Dark Skin;Futa on Male;Futanari;Gender Bender;Male on Futa;Mind Break;Multiple Insertion;Muscle;Rape;Shemale;Trap;Yaoi','Drill Jill',4.15),
+(644,'Ahegao;Anal;Crossdressing;Group Sex;Lingerie;Maid;Males only;Multiple Insertion;Prostitution;Shota;Smegma;Stockings;Trap;Twintails;Yaoi','Ere 2 Earo',4.65),
+(645,'Ahegao;Blowjob;Cunnilingus;Face Sitting;Fingering;Full Color;Group Sex;Harem;Huge Breasts;Hypnosis;Large Breasts;Masturbation;Nakadashi;Paizuri;School Uniform;Sex Toys;Threesome;Twintails','Yamada Gogogo',4.36),
+(646,'Ahegao;Anal;Crossdressing;Maid;Males only;Shota;Stockings;Trap;Yaoi','SGK',4.29),
+(647,'Ahegao;Anal;BBW;Blowjob;Cheating;Cunnilingus;Dark Skin;Deepthroat;Dirty Old Man;Double Penetration;Footjob;Gangbang;Group Sex;Gyaru;Huge Breasts;Huge Penis;Idol;Impregnation;Incest;Inverted Nipples;Large Breasts;MILF;Mother;Multiple Insertion;Paizuri;Prostitution;School Uniform;Slut;Spitroast;Straight Shota;Sumata;Tankoubon;Teacher;Uncensored','bobobo',4.64),
+(648,'Ahegao;Anal;BDSM;Bisexual;Blindfold;Bondage;Cousin;Crossdressing;Dark Skin;Double Penetration;Femdom;Group Sex;Gyaru;Huge Penis;Incest;Megane;Mouth Gag;Nakadashi;Pegging;Rape;School Uniform;Sex Toys;Shota;Stockings;Trap;Yaoi','Royal Koyanagi',4.26),
+(649,'Aunt;Bathroom Sex;BBW;Big Ass;Bikini;Blowjob;Cheating;Cunnilingus;Femdom;Incest;Large Breasts;Licking;Masturbation;MILF;Nakadashi;Paizuri;Sleeping;Straight Shota;Sumata;Swimsuit','Jinsuke',4.6),
+(650,'Ahegao;Anal;Anilingus;Animal Boy;Blowjob;Breast Sucking;Centaur;Fingering;Full Color;Males only;Monster;Nakadashi;Prostate Massage;Tentacles;Trap;Watersports;Yaoi','Azi Dahaka',4.26),
+(651,'Anal;Big Ass;Blowjob;Double Penetration;Futanari;Group Sex;Handjob;Huge Penis;Large Breasts;Male on Futa;Megane;Nakadashi;Spitroast','Kurenai Yuuji',4.29),
+(652,'Blowjob;Centaur;Daughter;Decensored;Defloration;Dick Growth;Footjob;Fox Girl;Group Sex;Happy Sex;Harpy;Incest;Inverted Nipples;Layer Cake;Megane;MILF;Monster Girl;Mother;Multiple Penises;Nakadashi;Oyakodon;School Uniform;Short Hair;Sweating;Threesome;Transformation;Voyeurism','Mizone',4.59),
+(653,'BBM / Fat Man;Centaur;Collar;Decensored;Group Sex;Monster Girl;Nakadashi;Shimaidon;Short Hair;Symbol Shaped Pupils;Threesome','Mizone',4.32),
+(654,'Blowjob;Defloration;Gyaru;Hairy;Happy Sex;Licking;Nakadashi;Sweating;Tsundere;Virginity (Male)','makki',4.64),
+(655,'Ahegao;BBM / Fat Man;Big Ass;Blowjob;Bondage;Breast Sucking;Condom;Cunnilingus;Dark Skin;Deepthroat;Drugs;Femdom;Footjob;Gokkun;Group Sex;Gyaru;Happy Sex;Large Breasts;Nakadashi;Paizuri;Pettanko;Prostitution;Rape;School Uniform;Shimapan;Short Hair;Slut;Stockings;Straight Shota;Tankoubon;Uncensored;X-ray','Gujira',4.57),
+(656,'Childhood Friend;Elder Sister;Large Breasts;Masturbation;Sex Toys;Solo Action;Stockings;Tall Girl;Voyeurism','Denkichi',4.32),
+(657,'Blowjob;Cunnilingus;Elder Sister;Handjob;Inseki;Large Breasts;Masturbation;Nakadashi;Sex Toys;Solo Action;Stockings;Tall Girl;Voyeurism','Denkichi',4.43),
+(658,'Ahegao;Anal;BDSM;Cosplay;Crossdressing;Devil;Lactation;Males only;Shota;Trap;Wings;Yaoi','Kaitou Yuuhi',4.35),
+(659,'Anal;Blowjob;Group Sex;Handjob;Large Breasts;Male on Futa;Prostitution;Shemale;Shota;Spitroast;Threesome;Virginity (Male)','Mogiki Hayami',4.42),
+(660,'Anal;Crossdressing;Frotting;Large Breasts;Male on Futa;MILF;Paizuri;Prostitution;Shemale;Shota;Spanking;Stockings;Trap','Mogiki Hayami',4.35),
+(661,'Big Ass;Dark Skin;Femdom;Gyaru;Happy Sex;Large Breasts;Nakadashi;Stockings;X-ray','Uo Denim',4.56),
+(662,'Ahegao;Anal;BBW;Big Ass;Bikini;Blowjob;Bondage;Cheating;Childhood Friend;Cosplay;Deepthroat;Drunk;Group Sex;Hairy;Happy Sex;Harem;Huge Breasts;Impregnation;Incest;Large Breasts;Licking;Lingerie;Maledom;Megane;MILF;Mother;Nakadashi;Nurse;Paizuri;Pantyhose;School Uniform;Sex Toys;Shibari;Shota;Stockings;Story Arc;Straight Shota;Swimsuit;Tan;Tankoubon;Tanlines;Teacher;Threesome;X-ray','Toguchi Masaya',4.48),
+(663,'Ahegao;Anal;BBM / Fat Man;BBW;Big Ass;Blackmail;Blindfold;CBT;Condom;Crossdressing;Dark Skin;Double Penetration;Femdom;Filming;Group Sex;Gyaru;Hairy;Handjob;Huge Breasts;Impregnation;Large Breasts;Megane;Nakadashi;Netorare;Paizuri;Prostitution;School Uniform;Slut;Stockings;Straight Shota;Tankoubon;Threesome','Taihei Tengoku',4.42),
+(664,'Anal;Anilingus;Animal Girl;Catgirl;Cow Girl;Devil;Full Color;Furry;Giantess;Group Sex;Harpy;Lactation;Large Breasts;Mermaid;Monster Girl;Piercings;Prostate Massage;Prostitution;Rape;Straight Shota;Tentacles','Porika',3.92),
+(665,'Ahegao;Anal;Blowjob;Catgirl;Dark Skin;Double Penetration;Group Sex;Gyaru;Large Breasts;School Uniform;Slut;Spitroast;Threesome;Twintails','Sunagawa Tara',4.38),
+(666,'Ahegao;Anal;Big Ass;Birth;Blowjob;Corruption;Defloration;Devil;DILF;Dirty Old Man;Exhibitionism;Fingering;Gangbang;Group Sex;Hairy;Hat;Huge Breasts;Human Cattle;Human Toilet;Humiliation;Impregnation;Large Breasts;Mind Break;Mind Control;Nakadashi;Pettanko;Piercings;Pregnant;Prolapse;Prostitution;Rape;Slave;Spitroast;Squirting;Stockings;Twintails;Watersports;X-ray','Neromashin',3.79),
+(667,'Ahegao;Big Ass;Blowjob;Childhood Friend;Deepthroat;Happy Sex;Huge Penis;Large Breasts;Nakadashi;Short Hair;Spats;Stockings;Tomboy','Ulrich',4.59),
+(668,'Blowjob;Bondage;Dark Skin;Drugs;Femdom;Monster Girl;Straight Shota','Takahashi Note',4.52),
+(669,'Breast Sucking;Defloration;Dog Girl;Happy Sex;Megane;School Uniform;Stockings','Ashiomi Masato',4.66),
+(670,'Anal;BBW;Big Ass;Blowjob;Furry;Handjob;Impregnation;Large Breasts;Maid;Monster Girl;Muscle;Orc;Pregnant;Scat;Sleeping;Uncensored;Watersports','Nezumi',4.28),
+(671,'Ahegao;Anal;Anilingus;Blowjob;Body Writing;Bukkake;Bunnygirl;Cervical Penetration;Chastity Belt;Collar;Cunnilingus;Dark Skin;Double Penetration;Exhibitionism;Femdom;Futanari;Group Sex;Gyaru;Harem;Huge Penis;Lactation;Large Breasts;Latex;Lingerie;Long Tongue;Maid;MILF;Mind Break;Muscle;Nakadashi;Nipple Penetration;Piercings;Pregnant;Prostitution;Rape;Short Hair;Slut;Stockings;Story Arc;Straight Shota;Tankoubon;Tattoo;Threesome;Watersports','Aoyama Akira',4.25),
+(672,'Blowjob;Catgirl;Cheating;Childhood Friend;Collar;Defloration;Elder Sister;French Kissing;Happy Sex;Incest;Inseki;Loli;Nakadashi;Pettanko;School Uniform;Stockings;Tankoubon','Napata',4.66),
+(673,'Blowjob;Bunnygirl;French Kissing;Happy Sex;Large Breasts;Maid;Masturbation;Nakadashi;Solo Action;Stockings;Symbol Shaped Pupils;X-ray','majoccoid',4.61),
+(674,'Aunt;Big Ass;Blackmail;Gloves;Incest;Large Breasts;Lingerie;Nakadashi;Paizuri;Stockings;Sumata','Uo Denim',4.66),
+(675,'Age Progression;Age Regression;Anal;Bathroom Sex;Blowjob;Breast Sucking;Cheating;Childhood Friend;Collar;Cunnilingus;Dark Skin;Defloration;Demon Girl | Succubus;Drugs;Fingering;French Kissing;Hairy;Handjob;Happy Sex;Impregnation;Large Breasts;Loli;MILF;Nakadashi;Nurse;Piercings;School Uniform;Sex Toys;Short Hair;Sixty-Nine;Squirting;Stockings;Straight Shota;Sweating;Symbol Shaped Pupils;Tankoubon;Tutor;Twintails;Uncensored;Virginity (Male)','Napata',4.62),
+(676,'Ahegao;Anal;Autofellatio;Crossdressing;Dark Skin;Foot Fetish;Group Sex;Males only;Mind Break;Mind Control;Prostate Massage;Sex Toys;Shota;Trap;Yaoi','Katou Chakichi',4.57),
+(677,'Ahegao;Anal;Big Ass;Bloomers;Blowjob;Body Writing;Bukkake;Collar;Deepthroat;Defloration;Double Penetration;Gangbang;Group Sex;Human Toilet;Humiliation;Large Breasts;Lingerie;Maledom;Mind Break;Mind Control;Multiple Insertion;Nakadashi;Rape;School Uniform;Slave','Fan no Hitori',3.9),
+(678,'Blowjob;Catgirl;Cosplay;Cunnilingus;Defloration;Drunk;Handjob;Happy Sex;Large Breasts;Nakadashi;Sixty-Nine;Stockings;Uncensored;X-ray','Umakuchi Shouyu',4.7),
+(679,'Anal;Anilingus;Blowjob;Cunnilingus;Dark Skin;Group Sex;Happy Sex;Large Breasts;Masturbation;Short Hair;Threesome;Uncensored','mogg',4.51),
+(680,'Elder Sister;Femdom;Group Sex;Happy Sex;Incest;Inseki;Large Breasts;Monster Girl;Paizuri;Straight Shota;Symbol Shaped Pupils;Threesome;Twins;X-ray','Pochi.',4.61),
+(681,'Cousin;Happy Sex;Incest;Large Breasts;Nakadashi;Swimsuit;Uncensored','mogg',4.45),
+(682,'Age Progression;Anal;Big Ass;Breast Expansion;Catgirl;Devil;Dirty Old Man;Double Penetration;Fox Girl;Group Sex;Large Breasts;Loli;Lowleg;Masturbation;Megane;Miko;MILF;Monster;Monster Girl;Nakadashi;Paizuri;Sex Toys;Stockings;Straight Shota;Sumata;Tankoubon;Transformation;Watersports;X-ray','E-Musu Aki',4.58),
+(683,'Big Ass;Blowjob;Dark Skin;Gyaru;Happy Sex;Large Breasts;Nakadashi;Paizuri;School Swimsuit;Swimsuit;Teacher','Uo Denim',4.63),
+(684,'Anal;Anilingus;Blowjob;Chikan;Crossdressing;Crotchless / Breastless;Group Sex;Huge Penis;Males only;Masturbation;Nakadashi;Sex Toys;Slut;Spitroast;Stockings;Symbol Shaped Pupils;Threesome;Trap;Twintails;Voyeurism;Yaoi','Zenra QQ',4.42),
+(685,'Ahegao;Anal;Bestiality;Bikini;Condom;Group Sex;Gyaru;Hotpants;Large Breasts;Stockings;Straight Shota;Swimsuit','Puyocha | YO',4.48),
+(686,'Ahegao;Blowjob;Bukkake;Condom;Exhibitionism;Fingering;Gyaru;Happy Sex;Hat;Hotpants;Large Breasts;Masturbation;Nakadashi;Paizuri;Slut;Squirting;Symbol Shaped Pupils;Tattoo;Twintails','sian',4.67),
+(687,'Ahegao;Anal;BBM / Fat Man;Big Ass;Dog Girl;Double Penetration;Group Sex;Large Breasts;Megane;Mind Break;Pet Girl;Spanking;Spitroast;Stockings;Straight Shota;Tall Girl;Teacher;Threesome','kanbe',4.41),
+(688,'Big Ass;Childhood Friend;Defloration;Happy Sex;Large Breasts;Nakadashi;Swimsuit;Uncensored','utu',4.63),
+(689,'Ahegao;Anal;Double Penetration;Group Sex;Gyaru;Nakadashi;Pantyhose;Slut;Symbol Shaped Pupils;X-ray','sian',4.45),
+(690,'Ahegao;Anal;Big Ass;Blackmail;Blowjob;Bukkake;Cheating;Condom;Dark Skin;Daughter;Deepthroat;Defloration;Dirty Old Man;Drugs;Exhibitionism;Fingering;Gangbang;Group Sex;Gyaru;Hairy;Hotpants;Humiliation;Impregnation;Incest;Lactation;Large Breasts;Maledom;Masturbation;Megane;Mind Break;Nakadashi;Piercings;Pregnant;Prostitution;Rape;Ryona;School Uniform;Slut;Smegma;Snuff;Squirting;Stockings;Sumata;Symbol Shaped Pupils;Tankoubon;Tattoo;Torture;Uncensored;Vomit;Watersports;X-ray','ShindoL',4.37),
+(691,'Anal;Crossdressing;Full Color;Group Sex;Males only;Shota;Trap;Yaoi','NemuNemu',4.64),
+(692,'Ahegao;Anal;Crossdressing;Dark Skin;Drugs;Father;Ghost;Group Sex;Incest;Males only;Megane;Otouto;School Uniform;Spitroast;Stockings;Trap;Yaoi','Zenra QQ',3.82),
+(693,'Ahegao;BBM / Fat Man;Bikini;Blowjob;Bukkake;Fingering;Group Sex;Hypnosis;Large Breasts;Mind Break;Paizuri;Rape;Sex Toys;Short Hair;Sweating;Swimsuit;Threesome;X-ray','Jyura',4.27),
+(694,'Anal;Anthology;Bikini;Crossdressing;Frotting;Gokkun;Group Sex;Handjob;Kimono / Yukata;Males only;Megane;Nakadashi;Pantyhose;School Uniform;Shota;Stockings;Swimsuit;Tan;Tanlines;Trap;X-ray;Yaoi','Amu;Coin RAND;Hanamaki Kaeru;Palco Nagashima;Soranosuzume',4.48),
+(695,'Anal;Anilingus;BBM / Fat Man;Blowjob;Bondage;Dark Skin;Femdom;Group Sex;Gyaru;Harem;Impregnation;Inverted Nipples;Large Breasts;Monster Girl;Orc;Rape;Royalty;X-ray','Odd',4.59),
+(696,'Blowjob;Deepthroat;Defloration;Exhibitionism;French Kissing;Happy Sex;Leg Lock;Nakadashi;School Uniform;Smug;Symbol Shaped Pupils','Blmanian',4.69),
+(697,'Ahegao;Big Ass;Defloration;Happy Sex;Large Breasts;Monster Girl;Nakadashi','Mizone',4.58),
+(698,'Anal;Bukkake;Double Penetration;Gangbang;Hat;Hotpants;Large Breasts;Nakadashi;Paizuri;Prostitution;Short Hair;Threesome','Butcha U',4.66),
+(699,'Anal;Anilingus;Crossdressing;Dark Skin;Incest;Males only;Shota;Tan;Tanlines;Trap;Uncle;Yaoi','Katou Chakichi',4.36),
+(700,'Blowjob;Bondage;Cheerleader;Childhood Friend;Dark Skin;Defloration;Femdom;Handjob;Happy Sex;Large Breasts;Megane;Nakadashi;Reverse Rape;School Uniform;Symbol Shaped Pupils;Tall Girl;Twintails','Miyamoto Issa',4.6),
+(701,'Ahegao;Blowjob;Collar;Decensored;Elder Sister;Exhibitionism;Gokkun;Hairy;Happy Sex;Incest;Large Breasts;Maledom;Masturbation;Nakadashi;Pet Girl;Spanking;Sweating;Watersports','Tonnosuke',4.55),
+(702,'Anal;Chikan;Comedy;Crossdressing;Males only;Shota;Teacher;Trap;Yaoi','Ayato Ayari',4.21),
+(703,'Ahegao;Anal;Big Ass;Blowjob;Double Penetration;Gangbang;Gloves;Group Sex;Huge Breasts;Large Breasts;MILF;Multiple Insertion;Oyakodon;Slut;Spitroast;Stockings;Symbol Shaped Pupils','type.90',3.95),
+(704,'Big Ass;Bikini;Blowjob;Cheating;Decensored;Deepthroat;Defloration;Double Penetration;Exhibitionism;French Kissing;Group Sex;Gyaru;Hairy;Handjob;Harem;Huge Breasts;Huge Penis;Large Breasts;Loli;Megane;Multiple Insertion;Nakadashi;Pettanko;Short Hair;Story Arc;Swimsuit;Tan;Tankoubon;Tanlines;Teacher;Threesome;Virginity (Male)','Shiwasu No Okina',4.59),
+(705,'Anal;Dark Skin;Futanari on Futanari;Group Sex;Gyaru;Hairy Armpits;Large Breasts;Male on Futa;MILF;Prostate Massage;Sex Toys;Shemale;Straight Shota;Urethra Insertion','Inochi Wazuka',3.72),
+(706,'Ahegao;Exhibitionism;Fox Girl;Group Sex;Large Breasts;Miko;Nakadashi','Mizuryu Kei',4.35),
+(707,'Alien;Anal;Anilingus;Blowjob;Bondage;Catgirl;Childhood Friend;Cunnilingus;Dark Skin;Decensored;Defloration;Double Penetration;Exhibitionism;Face Sitting;Femdom;Foot Fetish;French Kissing;Futanari;Group Sex;Happy Sex;Harem;Impregnation;Incest;Large Breasts;Loli;Nakadashi;Rape;Story Arc;Sweating;Tan;Tankoubon;Tanlines;Tentacles;Threesome','Akatsuki Myuuto',4.64),
+(708,'Ahegao;Futanari;Gangbang;Impregnation;Large Breasts;Magical Girl;Male on Futa;Monster;Nakadashi;Netorare;Rape;Sleeping;Stockings;Urethra Insertion;X-ray','Amatake Akewo',3.91),
+(709,'Ahegao;Bikini;Birth;Blowjob;Bondage;Group Sex;Impregnation;Lactation;Large Breasts;Mind Control;Monster;Nakadashi;Pregnant;Stuck in Wall;Swimsuit;Symbol Shaped Pupils;Threesome;X-ray','Amatake Akewo',3.85),
+(710,'Ahegao;Amputee;BBW;Bestiality;Big Areola;Big Ass;Birth;Bisexual;Blowjob;Cow Girl;Dark Skin;Deepthroat;Femdom;Ghost;Giantess;Group Sex;Hairy;Huge Breasts;Lamia;Large Breasts;Long Tongue;MILF;Mind Control;Monster;Monster Girl;Nakadashi;Netorare;Pantyhose;Pregnant;Rape;Straight Shota;Tall Girl;Tan;Tankoubon;Tanlines;Tentacles;Transformation;Urethra Insertion;X-ray;Yuri','Jyoka',4.45),
+(711,'Ahegao;Bikini;Cervical Penetration;Filming;Large Breasts;MILF;Monster;Nakadashi;Prolapse;Rape;Stockings;X-ray','Amatake Akewo',3.9),
+(712,'BBW;Blowjob;Breast Sucking;Defloration;Lactation;Large Breasts;Nakadashi;Robot Girl','Fukumaaya',4.68),
+(713,'Ahegao;Anal;Band-Aid / Pasties;Blowjob;Devil;Dick Growth;Double Penetration;Futanari;Group Sex;Large Breasts;Magical Girl;Male on Futa;Nakadashi;Stockings;Threesome;Vomit;X-ray','Amatake Akewo',4.11),
+(714,'Ahegao;Birth;Condom;Exhibitionism;Huge Penis;Impregnation;Incest;Rape;Reverse Rape;Short Hair;Time Stop','Gesundheit',4.6),
+(715,'Ahegao;Animal Girl;Blowjob;Bunnygirl;Deepthroat;Eyepatch;Happy Sex;Large Breasts;Masturbation;Nakadashi;School Uniform;Stockings;Symbol Shaped Pupils;Uncensored','Thomas',4.7),
+(716,'Ahegao;Anal;Blowjob;Crossdressing;Dark Skin;Deepthroat;DILF;Group Sex;Gyaru;Lingerie;Maledom;Males only;Megane;Mind Break;Mind Control;Nakadashi;Onahole;Royalty;School Swimsuit;School Uniform;Sex Toys;Shota;Stockings;Stomach Bulge;Symbol Shaped Pupils;Teacher;Trap;Yaoi','Katou Chakichi',4.06),
+(717,'Cheating;Incest;Large Breasts;Lingerie;Megane;MILF;Mother;Straight Shota;Virginity (Male);X-ray','Sugi G',4.5),
+(718,'Ahegao;Big Ass;Blowjob;Large Breasts;MILF;Short Hair;Stockings;Straight Shota','Jyura',4.53),
+(719,'Big Ass;Blowjob;Exhibitionism;Femdom;Group Sex;Hairy;Harem;Impregnation;Kimono / Yukata;Large Breasts;Masturbation;MILF;Nakadashi;Paizuri;Straight Shota;Uncensored;X-ray','Minamida Usuke',4.6),
+(720,'Anal;Blowjob;Leotard;Males only;Pantyhose;Shota;Stomach Bulge;Trap;Yaoi','Inochi Wazuka',3.66),
+(721,'Anal;Crossdressing;Incest;Lingerie;Males only;Otouto;Prostitution;Shota;Stockings;Symbol Shaped Pupils;Trap;Twintails;Yaoi','Shinagawa Mikuzu',4.16),
+(722,'Anal;Bikini;Blowjob;Crossdressing;Group Sex;Handjob;Males only;School Uniform;Stockings;Swimsuit;Symbol Shaped Pupils;Trap;Yaoi','Motsu Aki',4.5),
+(723,'Age Progression;Breast Expansion;Dandere;Dark Skin;Devil;Fangs;Happy Sex;Large Breasts;Nakadashi;Short Hair;Succubus;Wings','Kuroiwa Madoka',4.61),
+(724,'Anal;Bathroom Sex;Big Ass;Defloration;French Kissing;Hairy;Happy Sex;Large Breasts;Megane;Virginity (Male)','Doumou',4.66),
+(725,'Ahegao;Anal;Bondage;Bukkake;Collar;Defloration;Filming;Gangbang;Group Sex;Impregnation;Large Breasts;Megane;Mind Break;Nakadashi;Paizuri;Rape;School Uniform;Sex Toys;Slave;Spitroast;Squirting;Stockings;Stuck in Wall;Teacher;Threesome','Fan no Hitori',3.46),
+(726,'Anal;Crossdressing;Dark Skin;Femdom;Futa on Male;Futanari;Large Breasts;Tall Girl;Uncensored','Murasaki☆Nyaa',4.06),
+(727,'Anal;Blowjob;Crossdressing;Diaper;Males only;Shota;Trap;Yaoi','Ayato Ayari',4.08),
+(728,'Age Progression;BBW;Big Areola;Big Ass;Bikini;Blowjob;Dark Skin;Elf;Emotionless Sex;Grandmother;Group Sex;Hairy;Handjob;Harem;Huge Breasts;Impregnation;Incest;Lactation;Large Breasts;Megane;MILF;Mother;Nun;Paizuri;Pregnant;Sleeping;Stockings;Swimsuit;Tan;Tankoubon;Tanlines','Jeanne DA''ck',3.7),
+(729,'Ahegao;Blowjob;Childhood Friend;French Kissing;Gokkun;Happy Sex;Hotpants;Maledom;Nakadashi;Stockings;Sweating;X-ray','Pija',4.53),
+(730,'Ahegao;Band-Aid / Pasties;Bisexual;Cheating;Crossdressing;Frotting;Gokkun;Group Sex;Large Breasts;Leotard;Maid;Masturbation;Megane;Pantyhose;Prostitution;Shota;Stockings;Trap;Yaoi','Mizuryu Kei',4.18),
+(731,'Anal;BBM / Fat Man;Blowjob;Crossdressing;Dark Skin;Gyaru;Males only;Nakadashi;Prostitution;Shota;Symbol Shaped Pupils;Trap;Yaoi','Scotch',4.2),
+(732,'Anal;Anilingus;Big Ass;Blowjob;Crossdressing;Dark Skin;Drugs;Elf;Futa on Male;Futanari;Group Sex;Prostitution;Threesome;Trap','Runrun',4.45),
+(733,'Anal;Blowjob;Bondage;Crossdressing;Drugs;Elf;Males only;Megane;Mind Break;Rape;Trap;Yaoi','Morikoke',4.42),
+(734,'Anal;Males only;Mind Break;Monster;Rape;Shota;Stomach Bulge;Trap;Yaoi','RIR',3.17),
+(735,'Ahegao;Group Sex;Hat;Hypnosis;Megane;Nun;Police Uniform;Rape;Slut;Snuff;Tomboy','Mizuryu Kei',4.03),
+(736,'Anal;BBM / Fat Man;Blowjob;Bondage;Crossdressing;Dark Skin;Double Penetration;Group Sex;Hotpants;Males only;Prostitution;Stockings;Trap;X-ray;Yaoi','Shiroo',4.36),
+(737,'Anal;Crossdressing;Group Sex;Males only;Mind Break;Rape;Stockings;Trap;Yaoi','Tonikaku',4.07),
+(738,'Condom;Hairy Armpits;Happy Sex;Large Breasts;Lingerie;Nakadashi;School Uniform;Stockings;Uncensored','kanbe',4.56),
+(739,'Ahegao;Blowjob;Body Writing;Deepthroat;Exhibitionism;Gangbang;Group Sex;Kimono / Yukata;Large Breasts;Leg Lock;Licking;Masturbation;Short Hair;Slut;Straight Shota','Mizuryu Kei',4.53),
+(740,'Aunt;Blowjob;Cunnilingus;Fingering;Full Color;Huge Penis;Incest;Masturbation;MILF;Nakadashi;Virginity (Male)','Kiyokawa Nijiko',4.27),
+(741,'Ahegao;Anal;BDSM;Big Ass;Blowjob;Bondage;Cunnilingus;Dog Girl;Exhibitionism;Face Sitting;Femdom;Footjob;Handjob;Happy Sex;Large Breasts;Maledom;Nakadashi;Sex Toys;Squirting;Uncensored','Karasu',4.53),
+(742,'Ahegao;Blowjob;Femdom;Happy Sex;Huge Penis;Large Breasts;Nakadashi;Paizuri;Short Hair;Symbol Shaped Pupils;Tomboy;Uncensored','Ao Banana',4.62),
+(743,'Happy Sex;Large Breasts;Nakadashi;Paizuri;Virginity (Male)','Sugaishi',4.68),
+(744,'Ahegao;Femdom;French Kissing;Happy Sex;Hat;Licking;Nakadashi;Shimapan;Symbol Shaped Pupils','kanbe',4.54),
+(745,'Anal;Happy Sex;Huge Penis;Large Breasts;Masturbation;Nakadashi;Paizuri;School Uniform;Sex Toys;Stockings;Symbol Shaped Pupils','Jun',4.64),
+(746,'Blowjob;Corruption;Deepthroat;Gokkun;Group Sex;Large Breasts;Magical Girl;Megane;MILF;Nakadashi;Prostitution;Sex Toys','Jyura',3.97),
+(747,'Blowjob;Femdom;Handjob;Nakadashi;Reverse Rape;School Uniform;X-ray;Yandere','Yumoteliuce',4.63),
+(748,'Birth;Blowjob;Cosplay;Defloration;Gender Bender;Impregnation;Large Breasts;Nakadashi;Pregnant;Rape;Stockings;Stomach Bulge;X-ray','144',3.62),
+(749,'BBM / Fat Man;Blowjob;Gyaru;Large Breasts;Nakadashi;Prostitution;School Uniform;Sex Toys;Squirting;Sumata;Teacher;Uncensored','Yosuke',4.58),
+(750,'Ahegao;Condom;Exhibitionism;Humiliation;Hypnosis;Imouto;Incest;Nakadashi;School Uniform;Stockings;Symbol Shaped Pupils;Tsundere;Twintails','Akitsuki Itsuki',4.64),
+(751,'Ahegao;BBW;Big Ass;Blowjob;Cheating;Comedy;Cosplay;Hairy;Huge Breasts;Large Breasts;Lingerie;MILF;Nakadashi;Paizuri;School Uniform;Swimsuit;Symbol Shaped Pupils;Teacher;Uncensored','bobobo',4.43),
+(752,'Ahegao;Blowjob;Cunnilingus;Elder Sister;Face Sitting;Femdom;Gender Bender;Gyaru;Incest;Large Breasts;Nakadashi;Straight Shota','Maumen',4.39),
+(753,'Ahegao;Alien;Anal;Double Penetration;Group Sex;Nakadashi;Pregnant;Sex Toys;Short Hair;Sweating;X-ray','type.90',3.4),
+(754,'Bathroom Sex;Blackmail;Blowjob;Daughter;DILF;Elder Sister;Full Color;Group Sex;Impregnation;Incest;Inseki;Large Breasts;MILF;Mother;Nakadashi;Oyakodon;Pantyhose;School Uniform;Strap-on;Swinging / Netorase;Tan;Trap;X-ray','Dozamura',4.25),
+(755,'Ahegao;Exhibitionism;Happy Sex;Humiliation;Nakadashi;Pettanko;School Uniform;Tsundere;Twintails;Uncensored','Rico',4.59),
+(756,'Anal;Blowjob;Comedy;Filming;Human Toilet;Impregnation;Inverted Nipples;Large Breasts;Nakadashi;Piercings;Pregnant','Butcha U',4.54),
+(757,'Ahegao;Anal;Mind Break;Nakadashi;Rape;Spanking;Squirting;Stockings;Stuck in Wall;X-ray','Toritora',4.35),
+(758,'Blindfold;Blowjob;Hairy;Incest;MILF;Mother;Nakadashi;Small Penis;Stockings;Virginity (Male)','Hyji',4.19),
+(759,'Ahegao;Anal;Blowjob;Bondage;Defloration;Double Penetration;Gangbang;Gender Bender;Group Sex;Large Breasts;Megane;Nakadashi;Rape;Short Hair','Ozy',3.31),
+(760,'Ahegao;Big Ass;Blowjob;Comedy;Dark Skin;Fangs;Group Sex;Gyaru;Huge Breasts;Imouto;Incest;Large Breasts;Nakadashi;Prostitution;Slut','Satou Kimiatsu;Tamatsuyada',4.55),
+(761,'Ahegao;Anal;BBM / Fat Man;Big Ass;Elder Sister;Emotionless Sex;Group Sex;Human Toilet;Incest;Large Breasts;Megane;Nakadashi;Prostitution;School Uniform;Straight Shota','13.',4.35),
+(762,'Anal;Big Ass;Blowjob;Bondage;Collar;Deepthroat;Elder Sister;Group Sex;Incest;Large Breasts;Lingerie;Maledom;Nakadashi;Pet Girl;School Uniform;Sex Toys;Uncensored','type.90',3.69),
+(763,'Ahegao;Big Ass;Blowjob;Chinese Dress;Large Breasts;Smegma;Straight Shota','Numahana',4.73),
+(764,'Ahegao;Happy Sex;Large Breasts;Nakadashi;Paizuri;Sex Toys;Short Hair;Squirting;Straight Shota;Uncensored;X-ray','Bakuya',4.59),
+(765,'Ahegao;Blowjob;Dark Skin;Gyaru;Happy Sex;Huge Penis;Nakadashi;Paizuri;Uncensored','Ao Banana',4.65),
+(766,'Ahegao;Blowjob;Happy Sex;Large Breasts;Muscle;Nakadashi;Prostitution;Short Hair;Swimsuit;Tan;Tanlines;Uncensored','Ao Banana',4.35),
+(767,'Ahegao;Anal;BBW;Big Ass;Bloomers;Blowjob;Breast Expansion;Catgirl;Cheating;Deepthroat;Defloration;Devil;Dojikko;Double Penetration;Fangs;Femdom;Foot Fetish;Footjob;Futa on Female;Futanari;Gangbang;Gender Bender;Group Sex;Hairjob;Happy Sex;Hat;Huge Penis;Large Breasts;Licking;Loli;Magical Girl;Masturbation;Mind Control;Monster Girl;Multiple Insertion;Nakadashi;Paizuri;Pettanko;Plump;Rape;Reverse Rape;School Uniform;Shimapan;Sixty-Nine;Sleeping;Slime Girl;Slut;Small Penis;Squirting;Story Arc;Straight Shota;Succubus;Tankoubon;Teacher;Threesome;Vampire;Wings;Witch;X-ray','Doumou',4.59),
+(768,'Anilingus;Blowjob;Handjob;Happy Sex;Nakadashi;Naked Apron;Stockings;Teacher;Twintails;Uncensored','Nishi Iori',4.42),
+(769,'Ahegao;Anal;Blowjob;Catgirl;Gangbang;Group Sex;Handjob;Large Breasts;Rape;Stockings','Pija',3.67),
+(770,'Cheating;Condom;Dark Skin;Hat;Impregnation;Large Breasts;MILF;Nakadashi;Paizuri','Shinozuka Yuuji',4.62),
+(771,'Anal;Group Sex;Large Breasts;Lingerie;Magical Girl;Nakadashi;Pantyhose;Pettanko;Prostitution;Stockings;Twintails','CyoCyoPolice',4.04),
+(772,'Anal;Blowjob;Cheating;Cheerleader;Huge Penis;Twintails;Uncensored;Virginity (Male);Western;X-ray','Erotibot',4.51),
+(773,'Breast Sucking;Crossdressing;Dark Skin;Gyaru;Happy Sex;Huge Penis;Large Breasts;Squirting;Tomboy;Trap','Shomu',4.51),
+(774,'Ahegao;Blowjob;Deepthroat;Fangs;Gokkun;Happy Sex;Masturbation;Nakadashi;School Uniform;Uncensored;X-ray','Mafuyu Hemp',4.62),
+(775,'Ahegao;Blowjob;Bodysuit;Catgirl;Exhibitionism;Filming;Group Sex;Large Breasts;Masturbation;Nakadashi;Pantyhose;Slut;Stockings;Swinging / Netorase','Mizuryu Kei',4.32),
+(776,'Blowjob;Cunnilingus;Dark Skin;Face Sitting;Femdom;Hairy;Huge Breasts;Huge Penis;Large Breasts;Mind Break;Squirting;Straight Shota;Virginity (Male);Watersports','Kuroiwa Menou',4.44),
+(777,'Ahegao;Blowjob;Dark Skin;Defloration;Dirty Old Man;Dojikko;Drugs;Fingering;Full Color;Huge Penis;Impregnation;Large Breasts;Nakadashi;Stomach Bulge;Teacher;X-ray','Amatake Akewo',4.26),
+(778,'Ahegao;Band-Aid / Pasties;Big Ass;Large Breasts;Latex;Megane;Slut;Stockings','Mizuryu Kei',4.4),
+(779,'Ahegao;Bikini;Cheating;Daughter;Exhibitionism;Fingering;Footjob;Group Sex;Hairy;Happy Sex;Incest;Large Breasts;Megane;MILF;Mother;Oyakodon;Short Hair;Slut;Swimsuit;Symbol Shaped Pupils;Twintails','Mizuryu Kei',4.49),
+(780,'Ahegao;Blowjob;Comedy;Deepthroat;Defloration;Ear Fuck;Gender Bender;Large Breasts;X-ray','Akatsuki Katsuie',4.25),
+(781,'Ahegao;Anal;BBM / Fat Man;Blowjob;Defloration;Gender Bender;Group Sex;Hairy;Mind Break;Nakadashi;Rape;Short Hair;Tomboy;Uncensored','ShindoL',4.11),
+(782,'Ahegao;Anal;Bathroom Sex;Big Areola;Big Ass;Bikini;Bloomers;Blowjob;Body Writing;Breast Sucking;Chikan;Collar;Cunnilingus;Decensored;Deepthroat;Defloration;Dirty Old Man;Double Penetration;Exhibitionism;Femdom;Fingering;Futa on Female;Futanari;Gangbang;Gender Bender;Group Sex;Hairy;Huge Penis;Human Toilet;Impregnation;Incest;Lactation;Large Breasts;Licking;Lowleg;Megane;Menstruation;MILF;Mind Break;Mouth Gag;Nakadashi;Naked Apron;Netorare;Nose Hook;Nyotaimori;Pregnant;Prostitution;Rape;School Uniform;Slut;Squirting;Story Arc;Swimsuit;Tankoubon;Vomit;Voyeurism;Wakamezake;X-ray;Yuri','ShindoL',4.61),
+(783,'Ahegao;Anal;Big Ass;Blowjob;Decensored;Double Penetration;Gangbang;Group Sex;Kunoichi;Large Breasts;Nakadashi;Paizuri;Spitroast','Motsu',3.21),
+(784,'Ahegao;Anal;Animal Girl;BDSM;Blindfold;Blowjob;Collar;Huge Breasts;Large Breasts;Mouth Gag;Paizuri;Piercings;Royalty;Short Hair;Squirting;Trap;Uncensored;Vomit;Watersports;Yaoi','Meme 50',4.17),
+(785,'Ahegao;Blowjob;Chikan;Exhibitionism;Group Sex;Handjob;Human Toilet;Large Breasts;Lowleg;Slut;Stockings;Threesome','Mizuryu Kei',3.99),
+(786,'Ahegao;Blowjob;Cheating;Childhood Friend;Dark Skin;Large Breasts;Megane;MILF;Nakadashi;Oyakodon','Butcha U',4.63),
+(787,'BBW;Big Areola;Big Ass;Defloration;Femdom;Hairy;Happy Sex;Huge Breasts;Huge Penis;Large Breasts;School Uniform;Swimsuit;Tall Girl','Bonten',4.64),
+(788,'Dark Skin;Exhibitionism;Happy Sex;Large Breasts;Masturbation;Nakadashi;Stockings;Tentacles;Uncensored','Mizusaki.',4.64),
+(789,'Blowjob;Hairy;Happy Sex;Large Breasts;Leg Lock;Nakadashi;Paizuri;Pantyhose;Stockings;X-ray','Meicha',4.55),
+(790,'Ahegao;Blackmail;Blowjob;Cunnilingus;Deepthroat;Defloration;Large Breasts;Lingerie;Nakadashi;School Uniform;Stockings;Symbol Shaped Pupils;Twintails','Saida Kazuaki',4.39),
+(791,'Blowjob;Exhibitionism;Footjob;Large Breasts;Nakadashi;Virginity (Male)','Itou Eight',4.59),
+(792,'Ahegao;BBW;Big Areola;Big Ass;Breast Sucking;Cheating;Dark Skin;Drunk;Elder Sister;Femdom;Incest;Inseki;Lactation;Large Breasts;Paizuri;Reverse Rape;Sleeping;Tall Girl','bobobo',4.38),
+(793,'Ahegao;Aunt;French Kissing;Full Color;Huge Breasts;Incest;Large Breasts;Licking;MILF;Nakadashi;Small Penis;Straight Shota;Sweating;Virginity (Male)','Sanbaizu',4.36),
+(794,'Anal;Big Ass;Bikini;Blowjob;Bunnygirl;Cheating;Cosplay;Deepthroat;Defloration;Double Penetration;Group Sex;Huge Breasts;Idol;Incest;Large Breasts;Megane;Mind Break;Nakadashi;Netorare;Paizuri;Pantyhose;Race Queen;School Uniform;Slave;Stockings;Swimsuit;Tankoubon;Teacher;Torture;X-ray','Isao',4.23),
+(795,'Assjob;Bukkake;Femdom;Footjob;Gangbang;Gloves;Group Sex;Handjob;Human Toilet;Large Breasts;Maid;Naked Apron;Paizuri;Prostate Massage;Stockings;Swimsuit','Ogata Mamimi',4.59),
+(796,'Anal;Bikini;Crossdressing;Dark Skin;Devil;Femdom;Large Breasts;Lingerie;Monster Girl;Nakadashi;Pegging;Stockings;Strap-on;Swimsuit','Navier Haruka 2T',3.8),
+(797,'Ahegao;BBW;Big Areola;Big Ass;Blowjob;Cheerleader;Cosplay;Cunnilingus;Deepthroat;Hairy;Handjob;Huge Breasts;Large Breasts;Paizuri;Prostitution;School Uniform;Straight Shota','Nise Kurosaki',4.56),
+(798,'Anal;Bondage;Crossdressing;Dark Skin;Males only;Rape;Shota;Trap;Yaoi','Aimaitei Umami',3.95),
+(799,'Anal;BDSM;Blowjob;Bondage;Collar;Crossdressing;Filming;Fisting;Latex;Maledom;Males only;Mouth Gag;Sex Toys;Shota;Slave;Stockings;Trap;Yaoi','Aian',4.11),
+(800,'Anal;Anilingus;Assjob;BBM / Fat Man;Blowjob;Crossdressing;DILF;French Kissing;Full Color;Group Sex;Happy Sex;Males only;Megane;Mind Break;Nakadashi;Prostate Massage;Prostitution;School Uniform;Shota;Symbol Shaped Pupils;Trap;X-ray;Yaoi','Hinahara Yashiki',4.39),
+(801,'Ahegao;Anal;Assjob;BDSM;Blackmail;Blowjob;Body Writing;Crossdressing;Deepthroat;Drugs;Exhibitionism;Filming;Footjob;French Kissing;Frotting;Hat;Lingerie;Maid;Maledom;Males only;Masturbation;Mind Break;Mind Control;Nakadashi;Rape;School Uniform;Sex Toys;Shota;Smegma;Smell;Smug;Stockings;Story Arc;Sweating;Swimsuit;Symbol Shaped Pupils;Tan;Tankoubon;Tanlines;Trap;Watersports;Yaoi','Takatsu',4.43),
+(802,'Ahegao;Anal;Blowjob;Bukkake;Crossdressing;Deepthroat;Elf;Frotting;Masturbation;Nakadashi;Paizuri;Rape;Scat;Shota;Trap;Uncensored;Vomit;X-ray;Yaoi','Meme 50',3.73),
+(803,'Anal;Animal Boy;Crossdressing;Happy Sex;Males only;Nakadashi;School Uniform;Sex Toys;Symbol Shaped Pupils;Trap;Yaoi','Menoko',4.45),
+(804,'Anal;Bisexual;Crossdressing;Elder Sister;Fangs;Group Sex;Huge Penis;Incest;Loli;Shota;Stockings;Threesome;Trap;Vampire;Yaoi','Kousuke',4.38),
+(805,'Anal;Aunt;Incest;Large Breasts;MILF;Shemale;Shota;Sweating;Trap;Yaoi','Mogiki Hayami',4.23),
+(806,'Anal;Blowjob;Condom;Crossdressing;Group Sex;Lingerie;Males only;Rape;Shota;Tan;Tanlines;Trap;Yaoi','Nanamatsu Kenji',3.53),
+(807,'Anal;Crossdressing;Drugs;Group Sex;Kimono / Yukata;Males only;Mind Break;Rape;Symbol Shaped Pupils;Trap;Yaoi','Omecho',4.33),
+(808,'Anal;Breast Sucking;Crossdressing;Dark Skin;Gyaru;Happy Sex;Lactation;Males only;School Uniform;Trap;Twintails;Yaoi','Binto',4.34),
+(809,'Anal;Anilingus;Blowjob;Bondage;Crossdressing;Femdom;Masturbation;Nakadashi;Onahole;Pegging;Prostitution;Strap-on;Trap;Yaoi','Inari',3.98),
+(810,'Anal;Cosplay;Crossdressing;Males only;Shota;Stockings;Trap;Yaoi','Tachikawa Negoro',4.31),
+(811,'Anal;Crossdressing;Full Color;Group Sex;Happy Sex;Males only;Shota;Stockings;Trap;Yaoi','Soundvillage',4.14),
+(812,'Anal;Blowjob;Fangs;Small Penis;Trap;Yaoi','Hayuta',4.42),
+(813,'Anal;Crossdressing;French Kissing;Frotting;Happy Sex;Males only;School Uniform;Shota;Sixty-Nine;Stockings;Trap;X-ray;Yaoi','NemuNemu',4.63),
+(814,'Anal;BBM / Fat Man;Cosplay;Crossdressing;Males only;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Tachikawa Negoro',4.39),
+(815,'Anal;BBM / Fat Man;Collar;Crossdressing;Dirty Old Man;Lingerie;Males only;Nakadashi;Prostitution;Stockings;Trap;X-ray;Yaoi','locon',4.41),
+(816,'Ahegao;Anal;BBM / Fat Man;Bikini;Blowjob;Crossdressing;Dirty Old Man;Father;Full Color;Incest;Inseki;Males only;Mind Break;Naked Apron;Pantyhose;Sex Toys;Shota;Swimsuit;Trap;Yaoi','Gujira',4.51),
+(817,'Ahegao;Anal;Blowjob;Body Painting;Bukkake;Crossdressing;Exhibitionism;Full Color;Group Sex;Kimono / Yukata;Males only;Mind Break;Nakadashi;Prostitution;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Gujira',4.61),
+(818,'Anal;Anilingus;Blowjob;Bondage;Crossdressing;Freckles;Group Sex;Maledom;Males only;Masturbation;Sex Toys;Stockings;Trap;Yaoi','Katou Chakichi',4.18),
+(819,'Anal;BBM / Fat Man;Blackmail;Crossdressing;Exhibitionism;Males only;Shota;Trap;Yaoi','Tsukuru',4.19),
+(820,'Anal;Crossdressing;Dark Skin;Full Color;Gloves;Gyaru;Happy Sex;Incest;Latex;Males only;Otouto;Sex Toys;Stockings;Trap;Watersports;Yaoi','Kuroishi Ringo',4.0),
+(821,'Anal;Condom;Crossdressing;Happy Sex;Leg Lock;Males only;Nakadashi;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Chinzuriina',4.62),
+(822,'Anal;Bondage;Crossdressing;Dark Skin;Femdom;Full Color;Pegging;Strap-on;Trap','Runrun',4.28),
+(823,'Anal;Animal Boy;Bondage;Collar;Cosplay;Crossdressing;Group Sex;Leotard;Males only;Mind Break;Multiple Insertion;Pantyhose;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Kozi;Shuffle',4.54),
+(824,'Anal;Bondage;Collar;Crossdressing;Exhibitionism;Lingerie;Males only;Sex Toys;Stockings;Trap;Yaoi','Katou Chakichi',4.14),
+(825,'Ahegao;Anal;BBM / Fat Man;Crossdressing;Dirty Old Man;Impregnation;Males only;Nakadashi;Prostitution;Shota;Stomach Bulge;Trap;Yaoi','Nyorutarou',4.24),
+(826,'Anal;BBM / Fat Man;Crossdressing;DILF;Group Sex;Lingerie;Males only;Piercings;Shota;Trap;Yaoi','Ikezaki Misa',4.18),
+(827,'Anal;Bestiality;Blowjob;Bondage;Bukkake;Crossdressing;Gangbang;Group Sex;Huge Penis;Kunoichi;Mind Break;Mind Control;Rape;Shota;Spitroast;Trap;Yaoi','Martan',4.46),
+(828,'Anal;Chikan;Crossdressing;Males only;Trap;Yaoi','Komezawa',4.27),
+(829,'Anal;Bikini;Blowjob;Bukkake;Crossdressing;Gokkun;Group Sex;Males only;Nakadashi;Shota;Smegma;Swimsuit;Trap;Watersports;Yaoi','Zenra QQ',4.09),
+(830,'Anal;Blowjob;Crossdressing;Group Sex;Males only;Masturbation;Nakadashi;Prostate Massage;Rape;Shota;Stockings;Trap;Yaoi','Mine Mura;Shimaji',4.11),
+(831,'Anal;Crossdressing;Devil;Full Color;Males only;Shota;Stockings;Trap;Yaoi','Satome',3.84),
+(832,'Anal;Foot Fetish;Happy Sex;Males only;Nakadashi;Sex Toys;Shota;Trap;Yaoi','Omecho',4.31),
+(833,'Anal;Blowjob;Crossdressing;Incest;Males only;Otouto;Stockings;Trap;X-ray;Yaoi','Chinzuriina',4.32),
+(834,'Anal;Crossdressing;Group Sex;Incest;Inseki;Males only;Megane;Otouto;Shota;Trap;Yaoi','Takayama Non',4.29),
+(835,'Anal;Assjob;BBM / Fat Man;BDSM;Big Ass;Blackmail;Blindfold;Blowjob;Bondage;Bride;CBT;Chikan;Collar;Corruption;Crossdressing;Dandere;Deepthroat;Defloration;Dirty Old Man;Dojikko;Drugs;Emotionless Sex;Exhibitionism;Filming;Fingering;Full Color;Gender Bender;Huge Penis;Leotard;Maledom;Males only;Masturbation;Mind Break;Prostate Massage;School Swimsuit;School Uniform;Sex Toys;Shota;Stockings;Trap;Watersports;Yaoi','Wataya',3.9),
+(836,'Anal;Males only;Masturbation;Nakadashi;Onahole;Prostate Massage;Sex Toys;Shota;Trap;X-ray;Yaoi','Yuzuha',4.37),
+(837,'Ahegao;Anal;Blowjob;Deepthroat;Males only;Masturbation;Nakadashi;Sex Toys;Shota;Smell;Sweating;Trap;Yaoi','Kozi;Shuffle',4.24),
+(838,'Anal;Blowjob;Crossdressing;Males only;Shota;Stockings;Sweating;Trap;Yandere;Yaoi','Nagi Ichi',4.34),
+(839,'Anal;BBM / Fat Man;Bondage;Crossdressing;Decensored;Males only;Rape;School Uniform;Shota;Trap;Yaoi','Hanamaki Kaeru',3.92),
+(840,'Anal;Crossdressing;Males only;School Uniform;Sex Toys;Shota;Trap;Yaoi','Komezawa',4.69),
+(841,'Anal;Crossdressing;Males only;School Uniform;Shota;Trap;Yaoi','Komezawa',4.52),
+(842,'Anal;Crossdressing;Gender Bender;Group Sex;Males only;Shota;Symbol Shaped Pupils;Trap;Watersports;Yaoi','Nanamatsu Kenji',4.15),
+(843,'Anal;Blowjob;Crossdressing;Frotting;Happy Sex;Males only;Nakadashi;School Uniform;Symbol Shaped Pupils;Trap;X-ray;Yaoi','Nagi Ichi',4.61),
+(844,'Anal;Bondage;Crossdressing;Dirty Old Man;French Kissing;Kimono / Yukata;Males only;Muscle;Prostate Massage;Prostitution;Sex Toys;Shibari;Shota;Stockings;Trap;Yaoi','Aian',4.49),
+(845,'Anal;Bikini;Blowjob;Crossdressing;Males only;Sex Toys;Shota;Smell;Stockings;Swimsuit;Trap;Yaoi','Mario',4.23),
+(846,'Anal;Crossdressing;Exhibitionism;Males only;Trap;Yaoi','Nokoppa',4.4),
+(847,'Anal;Crossdressing;Males only;School Uniform;Shota;Trap;Yaoi','Kanbayashi Takaki',4.68),
+(848,'Anal;Animal Boy;Bestiality;Collar;Crossdressing;Dark Skin;Group Sex;Males only;Pantyhose;Scat;Shota;Small Penis;Trap;Yaoi','Amin;Naokame;ShindoL',3.44),
+(849,'Anal;BBM / Fat Man;Crossdressing;Drugs;Males only;Megane;Rape;Shota;Sleeping;Trap;Twintails;Yaoi','Tsukuru',4.33),
+(850,'Anal;BBM / Fat Man;Crossdressing;Drugs;Males only;Rape;School Uniform;Shota;Trap;Twintails;Yaoi','Tsukuru',4.48),
+(851,'Anal;BBM / Fat Man;Bondage;Crossdressing;Frotting;Kunoichi;Males only;Shota;Stockings;Trap;Yaoi','Ayato Ayari',4.2),
+(852,'Anal;Blowjob;Crossdressing;Incest;Inseki;Maid;Males only;Otouto;School Uniform;Shota;Stockings;Trap;Yaoi','Aoiro Ichigou',4.21),
+(853,'Anal;BBM / Fat Man;Crossdressing;Males only;Mind Break;Piercings;Prostate Massage;Sex Toys;Shota;Trap;Yaoi','Ikezaki Misa',4.55),
+(854,'Anal;BBM / Fat Man;Blowjob;Crossdressing;Dirty Old Man;Fingering;Group Sex;Males only;Sex Toys;Shota;Stockings;Trap;Twintails;Yaoi','Zenra QQ',4.3),
+(855,'Anal;Assjob;Blowjob;Corruption;Crossdressing;Full Color;Happy Sex;Hypnosis;Males only;Mind Break;Mind Control;Monster;Prostate Massage;Shota;Symbol Shaped Pupils;Tentacles;Trap;Yaoi','KONBOI',4.57),
+(856,'Anal;Crossdressing;Happy Sex;Males only;Shota;Trap;Yaoi','Kougami Eri',4.16),
+(857,'Anal;Decensored;Femdom;Futa on Male;Futanari;Huge Penis;Maid;Nakadashi;Rape;Shemale;Shota;Stockings;Trap','Omecho',4.29),
+(858,'Anal;Bondage;Crossdressing;Latex;Males only;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Aichi Shiho',4.52),
+(859,'Anal;Frotting;Happy Sex;Males only;Nakadashi;School Uniform;Symbol Shaped Pupils;Trap;Yaoi','Omecho',4.52),
+(860,'Anal;Crossdressing;Full Color;Maid;Males only;Nakadashi;Shota;Stockings;Trap;X-ray;Yaoi','Shinya',4.38),
+(861,'Anal;Blackmail;Bondage;Crossdressing;Group Sex;Males only;Megane;Shota;Slave;Trap;Yaoi','Aian',4.0),
+(862,'Anal;Anthology;Armpit;BBM / Fat Man;Cheating;Crossdressing;Group Sex;Licking;Males only;Rape;Shota;Symbol Shaped Pupils;Trap;Yaoi','Hanamaki Kaeru;Hayashida Toranosuke;Kirimoto Yuuji;Menoko;Palco Nagashima;Tonikaku',4.24),
+(863,'Anal;Crossdressing;Males only;Megane;Shota;Teacher;Time Stop;Trap;Yaoi','Ichimura',4.27),
+(864,'Anal;Crossdressing;Dark Skin;Gyaru;Happy Sex;Males only;Naked Apron;Shota;Trap;Yaoi','Binto',4.59),
+(865,'Anal;Anilingus;Crossdressing;Femdom;Futa on Male;Futanari;Megane;Prostate Massage;School Uniform;Shemale;Stockings;Threesome;Trap;Yaoi','13.',4.31),
+(866,'Anal;Condom;Cosplay;Crossdressing;Dark Skin;Gloves;Group Sex;Males only;Megane;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Inari',4.67),
+(867,'Ahegao;Anal;Crossdressing;Dick Growth;Full Color;Futa on Male;Futanari;Futanari on Futanari;Group Sex;Idol;Male on Futa;Nakadashi','Takemura Sesshu',4.12),
+(868,'Ahegao;Anal;Bondage;Crossdressing;Drugs;Maledom;Mind Break;Rape;Shota;Stuck in Wall;Tattoo;Trap;Watersports;Yaoi','Nanamatsu Kenji',4.37),
+(869,'Anal;Bikini;Crossdressing;Group Sex;Males only;Shota;Swimsuit;Tan;Tanlines;Trap;Yaoi','Ayato Ayari',4.26),
+(870,'Anal;Bikini;Crossdressing;Males only;Shota;Swimsuit;Trap;Yaoi','Aichi Shiho',4.37),
+(871,'Anal;Blowjob;Bondage;CBT;Chastity Belt;Crossdressing;Group Sex;Maledom;Males only;Shota;Trap;Yaoi','Inochi Wazuka',3.31),
+(872,'Anal;Crossdressing;Males only;Shota;Stockings;Trap;Yaoi','Binbi',4.11),
+(873,'Ahegao;Anal;Blowjob;Crossdressing;Elf;Fundoshi;Males only;Prostitution;Symbol Shaped Pupils;Trap;Virginity (Male);Yaoi','Chiku',4.41),
+(874,'Anal;Crossdressing;Dirty Old Man;Maledom;Males only;Megane;School Uniform;Shota;Trap;Yaoi','Amu;Hanamaki Kaeru;Nokoppa;Omecho;Palco Nagashima;Takase Yuu',4.26),
+(875,'Ahegao;Anal;Blindfold;Bondage;Crossdressing;Group Sex;Maledom;Males only;Mouth Gag;Piercings;Rape;Shota;Stockings;Tattoo;Trap;Yaoi','Zenra QQ',4.34),
+(876,'Ahegao;Anal;Collar;Crossdressing;Lingerie;Males only;School Uniform;Shota;Trap;Yaoi','locon',4.56),
+(877,'Anal;Crossdressing;Futa on Male;Futanari;Huge Breasts;Huge Penis;Large Breasts;Lingerie;Nakadashi;Stockings;Trap;Uncensored;Western','Necrosmos',4.44),
+(878,'Anal;BDSM;Blowjob;Bondage;Crossdressing;Gloves;Lingerie;Lowleg;Nakadashi;Rape;Slave;Stockings;Trap;Uncensored;Western;Yaoi','Necrosmos',4.65),
+(879,'Anal;Crossdressing;Frotting;Males only;Muscle;Shota;Stockings;Trap;Yaoi','NONAME',4.11),
+(880,'Anal;Bikini;Blowjob;Bride;Crossdressing;Devil;Exhibitionism;Full Color;Group Sex;Males only;Multiple Insertion;Nakadashi;Nurse;Paizuri;School Uniform;Shota;Stockings;Succubus;Trap;Watersports;X-ray;Yaoi','Negishiomeron',4.73),
+(881,'Ahegao;Anal;Crossdressing;Dark Skin;Elf;Leotard;Males only;Pantyhose;Shota;Trap;Yaoi','Nagi Ichi',4.53),
+(882,'Anal;Animal Boy;Crossdressing;Happy Sex;Males only;Shota;Trap;Tsundere;Yaoi','Chinzuriina',4.19),
+(883,'Anal;Cousin;Handjob;Incest;Males only;Shota;Trap;Yaoi','Collagen',4.23),
+(884,'Anal;Bathroom Sex;BBM / Fat Man;Blowjob;Crossdressing;Dark Skin;Group Sex;Gyaru;Males only;Nakadashi;School Uniform;Trap;Yaoi','Aian',4.18),
+(885,'Anal;Anilingus;Blowjob;Chinese Dress;Crossdressing;Fingering;Licking;Males only;Mind Break;Nakadashi;Rape;Shota;Small Penis;Trap;Yaoi','Shibusawa Hayato',3.63),
+(886,'Anal;Blowjob;Bukkake;Crossdressing;Dark Skin;Footjob;Gokkun;Group Sex;Males only;Naked Apron;Shota;Stockings;Trap;Yaoi','Shiroo',4.31),
+(887,'Ahegao;Anal;Chastity Belt;Collar;Crossdressing;Dark Skin;Drugs;Group Sex;Males only;Nakadashi;Orgasm Denial;Prostate Massage;Shota;Stockings;Trap;Vomit;Yaoi','Amatake Akewo',3.83),
+(888,'Ahegao;Anal;Crossdressing;Males only;School Uniform;Shota;Trap;Twintails;Yaoi','Kaitou Yuuhi',4.15),
+(889,'Anal;Blowjob;Condom;Crossdressing;Frotting;Happy Sex;Maid;Males only;Nakadashi;Shota;Stockings;Trap;X-ray;Yaoi','NemuNemu',4.07),
+(890,'Ahegao;Anal;Crossdressing;Males only;Prostitution;Shota;Symbol Shaped Pupils;Trap;Yaoi','Mario',4.29),
+(891,'Anal;Crossdressing;Group Sex;Large Breasts;Prostitution;Shemale;Trap;Yaoi','Inochi Wazuka',4.26),
+(892,'Anal;Blowjob;Crossdressing;Males only;Nakadashi;Nurse;Stockings;Trap;Yaoi','Aian',4.55),
+(893,'Anal;Crossdressing;Group Sex;Males only;Shota;Stockings;Trap;Yaoi','Tonikaku',4.51),
+(894,'Anal;Bathroom Sex;Crossdressing;Group Sex;Happy Sex;Incest;Inseki;Leg Lock;Lingerie;Males only;Otouto;Stockings;Trap;Yaoi','Zenra QQ',4.61),
+(895,'Anal;BBM / Fat Man;Blowjob;Crossdressing;Devil;Full Color;Males only;Nakadashi;Succubus;Trap;Wings;Yaoi','Magenta Rose',4.22),
+(896,'Anal;Blowjob;Males only;Prostitution;School Uniform;Trap;Yaoi','Ayato Ayari',4.46),
+(897,'Ahegao;Anal;BBM / Fat Man;Blackmail;Blowjob;Chastity Belt;Crossdressing;Dirty Old Man;Gyaru;Maid;Netorare;Orgasm Denial;Prostate Massage;Shota;Trap;X-ray;Yaoi','Gomabura',4.11),
+(898,'Anal;Blowjob;Crossdressing;Dark Skin;Deepthroat;Devil;Males only;Mind Break;Rape;Shota;Trap;Yaoi','Nanamatsu Kenji',4.3),
+(899,'Anal;Crossdressing;Males only;Mind Break;Rape;Shota;Trap;Yaoi','Lew',4.48),
+(900,'Anal;Crossdressing;Drugs;Leotard;Males only;Mind Break;Shota;Stockings;Trap;Urethra Insertion;X-ray;Yaoi','Martan',4.34),
+(901,'Anal;Crossdressing;Males only;Rape;Shota;Trap;Yandere;Yaoi','Kanbayashi Takaki',4.44),
+(902,'Ahegao;Anal;Blindfold;Bondage;Crossdressing;Enema;Males only;Mouth Gag;Rape;Shota;Stockings;Trap;Twintails;Yaoi','Zenra QQ',4.0),
+(903,'Ahegao;Anal;BBM / Fat Man;Bikini;Blackmail;Bloomers;Blowjob;Corruption;Crossdressing;Dirty Old Man;Drugs;Full Color;Leg Lock;Mind Break;Onahole;Prostitution;Rape;School Swimsuit;School Uniform;Sex Toys;Stockings;Swimsuit;Teacher;Trap;Yaoi','Nagi Ichi',4.68),
+(904,'Anal;Big Ass;Crossdressing;Dirty Old Man;Males only;Mind Break;Rape;Shota;Trap;Yaoi','Akiha@',4.19),
+(905,'Anal;Handjob;Males only;Masturbation;Shota;Trap;Yaoi','Mogiki Hayami',4.35),
+(906,'Anal;Blowjob;Dark Skin;Fangs;Fundoshi;Males only;Shota;Tan;Tanlines;Trap;Yaoi','Nagi Ichi',4.06),
+(907,'Anal;Blowjob;Crossdressing;Males only;Shota;Stockings;Trap;Yaoi','Nanamatsu Kenji',4.5),
+(908,'Anal;Blowjob;Crossdressing;Full Color;Males only;Masturbation;Shota;Stockings;Trap;Yaoi','Soundvillage',4.17),
+(909,'Ahegao;Anal;Crossdressing;Crotchless / Breastless;French Kissing;Frotting;Handjob;Happy Sex;Leg Lock;Lingerie;Males only;Nakadashi;Shota;Trap;X-ray;Yaoi','Nagi Ichi',4.44),
+(910,'Anal;Crossdressing;Dark Skin;Elf;Group Sex;Hotpants;Males only;Mind Break;Nakadashi;Rape;Shota;Slave;Stomach Bulge;Trap;Yaoi','Martan',3.91),
+(911,'Anal;Anilingus;Anthology;Bikini;Blowjob;Crossdressing;Gokkun;Happy Sex;Kimono / Yukata;Males only;Rape;School Uniform;Short Hair;Shota;Stockings;Swimsuit;Symbol Shaped Pupils;Trap;Twintails;Yaoi','Hanamaki Kaeru;Kirimoto Yuuji;Makuro;Namiko;Palco Nagashima;Takase Yuu;Tomatojigoku;Tonikaku',4.4),
+(912,'Ahegao;Anal;Collar;Crossdressing;Drugs;Group Sex;Males only;Rape;Shota;Stockings;Trap;Yaoi','Minokichi',4.23),
+(913,'Ahegao;Anal;Chikan;Dirty Old Man;Exhibitionism;Fingering;Gangbang;Group Sex;Rape;School Uniform;Shota;Small Penis;Stuck in Wall;Yaoi','Tsukuru',4.17),
+(914,'Anal;Blowjob;Frotting;Large Breasts;Male on Futa;Phimosis;Shemale;Symbol Shaped Pupils','Tokimachi Eisei',4.66),
+(915,'Anal;Anilingus;Big Ass;Blowjob;Breast Sucking;Handjob;Large Breasts;Male on Futa;Shemale;Straight Shota','Mogiki Hayami',4.55),
+(916,'Anal;Bloomers;Blowjob;Bukkake;Catgirl;Crossdressing;Double Penetration;Father;Frotting;Full Color;Group Sex;Incest;Males only;Megane;Multiple Insertion;Nakadashi;Piercings;Shota;Spats;Stockings;Symbol Shaped Pupils;Trap;Twins;Twintails;Yaoi','Zenra QQ',4.39),
+(917,'Anal;Crossdressing;Full Color;Group Sex;Handjob;Lingerie;Males only;Shota;Stockings;Trap;Watersports;Yaoi','NemuNemu',4.54),
+(918,'Anal;Blowjob;Crossdressing;French Kissing;Gloves;Happy Sex;Lingerie;Males only;Shota;Stockings;Trap;Yaoi','locon',4.64),
+(919,'Ahegao;Anal;BBW;Blowjob;Dark Skin;Deepthroat;Double Penetration;Exhibitionism;Fingering;Futanari;Gangbang;Group Sex;Huge Breasts;Huge Penis;Impregnation;Large Breasts;Male on Futa;Military Uniform;Muscle;Nakadashi;Paizuri;Spitroast;Stomach Bulge','Chinbotsu',4.3),
+(920,'Anal;Anilingus;Big Ass;Blowjob;Femdom;Futanari;Futanari on Futanari;Large Breasts;Shemale','Chinbotsu',4.36),
+(921,'Ahegao;Anal;Big Areola;Blindfold;Blowjob;Bondage;Dark Skin;Exhibitionism;Futanari;Hairy Armpits;Huge Penis;Large Breasts;Licking;Mouth Gag;Nose Hook;Scat;Sex Toys;Shemale;Smegma;Smell;Straight Shota;Trap','Kakugari Kyoudai',4.09),
+(922,'Ahegao;Anal;Big Ass;Blowjob;Double Penetration;Femdom;Fingering;Futa on Male;Futanari;Futanari on Futanari;Group Sex;Handjob;Huge Breasts;Huge Penis;Impregnation;Large Breasts;Masturbation;Mind Break;Nakadashi;Pegging;Shota;Spanking;Spitroast;Straight Shota;X-ray','Musashino Sekai',4.44),
+(923,'Ahegao;Anal;BBW;Big Ass;Blowjob;Double Penetration;Femdom;Futa on Male;Futanari;Futanari on Futanari;Group Sex;Huge Breasts;Incest;Inverted Nipples;Lactation;Large Breasts;Male on Futa;MILF;Mother;Reverse Rape;Shota;Threesome;Virginity (Male)','Herohero Tom',4.0),
+(924,'Ahegao;Anal;Anilingus;BBW;Big Ass;Blackmail;Blowjob;Breast Sucking;Bukkake;Deepthroat;Femdom;Futa on Male;Futanari;Futanari on Futanari;Gangbang;Group Sex;Happy Sex;Huge Breasts;Huge Penis;Lactation;Large Breasts;Masturbation;Megane;Mind Break;Pegging;Rape;Reverse Rape;School Uniform;Shota;Spitroast;Stockings;Straight Shota;Teacher;Trap;Watersports;X-ray','Herohero Tom;Isaki',4.35),
+(925,'Ahegao;Bondage;Femdom;Futanari;Futanari on Futanari;Group Sex;Huge Penis;Long Tongue;Onahole;School Uniform;Sex Toys;Stuck in Wall;Symbol Shaped Pupils;Urethra Insertion','Matou',3.59),
+(926,'Anal;Blowjob;Deepthroat;Futa on Male;Futanari;Gangbang;Group Sex;Handjob;Huge Breasts;Huge Penis;Large Breasts;Mind Break;Pegging;Rape;Reverse Rape;Shota','Musashino Sekai',4.9),
+(927,'Ahegao;Anal;Blowjob;Breast Sucking;Collar;Fisting;Futa on Male;Futanari;Group Sex;Handjob;Hotpants;Large Breasts;Licking;Pegging;Rape;Reverse Rape;Shota;Spats;Spitroast;Straight Shota','Kira Hiroyoshi',4.48),
+(928,'Ahegao;Anal;Anilingus;Blowjob;Collar;Cosplay;Crossdressing;Dark Skin;Double Penetration;Futa on Male;Futanari;Group Sex;Huge Penis;Large Breasts;Latex;Male on Futa;Megane;Multiple Insertion;Pegging;Sex Toys;Smegma;Stockings;Threesome;Trap','ICE',4.03),
+(929,'Ahegao;Anal;Blowjob;Double Penetration;Futanari;Gangbang;Group Sex;Lactation;Large Breasts;Male on Futa;Pregnant','Chinbotsu',3.81),
+(930,'Ahegao;Futanari;Handjob;Impregnation;Lactation;Male on Futa;Mind Break;Nakadashi;Onahole;Stockings;X-ray','Obyaa',3.99),
+(931,'Ahegao;Anal;Blowjob;Crossdressing;Dark Skin;Diaper;Dog Girl;Femdom;Futa on Male;Futanari;Nakadashi;Pegging;Sex Toys;Stockings;Straight Shota;Trap','Goya',4.16),
+(932,'Anal;Autofellatio;Fingering;Futanari;Handjob;Male on Futa;Masturbation;Short Hair','Magifuro Konnyaku',4.39),
+(933,'Ahegao;Anal;Big Ass;Bikini;Bukkake;Crossdressing;Dark Skin;Double Penetration;Fingering;Futa on Male;Futanari;Gangbang;Group Sex;Handjob;Huge Breasts;Huge Penis;Kunoichi;Lactation;Large Breasts;Male on Futa;Megane;Mouth Gag;Muscle;Nakadashi;Paizuri;Pantyhose;School Uniform;Shemale;Shota;Slave;Stockings;Swimsuit;Threesome','Musashino Sekai',3.86),
+(934,'Anal;Crossdressing;Femdom;Futa on Male;Futanari;Group Sex;Huge Penis;Idol;Shota;Stockings;Trap','Alpha Alf Layla;Ogata Mamimi',4.64),
+(935,'Anal;Crossdressing;Femdom;Futa on Male;Futanari;Huge Breasts;Huge Penis;Large Breasts;Nakadashi;Small Penis;Solo Action;Stockings;Sweating;Symbol Shaped Pupils;Tall Girl;Trap','Kasuga Mayu',4.37),
+(936,'Anal;Blowjob;Futa on Male;Futanari;Large Breasts;Male on Futa;Megane;Stockings','Musashino Sekai',4.4),
+(937,'Anal;Anilingus;Blowjob;Futa on Male;Group Sex;Large Breasts;Male on Futa;Nipple Penetration;Shemale;Shota;Threesome;Trap;Virginity (Male)','Inochi Wazuka',3.97),
+(938,'Ahegao;Anal;BBW;Futanari;Futanari on Futanari;Gaping;Group Sex;Huge Breasts;Huge Penis;Incest;Large Breasts;Mind Break;Nakadashi;Spreading;Stomach Bulge;Threesome;Urethra Insertion','Teterun',4.26),
+(939,'Autofellatio;Condom;Futanari;Gokkun;Masturbation;Sex Toys;Short Hair;Urethra Insertion','trump',4.24),
+(940,'Futa on Male;Futanari;Futanari on Futanari;Gokkun;Incest;Sex Toys;Short Hair','trump',3.85),
+(941,'Futa on Male;Futanari;Futanari on Futanari;Huge Penis;Imouto;Incest;Male on Futa;Short Hair;Urethra Insertion;X-ray','trump',4.24),
+(942,'Exhibitionism;Futanari;Futanari on Futanari;Huge Penis;Incest;Male on Futa;Nakadashi;Short Hair','trump',4.27),
+(943,'Blowjob;Crossdressing;Femdom;Futa on Male;Futanari;Happy Sex;Large Breasts;Male on Futa;Nakadashi;School Uniform;Trap;Uncensored;Western','Necrosmos',4.5),
+(944,'Anal;Crossdressing;Femdom;Futa on Male;Futanari;Happy Sex;Male on Futa;Prostate Massage;Sex Toys;Shota;Stockings;Trap','Nmasse',4.27),
+(945,'Ahegao;Anal;Blowjob;Collar;Femdom;Futa on Male;Futanari;Mind Break;Multiple Insertion;Reverse Rape;Sex Toys;Shota;Spitroast;Trap','Kaitou Yuuhi',4.07),
+(946,'Anal;Anilingus;Dick Growth;Femdom;Footjob;Futa on Male;Futanari;Group Sex;Huge Penis;Large Breasts;Maid;Male on Futa;School Uniform;Stockings;Stomach Bulge;Straight Shota;Threesome;Twintails;Yuri','Mikemono Yuu',4.27),
+(947,'Ahegao;Anal;Defloration;Eyepatch;Femdom;Futa on Male;Futanari;Group Sex;Huge Penis;Large Breasts;Male on Futa;Rape;Reverse Rape;Stockings;Straight Shota;Threesome;Yandere','Henkuma',3.77),
+(948,'Ahegao;Anal;Big Ass;Decensored;Exhibitionism;Futanari;Huge Penis;Large Breasts;Male on Futa;Orgasm Denial;Phimosis;Stockings;Urethra Insertion','RED-RUM',4.43),
+(949,'Anal;Crossdressing;Fangs;Femdom;Futa on Male;Futanari;Shota;Stockings;Trap','Magifuro Konnyaku',4.32),
+(950,'Anal;Animal Boy;Blowjob;Bodysuit;Dick Growth;Frotting;Futa on Male;Futanari;Large Breasts;Nakadashi;Shota;Twintails','Kito',3.84),
+(951,'Ahegao;Animal Girl;Blowjob;Breast Sucking;Cunnilingus;Fingering;Fox Girl;Futanari;Hairy;Handjob;Happy Sex;Kimono / Yukata;Male on Futa;Masturbation;Pettanko;X-ray','Amatake Akewo',4.45),
+(952,'Anal;Crossdressing;Futa on Male;Futanari;Group Sex;Hairy;Large Breasts;Muscle;Short Hair;Smell;Spats;Stomach Bulge;Sweating;Threesome;Tomboy;Trap','Inochi Wazuka',4.48),
+(953,'Anilingus;BBM / Fat Man;Dark Skin;French Kissing;Futa on Female;Futanari;Gyaru;Handjob;Large Breasts;Megane;Nakadashi;Onahole;School Uniform;Stockings;Sweating','Haikawa Hemlen',4.32),
+(954,'Anal;Devil;Fangs;Femdom;Futa on Male;Futanari;Shota;Succubus;Tailjob;Tentacles;Wings','Mumumu',3.86),
+(955,'Anal;BDSM;Blackmail;Crossdressing;Futa on Male;Futanari;Large Breasts;Lingerie;Stockings;Trap','Nyuuhin',3.86),
+(956,'Anal;Elder Sister;Futanari;Happy Sex;Incest;Large Breasts;Male on Futa;MILF;Shemale;Shota','Mogiki Hayami',4.26),
+(957,'Daughter;Futanari;Group Sex;Hairy;Hairy Armpits;Imouto;Incest;Lactation;Male on Futa;Mother;Nakadashi;Smegma;Threesome;Urethra Insertion;Widow','Inochi Wazuka',3.59),
+(958,'Ahegao;Anal;Crossdressing;Fangs;Futa on Male;Futanari;Happy Sex;Huge Penis;Symbol Shaped Pupils;Trap','Magifuro Konnyaku',4.48),
+(959,'Anal;Blowjob;Bondage;Bukkake;Crossdressing;Femdom;Futa on Male;Futanari;Masturbation;Mind Break;Nakadashi;Pantyhose;Rape;School Uniform;Shota;Stockings;Trap;Yandere','Lucie',4.26),
+(960,'Anal;Blowjob;Double Penetration;Femdom;Futa on Male;Futanari;Group Sex;Handjob;Mind Break;Nakadashi;Rape;School Uniform;Threesome','Kanbayashi Takaki',3.58),
+(961,'Blowjob;Futanari;Group Sex;Handjob;Happy Sex;Huge Penis;Megane;Phimosis;Reverse Harem;Short Hair;Squirting;Teacher;Watersports;X-ray','Messy',4.03),
+(962,'Anal;Anilingus;Bondage;Collar;Crossdressing;Males only;Mind Break;Mind Control;Netorare;Shota;Stockings;Tattoo;Trap;Yaoi','Katou Jun',3.92),
+(963,'Blowjob;Femdom;Handjob;Happy Sex;Lamia;Monster Girl;Nakadashi;Urethra Insertion','Kuraki Hiro',4.52),
+(964,'Arachne;BBM / Fat Man;Blowjob;Bondage;Femdom;Large Breasts;Monster Girl;Orgasm Denial;Paizuri;Prostitution','aho / AHOBAKA',4.42),
+(965,'Ahegao;Alien;Anal;Bathroom Sex;BDSM;Big Ass;Birth;Blowjob;Bondage;Chikan;Deepthroat;Double Penetration;Drugs;Gangbang;Gokkun;Group Sex;Huge Breasts;Huge Penis;Human Toilet;Impregnation;Lactation;Large Breasts;Licking;Maledom;Military Uniform;Mind Break;Monster;Multiple Penises;Nakadashi;Pantyhose;Pet Girl;Police Uniform;Pregnant;Prostitution;Rape;Slave;Spanking;Stockings;Stomach Bulge;Stuck in Wall;Torture;Tsundere;X-ray','Somejima',4.2),
+(966,'Ahegao;Blowjob;Fangs;Handjob;Happy Sex;Impregnation;Kimono / Yukata;Large Breasts;Monster Girl;Nakadashi;Uncensored;X-ray','Nippa Takahide',4.46),
+(967,'Furry;Happy Sex;Large Breasts;Masturbation;Nakadashi;Paizuri;Straight Shota;X-ray','nenemaru',4.47),
+(968,'Ahegao;Big Ass;Bikini;Blowjob;Dark Skin;Devil;Femdom;Fox Girl;French Kissing;Huge Penis;Large Breasts;Mind Break;Monster Girl;Nakadashi;Stockings;Succubus;Symbol Shaped Pupils;Virginity (Male);Wings;X-ray;Yandere','Meicha',4.65),
+(969,'Centaur;Dark Skin;Defloration;Emotionless Sex;Happy Sex;Monster Girl;Oni','Mizone',4.61),
+(970,'Ahegao;Cunnilingus;Fangs;Hairy;Happy Sex;Huge Breasts;Impregnation;Large Breasts;Miko;Monster Girl;Nakadashi;Oni;Stockings;Virginity (Male);X-ray','obmas',4.65),
+(971,'Ahegao;Anilingus;Big Ass;Collar;Dark Skin;Elf;French Kissing;Gyaru;Large Breasts;Lingerie;Paizuri;Stockings','Fuetakishi',4.28),
+(972,'Ahegao;Anal;Blowjob;Bukkake;Cervical Penetration;Deepthroat;Defloration;Double Penetration;Group Sex;Huge Penis;Impregnation;Megane;Monster;Nakadashi;Orc;Rape;Stockings;Stomach Bulge;Threesome;X-ray','TRY',4.08),
+(973,'Blowjob;Maid;Monster Girl;Nakadashi;NEET / Hikkikomori;Short Hair;Stockings;Vampire;X-ray','Rokusyou Kokuu',4.46),
+(974,'Ahegao;Anal;Breast Expansion;Double Penetration;Loli;Stockings;Stuck in Wall;Symbol Shaped Pupils','Waero',4.43),
+(975,'Ahegao;Bondage;Breast Expansion;Huge Breasts;Lactation;Large Breasts;Living Clothes;Monster;Mouth Gag;Nakadashi;Rape;Tentacles;Vore','Ikameshi',4.04),
+(976,'Anal;Bondage;Mind Break;Monster;Short Hair;Tentacles;Vore','ishimura | ishimiso',4.35),
+(977,'Ahegao;Collar;French Kissing;Lactation;Large Breasts;Mind Break;Monster;Nakadashi;Orc;Slave;Twintails','Yuugiri',4.14),
+(978,'Ahegao;Comedy;Devil;Dick Growth;Fangs;French Kissing;Huge Penis;Loli;Mind Break;Mind Control;Monster Girl;Nakadashi;Rape;Stockings;Stomach Bulge;Succubus;Virginity (Male);X-ray','Motsu Aki',4.38),
+(979,'Ahegao;Anal;Bestiality;Double Penetration;Hairy Armpits;Inverted Nipples;Mind Break;Mind Control;Monster;Nakadashi;Nipple Penetration;Pig;Prolapse;Spats;Stockings;Symbol Shaped Pupils;Vomit','KANZUME',4.02),
+(980,'Ahegao;Big Areola;Birth;Gangbang;Ghost;Group Sex;Hairy;Handjob;Impregnation;Large Breasts;Mind Break;Nakadashi;Paizuri;Pregnant;Spitroast;Stomach Bulge;X-ray','Amatake Akewo',4.29),
+(981,'Anal;Angel;Anthology;Body Writing;Corruption;Dark Skin;Devil;Double Penetration;Eyepatch;Fangs;Femdom;Fingering;Footjob;Futanari;Gloves;Group Sex;Human Toilet;Large Breasts;Licking;Male on Futa;Mind Break;Nakadashi;Rape;Squirting;Stockings;Succubus;Tattoo;Twintails;X-ray','Koppamu;Shion;Suterii;Tokoyo Akashi',3.9),
+(982,'Ahegao;Anal;Blowjob;Bukkake;Deepthroat;Demon Girl | Succubus;Double Penetration;Face Sitting;Gangbang;Group Sex;Large Breasts;Mind Break;Paizuri;Pettanko;Prostitution;Rape;Stockings','Umetarou',3.8),
+(983,'Alien;Anal;Blowjob;Bukkake;Comedy;Double Penetration;Gangbang;Gokkun;Group Sex;Gyaru;Lactation;Megane;Monster Girl;Nakadashi;Prostitution;School Uniform;Stomach Bulge','INAZUMA.',4.55),
+(984,'Blowjob;Group Sex;Large Breasts;Magical Girl;Nakadashi;Straight Shota;Virginity (Male);X-ray','Asahina Hikage',4.5),
+(985,'Anilingus;Cosplay;Femdom;Happy Sex;Inverted Nipples;Large Breasts;Nakadashi;Paizuri;Plump;Shota;Straight Shota;Sumata','Miyamoto Issa',4.52),
+(986,'Anal;Aunt;Big Ass;Cheating;Full Color;Incest;Large Breasts;MILF;Straight Shota','Mumumu',4.31),
+(987,'BBW;CBT;Exhibitionism;Femdom;Fingering;Group Sex;Hairy;Leg Lock;MILF;Muscle;Pettanko;Ryona;Spats;Straight Shota','clover',3.7),
+(988,'Big Ass;Crossdressing;Crotchless / Breastless;Face Sitting;Femdom;Group Sex;Incest;Large Breasts;Layer Cake;Lingerie;Paizuri;School Uniform;Stockings;Straight Shota;Symbol Shaped Pupils;Threesome;Twins','Mario',4.36),
+(989,'Blowjob;Deepthroat;Femdom;Happy Sex;Large Breasts;Nakadashi;Straight Shota','Mario',4.58),
+(990,'Dark Skin;Elf;Full Color;Group Sex;Large Breasts;Straight Shota;Threesome','Homare',4.47),
+(991,'Anilingus;Aunt;Blowjob;Cheating;Drunk;Group Sex;Huge Breasts;Incest;Inverted Nipples;Large Breasts;MILF;Mother;Nakadashi;Office Lady;Paizuri;Stockings;Straight Shota;Threesome;Twins;Watersports','Agata',4.55),
+(992,'Big Ass;Blowjob;Cunnilingus;Femdom;Huge Breasts;Large Breasts;Masturbation;Megane;Nurse;Pantyhose;Reverse Rape;Smell;Stockings;Straight Shota;Uncensored','Suruga Kuroitsu',4.48),
+(993,'Big Areola;Blowjob;Dark Skin;Femdom;Group Sex;Gyaru;Huge Breasts;Inverted Nipples;Large Breasts;Nakadashi;Short Hair;Straight Shota;Threesome;X-ray','Bu-chan',4.3),
+(994,'Ahegao;Big Ass;Bondage;Comedy;Femdom;Handjob;Large Breasts;Masturbation;Nakadashi;Onahole;Sex Toys;Straight Shota;Uncensored;X-ray','Kito Sakeru',4.64),
+(995,'Dark Skin;Femdom;Group Sex;Gyaru;Large Breasts;Stockings;Straight Shota;Threesome;Virginity (Male)','Chiba Toshirou',4.42),
+(996,'Anal;Bikini;Cheating;Cunnilingus;Exhibitionism;Hairy;Large Breasts;Masturbation;MILF;Nakadashi;Netori;Paizuri;Short Hair;Sixty-Nine;Straight Shota;Swimsuit;Tan;Tanlines','Takatsu',3.99),
+(997,'Ahegao;Anal;Anilingus;Animal Girl;Aunt;BBW;Big Ass;Cervical Penetration;Dark Skin;Double Penetration;Elder Sister;Femdom;Fisting;Freckles;Group Sex;Gyaru;Hairy;Happy Sex;Huge Breasts;Huge Penis;Impregnation;Incest;Inverted Nipples;Kimono / Yukata;Lactation;Large Breasts;Megane;MILF;Mother;Multiple Insertion;Nakadashi;Naked Apron;Nipple Penetration;Nurse;Oyakodon;School Uniform;Stockings;Story Arc;Straight Shota;Tall Girl;Tankoubon;Tentacles;Threesome;Virginity (Male);X-ray','Yuuki Ray',4.64),
+(998,'Big Ass;Dark Skin;Femdom;Full Color;Gyaru;Large Breasts;Megane;Nakadashi;Sex Toys;Straight Shota;Virginity (Male);X-ray','Kakuzatou',4.61),
+(999,'Big Ass;Defloration;Huge Breasts;Large Breasts;Leg Lock;Leotard;MILF;Nakadashi;Stockings;Straight Shota;Sweating','Fei',4.09),
+(1000,'Anal;Blowjob;Bukkake;Gangbang;Gokkun;Group Sex;Large Breasts;Licking;Megane;Pantyhose;Smug;Squirting;Straight Shota;Teacher;Virginity (Male);Watersports','Agata',4.45),
+(1001,'Anal;BDSM;Blindfold;Blowjob;Bondage;Crossdressing;Exhibitionism;Femdom;Large Breasts;Nun;Onahole;Paizuri;Pegging;Prostate Massage;Short Hair;Small Penis;Straight Shota;Strap-on;Trap;Uncensored','HANABi',3.97),
+(1002,'Childhood Friend;Cunnilingus;Happy Sex;Nakadashi;Uncensored','Hinahara Emi',4.67),
+(1003,'Blowjob;Childhood Friend;Dark Skin;Defloration;Gyaru;Happy Sex;Large Breasts;Nakadashi;Paizuri;Uncensored;Virginity (Male)','Suemitsu Dicca',4.68),
+(1004,'Bathroom Sex;Childhood Friend;Handjob;School Uniform;Short Hair;Uncensored','mogg',4.55),
+(1005,'Ahegao;Exhibitionism;Femdom;Handjob;Happy Sex;Large Breasts;Masturbation;Nakadashi;School Uniform;Straight Shota;Uncensored;X-ray','Ohkami Ryosuke',4.55),
+(1006,'Ahegao;Childhood Friend;Dark Skin;Happy Sex;Nakadashi;Straight Shota;Tomboy;Uncensored','Takahashi Note',4.59),
+(1007,'Childhood Friend;Femdom;Filming;Handjob;Happy Sex;Large Breasts;Lingerie;Masturbation;Nakadashi;Sex Toys;Uncensored','Matsukawa',4.65),
+(1008,'Ahegao;Anal;Bondage;Femdom;Group Sex;Pegging;Prison;Prostate Massage;Reverse Rape','Dibi',4.16),
+(1009,'Anal;Crotchless / Breastless;Femdom;Happy Sex;Large Breasts;Leotard;Pegging;Prostate Massage;Sex Toys;Stockings;Strap-on','Suisen Toilet',3.76),
+(1010,'Anal;BDSM;Blindfold;Bondage;CBT;Comedy;Crossdressing;Femdom;Footjob;Hotpants;Humiliation;Large Breasts;Pegging;Sex Toys;Stockings;Stomach Bulge;Straight Shota;Strap-on;Trap;Twintails;Uncensored','Motsu Aki',3.01),
+(1011,'Blowjob;Christmas;Crossdressing;Devil;Femdom;Large Breasts;Lingerie;Monster Girl;Stockings;Swimsuit;Tentacles;Trap;X-ray','DAWY',4.07),
+(1012,'Anal;Big Ass;Cheerleader;Crossdressing;Males only;Shota;Trap;Twintails;Yaoi','Inochi Wazuka',4.13),
+(1013,'Anal;Christmas;Crossdressing;Males only;Nakadashi;Shota;Stockings;Trap;Twintails;Yaoi','Palco Nagashima',4.48),
+(1014,'Anal;Crossdressing;Males only;Prostitution;School Uniform;Shota;Trap;Yaoi','Dynamite Moca',4.22),
+(1015,'Anal;Animal Boy;Blowjob;Collar;Crossdressing;Hypnosis;Maid;Mind Control;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Shikitani Asuka',4.09),
+(1016,'Ahegao;Anal;BBM / Fat Man;Bikini;Crossdressing;Males only;Megane;Prostitution;School Uniform;Shota;Swimsuit;Trap;Yaoi','Collagen',4.2),
+(1017,'Aunt;Blowjob;Cousin;Defloration;Group Sex;Hairy;Incest;Large Breasts;Layer Cake;MILF;Oyakodon;School Uniform;Threesome','Mitarashi Kousei',4.77),
+(1018,'Aunt;Incest;Large Breasts;Lingerie;MILF','Mitarashi Kousei',4.59),
+(1019,'Aunt;Hairy;Incest;Large Breasts;Masturbation;MILF','Mitarashi Kousei',4.58),
+(1020,'Blowjob;Breast Sucking;Cunnilingus;Happy Sex;Incest;Large Breasts;MILF;Sixty-Nine','Mitarashi Kousei',4.7),
+(1021,'Ahegao;Blowjob;Cunnilingus;Hairy;Happy Sex;Incest;Large Breasts;Licking;MILF;Sixty-Nine','Mitarashi Kousei',4.66),
+(1022,'Big Ass;Bloomers;Blowjob;Breast Sucking;Chinese Dress;Cosplay;Cunnilingus;Face Sitting;Group Sex;Hairy;Handjob;Happy Sex;Incest;Large Breasts;Maid;MILF;Paizuri;School Uniform;Threesome','Mitarashi Kousei',4.66),
+(1023,'Blowjob;Breast Sucking;Cunnilingus;Hairy;Happy Sex;Impregnation;Incest;Large Breasts;Licking;MILF;Nakadashi;Transparent Clothing','Mitarashi Kousei',4.72),
+(1024,'Aunt;Decensored;Footjob;Incest;Large Breasts;MILF;Pantyhose','Mitarashi Kousei',4.78),
+(1025,'Big Ass;Blowjob;Breast Sucking;Exhibitionism;Hairy;Handjob;Happy Sex;Incest;Large Breasts;Licking;Lingerie;MILF;Paizuri;Sex Toys;Stockings;Transparent Clothing;Voyeurism','Mitarashi Kousei',4.77),
+(1026,'Big Ass;Blowjob;Fingering;Footjob;Hairy;Happy Sex;Incest;Large Breasts;Lingerie;Masturbation;MILF;Sleeping','Mitarashi Kousei',4.59),
+(1027,'Armpit;Big Ass;Blowjob;Breast Sucking;Cunnilingus;Fingering;Hairy;Happy Sex;Incest;Large Breasts;Licking;MILF;Swimsuit','Mitarashi Kousei',4.69),
+(1028,'Big Ass;Blowjob;Breast Sucking;Cunnilingus;Hairy;Happy Sex;Incest;Kimono / Yukata;Large Breasts;Licking;Lingerie;MILF;Onsen;Shimapan;Sixty-Nine;Sleeping','Mitarashi Kousei',4.67),
+(1029,'Bikini;Blowjob;Breast Sucking;Cunnilingus;Decensored;Exhibitionism;Fingering;Hairy;Happy Sex;Incest;Large Breasts;MILF;Nakadashi;Swimsuit','Mitarashi Kousei',4.86),
+(1030,'Anilingus;Big Ass;Blowjob;Breast Sucking;Cunnilingus;Hairy;Happy Sex;Incest;Large Breasts;Licking;Masturbation;MILF;Sex Toys;Transparent Clothing','Mitarashi Kousei',4.66),
+(1031,'Anilingus;Aunt;Big Ass;Blowjob;Breast Sucking;Cunnilingus;Decensored;Fingering;Hairy;Happy Sex;Incest;Large Breasts;Licking;Lingerie;Masturbation;MILF','Mitarashi Kousei',4.92),
+(1032,'Aunt;Blowjob;Breast Sucking;Decensored;Fingering;Happy Sex;Incest;Large Breasts;MILF;Nakadashi;Paizuri;Shimapan;Sweating','Mitarashi Kousei',4.97),
+(1033,'Big Ass;Blowjob;Cheerleader;Cosplay;Hairy;Happy Sex;Incest;Large Breasts;Licking;Lingerie;Masturbation;MILF;Shimapan;Sixty-Nine;Transparent Clothing;Voyeurism','Mitarashi Kousei',4.73),
+(1034,'Anal;Anilingus;Aunt;Big Ass;Blowjob;Breast Sucking;Bukkake;Childhood Friend;Cousin;Cunnilingus;Double Penetration;Group Sex;Hairy;Incest;Large Breasts;Licking;MILF;Nakadashi;Oyakodon;Pantyhose;School Uniform;Sleeping;Stockings;Threesome','Mitarashi Kousei',4.67),
+(1035,'Aunt;Bathroom Sex;Big Ass;Blowjob;Breast Sucking;Cosplay;Cunnilingus;Decensored;Hairy;Happy Sex;Incest;Large Breasts;MILF;School Uniform;Sixty-Nine;Sleeping;Stockings','Mitarashi Kousei',4.5),
+(1036,'Anal;Bestiality;Bondage;Corruption;Horse;Impregnation;MILF;Mind Break;Monster;Mouth Gag;Netorare;Rape;Sex Toys;X-ray','Misonou',2.88),
+(1037,'Blowjob;Happy Sex;Masturbation;Nakadashi;Uncensored;X-ray','OuchiKaeru',4.44),
+(1038,'Exhibitionism;Incest;Masturbation;Nakadashi;Sex Toys;Short Hair;Twins;Uncensored;X-ray','Nonaka Tama',4.64),
+(1039,'Age Regression;Demon Girl | Succubus;Diaper;Femdom;Large Breasts;Loli;Oppai Loli;Paizuri;Straight Shota','Cool Kyou Shinja',4.21),
+(1040,'Ahegao;Big Areola;Blowjob;Bodysuit;Huge Breasts;Large Breasts;Muscle;Nakadashi;Paizuri;Rape;X-ray','Onomeshin',3.6),
+(1041,'Ahegao;Anal;BBW;Bunnygirl;Cosplay;Double Penetration;Group Sex;Huge Breasts;Large Breasts;Leotard;Muscle;Paizuri;Plump;Prostitution;Spitroast;Stockings;Witch','Poccora',3.91),
+(1042,'Deepthroat;Imouto;Incest;Loli;NEET / Hikkikomori;School Uniform;Stockings','Ichihaya',4.14),
+(1043,'Collar;Full Color;Group Sex;Large Breasts;Loli;Monster Girl;Nakadashi;Oni;Paizuri;Tall Girl;Threesome;X-ray','aho / AHOBAKA',4.35),
+(1044,'Ahegao;Collar;Defloration;Legal Loli;Loli;Zombie','Kobayashi Oukei',3.8),
+(1045,'Ahegao;Anal;Big Ass;Cervical Penetration;Demon | Incubus;Double Penetration;Hairy;Huge Breasts;Kunoichi;Large Breasts;Mind Break;Stockings;Sweating;Tentacles;Watersports;X-ray','Tsukino Jyogi',4.21),
+(1046,'Anal;Blowjob;Crossdressing;Lingerie;Maledom;Males only;Mind Break;Prostitution;Rape;Shota;Stockings;Trap;Yaoi','Satou Kana',3.96),
+(1047,'Handjob;Large Breasts;Lingerie;Nakadashi;Nurse;Paizuri;Uncensored','Saijou Satoru',4.15),
+(1048,'Ahegao;Big Ass;Blowjob;Cheating;Group Sex;Harem;Huge Penis;Lactation;Large Breasts;Lingerie;MILF;Nakadashi;Paizuri;Short Hair;Uncensored','Polinky',4.3),
+(1049,'Anilingus;Big Ass;Blowjob;Group Sex;Harem;Large Breasts;MILF;Nakadashi;Paizuri;Stockings;Uncensored;X-ray','Polinky',3.95),
+(1050,'Big Ass;Blowjob;Huge Breasts;Nakadashi;Paizuri;Short Hair;Teacher;Uncensored','Nanao Yukiji',4.52),
+(1051,'Blowjob;Childhood Friend;Happy Sex;Large Breasts;Nakadashi;Paizuri;Tanlines;Uncensored;X-ray','Nakano Sora',4.45),
+(1052,'Big Ass;Cunnilingus;Happy Sex;Large Breasts;Nakadashi;NEET / Hikkikomori;Uncensored','Musashimaru',4.45),
+(1053,'Cunnilingus;Femdom;Footjob;School Uniform;Teacher;Uncensored;X-ray','Mozu',4.2),
+(1054,'Anal;Bikini;Double Penetration;Full Color;Group Sex;Loli;Nakadashi;Prostitution;School Uniform;Swimsuit;Threesome;X-ray','Kiryu Manzoku',3.08),
+(1056,'Blowjob;Happy Sex;Large Breasts;Masturbation;Nakadashi;Uncensored','Momoduki Suzu',4.49),
+(1057,'Big Ass;Blowjob;Catgirl;Fangs;Group Sex;Large Breasts;Nakadashi;Pettanko;School Uniform;Stockings;Threesome;Uncensored;X-ray','Mojarin',4.33),
+(1058,'Blowjob;Condom;Hairy;Happy Sex;Incest;Inseki;Large Breasts;Paizuri;School Uniform;Stockings;Uncensored','Kotengu',4.6),
+(1059,'BBW;Blowjob;Happy Sex;Large Breasts;Nakadashi;Nurse;Paizuri;Plump;Uncensored;X-ray','Kosuke Haruhito',4.52),
+(1060,'BBM / Fat Man;Blowjob;Collar;Cunnilingus;Hairy;Happy Sex;Large Breasts;Lingerie;Stockings;Uncensored','Kasugano Tobari',4.23),
+(1061,'Bisexual;Group Sex;Loli;Netorare;Rape;Reverse Rape;Straight Shota;Uncensored','kanbe',2.92),
+(1062,'Handjob;Happy Sex;Large Breasts;Nakadashi;Uncensored;X-ray','Kamiya Zuzu',4.54),
+(1063,'Happy Sex;Nakadashi;Short Hair;Spats;Teacher;Uncensored;X-ray','Kakao',4.57),
+(1064,'Blowjob;Handjob;Happy Sex;Incest;Inseki;Large Breasts;Nakadashi;Naked Apron;School Uniform;Uncensored;X-ray','Kaitenfude',4.53),
+(1065,'Anilingus;Big Ass;Blowjob;Chikan;Femdom;Large Breasts;Masturbation;Nakadashi;Office Lady;Sex Toys;Straight Shota;Uncensored','Inoue Makito',4.07),
+(1066,'Ahegao;Bathroom Sex;Bikini;Blindfold;Blowjob;Bondage;Breast Sucking;Cheating;Drunk;Gyaru;Harem;Huge Breasts;Huge Penis;Impregnation;Large Breasts;Leg Lock;Maledom;MILF;Nakadashi;Paizuri;School Uniform;Shimapan;Sleeping;Smegma;Spanking;Spats;Stockings;Story Arc;Swimsuit;Tan;Tanlines;Teacher;X-ray;Yuri','DISTANCE',4.6),
+(1067,'Ahegao;BBW;Big Areola;Big Ass;Blowjob;Breast Sucking;Cheating;Dark Skin;Exhibitionism;Femdom;Harem;Huge Breasts;Huge Penis;Impregnation;Inverted Nipples;Lactation;Large Breasts;Leg Lock;Maid;Megane;MILF;Muscle;Nakadashi;Netori;Paizuri;Short Hair;Smegma;Stockings;Story Arc;Tall Girl;X-ray','DISTANCE',4.66),
+(1068,'Handjob;Large Breasts;Nakadashi;Symbol Shaped Pupils','Yumoteliuce',4.43),
+(1069,'Blowjob;Dark Skin;Full Color;Happy Sex;Huge Breasts;Large Breasts;Nakadashi','Aoi Nagisa',4.5),
+(1070,'Condom;Hairy;Happy Sex;Office Lady;Tomboy;Uncensored','Ikuhana Niro',4.72),
+(1071,'Blowjob;Childhood Friend;Happy Sex;Large Breasts;Nakadashi;School Uniform;Tsundere;Uncensored;X-ray','Hakui Ami | Ichinose Land',4.35),
+(1072,'Anilingus;Blowjob;Childhood Friend;Group Sex;Happy Sex;Large Breasts;Nakadashi;Paizuri;Pettanko;Swimsuit;Uncensored;X-ray','Ichigou',4.59),
+(1073,'Blowjob;Condom;Happy Sex;Large Breasts;School Uniform;Slut;Teacher;Tsundere;Twintails;Uncensored','Homunculus',4.17),
+(1074,'Cousin;Cunnilingus;Incest;Large Breasts;Nakadashi;Uncensored','Hinasaki Yo',4.5),
+(1075,'Ahegao;Big Ass;Childhood Friend;Cunnilingus;Dark Skin;Defloration;Gyaru;Handjob;Happy Sex;Large Breasts;School Uniform;Short Hair;Tsundere;Uncensored;X-ray','Henkuma',4.67),
+(1076,'Big Ass;Cunnilingus;Hairy;Megane;Nakadashi;Short Hair;Uncensored;X-ray','Hardboiled Yoshiko',4.5),
+(1077,'Cunnilingus;Happy Sex;Large Breasts;Nakadashi;School Uniform;Uncensored;X-ray','Hamao',4.75),
+(1078,'Ahegao;Big Ass;Blackmail;Blowjob;Cheating;Cunnilingus;Fingering;Gaping;Huge Penis;Incest;Large Breasts;Licking;MILF;Mind Break;Mother;Nakadashi;Squirting;Straight Shota;Sweating','Hoyoyo',4.1),
+(1079,'Anal;Aunt;BDSM;Blackmail;Blowjob;Bondage;Collar;Cousin;Defloration;Drunk;Femdom;Filming;Footjob;Group Sex;Harem;Incest;Large Breasts;Latex;Lingerie;Megane;MILF;Nakadashi;Naked Apron;Office Lady;Paizuri;Slave;Story Arc;Swimsuit;Threesome','Honda Arima',4.21),
+(1080,'Ahegao;Anal;Animal Girl;Bathroom Sex;Bikini;Bisexual;Breast Sucking;Catgirl;Collar;Comedy;Double Penetration;Face Sitting;Group Sex;Happy Sex;Imouto;Incest;Licking;Lingerie;Lowleg;Megane;Nakadashi;Pet Girl;Pettanko;Rape;Sex Toys;Short Hair;Stockings;Story Arc;Swimsuit;Threesome;Tsundere;X-ray;Yuri','Teri-Terio',4.41),
+(1081,'Ahegao;Anal;BDSM;Blowjob;Body Modification;Bondage;Breast Sucking;Collar;Dick Growth;Double Penetration;Futanari;Futanari on Futanari;Lactation;Large Breasts;Multiple Penises;Orgasm Denial;Parasite;Stockings;Tentacles','Sagattoru',3.36),
+(1082,'Anal;Crossdressing;Incest;Inseki;Males only;Shota;Trap;Yaoi','Sakiyo Cake | Sakiyoshi Tukune',4.08),
+(1083,'Anal;Blowjob;Cunnilingus;French Kissing;X-ray','uraura',4.3),
+(1084,'Anal;Blowjob;Bondage;Bunnygirl;Double Penetration;Group Sex;Loli;Nakadashi;Paizuri;Threesome','Shaa',2.63),
+(1085,'Big Ass;Blowjob;Cheating;Impregnation;Large Breasts;Lingerie;Megane;MILF;Nakadashi;Paizuri;Short Hair;Stockings;Uncensored;Western;X-ray','gy',4.09),
+(1086,'Big Ass;Cunnilingus;Impregnation;Incest;Inseki;Nakadashi;Pettanko;School Uniform;Short Hair;Twintails;Uncensored;Western;X-ray','gy',3.88),
+(1087,'Handjob;Large Breasts;Nakadashi;Paizuri;Stockings;Teacher;Uncensored','Hazuki Yuuto',4.49),
+(1088,'Big Ass;Fangs;Happy Sex;Megane;Nakadashi;Short Hair;Slut;Uncensored','Fukumaaya',4.43),
+(1089,'Catgirl;Happy Sex;Maid;Pettanko;Short Hair;Uncensored','Eisuke',4.25),
+(1090,'Ahegao;Anal;Crotchless / Breastless;Femdom;Fingering;Group Sex;Handjob;Happy Sex;Lingerie;Nakadashi;Office Lady;Pegging;Prostate Massage;Sex Toys;Stockings;Straight Shota;Strap-on;Tall Girl;Uncensored','Dibi',4.12),
+(1091,'Blowjob;Condom;Handjob;Happy Sex;Nakadashi;Pettanko;School Uniform;Short Hair;Uncensored','Sakuma Tsukasa',4.6),
+(1092,'Handjob;Happy Sex;Nakadashi;School Uniform;Uncensored;X-ray','Tsuge Yasuna',4.5),
+(1093,'Handjob;Large Breasts;Monster Girl;Nakadashi;Uncensored','Shiba Nanasei',4.71),
+(1094,'Big Ass;Large Breasts;Miko;Nakadashi;Uncensored','Shinozuka Jouji',4.74),
+(1095,'Happy Sex;Large Breasts;Lingerie;Maid;Megane;Nakadashi;Paizuri;Sex Toys;Stockings;Uncensored;X-ray','sorani',4.35),
+(1096,'BBW;Elder Sister;Huge Breasts;Incest;Large Breasts;Straight Shota;Uncensored','Tachibana Aruto',4.34),
+(1097,'Blowjob;Cunnilingus;Happy Sex;Large Breasts;Nakadashi;School Uniform;Uncensored','Taira Issui',4.7),
+(1098,'Ahegao;Incest;Inseki;Large Breasts;Nakadashi;School Uniform;Uncensored','Takashi',4.33),
+(1099,'Anal;Crossdressing;Filming;Group Sex;Males only;Rape;Shota;Yaoi','Minokichi',4.03),
+(1100,'Blowjob;Cosplay;Double Penetration;Elder Sister;Fingering;Group Sex;Huge Breasts;Incest;Large Breasts;Masturbation;MILF;Mother;Oyakodon;Stockings;Straight Shota;Swimsuit;Teacher;Threesome','Rakko',3.26),
+(1101,'Anal;Anilingus;Bloomers;Blowjob;CBT;Crossdressing;Cunnilingus;Deepthroat;Femdom;Group Sex;Harem;Human Toilet;Nakadashi;Nurse;Paizuri;Prostate Massage;School Uniform;Shemale;Soushuuhen;Story Arc;Trap;Yaoi','13.',3.79),
+(1102,'Anal;Anilingus;Blowjob;Breast Sucking;Bukkake;Childhood Friend;Comedy;Cunnilingus;Decensored;Deepthroat;Defloration;Femdom;Fingering;French Kissing;Group Sex;Handjob;Happy Sex;Harem;Imouto;Incest;Inseki;Large Breasts;Leg Lock;Licking;Masturbation;Muscle;Nakadashi;Paizuri;Pettanko;Sex Toys;Shimapan;Spanking;Squirting;Story Arc;Sumata;Symbol Shaped Pupils;Tankoubon;Threesome;Twintails;X-ray;Yuri','Arsenal',4.6),
+(1103,'Big Ass;Bikini;Blowjob;Deepthroat;Femdom;Maledom;Stockings;Swimsuit;Symbol Shaped Pupils;Twintails;X-ray','Tsutsumi',4.44),
+(1104,'Dark Skin;Elf;Large Breasts;Monster Girl;Nakadashi;Short Hair;Slime Girl;X-ray','Mizone',4.62),
+(1105,'Animal Girl;Happy Sex;Lamia;Long Tongue;Monster Girl;X-ray','Gin-Blade;Mizone',4.78),
+(1106,'Defloration;Hairy;Happy Sex;Large Breasts;Nakadashi;Pantyhose;Straight Shota;Virginity (Male)','Agawa Ryo',4.39),
+(1107,'Ahegao;Full Color;Happy Sex;Licking;Megane;Pettanko;Spats;Tsundere;Twintails','Norinko',4.38),
+(1108,'Ahegao;Blowjob;Bukkake;Femdom;Happy Sex;Leg Lock;Nakadashi;Pettanko;School Uniform;Short Hair','Norinko',4.24),
+(1109,'Anilingus;Blowjob;Breast Sucking;Elder Sister;Femdom;Footjob;Full Color;Group Sex;Handjob;Harem;Incest;Large Breasts;Megane;MILF;Mother;Naked Apron;Paizuri;Pantyhose;Ryona;Sleeping;Spanking;Straight Shota','Kamoshireya',3.76),
+(1110,'Blowjob;Drunk;Full Color;Handjob;Impregnation;Incest;Large Breasts;MILF;Mother;Nakadashi;Pregnant;Sleeping;Story Arc;Straight Shota;X-ray','Kuroneko Smith',4.64),
+(1111,'Anal;Armpit;Blowjob;Defloration;Exhibitionism;Group Sex;Happy Sex;Large Breasts;School Uniform;Story Arc','Ooshima Ryou',4.52),
+(1112,'Dick Growth;Exhibitionism;Futanari;Futanari on Futanari;Huge Penis;Large Breasts;Miko;Phimosis;Short Hair','Magifuro Konnyaku',4.33),
+(1113,'Anal;Bondage;Collar;Crossdressing;Lingerie;Males only;School Uniform;Shota;Small Penis;Trap;Yandere;Yaoi','ManbooRerere',4.5),
+(1114,'Animal Boy;Catgirl;Large Breasts','Kuroshiki',4.29),
+(1115,'Bisexual;Catgirl;Group Sex;Large Breasts;Nakadashi;Threesome','Kuroshiki',4.2),
+(1116,'Anal;Catgirl;Double Penetration;Furry;Group Sex;Large Breasts;Multiple Insertion','Kuroshiki',3.75),
+(1117,'Anal;Bondage;Catgirl;Furry;Futanari;Shibari','Kuroshiki',3.9),
+(1118,'Large Breasts;Nakadashi;Nun;Stockings;Straight Shota','Kusatsu Terunyo',4.27),
+(1119,'Happy Sex;Loli;Witch','Tamano Kedama',4.4),
+(1120,'Animal Girl;Happy Sex;Loli;Smug;Stockings','Tamano Kedama',4.46),
+(1121,'Ahegao;BBM / Fat Man;Bunnygirl;Elf;Gokkun;Impregnation;Lactation;Loli;Pregnant;Prolapse;Smegma;Stockings;Symbol Shaped Pupils','Kotee',3.76),
+(1122,'Anal;Bondage;Enema;Exhibitionism;Incest;Lactation;Large Breasts;Mind Break;Monster;Rape;Scat;Tentacles;Yuri','Bontenkarasu',3.43),
+(1123,'Anal;Blindfold;Bondage;Enema;Exhibitionism;Humiliation;Lactation;Large Breasts;Scat;Spanking;Tentacles;Watersports','Bontenkarasu',2.64),
+(1124,'Blackmail;Drugs;Group Sex;Hairy;Large Breasts;Nakadashi;Rape;School Uniform;Shimapan;Stockings;Straight Shota;Sweating;Threesome;X-ray','Kemigawa Mondo',3.64),
+(1125,'Anal;Crossdressing;Males only;Pantyhose;Shota;Trap;Yaoi','Uehasu',4.49),
+(1126,'Anal;BBM / Fat Man;Collar;Crossdressing;DILF;Drugs;French Kissing;Males only;Mind Break;Piercings;Prostitution;Shota;Slut;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Hontoku',4.39),
+(1127,'Ahegao;Anal;Blowjob;Condom;Crossdressing;Futa on Male;Futanari;Gokkun;Huge Penis;Phimosis;Shota;Small Penis;Stockings;Trap;X-ray','Magifuro Konnyaku',4.48),
+(1128,'Defloration;Full Color;Gaping;Sex Toys;Spats;Spreading;Uncensored','Bosshi',4.48),
+(1129,'Cunnilingus;Defloration;Exhibitionism;Happy Sex;Nakadashi;Onsen;Uncensored;X-ray','Yukian',4.57),
+(1130,'Big Ass;Blowjob;Childhood Friend;Cunnilingus;Happy Sex;Large Breasts;Nakadashi;School Uniform;Twintails;Uncensored','UmiUshi',4.71),
+(1131,'Blowjob;Hairy;Happy Sex;Large Breasts;Nakadashi;Uncensored','Tsukitokage',4.5),
+(1132,'Breast Sucking;Full Color;Handjob;Happy Sex;Large Breasts;Megane;MILF;Nakadashi;Paizuri;Pantyhose;Straight Shota;Sweating;Teacher;Tutor;Virginity (Male);X-ray','Nora Higuma',4.79),
+(1133,'Ahegao;Anal;Big Ass;Bondage;Defloration;Double Penetration;Gaping;Group Sex;Hairy;Hairy Armpits;Huge Breasts;Humiliation;Impregnation;Large Breasts;Mind Break;Multiple Insertion;Nakadashi;Nose Hook;Piercings;Pregnant;Rape;Ryona;Scat;Slave;Spanking;Squirting;Stomach Bulge;X-ray','Neromashin',3.33),
+(1134,'Ahegao;Blowjob;Cheating;Condom;Cunnilingus;Face Sitting;Full Color;Large Breasts;Megane;MILF;Mind Control;Nakadashi;Paizuri;Short Hair;Stockings;Symbol Shaped Pupils;X-ray','Hozumi Kenji',3.5),
+(1135,'Blowjob;Exhibitionism;Happy Sex;Large Breasts;Masturbation;Nakadashi;Reverse Rape;School Uniform;Stockings;Time Stop;Voyeurism;X-ray','Maihara Matsuge',4.17),
+(1136,'Chikan;Cunnilingus;Happy Sex;Invisible;Large Breasts;Licking;Masturbation;Nakadashi;Paizuri;School Uniform;Stockings','Maihara Matsuge',4.39),
+(1137,'Anal;Aunt;Big Ass;Blowjob;Breast Sucking;Cunnilingus;Full Color;Hairy;Hairy Armpits;Happy Sex;Incest;Large Breasts;Megane;MILF;Nakadashi;Phimosis;Short Hair;Sleeping;Smell;Spreading;Straight Shota;Sweating;Virginity (Male);X-ray','Seibee',4.31),
+(1138,'Anal;Big Areola;Bondage;Breast Expansion;Collar;Futa on Male;Futanari;Group Sex;Hairy Armpits;Huge Penis;Impregnation;Incest;Lactation;Large Breasts;Megane;MILF;Mind Break;Monster;Mother;Piercings;Pregnant;Rape;Sex Toys;Shota;Sweating','Kiken Shisou',3.53),
+(1139,'Ahegao;Big Areola;Big Ass;Cheerleader;Crotchless / Breastless;Femdom;Gloves;Happy Sex;Large Breasts;Lingerie;Nakadashi;Paizuri;Spanking;Stockings;Twintails;X-ray','Chirumakuro',4.41),
+(1140,'Bikini;Dark Skin;Happy Sex;Large Breasts;Monster Girl;Nakadashi;Oni;Short Hair;Swimsuit;X-ray','obmas',4.67),
+(1141,'BBW;Blowjob;Defloration;Huge Breasts;Kimono / Yukata;Large Breasts;Monster Girl;Nakadashi;Oni;X-ray','obmas',4.55),
+(1142,'Big Ass;Cervical Penetration;Dick Growth;Futanari;Futanari on Futanari;Giantess;Huge Breasts;Huge Penis;Impregnation;Large Breasts;Mermaid;Micro;Nakadashi;Nipple Penetration;Paizuri;Unbirthing;X-ray','Rebis',4.29),
+(1143,'Catgirl;French Kissing;Happy Sex;Large Breasts;Lingerie;Nakadashi','Oretto',4.44),
+(1144,'Anal;Blowjob;Handjob;Incest;Males only;Masturbation;Otouto;Shota;Yaoi','Shiogochi',4.18),
+(1145,'Anal;Bodysuit;Exhibitionism;Group Sex;Males only;Shota;Yaoi','Shiogochi',3.0),
+(1146,'Blowjob;Condom;Dark Skin;Handjob;Impregnation;Lactation;Large Breasts;Nakadashi;Possession;Pregnant;School Uniform;Stockings;Straight Shota;Teacher;X-ray','Kurisu',4.41),
+(1147,'Alien;Huge Penis;Impregnation;Mind Control;Nakadashi;Parasite;Possession;Pregnant;School Uniform;Short Hair;Teacher;X-ray','Kurisu',4.57),
+(1148,'Alien;French Kissing;Group Sex;Impregnation;Large Breasts;Masturbation;Mind Control;Nakadashi;Paizuri;Parasite;Possession;Pregnant;Rape;School Uniform;Stockings;Threesome;X-ray','Himekuri;Kurisu',4.38),
+(1149,'Alien;Anal;Blowjob;Cervical Penetration;Corruption;Cunnilingus;Fingering;French Kissing;Impregnation;Large Breasts;Megane;Mind Control;Nakadashi;Possession;Short Hair;Sixty-Nine;Stockings;Stomach Bulge;X-ray','Kurisu',4.59),
+(1150,'Alien;Blowjob;Cunnilingus;Exhibitionism;Impregnation;Large Breasts;Licking;Mind Control;Nakadashi;Parasite;Possession;Squirting;Stockings;X-ray','Kurisu',4.39),
+(1151,'Impregnation;Large Breasts;Nakadashi;Parasite;Possession;Short Hair;Teacher','Kurisu',4.62),
+(1152,'Ahegao;Drugs;Femdom;Reverse Rape','Kuno Touya',4.23),
+(1153,'Ahegao;Brain Fuck;Corruption;Double Penetration;Large Breasts;Leotard;Living Clothes;Mind Break;Possession;Rape;Tentacles;X-ray','Kumoi Takashi',3.3),
+(1154,'Anal;Catgirl;Cunnilingus;Double Penetration;Group Sex;Stockings;Threesome','Kuroshiki',3.33),
+(1155,'Blowjob;Catgirl;Short Hair','Kuroshiki',2.5),
+(1156,'Blowjob;Hairy;Large Breasts;Lingerie;Nakadashi;School Uniform;Uncensored','Shimazu Tekko',4.36),
+(1157,'Decensored;Defloration;Group Sex;Loli;Megane;Nakadashi;School Uniform;Slave','Mayonnaise.',3.75),
+(1158,'Ahegao;All the Way through;Big Areola;Blowjob;Breast Sucking;Collar;Dark Skin;Deepthroat;Drugs;Elf;Fisting;Full Color;Gokkun;Harem;Huge Breasts;Huge Penis;Lactation;Large Breasts;Maledom;Mind Break;Rape;Slave;Stockings;Stomach Bulge;Torture;Vomit;X-ray','Erodezain Koubou',3.8),
+(1159,'Ahegao;Anal;BDSM;Blowjob;Body Writing;Bondage;Deepthroat;Defloration;Double Penetration;Exhibitionism;Femdom;Fisting;Gangbang;Group Sex;Huge Penis;Human Toilet;Impregnation;Maledom;Megane;Mind Break;Nakadashi;Pantyhose;Pettanko;Prostitution;Rape;School Uniform;Sex Toys;Slave;Spitroast;Stockings;Stomach Bulge;Tankoubon;Torture;Twintails','Mayonnaise.',3.57),
+(1160,'Anal;Body Writing;Bondage;Bukkake;Defloration;Double Penetration;Fisting;Group Sex;Huge Penis;Human Toilet;Loli;Maledom;Megane;Multiple Insertion;Pettanko;Prostitution;Rape;School Uniform;Sex Toys;Slave;Stomach Bulge;Tankoubon;Teacher;Twintails;X-ray','Mayonnaise.',4.0),
+(1161,'Ahegao;Anilingus;Big Ass;Blowjob;Bondage;Bukkake;CBT;Drugs;Exhibitionism;Face Sitting;Femdom;Fingering;Fisting;Fundoshi;Gangbang;Gokkun;Group Sex;Hairy;Hairy Armpits;Large Breasts;Megane;Mind Break;Nurse;Sex Toys;Spanking;Stomach Bulge;Tattoo','Kakugari Kyoudai',4.27),
+(1162,'Anal;Bikini;Blowjob;Breast Sucking;Bunnygirl;Cow Girl;Dirty Old Man;Exhibitionism;Femdom;Fingering;Group Sex;Hairy;Handjob;Impregnation;Lactation;Large Breasts;Licking;Lowleg;Maid;Maledom;Mind Control;Nakadashi;Office Lady;Onsen;Pantyhose;Pregnant;Rape;Reverse Rape;Sex Toys;Spitroast;Swimsuit;Tankoubon;Teacher;Voyeurism','ISUTOSHI',3.6),
+(1163,'Anal;Anilingus;Big Ass;Blowjob;Breast Expansion;Breast Sucking;Bukkake;Cunnilingus;Dark Skin;Decensored;Defloration;Double Penetration;Drugs;Enema;Fingering;Gangbang;Group Sex;Impregnation;Kunoichi;Large Breasts;Licking;Mind Break;Monster;Multiple Insertion;Nakadashi;Nipple Penetration;Rape;Spanking;Stockings;Tentacles;Vomit;X-ray','Butcha U',4.76),
+(1164,'Anal;Blowjob;Collar;Crossdressing;Deepthroat;Drugs;Fingering;Gangbang;Gokkun;Group Sex;Latex;Mind Break;Nakadashi;Piercings;Rape;Shota;Stockings;Symbol Shaped Pupils;Trap;Virginity (Male);Vomit;Yaoi','Takashi',3.87),
+(1165,'Aunt;Cheating;Chikan;Comedy;Double Penetration;Elder Sister;Femdom;Group Sex;Harem;Incest;Loli;Megane;MILF;Mother;Nakadashi;School Uniform;Tankoubon;Threesome','Karma Tatsurou',4.56),
+(1166,'Anal;Anilingus;Blindfold;Blowjob;Cheating;Double Penetration;Exhibitionism;Femdom;Group Sex;Hairy;Handjob;Harem;Incest;Lactation;Large Breasts;Masturbation;Megane;MILF;Mother;Nakadashi;Phimosis;School Swimsuit;School Uniform;Sex Toys;Smell;Solo Action;Squirting;Story Arc;Sweating;Swimsuit;Tankoubon;Threesome;Virginity (Male);Voyeurism;X-ray','Oobanburumai',4.42),
+(1167,'Anal;Cosplay;Crossdressing;Dark Skin;Frotting;Males only;Nakadashi;Prostitution;Stockings;Trap;Yaoi','Aimaitei Umami',4.42),
+(1168,'Ahegao;Aunt;Big Areola;Big Ass;Blowjob;Exhibitionism;Fingering;Hairy;Happy Sex;Huge Breasts;Huge Penis;Incest;Large Breasts;Licking;Maledom;Megane;MILF;Nakadashi;School Uniform;Straight Shota;Swimsuit;Uncensored;X-ray','Tsukino Jyogi',4.49),
+(1169,'Ahegao;Aunt;Bathroom Sex;Big Areola;Big Ass;Blowjob;Deepthroat;French Kissing;Hairy;Happy Sex;Huge Breasts;Huge Penis;Incest;Large Breasts;Maledom;Megane;MILF;Mind Break;Nakadashi;Onsen;Smegma;Straight Shota;Sweating;X-ray','Tsukino Jyogi',4.44),
+(1170,'Ahegao;Alien;Anal;Anilingus;Animal Girl;Anthology;BDSM;Bestiality;Birth;Bodysuit;Bondage;Catgirl;Centaur;Collar;Cow Girl;Devil;Double Penetration;Egg Laying;Elf;Group Sex;Harem;Huge Breasts;Huge Penis;Human Cattle;Impregnation;Lactation;Lamia;Large Breasts;Lingerie;Mind Break;Monster;Monster Girl;Multiple Insertion;Multiple Penises;Nakadashi;Pregnant;Rape;Royalty;Slave;Squirting;Stomach Bulge;Symbol Shaped Pupils;Tentacles;Vore;X-ray','Ashimoto Yoika;Sakazaki Freddie;ShindoL;Takayuki Hiyori;Zucchini',3.86),
+(1171,'Ahegao;Anal;Bestiality;Double Penetration;Full Color;Group Sex;Kunoichi;Large Breasts;Monster;Rape;Stomach Bulge;Tentacles;X-ray','Modaetei Anetarou;Modaetei Imojirou',2.25),
+(1172,'Exhibitionism;Fisting;Loli;Megane;Prostitution;School Uniform;Sex Toys;Stomach Bulge;Twintails;X-ray','Mayonnaise.',3.33),
+(1173,'Anilingus;Blowjob;Bondage;Bukkake;Gangbang;Group Sex;Impregnation;Nakadashi;Pettanko;Prostitution;Sex Toys;Spitroast;Torture;X-ray','Mayonnaise.',3.54),
+(1174,'Ahegao;Blowjob;Demon | Incubus;Femdom;Foot Fetish;Footjob;Large Breasts;Mask;Monster Girl;Pettanko;Smell','Ueda John',3.33),
+(1175,'Bathroom Sex;Blowjob;Hairy;Handjob;Incest;Large Breasts;MILF;Mother;Nakadashi;Straight Shota','Karma Tatsurou',4.46),
+(1176,'Bathroom Sex;Emotionless Sex;Femdom;Handjob;Nakadashi;Stockings;Straight Shota;X-ray','Ogadenmon',4.17),
+(1177,'All the Way through;Anal;Big Ass;Frotting;Futa on Male;Futanari;Gaping;Huge Breasts;Huge Penis;Large Breasts;Monster Girl;Nakadashi;Prolapse;Reverse Rape;Stomach Bulge;Tan;Tanlines;Vore','Teterun',3.36),
+(1178,'Anal;Anilingus;Blowjob;Bondage;Crossdressing;Dark Skin;Devil;Femdom;Footjob;Frotting;Futa on Male;Futanari;Group Sex;Large Breasts;Pegging;Rape;Reverse Rape;Shota;Small Penis;Stockings;Succubus;Tentacles;Trap','SIRPENT',4.24),
+(1179,'Ahegao;Anal;Blowjob;Bukkake;Chikan;Crossdressing;Dark Skin;Devil;Femdom;Fingering;Frotting;Full Color;Futa on Male;Futanari;Group Sex;Incest;Lingerie;Shota;Sixty-Nine;Small Penis;Stockings;Succubus;Tentacles;Trap;Yaoi','SIRPENT',4.62),
+(1180,'Ahegao;Anal;Blowjob;Childhood Friend;Dojikko;Fangs;Femdom;Futa on Male;Futanari;Large Breasts;Licking;Paizuri;Prostate Massage;Spats;Tall Girl','Wokasiya',4.33),
+(1181,'Ahegao;Anal;Blowjob;Childhood Friend;Crossdressing;Femdom;Futa on Male;Futanari;Gender Bender;Huge Penis;Impregnation;Large Breasts;Mind Break;Nakadashi;Piercings;Shota;Stomach Bulge;Trap','Chimosaku',4.46),
+(1182,'Bestiality;Blindfold;Bondage;Double Penetration;Gender Bender;Group Sex;Horse;Impregnation;Large Breasts;Mind Break;Nakadashi;Rape;Threesome','Yutakame',3.63),
+(1183,'Bondage;Drugs;Femdom;Handjob;Huge Breasts;Huge Penis;Large Breasts;Nakadashi;Paizuri;School Uniform;Witch;X-ray','PIero',4.55),
+(1184,'Anal;Double Penetration;Egg Laying;Group Sex;Happy Sex;Monster Girl','Takayuki Hiyori',3.67),
+(1185,'Ahegao;Anal;Birth;Blowjob;Brain Fuck;Cervical Penetration;Devil;Double Penetration;Drugs;Egg Laying;Group Sex;Huge Penis;Lactation;Large Breasts;Mind Break;Monster;Monster Girl;Multiple Insertion;Nakadashi;Pregnant;Rape;Spitroast;Stomach Bulge;Tentacles;Threesome;Torn Clothing;Vomit;X-ray','FCT',4.36),
+(1186,'Anal;Blowjob;Group Sex;Large Breasts;Magical Girl;MILF;Monster;Nakadashi;Rape;Short Hair','Butcha U;Takasugi Kou;Tamaki Nozomu',4.17),
+(1187,'Anal;Bisexual;Blindfold;Blowjob;Bondage;Humiliation;Nakadashi;Rape;Short Hair;Shota;Stockings;Yaoi','Ikezaki Misa',3.58),
+(1188,'Anal;Anilingus;Bondage;Dog Girl;Fangs;Femdom;Futa on Male;Futanari;Pegging;Reverse Rape;Tengu','Mumumu',3.61),
+(1189,'Anal;Anilingus;Fangs;Femdom;Fox Girl;Futa on Male;Futanari;Hat;Reverse Rape;Short Hair;Tailjob','Mumumu',3.69),
+(1190,'Anal;Crossdressing;Fangs;Frotting;Males only;Stockings;Trap;Yaoi','Meme 50',4.41),
+(1191,'Anal;BBM / Fat Man;Big Ass;Bikini;Drugs;Filming;Group Sex;Huge Breasts;Large Breasts;Nakadashi;Paizuri;Sleeping;Swimsuit','Monaka',3.9),
+(1192,'Blowjob;Collar;Condom;Cunnilingus;Deepthroat;Dog Girl;Filming;Futanari;Futanari on Futanari;Large Breasts;Masturbation;Nakadashi;Paizuri;Pet Girl;Sleeping;Symbol Shaped Pupils;Uncensored;Watersports','Hakaba Yodomu',4.63),
+(1193,'Decensored;Exhibitionism;Filming;Futanari;Futanari on Futanari;Large Breasts;Masturbation;Nakadashi;Stockings;Symbol Shaped Pupils','Hakaba Yodomu',4.56),
+(1194,'Blowjob;Decensored;Exhibitionism;Females only;Futanari;Futanari on Futanari;Hairy;Happy Sex;Large Breasts;Sweating','Hakaba Yodomu',4.55),
+(1195,'Blowjob;Group Sex;Large Breasts;Leg Lock;Megane;Nakadashi;School Uniform;Slut;Symbol Shaped Pupils;Threesome;Virginity (Male)','Spiritus Tarou',3.13),
+(1196,'Anal;Animal Girl;Blowjob;Breast Sucking;Double Penetration;Fox Girl;French Kissing;Gangbang;Group Sex;Happy Sex;Large Breasts;Nakadashi;Paizuri;Short Hair;X-ray','Koza',3.73),
+(1197,'Cunnilingus;Group Sex;Large Breasts;Nakadashi;Short Hair;Squirting;Stockings','Satetsu',3.67),
+(1198,'Hat;Incest;Large Breasts;Paizuri;Pantyhose;Stockings','Imotoka Tsuyuki',4.41),
+(1199,'Blindfold;Happy Sex;Large Breasts;Nakadashi;Short Hair','soda',4.27),
+(1200,'Ahegao;BBM / Fat Man;Big Ass;Breast Sucking;Catgirl;Cervical Penetration;Huge Penis;Large Breasts;Lingerie;Nakadashi;Paizuri;School Uniform;Stockings;Sweating','Takurou',4.26),
+(1201,'Blowjob;Gender Bender;Large Breasts;Mind Break;Mind Control;Nakadashi;School Uniform;Selfcest;Short Hair;X-ray','Giu',3.9),
+(1202,'Ahegao;BBM / Fat Man;Big Ass;Blowjob;Collar;Condom;Defloration;Double Penetration;Fingering;French Kissing;Group Sex;Large Breasts;Lingerie;Nakadashi;School Uniform;Short Hair;Swinging / Netorase;Symbol Shaped Pupils;Threesome;Virginity (Male);X-ray','Tamagoro',4.27),
+(1203,'Anal;Crossdressing;Males only;Piercings;School Uniform;Shota;Trap;Yaoi','Lew',4.49),
+(1204,'Femdom;Happy Sex;Miko;Nakadashi;Sleeping;Straight Shota','Michiking',4.61),
+(1205,'Blowjob;DILF;Large Breasts;Megane;Nakadashi;Paizuri;Plump;Rape;Teacher','Itou Eight',3.86),
+(1206,'BDSM;Blowjob;French Kissing;Happy Sex;Harem;Large Breasts;Maledom;Paizuri','Yuuki Hagure',4.67),
+(1207,'Anal;Blowjob;Crossdressing;Crotchless / Breastless;Happy Sex;Males only;Shota;Stockings;Trap;Twintails;Yaoi','Sioyaki Ayu',4.13),
+(1208,'Blowjob;Breast Sucking;Cunnilingus;Handjob;Happy Sex;Impregnation;Large Breasts;Nakadashi;Sixty-Nine;Symbol Shaped Pupils;Twintails;X-ray','Takeyuu',4.61),
+(1209,'Femdom;Large Breasts;Long Tongue;MILF;Monster Girl;Reverse Rape;Short Hair;Yandere','Nakamura Regura',4.56),
+(1210,'Ahegao;Animal Boy;Blowjob;Breast Sucking;Catgirl;Collar;Futanari;Large Breasts;Nakadashi;Shimapan;Short Hair','Kitsuneko Anko',3.86),
+(1211,'Ahegao;Blowjob;Cunnilingus;Defloration;Fingering;French Kissing;Nakadashi;Possession;Squirting;Watersports;X-ray','Ichitaka',4.61),
+(1212,'Blowjob;Condom;Dark Skin;Fox Girl;Full Color;Impregnation;Large Breasts;Nakadashi;Sweating','Yukibuster-Z',4.66),
+(1213,'Blowjob;Collar;Defloration;Happy Sex;Impregnation;Nakadashi;Stockings','Matsuri Miko',4.36),
+(1214,'Blowjob;Defloration;Gloves;Happy Sex;Inverted Nipples;Large Breasts;Lingerie;Nakadashi;Paizuri;Stockings;Virginity (Male)','Chirumakuro',4.57),
+(1215,'Anal;Blowjob;Double Penetration;Gender Bender;Group Sex;Incest;Large Breasts;Nakadashi;Rape;Short Hair;Threesome;X-ray','Shinogiri Zun',3.62),
+(1216,'Blowjob;Cunnilingus;Decensored;Doctor;Hairy;Large Breasts;MILF;Nakadashi;Phimosis;Prostate Massage;School Uniform;Sixty-Nine;Straight Shota;Virginity (Male)','Hashida Mamoru',4.41),
+(1217,'Animal Girl;Blowjob;Fox Girl;French Kissing;Large Breasts;Nakadashi;Sweating;Swimsuit;Transparent Clothing','ABO',4.71),
+(1218,'Bikini;Fox Girl;Large Breasts;Nakadashi;Paizuri;Phimosis;Straight Shota;Swimsuit','Kurokawa IZUMI',4.14),
+(1219,'Ahegao;Nakadashi;Pettanko;Short Hair;Watersports','Clone Ningen',4.37),
+(1220,'Ahegao;Blowjob;Condom;Deepthroat;Defloration;Licking;Pettanko','Clone Ningen',4.61),
+(1221,'Anal;Double Penetration;Group Sex;Large Breasts;Mind Break;Paizuri;Rape;Threesome','nuezou',4.09),
+(1222,'Ahegao;Anal;BBW;Big Areola;Big Ass;Drugs;Fisting;Huge Breasts;Inverted Nipples;Large Breasts;Megane;Mind Break;Nakadashi;Nipple Penetration;Rape;School Uniform;Sex Toys;Teacher','henrik',3.61),
+(1223,'Bikini;Blowjob;Defloration;Huge Breasts;Large Breasts;Rape;Swimsuit','Jean Louis',4.1),
+(1224,'Anal;BBW;Big Ass;Dark Skin;Double Penetration;Group Sex;Huge Breasts;Incest;Large Breasts;MILF;Mother;Paizuri;Short Hair;Straight Shota;Swimsuit;Voyeurism','Matsumoto Katsuya',3.78),
+(1225,'Ahegao;Anal;Bikini;Bunnygirl;Catgirl;Exhibitionism;Group Sex;Large Breasts;Nakadashi;Sex Toys;Short Hair;Stockings;Swimsuit;Threesome','Puyocha | YO',4.51),
+(1226,'Group Sex;Mind Control;Nakadashi;Stockings','Take Calcium',3.5),
+(1227,'Anal;Bikini;Crossdressing;Father;Full Color;Group Sex;Incest;Males only;Shota;Stockings;Swimsuit;Trap;Yaoi','Zenra QQ',3.64),
+(1228,'Big Ass;Blowjob;Condom;Femdom;Happy Sex;Hat;Large Breasts;Monster Girl;Paizuri;Short Hair;Smug;Tengu;X-ray','Yukiusagi.',4.2),
+(1229,'Big Ass;Condom;Fingering;Full Color;Group Sex;Gyaru;Huge Breasts;Impregnation;Large Breasts;Nakadashi;Tan;Tanlines;Threesome','Rebis',4.35),
+(1230,'Anal;Big Ass;Defloration;Full Color;Group Sex;Harem;Huge Breasts;Impregnation;Large Breasts;Nakadashi;School Uniform;Tan;Tanlines;Threesome;X-ray','Rebis',4.69),
+(1231,'Age Progression;Ahegao;Anal;Aunt;Big Ass;Corruption;Dark Skin;Daughter;Demon | Incubus;Femdom;Futanari;Futanari on Futanari;Group Sex;Huge Penis;Imouto;Impregnation;Incest;Large Breasts;Loli;Monster Girl;Mother;Muscle;Niece;Stockings;Stomach Bulge;Tall Girl','Rebis',4.04),
+(1232,'Anal;Anilingus;Big Ass;Bikini;Collar;Dark Skin;Group Sex;Harem;Impregnation;Incest;Lactation;MILF;Mother;Oyakodon;Swimsuit;Threesome','Rebis',4.18),
+(1233,'Assjob;BBW;Big Ass;Breast Sucking;Bunnygirl;Cheating;Corruption;Dark Skin;Demon | Incubus;Dick Growth;Elf;Futanari;Futanari on Futanari;Group Sex;Impregnation;Incest;Lactation;Lamia;Large Breasts;Megane;MILF;Monster Girl;Multiple Penises;Muscle;Nakadashi;Oppai Loli;Piercings;Royalty;Ryona;Stockings;Sweating;Tall Girl','Rebis',4.12),
+(1234,'Anal;Big Ass;Dark Skin;Daughter;Enema;Futanari;Futanari on Futanari;Huge Breasts;Incest;Lactation;Large Breasts;MILF;Monster Girl;Mother;Paizuri;Tentacles','Rebis',4.5),
+(1235,'Ahegao;Anal;Anilingus;Animal Girl;BBW;Big Ass;Blowjob;Breast Sucking;Bunnygirl;Cheating;Dark Skin;Defloration;Femdom;Fingering;Fox Girl;Futanari;Gender Bender;Group Sex;Hairy;Happy Sex;Harem;Huge Breasts;Huge Penis;Impregnation;Lactation;Large Breasts;Megane;MILF;Mind Break;Mind Control;Monster Girl;Muscle;Nakadashi;Netorare;Netori;Onahole;Paizuri;Phimosis;Pregnant;Sex Toys;Small Penis;Stockings;Stomach Bulge;Straight Shota;Sumata;Symbol Shaped Pupils;Twintails;Yuri','Akitsuchi Shien;Chinbotsu;Rebis;Wamusato Haru',4.46),
+(1236,'Ahegao;Big Ass;Bikini;Blowjob;Fingering;Frotting;Futanari;Futanari on Futanari;Group Sex;Handjob;Huge Breasts;Impregnation;Inverted Nipples;Lactation;Large Breasts;Licking;Mind Break;Multiple Penises;Muscle;Nakadashi;Paizuri;Rape;Stockings;Swimsuit;Tattoo;X-ray','Chinbotsu;Rebis',4.27),
+(1237,'Anal;Dark Skin;Daughter;Double Penetration;Foot Fetish;Futanari;Group Sex;Huge Breasts;Huge Penis;Incest;Lactation;Large Breasts;Mind Break;Mother;Muscle;Nipple Penetration;Pettanko','Rebis',4.55),
+(1238,'Armpit;Big Ass;Blowjob;Dark Skin;Double Penetration;Futanari;Futanari on Futanari;Gokkun;Group Sex;Huge Penis;Lactation;Large Breasts;Masturbation;Monster;Muscle;Paizuri;Prostitution','Rebis',4.46),
+(1239,'Ahegao;Angel;Big Ass;Dark Skin;Daughter;Demon | Incubus;Futanari;Hairjob;Huge Breasts;Huge Penis;Impregnation;Incest;Lactation;Large Breasts;MILF;Mind Break;Mother;Nakadashi;Nipple Penetration;Paizuri;Tentacles;X-ray','Rebis',4.65),
+(1240,'Big Ass;Dark Skin;Daughter;Devil;Elf;Futanari;Huge Penis;Impregnation;Lactation;Large Breasts;Loli;Mother;Nakadashi;Oppai Loli','Chinbotsu;Rebis',4.46),
+(1241,'Anal;BBW;Big Ass;Blowjob;Futanari;Group Sex;Huge Breasts;Huge Penis;Large Breasts;Magical Girl;Multiple Penises;Paizuri;Yuri','Alpha Alf Layla;Chinbotsu;Rebis',4.84),
+(1242,'Big Ass;Birth;Bukkake;Childhood Friend;Dark Skin;Defloration;Devil;Egg Laying;Elf;Futanari;Futanari on Futanari;Impregnation;Incest;Lamia;Large Breasts;Monster Girl;Mother;Multiple Penises;Muscle;Nakadashi;Rape;Stockings;Stomach Bulge;Succubus','Rebis',4.23),
+(1243,'Big Ass;Dark Skin;Defloration;Devil;Elf;Futanari;Futanari on Futanari;Group Sex;Lactation;Lamia;Large Breasts;Masturbation;Monster Girl;Multiple Penises;Muscle;Tentacles','Rebis',4.25),
+(1244,'Big Ass;Dark Skin;Demon | Incubus;Elf;Futanari;Group Sex;Huge Penis;Lactation;Large Breasts;Multiple Penises;Muscle;Paizuri;Rape;Yuri','Rebis',4.42),
+(1245,'Ahegao;Anal;Blowjob;Bunnygirl;Defloration;Dick Growth;Eyepatch;Fingering;Frotting;Futanari;Futanari on Futanari;Gokkun;Group Sex;Gyaru;Huge Penis;Impregnation;Large Breasts;Licking;Loli;Male on Futa;Megane;Nakadashi;Paizuri;Stockings;Threesome;Tsundere;X-ray','Akitsuchi Shien;Alpha Alf Layla;Chinbotsu;Rebis',4.38),
+(1246,'Ahegao;Blowjob;Dark Skin;Fingering;Happy Sex;Huge Breasts;Impregnation;Large Breasts;Leg Lock;Licking;Megane;Nakadashi;Paizuri;Short Hair;Spats;Squirting;Straight Shota;Sweating;Teacher;Tomboy;Uncensored;X-ray','Rebis;Wamusato Haru',4.64),
+(1247,'Anal;Big Ass;Corruption;Futanari;Futanari on Futanari;Huge Breasts;Large Breasts;Megane;Mind Break;Mind Control;Multiple Penises;Shemale','Chinbotsu;Rebis',4.5),
+(1248,'Ahegao;Armpit;Big Ass;Blowjob;Dark Skin;Deepthroat;Defloration;Devil;Dick Growth;Drugs;Eyepatch;Futanari;Futanari on Futanari;Group Sex;Huge Breasts;Impregnation;Lactation;Large Breasts;Megane;Mind Break;Mind Control;Monster Girl;Multiple Penises;Muscle;Nakadashi;Paizuri;Shemale;X-ray','Chinbotsu;Rebis',4.5),
+(1249,'Anal;Armpit;Big Ass;Blowjob;Bondage;Dark Skin;Double Penetration;Elf;Fingering;Futanari;Large Breasts;Loli;Muscle;Nakadashi;Pregnant;Rape;Urethra Insertion','Chinbotsu;Rebis',3.81),
+(1250,'Big Ass;Blowjob;Defloration;Futanari;Group Sex;Huge Breasts;Impregnation;Lactation;Large Breasts;Mind Break;Muscle;Nakadashi;Paizuri;Threesome;X-ray','Chinbotsu;Rebis',4.45),
+(1251,'Big Ass;Bondage;Dark Skin;Demon | Incubus;Double Penetration;Futanari;Futanari on Futanari;Group Sex;Lactation;Large Breasts;Monster Girl;Muscle;Nipple Penetration;Orc;Paizuri;Pregnant;Rape;Tentacles;X-ray;Yuri','Rebis',4.24),
+(1252,'Anal;Aunt;Big Ass;Dark Skin;Futanari;Futanari on Futanari;Group Sex;Incest;Large Breasts;Loli;Muscle;Niece;Nipple Penetration;Oppai Loli;Threesome','Rebis',3.74),
+(1253,'Animal Girl;Big Ass;Blowjob;Catgirl;Decensored;Happy Sex;Impregnation;Leg Lock;Megane;Nakadashi;Sex Toys;Sixty-Nine;Squirting;Stockings;X-ray','Jun',4.81),
+(1254,'Big Areola;Huge Breasts;Large Breasts;Monster Girl;Oni;Straight Shota;X-ray','obmas',4.22),
+(1255,'Age Progression;Age Regression;Breast Expansion;Bunnygirl;Full Color;Gender Bender;Lingerie;Mind Control;Sex Toys;Transformation','Amulai;Reitoumikan',4.18),
+(1256,'Cunnilingus;Drunk;French Kissing;Happy Sex;Large Breasts;Nakadashi','Oretto',4.0),
+(1257,'Defloration;Happy Sex;Stockings','Oretto',4.1),
+(1258,'Heterochromia;Large Breasts;Latex;Short Hair;Stockings','Kamelie',4.11),
+(1259,'Anal;Animal Boy;Blowjob;Condom;French Kissing;Incest;Males only;Otouto;Prostitution;Sex Toys;Shota;Yaoi','Shiogochi',2.88),
+(1260,'Anal;Handjob;Males only;Shota;Yaoi','Shiogochi',4.17),
+(1261,'Fingering;French Kissing;Hairy;Happy Sex;Kuudere;Large Breasts;Leg Lock;Lingerie;Maid;Nakadashi;Paizuri;Stockings;Virginity (Male)','Syoukaki',4.74),
+(1262,'Dark Skin;Femdom;Gyaru;Large Breasts;Straight Shota;Virginity (Male)','Haikawa Hemlen',4.41),
+(1263,'Bikini;Blowjob;Breast Sucking;Dark Skin;Femdom;Gyaru;Large Breasts;Nakadashi;Slut;Straight Shota;Swimsuit;Threesome;Virginity (Male);X-ray','Haikawa Hemlen',4.4),
+(1264,'BBW;Breast Sucking;Collar;Cow Girl;Huge Breasts;Lactation;Large Breasts;Paizuri;Plump;Stockings;Straight Shota','Misaoka',4.29),
+(1265,'Anal;Bikini;Blindfold;Blowjob;Bukkake;Gangbang;Group Sex;Hairy;Huge Breasts;Nakadashi;Short Hair;Slut;Squirting;Swimsuit;Witch','KANZUME',4.17),
+(1266,'BBW;Crossdressing;Huge Breasts;Idol;Large Breasts;Plump;Straight Shota','Misaoka',4.48),
+(1267,'Blowjob;Full Color;Group Sex;Idol;Loli;Rape;Shimapan;Spitroast;Twintails','YD',3.98),
+(1268,'Ahegao;Catgirl;Cosplay;Cunnilingus;Fangs;French Kissing;Happy Sex;Idol;Inverted Nipples;Large Breasts;Nakadashi;Short Hair;Smell;Squirting;Sweating;X-ray','Moketa',4.62),
+(1269,'Animal Girl;Femdom;Fox Girl;Huge Breasts;Impregnation;Large Breasts;Straight Shota','Diisuke',4.38),
+(1270,'Bondage;Collar;Human Cattle;Impregnation;Lactation;Large Breasts;Mind Break;Rape','Chouzetsu Bishoujo mine',3.5),
+(1271,'Big Ass;Group Sex;Large Breasts;Pantyhose;Stockings;Straight Shota','Asahina Hikage',3.75),
+(1272,'Anal;Crossdressing;Femdom;Maid;Nakadashi;Pegging;Sex Toys;Small Penis;Trap','Kujou Shirei',4.28),
+(1273,'Ahegao;Anal;Animal Girl;BBW;Big Ass;Bloomers;Comedy;Condom;Decensored;Happy Sex;Large Breasts;Pantyhose;Plump;Short Hair','Jun',4.58),
+(1274,'Blowjob;Cousin;Cunnilingus;Defloration;French Kissing;Happy Sex;Incest;Nakadashi','Mutsuki',4.31),
+(1275,'Blowjob;Cunnilingus;Leg Lock;Nakadashi;X-ray','Danchino',4.35),
+(1276,'Animal Girl;Fox Girl;Large Breasts;Leg Lock','Nanase Mizuho',4.5),
+(1277,'Gender Bender;Happy Sex;Stockings','Miyashita Miki',4.27),
+(1278,'Defloration;Nakadashi;Pettanko;Sex Toys','Mayonnaise.',3.63),
+(1279,'Blowjob;Defloration;Double Penetration;Freckles;Group Sex;Nakadashi;Rape','Tamaki Nozomu',3.53),
+(1280,'BBW;Big Areola;Big Ass;Hairy;Handjob;Happy Sex;Impregnation;Kimono / Yukata;Large Breasts;Monster Girl;Nakadashi;Oni;Sweating;X-ray','obmas',4.64),
+(1281,'Anilingus;French Kissing;Incest;Males only;Otouto;Shota;Yaoi','Shiogochi',3.8),
+(1282,'Blowjob;Group Sex;Large Breasts;Megane;Nakadashi;Paizuri;School Uniform;Shimapan;Slut;Uncensored;Virginity (Male)','Yoshida Inuhito',3.89),
+(1283,'Blowjob;Cousin;Femdom;Hairy;Happy Sex;Hotpants;Incest;Large Breasts;Straight Shota;Virginity (Male)','Kishizuka Kenji',4.21),
+(1284,'Blowjob;Cosplay;Emotionless Sex;Large Breasts;Nurse;Paizuri;Prostitution','7zu7',4.11),
+(1285,'Blowjob;Bukkake;Chikan;Defloration;Exhibitionism;French Kissing;Handjob;Happy Sex;Megane;Nakadashi;Reverse Rape;School Uniform;Sumata','Tougarashi Hideyu',4.39),
+(1286,'Anal;Blowjob;Collar;Condom;Double Penetration;Gangbang;Group Sex;Large Breasts;Loli;Nakadashi;Oppai Loli;Paizuri;Prostitution;Stockings;Teacher;Threesome;Twintails;X-ray','Shou-san Bouzu',3.91),
+(1287,'Collar;Demon | Incubus;Face Sitting;Femdom;Group Sex;Loli;Mind Break;Mind Control;Monster Girl;Oppai Loli;Rape;Snuff;Stockings;Straight Shota;Threesome;Vore','Akazawa RED',3.93),
+(1288,'Anilingus;Demon Girl | Succubus;Femdom;Group Sex;Large Breasts;Leg Lock;Mind Break;Monster Girl;Pegging;Stockings;Straight Shota;Threesome;Urethra Insertion;X-ray','Akazawa RED',4.11),
+(1289,'Anilingus;Blowjob;Collar;Demon Girl | Succubus;Femdom;Group Sex;Huge Breasts;Large Breasts;Licking;Pettanko;Reverse Rape;Smug;Snuff;Straight Shota;Tailjob;Tattoo;Threesome;Urethra Insertion;Vore','Akazawa RED',3.82),
+(1290,'Bikini;Cunnilingus;French Kissing;Happy Sex;Nakadashi;Squirting;Swimsuit;X-ray','Kazuma Muramasa',4.72),
+(1291,'Blowjob;French Kissing;Happy Sex;Idol;Large Breasts;Nakadashi;Stockings','Asami Asami',4.63),
+(1292,'Anal;Bikini;Crossdressing;Dark Skin;Gyaru;Males only;Shota;Small Penis;Swimsuit;Trap;Yaoi','Binto',4.4),
+(1293,'Anal;Anilingus;Bisexual;Crossdressing;Femdom;Large Breasts;Pegging;Prostate Massage;Strap-on;Urethra Insertion','Tokimachi Eisei',3.68),
+(1294,'Ahegao;Blackmail;Defloration;Face Sitting;Hairy;Nakadashi;Reverse Rape;School Uniform;Smell;Squirting;Stockings;X-ray','Kitani Sai',4.21),
+(1295,'Anal;Blowjob;Daughter;Futa on Male;Futanari;Huge Penis;Incest;Loli;Smegma','Tokimachi Eisei',3.03),
+(1296,'Blowjob;Breast Sucking;French Kissing;Happy Sex;Licking;Nakadashi','Tougarashi Hideyu',4.24),
+(1297,'Ahegao;BBM / Fat Man;Blindfold;Bondage;Collar;Futanari;Huge Penis;Insect;Male on Futa;Mask;Nakadashi;Shibari;Torture;Twintails;Urethra Insertion','Izumi Yuujiro',3.17),
+(1298,'Breast Sucking;Large Breasts;Maledom;Nakadashi;Rape;Selfcest;Stockings;Torn Clothing;X-ray','Isada',4.07),
+(1299,'Blowjob;Defloration;Happy Sex;Large Breasts;Nakadashi;Smell','Syoukaki',4.66),
+(1300,'Happy Sex;Large Breasts;Megane','Syoukaki',4.64),
+(1301,'Full Color;Handjob;Large Breasts;Megane;Pantyhose','Midoh Tsukasa',4.22),
+(1302,'Bestiality;Blowjob;Defloration;Fingering;French Kissing;Idol;Layer Cake;Masturbation;Nakadashi;Rape;Sumata;Twintails','Takane Nohana',3.08),
+(1303,'Anal;Cosplay;Crossdressing;Maid;Males only;Nurse;Shota;Stockings;Trap;Yaoi','Noi',4.08),
+(1304,'Comedy;Happy Sex;Large Breasts;Nakadashi;School Uniform','Syoukaki',4.55),
+(1305,'Breast Sucking;Childhood Friend;Cunnilingus;Defloration;French Kissing;Happy Sex;Nakadashi;X-ray','Hanafuda Sakurano',4.51),
+(1306,'Cheating;Fingering;French Kissing;Incest;Kimono / Yukata;Leg Lock;MILF;Mother;Nakadashi;Netori;Onsen;Sweating','',4.27),
+(1307,'Assjob;Body Writing;Large Breasts;Nakadashi;Paizuri;Spats','Yukitaka',3.68),
+(1308,'Animal Girl;Band-Aid / Pasties;Big Areola;Bikini;Blowjob;Femdom;Gloves;Huge Breasts;Impregnation;Inverted Nipples;Invisible;Large Breasts;Nakadashi;Paizuri;Phimosis;Pregnant;Prostitution;Smegma;Stockings;X-ray','Chirumakuro',4.53),
+(1309,'BBW;Big Areola;Femdom;Large Breasts;Lingerie;Masturbation;Paizuri;Spats;Stockings','Chirumakuro',4.62),
+(1310,'Blowjob;Breast Sucking;Happy Sex;Huge Breasts;Large Breasts;Nakadashi;Paizuri;Twintails;X-ray','Chirumakuro',4.63),
+(1311,'Big Areola;Femdom;Happy Sex;Inverted Nipples;Large Breasts;Nakadashi;Paizuri;Tsundere;Twintails;X-ray','Chirumakuro',4.62),
+(1312,'Anal;DILF;French Kissing;Handjob;Kimono / Yukata;Males only;Nakadashi;Netorare;Rape;Shota;Trap;Yaoi','Tsukuru',4.22),
+(1313,'Anal;BBM / Fat Man;Blowjob;Femdom;Happy Sex;Hat;Leg Lock;Loli;Nakadashi;Symbol Shaped Pupils;X-ray','Kaenuco',3.42),
+(1314,'Cheating;Dark Skin;Gyaru;Huge Breasts;Huge Penis;Large Breasts;Paizuri;Short Hair;Slut;Straight Shota;Virginity (Male);X-ray','Nanakagi Satoshi',4.54),
+(1315,'Ahegao;Cervical Penetration;Huge Penis;Large Breasts;Maid;Paizuri;Squirting;Stockings;Straight Shota;X-ray','Nanakagi Satoshi',4.51),
+(1316,'Cheating;Dark Skin;Gyaru;Huge Penis;Large Breasts;Nakadashi;Short Hair;Straight Shota','Nanakagi Satoshi',4.62),
+(1317,'Ahegao;Dark Skin;Huge Penis;Large Breasts;Mind Break;Stockings;Straight Shota','Nanakagi Satoshi',4.58),
+(1318,'Big Ass;Dark Skin;Gyaru;Happy Sex;Harem;Huge Breasts;Huge Penis;Large Breasts;Maid;Nakadashi;Short Hair;Slut;Squirting;Straight Shota','Nanakagi Satoshi',4.38),
+(1319,'Bondage;Dark Skin;Group Sex;Gyaru;Huge Breasts;Huge Penis;Large Breasts;Netori;Orgasm Denial;Straight Shota;Sweating;Threesome','Nanakagi Satoshi',4.44),
+(1320,'Ahegao;Blowjob;Drugs;Group Sex;Huge Penis;Loli;Multiple Penises;Nakadashi;Stomach Bulge;Symbol Shaped Pupils;Threesome','Maeshima Ryou',3.76),
+(1321,'Dark Skin;Elf;Happy Sex;Maid;Nakadashi;Stockings','Kasei',4.69),
+(1322,'Big Ass;Dark Skin;Defloration;DILF;Elf;Happy Sex;Large Breasts;Maid;Masturbation;Stockings;Tattoo','Miyamoto Liz',4.67),
+(1323,'BBW;Blowjob;Happy Sex;Idol;Nakadashi;Plump;Short Hair;Yandere','Kirin Kakeru;Kouri',4.33),
+(1324,'Ahegao;Anal;BDSM;Blindfold;Bondage;Double Penetration;Drugs;Gloves;Group Sex;Kunoichi;Maledom;Nakadashi;Pettanko;Stockings','Nanahara Fuyuki',3.92),
+(1325,'Daughter;Fingering;French Kissing;Happy Sex;Incest;Inseki;Loli;Masturbation;Randoseru;Squirting;Sweating;X-ray','Chipokan',4.39),
+(1326,'Bondage;Cosplay;Imouto;Incest;Masturbation;Nakadashi;Pantyhose;Rape;School Uniform;Sex Toys;Short Hair','Nukkoru',3.77),
+(1327,'Blowjob;Defloration;Happy Sex;Loli;Nakadashi;Stockings;Tutor','Kamita',4.38),
+(1328,'Blowjob;Cunnilingus;Daughter;Fingering;Incest;Inseki;Loli;Nakadashi;Pajamas','Ponsuke',4.29),
+(1329,'Anal;Bisexual;Dick Growth;Futa on Male;Futanari;Huge Penis;Loli;Muscle;Pegging;Reverse Rape;Stomach Bulge;Strap-on;Yaoi','Inukai',3.12),
+(1330,'Full Color;Gangbang;Group Sex;Happy Sex;Idol;Shimapan','Ajishio',4.05),
+(1331,'Anal;Birth;Egg Laying;Fairy;Hat;Impregnation;Loli;Nakadashi;Pantyhose;Pregnant;Rape;Stomach Bulge;Tentacles;X-ray','YASSY',3.85),
+(1332,'Bodysuit;Breast Sucking;Cunnilingus;Fingering;Footjob;Happy Sex;Large Breasts;Nakadashi;X-ray','Watanuki Ron',4.45),
+(1333,'BBM / Fat Man;Catgirl;Defloration;Gokkun;Loli;Magical Girl;Mind Control;Nakadashi;Stockings','santa',4.41),
+(1334,'BBM / Fat Man;Catgirl;Collar;Cosplay;Group Sex;Hypnosis;Loli;Magical Girl;Nakadashi;Rape;Shared Senses;Stockings;Symbol Shaped Pupils;Threesome','santa',4.24),
+(1335,'Blackmail;Breast Sucking;Bukkake;Crossdressing;Defloration;Femdom;Fingering;French Kissing;Hairy;Handjob;Happy Sex;Humiliation;Incest;Large Breasts;Licking;Maid;MILF;Mother;Nakadashi;Paizuri;School Uniform;Stockings;Threesome;Trap;Watersports','Ikuya Daikokudou',3.96),
+(1336,'BBW;Delusion;Demon Girl | Succubus;Femdom;Happy Sex;Huge Breasts;Nakadashi;Paizuri;Plump;Tall Girl','Kuroharuto',4.41),
+(1337,'Blowjob;Breast Sucking;Cunnilingus;Fingering;French Kissing;Happy Sex;Large Breasts;Nakadashi;X-ray','Tsukiwani',4.47),
+(1338,'Anilingus;Blindfold;Bondage;Defloration;Femdom;Happy Sex;Lingerie;Megane;Nakadashi;Stockings;Symbol Shaped Pupils;Virginity (Male);X-ray','Giuniu',4.53),
+(1339,'Condom;Dark Skin;Happy Sex;Leg Lock;Loli;Nakadashi;Oppai Loli;Slut;Straight Shota;Twintails;Virginity (Male)','Tamagoro',4.59),
+(1340,'Dark Skin;Group Sex;Loli;Nakadashi;School Swimsuit;Straight Shota;Swimsuit;Threesome;X-ray','Tamagoro',4.58),
+(1341,'Blowjob;Breast Sucking;Fingering;French Kissing;Happy Sex;Imouto;Incest;Large Breasts;Nakadashi','Akino Sora',4.66),
+(1342,'Anal;Chastity Belt;Crossdressing;Incest;Males only;Otouto;School Swimsuit;Shota;Stockings;Trap;Twintails;Yaoi','Shinagawa Mikuzu',4.38),
+(1343,'Blowjob;Bondage;Bukkake;Cunnilingus;Exhibitionism;Fingering;Group Sex;Humiliation;Mask;Nakadashi;Rape;Slave;Threesome;Yuri','Hirotake Awataka',3.29),
+(1344,'Blowjob;Condom;Defloration;Fingering;French Kissing;Group Sex;Huge Penis;Mind Break;Nakadashi;Netorare;School Uniform;Squirting;Straight Shota;Threesome;Virginity (Male);X-ray','Bon-3000',3.82),
+(1345,'Animal Girl;Catgirl;Furry;Megane;Nakadashi;School Swimsuit;Swimsuit','Tamanosuke',3.72),
+(1346,'Ahegao;Blowjob;Filming;Full Color;Large Breasts;Mind Break;Mind Control;Nakadashi;School Uniform;Stockings;Symbol Shaped Pupils','SAIGA dou',4.18),
+(1347,'Anal;Footjob;Large Breasts;Stockings;Tentacles;Uncensored','Electric_Dragon',3.67),
+(1348,'Breast Sucking;Cunnilingus;Defloration;French Kissing;Happy Sex;Large Breasts;Nakadashi;School Uniform;Virginity (Male);X-ray','Miyamoto Yuu',4.6),
+(1349,'Blowjob;Breast Sucking;Defloration;French Kissing;Ghost;Happy Sex;Large Breasts;Nakadashi;School Uniform','Ayakawa Riku',4.66),
+(1350,'Ahegao;BBW;Big Areola;Big Ass;Defloration;DILF;Elf;Fingering;French Kissing;Hairy;Huge Breasts;Large Breasts;MILF;Nakadashi;Sweating','Yamamoto Zenzen',4.35),
+(1351,'Femdom;Handjob;Huge Penis;Large Breasts;Latex;Straight Shota','Shindou Hajime',3.5),
+(1352,'Ahegao;Anal;Blowjob;Dark Skin;Full Color;Futanari;Happy Sex;Large Breasts;Male on Futa;Monster;Muscle;Nakadashi;Orc;Orgasm Denial;Rape;Royalty;Tomboy','Mikoyan',3.91),
+(1353,'Blowjob;Childhood Friend;Defloration;Ghost;Happy Sex;Miko;Mind Control;Nakadashi;Possession','Shinogi A-Suke',4.44),
+(1354,'Christmas;French Kissing;Happy Sex;Large Breasts;Nakadashi;Squirting;Stockings;X-ray','Tougarashi Hideyu',4.63),
+(1355,'Ahegao;Animal Boy;Animal Girl;Furry;Long Tongue;Nakadashi;Prostitution;Symbol Shaped Pupils;X-ray','Tamanosuke',3.94),
+(1356,'Bloomers;Blowjob;Bride;Cheating;Condom;Full Color;Handjob;Incest;Large Breasts;Leg Lock;Masturbation;MILF;Mother;Nakadashi;Paizuri;Pantyhose;Stockings;X-ray','Haruharutei',4.55),
+(1357,'Animal Girl;Armpit;Cow Girl;Femdom;Fox Girl;Group Sex;Large Breasts;Stockings;Threesome','Hakui Ami | Ichinose Land',4.31),
+(1358,'Big Ass;Blowjob;Bunnygirl;Crotchless / Breastless;Large Breasts;Paizuri;X-ray','Yoshimura Tatsumaki',4.16),
+(1359,'Breast Sucking;Condom;French Kissing;Handjob;Happy Sex;Kuudere;Large Breasts;Muscle;Sweating','Herio',4.79),
+(1360,'Anal;Bisexual;Blowjob;Crossdressing;Kimono / Yukata;Shota;Trap;Yaoi','Gujira',4.44),
+(1361,'Ahegao;Anal;Big Ass;Deepthroat;Double Penetration;Gokkun;Group Sex;Horse;Huge Penis;Large Breasts;Monster;Nakadashi;Orc;Paizuri;Rape','Monaka',3.23),
+(1362,'Anal;BBM / Fat Man;Blowjob;Defloration;Drugs;Large Breasts;Nakadashi;Paizuri;Sleeping','Monaka',3.48),
+(1363,'Blowjob;Deepthroat;Defloration;Happy Sex;Impregnation;Large Breasts;Nakadashi','Magatama',4.68),
+(1364,'Anal;Big Ass;Blowjob;Gloves;Huge Penis;Large Breasts;Nakadashi;Paizuri;Sixty-Nine;Spanking;Straight Shota','Nori',4.33),
+(1365,'Age Regression;Blowjob;Gender Bender;Group Sex;Harem;Large Breasts;Onsen;Paizuri;X-ray','Maho',4.04),
+(1366,'Ahegao;Anal;Armpit;Bikini;Blindfold;Blowjob;Group Sex;Large Breasts;Prostitution;Sex Toys;Swimsuit','Matou',2.61),
+(1367,'Blowjob;Defloration;Dirty Old Man;Drugs;Gangbang;Group Sex;Kimono / Yukata;Loli;Mouth Gag;Pettanko;Rape;Spitroast;Toddler;Watersports;X-ray','Maka Fushigi',4.07),
+(1368,'Blowjob;Fingering;Happy Sex;Imouto;Incest;Loli;Pettanko;Straight Shota;Twintails;X-ray','Maka Fushigi',4.71),
+(1369,'Blowjob;Cunnilingus;Decensored;Femdom;Incest;Licking;Loli;Masturbation;Pettanko;X-ray','Maka Fushigi',4.58),
+(1370,'Anal;Blowjob;Bukkake;Childhood Friend;Decensored;Dirty Old Man;Double Penetration;Drugs;Fingering;Gangbang;Group Sex;Loli;Netorare;Pettanko;Prostitution;Rape;School Uniform;Spitroast;Stockings;Straight Shota','Maka Fushigi',4.05),
+(1371,'Bathroom Sex;Blowjob;Cheating;Cunnilingus;Femdom;Fingering;Happy Sex;Loli;Pettanko;School Uniform;Sixty-Nine;Teacher;Twintails;X-ray','Maka Fushigi',4.25),
+(1372,'Anal;Blowjob;Cunnilingus;Double Penetration;Fingering;Imouto;Incest;Loli;Sex Toys;Sixty-Nine','Maka Fushigi',4.43),
+(1373,'Blowjob;Exhibitionism;Femdom;Guro;Hairy;Loli;Oppai Loli;Pettanko;Prostitution;X-ray','Maka Fushigi',3.91),
+(1374,'Blowjob;Femdom;Hairy;Loli;Pettanko;Rape;Stockings','Maka Fushigi',4.64),
+(1375,'Bathroom Sex;Blowjob;Bondage;Femdom;Group Sex;Loli;Mouth Gag;Pettanko;Rape;Spitroast;Twintails','Maka Fushigi',4.76),
+(1376,'Anal;Blowjob;Double Penetration;Femdom;Group Sex;Loli;Pettanko;School Uniform;Spitroast;Squirting;Straight Shota','Maka Fushigi',4.4),
+(1377,'Blowjob;Cheating;Daughter;Femdom;Group Sex;Incest;Loli;Prostitution;Short Hair;Twintails','Maka Fushigi',4.54),
+(1378,'Anal;Blowjob;Cheating;Condom;Hairy;Happy Sex;Loli;Pettanko;Twintails','Maka Fushigi',4.8),
+(1379,'Ahegao;Anal;Bathroom Sex;Blowjob;Femdom;Fingering;Handjob;Happy Sex;Imouto;Incest;Loli;Prostitution','Maka Fushigi',4.28),
+(1380,'Anal;Blackmail;Defloration;Double Penetration;Group Sex;Imouto;Incest;Loli;Masturbation;Megane;Nakadashi;Rape;School Uniform;Short Hair;Strap-on;Twintails','Maka Fushigi',4.33),
+(1381,'Anal;Bisexual;Double Penetration;Group Sex;Imouto;Incest;Loli;Megane;Sex Toys','Maka Fushigi',3.41),
+(1382,'Anal;Blackmail;Loli;Megane;School Uniform','Maka Fushigi',3.16),
+(1383,'Comedy;Happy Sex;Large Breasts;Nakadashi;School Uniform;Stockings;Symbol Shaped Pupils;X-ray','Makinosaka Shin''ichi',4.73),
+(1384,'Ahegao;Anal;Blowjob;Collar;Exhibitionism;French Kissing;Males only;Nakadashi;Netorare;Shota;Yaoi','Hontoku',4.29),
+(1385,'Ahegao;Big Ass;Blowjob;Deepthroat;Exhibitionism;Full Color;Gangbang;Group Sex;Incest;Large Breasts;Mask;MILF;Mother;Short Hair;Watersports;X-ray','',3.28),
+(1386,'Big Ass;Blowjob;Cervical Penetration;Cunnilingus;Deepthroat;Exhibitionism;Face Sitting;Full Color;Incest;Large Breasts;MILF;Mother;Nakadashi;Short Hair;Sixty-Nine;Squirting;Stomach Bulge;X-ray','',3.35),
+(1387,'Ahegao;Big Ass;Breast Sucking;Cunnilingus;French Kissing;Full Color;Huge Breasts;Huge Penis;Incest;Large Breasts;Mask;MILF;Mother;Nakadashi','',3.57),
+(1388,'Ahegao;Big Ass;Blowjob;Breast Sucking;Cervical Penetration;French Kissing;Full Color;Huge Penis;Incest;Large Breasts;Mask;Masturbation;MILF;Mother;Nakadashi;Squirting;X-ray','',3.19),
+(1389,'Ahegao;Big Ass;Blowjob;Cervical Penetration;Full Color;Incest;Large Breasts;Mask;MILF;Mother;Nakadashi;Short Hair;Watersports;X-ray','',3.95),
+(1390,'Anal;Bestiality;Birth;Dark Skin;Demon | Incubus;Elf;Futa on Male;Futanari;Futanari on Futanari;Gokkun;Group Sex;Huge Penis;Lactation;Large Breasts;Loli;Monster Girl;Muscle;Orc;Pregnant;Prostitution;Shota;Stomach Bulge;Tentacles;Toddler;Trap;Watersports;X-ray','Abubu',4.05),
+(1391,'Blowjob;Femdom;Footjob;Happy Sex;Impregnation;Nakadashi;X-ray','Aiue Oka',4.37),
+(1392,'Ahegao;Anal;Bisexual;Catgirl;Cheating;Collar;Gloves;Group Sex;Maledom;Orgasm Denial;Piercings;Sex Toys;Short Hair;Smell;Stockings;Symbol Shaped Pupils;Threesome','Fukuyama Naoto',4.36),
+(1393,'Ahegao;Anal;Collar;Comedy;Deepthroat;Double Penetration;Fingering;Group Sex;Happy Sex;Imouto;Incest;Large Breasts;Maledom;Muscle;Nakadashi;Sex Toys;Sumata;Threesome;Uncensored;X-ray','Fukuyama Naoto',4.49),
+(1394,'Blackmail;Blowjob;Defloration;Group Sex;Large Breasts;Nakadashi;Stockings;Uncensored','Kyockcho',3.62),
+(1395,'Ahegao;Anal;BBM / Fat Man;Big Ass;Hypnosis;Large Breasts;Mind Break;Nakadashi;School Uniform;Tanlines;Uncensored;Watersports','Aiue Oka',4.46),
+(1396,'Anilingus;Femdom;Group Sex;Hairy;Humiliation;Hypnosis;Large Breasts;Megane;Nakadashi;Tanlines;Tsundere;Uncensored;X-ray','Aiue Oka',4.48),
+(1397,'Bisexual;Blowjob;Demon Girl | Succubus;Harem;Large Breasts;Megane;Monster Girl;Nakadashi;Paizuri;School Uniform;Uncensored;X-ray','Sasamori Tomoe',4.52),
+(1398,'Blowjob;Full Color;Males only;Onahole;Shota;Tentacles;Trap;Yaoi','Numa',3.5),
+(1399,'Ahegao;Big Ass;Demon Girl | Succubus;Large Breasts;Monster Girl;School Uniform;X-ray','Maho',4.29),
+(1400,'Blowjob;Gokkun;Loli;Monster Girl;Plant Girl;Toddler;Twintails','Maka Fushigi',3.69),
+(1401,'Defloration;Happy Sex;Large Breasts;Leg Lock;Nakadashi;Sleeping;Sweating;Tall Girl','Makinosaka Shin''ichi',4.72),
+(1402,'Cervical Penetration;Happy Sex;Huge Penis;Large Breasts;Military Uniform;Paizuri;Stockings;Straight Shota;Symbol Shaped Pupils;Tall Girl','Makinosaka Shin''ichi',4.65),
+(1403,'Anal;Bikini;Butler;Christmas;Defloration;Dirty Old Man;Mind Break;Nakadashi;Spitroast','Nora Shinji',2.8),
+(1404,'Anal;Cheating;Large Breasts;Sex Toys','Emua',4.03),
+(1405,'Anal;Large Breasts;Masturbation;Nakadashi;Sex Toys;Threesome;Yuri','Emua',4.03),
+(1406,'Ahegao;BBM / Fat Man;BDSM;Collar;DILF;Double Penetration;Exhibitionism;Human Toilet;Large Breasts;Masturbation;Mind Break;Nakadashi;Netorare;School Uniform;Sex Toys;Squirting;Symbol Shaped Pupils;Teacher;Watersports;X-ray','Mucha',3.59),
+(1407,'Anal;Band-Aid / Pasties;Blowjob;Breast Sucking;Bukkake;Cunnilingus;Double Penetration;Gangbang;Group Sex;Large Breasts;Loli;Nakadashi;Oppai Loli;Paizuri;Prostitution;Teacher;Threesome;X-ray','Shou-san Bouzu',3.7),
+(1408,'Anal;Blowjob;Cousin;Crossdressing;Defloration;Elder Sister;Femdom;Futa on Male;Futanari;Incest;Large Breasts;Megane;School Uniform;Shota;Stockings;Trap','Coin RAND',3.64),
+(1409,'Anal;Crossdressing;Futa on Male;Futanari;Nakadashi;Shota;Stockings;Trap','Mikami Hokuto',4.28),
+(1410,'Anal;Big Ass;Crossdressing;Femdom;Footjob;Group Sex;Large Breasts;Megane;Stockings;Straight Shota;Threesome;Trap;Virginity (Male)','Okuni Yoshinobu',3.68),
+(1411,'Blowjob;Cheating;Drunk;French Kissing;Happy Sex;Large Breasts;Nakadashi;Paizuri;Stockings;Virginity (Male);Waitress;X-ray','Kasumi',4.67),
+(1412,'Drunk;Fingering;French Kissing;Hairy;Happy Sex;Large Breasts;Nakadashi;Paizuri;Slut;Virginity (Male);X-ray','Tomohiro Kai',4.8),
+(1413,'Anal;Chinese Dress;Crossdressing;Elf;Males only;Shota;Trap;Yaoi','Nagi Ichi',4.66),
+(1414,'BBM / Fat Man;Bikini;Chikan;Drunk;Fingering;Hairy;Leg Lock;Loli;Nakadashi;Swimsuit;X-ray','Kikunosukemaru',3.87),
+(1415,'Childhood Friend;Defloration;Happy Sex;Large Breasts;Sleeping;Sweating;Virginity (Male)','Uekan',4.81),
+(1416,'Bondage;Cunnilingus;Full Color;MILF;Shibari;Stockings;Straight Shota;Virginity (Male)','',3.38),
+(1417,'Ahegao;Blowjob;Dirty Old Man;Double Penetration;Group Sex;Large Breasts;Mind Break;Nakadashi;Rape;School Uniform;Uncensored;X-ray','Iwasaki Yuuki',3.89),
+(1418,'Blowjob;Bukkake;Gokkun;Happy Sex;Large Breasts;Nakadashi;Paizuri;X-ray','Danbo',4.55),
+(1419,'Animal Girl;Catgirl;Decensored;Full Color;Furry','Tamanosuke',4.19),
+(1420,'Ahegao;Anal;BBM / Fat Man;BDSM;Bikini;Blackmail;Blindfold;Bloomers;Blowjob;Bondage;Cheating;Collar;Dark Skin;Defloration;Double Penetration;Group Sex;Huge Penis;Imouto;Incest;Inseki;Large Breasts;Masturbation;Megane;Nakadashi;Nurse;Pantyhose;Randoseru;Rape;School Swimsuit;School Uniform;Sex Toys;Slave;Stockings;Swimsuit;Tankoubon;Teacher;Threesome;Watersports','Miyano Kintarou',3.7),
+(1421,'Ahegao;BBM / Fat Man;Bikini;Blowjob;Bondage;Corruption;Crossdressing;Cunnilingus;Dark Skin;Defloration;Demon | Incubus;Dick Growth;Face Sitting;Femdom;Fingering;French Kissing;Huge Penis;Impregnation;Large Breasts;Lingerie;Magical Girl;Mind Control;Monster;Monster Girl;Nakadashi;Netorare;Paizuri;Prostitution;Rape;Reverse Rape;School Uniform;Stockings;Symbol Shaped Pupils;Tattoo;Tentacles;Threesome;Transformation;Trap;Virginity (Male)','Satou Kuuki',3.5),
+(1422,'Big Areola;Blowjob;Bukkake;Condom;Emotionless Sex;Filming;Idol;Large Breasts','Pija',3.59),
+(1423,'Defloration;Elf;Happy Sex;Loli;Nakadashi;Tsundere','Noise',4.62),
+(1424,'Armpit;Bukkake;Drugs;Elf;Hairjob;Happy Sex;Hotpants;Loli;Nakadashi;Stockings;Sweating;Tsundere','Noise',4.67),
+(1425,'Cheating;Drunk;Fingering;Happy Sex;Large Breasts;Nakadashi;Waitress;X-ray','Souji Hougu',4.56),
+(1426,'Blowjob;Cheating;Daughter;Gokkun;Group Sex;Incest;Large Breasts;Mother;Oyakodon;Threesome','Tachibana Omina',4.65),
+(1427,'Blowjob;Group Sex;Idol;Nakadashi;Rape;School Uniform','Yuushi Tessen | Yuzu Machi',2.76),
+(1428,'Deepthroat;Defloration;Double Penetration;Drugs;Group Sex;Idol;Loli;Multiple Insertion;Rape;School Uniform','Yuushi Tessen | Yuzu Machi',3.35),
+(1429,'BBM / Fat Man;Blowjob;Cervical Penetration;Collar;Drugs;Huge Penis;Impregnation;Loli;Mind Control;Nakadashi;Swimsuit;Symbol Shaped Pupils','Yuushi Tessen | Yuzu Machi',3.73),
+(1430,'Ahegao;Bukkake;Deepthroat;Defloration;Drugs;Group Sex;Impregnation;Loli;Rape;School Uniform;Sleeping','Yuushi Tessen | Yuzu Machi',2.26),
+(1431,'Blowjob;Christmas;Deepthroat;Nakadashi;Pettanko;Stockings;X-ray','Kikunosukemaru',4.31),
+(1432,'Ahegao;Bikini;Dark Skin;Demon | Incubus;Fingering;Huge Penis;Large Breasts;Licking;Massage;Mind Break;Nakadashi;Rape;Squirting;Stomach Bulge;Sweating;Swimsuit;X-ray','Uruujima Call',3.32),
+(1433,'Anal;Dark Skin;Futa on Male;Futanari;Gyaru;Reverse Rape','Aimaitei Umami',4.22),
+(1434,'BBW;Big Ass;Defloration;Happy Sex;Large Breasts;School Uniform','Uekan',4.78),
+(1435,'Armpit;Egg Laying;Group Sex;Large Breasts;Mind Break;Rape;Stockings;Tentacles','Izumi;Reizei',3.16),
+(1436,'BBM / Fat Man;Defloration;Filming;Gender Bender;Loli','Himeno Mikan',3.56),
+(1437,'Blowjob;Defloration;French Kissing;Happy Sex;Large Breasts;Masturbation;Nakadashi;School Uniform;X-ray','Uekan',4.78),
+(1438,'Bloomers;Cunnilingus;Decensored;Defloration;Fingering;French Kissing;Happy Sex;Hat;Large Breasts;Licking;Spats;Virginity (Male);X-ray','Taropun',4.54),
+(1439,'Ahegao;Exhibitionism;Fingering;Happy Sex;Huge Penis;Loli;Nakadashi;Slut;Stockings;Stomach Bulge;X-ray','Nanjou Asuka',3.65),
+(1440,'Aunt;Blowjob;Breast Sucking;Bukkake;Cheating;Cunnilingus;Fingering;Full Color;Hairy;Happy Sex;Incest;Large Breasts;Lingerie;Masturbation;MILF;Nakadashi;Smell;Virginity (Male);X-ray','Paja',3.76),
+(1441,'Blowjob;Breast Sucking;Cunnilingus;Dark Skin;Defloration;Fangs;Happy Sex;Loli;Megane;Short Hair;Sixty-Nine;Straight Shota;Tomboy;Virginity (Male)','Momonosuke',4.65),
+(1442,'Aunt;Demon Girl | Succubus;Group Sex;Hotpants;Huge Penis;Large Breasts;Masturbation;MILF;Stockings;Straight Shota;Transformation','Royal Koyanagi',4.38),
+(1443,'CBT;Femdom;Group Sex;Handjob;Large Breasts;Latex;Layer Cake;Megane;MILF;Orgasm Denial;Oyakodon;Spanking;Stockings;Straight Shota;Threesome','Shindou Hajime',3.75),
+(1444,'Big Ass;Blackmail;Blowjob;Cheating;Group Sex;Hairy;Large Breasts;MILF;Nakadashi;School Swimsuit;Straight Shota;Swimsuit;Tanlines;Watersports','Takatsu',3.78),
+(1445,'Ahegao;Anal;Blowjob;Bondage;Double Penetration;Gangbang;Group Sex;Hairy;Large Breasts;Lingerie;MILF;Nun;Pantyhose;Sex Toys;Stockings;Straight Shota','Momofuki Rio',4.21),
+(1446,'Ahegao;Anal;Crossdressing;Males only;Shota;Spats;Trap;Yaoi','Nanamatsu Kenji',4.57),
+(1447,'Anal;Blackmail;Crossdressing;Gokkun;Males only;Mind Break;Rape;Shota;Stockings;Trap;Yaoi','Mine Mura',3.21),
+(1448,'Blowjob;Cousin;Defloration;Group Sex;Imouto;Incest;Loli;Nakadashi;Straight Shota;Swinging / Netorase;Tanlines;Threesome;Virginity (Male)','Tsubaki Jushiro',4.5),
+(1449,'Anal;Happy Sex;Large Breasts;Nakadashi;Naked Apron;Prostitution;Sweating','tokyo',4.24),
+(1450,'Dark Skin;Happy Sex;Large Breasts','Momonosuke',4.62),
+(1451,'Ahegao;Anal;BDSM;Chastity Belt;Femdom;Footjob;Happy Sex;Latex;Orgasm Denial;Pegging;Spanking;Spreading;Straight Shota;Strap-on','Dibi',3.88),
+(1452,'Ahegao;Blowjob;Cheating;Huge Penis;Impregnation;Loli;Long Tongue;Nakadashi;Stomach Bulge;Symbol Shaped Pupils;Twintails;Yandere','atahuta',4.16),
+(1453,'BBM / Fat Man;Blowjob;Deepthroat;Huge Penis;Impregnation;Loli;Nakadashi;Short Hair;Swimsuit;Symbol Shaped Pupils;Tutor','Yuushi Tessen | Yuzu Machi',4.49),
+(1454,'Ahegao;Anal;Animal Boy;Bisexual;Blowjob;Crossdressing;Deepthroat;Full Color;Furry;Group Sex;Huge Penis;Large Breasts;Monster;Muscle;Paizuri;Stomach Bulge;Threesome;Transformation;Trap;Western;Yaoi','Powfoo',4.41),
+(1455,'Anal;Animal Boy;Full Color;Furry;Males only;Western;Yaoi','Powfoo',4.69),
+(1456,'Ahegao;BDSM;Bodysuit;Bondage;Collar;Cow Girl;Double Penetration;Human Cattle;Lactation;Large Breasts;Nakadashi;Sex Toys','Shinoda Kazuhiro',4.21),
+(1457,'Anal;BDSM;Bondage;Crossdressing;Incest;Maledom;Males only;Otouto;Shota;Trap;Twins;Yaoi','Urakuso',4.5),
+(1459,'Blowjob;Bondage;Femdom;Paizuri;Reverse Rape;School Uniform;Tomboy','Matsukasa',4.31),
+(1460,'Blowjob;Defloration;Happy Sex;Nakadashi;Pettanko','Kobayashi Oukei',4.65),
+(1461,'Ahegao;Blowjob;Body Modification;Bondage;Brain Fuck;Breast Expansion;Bunnygirl;Demon | Incubus;Double Penetration;Group Sex;Large Breasts;Leotard;Mind Break;Mind Control;Monster;Nakadashi;Orgasm Denial;Rape;Tattoo;Tentacles;Vomit','Otochichi',3.69),
+(1462,'Anal;Males only;Rape;Shota;Teacher;Watersports;Yaoi','Sugayama',4.33),
+(1463,'Big Ass;Blowjob;Condom;Drunk;French Kissing;Group Sex;Hairy;Large Breasts;Rape;Reverse Harem;Stockings;Threesome','Kichirock',3.17),
+(1464,'Cheating;Childhood Friend;Femdom;Footjob;Hairy;Huge Penis;Large Breasts;Muscle;Prostitution;Stomach Bulge;Swimsuit;Transparent Clothing;Watersports;X-ray','John K. Pe-ta',3.29),
+(1465,'Ahegao;Anal;Anilingus;Cervical Penetration;Cheating;Cunnilingus;Femdom;Fisting;Footjob;Hairy;Hairy Armpits;Imouto;Impregnation;Incest;Megane;MILF;Muscle;Prolapse;Sex Toys;Small Penis;Stomach Bulge;Tomboy;Vomit;Watersports;X-ray;Yuri','John K. Pe-ta',3.65),
+(1466,'Ahegao;Anal;Bondage;Cervical Penetration;Double Penetration;Hairy;Hairy Armpits;Huge Penis;Impregnation;Mind Control;Muscle;Prolapse;Scat;School Uniform;Smegma;Stomach Bulge;Swimsuit;Teacher;Time Stop;Tomboy;Uncensored;Vomit;Watersports;X-ray','John K. Pe-ta',3.54),
+(1467,'Ahegao;All the Way through;Bondage;Cervical Penetration;Comedy;Defloration;Nipple Penetration;Scat;Stomach Bulge;Tentacles;Tomboy;X-ray','John K. Pe-ta',3.4),
+(1468,'Ahegao;Anal;Bathroom Sex;Big Areola;Big Ass;Blowjob;Bondage;Bukkake;Decensored;Deepthroat;Elder Sister;Enema;Exhibitionism;Femdom;Fisting;Gangbang;Group Sex;Huge Penis;Incest;Inverted Nipples;Lactation;Large Breasts;Maledom;Megane;Rape;Reverse Rape;School Uniform;Stomach Bulge;Swimsuit;Tankoubon;Teacher;Tentacles;Watersports;X-ray','John K. Pe-ta',3.86),
+(1469,'Ahegao;Anal;Big Areola;Big Ass;Blowjob;Bondage;Cervical Penetration;Cunnilingus;Dark Skin;Decensored;Deepthroat;Defloration;Dirty Old Man;Double Penetration;Exhibitionism;Femdom;Fisting;Gangbang;Group Sex;Harem;Huge Breasts;Huge Penis;Human Toilet;Imouto;Incest;Inverted Nipples;Lactation;Large Breasts;Maid;Maledom;Megane;MILF;Mouth Gag;Multiple Insertion;Nakadashi;Nipple Penetration;Prolapse;Prostitution;Rape;Shibari;Short Hair;Squirting;Stockings;Stomach Bulge;Tankoubon;Teacher;Tomboy;Twintails;Vomit;Waitress;Watersports;X-ray','John K. Pe-ta',3.96),
+(1470,'Ahegao;Anal;BDSM;Big Ass;Blackmail;Blowjob;Bondage;Cervical Penetration;Cheating;Childhood Friend;Comedy;Cunnilingus;Deepthroat;Drunk;Fangs;Femdom;Fingering;Fisting;Gloves;Gothic;Group Sex;Hairy;Hairy Armpits;Happy Sex;Harem;Hotpants;Huge Breasts;Inverted Nipples;Lactation;Large Breasts;Legal Loli;Lingerie;Loli;Lowleg;Maledom;Megane;MILF;Nipple Penetration;Office Lady;Oppai Loli;Pantyhose;Phimosis;Prolapse;Shimapan;Short Hair;Smegma;Squirting;Stomach Bulge;Story Arc;Symbol Shaped Pupils;Tomboy;Torture;Vomit;Watersports;X-ray','John K. Pe-ta',4.45),
+(1471,'Blowjob;Cervical Penetration;Comedy;Deepthroat;Elder Sister;Filming;Incest;Large Breasts;Nakadashi;Prostitution;Short Hair;Squirting;X-ray','John K. Pe-ta',4.12),
+(1472,'Ahegao;Anal;Big Ass;Bikini;Huge Penis;Impregnation;Large Breasts;Mind Break;Nakadashi;Rape;Squirting;Stomach Bulge;Swimsuit;Vomit;X-ray','John K. Pe-ta',3.67),
+(1473,'Ahegao;Anal;Blackmail;Blowjob;Cunnilingus;Deepthroat;Fingering;Fisting;Hairy;Impregnation;Large Breasts;Licking;Masturbation;Nakadashi;Squirting;Stomach Bulge;Teacher;Vomit;X-ray','John K. Pe-ta',4.33),
+(1474,'Blowjob;Decensored;Huge Penis;Muscle;Pettanko;Smegma;Stomach Bulge;Vomit;X-ray','John K. Pe-ta',4.09),
+(1475,'Anal;Anilingus;Blowjob;Bondage;Cheating;Comedy;Elder Sister;Femdom;Group Sex;Hairy;Incest;Reverse Rape;Sleeping;Smegma;Stomach Bulge;Straight Shota;Watersports;X-ray','John K. Pe-ta',4.14),
+(1476,'Anal;Blowjob;Bukkake;Deepthroat;Double Penetration;Fisting;Group Sex;Rape;Squirting;Stomach Bulge;Swimsuit;Tan;Tanlines;X-ray','John K. Pe-ta',4.07),
+(1477,'Anal;Anilingus;Big Ass;Blowjob;Deepthroat;Double Penetration;Drunk;Elder Sister;Femdom;Fisting;Foot Fetish;Gangbang;Group Sex;Hairy;Huge Penis;Impregnation;Incest;Inverted Nipples;Maledom;Megane;Mind Break;Nakadashi;Nipple Penetration;Piercings;Scat;School Uniform;Sex Toys;Squirting;Stomach Bulge;Swimsuit;Tankoubon;Vomit;X-ray','John K. Pe-ta',4.38),
+(1478,'Ahegao;Anal;Anilingus;Big Areola;Big Ass;Blackmail;Blowjob;Bondage;Cheating;Decensored;Deepthroat;Double Penetration;Elder Sister;Femdom;Fisting;Huge Penis;Impregnation;Incest;Lactation;Large Breasts;Maledom;Megane;Nakadashi;Paizuri;Rape;School Uniform;Sex Toys;Stomach Bulge;Tankoubon;Tentacles;Torture;Watersports;X-ray','John K. Pe-ta',4.17),
+(1479,'Ahegao;Decensored;Defloration;Hairy;Happy Sex;Impregnation;Large Breasts;Nakadashi;Squirting;Symbol Shaped Pupils;Watersports;X-ray','John K. Pe-ta',4.4),
+(1480,'Huge Penis;Nakadashi;Pettanko;Squirting;Stomach Bulge;Vomit;X-ray','John K. Pe-ta',3.53),
+(1481,'Anal;Anilingus;Bathroom Sex;Big Ass;Blowjob;Deepthroat;Double Penetration;Femdom;Fisting;Gangbang;Group Sex;Hairy;Huge Penis;Impregnation;Incest;Inverted Nipples;Lactation;Large Breasts;Maledom;Megane;MILF;Mother;Nakadashi;Nipple Penetration;Pettanko;Pregnant;Rape;Scat;School Uniform;Sixty-Nine;Spitroast;Stomach Bulge;Tankoubon;Teacher;Tentacles;Torture;Vomit;Watersports;X-ray','John K. Pe-ta',4.04),
+(1482,'Ahegao;Anal;Big Areola;Big Ass;Bondage;Decensored;Elder Sister;Femdom;Group Sex;Happy Sex;Impregnation;Incest;Lactation;Large Breasts;Maledom;Megane;Mind Break;Mouth Gag;Nakadashi;Paizuri;School Uniform;Stockings;Stomach Bulge;Swimsuit;Tankoubon;Tentacles;Twintails;Watersports;X-ray','John K. Pe-ta',4.32),
+(1483,'Ahegao;Anal;Big Areola;Big Ass;Blowjob;Bondage;Cervical Penetration;Deepthroat;Defloration;Double Penetration;Drunk;Exhibitionism;Femdom;Fisting;Group Sex;Hairy;Hairy Armpits;Huge Penis;Imouto;Incest;Inverted Nipples;Large Breasts;Maledom;Mouth Gag;Nipple Penetration;Onsen;Pettanko;Pregnant;Scat;Short Hair;Stomach Bulge;Tankoubon;Teacher;Tomboy;Tsundere;Vomit;Watersports;X-ray','John K. Pe-ta',4.38),
+(1484,'Ahegao;Anal;Big Areola;Big Ass;Blowjob;Bondage;Dark Skin;Decensored;Deepthroat;Dirty Old Man;Face Sitting;Femdom;Fisting;Freckles;Huge Penis;Impregnation;Incest;Lactation;Large Breasts;Maledom;Megane;Mouth Gag;Nakadashi;Nipple Penetration;Paizuri;Rape;Reverse Rape;Scat;School Swimsuit;Squirting;Stockings;Stomach Bulge;Swimsuit;Tankoubon;Teacher;Tentacles;Vomit;X-ray','John K. Pe-ta',4.3),
+(1485,'Ahegao;Anal;Anilingus;Big Ass;Blowjob;Bondage;Cervical Penetration;Comedy;Cousin;Cunnilingus;Decensored;Deepthroat;Defloration;Femdom;Fisting;Group Sex;Hairy;Huge Penis;Incest;Inverted Nipples;Lactation;Large Breasts;Loli;Lowleg;Maid;Maledom;Megane;Mouth Gag;Nakadashi;Nipple Penetration;Nurse;Oppai Loli;Rape;School Uniform;Sex Toys;Sleeping;Spitroast;Squirting;Stomach Bulge;Tankoubon;Twintails;Vomit;Waitress;Watersports;X-ray','John K. Pe-ta',4.14),
+(1486,'Ahegao;Anal;Big Areola;Big Ass;Blowjob;Bondage;Cheating;Cunnilingus;Decensored;Deepthroat;Femdom;Fingering;Fisting;Gangbang;Group Sex;Hairy;Hairy Armpits;Huge Penis;Impregnation;Inverted Nipples;Lactation;Large Breasts;Maledom;Megane;Mind Break;Mouth Gag;Muscle;Nakadashi;Nipple Penetration;Pregnant;Prolapse;Rape;Scat;School Uniform;Sex Toys;Sixty-Nine;Squirting;Stomach Bulge;Tankoubon;Vomit;Watersports;X-ray;Yuri','John K. Pe-ta',4.04),
+(1487,'Blowjob;Bondage;Filming;Inverted Nipples;Lactation;Large Breasts;Megane;Mouth Gag;Nose Hook;Stockings;Vomit;X-ray','John K. Pe-ta',3.6),
+(1488,'Anal;Incest;Inseki;Loli;Nakadashi;Niece;Sex Toys;Stockings;Twintails;Virginity (Male)','Mamezou',4.38),
+(1489,'Blowjob;Cunnilingus;Defloration;DILF;Hairy;Impregnation;Loli;Nakadashi;Torn Clothing','Koji',4.15),
+(1490,'Anal;Animal Boy;Blowjob;Full Color;Furry;Group Sex;Western;Yaoi','Powfoo',4.36),
+(1491,'Blowjob;Condom;Cunnilingus;Happy Sex;School Uniform','Key',4.61),
+(1492,'Elder Sister;Femdom;Incest;Large Breasts;Megane;Nakadashi;Phimosis;Smegma;Spats;Straight Shota;Virginity (Male)','Takatsu',4.39),
+(1493,'Big Ass;Blowjob;Cheating;Deepthroat;French Kissing;Large Breasts;Muscle;Nakadashi;Paizuri;Prostitution;School Uniform;Slut;Stockings;X-ray','Shinozuka Yuuji',4.65),
+(1494,'Bondage;Femdom;Nakadashi;School Uniform;Stockings;Sumata;Uncensored;X-ray;Yandere','Nakano Sora',4.3),
+(1495,'Blindfold;Femdom;Footjob;Happy Sex;Large Breasts;Nakadashi;Stockings','Nakano Sora',4.53),
+(1496,'Ahegao;Bathroom Sex;BBW;Blowjob;Cunnilingus;Defloration;Happy Sex;Large Breasts;Licking;Nakadashi;Paizuri;Straight Shota;Symbol Shaped Pupils;Trap;X-ray','Toudori',4.64),
+(1497,'Ahegao;BBW;Blowjob;Cervical Penetration;Crossdressing;Deepthroat;Gokkun;Hotpants;Huge Penis;Large Breasts;Nakadashi;Stockings;Straight Shota;Symbol Shaped Pupils;Trap;Vomit;X-ray','Toudori',4.36),
+(1498,'Ahegao;BBW;Big Ass;Filming;Huge Breasts;Huge Penis;Large Breasts;Nakadashi;Straight Shota;X-ray','Toudori',4.22),
+(1499,'Ahegao;BBM / Fat Man;Bikini;Blowjob;Double Penetration;Femdom;Group Sex;Large Breasts;Nakadashi;Slut;Stockings;Straight Shota;Swimsuit;X-ray','Dorachefu',3.71),
+(1500,'Bodysuit;Double Penetration;Drugs;Large Breasts;Tentacles','Umekichi',3.39),
+(1501,'Ahegao;Blackmail;CBT;Chastity Belt;Femdom;Handjob;Imouto;Incest;Large Breasts;Orgasm Denial;Reverse Rape;School Uniform;Stockings;Yandere','Umekichi',3.07),
+(1502,'Blindfold;Bondage;Delusion;Demon Girl | Succubus;Large Breasts;Nakadashi;Rape','Umekichi',3.36),
+(1503,'Blowjob;Breast Sucking;Cheating;Collar;Deepthroat;DILF;Fingering;Hat;Huge Penis;Leg Lock;Licking;Lingerie;Loli;Lowleg;Nakadashi;Rape;Sleeping;Stockings;Symbol Shaped Pupils;Transparent Clothing;Twintails;X-ray','Hideo',4.23),
+(1504,'Blowjob;Deepthroat;Gokkun;Group Sex;Harem;Hat;Mind Break;Monster;Nakadashi;Pantyhose;Rape;Short Hair;Snuff;Stockings;Sweating;Symbol Shaped Pupils;Torn Clothing;Transparent Clothing;X-ray','Hideo',4.31),
+(1505,'Ahegao;Bathroom Sex;Blowjob;Deepthroat;Elder Sister;Femdom;Footjob;Group Sex;Harem;Impregnation;Incest;Inseki;Loli;Nakadashi;Phimosis;Shimaidon;Threesome;Transparent Clothing;Twintails;X-ray','Hideo',4.35),
+(1506,'Ahegao;Mind Control;Nakadashi;Stockings;Symbol Shaped Pupils;Virginity (Male);X-ray','Hideo',3.89),
+(1507,'Ahegao;BBW;Big Ass;Blowjob;Huge Breasts;Large Breasts;Leg Lock;MILF;Paizuri;Straight Shota;Widow','Matsumoto Katsuya',4.3),
+(1508,'Ahegao;BBW;Big Ass;Blowjob;Cheating;Huge Breasts;Huge Penis;Incest;Inseki;Large Breasts;MILF;Mother;Nakadashi;Paizuri;Straight Shota','Matsumoto Katsuya',3.92),
+(1509,'Blowjob;Femdom;Happy Sex;Nakadashi','hr tsu',3.83),
+(1510,'Bestiality;Defloration;Elf;Happy Sex;Large Breasts;Monster;Multiple Penises;Stomach Bulge','Konshin',4.23),
+(1511,'Happy Sex;Imouto;Incest;Large Breasts;Nakadashi;School Uniform;Stockings;X-ray','Aoki Kanji',4.56),
+(1512,'BBW;Birth;Loli;Mind Break;Monster;Orc;Pregnant','Chabo',2.33),
+(1513,'BDSM;Blowjob;Bondage;Breast Sucking;Deepthroat;Fingering;French Kissing;Happy Sex;Loli;Maledom;Nakadashi','Mitsudoue',4.04),
+(1514,'BBM / Fat Man;Blowjob;Cervical Penetration;DILF;Huge Penis;Loli;Nakadashi;Stockings;Stomach Bulge;X-ray','Yuushi Tessen | Yuzu Machi',4.22),
+(1515,'Bikini;Blowjob;Fingering;Imouto;Incest;Loli;Nakadashi;Swimsuit;X-ray','Kinomoto Anzu',4.65),
+(1516,'Bikini;Blowjob;Dirty Old Man;Huge Penis;Loli;Nakadashi;Stomach Bulge;Swimsuit;X-ray','Yuushi Tessen | Yuzu Machi',4.14),
+(1517,'Blowjob;Hairy Armpits;Happy Sex;Large Breasts;MILF;Nakadashi;Sixty-Nine;Straight Shota','Tanishi',4.4),
+(1518,'Aunt;Blowjob;Femdom;Happy Sex;Incest;Large Breasts;MILF;Nakadashi','Etuzan Jakusui',4.78),
+(1519,'Ahegao;Animal Girl;BBM / Fat Man;BBW;Big Ass;Collar;Fox Girl;Huge Breasts;Lactation;Large Breasts;Twins;X-ray','Tsumetoro',3.36),
+(1520,'Anal;BDSM;Bondage;Chastity Belt;Collar;Crossdressing;Diaper;Femdom;Futa on Male;Futanari;Group Sex;Pegging;School Uniform;Sex Toys;Shibari;Shota;Story Arc;Strap-on;Swimsuit;Tankoubon;Teacher;Threesome','Mizuyoukan',3.83),
+(1521,'Anilingus;BBM / Fat Man;BDSM;Blackmail;Blindfold;Blowjob;Body Painting;Breast Sucking;Chastity Belt;Chikan;Dirty Old Man;Exhibitionism;Fingering;Group Sex;Handjob;Kimono / Yukata;Large Breasts;Latex;Leg Lock;Maledom;MILF;Muscle;Nakadashi;Nyotaimori;Office Lady;Onsen;Prostate Massage;Sex Toys;Shibari;Slave;Spitroast;Stockings;Story Arc;Threesome;Wakamezake','Misaki Yukihiro',3.65),
+(1522,'Big Ass;Chikan;Futanari;Group Sex;Large Breasts;Megane;Monster;Monster Girl;Nakadashi;Robot Girl;Selfcest','Misaki Yukihiro',3.65),
+(1523,'Anal;Blowjob;Crossdressing;Filming;Fingering;French Kissing;Happy Sex;Lingerie;Males only;Megane;School Uniform;Trap;Tsundere;Yaoi','Matsumoto Mitohi.',4.17),
+(1524,'Bikini;Huge Breasts;Large Breasts;Loli;Nakadashi;Oppai Loli;Paizuri;Prostitution;Swimsuit;Teacher;Twintails','Shou-san Bouzu',4.1),
+(1525,'Condom;Defloration;Happy Sex;Incest;Large Breasts;Megane;School Uniform','Tukinowagamo',4.75),
+(1526,'Childhood Friend;Happy Sex;Large Breasts;Megane;Short Hair','Tukinowagamo',4.63),
+(1527,'Anal;Crossdressing;Handjob;Maid;Males only;Shota;Trap;Yaoi','Kimagu',3.83),
+(1528,'BBW;Breast Sucking;Hairy;Happy Sex;Huge Breasts;Large Breasts;Leg Lock;Megane;MILF;Nakadashi;Teacher;X-ray','Etuzan Jakusui',4.35),
+(1529,'Blowjob;Breast Sucking;Comedy;Cunnilingus;Face Sitting;French Kissing;Hairy;Happy Sex;Large Breasts;Nakadashi;Sixty-Nine;Watersports','Shiomaneki',4.51),
+(1530,'Anal;Big Ass;Decensored;Happy Sex;Nakadashi;Twintails','Dorei Jackie',4.78),
+(1531,'Ahegao;Anal;Blowjob;Body Modification;Bodysuit;Collar;Comedy;Dick Growth;Footjob;Futanari;Gokkun;Gothic;Humiliation;Lactation;Large Breasts;Leotard;Magical Girl;Masturbation;Monster;Nakadashi;Nose Hook;Orc;Orgasm Denial;Rape;Ryona;Sex Toys;Spanking;Twintails;X-ray;Yuri','Takahama Tarou',3.5),
+(1532,'Anal;BBW;Big Ass;Birth;Collar;Double Penetration;Group Sex;Impregnation;Lactation;Large Breasts;Nakadashi;Plump;Possession;Pregnant;Spitroast','tokyo',3.68),
+(1533,'Bikini;Blowjob;Bukkake;Cunnilingus;Dark Skin;Defloration;Exhibitionism;French Kissing;Handjob;Happy Sex;Loli;Masturbation;Megane;Nakadashi;Prostitution;Shimapan;Stockings;Sumata;Swimsuit;Twintails','Nekodanshaku',4.51),
+(1534,'Anal;Anilingus;BBM / Fat Man;Happy Sex;Imouto;Incest;Loli;Nakadashi','Ujiie Moku',4.11),
+(1535,'Anal;Decensored;Full Color;Happy Sex;Imouto;Incest;Large Breasts','Jun',4.57),
+(1536,'Bondage;Cervical Penetration;Dark Skin;Diaper;Elf;Eyepatch;Full Color;Loli;Nakadashi;Rape;Sex Toys;Shimapan;Watersports','Ogata Zen',3.44),
+(1537,'Ahegao;Anal;Dark Skin;Deepthroat;Elf;Eyepatch;Full Color;Impregnation;Loli;Sex Toys;Stomach Bulge','Ogata Zen',3.37),
+(1538,'Bikini;Double Penetration;Group Sex;Huge Breasts;Large Breasts;Lowleg;Tanlines','Shou-san Bouzu',3.56),
+(1539,'Bikini;Blowjob;Breast Sucking;Bukkake;Cunnilingus;French Kissing;Happy Sex;Licking;Nakadashi;Squirting;Swimsuit;Tanlines;X-ray','Tsurui',3.82),
+(1540,'Bondage;Cunnilingus;Incest;Inseki;MILF;Mother;Mouth Gag;Pantyhose;Rape','hiro',3.62),
+(1541,'Ahegao;Blowjob;Bodysuit;French Kissing;Happy Sex;Nakadashi;X-ray','Ginhaha',4.47),
+(1542,'Big Ass;Cow Girl;Full Color;Large Breasts;Nakadashi;Paizuri','Nanao',4.47),
+(1543,'Ahegao;BBM / Fat Man;Cow Girl;Defloration;Drugs;Large Breasts;Mind Break;Nakadashi;Paizuri;Pantyhose;Prostitution;Rape;School Uniform;Stockings','Norakuro Nero',4.25),
+(1544,'Bukkake;Cervical Penetration;Drugs;Futanari;Group Sex;Impregnation;Mind Break;Nakadashi;Pregnant;Rape;X-ray','Tachibana Yuu',3.52),
+(1545,'Anal;Group Sex;Males only;Shota;Trap;Virginity (Male);Yaoi','Binto',4.3),
+(1546,'Ahegao;Big Ass;Blowjob;Bukkake;Bunnygirl;DILF;Group Sex;Hairy;Inverted Nipples;Large Breasts;Nakadashi;Prostitution;Smegma;Smell','Itou Eight',3.71),
+(1547,'BBM / Fat Man;Blowjob;Dirty Old Man;French Kissing;Group Sex;Huge Penis;Hypnosis;Loli;Mind Control;Nakadashi;Symbol Shaped Pupils;Threesome','Yuushi Tessen | Yuzu Machi',4.17),
+(1548,'Anal;Defloration;Huge Penis;Large Breasts;Mind Control;Nakadashi;Paizuri;Swimsuit','Henkuma',4.22),
+(1549,'Anal;Group Sex;Loli;Short Hair;Stockings;Watersports','Kotatsu',4.16),
+(1550,'Blowjob;Decensored;Defloration;Full Color;Group Sex;Harem;Large Breasts;Loli;Nakadashi;Paizuri;Threesome','Menyoujan',4.54),
+(1551,'Ahegao;Anal;Blowjob;Collar;Decensored;Exhibitionism;Males only;Shota;Symbol Shaped Pupils;Trap;Yaoi','Jairou | Xil',4.91),
+(1552,'Happy Sex;Impregnation;Large Breasts;Nakadashi;Pregnant','Ootsuka Mahiro',4.75),
+(1553,'Blowjob;Bukkake;Dark Skin;Furry;Group Sex;Impregnation;Large Breasts;Nakadashi;Paizuri','Sindoll',4.39),
+(1554,'Aunt;BBW;Big Areola;Cheating;Grandmother;Hairy;Hairy Armpits;Impregnation;Incest;Megane;MILF;Pregnant','Nonki',3.71),
+(1555,'Defloration;Imouto;Incest;Loli;Nakadashi;Straight Shota','Tsubaki Jushiro',4.7),
+(1556,'Ahegao;Defloration;Group Sex;Hairy;Large Breasts;Loli;MILF;Nakadashi;Netorare;Oyakodon;Rape;X-ray','sugarBt',3.06),
+(1557,'Blowjob;Daughter;Defloration;Femdom;Fingering;Group Sex;Hairy;Incest;Large Breasts;Loli;MILF;Mind Break;Mind Control;Mother;Muscle;Nakadashi;Oyakodon;Paizuri;Rape;Reverse Rape;Squirting;Sweating;Threesome;X-ray;Yandere;Yuri','sugarBt',4.28),
+(1558,'BBM / Fat Man;Bikini;Blowjob;Cheating;Deepthroat;Gangbang;Group Sex;Large Breasts;Loli;MILF;Mind Break;Nakadashi;Oyakodon;Rape;Slut;Spitroast;Straight Shota;Swimsuit;X-ray','sugarBt',4.23),
+(1559,'Anal;Big Ass;Blowjob;Breast Sucking;Cheating;Cunnilingus;Decensored;Fingering;Hairy;Happy Sex;Incest;Large Breasts;MILF;Mother;Nakadashi;Teacher','Hoshino Ryuichi',4.16),
+(1560,'Breast Sucking;Cunnilingus;Defloration;Femdom;French Kissing;Happy Sex;Imouto;Incest;Nakadashi;Short Hair;Smell;Tsundere','Junkie',4.36),
+(1561,'Blowjob;Happy Sex;Impregnation;Large Breasts;Muscle;Virginity (Male)','Mikami Cannon',4.71),
+(1562,'Anal;Bodysuit;Bondage;Drugs;Monster;Piercings','yudg',2.2),
+(1563,'Ahegao;Anal;Armpit;Corruption;Group Sex;Mind Break;Monster;Rape;Snuff','Makari Tohru',3.58),
+(1564,'BBW;Happy Sex;Huge Breasts;Large Breasts;Nakadashi','tokyo',4.7),
+(1565,'Childhood Friend;Defloration;Exhibitionism;Face Sitting;Foot Fetish;Hairy;Incest;Pettanko;School Uniform;Story Arc;Tankoubon;Teacher;Twins','MARUTA',4.55),
+(1566,'Ahegao;Anal;Animal Boy;Bisexual;Blowjob;Crossdressing;Crotchless / Breastless;Full Color;Gloves;Group Sex;Incest;Leotard;Lingerie;Nakadashi;Otouto;Pantyhose;Scat;School Uniform;Shota;Stockings;Trap;Yaoi','Ten no Katsuraya',4.32),
+(1567,'Ahegao;Blowjob;Dark Skin;Drunk;Futanari;Group Sex;Huge Penis;Large Breasts;Male on Futa;Multiple Insertion;Nakadashi;Shemale;Symbol Shaped Pupils;Uncensored;Waitress;Western','doxy',3.95),
+(1568,'Animal Boy;Animal Girl;BBW;Blowjob;Cow Girl;Huge Breasts;Large Breasts;Paizuri;Plump;Short Hair;Swimsuit;Tsundere','Eno Yukimi',4.0),
+(1569,'Anal;Big Ass;Femdom;Handjob;Happy Sex;Large Breasts;MILF;Swimsuit','Navier Haruka 2T',4.61),
+(1570,'Animal Girl;Femdom;Gender Bender;Large Breasts;Masturbation','Hitomasu Modoru;Kamiya Zuzu',4.1),
+(1571,'Futa on Male;Futanari;Futanari on Futanari;Happy Sex;Huge Penis;Large Breasts;Short Hair','Dulce Q',4.31),
+(1572,'Ahegao;Anal;Double Penetration;Drugs;Femdom;Group Sex;Harem;Impregnation;Latex;Megane;Nakadashi;Pegging;Pettanko;Sex Toys;Stomach Bulge;Strap-on;Virginity (Male)','Minority',3.43),
+(1573,'Anal;Blowjob;Crossdressing;Happy Sex;Males only;Masturbation;Megane;Nakadashi;School Uniform;Trap;Yaoi','Matsumoto Mitohi.',4.42),
+(1574,'Gender Bender;Pantyhose;Symbol Shaped Pupils','Matsumoto Mitohi.',4.67),
+(1575,'Cheating;Harem;Large Breasts;Maledom;MILF;Reverse NTR;Teacher','Miyabi Tsuzuru',4.59),
+(1576,'Bikini;Blowjob;Happy Sex;Large Breasts;Nakadashi;Paizuri;Short Hair;Swimsuit','Minakami Sakura',4.31),
+(1577,'Ahegao;Anal;Blowjob;Breast Sucking;Bukkake;Bunnygirl;Chikan;Crossdressing;Drugs;Emotionless Sex;Exhibitionism;Footjob;Full Color;Gangbang;Group Sex;Handjob;Kuudere;Lingerie;Maid;Males only;Mind Break;Prostitution;Shimapan;Shota;Slave;Small Penis;Stockings;Trap;X-ray;Yaoi','Gujira',4.59),
+(1578,'Anal;Condom;Crossdressing;Emotionless Sex;Males only;Prostitution;Shota;Trap;Yaoi','Gujira',4.19),
+(1579,'Anal;Anilingus;BBM / Fat Man;Blowjob;Catgirl;Chikan;Collar;Dark Skin;DILF;Double Penetration;Fingering;Gangbang;Group Sex;Hotpants;Human Toilet;Loli;Magical Girl;Multiple Insertion;Nakadashi;School Uniform;Sex Toys;Stockings;Swimsuit;Symbol Shaped Pupils;Tattoo;Watersports;X-ray','Shimanto Shisakugata',4.11),
+(1580,'Anal;BBM / Fat Man;Dark Skin;Double Penetration;Group Sex;Loli;Nakadashi;Piercings;School Uniform;Sex Toys;Tattoo;Watersports','Shimanto Shisakugata',3.84),
+(1581,'Blowjob;Bukkake;Defloration;Double Penetration;Footjob;Group Sex;Loli;Mind Break;Paizuri;Threesome;X-ray','ryoma',3.22),
+(1582,'Animal Girl;Decensored;Happy Sex;Harpy;Large Breasts;Leg Lock;Monster Girl;Nakadashi;Straight Shota','Jun',4.66),
+(1583,'Ahegao;Anal;Blowjob;Crossdressing;Fingering;Frotting;Full Color;Group Sex;Incest;Males only;Otouto;Shota;Sixty-Nine;Small Penis;Stockings;Trap;X-ray;Yaoi','NemuNemu',4.54),
+(1584,'Blowjob;Breast Sucking;Cunnilingus;Grandmother;Incest;MILF;Nakadashi;Short Hair;Straight Shota;Sweating','',3.45),
+(1585,'Blowjob;Breast Sucking;Full Color;Hairy;Incest;MILF;Mother;Nakadashi;Nurse;Small Penis;Stockings;Straight Shota','',3.63),
+(1586,'Animal Girl;Blowjob;Childhood Friend;Deepthroat;Furry;Loli;Nakadashi;School Uniform;Symbol Shaped Pupils','ro',3.83),
+(1587,'Animal Boy;Animal Girl;Furry;Loli;Rape;School Uniform;Watersports','ro',3.66),
+(1588,'Inverted Nipples;Megane;Nakadashi;Stockings;Yandere','Shika Yuno',3.72),
+(1589,'Happy Sex;Mask;School Uniform;Stockings','Koume Keito',3.82),
+(1590,'Cervical Penetration;Demon | Incubus;Egg Laying;Elf;Impregnation;Lactation;Long Tongue;Monster Girl;Nakadashi;Pregnant;Stockings;Stomach Bulge;Tentacles;X-ray','Sakazaki Freddie',2.89),
+(1591,'Anal;Blowjob;Crossdressing;Males only;Shota;Stockings;Trap;Yaoi','Yoshiyuki',4.83),
+(1592,'Ahegao;Blowjob;Bodysuit;Cervical Penetration;Corruption;Large Breasts;Nakadashi','Cru',3.78),
+(1593,'Anal;Defloration;Double Penetration;Gothic;Group Sex;Mind Break;Rape;Stockings;Threesome','Arino Hiroshi',3.0),
+(1594,'Angel;Catgirl;Femdom;Futanari;Group Sex;Harem;Large Breasts;Loli;Male on Futa;Vampire;Witch','Tsubakiyama Parry',3.94),
+(1595,'Big Areola;Big Ass;Blowjob;Breast Sucking;Collar;Happy Sex;Huge Breasts;Huge Penis;Large Breasts;MILF;Nakadashi;Office Lady','Shibari Kana',4.48),
+(1596,'Anal;Bikini;Blowjob;Cosplay;Crossdressing;Fingering;Frotting;Full Color;Group Sex;Happy Sex;Lingerie;Males only;Masturbation;Prostitution;School Swimsuit;Sex Toys;Shota;Stockings;Swimsuit;Symbol Shaped Pupils;Trap;X-ray;Yaoi','NemuNemu',4.58),
+(1597,'Blowjob;Group Sex;Handjob;Large Breasts;Leg Lock;Megane;Nakadashi;Office Lady;Pantyhose;Short Hair;Threesome;Virginity (Male)','Lockheart',4.64),
+(1598,'Blowjob;Breast Sucking;Defloration;Impregnation;Large Breasts;Mind Control;Nakadashi;Rape;Straight Shota','Izuki Jirou',3.5),
+(1599,'Deepthroat;Footjob;Idol;Nakadashi;Rape','Bismarcho',3.88),
+(1600,'Anal;Animal Boy;Blowjob;Crossdressing;Decensored;Fingering;Full Color;Licking;Lingerie;Males only;Sex Toys;Shota;Small Penis;Stockings;Trap;X-ray;Yaoi','NemuNemu',4.27),
+(1601,'Anal;Animal Boy;Blowjob;Crossdressing;Idol;Lingerie;Maid;Males only;Masturbation;Onahole;Sex Toys;Shota;Small Penis;Stockings;Trap;Twintails;X-ray;Yaoi','NemuNemu',4.65),
+(1602,'Anal;Crossdressing;Males only;Nakadashi;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Yuya',4.47),
+(1603,'Anal;Cosplay;Crossdressing;Femdom;Futa on Male;Futanari;Huge Penis;Shota;Stockings;Trap','Alpha Alf Layla',4.35),
+(1604,'Ahegao;BDSM;Bondage;Chastity Belt;Collar;Exhibitionism;Group Sex;Mouth Gag;Nose Hook;Pet Girl;Sex Toys;Slave','Hakaba',3.63),
+(1605,'Anal;Crossdressing;Idol;Maid;Males only;Shota;Stockings;Trap;Twintails;Yaoi','Amayui Kisa',4.08),
+(1606,'Blowjob;Condom;Dark Skin;Defloration;Elder Sister;Happy Sex;Impregnation;Incest;Inseki;Nakadashi;School Uniform;Straight Shota;Tanlines;Virginity (Male)','Inari',4.66),
+(1607,'Elder Sister;Femdom;Footjob;Handjob;Incest;Large Breasts;Nakadashi;Stockings;Straight Shota;Virginity (Male);X-ray','Jingrock',3.98),
+(1608,'Anal;Blowjob;Crossdressing;DILF;Group Sex;Males only;Prostitution;Rape;School Uniform;Shota;Stockings;Teacher;Trap;Yaoi','Lew',4.15),
+(1609,'Blowjob;Bukkake;Maid;Masturbation;Nakadashi;Pantyhose;Phimosis;Straight Shota;Virginity (Male);Waitress;Watersports;X-ray','Morishima Kon',4.42),
+(1610,'Anal;Crossdressing;Males only;Shota;Stockings;Tentacles;Trap;Yaoi','Magifuro Konnyaku',4.52),
+(1611,'Blowjob;Breast Sucking;Cunnilingus;Defloration;Happy Sex;Nakadashi;Sixty-Nine;Sweating','Wabara Hiro',4.69),
+(1612,'BBM / Fat Man;Blowjob;Dark Skin;Deepthroat;Defloration;Nakadashi;Sweating;Virginity (Male)','Momonosuke',4.54),
+(1613,'Blowjob;Femdom;Happy Sex;Nakadashi;X-ray','Mozu',4.74),
+(1614,'Breast Sucking;Elder Sister;Handjob;Happy Sex;Huge Breasts;Huge Penis;Incest;Large Breasts;Leg Lock;School Uniform;Straight Shota','Accho | Accio',4.6),
+(1615,'Blackmail;Blowjob;Collar;Delusion;Double Penetration;Exhibitionism;Femdom;Footjob;Group Sex;Hairy;Humiliation;Impregnation;Lactation;Large Breasts;Maledom;Megane;MILF;Nakadashi;Pregnant;Sex Toys;Slave;Stockings;Teacher','Maguro Teikoku',4.17),
+(1616,'Happy Sex;Large Breasts;Megane;Paizuri;Pantyhose;Short Hair;Stockings','Yaki Tomato',4.83),
+(1617,'Band-Aid / Pasties;Blindfold;Body Writing;Collar;Gangbang;Group Sex;Hairy;Human Toilet;Impregnation;Nakadashi;Nose Hook;Pantyhose;Piercings;Scat','Amano Ameno',3.38),
+(1618,'Animal Girl;Fox Girl;Happy Sex;Large Breasts;Military Uniform;Nakadashi;Stockings;Symbol Shaped Pupils','Kyougoku Shin',4.83),
+(1619,'Breast Sucking;Femdom;Large Breasts;Leg Lock;Maid;Nakadashi;Pantyhose;Reverse Rape;Short Hair;Stockings;Straight Shota;Transparent Clothing','Campbell Gichou',3.96),
+(1620,'Bikini;Bisexual;Bondage;Demon Girl | Succubus;Fangs;Females only;Femdom;Fingering;French Kissing;Large Breasts;Mind Break;Monster Girl;Short Hair;Swimsuit;Tailjob;Yuri','Miitoban | Nikuman Umeew',4.59),
+(1621,'Bikini;Dark Skin;Demon Girl | Succubus;Femdom;Handjob;Happy Sex;Large Breasts;Monster Girl;Nakadashi;Stockings;Swimsuit;Wings','Miitoban | Nikuman Umeew',4.63),
+(1622,'Ahegao;Blowjob;Bukkake;Demon Girl | Succubus;Drugs;Fangs;Happy Sex;Large Breasts;Nakadashi;Watersports;Wings;X-ray','Miitoban | Nikuman Umeew',4.64),
+(1623,'Bikini;Bisexual;Blowjob;Dark Skin;Demon Girl | Succubus;Fingering;French Kissing;Group Sex;Happy Sex;Monster Girl;Nakadashi;Stockings;Threesome;Wings','Miitoban | Nikuman Umeew',4.77),
+(1624,'Anal;Cheating;Group Sex;Large Breasts;Lingerie;Megane','Emua',3.74),
+(1625,'Anal;Bisexual;Cheating;Group Sex;Large Breasts;Lingerie;Megane','Emua',3.78),
+(1626,'Anal;Crossdressing;Lingerie;Males only;Prostitution;Shota;Trap;Yaoi','Tekorun',4.58),
+(1627,'Ahegao;Big Areola;Blowjob;Large Breasts;Mind Break;Nakadashi;Nun;Paizuri;Reverse NTR;Stockings','Ame Arare',4.24),
+(1628,'Anal;Blowjob;Cow Girl;Defloration;Double Penetration;Drunk;Footjob;Gokkun;Group Sex;Large Breasts;Nakadashi;Paizuri;Pantyhose;Sleeping;Symbol Shaped Pupils','Yasui Riosuke',4.17),
+(1629,'Big Ass;Blackmail;Gyaru;Inverted Nipples;Large Breasts;Scat;School Uniform;Stockings;Twintails','Itou Eight',3.5),
+(1630,'Butler;Gender Bender;Stockings;Transformation','Mokufuu',3.86),
+(1631,'Blowjob;Fingering;Happy Sex;Incest;Inseki;Large Breasts;Nakadashi','momi',4.59),
+(1632,'Double Penetration;French Kissing;Group Sex;Large Breasts;Micro;Nakadashi;Swimsuit;Threesome','momi',3.45),
+(1633,'Femdom;Large Breasts;Nakadashi;Paizuri;School Uniform;Short Hair','Goban',4.43),
+(1634,'Ahegao;Blindfold;Bukkake;Double Penetration;Group Sex;Leotard;Nakadashi;Short Hair;Stockings','Kutani',3.12),
+(1635,'Anal;Armpit;Bikini;Blowjob;Comedy;Dark Skin;Demon Girl | Succubus;Drugs;Fangs;Femdom;Gloves;Group Sex;Gyaru;Handjob;Happy Sex;Large Breasts;Licking;Long Tongue;Nakadashi;Prostitution;Slut;Smell;Sweating;Swimsuit;Tailjob;Threesome;Twintails;X-ray','Navier Haruka 2T',4.31),
+(1636,'Anal;BBM / Fat Man;Blowjob;Bukkake;Bunnygirl;Double Penetration;Group Sex;Large Breasts;Leotard;Mind Break;Nakadashi;Paizuri;Pantyhose;Prostitution;Sex Toys;Short Hair','Shou-san Bouzu',3.69),
+(1637,'Bondage;Large Breasts;Sex Toys;Shibari;Yuri','Sakawaki Herodai',4.24),
+(1638,'Ahegao;Anal;Animal Boy;Cervical Penetration;Collar;Comedy;Dark Skin;Daughter;Fisting;Group Sex;Incest;Inverted Nipples;Lactation;Large Breasts;Megane;MILF;Mother;Nakadashi;Nipple Penetration;Oyakodon;Stomach Bulge;Symbol Shaped Pupils;Threesome;Urethra Insertion;X-ray','John K. Pe-ta',3.34),
+(1639,'Blowjob;Happy Sex;Large Breasts;Military Uniform;Nakadashi;Pantyhose','Hiyoshi Hana',4.95),
+(1640,'Blowjob;Cheating;Elder Sister;Full Color;Incest;Large Breasts;MILF;Mother;Nakadashi;Stockings;Straight Shota','',4.33),
+(1641,'Aunt;BBW;Breast Sucking;Dark Skin;Defloration;DILF;Elder Sister;Femdom;Group Sex;Huge Penis;Incest;Inverted Nipples;Lactation;Large Breasts;Megane;Miko;Nakadashi;Nipple Penetration;Paizuri;Pantyhose;Plump;Rape;School Uniform;Story Arc;Straight Shota;Tall Girl;Tankoubon;Teacher;Threesome;Virginity (Male)','PIero',4.11),
+(1642,'Ahegao;Bisexual;Blowjob;Deepthroat;Dirty Old Man;Group Sex;Kunoichi;Mind Break;Pettanko;Rape;Stockings;X-ray;Yuri','Moyatto',3.15),
+(1643,'Defloration;Happy Sex;Large Breasts;Nakadashi;Straight Shota','Kemuri Haku',4.28),
+(1644,'Condom;Defloration;Happy Sex;Large Breasts;School Uniform','Ootsuka Mahiro',4.64),
+(1645,'Big Ass;Blowjob;Breast Sucking;Condom;Cunnilingus;French Kissing;Full Color;Happy Sex;Impregnation;Incest;Kimono / Yukata;Lactation;Large Breasts;Lingerie;MILF;Mother;Nakadashi;Paizuri;Pantyhose;Pregnant;Stockings;X-ray','Haruharutei',4.47),
+(1646,'Blowjob;Full Color;Large Breasts;Nakadashi','Nanao',4.62),
+(1647,'Bodysuit;Bondage;Large Breasts;Nakadashi;Rape;X-ray','SAKULA',3.0),
+(1648,'Anal;Double Penetration;Eyepatch;Group Sex;Loli;Nakadashi;Short Hair;Stockings;Strap-on;Tanlines;Threesome','Yukimi',4.59),
+(1649,'Anal;Drugs;Gender Bender;Males only;Monster;Nakadashi;Rape;Shota;Trap;Twins;Yaoi','D@i',4.2),
+(1650,'Blowjob;Breast Sucking;Double Penetration;Group Sex;Handjob;Large Breasts;Multiple Insertion;Nakadashi;Slut;Threesome;Uncensored;X-ray','Hiura R',3.88),
+(1651,'Ahegao;Blowjob;Cunnilingus;Group Sex;Huge Penis;Large Breasts;Nakadashi;School Uniform;Uncensored','Hiroshiki',4.35),
+(1652,'Blowjob;Cosplay;Large Breasts;Nakadashi;Paizuri;Stockings;Tsundere;Uncensored','Harukichi',4.67),
+(1653,'Anal;Exhibitionism;Hairy;Handjob;Large Breasts;Nakadashi;School Uniform;Sex Toys;Uncensored','Haru Yukiko',4.54),
+(1654,'Anilingus;Blowjob;Exhibitionism;Happy Sex;Large Breasts;Nakadashi;School Uniform;Uncensored;X-ray','Haru Yukiko',4.6),
+(1655,'Defloration;Happy Sex;Pettanko;Short Hair;Uncensored','Hamao',4.41),
+(1656,'Blowjob;Handjob;Happy Sex;Large Breasts;Nakadashi;Prostitution;School Uniform;Uncensored','Fujiyama',3.89),
+(1657,'Big Ass;Condom;Cunnilingus;Hairy;Happy Sex;Pettanko;Uncensored','Eguchi Jaws',4.71),
+(1658,'Blowjob;Childhood Friend;Footjob;Happy Sex;Large Breasts;Nakadashi;Uncensored','Dynamite Moca',4.6),
+(1659,'Blowjob;Bondage;Childhood Friend;Collar;Exhibitionism;Fingering;Large Breasts;Maledom;Nakadashi;Pet Girl;Spreading;Uncensored;X-ray','Chika',4.2),
+(1660,'Ahegao;Happy Sex;Legal Loli;Loli;Nakadashi;Symbol Shaped Pupils;Toddler;X-ray','Fooyuta',4.22),
+(1661,'Ahegao;Anal;Birth;Double Penetration;Loli;Stomach Bulge;Tentacles;X-ray','Sanwaribiki',3.25),
+(1662,'Big Ass;Blowjob;Cheating;Dark Skin;Deepthroat;Impregnation;Incest;Inseki;Large Breasts;MILF;Mother;Muscle;Nakadashi;Netorare;Squirting;X-ray','Etuzan Jakusui',3.47),
+(1663,'Cunnilingus;Decensored;Fingering;French Kissing;Handjob;Happy Sex;Imouto;Incest;Loli;Megane;Nakadashi;Pettanko;X-ray','Arekusa Mahone',4.38),
+(1664,'Big Ass;Defloration;Hairy;Huge Breasts;Large Breasts;Megane;School Uniform;Tall Girl','Etuzan Jakusui',4.54),
+(1665,'Blowjob;Gokkun;Incest;Loli;Niece','7ten Paoki',4.57),
+(1666,'Ahegao;Collar;Filming;Human Toilet;Oni;Pettanko;Rape;Short Hair;Snuff;Stomach Bulge','Gesundheit',3.68),
+(1667,'Anal;Gender Bender;Males only;Orgasm Denial;Shota;Trap;Yaoi','D@i',4.29),
+(1668,'Condom;Defloration;Happy Sex;Large Breasts;Megane;Paizuri;Tomboy;Uncensored','bowcan',4.69),
+(1669,'Blowjob;Happy Sex;Large Breasts;Nakadashi;School Uniform;Tall Girl;Tomboy;Uncensored;X-ray','BeNantoka',4.79),
+(1670,'Anal;Blowjob;Double Penetration;Gangbang;Group Sex;Handjob;Large Breasts;Nakadashi;Stockings;Swimsuit;Uncensored;X-ray','Ban Kazuyasu',3.62),
+(1671,'Blowjob;Deepthroat;Handjob;Happy Sex;Large Breasts;Nakadashi;School Uniform;Stockings;Teacher;Uncensored','Ayuma Sayu',4.35),
+(1672,'Ahegao;BBW;Exhibitionism;Large Breasts;Nakadashi;Plump;Shimapan;Uncensored;Voyeurism','Ashiomi Masato',4.07),
+(1673,'Ahegao;Anal;Big Ass;Blowjob;Condom;Cunnilingus;Large Breasts;Lingerie;Megane;Nakadashi;Office Lady;Uncensored','Ash Yokoshima',4.36),
+(1674,'Ahegao;Happy Sex;Large Breasts;Nakadashi;Paizuri;Straight Shota;Uncensored','Aoi Miharu',4.61),
+(1675,'Anal;Blowjob;Double Penetration;Gangbang;Group Sex;Handjob;Nakadashi;School Uniform','Akuma',3.02),
+(1676,'Ahegao;BBM / Fat Man;BBW;Large Breasts;Nakadashi;Plump;Swimsuit;Uncensored','Akiya Akira',2.89),
+(1677,'Ahegao;Fingering;Happy Sex;Imouto;Incest;Kotatsu;Nakadashi;Pettanko;Squirting;Uncensored','Akino Sora',4.74),
+(1678,'Large Breasts;Leotard;Nakadashi;Uncensored','Akagi Asahito',4.68),
+(1679,'Anal;Blowjob;Nakadashi;School Uniform;Selfcest;Shota;Yaoi','Yomogi Ringo',4.67),
+(1680,'Blackmail;Cheating;Femdom;Foot Fetish;Footjob;Large Breasts;MILF;Nakadashi;Naked Apron;Pantyhose;School Uniform;Straight Shota;Torn Clothing','Mokkouyou Bond',3.89),
+(1681,'Ahegao;Collar;Eyepatch;Incest;Large Breasts;MILF;Mother;Nakadashi;Straight Shota;Sweating;Widow','SWA',4.13),
+(1682,'Anal;Blackmail;Blindfold;Bloomers;Bondage;Cheating;Chikan;Dark Skin;Defloration;DILF;Double Penetration;Emotionless Sex;Group Sex;Hairy;Hotpants;Large Breasts;Megane;MILF;Mind Break;Nakadashi;Netorare;Pantyhose;Rape;School Uniform;Sex Toys;Stockings;Story Arc;Tankoubon;Tanlines;Teacher;Threesome;Time Stop;Tomboy;Watersports;X-ray','BANG-YOU | Didori',3.68),
+(1683,'Anal;Anilingus;Blowjob;Chikan;Cunnilingus;Decensored;Defloration;Elder Sister;Femdom;Group Sex;Hairy;Happy Sex;Harem;Impregnation;Incest;Large Breasts;Maid;Megane;Nakadashi;Onsen;Paizuri;Pantyhose;School Uniform;Short Hair;Sumata;Tankoubon;Tomboy;Tsundere;Yuri','Yuzuki N Dash',4.8),
+(1684,'Anal;Animal Boy;Bloomers;Crossdressing;Footjob;Leotard;Males only;Pantyhose;Prostate Massage;School Swimsuit;School Uniform;Stockings;Swimsuit;Trap;Yaoi','Nokoppa',4.31),
+(1685,'Ahegao;Big Ass;Blowjob;Happy Sex;Pettanko;School Uniform;Tsundere','MAMO',4.55),
+(1686,'Blowjob;Breast Sucking;Cunnilingus;Defloration;Drunk;Hairy;Happy Sex;Large Breasts;Spats;Tomboy;X-ray','Makinosaka Shin''ichi',4.79),
+(1687,'Anal;Bondage;Crossdressing;Males only;Shota;Trap;Watersports;Yaoi','U-hi',4.49),
+(1688,'Anal;Big Ass;Blackmail;Blindfold;Blowjob;Bondage;Breast Expansion;Double Penetration;Full Color;Group Sex;Huge Breasts;Large Breasts;Leotard;Rape;Robot Girl;Shibari;Short Hair;Stockings;Stomach Bulge','orico',3.12),
+(1689,'Blowjob;Cunnilingus;Face Sitting;Handjob;Imouto;Incest;Leg Lock;Mind Control;Possession;Rape;Virginity (Male)','Takuwan',3.67),
+(1690,'Bikini;Gyaru;Happy Sex;Large Breasts;School Uniform;Swimsuit;Tanlines;Teacher','Hairou',4.56),
+(1691,'Anal;Crossdressing;Gender Bender;Males only;Shota;Trap;Virginity (Male);Yaoi','D@i',4.54),
+(1692,'Ahegao;Anal;Big Ass;Bodysuit;Group Sex;Large Breasts;Mind Control;Nakadashi;Stockings','Akisu',4.39),
+(1693,'Ahegao;Femdom;Guro;Lactation;Loli;Monster;Oni;Oppai Loli;Rape;Sex Toys;Short Hair;Snuff','Gesundheit',3.71),
+(1694,'Animal Girl;BBW;Blowjob;Cow Girl;Huge Breasts;Large Breasts;Nakadashi;Paizuri;Plump','Eno Yukimi',4.62),
+(1695,'Blowjob;Femdom;Footjob;Large Breasts;School Uniform;Slut;Straight Shota;Sumata','Kemuri Haku',3.85),
+(1696,'Cheating;Cunnilingus;French Kissing;Happy Sex;Incest;Large Breasts;MILF;Mother;Nakadashi','Haitoku Sensei',4.46),
+(1697,'Blowjob;Breast Sucking;Bukkake;Cheating;Condom;Fingering;French Kissing;Handjob;Happy Sex;Incest;Large Breasts;Masturbation;MILF;Mother;Nakadashi;Paizuri','Haitoku Sensei',4.5),
+(1698,'Anal;Anilingus;Bathroom Sex;Breast Sucking;Cheating;Cunnilingus;Fingering;French Kissing;Happy Sex;Incest;Large Breasts;Masturbation;MILF;Mother;Nakadashi;Sweating','Haitoku Sensei',4.48),
+(1699,'Cunnilingus;Fingering;Hairy;Large Breasts;MILF;Straight Shota;Uncensored;Virginity (Male)','Paja',3.65),
+(1700,'Anal;Blowjob;Crossdressing;Males only;Nun;Shota;Stockings;Trap;Yaoi','Palco Nagashima',4.32),
+(1701,'Anal;Bikini;Crossdressing;Father;Group Sex;Incest;Lingerie;Males only;Rape;Sex Toys;Shota;Trap;Yaoi','Sakura Puchilo',3.36),
+(1702,'Blowjob;Deepthroat;Loli;Nakadashi;School Swimsuit;Short Hair;Swimsuit','Hisasi',4.81),
+(1703,'Happy Sex;Large Breasts;School Uniform;Twintails','Watanuki Ron',4.43),
+(1704,'BBM / Fat Man;Cheating;Cow Girl;Impregnation;Large Breasts;Nakadashi','Suzuhane Suzu',3.42),
+(1705,'Cheating;Hairy;Large Breasts;Masturbation;Nakadashi;Stockings;Twintails;Uncensored','Karube Giri',4.48),
+(1706,'Big Ass;Childhood Friend;Exhibitionism;Masturbation;Nakadashi;Swimsuit;Uncensored','Kohsaka Donten',4.71),
+(1707,'Anal;Big Ass;Blowjob;Comedy;Gaping;Hairy;Large Breasts;Nakadashi;Office Lady;Uncensored;X-ray','Konchiki',4.41),
+(1708,'Big Ass;Exhibitionism;Large Breasts;Nakadashi;Shimapan;Short Hair;Uncensored;X-ray','Maki Daikichi',4.6),
+(1709,'Blowjob;Bunnygirl;Large Breasts;Leotard;Nakadashi;Uncensored','Maumen',4.56),
+(1710,'Big Ass;Hairy;Happy Sex;Large Breasts;Masturbation;Nakadashi;Uncensored','Karma Tatsurou',4.86),
+(1711,'Happy Sex;Nakadashi;Short Hair;Uncensored;X-ray','',4.66),
+(1712,'Ahegao;Blowjob;Childhood Friend;Happy Sex;Nakadashi;School Uniform;Short Hair;Spats;Tomboy;Uncensored','Itou Ei',4.68),
+(1713,'Big Ass;Blowjob;Hairy;Large Breasts;Nakadashi;Reverse Rape;Uncensored;Yandere','Ishikawa Shisuke',4.72),
+(1714,'Ahegao;Blowjob;Cheating;Large Breasts;Masturbation;MILF;Nakadashi','Aoi Hitori',3.71),
+(1715,'Ahegao;Anal;Anilingus;Bondage;Cheating;Crossdressing;Cunnilingus;Deepthroat;Defloration;Fundoshi;Group Sex;Harem;Impregnation;Large Breasts;Nakadashi;Pregnant;School Swimsuit;School Uniform;Sex Toys;Stockings;Story Arc;Swimsuit;Threesome;Tomboy;Watersports','Utamaro',4.65),
+(1716,'BBM / Fat Man;BBW;Catgirl;Double Penetration;Drugs;Group Sex;Impregnation;Large Breasts;Mind Break;Nakadashi;Pregnant;Rape;School Uniform;Sleeping;Threesome','Norakuro Nero',3.67),
+(1717,'Anal;Blowjob;Bondage;Exhibitionism;Full Color;Group Sex;Rape;Shota;Yaoi','Hakuyagen',3.0),
+(1718,'Anilingus;BBW;Blowjob;Cunnilingus;French Kissing;Hairy;Happy Sex;Impregnation;Incest;Large Breasts;Leg Lock;MILF;Mother;Nakadashi;Sixty-Nine;Straight Shota;X-ray','Yamamoto Yoshifumi',4.36),
+(1719,'Blowjob;Cheating;Condom;Full Color;Handjob;Incest;Masturbation;MILF;Mother;Naked Apron;Paizuri;Virginity (Male);X-ray','Kintama Ookami',3.8),
+(1720,'Anal;Blowjob;Bondage;CBT;Fisting;Handjob;Humiliation;Mouth Gag;Muscle;Nakadashi;Nose Hook;Piercings;Rape;Torture','Suzurame',3.0),
+(1721,'Full Color;Large Breasts;Paizuri;Prostitution;Short Hair;Uncensored','Lolicept',4.35),
+(1722,'Full Color;Large Breasts;Paizuri;Prostitution;Short Hair;Uncensored','Lolicept',4.22),
+(1723,'Ahegao;Exhibitionism;Happy Sex;Large Breasts;Nakadashi;Sex Toys','Oroneko',4.68),
+(1724,'Femdom;Happy Sex;Large Breasts;School Uniform','Oroneko',4.54),
+(1725,'Ahegao;Big Ass;Birth;Egg Laying;Group Sex;Huge Breasts;Impregnation;Large Breasts;Mind Break;Mind Control;Nakadashi;Orc;Orgasm Denial;Piercings;Rape;Slave;Stomach Bulge;Symbol Shaped Pupils;Tentacles;X-ray','Ahemaru',3.53),
+(1726,'Ahegao;Anal;Defloration;Drugs;Elf;Large Breasts;Leg Lock;Mind Break;Nakadashi;Pet Girl;Piercings;Rape;Slave;X-ray','Fan no Hitori',4.47),
+(1727,'Ahegao;Anal;Animal Girl;Blowjob;Collar;Deepthroat;Dog Girl;Double Penetration;Exhibitionism;Gangbang;Group Sex;Loli;Nakadashi;Pet Girl;Sex Toys;Watersports','Maeshima Ryou',4.32),
+(1728,'Ahegao;BBM / Fat Man;Blowjob;Bondage;Bukkake;Cunnilingus;Loli;Randoseru;Sex Toys;Slut;Stockings','Maeshima Ryou',4.25),
+(1729,'Ahegao;Anal;BBM / Fat Man;Bikini;Blowjob;Double Penetration;Drunk;Filming;Fingering;Gangbang;Group Sex;Loli;Megane;Nakadashi;Randoseru;Slut;Spitroast;Stockings;Swimsuit;Twintails;X-ray','Maeshima Ryou',4.48),
+(1730,'Ahegao;Anal;Double Penetration;Group Sex;Loli','Maeshima Ryou',3.91),
+(1731,'Happy Sex;Pettanko;School Uniform;Short Hair;Stockings;Tomboy;Tsundere','Syoukaki',4.92),
+(1732,'Elder Sister;Femdom;Group Sex;Incest;Large Breasts;School Uniform;Straight Shota;Threesome','Morishima Kon',4.25),
+(1733,'Ahegao;Anal;BBM / Fat Man;Big Ass;Blowjob;Defloration;Huge Penis;Idol;Mind Break;Nakadashi;Prostitution;School Uniform;Symbol Shaped Pupils','Makurou',3.65),
+(1734,'Blowjob;Group Sex;Loli;Nakadashi;Rape;School Swimsuit;Short Hair;Swimsuit;Tanlines;Threesome;X-ray','Malcorond',3.8),
+(1735,'Anal;Anilingus;Blackmail;Femdom;Fingering;Huge Breasts;Large Breasts;Masturbation;Mind Break;Straight Shota;Teacher;Uncensored','Horieros',3.64),
+(1736,'Ahegao;BBM / Fat Man;Blowjob;Full Color;Group Sex;Hypnosis;Large Breasts;Megane;Stockings;Tsundere;Uncensored','Kanbayashi Chiko',2.95),
+(1737,'Full Color;Large Breasts;Paizuri;Prostitution;Short Hair;Uncensored','Lolicept',4.14),
+(1738,'Full Color;Large Breasts;Paizuri;Prostitution;Short Hair;Uncensored','Lolicept',4.3),
+(1739,'Animal Girl;Collar;Dark Skin;Fangs;Fox Girl;Full Color;Heterochromia;Loli;Nakadashi;Pet Girl;Stockings;Tsundere;Uncensored','Mda Starou',4.6),
+(1740,'Full Color;Large Breasts;Layer Cake;Threesome;Uncensored','108 Gou',3.86),
+(1741,'Demon Girl | Succubus;Femdom;Large Breasts;Paizuri;Phimosis;Straight Shota;Virginity (Male)','Simon',4.36),
+(1742,'Ahegao;Band-Aid / Pasties;BBW;Big Areola;Fox Girl;Hairy;Impregnation;Lactation;Large Breasts;Masturbation;Mind Control;Piercings;Stockings;Sweating','Amazon',3.72),
+(1743,'Ahegao;Anal;Angel;Big Ass;Bondage;Cervical Penetration;Dark Skin;Demon Girl | Succubus;Double Penetration;Lactation;Large Breasts;Mind Break;Stockings;Tentacles;Vore','Nagai Wataru',3.19),
+(1744,'Anilingus;BBM / Fat Man;Blowjob;Catgirl;Drugs;Group Sex;Harem;Impregnation;Incest;Large Breasts;Loli;Mind Control;Nakadashi;Prostitution;Rape;School Uniform;Teacher;Threesome;X-ray','Norakuro Nero',3.76),
+(1745,'Cheating;Full Color;Incest;Inseki;Large Breasts;MILF;Mother;Straight Shota','Sugi G',3.62),
+(1746,'Bondage;Males only;Mind Break;Prostate Massage;Sex Toys;Shota;Symbol Shaped Pupils;Yaoi','Kotoko',3.79),
+(1747,'Bikini;Large Breasts;Short Hair;Swimsuit','Koza',4.48),
+(1748,'Big Ass;Huge Breasts;Large Breasts;Nakadashi;Short Hair;Stockings;Straight Shota','Kotoba Ai',4.15),
+(1749,'Blowjob;Happy Sex;Large Breasts;Megane;Nakadashi;School Uniform;Short Hair;Stockings','Fujishima Sei1go',4.47),
+(1750,'Blowjob;Bondage;Femdom;Footjob;Idol;Short Hair;Stockings','Shinooka Homare',4.48),
+(1751,'Anal;BDSM;Blowjob;Bondage;CBT;Femdom;Fingering;Footjob;Handjob;Latex;Lingerie;Orgasm Denial;Pegging;Prostate Massage;Sex Toys;Stockings;Strap-on;Torture;Urethra Insertion;X-ray','Otochichi',4.08),
+(1752,'Ahegao;Band-Aid / Pasties;Big Areola;Big Ass;Blowjob;Bodysuit;Breast Sucking;Cheating;Deepthroat;Hairy;Huge Breasts;Large Breasts;Megane;MILF;Netori;Transparent Clothing;Virginity (Male)','Otochichi',4.69),
+(1753,'Blowjob;Bondage;Defloration;Femdom;Megane;Reverse Rape;Yandere','Otochichi',3.64),
+(1754,'Ahegao;Bikini;Blindfold;Blowjob;Lactation;Large Breasts;MILF;Nakadashi;Office Lady;Swimsuit','Otochichi',4.64),
+(1755,'Anal;Armpit;CBT;Chastity Belt;Femdom;Footjob;Pegging;Prostate Massage;Urethra Insertion','Otochichi',3.86),
+(1756,'Anal;Bondage;CBT;Femdom;Footjob;Onahole;Pegging;Prostate Massage;Sex Toys;Slave;Strap-on;Urethra Insertion;Watersports','Otochichi',2.97),
+(1757,'Anal;BDSM;Bondage;CBT;Femdom;Foot Fetish;Footjob;Handjob;Pantyhose;Pegging;Stockings;Strap-on;Urethra Insertion','Otochichi',3.9),
+(1758,'BBW;Big Areola;Big Ass;Cheating;Comedy;Decensored;Deepthroat;Drugs;Femdom;Hairy;Handjob;Happy Sex;Harem;Impregnation;Incest;Lactation;Large Breasts;Leg Lock;Mask;Masturbation;MILF;Mother;Nipple Penetration;Plump;Story Arc;Threesome;Virginity (Male);X-ray','Otochichi',4.62),
+(1759,'Ahegao;Assjob;BBW;Big Ass;Blowjob;Femdom;Huge Breasts;Huge Penis;Incest;Large Breasts;Megane;MILF;Mother;Netori;Plump;Slut;Virginity (Male)','Otochichi',4.35),
+(1760,'Anal;BBM / Fat Man;Blowjob;Femdom;Handjob;Happy Sex;Loli;Pegging;Prostate Massage;Sex Toys;Strap-on;Urethra Insertion','Otochichi',3.89),
+(1761,'BBW;Blowjob;Cheating;Comedy;Dojikko;Exhibitionism;Handjob;Impregnation;Incest;Inseki;Large Breasts;MILF;Mother;Nakadashi;Pregnant','Otochichi',4.65),
+(1762,'Ahegao;Anal;Band-Aid / Pasties;BBW;BDSM;Big Ass;Bikini;Blowjob;Bodysuit;Bondage;Cervical Penetration;Cheating;Daughter;Defloration;Group Sex;Hairy Armpits;Impregnation;Incest;Inseki;Inverted Nipples;Lactation;Large Breasts;Latex;Megane;MILF;Mother;Mouth Gag;Nakadashi;Oyakodon;Paizuri;Piercings;Plump;Pregnant;Sex Toys;Spanking;Squirting;Stockings;Straight Shota;Sweating;Swimsuit;Tankoubon;Threesome;Virginity (Male)','Otochichi',4.65),
+(1763,'Ahegao;Anal;BBW;Big Ass;Blowjob;Cheating;Femdom;Hairy;Hairy Armpits;Harem;Huge Breasts;Impregnation;Incest;Inverted Nipples;Lactation;Large Breasts;Megane;MILF;Mother;Plump;Sex Toys;Slut;Stockings;Story Arc;Virginity (Male);X-ray','Otochichi',4.57),
+(1764,'Anal;Bikini;Blowjob;Femdom;Fisting;Group Sex;Loli;Orgasm Denial;Pegging;Prostate Massage;Sex Toys;Strap-on;Swimsuit;Urethra Insertion','Otochichi',3.02),
+(1765,'Assjob;Big Ass;Blowjob;Cheating;Cheerleader;Femdom;Huge Breasts;Lactation;Large Breasts;Lingerie;Megane;MILF;Nakadashi;Nurse;Paizuri;Pantyhose;School Uniform;Stockings;Straight Shota;Tall Girl;Tankoubon;Teacher;Tutor;Virginity (Male)','Saranaru Takami',4.17),
+(1766,'Anal;Blindfold;Blowjob;Cervical Penetration;Double Penetration;Femdom;Group Sex;Nakadashi;Short Hair;Straight Shota;Uncensored','Fishine;Ireading',4.48),
+(1767,'BBW;Big Ass;Blowjob;Hairy;Hairy Armpits;Happy Sex;Incest;Large Breasts;MILF;Mother;Nakadashi;Naked Apron;NEET / Hikkikomori;Netori;Sleeping','Otochichi',4.48),
+(1768,'Blowjob;Demon Girl | Succubus;Large Breasts;Megane;Nakadashi;School Uniform;Sweating;X-ray','Sasamori Tomoe',4.51),
+(1769,'Blowjob;Demon Girl | Succubus;Femdom;Large Breasts;Maid;Megane;Nakadashi;Paizuri;School Uniform;Stockings','Sasamori Tomoe',4.63),
+(1770,'Big Ass;Footjob;Happy Sex;Nakadashi;Pantyhose;Pettanko;School Uniform;Stockings;Uncensored','Satozaki',4.46),
+(1771,'Anal;Blowjob;Group Sex;Handjob;Large Breasts;Nakadashi;Paizuri;Slut;Uncensored','Soramame-san',3.6),
+(1772,'Ahegao;Anal;BDSM;Blowjob;Bondage;Deepthroat;Double Penetration;Exhibitionism;Gangbang;Group Sex;Maledom;Nakadashi;Paizuri;Sex Toys;Spitroast;Stockings;Uncensored;X-ray','Soramame-san',3.46),
+(1773,'Blowjob;Exhibitionism;Femdom;Footjob;Large Breasts;School Uniform;Short Hair;Uncensored;Yandere','Suzushiro Nazuna',4.26),
+(1774,'Big Ass;Blowjob;Breast Sucking;Happy Sex;Large Breasts;Maid;Nakadashi;Paizuri;Short Hair;Tomboy;Uncensored','Syowmaru',4.68),
+(1775,'Blowjob;Bunnygirl;Cosplay;Happy Sex;Large Breasts;Leotard;Nakadashi;Short Hair;Tomboy;Uncensored','Syowmaru',4.82),
+(1776,'Anilingus;Blowjob;Femdom;Footjob;Large Breasts;Licking;School Uniform;Short Hair;Uncensored','Satetsu',3.73),
+(1777,'Childhood Friend;Cosplay;Happy Sex;Maid;Nakadashi;Stockings;Twintails;Uncensored','Sakofu',4.33),
+(1778,'Blowjob;Cunnilingus;Elder Sister;Incest;Large Breasts;Nakadashi;Paizuri;Sixty-Nine;Uncensored','Shinonome Ryu',4.64),
+(1779,'Ahegao;Blowjob;Fangs;Large Breasts;Masturbation;Nakadashi;Stockings;Swimsuit;Twintails;Uncensored','Rokkaku Yasosuke',4.54),
+(1780,'Ahegao;Blowjob;Bondage;Large Breasts;Masturbation;Nakadashi;Sex Toys;Uncensored;X-ray','Rico',4.69),
+(1781,'Anal;Blowjob;Double Penetration;Group Sex;Handjob;Nakadashi;Short Hair;Threesome;Uncensored','RAITA',3.6),
+(1782,'Blowjob;Breast Expansion;Breast Sucking;Collar;Dark Skin;Dirty Old Man;French Kissing;Group Sex;Hairy;Hairy Armpits;Huge Penis;Incest;Large Breasts;Loli;MILF;Mind Break;Mind Control;Nakadashi;Prostitution;Straight Shota;Threesome','Abubu',4.39),
+(1783,'Anal;Femdom;Filming;Group Sex;Large Breasts;MILF;Nakadashi;Pegging;Small Penis;Stockings;Straight Shota;Strap-on;Threesome','Saigado',3.83),
+(1784,'Blowjob;Defloration;Fingering;Licking;Monster Girl;Nakadashi','Ashika',4.4),
+(1785,'Anilingus;Assjob;Blowjob;Cheating;Condom;Cunnilingus;Deepthroat;Fingering;Footjob;Full Color;Incest;MILF;Mother;Nakadashi;Netori;Paizuri','',4.62),
+(1786,'Cheating;Full Color;Incest;Masturbation;MILF;Mother;Nakadashi;Netori;Sex on the Phone;Sleeping;Straight Shota','Horsetail',4.41),
+(1787,'Bikini;Blowjob;Cheating;Full Color;Incest;Large Breasts;MILF;Mother;Nakadashi;Paizuri;Swimsuit','',4.44),
+(1788,'BBW;Big Ass;Blowjob;Dark Skin;Filming;Group Sex;Large Breasts;Nakadashi;Paizuri;Plump;Threesome','Poccora',3.52),
+(1789,'Anal;Blowjob;Crossdressing;Gloves;Maid;Males only;Shota;Stockings;Trap;Twintails;Yaoi','Mogiki Hayami',4.59),
+(1790,'Blowjob;Childhood Friend;Defloration;French Kissing;Happy Sex;Huge Penis;Large Breasts;Monster;Nakadashi;Oni;Pantyhose;Virginity (Male);X-ray','Simon',4.51),
+(1791,'Bisexual;Group Sex;School Uniform;Stockings;Sweating;Threesome','Nakano Sora',4.29),
+(1792,'Ahegao;Bunnygirl;Huge Penis;Impregnation;Large Breasts;Leotard;Loli;Nakadashi','Korotsuke',3.98),
+(1793,'Blowjob;Happy Sex;Nakadashi;School Uniform;Tsundere;Twintails;X-ray','SAKULA',4.76),
+(1794,'Blowjob;Happy Sex;Large Breasts;Nakadashi;Uncensored','Nokin',4.73),
+(1795,'Blowjob;Elf;Gloves;Large Breasts;Monster;Nakadashi;Paizuri;Straight Shota;Tentacles;Uncensored;X-ray','Noragami Souta',4.23),
+(1796,'Fingering;French Kissing;Hotpants;Imouto;Impregnation;Incest;Large Breasts;Licking;Nakadashi;Short Hair;Uncensored;X-ray','Nozi',4.43),
+(1797,'Ahegao;Anal;Blowjob;Exhibitionism;Large Breasts;Nakadashi;Sex Toys;Stockings;Twintails;Uncensored','Puyocha | YO',4.54),
+(1798,'Breast Sucking;Defloration;French Kissing;Hairy;Happy Sex;Large Breasts;Megane;Nakadashi;Uncensored;Virginity (Male)','Niimaru Yuu',4.68),
+(1799,'Cheating;Large Breasts;Nakadashi;School Uniform;Short Hair;Uncensored;X-ray','Napata',4.12),
+(1800,'Blowjob;Large Breasts;Nakadashi;Paizuri;Pantyhose;School Uniform;Shimapan;Stockings;Uncensored','Mutsuki Haru',4.76),
+(1801,'Big Ass;Exhibitionism;Hairy;Nakadashi;School Uniform;Uncensored','Mutsuki Haru',4.7),
+(1802,'Animal Girl;Blowjob;Cunnilingus;Demon Girl | Succubus;Face Sitting;Fingering;Group Sex;Handjob;Harem;Loli;Nakadashi;School Uniform;Shimaidon;Stockings;Swimsuit;Threesome;Twins;Uncensored;X-ray','Mutou Mato',4.62),
+(1803,'Animal Girl;Blowjob;Demon Girl | Succubus;Group Sex;Harem;Leg Lock;Loli;Nakadashi;School Uniform;Short Hair;Spreading;Stockings;Twintails;Uncensored;X-ray','Mutou Mato',4.68),
+(1804,'Ahegao;Fingering;French Kissing;Hairy;Happy Sex;Inverted Nipples;Large Breasts;Lingerie;Megane;Nakadashi;Uncensored','Momoco',4.81),
+(1805,'Anal;Bloomers;Blowjob;Full Color;Group Sex;Large Breasts;Prostitution;School Swimsuit;School Uniform;Swimsuit','Mogudan',3.81),
+(1806,'Anal;Animal Girl;Blowjob;Crossdressing;Frotting;Full Color;Leotard;Males only;Nakadashi;Nurse;School Swimsuit;Shota;Stockings;Swimsuit;Trap;Yaoi','WLHO',4.31),
+(1807,'Ahegao;Big Ass;Blowjob;Childhood Friend;Condom;Defloration;Happy Sex;Large Breasts;Shimapan;Stockings;Tsundere;Uncensored;Virginity (Male)','mogg',4.67),
+(1808,'Happy Sex;Large Breasts;Megane;Nakadashi;Short Hair;Uncensored','Michiking',4.71),
+(1809,'Footjob;Happy Sex;Large Breasts;Maid;Nakadashi;Shimapan;Short Hair;Stockings;Uncensored','Michiking',4.71),
+(1810,'Hairy;Handjob;Large Breasts;Nakadashi;Uncensored','Mikarin',4.35),
+(1811,'Blowjob;Defloration;Happy Sex;Large Breasts;Nakadashi;Teacher;Uncensored;Virginity (Male)','MGMEE',4.59),
+(1812,'Blowjob;Defloration;Hairy;Happy Sex;Large Breasts;Lingerie;Nakadashi;Stockings;Uncensored;Virginity (Male);X-ray','Meme 50',4.71),
+(1813,'Elder Sister;Group Sex;Imouto;Incest;Large Breasts;Layer Cake;Shimaidon','SABUROU',4.31),
+(1814,'Handjob;Happy Sex;Loli;Nakadashi;Pajamas;Sumata','Satuyo',4.26),
+(1815,'Defloration;Happy Sex;Inverted Nipples;Nakadashi;School Uniform;Short Hair;Tomboy;Virginity (Male)','Z-Ton',4.68),
+(1816,'Animal Girl;Blowjob;Bunnygirl;Huge Breasts;Large Breasts;Paizuri','Kanten',4.5),
+(1817,'Anal;Blowjob;Futanari;Futanari on Futanari;Group Sex;Large Breasts;Male on Futa;Shota;Threesome','Musashino Sekai',4.08),
+(1818,'Blowjob;Defloration;Gender Bender;Large Breasts;Nakadashi;Paizuri','Kasuga Mayu',4.5),
+(1819,'Big Ass;Bloomers;Blowjob;DILF;Large Breasts;Megane;Nakadashi;School Uniform;Short Hair','Mogudan',3.44),
+(1820,'Bondage;Crossdressing;Dirty Old Man;School Uniform;Shibari;Shota;Yaoi','Daichi',3.07),
+(1821,'Bestiality;Defloration;Elf;Full Color;Group Sex;Impregnation;Large Breasts;Mind Break;Monster;Nakadashi;Orc;Pig;Pregnant;Rape;Threesome','Sanrokumaru',3.53),
+(1822,'Blowjob;Cheating;Full Color;Hairy;MILF;Nakadashi;Straight Shota','Suzuki Dogezaemon',3.66),
+(1823,'Blowjob;Breast Sucking;Fingering;French Kissing;Happy Sex;Nakadashi','Napata',4.67),
+(1824,'Fingering;Happy Sex;Idol;School Uniform','Napata',4.48),
+(1825,'Anal;Anilingus;Big Ass;Blowjob;Group Sex;Lactation;Large Breasts;Magical Girl;Multiple Insertion;Paizuri;Stockings;Straight Shota;X-ray','Nakano Sora',4.11),
+(1826,'Cunnilingus;Face Sitting;Femdom;Group Sex;Harem;Large Breasts;Nakadashi;Paizuri;Prostate Massage;School Uniform;Straight Shota;Virginity (Male)','Nakano Sora',3.71),
+(1827,'Full Color;Gender Bender;Large Breasts;Megane;Selfcest','Reitoumikan',4.35),
+(1828,'Ahegao;Big Ass;Blackmail;Blowjob;Double Penetration;Femdom;Gaping;Group Sex;Handjob;Impregnation;Large Breasts;MILF;Mother;Multiple Insertion;Nakadashi;Paizuri;Pregnant;Prostitution;Stockings;Threesome','Sawada Daisuke',3.52),
+(1829,'Happy Sex;Imouto;Incest;Loli;Nakadashi;Short Hair;X-ray','Ichihaya',4.42),
+(1830,'Imouto;Incest;Loli;Nakadashi;Rape;School Uniform','Ichihaya',4.27),
+(1831,'Happy Sex;Imouto;Incest;Loli','Ichihaya',4.49),
+(1832,'Autofellatio;Bodysuit;Futanari;Huge Penis;Large Breasts;Paizuri','Mugen no Ossan',3.13),
+(1833,'Inverted Nipples;Large Breasts;Military Uniform;Nakadashi;Stockings','Akiduki Akina',4.21),
+(1834,'Drugs;Group Sex;Large Breasts;Paizuri;Short Hair;Stockings;Symbol Shaped Pupils;X-ray','Mukoujima Tenro',4.06),
+(1835,'Big Ass;Cunnilingus;Hairy;Happy Sex;Large Breasts;School Uniform;Short Hair;Tall Girl;Tomboy;Uncensored','utu',4.7),
+(1836,'Ahegao;Anal;Big Ass;Blowjob;Deepthroat;Group Sex;Large Breasts;Miko;Uncensored','wakamesan',3.21),
+(1837,'Ahegao;Blackmail;Blowjob;Deepthroat;Exhibitionism;Filming;French Kissing;Large Breasts;Nakadashi;School Uniform;Shimapan;Short Hair;Teacher;Uncensored','Waves',4.0),
+(1838,'Blindfold;Condom;Cunnilingus;Hairy;Happy Sex;School Uniform;Uncensored','Yamada Yuuya',4.64),
+(1839,'Blowjob;Cheating;Nakadashi;Smell;Spats;Uncensored','Yuzuriha',4.18),
+(1840,'BBW;Big Ass;Blowjob;Large Breasts;Nakadashi;Plump;Uncensored','zasha',4.63),
+(1841,'Cunnilingus;Dark Skin;DILF;Hairy;Happy Sex;Nakadashi;Uncensored','Ushino Kandume',4.74),
+(1842,'Animal Girl;Breast Sucking;Fox Girl;Group Sex;Happy Sex;Hotpants;Large Breasts;Layer Cake;Monster Girl;Nakadashi;Paizuri;Sweating;Threesome;Uncensored;Yuri','Tsukitokage',4.7),
+(1843,'Blowjob;Large Breasts;Nakadashi;School Uniform;Sex Toys;Stockings;Uncensored;X-ray','Toyo',4.62),
+(1844,'Ahegao;Big Ass;Blowjob;Handjob;Happy Sex;Large Breasts;Nakadashi;School Uniform;Uncensored;X-ray','Thomas',4.69),
+(1845,'Blowjob;Happy Sex;Masturbation;Nakadashi;Pettanko;Twintails;Uncensored;X-ray','Tetsuyama Kaya',4.62),
+(1846,'Big Ass;Blowjob;Cheating;Condom;Huge Breasts;MILF;Netori;Uncensored','Tabigarasu',4.27),
+(1847,'Ahegao;Cunnilingus;Happy Sex;Large Breasts;Nakadashi;School Swimsuit;Swimsuit;X-ray','Rou',4.0),
+(1848,'Blowjob;Large Breasts;Prostitution','',2.18),
+(1849,'Ahegao;BBW;Big Ass;Cheating;Dark Skin;Full Color;Huge Breasts;Huge Penis;Incest;Large Breasts;Megane;MILF;Mother;Nakadashi;Netorare;School Uniform;Story Arc;X-ray','',3.74),
+(1850,'Ahegao;BBW;Big Ass;Elder Sister;Full Color;Gokkun;Harem;Hotpants;Huge Breasts;Huge Penis;Imouto;Impregnation;Incest;Lactation;Large Breasts;MILF;Mother;Nakadashi;Smell;Squirting;Virginity (Male);Watersports;X-ray;Yandere','',2.8),
+(1851,'Blindfold;Bondage;Condom;Femdom;Full Color;Incest;Large Breasts;Lingerie;MILF;Mother;Nakadashi;Stockings;Straight Shota','Izayoi no Kiki',4.21),
+(1852,'Blindfold;Decensored;Face Sitting;Femdom;Footjob;Full Color;Group Sex;Loli;Nakadashi;Prostitution;Threesome;Watersports','MUK',4.62),
+(1853,'Ahegao;BDSM;Blowjob;Bondage;Condom;Decensored;Doll;Femdom;Fingering;French Kissing;Full Color;Ghost;Gokkun;Happy Sex;Huge Penis;Licking;Loli;Nakadashi;Reverse NTR;Reverse Rape;Slave;Symbol Shaped Pupils;Yandere','MUK',4.66),
+(1854,'Decensored;Defloration;Demon Girl | Succubus;Femdom;Full Color;Handjob;Happy Sex;Loli;Monster Girl;Nakadashi;Short Hair;Stockings;Sumata','MUK',4.55),
+(1855,'Crotchless / Breastless;Cunnilingus;Happy Sex;Large Breasts;Lingerie;Short Hair','Kurokoshi You',4.8),
+(1856,'Condom;French Kissing;Happy Sex;School Uniform','Jorori',4.77),
+(1857,'Ahegao;Cheating;Defloration;Group Sex;Imouto;Incest;Threesome;Twintails;X-ray','Narusawa Kei',4.56),
+(1858,'Anilingus;Blackmail;Bondage;Elder Sister;Face Sitting;Femdom;Impregnation;Incest;Inseki;Large Breasts;Nakadashi;Paizuri;School Uniform;Straight Shota;Virginity (Male);X-ray','Narusawa Kei',3.86),
+(1859,'Impregnation;Lactation;Large Breasts;School Uniform;X-ray','Narusawa Kei',4.6),
+(1860,'Animal Girl;Blowjob;Cunnilingus;Fox Girl;Happy Sex;Large Breasts;Sixty-Nine','Nekodanshaku',4.83),
+(1861,'Blowjob;Condom;Impregnation;Large Breasts;MILF;Nakadashi;Short Hair;Virginity (Male);X-ray','Oomori Makoto',4.17),
+(1862,'Bisexual;Gender Bender;Group Sex;Sex Toys;Yuri','Inochi Wazuka',3.73),
+(1863,'Ahegao;Big Ass;Full Color;Grandmother;Huge Breasts;Huge Penis;Incest;Inseki;Large Breasts;Megane;MILF;Mother','',2.67),
+(1864,'BBW;Cheating;Hairy;Huge Breasts;Large Breasts;Megane;MILF;Nakadashi;Swinging / Netorase;Virginity (Male)','',3.5),
+(1865,'Big Areola;Blowjob;Cheating;Deepthroat;Full Color;Large Breasts;MILF;Nakadashi;X-ray','',3.6),
+(1866,'Ahegao;Anal;Cheating;Double Penetration;Exhibitionism;Full Color;Group Sex;Huge Penis;Large Breasts;Megane;MILF;Nakadashi;Threesome;X-ray','',4.0),
+(1867,'Ahegao;Big Ass;Blowjob;Cervical Penetration;Cunnilingus;Elder Sister;French Kissing;Full Color;Happy Sex;Incest;Large Breasts;Leg Lock;Megane;Nakadashi;Plump;Sixty-Nine;X-ray','',3.14),
+(1868,'Ahegao;BBW;Cervical Penetration;Full Color;Huge Breasts;Huge Penis;Impregnation;Incest;Large Breasts;MILF;Mother;Nakadashi;X-ray','',2.62),
+(1869,'Ahegao;Aunt;BBW;Big Areola;Big Ass;Bikini;Blowjob;Femdom;Full Color;Huge Breasts;Huge Penis;Incest;Large Breasts;Megane;MILF;Rape;Swimsuit;Virginity (Male)','',2.62),
+(1870,'Ahegao;Aunt;BBW;Big Areola;Blowjob;Deepthroat;Full Color;Group Sex;Huge Breasts;Huge Penis;Impregnation;Incest;Large Breasts;Megane;MILF;Nakadashi;Threesome;X-ray','',3.17),
+(1871,'Anal;Crossdressing;Father;Incest;Males only;Onahole;Shota;Stockings;Trap;Yaoi','Minase Seri',4.07),
+(1872,'Anal;Crossdressing;Maid;Males only;Shota;Smegma;Stuck in Wall;Trap;Watersports;X-ray;Yaoi','Matsunoan',4.1),
+(1873,'Large Breasts;Nakadashi;Uncensored;X-ray','Sakurazari Hotori',4.59),
+(1874,'Blowjob;Cunnilingus;Large Breasts;Nakadashi;Stockings;Uncensored','Okara',4.5),
+(1875,'Hairy;Handjob;Large Breasts;Nakadashi;School Uniform;Uncensored','Ichiko',4.68),
+(1876,'Blowjob;Nakadashi;Pettanko;Uncensored','Konchiki',4.72),
+(1877,'BBW;Big Ass;Blowjob;Cosplay;Cunnilingus;Happy Sex;Large Breasts;Megane;Nakadashi;Plump;Stockings;Twintails;Uncensored','zasha',4.6),
+(1878,'Blowjob;Cheating;Hairy;Nakadashi;Stockings;Uncensored;Yandere','Takemasa Takeshi',3.86),
+(1879,'Ahegao;Condom;Dirty Old Man;Emotionless Sex;French Kissing;Nakadashi;School Uniform;Slut;Stockings;Tsundere;Uncensored','Gengorou',4.28),
+(1880,'Breast Sucking;Footjob;French Kissing;Handjob;Large Breasts;Nakadashi;School Uniform;Stockings;Symbol Shaped Pupils;Teacher;Uncensored;X-ray','Oouso',4.0),
+(1881,'Ahegao;Fingering;Licking;Masturbation;Nakadashi;Pettanko;Stockings;Uncensored','fu-ta',4.38),
+(1882,'Blowjob;Breast Sucking;Cunnilingus;Elf;French Kissing;Happy Sex;Impregnation;Large Breasts;Nakadashi;Paizuri;Pregnant;Sixty-Nine;Stockings;Symbol Shaped Pupils;Uncensored','Emily',4.75),
+(1883,'Blowjob;Exhibitionism;Femdom;Handjob;Inverted Nipples;Loli;Nakadashi;Uncensored','Kikaider Reijhiro',4.13),
+(1884,'Band-Aid / Pasties;Blowjob;Breast Sucking;Cheating;Exhibitionism;French Kissing;Happy Sex;Large Breasts;Lingerie;Nakadashi;Tomboy;Uncensored;Virginity (Male)','Kusatsu Terunyo',3.59),
+(1885,'Blowjob;Defloration;French Kissing;Hairy;Happy Sex;Large Breasts;School Uniform;Stockings;Uncensored','Reco',4.71),
+(1886,'Ahegao;Anilingus;BBW;Blowjob;Cheating;Deepthroat;Dirty Old Man;Hairy;Large Breasts;MILF;Mind Control;Nakadashi;Netorare;Smegma;X-ray','Shuten Douji',4.0),
+(1887,'Animal Girl;BBW;Big Ass;Furry;Large Breasts;MILF;Paizuri;Straight Shota','UNp',3.75),
+(1888,'Ahegao;Anal;Blackmail;Blowjob;Double Penetration;Group Sex;Human Toilet;Large Breasts;Nakadashi;Rape;Slave','Naruhodo',2.75),
+(1889,'Ahegao;Blowjob;Fingering;Gangbang;Handjob;Huge Breasts;Huge Penis;Large Breasts;Nakadashi;Paizuri;Slut;Spitroast;Stomach Bulge','Naruhodo',4.16),
+(1890,'Ahegao;Anal;Big Ass;Blowjob;Breast Sucking;Gangbang;Group Sex;Huge Breasts;Impregnation;Large Breasts;Nakadashi;Paizuri;Rape;Spitroast;X-ray','Naruhodo',4.43),
+(1891,'Breast Sucking;Impregnation;Incest;Large Breasts;Megane;MILF;Mother;Nakadashi;Straight Shota','Daigo',4.64),
+(1892,'Ahegao;Blowjob;Cheating;Deepthroat;Fingering;Hotpants;Huge Penis;Incest;Large Breasts;MILF;Mind Break;Mother;Nakadashi;Story Arc;Sweating;Virginity (Male)','Hoyoyo',3.3),
+(1893,'Cheating;Full Color;Huge Penis;Incest;Large Breasts;MILF;Mother','Hoyoyo',3.5),
+(1894,'Band-Aid / Pasties;Blindfold;Bloomers;Bondage;Cheating;Full Color;Huge Penis;Incest;Large Breasts;Leg Lock;MILF;Mother;Nakadashi;Sex Toys','Hoyoyo',3.25),
+(1895,'Ahegao;Blowjob;Cheating;Deepthroat;Huge Penis;Incest;Large Breasts;MILF;Mother;Nakadashi;Virginity (Male)','Hoyoyo',3.56),
+(1896,'Ahegao;Anal;Crossdressing;Group Sex;Males only;Mind Break;Mind Control;Prostate Massage;Rape;Sex Toys;Shota;Stockings;Trap;Urethra Insertion;Yaoi','Katou Chakichi',3.5),
+(1897,'Blowjob;Maid;Masturbation;Nakadashi;Pantyhose;Phimosis;Stockings;Straight Shota;Virginity (Male);Waitress;Watersports;X-ray','Morishima Kon',4.42),
+(1898,'Chikan;Defloration;Femdom;Large Breasts;Megane;School Uniform;Straight Shota;Tall Girl','Morishima Kon',4.63),
+(1899,'Blowjob;Bukkake;Exhibitionism;Gokkun;Group Sex;Human Toilet;Large Breasts;Mind Control;Stockings;Threesome','Hiyo Hiyo',4.0),
+(1900,'Anal;BBM / Fat Man;Crossdressing;Dark Skin;Foot Fetish;Lactation;Licking;Maledom;Netorare;Prostate Massage;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Kawaisaw',2.88),
+(1901,'Anal;Crossdressing;Demon | Incubus;Males only;Shota;Stockings;Trap;Yaoi','Nokoppa',4.55),
+(1902,'Ahegao;Anal;BBM / Fat Man;Big Areola;Birth;Bisexual;Bondage;Crossdressing;Dark Skin;Daughter;Decensored;Elf;Father;Femdom;Gaping;Granddaughter;Group Sex;Huge Breasts;Huge Penis;Impregnation;Incest;Large Breasts;Lingerie;Loli;Mind Break;Nakadashi;Netorare;Oppai Loli;Oyakodon;Piercings;Pregnant;Prolapse;Prostitution;Rape;Sex Toys;Shota;Slave;Stockings;Tattoo;Trap;Yaoi','Neromashin',3.77),
+(1903,'Anal;BBM / Fat Man;Birth;Bisexual;Crotchless / Breastless;Daughter;Defloration;Elf;Exhibitionism;Fisting;Group Sex;Hairy;Hairy Armpits;Huge Breasts;Huge Penis;Human Cattle;Human Toilet;Humiliation;Impregnation;Incest;Lactation;Large Breasts;Loli;MILF;Mind Break;Monster;Mother;Nakadashi;Netorare;Orc;Oyakodon;Piercings;Pregnant;Prostitution;Rape;Scat;Slave;Stockings;Straight Shota','Neromashin',3.65),
+(1904,'Ahegao;Anal;BDSM;Birth;Blindfold;Bondage;Defloration;Double Penetration;Drugs;Elf;Enema;Group Sex;Hairy;Hairy Armpits;Impregnation;Large Breasts;Loli;Mind Break;Nakadashi;Orgasm Denial;Piercings;Pregnant;Rape;Scat;Sex Toys;Stockings;Straight Shota;Tattoo','Neromashin',3.94),
+(1905,'Demon Girl | Succubus;Femdom;Footjob;Latex;Loli;Monster Girl;Prostitution;Stockings;Symbol Shaped Pupils;Tailjob;Wings','Yasha',3.41),
+(1906,'Anal;Bikini;Crossdressing;Incest;Males only;Otouto;Shota;Swimsuit;Trap;Yaoi','Hanamaki Kaeru',4.52),
+(1907,'Anal;Crossdressing;Happy Sex;Lingerie;Males only;Nakadashi;Shota;Trap;Yaoi','Binto',4.6),
+(1908,'Dark Skin;DILF;Double Penetration;Gender Bender;Group Sex;Large Breasts;Lingerie;Nakadashi;Short Hair;Stockings;Swimsuit','Ikeshita Maue',4.19),
+(1909,'Big Ass;Cosplay;Happy Sex;Large Breasts;Loli;Megane;Monster;Monster Girl;Nakadashi;Nipple Penetration;Paizuri;Slime Girl;Sweating;Transformation;X-ray','ron',4.57),
+(1910,'Anal;Bisexual;Blowjob;Deepthroat;Femdom;Group Sex;Large Breasts;Nakadashi;Trap;Yaoi','Nishida',4.46),
+(1911,'Ahegao;Anilingus;Animal Girl;Armpit;Blowjob;Bodysuit;Breast Sucking;Catgirl;Collar;Cunnilingus;Dark Skin;Defloration;Drugs;Elder Sister;Fangs;Femdom;French Kissing;Group Sex;Happy Sex;Imouto;Impregnation;Incest;Kimono / Yukata;Large Breasts;Layer Cake;Licking;Lingerie;Maledom;Nakadashi;Paizuri;Pet Girl;Shimaidon;Smell;Squirting;Stockings;Story Arc;Sweating;Tall Girl;Threesome;Twins;Watersports;X-ray','Suzuhane Suzu',4.76),
+(1912,'Anal;Cheerleader;Crossdressing;Elf;Group Sex;Males only;Selfcest;Shota;Trap;Yaoi','MM',4.35),
+(1913,'Anal;Crossdressing;Full Color;Males only;Nakadashi;Shota;Stockings;Symbol Shaped Pupils;Trap;Twintails;Yaoi','Shinya',4.59),
+(1914,'Anal;Full Color;Males only;Shota;Trap;Yaoi','Lantana',4.56),
+(1915,'Blowjob;Dark Skin;Impregnation;Incest;Large Breasts;MILF;Mother;Muscle;Pregnant;Short Hair;Straight Shota;Tanlines','Bu-chan',4.17),
+(1916,'Ahegao;Bestiality;Birth;Blowjob;Bondage;Decensored;Defloration;Horse;Huge Penis;Impregnation;Large Breasts;Mind Break;Mouth Gag;Nakadashi;Pregnant;Rape;X-ray','Satou Souji',3.69),
+(1917,'Blowjob;Handjob;Large Breasts;Lingerie;Military Uniform;Stockings','Ribyuhki',4.38),
+(1918,'Big Ass;Blowjob;Large Breasts;MILF;Multiple Insertion;Nakadashi;Phimosis;Sex Toys;Stockings;Straight Shota;Sumata;Teacher','Takatsu',4.36),
+(1919,'BBW;Bondage;Comedy;Handjob;Large Breasts;Nakadashi;Paizuri;Plump;Stockings;Twintails;Uncensored','Nanao Yukiji',4.66),
+(1920,'Ahegao;Anal;Cheating;Double Penetration;Group Sex;Large Breasts;MILF;Nakadashi;Piercings;Squirting;Threesome','Sunagawa Tara',3.69),
+(1921,'BBW;Blowjob;Cervical Penetration;Hairy;Impregnation;Incest;Large Breasts;MILF;Mother;Nakadashi;Straight Shota;X-ray','Yamamoto Yoshifumi',4.42),
+(1922,'Ahegao;Band-Aid / Pasties;BBW;Big Ass;Bikini;Blowjob;Bodysuit;Bukkake;Bunnygirl;Catgirl;CBT;Cheating;Chinese Dress;Cosplay;Elder Sister;Group Sex;Hairy;Huge Breasts;Huge Penis;Impregnation;Incest;Inseki;Large Breasts;Latex;Lingerie;MILF;Mother;Nakadashi;Paizuri;Stockings;Swimsuit;Tankoubon;Teacher;Threesome;Virginity (Male);Waitress;X-ray','Ando Hiroyuki',4.37),
+(1923,'Animal Girl;Big Ass;Furry;Large Breasts;Monster;Muscle;Nakadashi;Paizuri;Tall Girl;Uncensored;X-ray','Jyoka',4.02),
+(1924,'Ahegao;Blindfold;Blowjob;Body Modification;Bondage;Brain Fuck;Breast Expansion;Corruption;Dick Growth;Futa on Male;Futanari;Gokkun;Inverted Nipples;Large Breasts;Monster Girl;Stockings;Symbol Shaped Pupils;Tall Girl;Twintails;X-ray','Otoo',3.78),
+(1925,'Blowjob;Ghost;School Uniform','Natsume Tsuna',4.29),
+(1926,'Ahegao;Big Ass;Bikini;Blowjob;Cunnilingus;Group Sex;Handjob;Inseki;Large Breasts;Nakadashi;Paizuri;Plump;Shimaidon;Swimsuit;Twintails;Uncensored;X-ray','Arinotowatari',4.62),
+(1927,'Ahegao;Big Ass;Blowjob;Exhibitionism;Eyepatch;Huge Penis;Humiliation;Large Breasts;Leotard;Mask;Mind Break;Muscle;Nakadashi;Uncensored;X-ray','Survival Knife',4.05),
+(1928,'Ahegao;Blowjob;Gyaru;Large Breasts;Maid;Nakadashi;Stockings;Twintails;Uncensored','Maumen',4.47),
+(1929,'Anal;Crossdressing;Exhibitionism;Males only;Shota;Trap;Yaoi','Soranosuzume',4.32),
+(1930,'Anal;Crossdressing;Frotting;Males only;Nakadashi;Shota;Stockings;Trap;Yaoi','Nyu',4.39),
+(1931,'Ahegao;Anal;Armpit;Big Ass;Blowjob;Double Penetration;Group Sex;Large Breasts;MILF;Reverse Harem;X-ray','Numahana',3.79),
+(1932,'Ahegao;Blowjob;Breast Sucking;Lactation;Large Breasts;MILF;Nakadashi;Paizuri;Short Hair;Stockings;Straight Shota','Takatsu',4.43),
+(1933,'Blowjob;Crotchless / Breastless;Cunnilingus;Group Sex;Hairy;Large Breasts;Lingerie;Megane;Nakadashi;School Uniform;Stockings;Swimsuit;Tankoubon;Tanlines;Uncensored;X-ray','SAVAN',4.5),
+(1934,'Cheating;Dark Skin;Group Sex;Hairy;Large Breasts;Megane;Nakadashi;Nurse;School Uniform;Swimsuit;Tankoubon;Threesome;Uncensored','utu',4.64),
+(1935,'Anilingus;Big Ass;Blowjob;Demon Girl | Succubus;Femdom;Large Breasts;Leotard;Straight Shota;Virginity (Male)','ML',4.17),
+(1936,'Ahegao;Anal;BBW;Big Ass;Bloomers;Blowjob;Bodysuit;Bondage;Breast Expansion;Catgirl;Cheating;Dark Skin;Deepthroat;Defloration;Demon Girl | Succubus;Dick Growth;Dojikko;Double Penetration;Face Sitting;Fangs;Femdom;Foot Fetish;Footjob;Futa on Female;Futanari;Futanari on Futanari;Gangbang;Gender Bender;Group Sex;Hairjob;Handjob;Happy Sex;Large Breasts;Licking;Loli;Magical Girl;Masturbation;Mind Break;Monster Girl;Multiple Insertion;Nakadashi;Paizuri;Plump;Rape;Reverse Rape;Royalty;School Uniform;Shimapan;Short Hair;Sixty-Nine;Sleeping;Slime Girl;Slut;Small Penis;Spreading;Squirting;Stockings;Story Arc;Straight Shota;Tankoubon;Teacher;Tentacles;Threesome;Torn Clothing;Transformation;Twintails;Uncensored;Urethra Insertion;Vampire;Virginity (Male);Wings;Witch;X-ray','Doumou',4.31),
+(1937,'Ahegao;Anal;Blowjob;Cunnilingus;Dark Skin;Face Sitting;Femdom;Filming;Footjob;Group Sex;Hairy;Handjob;Incest;Inseki;Multiple Insertion;Nakadashi;Reverse Rape;School Uniform;Smell;Straight Shota;Symbol Shaped Pupils;Twintails;Uncensored;Urethra Insertion;Virginity (Male)','Azuma Tesshin',4.31),
+(1938,'Ahegao;Anal;Big Ass;Blowjob;Bukkake;Double Penetration;Gokkun;Group Sex;Large Breasts;Mask;Megane;Pantyhose;School Uniform;Shimapan;Slut;Smell;Stockings;Uncensored','Sexyturkey',4.23),
+(1939,'Animal Boy;Animal Girl;Blowjob;Catgirl;Large Breasts;Nakadashi;Plump;Shimapan;Straight Shota;Uncensored','Shiokonbu',4.43),
+(1940,'BBM / Fat Man;Bondage;Elf;Large Breasts;Nakadashi;Rape;Sex Toys;Slave;Stockings','Usagi Nagomu',4.11),
+(1941,'Crossdressing;Femdom;Footjob;Gender Bender;Short Hair;Straight Shota;Tomboy;Trap','Kito Sakeru',4.05),
+(1942,'Anal;Cheating;Hairy;Large Breasts;MILF;Nakadashi;Straight Shota','Minamida Usuke',4.51),
+(1943,'Anal;Blowjob;Futa on Male;Futanari;Group Sex;Males only;Nakadashi;Prostate Massage;Shota;Yaoi','Itoh Kani',3.81),
+(1944,'Anal;Anilingus;Blowjob;Crossdressing;French Kissing;Frotting;Gokkun;Handjob;Males only;Nakadashi;Shota;Trap;Yaoi','Hanamaki Kaeru',4.5),
+(1945,'Blowjob;Freckles;Full Color;Handjob;Happy Sex;Imouto;Incest;Large Breasts;Leg Lock;Nakadashi;Paizuri;School Uniform;Tanlines','Vanilla Type',4.08),
+(1946,'Bikini;Blowjob;Cunnilingus;Defloration;Hairy;Large Breasts;Nakadashi;Straight Shota;Sweating;Swimsuit;Tall Girl','846gou',4.38),
+(1947,'Ahegao;Blowjob;Large Breasts;Nakadashi;Paizuri;Stockings','Ashima Takumi',4.37),
+(1948,'Ahegao;BBW;Large Breasts;Leotard;Nakadashi;Plump;Reverse Rape;Stockings;Sweating;Tall Girl','soba',4.49),
+(1949,'Anal;Crossdressing;Femdom;Prostate Massage;School Uniform;Sex Toys;Stockings;Straight Shota;Trap','Gin Jyuji',3.63),
+(1950,'Anal;BBW;Big Ass;Blowjob;Hairy Armpits;Large Breasts;MILF;Straight Shota;Teacher;Virginity (Male);Watersports','Sugi G',4.55),
+(1951,'Big Ass;Cheating;Group Sex;Hairy;Incest;Large Breasts;Megane;MILF;Mother;Stockings;Threesome;Tutor','Natsu no Oyatsu',4.42),
+(1952,'Ahegao;Anal;Blowjob;Femdom;Group Sex;Incest;Large Breasts;Megane;MILF;Mother;Nakadashi;Pantyhose;Small Penis;Straight Shota;Strap-on;Symbol Shaped Pupils;Teacher;Threesome;Yandere','Itami',4.39),
+(1953,'Ahegao;Anal;Bathroom Sex;BBW;Big Ass;Blowjob;Cervical Penetration;Cheating;Cunnilingus;Defloration;Elder Sister;French Kissing;Group Sex;Hairy;Huge Breasts;Huge Penis;Impregnation;Incest;Large Breasts;Megane;Miko;MILF;Mother;Nakadashi;Oyakodon;Paizuri;Pantyhose;Sex on the Phone;Sixty-Nine;Stockings;Story Arc;Straight Shota;Swimsuit;Tankoubon;Teacher;Threesome;Virginity (Male);Widow;X-ray','Kai Hiroyuki',4.59),
+(1954,'Anal;Double Penetration;Group Sex;Happy Sex;Huge Breasts;Incest;Large Breasts;MILF;Mother;Nakadashi;Straight Shota;Threesome;Virginity (Male);Watersports;X-ray','Mizuiro Megane',4.05),
+(1955,'Big Ass;Exhibitionism;Incest;Large Breasts;MILF;Mother;Straight Shota;X-ray','Mizuiro Megane',4.27),
+(1956,'Bikini;Blowjob;Cunnilingus;Exhibitionism;Full Color;Happy Sex;Incest;Large Breasts;MILF;Mother;Story Arc;Straight Shota;Swimsuit','Mizuiro Megane',4.41),
+(1957,'Bathroom Sex;BBW;Big Ass;Blowjob;Exhibitionism;Hairy;Happy Sex;Impregnation;Incest;Lactation;Large Breasts;Megane;MILF;Mother;Nakadashi;Naked Apron;Sixty-Nine;Story Arc;Straight Shota;Watersports','Mizuiro Megane',4.53),
+(1958,'BBW;Blowjob;Breast Sucking;Christmas;Drunk;Hairy;Happy Sex;Incest;Masturbation;Megane;MILF;Mother;Straight Shota;X-ray','Mizuiro Megane',4.38),
+(1959,'Blowjob;Breast Sucking;Cunnilingus;Fingering;Happy Sex;Incest;Lactation;Large Breasts;MILF;Mother;Muscle;Paizuri;Sixty-Nine;Squirting;Straight Shota;Swimsuit;Tan;Tanlines;Widow','Mizuiro Megane',4.41),
+(1960,'Birth;Blowjob;Dark Skin;Double Penetration;Group Sex;Impregnation;Incest;Large Breasts;Masturbation;MILF;Mother;Muscle;Pregnant;Rape;Story Arc;Straight Shota;Zombie','Mizuiro Megane',3.3),
+(1961,'Ahegao;Anal;BBM / Fat Man;Blowjob;Drugs;Males only;Megane;Mind Break;Nakadashi;Prostate Massage;Rape;Shota;Sleeping;Stockings;Yaoi','Erutasuku',3.67),
+(1962,'Anal;Crossdressing;Latex;Males only;Orgasm Denial;Shota;Trap;Virginity (Male);Yaoi','Hanamaki Kaeru',4.32),
+(1963,'Blowjob;Bunnygirl;Cheating;Dark Skin;Demon Girl | Succubus;Leotard;Nakadashi;Reverse NTR;X-ray','Gorgonzola',4.64),
+(1964,'Anal;Animal Boy;Bikini;Crossdressing;Drugs;Idol;Males only;Rape;Sex Toys;Shota;Stockings;Swimsuit;Trap;Twintails;Yaoi','Inari',4.6),
+(1965,'Ahegao;Full Color;Large Breasts;Straight Shota','Rikka Kai',4.11),
+(1966,'BBM / Fat Man;Defloration;Double Penetration;Group Sex;Impregnation;Large Breasts;Lingerie;Mind Break;Nakadashi;Pregnant;Prostitution;Rape','Carn',3.67),
+(1967,'Anal;Anilingus;Blowjob;Cheating;DILF;Double Penetration;Group Sex;Large Breasts;Nakadashi;Slut;Straight Shota','Maguro Teikoku',3.54),
+(1968,'Breast Sucking;Full Color;Handjob;Impregnation;Incest;Large Breasts;MILF;Mother;Nakadashi;Paizuri;Pregnant;Straight Shota','Carburetor',4.03),
+(1969,'Blowjob;Dark Skin;Happy Sex;Large Breasts;Maid;Straight Shota','Takatsu',4.58),
+(1970,'Ahegao;Anilingus;Bathroom Sex;Big Ass;Bikini;Blindfold;Blowjob;Breast Sucking;Cunnilingus;Dark Skin;Daughter;Defloration;Demon Girl | Succubus;Drugs;Emotionless Sex;Exhibitionism;Femdom;Fingering;Foot Fetish;Group Sex;Hairy;Handjob;Happy Sex;Harem;Huge Breasts;Impregnation;Incest;Large Breasts;Loli;Maid;Maledom;Massage;Megane;MILF;Mother;Muscle;Nakadashi;Naked Apron;Oyakodon;Paizuri;Pantyhose;Prostate Massage;Reverse Rape;Sex on the Phone;Sex Toys;Short Hair;Stockings;Story Arc;Straight Shota;Sweating;Swimsuit;Symbol Shaped Pupils;Tankoubon;Threesome;Virginity (Male);Voyeurism;X-ray','Takatsu',4.61),
+(1971,'Anal;Big Ass;Blowjob;Cheerleader;Cunnilingus;Deepthroat;Double Penetration;Gangbang;Gender Bender;Group Sex;Handjob;Large Breasts;Loli;Pettanko;Rape;Sex Toys;Spitroast;Twintails;X-ray','Yoshiie',3.81),
+(1972,'Bloomers;Blowjob;Gangbang;Gender Bender;Group Sex;Impregnation;Large Breasts;Licking;Loli;Maid;Nakadashi;Pregnant;Rape;School Uniform;Spitroast;Straight Shota;X-ray','Yoshiie',4.0),
+(1973,'Anal;Blowjob;Deepthroat;Femdom;Filming;Gender Bender;Group Sex;Handjob;Leg Lock;Megane;Paizuri;Pegging;Prostate Massage;Prostitution;School Uniform;Sex Toys;Straight Shota;Teacher','Yoshiie',4.36),
+(1974,'Anal;Blowjob;Breast Sucking;Cunnilingus;Demon Girl | Succubus;Femdom;Fingering;Gender Bender;Gloves;Handjob;Impregnation;Large Breasts;Lingerie;Nakadashi;Paizuri;Phimosis;Pregnant;Prostate Massage;Short Hair;Slave;Small Penis;Stockings;Straight Shota;Sweating;Transformation;Virginity (Male);X-ray','Yoshiie',4.34),
+(1975,'Ahegao;Blowjob;Corruption;Deepthroat;Demon Girl | Succubus;Femdom;Futanari;Gender Bender;Loli;Mind Break;Monster Girl;Oppai Loli;Paizuri;Transformation;X-ray','RIR',4.47),
+(1976,'Demon Girl | Succubus;Gender Bender;Loli;Tattoo;Transformation','Uno Ryoku',3.55),
+(1977,'Anal;Crossdressing;Demon Girl | Succubus;Demon | Incubus;Femdom;Prostate Massage;Straight Shota;Symbol Shaped Pupils;Transformation;Urethra Insertion','RCA',4.27),
+(1978,'Animal Girl;Armpit;Fox Girl;Group Sex;Hairy;Hairy Armpits;Happy Sex;Impregnation;Large Breasts;MILF;Oni;Short Hair;Straight Shota;Symbol Shaped Pupils;Threesome','Tanishi',4.23),
+(1979,'Demon Girl | Succubus;Femdom;Group Sex;Large Breasts;Stockings;Straight Shota;Symbol Shaped Pupils;Threesome','HANABi',4.18),
+(1980,'Anal;Double Penetration;Elf;Femdom;Futa on Male;Futanari;Group Sex;Large Breasts;Multiple Insertion;Threesome;Vomit','Tokimachi Eisei',4.07),
+(1981,'Anal;Blowjob;Cunnilingus;Dark Skin;French Kissing;Handjob;Nakadashi;Pettanko;Prostate Massage;Stockings;Straight Shota;Uncensored','Woruto',4.59),
+(1982,'Blowjob;Cunnilingus;Handjob;Nakadashi;Pettanko;Prostate Massage;Stockings;Straight Shota;Uncensored;X-ray','Woruto',4.55),
+(1983,'Anal;Crossdressing;Elder Sister;Elf;Femdom;Futa on Male;Futanari;Huge Penis;Impregnation;Incest;Shota;Stockings;Trap','144',4.0),
+(1984,'Ahegao;Big Ass;Blowjob;Hairy;Large Breasts;MILF;Nakadashi;Office Lady;Sweating','Etuzan Jakusui',4.66),
+(1985,'Anal;Blowjob;Gloves;Happy Sex;Latex;Loli;Nakadashi;Stockings;Symbol Shaped Pupils;Twintails','Toyo',4.58),
+(1986,'Ahegao;Blowjob;Bunnygirl;Double Penetration;Drugs;Group Sex;Impregnation;Leotard;Loli;Mind Break;Pantyhose;Pregnant;Rape;Symbol Shaped Pupils;X-ray','Gui Fu Shen Nai',3.92),
+(1987,'Ahegao;Anilingus;Big Areola;Big Ass;Bisexual;Blowjob;Breast Sucking;Dark Skin;Defloration;Elf;French Kissing;Group Sex;Gyaru;Hairy;Harem;Huge Breasts;Impregnation;Inverted Nipples;Lactation;Large Breasts;Lingerie;MILF;Nakadashi;Paizuri;Pregnant;Stockings;Sweating;Threesome;Virginity (Male);X-ray','Mifune Seijirou',4.53),
+(1988,'Anilingus;Big Ass;Blowjob;Bukkake;Crotchless / Breastless;Futanari;Group Sex;Gyaru;Huge Breasts;Large Breasts;Lingerie;Male on Futa;Tanlines','Musashino Sekai',4.24),
+(1989,'Ahegao;Anal;Big Areola;Big Ass;Blowjob;Bondage;Breast Sucking;Chikan;Futanari;Group Sex;Huge Penis;Inverted Nipples;Lactation;Large Breasts;Licking;Lingerie;Male on Futa;Maledom;Mind Break;Mouth Gag;Rape;School Uniform;Sex Toys;Squirting','Musashino Sekai',3.98),
+(1990,'Ahegao;Anal;Bestiality;Cervical Penetration;Dark Skin;Group Sex;Horse;Lactation;Large Breasts;Prolapse;Stockings','Ahemaru | henrik',3.68),
+(1991,'Ahegao;BBM / Fat Man;Birth;Dark Skin;Group Sex;Impregnation;Lactation;Prolapse;Stockings','Ahemaru | henrik',3.75),
+(1992,'Ahegao;BBM / Fat Man;Blowjob;Dark Skin;Exhibitionism;Full Color;Lactation;Large Breasts;Nakadashi;Stockings','Taro',3.81),
+(1993,'Bikini;Blowjob;Cunnilingus;Deepthroat;Exhibitionism;Huge Penis;Kimono / Yukata;Loli;Nakadashi;Prostitution;Swimsuit;Symbol Shaped Pupils;Tan;Tanlines;Virginity (Male);X-ray','Tamagoro',4.62),
+(1994,'Blowjob;Cunnilingus;Deepthroat;Group Sex;Happy Sex;Licking;Loli;Nakadashi;Slut;Squirting;Twintails;X-ray','Tamagoro',4.62),
+(1995,'Breast Sucking;Fangs;Loli;Megane;Nakadashi;Prostitution;Tutor;Twintails;X-ray','Tamagoro',4.58),
+(1996,'Ahegao;Group Sex;Large Breasts;Layer Cake;Loli;Nakadashi;Oni;Threesome','Kousuke',4.62),
+(1997,'Blackmail;Body Swap;Bondage;Catgirl;Collar;Defloration;DILF;Emotionless Sex;Filming;Group Sex;Harem;Impregnation;Large Breasts;Loli;Megane;Mind Control;Nakadashi;Onahole;Paizuri;Possession;Rape;School Uniform;Sleeping;Stockings;Story Arc;Symbol Shaped Pupils;Tankoubon;Teacher;Wormhole','Yokoyama Naoki',4.15),
+(1998,'Anal;Bestiality;Birth;Cervical Penetration;Daughter;Double Penetration;Futanari;Gender Bender;Group Sex;Incest;Large Breasts;Monster Girl;Mother;Pregnant;Snuff;Tribadism','Mizuiro Megane',3.87),
+(1999,'Big Ass;Huge Penis;Incest;Inseki;Large Breasts;MILF;Short Hair;Swinging / Netorase','Kizaru',4.36),
+(2000,'Ahegao;Big Areola;Birth;Double Penetration;Exhibitionism;Fisting;Gaping;Group Sex;Lactation;Large Breasts;Multiple Insertion;Pregnant;Prolapse;Stomach Bulge;Zombie','Ahemaru | henrik',3.3),
+(2001,'Blowjob;Body Writing;Cow Girl;Impregnation;Large Breasts;Mind Control;Nakadashi;Paizuri;Symbol Shaped Pupils','Booch',4.0),
+(2002,'Cow Girl;Elf;Harem;Large Breasts;Stockings;Straight Shota','Zanzi',4.05),
+(2003,'Big Areola;Breast Sucking;Cow Girl;Large Breasts;Latex;Nakadashi;Paizuri;Stockings','Tabigarasu',4.6),
+(2004,'Blowjob;Daughter;Footjob;Imouto;Incest;Large Breasts;Lingerie;Loli;MILF;Mother;Niece;Pantyhose;School Uniform;Stockings;Straight Shota;Tankoubon','gemu555',4.38),
+(2005,'Ahegao;Anal;Blowjob;Cheating;Enema;Footjob;Group Sex;Hotpants;Lactation;Large Breasts;Megane;Multiple Insertion;Nakadashi;Nurse;Paizuri;Pantyhose;Rape;Stockings;Stomach Bulge;Tankoubon;Tanlines;Watersports','Nuku Nuku Orange',3.65),
+(2006,'Anal;Anilingus;Blowjob;Bondage;Breast Sucking;Cow Girl;Cunnilingus;Face Sitting;Femdom;Foot Fetish;French Kissing;Gokkun;Large Breasts;Licking;Lingerie;Mouth Gag;Nakadashi;Pegging;Sex Toys;Strap-on;Urethra Insertion','Sugar Milk',3.59),
+(2007,'Bikini;Blowjob;French Kissing;Large Breasts;Mind Control;Pantyhose;Piercings;Short Hair;Stockings;Swimsuit','chin',4.38),
+(2008,'Anal;Blowjob;Large Breasts;Male on Futa;Nakadashi;Shemale;Shota;Sweating;Trap','Mogiki Hayami',4.21),
+(2009,'Anal;Gender Bender;Males only;Shota;Trap;Yaoi','D@i',4.45),
+(2010,'Ahegao;Anal;Big Ass;Cheating;Condom;Huge Breasts;Large Breasts;Lingerie;MILF;Nakadashi;Short Hair;Straight Shota','Ao Madousi',3.92),
+(2011,'Anal;Anilingus;Animal Girl;Blowjob;Bondage;Emotionless Sex;Femdom;Loli;Long Tongue;Monster Girl;Oppai Loli;Orgasm Denial;Prostate Massage;Straight Shota;Tentacles','Tsunamushi',4.06),
+(2012,'Ahegao;Anal;Anilingus;BBM / Fat Man;Blowjob;Bodysuit;Crotchless / Breastless;Cunnilingus;Dark Skin;Dirty Old Man;Double Penetration;Gangbang;Group Sex;Gyaru;Handjob;Large Breasts;Mind Control;Nakadashi;Nun;Piercings;Prostitution;Sixty-Nine;Stockings;Swimsuit','Inoue Nanaki',3.09),
+(2013,'Animal Girl;Blowjob;Gender Bender;Gokkun;Group Sex;Mind Control;Stockings','Yuushi Tessen | Yuzu Machi',3.72),
+(2014,'Animal Girl;Blowjob;Dark Skin;Foot Fetish;Group Sex;Loli;Nakadashi;Rape;Short Hair;Sleeping;Tanlines','Esora Koto',2.88),
+(2015,'Ahegao;Dirty Old Man;Drugs;Fairy;Loli;Nakadashi;Tanlines;X-ray','Esora Koto',3.33),
+(2016,'Ahegao;Blowjob;Femdom;Fundoshi;Group Sex;Handjob;Loli;Oppai Loli;Tanlines;Threesome','Esora Koto',3.58),
+(2017,'BBM / Fat Man;Dojikko;Gangbang;Group Sex;Large Breasts;Loli;Onsen;Oppai Loli;Randoseru;School Uniform;Symbol Shaped Pupils;Twins','Esora Koto',3.71),
+(2018,'Dark Skin;Elf;Large Breasts;Masturbation;Nakadashi;Straight Shota','Kobanya Koban',4.69),
+(2019,'Happy Sex;Large Breasts;Nakadashi;Short Hair;Straight Shota','Chipa',4.21),
+(2020,'Blowjob;Defloration;Happy Sex;Large Breasts;Nakadashi;Prostitution;Virginity (Male)','Nectar',4.02),
+(2021,'Anal;Blowjob;Group Sex;Loli;Stockings;Threesome;Twintails','Toyo',4.19),
+(2022,'Lingerie;Oni;Pettanko;Short Hair;Stockings','Nekomata Naomi',4.4),
+(2023,'Ahegao;Gyaru;Happy Sex;Large Breasts;Paizuri;Slut;Virginity (Male)','Toribami Sasami',4.45),
+(2024,'Blowjob;Collar;Group Sex;Large Breasts;Loli;Nakadashi;Short Hair;Stockings','Akaiguppy',4.66),
+(2025,'Blowjob;Bondage;Crossdressing;Femdom;Filming;Group Sex;Loli;Megane;Nakadashi;Paizuri;Phimosis;Reverse Rape;Short Hair;Smegma;Straight Shota;Trap;Twintails;Watersports','Youta',3.82),
+(2026,'Ahegao;Bondage;Group Sex;Huge Penis;Masturbation;Megane;Muscle;Nakadashi;School Uniform;Slut;Stuck in Wall;Swimsuit','Yumoteliuce',4.33),
+(2027,'Hairy;Happy Sex;Nakadashi;Pantyhose;Sweating;Tattoo','AZASUKE',4.7),
+(2028,'Ahegao;Blowjob;Handjob;Large Breasts;Loli;Oppai Loli;School Swimsuit;Short Hair;Symbol Shaped Pupils;Watersports','Eisen',3.19),
+(2029,'Centaur;Happy Sex;Huge Breasts;Huge Penis;Large Breasts;Monster Girl;Nakadashi;Paizuri','Jun',4.62),
+(2030,'Ahegao;Blowjob;Dark Skin;Drugs;Eyepatch;French Kissing;Large Breasts;Mind Break;Nakadashi;Rape;Squirting;Twintails','Yamanashi Yuuya',3.93),
+(2031,'Animal Girl;Blowjob;Cervical Penetration;Loli;Nakadashi;School Swimsuit;Sleeping;Swimsuit','Micchan',4.12),
+(2032,'Femdom;Footjob;Monster Girl;Nakadashi;Slime Girl;Transformation;X-ray;Yandere','DATE',4.46),
+(2033,'Cheating;Impregnation;Incest;MILF;Mother;Short Hair;Straight Shota','Lemon Keiki',4.44),
+(2034,'Bestiality;Defloration;Dog;Inverted Nipples;Rape;School Uniform;Stockings;Twintails','Tenzen Miyabi',3.73),
+(2035,'French Kissing;Happy Sex;Imouto;Incest;Loli;Nakadashi;Oppai Loli;Uncensored;X-ray','Ekakibit',4.66),
+(2036,'Ahegao;Incest;Large Breasts;Nakadashi;Uncensored','Ekakibit',4.4),
+(2037,'Anal;Double Penetration;Filming;Group Sex;Handjob;Impregnation;Lactation;Large Breasts;Masturbation;Mind Break;Mind Control;Reverse Harem;Sex Toys;Solo Action;Stockings;Symbol Shaped Pupils;Wormhole','Rakujin',3.74),
+(2038,'Age Regression;Armpit;Body Modification;Bondage;Corruption;Demon | Incubus;Double Penetration;Filming;Group Sex;Incest;Large Breasts;Loli;Mind Break;Mind Control;Rape;Sex Toys;Symbol Shaped Pupils;Tattoo','Rakujin',4.27),
+(2039,'Breast Expansion;Imouto;Incest;Mind Control;School Uniform;Stockings','Rakujin',4.26),
+(2040,'Body Writing;Dark Skin;Group Sex;Gyaru;Mind Control;Piercings;School Uniform','Rakujin',3.47),
+(2041,'Ahegao;Breast Expansion;Defloration;DILF;Group Sex;Large Breasts;Latex;Mind Control;School Uniform;Stockings;Symbol Shaped Pupils','Rakujin',3.88),
+(2042,'Condom;Decensored;Defloration;Happy Sex;Huge Penis;Impregnation;Large Breasts;Nakadashi;Teacher;Virginity (Male);X-ray','clover',4.59),
+(2043,'Anal;Crossdressing;Futa on Male;Futanari;Shota;Stockings;Trap','Magifuro Konnyaku',4.58),
+(2044,'Anal;Animal Girl;Band-Aid / Pasties;BBW;Big Ass;Bunnygirl;Drugs;Fox Girl;Huge Breasts;Large Breasts;Leotard;Megane;Pantyhose','Tsumetoro',4.83),
+(2045,'Blowjob;Crossdressing;Gender Bender;Leg Lock;Nakadashi;School Uniform;Short Hair;Tomboy;X-ray','Shimimaru',4.18),
+(2046,'Ahegao;Anal;Anilingus;BBM / Fat Man;BDSM;Bikini;Breast Expansion;Defloration;Impregnation;Loli;Maledom;Mind Break;Nakadashi;Sex Toys;Slave;Stockings;Swimsuit;Symbol Shaped Pupils','Atage',3.77),
+(2047,'Cousin;Incest;Large Breasts;Monster Girl;Nakadashi;Short Hair','Toumasu | Kanemaki Thomas',4.62),
+(2048,'Ahegao;BBM / Fat Man;BBW;Big Areola;Breast Sucking;Collar;Cow Girl;Cunnilingus;Decensored;Dirty Old Man;Filming;French Kissing;Group Sex;Hairy;Huge Breasts;Huge Penis;Impregnation;Lactation;Large Breasts;Nakadashi;Squirting;Stockings;Threesome','Tsumetoro',3.67),
+(2049,'Ahegao;Big Ass;Blowjob;Furry;Group Sex;Large Breasts;Monster Girl;Nakadashi;Oni;Uncensored','Mizone',4.43),
+(2050,'Ahegao;Big Ass;Blowjob;Cheating;Hairy;Handjob;Harem;Hotpants;Lactation;Large Breasts;Lingerie;Nakadashi;Plump;Short Hair;Spreading;Stockings;Uncensored','Mojarin',4.64),
+(2051,'Ahegao;Blowjob;Exhibitionism;Fangs;Handjob;Happy Sex;Large Breasts;Nakadashi;Tanlines;Tomboy;Uncensored;X-ray','Unou',4.69),
+(2052,'Ahegao;Blowjob;Dark Skin;Large Breasts;Nakadashi;Straight Shota;Uncensored','Onodera',4.55),
+(2053,'Breast Sucking;Demon Girl | Succubus;Femdom;Full Color;Large Breasts;Paizuri;Prostate Massage;Stockings;Straight Shota','Shinooka Homare',4.2),
+(2054,'Ahegao;Blindfold;Cheating;Full Color;Huge Penis;Large Breasts;MILF;Nakadashi;Netori;Pantyhose;Short Hair;Straight Shota;Symbol Shaped Pupils','Juna Juna Juice',4.48),
+(2055,'Bathroom Sex;Blowjob;Full Color;Harem;Huge Penis;Incest;Large Breasts;MILF;Mother;Netori;Reverse Rape;Straight Shota;Symbol Shaped Pupils','Juna Juna Juice',4.38),
+(2056,'Anal;Band-Aid / Pasties;Bathroom Sex;Blowjob;Catgirl;Cervical Penetration;Cheating;Cosplay;Cunnilingus;Exhibitionism;Face Sitting;Filming;Fingering;French Kissing;Full Color;Gaping;Large Breasts;MILF;Muscle;Nakadashi;School Uniform;Sex Toys;Short Hair;Sixty-Nine;Spreading;Squirting;Straight Shota;Symbol Shaped Pupils','Juna Juna Juice',4.74),
+(2057,'Ahegao;Blowjob;Cunnilingus;Dark Skin;Exhibitionism;Fangs;Nakadashi;Paizuri;School Uniform;Stockings;Uncensored','fu-ta',4.66),
+(2058,'Big Ass;Blowjob;Dark Skin;Femdom;Footjob;Group Sex;Handjob;Large Breasts;Megane;Pegging;Threesome;Uncensored','SHUKO',3.42),
+(2059,'Anal;Crossdressing;Gyaru;Incest;Males only;Otouto;Slut;Symbol Shaped Pupils;Trap;Yaoi','Binto',3.99),
+(2060,'Anal;Bikini;Blowjob;Crossdressing;Dark Skin;Double Penetration;Group Sex;Males only;Mind Break;Rape;Shota;Spitroast;Swimsuit;Trap;Yaoi','Urakuso',4.11),
+(2061,'Animal Girl;Big Areola;Big Ass;Breast Sucking;Catgirl;Dark Skin;French Kissing;Furry;Impregnation;Large Breasts;Muscle;Nakadashi;Symbol Shaped Pupils','Nankai no Sizimi',4.08),
+(2062,'Anal;Blowjob;Dark Skin;Defloration;Drunk;Mind Control;Nakadashi;Rape;Sex Toys;Sleeping;Symbol Shaped Pupils;X-ray','Z-Ton',4.71),
+(2063,'Bondage;Elder Sister;Femdom;Group Sex;Hairy;Incest;MILF;Mother;Oyakodon;Threesome','Q Doukei',3.97),
+(2064,'Big Ass;Happy Sex;Large Breasts;Latex;Stockings;Sweating','Sakomae Aichi',4.83),
+(2065,'Femdom;Group Sex;Large Breasts;Military Uniform;Stomach Bulge','Saida Kazuaki',4.09),
+(2066,'Anal;Crossdressing;Males only;Masturbation;Nurse;Prostate Massage;Sex Toys;Shota;Solo Action;Stockings;Trap;Yaoi','Aogiri Penta',4.54),
+(2067,'Anal;Crossdressing;Males only;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Menoko',4.48),
+(2068,'Anal;Blowjob;Body Modification;Crossdressing;Gender Bender;Loli;Male on Futa;Mind Control;Shemale;Transformation;Trap;Yaoi','Ruuen Rouga',4.31),
+(2069,'Blowjob;Large Breasts;Loli;Nakadashi;Oppai Loli;School Uniform;Symbol Shaped Pupils;Teacher;X-ray','Ryoji',4.75),
+(2070,'Anal;Comedy;Dark Skin;Double Penetration;Fangs;Group Sex;Gyaru;Huge Breasts;Large Breasts;Slut;Straight Shota','Satou Kimiatsu;Tamatsuyada',3.86),
+(2071,'Anal;Blowjob;Comedy;Dark Skin;Deepthroat;Double Penetration;Fangs;Gangbang;Gloves;Group Sex;Gyaru;Huge Breasts;Large Breasts;Loli;Smug;Spitroast','Satou Kimiatsu;Tamatsuyada',3.73),
+(2072,'Double Penetration;Group Sex;Huge Breasts;Large Breasts;Loli','Satou Kimiatsu;Tamatsuyada',4.45),
+(2073,'Anal;Bunnygirl;Dark Skin;Gyaru;Large Breasts;Leotard;Loli;MILF;Oyakodon;Pantyhose;Prostitution','Satou Kimiatsu;Tamatsuyada',3.9),
+(2074,'Animal Girl;Breast Expansion;Impregnation;Loli;Mouse Girl;Nakadashi;Short Hair;Stockings;Stomach Bulge','Peso',4.49),
+(2075,'Blindfold;Blowjob;Happy Sex;Large Breasts;Maledom;Masturbation;MILF;Oyakodon;Squirting;Voyeurism','Sakurayu Haru',4.71),
+(2076,'BBW;Blowjob;Bukkake;Group Sex;Hairy;Incest;Large Breasts;MILF;Mother;Short Hair;Straight Shota;X-ray','Natsu no Oyatsu',3.37),
+(2077,'Ahegao;Anal;Bikini;Crossdressing;Dark Skin;Dick Growth;Drugs;Face Sitting;Femdom;Futa on Male;Futanari;Large Breasts;Mind Break;Smell;Swimsuit;Trap;Urethra Insertion','Murasaki☆Nyaa',4.26),
+(2078,'Anal;Anilingus;Asphyxiation;BBM / Fat Man;Blowjob;Condom;French Kissing;Hairy;Harem;Huge Penis;Loli;Megane;Nakadashi;Prostitution;School Uniform;Smell;Story Arc;Sweating;Tankoubon;Threesome','Shiwasu No Okina',4.66),
+(2079,'Ahegao;Anal;Bathroom Sex;Breast Sucking;Cousin;Decensored;Defloration;DILF;Foot Fetish;Group Sex;Hairy;Handjob;Happy Sex;Huge Penis;Incest;Large Breasts;Licking;Megane;Mind Break;Nakadashi;Paizuri;Pantyhose;Rape;School Uniform;Spitroast;Squirting;Stockings;Straight Shota;Sumata;Swimsuit;Tankoubon;Threesome;X-ray','sugarBt',4.29),
+(2080,'Ahegao;Bondage;Collar;Dark Skin;Futanari;Guro;Huge Penis;Loli;Monster;Oni;Pettanko;Sex Toys;Snuff;Stomach Bulge;Story Arc;Tankoubon;Vore','Gesundheit',4.27),
+(2081,'Anilingus;Cheating;DILF;Large Breasts;MILF;Naked Apron;Straight Shota;Tankoubon','Saigado',3.67),
+(2082,'Anal;Anilingus;Bikini;Bunnygirl;Collar;Double Penetration;Group Sex;Hairy;Large Breasts;Prostitution;Smegma;Smell;Stockings;Swimsuit','Mizoguchi Gelatin',4.17),
+(2083,'Ahegao;Anal;Aunt;Blowjob;Cheating;Condom;Face Sitting;French Kissing;Group Sex;Hairy;Hairy Armpits;Huge Breasts;Impregnation;Incest;Large Breasts;MILF;Mother;Nakadashi;Netori;Prostate Massage;Straight Shota;Threesome;Voyeurism;X-ray','Ameyama Denshin',4.23),
+(2084,'Ahegao;Anal;Aunt;Drugs;Enema;Femdom;Incest;Prostate Massage;Sex Toys;Stomach Bulge;Straight Shota','Ameyama Denshin',3.87),
+(2085,'Anal;Blowjob;Demon Girl | Succubus;Dick Growth;Fingering;Huge Penis;Large Breasts;Paizuri;Straight Shota;Threesome;Uncensored','Shindou',3.71),
+(2086,'BBM / Fat Man;Bikini;Decensored;Gyaru;Huge Penis;Large Breasts;Monster Girl;Oni;Prostitution;Slut;Stockings;Stomach Bulge;Swimsuit;Tan;Tanlines','aho / AHOBAKA',4.35),
+(2087,'Ahegao;Animal Girl;Bondage;Cow Girl;Group Sex;Human Cattle;Impregnation;Lactation;Large Breasts;Megane;Nakadashi;Stockings','wakamesan',4.02),
+(2088,'Anal;Animal Boy;Collar;Crossdressing;Group Sex;Rape;Selfcest;Shota;Trap;Yaoi','Saigado',3.85),
+(2089,'Blowjob;Cosplay;Happy Sex;Loli;Nakadashi;Oni;Short Hair','JP06',4.69),
+(2090,'Anal;Bikini;Blindfold;Blowjob;Bondage;Collar;Deepthroat;Face Sitting;Femdom;Footjob;Group Sex;Handjob;Idol;Latex;Lingerie;Mouth Gag;Pegging;Selfcest;Stockings;Strap-on;Swimsuit;Threesome','Hidebou',4.65),
+(2091,'Ahegao;Anal;Blowjob;Bondage;Drugs;Group Sex;Males only;Nakadashi;Rape;Shota;Yaoi','Toshiyuki',4.26),
+(2092,'BBW;Big Ass;Bikini;Blowjob;Group Sex;Handjob;Huge Breasts;Impregnation;Incest;Large Breasts;MILF;Mother;Nakadashi;Paizuri;Pregnant;Spanking;Straight Shota;Threesome','Uradoori no Nukemichi',4.11),
+(2093,'Ahegao;Anal;Band-Aid / Pasties;BBW;Big Areola;Big Ass;Blowjob;Body Modification;Body Writing;Breast Expansion;Dark Skin;Defloration;Exhibitionism;Filming;Gyaru;Human Toilet;Humiliation;Imouto;Impregnation;Incest;Large Breasts;Latex;Loli;Megane;MILF;Mind Break;Mind Control;Nakadashi;Nose Hook;Paizuri;Pregnant;School Uniform;Sex Toys;Stockings;Symbol Shaped Pupils;Teacher;Transformation;Twintails;Watersports;X-ray','Kamaros',3.91),
+(2094,'Ahegao;Big Areola;Big Ass;Blowjob;Body Modification;Cervical Penetration;Demon Girl | Succubus;Elder Sister;Femdom;Full Color;Group Sex;Huge Breasts;Huge Penis;Impregnation;Lactation;Large Breasts;Long Tongue;Monster;Monster Girl;Nakadashi;Straight Shota;Tattoo;Threesome;Transformation;Watersports;X-ray','Shuten Douji',3.93),
+(2095,'Big Areola;Big Ass;Blowjob;Demon Girl | Succubus;French Kissing;Furry;Happy Sex;Huge Breasts;Large Breasts;Military Uniform;Nakadashi;Phimosis;Stockings;Straight Shota;Tall Girl;Transformation;Virginity (Male);X-ray','Rikose',4.53),
+(2096,'Animal Girl;Armpit;Blowjob;Deepthroat;French Kissing;Gokkun;Licking;Lingerie;Megane;Pantyhose;Sex Toys;Short Hair;Squirting;Stockings','Blue_Gk',4.64),
+(2097,'Anal;Bisexual;Blowjob;Bondage;Double Penetration;Femdom;Footjob;Full Color;Group Sex;Incest;Rape;Sex Toys;Strap-on;Symbol Shaped Pupils;Threesome;Twintails;Voyeurism;Yuri','YD',4.72),
+(2098,'Anal;Blowjob;Crossdressing;Group Sex;Handjob;Hotpants;Males only;Military Uniform;Rape;Shota;Stockings;Trap;Yaoi','Katou Chakichi',3.3),
+(2099,'Bondage;Crossdressing;Demon | Incubus;Freckles;Males only;Rape;Shota;Trap;Yaoi','Po-ju / Monty',4.57),
+(2100,'Blowjob;Dark Skin;Femdom;Hairy;Hairy Armpits;Incest;Licking;MILF;Mother;Muscle;Nakadashi;Paizuri;Phimosis;Short Hair;Straight Shota;Tomboy;Tsundere;Virginity (Male);Widow;X-ray','Kuroiwa Menou',4.54),
+(2101,'Armpit;Blowjob;DILF;Group Sex;Handjob;Loli;Nakadashi;Oppai Loli;Tanlines','Esora Koto',3.47),
+(2102,'Blowjob;Femdom;Group Sex;Handjob;Huge Penis;Loli;Threesome','Kakkuu',4.57),
+(2103,'Anal;Bondage;Crossdressing;Filming;Males only;Muscle;Nakadashi;Sixty-Nine;Stockings;Teacher;Trap;Yaoi','Katou Chakichi',4.19),
+(2104,'Blowjob;Demon Girl | Succubus;Happy Sex;Large Breasts;Monster;Nakadashi;Transformation;Yandere','Komagata',4.72),
+(2105,'Ahegao;Anal;Blowjob;Dark Skin;Defloration;Double Penetration;Elf;Gangbang;Group Sex;Large Breasts;Mind Break;Monster;Nakadashi;Paizuri;Rape;Stockings','Gonzaburo',3.78),
+(2106,'Anal;Anilingus;Blowjob;Crotchless / Breastless;Enema;Femdom;Group Sex;Harem;Large Breasts;Maid;Nakadashi;Prostate Massage;Small Penis;Stockings;Straight Shota;Symbol Shaped Pupils;Twintails;Uncensored;X-ray','Marui Maru',4.44),
+(2107,'Ahegao;Big Ass;Elder Sister;Femdom;Harem;Incest;Large Breasts;Lingerie;Maid;Nakadashi;Pegging;Sex Toys;Shota;Stockings;Strap-on;Uncensored;X-ray','Marui Maru',4.23),
+(2108,'Blowjob;Group Sex;Happy Sex;Huge Penis;Large Breasts;Maid;Megane;Nakadashi;School Uniform;Shimapan;Swimsuit;Tankoubon;Teacher;Twintails;Uncensored;X-ray','Akitsuki Itsuki',4.66),
+(2109,'Ahegao;Anal;Cheating;Cousin;Dark Skin;Group Sex;Large Breasts;Megane;Paizuri;Prostitution;School Uniform;Stockings;Swimsuit;Tankoubon;Twintails;Uncensored','Fujimaru',4.63),
+(2110,'Ahegao;Big Ass;Blowjob;Bondage;Cervical Penetration;Daughter;Deepthroat;Defloration;Demon | Incubus;Femdom;Fundoshi;Group Sex;Happy Sex;Huge Breasts;Large Breasts;Leg Lock;Legal Loli;Loli;Monster Girl;Nakadashi;Oni;Orgasm Denial;Oyakodon;Reverse Rape;Stomach Bulge;Sumata;Sweating;Threesome;Uncensored;X-ray','Shindou',4.61),
+(2111,'Ahegao;Bathroom Sex;Blowjob;Breast Sucking;Cheating;Demon | Incubus;French Kissing;Handjob;Huge Breasts;Inverted Nipples;Large Breasts;MILF;Monster Girl;Nakadashi;Oni;Onsen;Sumata;Symbol Shaped Pupils;Uncensored','Shindou',4.61),
+(2112,'Cervical Penetration;Femdom;Group Sex;Huge Breasts;Inverted Nipples;Large Breasts;Loli;MILF;Monster Girl;Nakadashi;Oni;Oyakodon;Uncensored;X-ray','Shindou',4.62),
+(2113,'Cheating;Dark Skin;Defloration;Huge Breasts;Hypnosis;Large Breasts;Oni;Shimaidon;Stockings;Uncensored','Shindou',4.76),
+(2114,'Big Ass;Blowjob;Cunnilingus;Hairy;Handjob;Happy Sex;Large Breasts;Nakadashi;Uncensored;Virginity (Male)','Yokoshima Nikki',4.67),
+(2115,'Blowjob;Bukkake;Dark Skin;Happy Sex;Incest;Nakadashi;Naked Apron;School Uniform;Uncensored;Uncle','mogg',4.63),
+(2116,'Blowjob;Condom;Demon Girl | Succubus;Happy Sex;Huge Breasts;Large Breasts;Megane;Nakadashi;Paizuri;School Uniform;Uncensored;X-ray','Sasamori Tomoe',4.76),
+(2117,'Big Ass;Blowjob;Demon Girl | Succubus;Exhibitionism;Femdom;Happy Sex;Large Breasts;Megane;Monster Girl;Nakadashi;Paizuri;School Swimsuit;School Uniform;Stockings;Uncensored;X-ray','Sasamori Tomoe',4.82),
+(2118,'Dark Skin;Decensored;Full Color;Group Sex;Happy Sex;Nakadashi;Threesome;Yuri','Pirontan',4.83),
+(2119,'Ahegao;Big Ass;Blowjob;Cheating;Condom;Lingerie;Megane;Nakadashi;Prostitution;School Swimsuit;School Uniform;Stockings;Twintails;Uncensored','Ikematsu',3.5),
+(2120,'Ahegao;Bikini;Blowjob;Harem;Large Breasts;Nakadashi;Office Lady;Swimsuit;Threesome;Uncensored','Ashiomi Masato',4.69),
+(2121,'Ahegao;Anal;BBW;Bestiality;Big Ass;Blowjob;Breast Sucking;Crotchless / Breastless;Deepthroat;Double Penetration;Drugs;Fangs;Footjob;Gloves;Group Sex;Hairy;Huge Breasts;Huge Penis;Inverted Nipples;Large Breasts;Lingerie;Lowleg;Masturbation;Megane;Mind Break;Monster;Monster Girl;Nakadashi;Prostitution;Sex Toys;Small Penis;Stockings;Stomach Bulge;Straight Shota;Symbol Shaped Pupils;Transparent Clothing;Twintails;Uncensored;Voyeurism;X-ray','Shindou',4.19),
+(2122,'Ahegao;Anilingus;Big Ass;Blowjob;Breast Sucking;Bukkake;Defloration;Femdom;Frotting;Futanari;Gloves;Group Sex;Handjob;Harem;Hat;Large Breasts;Leg Lock;Licking;Lowleg;Military Uniform;Monster Girl;Nakadashi;Onahole;Oni;Paizuri;Sex Toys;Small Penis;Stockings;Straight Shota;Threesome;Uncensored;Virginity (Male)','Shindou',4.43),
+(2123,'Anal;Bikini;Blowjob;Bunnygirl;Collar;Dark Skin;Demon | Incubus;Face Sitting;Fangs;Full Color;Gangbang;Gloves;Group Sex;Handjob;Large Breasts;Leotard;Loli;Nakadashi;Paizuri;Pantyhose;Short Hair;Spitroast;Stockings;Swimsuit;Tattoo','Asanagi;BLADE;Mda Starou',4.76),
+(2124,'Blowjob;Bondage;Chinese Dress;Collar;Dark Skin;Demon Girl | Succubus;Full Color;Impregnation;Mind Break;Nakadashi;Pettanko;School Swimsuit;Stockings','Mda Starou',4.82),
+(2125,'Anilingus;Animal Girl;Bisexual;Blowjob;Cunnilingus;Deepthroat;Defloration;Fangs;Fox Girl;French Kissing;Group Sex;Hairy;Happy Sex;Nakadashi;Sweating;Threesome;X-ray','Mitsugi',4.71),
+(2126,'Ahegao;Anal;Bodysuit;Bondage;Dark Skin;Drugs;Filming;Group Sex;Hairy Armpits;Human Toilet;Impregnation;Inverted Nipples;Large Breasts;Megane;MILF;Nakadashi;Piercings;Reverse Rape;Slut;Spats;Straight Shota;Tanlines','Butcha U',3.9),
+(2127,'Anal;Bestiality;Blindness;Butler;Collar;Males only;Masturbation;Mind Break;Pig;Rape;Shota;Voyeurism;Yandere;Yaoi','Hontoku',3.0),
+(2128,'Anal;Assjob;Bikini;Blowjob;Bukkake;Collar;Dark Skin;Double Penetration;Gangbang;Group Sex;Handjob;Hat;Large Breasts;Loli;Nakadashi;Spreading;Swimsuit;Threesome;Twintails','Haga Yui;Oota Yuuichi',4.13),
+(2129,'BBW;Big Ass;Defloration;Fangs;Gender Bender;Hairy;Huge Breasts;Large Breasts;Masturbation;Nakadashi;School Uniform;Short Hair;Stockings;X-ray','Ichinomiya Yuu',4.41),
+(2130,'Anal;Blowjob;Crossdressing;Males only;Pantyhose;Shota;Trap;Yaoi','Aichi Shiho',4.52),
+(2131,'Blindfold;Blowjob;Bondage;Cunnilingus;Face Sitting;Imouto;Incest;Loli;Maledom;Mouth Gag;Nakadashi;Straight Shota;Twintails;X-ray','Tsubaki Jushiro',4.44),
+(2132,'Big Ass;Childhood Friend;Defloration;Happy Sex;Huge Breasts;Inverted Nipples;Large Breasts;Nakadashi;Paizuri;Tall Girl','Suruga Kuroitsu',4.79),
+(2133,'Happy Sex;Loli;Monster Girl;Short Hair','Morisugi',4.39),
+(2134,'Femdom;Group Sex;Large Breasts;Megane;MILF;Oni;Orgasm Denial;Prostate Massage;Short Hair;Straight Shota;Threesome;X-ray','Sugi G',4.18),
+(2135,'Ahegao;Anal;Animal Boy;Collar;Crossdressing;Group Sex;Huge Penis;Lingerie;Males only;Mouth Gag;Stockings;Trap;Urethra Insertion;Yaoi','Katou Chakichi',3.46),
+(2136,'Ahegao;Breast Sucking;Crotchless / Breastless;Elf;Happy Sex;Nakadashi;Stockings;Tsundere;Uncensored','Asaki Takayuki',4.68),
+(2137,'Ahegao;Blowjob;Deepthroat;Elf;Exhibitionism;Large Breasts;Nakadashi;Straight Shota','Asaki Takayuki',4.37),
+(2138,'Bikini;Femdom;French Kissing;Large Breasts;Nakadashi;Paizuri;Swimsuit;Vampire','Nakamura Regura',4.63),
+(2139,'Anal;Crossdressing;Dick Growth;Futa on Male;Futanari;Huge Penis;Mind Control;Shota;Stockings;Trap','Magifuro Konnyaku',4.3),
+(2140,'Anal;Bestiality;Big Areola;Big Ass;Blowjob;Bukkake;Deepthroat;Horse;Large Breasts;Nakadashi','FAN',3.83),
+(2141,'Blindfold;Full Color;Group Sex;Threesome;Uncensored','aoin',4.71),
+(2142,'Blowjob;Deepthroat;Fangs;Happy Sex;Monster Girl;Nakadashi;Oni;Pettanko;Short Hair;X-ray','Uno Ryoku',4.62),
+(2143,'Blackmail;Defloration;Group Sex;Loli;Nakadashi;Oni;Rape;Ryona;Short Hair','Mochi',2.97),
+(2144,'Exhibitionism;Futa on Female;Futanari;Huge Penis;Large Breasts;Loli;Onsen;Rape;Stomach Bulge;Straight Shota;Toddler','Tempo Gensui',3.48),
+(2145,'Animal Boy;Animal Girl;Cow Girl;Defloration;Group Sex;Large Breasts;Mind Control;Rape;Stockings;Threesome','wakamesan',4.38),
+(2146,'Ahegao;Armpit;Blowjob;Bondage;Breast Sucking;Condom;Cunnilingus;Deepthroat;Defloration;Delusion;DILF;Elder Sister;Exhibitionism;Femdom;Fingering;Footjob;Gyaru;Hairy;Handjob;Happy Sex;Hat;Imouto;Incest;Lactation;Large Breasts;Leg Lock;Licking;Lingerie;Loli;Maid;Maledom;Masturbation;Megane;Mind Break;Nakadashi;School Uniform;Sex Toys;Sixty-Nine;Stockings;Story Arc;Sumata;Symbol Shaped Pupils;Tankoubon;Teacher;Voyeurism;Waitress','Miyabi',4.49),
+(2147,'Ahegao;Anal;Bathroom Sex;Bikini;Blowjob;Cunnilingus;Double Penetration;Drunk;Exhibitionism;Face Sitting;Fingering;French Kissing;Group Sex;Hairy;Handjob;Huge Penis;Incest;Kimono / Yukata;Large Breasts;Masturbation;MILF;Mother;Nakadashi;Office Lady;Onahole;Sex on the Phone;Sex Toys;Sixty-Nine;Sleeping;Squirting;Story Arc;Straight Shota;Swimsuit;Tankoubon;Threesome','Takasugi Kou',4.13),
+(2148,'Ahegao;Armpit;Bukkake;Dirty Old Man;Group Sex;Huge Penis;Large Breasts;Megane;Paizuri;Prostitution;Short Hair','Muneshiro',4.07),
+(2149,'Ahegao;Anal;Big Ass;Blowjob;Bondage;Dirty Old Man;Large Breasts;Nakadashi;School Uniform;Sex Toys;Stockings;Uncensored','PiyoPiyo',3.85),
+(2150,'Anal;Crossdressing;Dark Skin;Elf;Maid;Males only;Shota;Stockings;Trap;Yaoi','SIRPENT',3.68),
+(2151,'Anal;BDSM;Blowjob;Defloration;Exhibitionism;Femdom;Gangbang;Gloves;Group Sex;Hairy;Handjob;Maledom;Masturbation;Megane;Mind Break;Nakadashi;Reverse NTR;School Uniform;Slut;Spitroast;Stockings;Tan;Tankoubon;Tanlines;Teacher;Tomboy;X-ray','Shimimaru',4.3),
+(2152,'Ahegao;Animal Girl;BDSM;Big Areola;Blowjob;Breast Sucking;Bukkake;Dog Girl;Exhibitionism;Fingering;French Kissing;Gokkun;Hairy;Happy Sex;Large Breasts;Maledom;Nakadashi;Pet Girl;Spanking;Squirting;Symbol Shaped Pupils;Watersports;X-ray','Kousuke',4.61),
+(2153,'Ahegao;Blowjob;Condom;Happy Sex;Large Breasts;Nakadashi;Tsundere;Uncensored','dam',4.55),
+(2154,'Ahegao;Anal;BBM / Fat Man;Big Areola;Big Ass;Bodysuit;Bondage;Bukkake;Double Penetration;Eyepatch;Group Sex;Handjob;Heterochromia;Lactation;Large Breasts;Muscle;Nakadashi;Paizuri;Rape;Sweating;Threesome;X-ray','PIero',4.11),
+(2155,'Elder Sister;Incest;Inseki;Large Breasts;Paizuri;School Uniform;Straight Shota','Navier Haruka 2T',4.48),
+(2156,'Anal;Angel;Bisexual;Collar;Defloration;Group Sex;Loli;Stockings;Threesome;Yuri','Mochi',4.19),
+(2157,'Defloration;Elf;Legal Loli;Lingerie;Loli;Nakadashi;Stockings;X-ray','Tanabe Kyou',4.39),
+(2158,'Anal;Big Ass;Femdom;Loli;Twintails','Ookawada Nan',4.12),
+(2159,'Ahegao;BBM / Fat Man;Big Areola;Bikini;Blindfold;Bloomers;Blowjob;Cheerleader;Dark Skin;Exhibitionism;Filming;Fingering;French Kissing;Full Color;Group Sex;Hairy;Harem;Large Breasts;MILF;Mind Control;Paizuri;School Swimsuit;Sex Toys;Squirting;Stockings;Sweating;Swimsuit;Teacher;Threesome;X-ray','Izuminoaru',4.16),
+(2160,'Ahegao;BBM / Fat Man;Dark Skin;Full Color;Group Sex;Gyaru;Harem;Large Breasts;Mind Control;Nakadashi;School Uniform;Stockings','Izuminoaru',4.06),
+(2161,'Anal;Big Ass;Bondage;Dark Skin;Femdom;Footjob;Group Sex;Handjob;Harem;Large Breasts;Lingerie;Megane;Nakadashi;Nurse;Pegging;School Uniform;Stockings;Tankoubon;Tanlines;Uncensored','Marui Maru',4.16),
+(2162,'Anal;Bisexual;Crossdressing;Harem;Incest;Prostate Massage;Shemale;Stockings;Tankoubon;Trap;Yaoi;Yuri','Matsutou Tomoki',4.91),
+(2163,'Ahegao;Anal;Bisexual;Bloomers;Defloration;Dick Growth;Futa on Male;Futanari;Group Sex;Imouto;Incest;Loli;Male on Futa;Megane;School Uniform;Story Arc;Straight Shota;Strap-on;Tankoubon;Threesome;Yuri','Shinozaki Rei',3.67),
+(2164,'Anal;Blowjob;Bondage;Crossdressing;Defloration;Dick Growth;Double Penetration;Femdom;Foot Fetish;Footjob;Futa on Male;Futanari;Gokkun;Group Sex;Huge Penis;Licking;Magical Girl;Masturbation;Megane;Nakadashi;Pegging;Prostate Massage;School Uniform;Sex Toys;Shimapan;Slave;Story Arc;Strap-on;Tankoubon;Threesome;Transformation;Wings;Yaoi','Michian Ruu',4.25),
+(2165,'Bikini;Blowjob;Dark Skin;Gyaru;Happy Sex;Nakadashi;Paizuri;School Uniform;Swimsuit;X-ray','Sage Joh',4.61),
+(2166,'Ahegao;Anal;Animal Boy;Blowjob;Collar;Elf;Femdom;Furry;Futa on Male;Futanari;Group Sex;Large Breasts;Mind Break;Nakadashi;Reverse Rape;Sex Toys;Stockings;Threesome;Yaoi','Takatsu',3.94),
+(2167,'Ahegao;Happy Sex;Large Breasts;Nakadashi;Paizuri;Uncensored','Bota Mochito',4.62),
+(2168,'Ahegao;Childhood Friend;Cunnilingus;Happy Sex;Humiliation;Nakadashi;Uncensored','Takashi',4.65),
+(2169,'Bikini;Blowjob;Happy Sex;Large Breasts;Nakadashi;Plump;Swimsuit;Uncensored','TANABE',4.79),
+(2170,'Blowjob;Bondage;Demon Girl | Succubus;Fangs;Femdom;Handjob;Loli;Nakadashi;Stockings;Uncensored','Motsu Aki',3.47),
+(2171,'Blowjob;DILF;Doll;Emotionless Sex;Kunoichi;Leotard;Nakadashi;Paizuri;Rape;Robot Girl','Doko Tetora',3.28),
+(2172,'Happy Sex;Large Breasts;Monster Girl;Nakadashi;Plant Girl;Squirting;Uncensored;X-ray','Mizone',4.73),
+(2173,'Anal;BBW;Big Areola;Big Ass;Bloomers;Blowjob;Bodysuit;Cheating;Condom;Cunnilingus;Defloration;Double Penetration;Exhibitionism;Footjob;Full Color;Group Sex;Huge Breasts;Inverted Nipples;Large Breasts;Lingerie;MILF;Nakadashi;Netorare;Nurse;Paizuri;Pantyhose;Sleeping;Stockings;Swimsuit;Tankoubon;Threesome;X-ray','orico',4.23),
+(2174,'Bestiality;Big Areola;Dog;Inverted Nipples;Large Breasts;Monster','Tenzen Miyabi',3.46),
+(2175,'Anal;Femdom;Incest;Large Breasts;MILF;Mother;Prostate Massage;Straight Shota','Sarunote Isao',3.5),
+(2176,'Ahegao;Big Ass;Emotionless Sex;Happy Sex;Large Breasts;Monster Girl;Nakadashi;Plant Girl;Uncensored;X-ray','Mizone',4.71),
+(2177,'Hairy;Handjob;Happy Sex;Large Breasts;MILF;Nakadashi;Paizuri;Uncensored;X-ray','Homunculus',4.73),
+(2178,'Bondage;Femdom;Large Breasts;Lingerie;Loli;Maid;Masturbation;Nakadashi;Straight Shota;Uncensored','Ogadenmon',3.83),
+(2179,'Anilingus;Dark Skin;Femdom;Handjob;Huge Breasts;Large Breasts;Paizuri;Straight Shota;Uncensored','EO Masaka',4.21),
+(2180,'Ahegao;Childhood Friend;Handjob;Inseki;Large Breasts;Nakadashi;Plump;Uncensored;X-ray','Henkuma',4.52),
+(2181,'Anal;Aunt;Blowjob;Cheating;Hairy Armpits;Handjob;Incest;Kimono / Yukata;Large Breasts;Nakadashi','Takeshi',4.27),
+(2182,'Anal;Crossdressing;Dark Skin;Full Color;Group Sex;Males only;Stockings;Trap;Yaoi','Greco Roman',3.5),
+(2183,'Collar;Large Breasts;Mind Break;Mouth Gag;Nakadashi;Onahole;Rape;Wormhole','Carmine',4.14),
+(2184,'Anal;Bisexual;Blowjob;Bondage;Chastity Belt;Collar;Crossdressing;Drugs;Father;Femdom;French Kissing;Group Sex;Incest;Lingerie;Maid;Mind Break;Mouth Gag;Pegging;Rape;School Swimsuit;School Uniform;Sex Toys;Shota;Stockings;Strap-on;Threesome;Trap;Watersports;Yaoi','Wataya',3.8),
+(2185,'Blowjob;Loli;Monster Girl;Nakadashi;Oni;Short Hair;X-ray','SAKULA',4.32),
+(2186,'Anal;Blowjob;Dark Skin;Males only;Piercings;Trap;Yaoi','Misaka Nyuumen',4.39),
+(2187,'Breast Expansion;Chikan;Collar;Gender Bender;Large Breasts;Megane;Mind Break;Short Hair;Spanking','Poriuretan',3.05),
+(2188,'Ahegao;Anal;Body Writing;Bondage;Crossdressing;Group Sex;Males only;Megane;Nakadashi;School Uniform;Sex Toys;Shota;Stuck in Wall;Trap;Yaoi','Sakura Puchilo',4.48),
+(2189,'Anal;Blowjob;Crossdressing;Group Sex;Males only;Nakadashi;Shota;Trap;Yaoi','Mine Mura',3.67),
+(2190,'Anal;Blowjob;Fingering;French Kissing;Group Sex;Handjob;Males only;Nakadashi;Prostitution;Rape;Sex Toys;Spitroast;Trap;Yaoi','Mine Mura',3.63),
+(2191,'Anal;Males only;Nakadashi;Prostate Massage;Shota;Symbol Shaped Pupils;Trap;Yaoi','Uehasu',4.62),
+(2192,'Dark Skin;Large Breasts;MILF;Netorare;Straight Shota','AKYS Honpo',2.92),
+(2193,'Anal;Cheating;Large Breasts;MILF;Mind Control;Sex Toys','miya9',3.39),
+(2194,'Ahegao;Anal;BBM / Fat Man;Bondage;Defloration;Impregnation;Lactation;Large Breasts;Loli;Mind Break;Nakadashi;Pregnant;Prostitution;Rape;Scat;Stomach Bulge','Makurou',1.58),
+(2195,'Ahegao;Collar;Gender Bender;Large Breasts;Nakadashi;Paizuri;Pet Girl;Watersports','Hayashida Toranosuke',2.4),
+(2196,'Bestiality;Birth;Body Modification;Cervical Penetration;Guro;Human Cattle;Impregnation;Pig;Pregnant;Snuff','Hattori Mitsuka',1.55),
+(2197,'Anal;Blowjob;Dick Growth;Double Penetration;Futanari;Futanari on Futanari;Gangbang;Group Sex;Hairy;Large Breasts;Megane;Nun;Nurse;Spitroast;Stockings;Straight Shota;Tanlines;Threesome;Tomboy','Kuroiwa Menou',3.5),
+(2198,'Femdom;Smell;Straight Shota;Twintails;Virginity (Male)','Kauti',3.0),
+(2199,'Animal Girl;Big Ass;Blowjob;Face Sitting;Fox Girl;Nakadashi;Straight Shota','Itou Yuuji',4.2),
+(2200,'Bukkake;Gender Bender;Group Sex;Loli;Short Hair','Sexyturkey',3.0),
+(2201,'Condom;Loli;Nakadashi;Oppai Loli;Prostitution','Misao.',4.0),
+(2202,'Idol;Large Breasts;Paizuri;School Swimsuit;Swimsuit','Takemasa Takeshi',4.75),
+(2203,'Anal;Crossdressing;Group Sex;Incest;Males only;Otouto;Shota;Stockings;Trap;Yaoi','EGAMI',3.5),
+(2204,'Anal;Crossdressing;Males only;Shota;Stockings;Trap;Yaoi','EGAMI',4.5),
+(2205,'BBM / Fat Man;Cheating;Condom;DILF;French Kissing;Handjob;Huge Breasts;Large Breasts;MILF;Nakadashi;Office Lady;Paizuri;Pantyhose;Prostitution;Sweating;Teacher','Haitukun',3.0),
+(2206,'Anal;Blowjob;Full Color;Futanari;Handjob;Huge Breasts;Huge Penis;Large Breasts;Male on Futa;Nakadashi;Shemale','Nekotasou',3.5),
+(2207,'Ahegao;Band-Aid / Pasties;Big Areola;Blowjob;Bondage;Bunnygirl;Corruption;Dark Skin;Fingering;Gokkun;Huge Breasts;Huge Penis;Large Breasts;Maebari;Mind Control;Monster;Nakadashi;Paizuri;Stockings;Stomach Bulge','Onomeshin',3.54),
+(2208,'Ahegao;Anal;Blowjob;Crossdressing;Exhibitionism;Group Sex;Handjob;Lingerie;Males only;Megane;Multiple Insertion;Nakadashi;Sex Toys;Shota;Symbol Shaped Pupils;Trap;Yaoi','Sakura Puchilo',4.36),
+(2209,'Bloomers;Defloration;Emotionless Sex;Femdom;Gender Bender;Handjob;Large Breasts;Military Uniform;Nakadashi;Pantyhose;Symbol Shaped Pupils;X-ray','Itou Life',4.27),
+(2210,'Cheating;Huge Breasts;Incest;Large Breasts;Megane;MILF;Mother;Sleeping;Straight Shota','mmm',4.06),
+(2211,'Blowjob;Kimono / Yukata;Large Breasts;Monster Girl;Stockings;Yandere','SeN',4.42),
+(2212,'Blowjob;Cunnilingus;Fingering;French Kissing;Large Breasts;Watersports;Yandere','SeN',4.39),
+(2213,'Anal;Cosplay;Full Color;Group Sex;Idol;Large Breasts;Maid;Nakadashi;Paizuri;Stockings;Threesome;X-ray','Kamishiro Ryuu',4.46),
+(2214,'Blowjob;Breast Sucking;Cunnilingus;Group Sex;Harem;Idol;Large Breasts;Loli;Maid;Nakadashi;Paizuri;Sixty-Nine;Squirting;Stockings;Threesome','Kamishiro Ryuu',4.46),
+(2215,'Anal;Big Ass;Blowjob;Breast Sucking;Cosplay;Cunnilingus;Double Penetration;Face Sitting;Group Sex;Hairy;Idol;Impregnation;Large Breasts;Licking;Maid;Nakadashi;Paizuri;Prostitution;Sex Toys;Spitroast;Squirting;Stockings;Waitress;X-ray','Kamishiro Ryuu',4.52),
+(2216,'Big Ass;Blowjob;Defloration;Fingering;Group Sex;Idol;Large Breasts;Maid;Megane;Nakadashi;Short Hair;Stockings;Threesome;Virginity (Male)','Kamishiro Ryuu',3.8),
+(2217,'Anilingus;Blowjob;Diaper;Filming;Group Sex;Idol;Loli;Short Hair','Azusa Norihee',3.75),
+(2218,'Anal;Crossdressing;Group Sex;Males only;Trap;Twintails;Yaoi','Kirimoto Yuuji',4.25),
+(2219,'Bloomers;Cosplay;Incest;Large Breasts;MILF;Mother;Nurse','Edo Shigezu',4.39),
+(2220,'Anal;Blowjob;Dick Growth;Futa on Male;Futanari;Futanari on Futanari;Impregnation;Incest;Large Breasts;Male on Futa;Nakadashi;Pegging;Sex Toys;Shota;Tentacles;Trap','Ookubo Matagi',2.74),
+(2221,'Ahegao;Blowjob;Fingering;Large Breasts;Nakadashi;X-ray','Menea the Dog',4.76),
+(2222,'Blowjob;Chikan;Fingering;Handjob;Incest;Large Breasts;Megane;MILF;Mother;Nakadashi;Pantyhose','Hyji',3.79),
+(2223,'Anal;Crossdressing;Handjob;Incest;Males only;Masturbation;Otouto;Stockings;Straight Shota;Yaoi','EGAMI',3.52),
+(2224,'Anal;Defloration;Dragon Girl;Gender Bender;Loli;Maid;Nakadashi;Stockings','Bizen',4.3),
+(2225,'Armpit;Bikini;French Kissing;Full Color;Large Breasts;Nakadashi;Swimsuit','Nanao',4.72),
+(2226,'Big Areola;Breast Sucking;Defloration;Fundoshi;Hairy;Impregnation;Lactation;Large Breasts;Nakadashi;Paizuri;Pregnant;X-ray','Taji',4.12),
+(2227,'Straight Shota;Tomboy;X-ray','Katou Fuguo',4.36),
+(2228,'Anal;Blowjob;Invisible;Large Breasts;Magical Girl;Mind Break;Nakadashi;Rape;Short Hair;Squirting;Tentacles;Tomboy','BANG-YOU | Didori',4.23),
+(2229,'Bathroom Sex;BBM / Fat Man;Blowjob;Cheating;Condom;Crotchless / Breastless;Filming;Handjob;Huge Breasts;Huge Penis;Large Breasts;Leg Lock;Megane;MILF;Nakadashi;Pantyhose','Haitukun',3.93),
+(2230,'Ahegao;Blowjob;Hairy;Large Breasts;School Uniform;Uncensored;X-ray','Bubuzuke',4.39),
+(2231,'French Kissing;Hairy;Happy Sex;Nakadashi;Pettanko;Short Hair;Tomboy','Fushoku',4.78),
+(2232,'Defloration;Elder Sister;Femdom;Incest;Reverse Rape;School Uniform;Short Hair;Straight Shota','Agata',4.3),
+(2233,'BBM / Fat Man;Defloration;Loli;Short Hair;Tanlines','Yukiyoshi Mamizu',4.06),
+(2234,'Anal;Band-Aid / Pasties;Collar;Double Penetration;Group Sex;Impregnation;Large Breasts;Mind Break;Mind Control;Nakadashi;Paizuri;Pregnant;Rape;Slave;Stockings;Threesome','Fan no Hitori',3.45),
+(2235,'Aunt;Big Ass;Blackmail;Blowjob;Cheating;Fingering;Full Color;Incest;Large Breasts;Leg Lock;MILF;Nakadashi;Story Arc;Straight Shota;Sweating','Kuroneko Smith',4.09),
+(2236,'Ahegao;BBM / Fat Man;Bondage;Cheating;Collar;Filming;Group Sex;Hairy;Hairy Armpits;Large Breasts;MILF;Mind Break;Short Hair;Slave','Tanaka Aji',3.33),
+(2237,'Exhibitionism;Femdom;Footjob;Humiliation;Large Breasts;Lingerie;Nakadashi;Rape;School Uniform;Sex Toys;Stockings;Twintails;Uncensored','Oouso',4.33),
+(2238,'Ahegao;Bestiality;Blowjob;Deepthroat;Exhibitionism;Horse;Large Breasts;Nakadashi;Prolapse;Stomach Bulge;Vomit;X-ray','Mitsuru Nakata',3.44),
+(2239,'Ahegao;Blowjob;Dark Skin;DILF;Elf;Gyaru;Huge Breasts;Impregnation;Large Breasts;Nakadashi','Taihei Tengoku',3.61),
+(2240,'Ahegao;BBW;BDSM;Big Ass;Bikini;Blindfold;Blowjob;Cheating;Exhibitionism;Filming;Huge Breasts;Incest;Inseki;Large Breasts;MILF;Mother;Straight Shota;Voyeurism;X-ray','Jyura',3.85),
+(2241,'Anal;Crossdressing;Males only;Nakadashi;Shota;Trap;Yaoi','Acbin''s',4.3),
+(2242,'BBM / Fat Man;Gender Bender;Large Breasts;Mind Break;Prostitution','Kazakura',3.27),
+(2243,'Blowjob;Breast Sucking;Incest;Large Breasts;MILF;Mother;Nakadashi;Possession;Straight Shota','Takatsu',4.33),
+(2244,'Anal;DILF;Double Penetration;Exhibitionism;Group Sex;Loli;Masturbation;Short Hair;Straight Shota;Threesome','Kiya Shii',3.81),
+(2245,'Anal;BBM / Fat Man;Decensored;Dirty Old Man;Double Penetration;Drugs;Fingering;Gangbang;Group Sex;Hairy;Large Breasts;MILF;Rape;Sleeping;Story Arc;Threesome;Widow','Aoi Hitori',3.58),
+(2246,'Blowjob;Breast Sucking;Large Breasts;Megane;Nakadashi;School Uniform;Short Hair;Smell;Smug','Herio',4.76),
+(2247,'BDSM;Blindfold;Blowjob;Bondage;Happy Sex;Large Breasts;Maledom;Nakadashi;School Uniform;Short Hair','Spiritus Tarou',4.71),
+(2248,'Body Painting;Dark Skin;Full Color;Group Sex;Large Breasts;Paizuri','Mda Starou',4.28),
+(2249,'Ahegao;Anal;Bikini;Blackmail;Blowjob;Cheating;Chikan;Cunnilingus;Dark Skin;Double Penetration;Drugs;Exhibitionism;Fingering;Group Sex;Gyaru;Hairy;Hotpants;Impregnation;Incest;Large Breasts;Lingerie;Maid;Masturbation;MILF;Mother;Multiple Insertion;Nakadashi;Netorare;Pregnant;Short Hair;Sleeping;Story Arc;Straight Shota;Swimsuit;Tankoubon;Tanlines;Tattoo;X-ray','Takatsu',4.27),
+(2250,'Anal;Armpit;Big Ass;Blowjob;Crossdressing;French Kissing;Handjob;Licking;Males only;Nakadashi;School Uniform;Shota;Stockings;Trap;Yaoi','Agawa Ryo;Toilet Komoru',4.6),
+(2251,'Anal;Bisexual;Defloration;Femdom;Group Sex;Harem;Imouto;Incest;Loli;Masturbation;Megane;Mind Break;Nakadashi;Straight Shota;Threesome;Watersports;Yuri','Takanaga Kouhei',4.08),
+(2252,'Blowjob;Loli;Nakadashi;Spats;Stockings;Swimsuit','Toyo',4.42),
+(2253,'Catgirl;Femdom;Furry;Multiple Breasts;Nakadashi','Nme',4.29),
+(2254,'Ahegao;Amputee;Blowjob;Bondage;Deepthroat;DILF;Drugs;Fingering;Gender Bender;Group Sex;Impregnation;Legal Loli;Loli;Maledom;Mind Break;Nakadashi;Rape;Ryona;Snuff;Spanking;Squirting;Stockings;Stomach Bulge;Torture;Uncensored;X-ray','Asanagi',3.55),
+(2255,'Ahegao;Anal;Blowjob;Bondage;Crossdressing;Deepthroat;Dirty Old Man;Fangs;Fingering;Gaping;Gender Bender;Gloves;Group Sex;Hat;Huge Penis;Leg Lock;Lingerie;Lowleg;Maid;Masturbation;Mind Break;Rape;School Swimsuit;School Uniform;Shota;Sixty-Nine;Small Penis;Stockings;Swimsuit;Symbol Shaped Pupils;Threesome;Trap;Twintails;Uncensored;Yaoi','Asanagi',4.47),
+(2256,'Ahegao;Alien;Big Ass;Blowjob;Cunnilingus;Decensored;Demon Girl | Succubus;Femdom;Hairy;Pettanko;Sixty-Nine;Wormhole;X-ray','Yuki Tomoshi',4.26),
+(2257,'Decensored;Group Sex;Layer Cake;Loli;Robot Girl;Shared Senses;Stockings;Threesome','Petenshi',4.29),
+(2258,'Bondage;Childhood Friend;Defloration;French Kissing;Happy Sex;Nakadashi;School Uniform;Sumata;Virginity (Male);X-ray','Yukimi',4.58),
+(2259,'Blackmail;Fingering;Huge Penis;Impregnation;Large Breasts;Magical Girl;School Uniform','Yoshiie',3.7),
+(2260,'Blowjob;Emotionless Sex;Leg Lock;Nakadashi;Pantyhose;X-ray','Katou Fuguo',4.5),
+(2261,'Loli;Nakadashi;Stockings;Straight Shota;X-ray','Katou Fuguo',4.55),
+(2262,'Ahegao;Big Ass;Blowjob;Cheating;Chikan;Dark Skin;Deepthroat;Defloration;Exhibitionism;Full Color;Group Sex;Huge Breasts;Huge Penis;Impregnation;Large Breasts;Loli;Maid;MILF;Nakadashi;Naked Apron;Nurse;Oppai Loli;Oyakodon;Rape;Reverse Rape;School Uniform;Slave;Spanking;Stockings;Story Arc;Stuck in Wall;Sweating;Tomboy;X-ray','Koto',4.28),
+(2263,'Anilingus;Cunnilingus;Femdom;Maid;Pegging;Strap-on;Trap;Uncensored','Sexyturkey',4.16),
+(2264,'Ahegao;Big Ass;French Kissing;Hairy;Impregnation;Large Breasts;Nakadashi;Reverse Rape','Booch',4.48),
+(2265,'Anal;Anilingus;Blowjob;Crossdressing;Demon Girl | Succubus;Femdom;French Kissing;Large Breasts;Nakadashi;Paizuri;Pegging;Sex Toys;Spreading;Stockings;Straight Shota;Trap;Uncensored;Virginity (Male);X-ray','Shindou',4.1),
+(2266,'Blowjob;Breast Sucking;Collar;Cunnilingus;Face Sitting;Group Sex;Harem;Large Breasts;Layer Cake;Licking;Nakadashi;Sweating;Uncensored;X-ray','Tachibana Omina',4.59),
+(2267,'Anal;Fingering;Hypnosis;Loli;Nakadashi;School Uniform;Stockings;Symbol Shaped Pupils','Mamezou',4.42),
+(2268,'Group Sex;Monster Girl;Paizuri;Slime;Slime Girl;Swimsuit;Threesome;Transformation','DATE',4.47),
+(2269,'Anal;Crossdressing;Males only;Shota;Stockings;Trap;Yaoi','Scotch',4.35),
+(2270,'Ahegao;Animal Girl;Bestiality;Collar;Defloration;Drugs;Fangs;Fox Girl;French Kissing;Human Cattle;Humiliation;Large Breasts;Maledom;Mind Break;Mind Control;Nakadashi;Pig;Slave;Stockings;Stomach Bulge;Symbol Shaped Pupils;Uncensored;X-ray','Asanagi',3.76),
+(2271,'Ahegao;Asphyxiation;Chikan;DILF;Exhibitionism;Fangs;Fingering;Group Sex;Large Breasts;Licking;Megane;Mind Break;Paizuri;Rape;Ryona;School Uniform;Squirting;Twintails;Uncensored','Asanagi',3.92),
+(2272,'Blowjob;Childhood Friend;Hairy;Masturbation;Nakadashi;School Uniform;Short Hair;X-ray','Kauti',4.0),
+(2273,'Blowjob;Large Breasts;Loli;Nakadashi;Twintails','KONBOI',4.17),
+(2274,'Anal;Animal Girl;Group Sex;Nakadashi','Shiroobi',3.38),
+(2275,'Ahegao;Blowjob;Cervical Penetration;Kimono / Yukata;Nakadashi;Paizuri;Symbol Shaped Pupils;X-ray','Eshimoto',4.55),
+(2276,'Animal Girl;BBM / Fat Man;Full Color;Handjob;Loli;Onahole;Oppai Loli;Short Hair','Esora Koto',3.57),
+(2277,'Bathroom Sex;Blowjob;Breast Sucking;French Kissing;Large Breasts;MILF;Mother;Paizuri;Sumata','Unagimaru',4.57),
+(2278,'Anal;Animal Girl;Blowjob;Catgirl;Cosplay;Cunnilingus;Exhibitionism;Full Color;Imouto;Incest;Masturbation;Sex Toys;Short Hair;Urethra Insertion;Watersports','Minatoya Shunsaku',4.61),
+(2279,'Anal;Bondage;Collar;Group Sex;Males only;Piercings;Rape;Shota;Trap;Yaoi','Kai Maruko',3.62),
+(2280,'Ahegao;Anilingus;BBW;Big Ass;Blowjob;Cheating;Deepthroat;Group Sex;Hairy;Handjob;Harem;Huge Penis;Inverted Nipples;Large Breasts;Layer Cake;Leg Lock;Megane;MILF;Mind Break;Nakadashi;Netori;Plump;Sex on the Phone;Squirting;Tanlines','Minamida Usuke',4.51),
+(2281,'Blowjob;Childhood Friend;Cunnilingus;Fingering;French Kissing;Happy Sex;Large Breasts;Nakadashi;School Uniform;Squirting','Suihei Sen',4.79),
+(2282,'Blowjob;Bondage;Cheating;Childhood Friend;Dark Skin;Defloration;Dirty Old Man;Group Sex;Hairy;Happy Sex;Huge Penis;Large Breasts;Paizuri;Prostitution;Reverse Rape;School Uniform;Slut;Stockings;Swimsuit;Tankoubon;Tanlines;Teacher;Uncensored;Yuri','Eisuke',4.74),
+(2283,'Defloration;Happy Sex;Harem;Impregnation;Kimono / Yukata;Large Breasts;Lingerie;Megane;MILF;Pantyhose;Pregnant;Shimaidon;Slut;Stockings;Story Arc;Tankoubon;Teacher;Threesome','Yano Toshinori',4.56),
+(2284,'Anal;Crossdressing;Males only;Masturbation;Megane;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Binto',4.38),
+(2285,'Blowjob;Defloration;Emotionless Sex;Fingering;French Kissing;Gokkun;Huge Breasts;Large Breasts;Lingerie;Nakadashi;Paizuri;Spreading;Stockings','Kaiou',4.18),
+(2286,'Collar;French Kissing;Happy Sex;Nakadashi;X-ray','Takaharu',4.53),
+(2287,'Assjob;BBW;Big Ass;Bikini;Collar;Huge Breasts;Large Breasts;Paizuri;Swimsuit','Muronaga Chaashuu',4.35),
+(2288,'Anal;Animal Girl;Blowjob;Bunnygirl;Fundoshi;Furry;Happy Sex;Kimono / Yukata;Nakadashi','Setouchi Kurage',4.46),
+(2289,'Blowjob;Childhood Friend;Comedy;Delusion;Exhibitionism;Gangbang;Happy Sex;Large Breasts;Paizuri;School Uniform;Short Hair;Virginity (Male)','Itou Yuuji',4.38),
+(2290,'Anal;Blowjob;Breast Sucking;Double Penetration;Fingering;Group Sex;Large Breasts;Muscle;Nakadashi;Paizuri;Straight Shota','Itou Yuuji',3.93),
+(2291,'Ahegao;Corruption;Dick Growth;Elder Sister;Futanari;Gender Bender;Rape;Shota;Transformation;Vampire','Mikezoutei',3.73),
+(2292,'Ahegao;Anal;Asphyxiation;BBM / Fat Man;Dark Skin;Dirty Old Man;Double Penetration;Gangbang;Gaping;Gyaru;Impregnation;Large Breasts;Megane;Nakadashi;Nurse;Pettanko;Pregnant;Prostitution;Rape;School Uniform;Sex Toys;Shimapan;Spitroast;Swimsuit;Tankoubon;Uncensored;Western;X-ray;Yandere','gy',4.23),
+(2293,'Handjob;Imouto;Incest;Inseki;Loli;Nakadashi;Reverse Rape;School Uniform;Short Hair;Sleeping;X-ray','Araki Mitsuru',4.65),
+(2294,'BBW;Big Ass;Blowjob;Dark Skin;Deepthroat;Femdom;Gyaru;Happy Sex;Hotpants;Huge Breasts;Large Breasts;Leg Lock;Phimosis;Sweating;Virginity (Male)','Ozy',4.61),
+(2295,'Anilingus;Animal Boy;Animal Girl;Blowjob;Bukkake;Catgirl;Decensored;Full Color;Group Sex;Harem;Large Breasts;Nakadashi;Paizuri;Twins','Arumajiki',4.47),
+(2296,'Ahegao;Demon Girl | Succubus;Dick Growth;Drugs;Exhibitionism;Femdom;Footjob;Full Color;Handjob;Huge Penis;Humiliation;Monster Girl;Nakadashi;Stomach Bulge;Watersports;X-ray','Mimizu',4.42),
+(2297,'Bondage;Defloration;Femdom;Group Sex;Large Breasts;Orgasm Denial;Paizuri;Threesome;Twintails;Virginity (Male)','utu',4.32),
+(2298,'Bikini;Blowjob;French Kissing;Happy Sex;Large Breasts;Megane;Nakadashi;Paizuri;Swimsuit','utu',4.67),
+(2299,'Bathroom Sex;Blowjob;Cunnilingus;Dandere;Hairy;Happy Sex;Kuudere;Large Breasts;School Uniform;Squirting','utu',4.61),
+(2300,'Anal;Bikini;Cheating;Condom;Crossdressing;Dark Skin;Full Color;Males only;Nakadashi;Prostitution;Shota;Stockings;Trap;Tsundere;Yaoi','Enoshima Iki',4.46),
+(2301,'Anal;Angel;Anilingus;Bondage;CBT;Crossdressing;Demon | Incubus;Full Color;Huge Penis;Males only;Mouth Gag;Prostate Massage;Rape;Sex Toys;Shota;Trap;Urethra Insertion;Yaoi','Darumasan Koronda',3.67),
+(2302,'Demon Girl | Succubus;Dick Growth;Drugs;Femdom;Gloves;Happy Sex;Huge Penis;Leg Lock;Mind Break;Nakadashi;Pettanko;Short Hair;Stockings;Stomach Bulge;X-ray','Mimizu',4.27),
+(2303,'Anal;Crossdressing;Exhibitionism;Full Color;Males only;Shota;Stockings;Trap;Yaoi','Soundvillage',4.27),
+(2304,'Anal;Full Color;Males only;School Uniform;Shota;Trap;Yaoi','Soundvillage',4.2),
+(2305,'Big Ass;Blowjob;Breast Sucking;Cunnilingus;Drugs;French Kissing;Large Breasts;Nakadashi;Paizuri;Stockings;X-ray','Yukisiro Arte',4.48),
+(2306,'Anal;BBW;Blowjob;Deepthroat;Nakadashi;Paizuri;Plump;Prostitution;Short Hair','Ibukichi',4.09),
+(2307,'Blowjob;Femdom;Full Color;Group Sex;Large Breasts;Nakadashi;Paizuri;Reverse Rape;School Uniform;Slut;Stockings;Threesome;Uncensored;X-ray','Usashiro Mani',4.15),
+(2308,'BBW;Breast Sucking;Large Breasts;Paizuri;Prostitution;Swimsuit','Muronaga Chaashuu',3.75),
+(2309,'BBW;Big Ass;Blowjob;Cheating;Happy Sex;Inverted Nipples;Large Breasts;MILF;Nakadashi;Paizuri;School Uniform;Stockings','Muronaga Chaashuu',4.36),
+(2310,'Anal;BBM / Fat Man;Full Color;Males only;Shota;Tanlines;Yaoi','Soundvillage',4.0),
+(2311,'Anal;Animal Boy;Assjob;Crossdressing;Dark Skin;Footjob;Full Color;Group Sex;Leotard;Males only;Muscle;Pantyhose;Prostitution;Stockings;Trap;Yaoi','Greco Roman',4.74),
+(2312,'Anal;Blowjob;Crossdressing;Dark Skin;Filming;Full Color;Group Sex;Maid;Males only;Onahole;Sex Toys;Spitroast;Trap;Yaoi','Greco Roman',3.24),
+(2313,'Anal;Anilingus;Double Penetration;Femdom;Full Color;Futa on Male;Futanari;Futanari on Futanari;Group Sex;Incest;Inseki;Large Breasts;Male on Futa;Oyakodon;Shota;Threesome;Trap','Greco Roman',3.45),
+(2314,'BBM / Fat Man;Full Color;Large Breasts;MILF;Pantyhose;Prostitution;Stockings','Greco Roman',2.62),
+(2315,'Anal;Anilingus;Crossdressing;Footjob;Full Color;Group Sex;Males only;Multiple Insertion;Trap;Yaoi','Greco Roman',3.89),
+(2316,'Anal;Blackmail;DILF;Drugs;Enema;Full Color;Large Breasts;Male on Futa;Orgasm Denial;Pantyhose;Shemale;Stockings','Greco Roman',3.0),
+(2317,'Ahegao;Bikini;Blackmail;Cheating;Dark Skin;Filming;French Kissing;Full Color;Gyaru;Large Breasts;Lingerie;Mind Break;Nakadashi;Netori;Tanlines;Tomboy;X-ray','Korotsuke',4.5),
+(2318,'Ahegao;Anal;BDSM;Blowjob;Cheating;Condom;Exhibitionism;Full Color;Gokkun;Group Sex;Hairy;Huge Breasts;Impregnation;Large Breasts;Masturbation;MILF;Nakadashi;Naked Apron;Netori;Phimosis;Pregnant;Straight Shota;Voyeurism','Minamida Usuke',4.3),
+(2319,'Bestiality;Blowjob;Defloration;Dog;Masturbation;Nakadashi;Sleeping','xxzero',4.41),
+(2320,'Bestiality;Blowjob;Cheating;Dog;Large Breasts;MILF;Nakadashi','xxzero',3.82),
+(2321,'Blowjob;Childhood Friend;French Kissing;Hairy;Happy Sex;Large Breasts;Nakadashi;School Uniform;Stomach Bulge;X-ray','Yoshida',4.63),
+(2322,'Armpit;Blowjob;Cunnilingus;French Kissing;Happy Sex;Imouto;Incest;Licking;Nakadashi;Short Hair;X-ray','Oryou',4.82),
+(2323,'Anal;Anilingus;Blowjob;Bondage;Collar;Demon Girl | Succubus;Femdom;Futa on Male;Futanari;Handjob;Large Breasts;Male on Futa;Masturbation;Mouth Gag;Orgasm Denial;Phimosis;Reverse Rape;Short Hair;Smegma','Kitahara Eiji',3.68),
+(2324,'Big Ass;Huge Penis;Large Breasts;Muscle;Paizuri;Sweating;Twintails','JACKASSS | Sorahati Midoro',4.28),
+(2325,'Bikini;Group Sex;Impregnation;Large Breasts;Short Hair;Stockings;Swimsuit;Symbol Shaped Pupils;Threesome','Inanaki Shiki',4.68),
+(2326,'Big Ass;Blowjob;Defloration;Elf;Group Sex;Happy Sex;Harem;Large Breasts;MILF;Nakadashi;Nun;Symbol Shaped Pupils;Threesome;Uncensored','Tachibana Omina',4.82),
+(2327,'Ahegao;Asphyxiation;Bondage;CBT;Dark Skin;Deepthroat;DILF;Fangs;Femdom;Footjob;Gloves;Hat;Human Cattle;Humiliation;Maledom;Megane;Military Uniform;Mind Break;Nakadashi;Nose Hook;Pettanko;Rape;Slave;Snuff;Squirting;Stockings;Straight Shota;Uncensored','Asanagi',4.1),
+(2328,'Ahegao;Blowjob;Bondage;Cervical Penetration;Defloration;Double Penetration;Fingering;Full Color;Furry;Inverted Nipples;Kunoichi;Large Breasts;Leg Lock;Leotard;Nakadashi;Prostitution;Sex Toys;Short Hair;Stockings;Stomach Bulge;X-ray','Mimonel',4.62),
+(2329,'Ahegao;Anal;Armpit;Big Ass;Blowjob;Crotchless / Breastless;DILF;Double Penetration;Gangbang;Group Sex;Impregnation;Lingerie;Lowleg;Nakadashi;Stockings;Torn Clothing;Uncensored','Booch',4.19),
+(2330,'Ahegao;Anal;BBW;Big Ass;Blowjob;Double Penetration;Exhibitionism;Filming;Group Sex;Impregnation;Masturbation;Nakadashi;Plump;Stockings;Stuck in Wall;Symbol Shaped Pupils;Threesome;Uncensored','Booch',4.17),
+(2331,'Decensored;Group Sex;Harem;Loli;Megane','Kiya Shii',4.63),
+(2332,'Blowjob;Incest;MILF;Mother;Nakadashi;Short Hair;Straight Shota;Watersports;X-ray','Mizuiro Megane',4.71),
+(2333,'Big Ass;French Kissing;Happy Sex;Impregnation;Large Breasts;MILF;Paizuri','Yoshimura Tatsumaki',4.64),
+(2334,'Full Color;Large Breasts;Megane;Pantyhose;Short Hair','Akizora Momidi',4.42),
+(2335,'Blowjob;Cheating;Lactation;Large Breasts;MILF;Nakadashi;Uncensored','Yuzuriha',4.15),
+(2336,'Ahegao;Anal;Blowjob;Cheating;Filming;Gyaru;Hairy;Megane;Nakadashi;Teacher;Uncensored;Voyeurism','Uchi-Uchi Keyaki',3.02),
+(2337,'Condom;French Kissing;Happy Sex;Idol','Gustav',4.61),
+(2338,'Defloration;Double Penetration;Group Sex;Mind Break;Nakadashi;Rape','Gentsuki',3.67),
+(2339,'Cunnilingus;Handjob;Large Breasts;Nakadashi;Paizuri;Swimsuit;Tanlines;Twintails;Uncensored;X-ray','Hashimoto',4.6),
+(2340,'Large Breasts;Nakadashi;School Uniform;Short Hair;Uncensored;X-ray','Ooyama Kina',4.33),
+(2341,'Blowjob;Cunnilingus;Hairy;Large Breasts;Leg Lock;Nakadashi;Paizuri;Short Hair;X-ray;Yandere','Kurona',2.6),
+(2342,'Blowjob;French Kissing;Hairy;Happy Sex;Large Breasts;Leg Lock;Megane;Nakadashi;School Uniform;Short Hair;X-ray','Asuhiro',4.64),
+(2343,'Childhood Friend;Condom;Defloration;Happy Sex;School Uniform;Short Hair','Kumano Tooru | Kumada',4.65),
+(2344,'Blowjob;Cosplay;Full Color;Large Breasts;Nurse;Pantyhose;School Uniform','Nanao',4.61),
+(2345,'French Kissing;Happy Sex;Large Breasts;Megane;Nakadashi;School Uniform;Teacher;X-ray','Utatane Hiroyuki',4.73),
+(2346,'Ahegao;Blowjob;Braids;Cheating;Full Color;Incest;Large Breasts;MILF;Mother;Nakadashi;Pantyhose;Swimsuit;Torn Clothing','Shiashiya',3.04),
+(2347,'Animal Boy;Catgirl;Dog Girl;Males only;Selfcest;Yaoi','Kikuchi',3.6),
+(2348,'Femdom;Large Breasts;Short Hair','Ashima Takumi',4.33),
+(2349,'Collar;Full Color;Group Sex;Large Breasts;Maid;Nakadashi;Stockings;Threesome','REI',4.62),
+(2350,'Bikini;Blowjob;Large Breasts;Nakadashi;Paizuri','Haruno Suzune',4.24),
+(2351,'Blowjob;Breast Sucking;Cheating;Condom;Cunnilingus;Fingering;Happy Sex;Hotpants;Licking;MILF;Nakadashi;Netorare;Sixty-Nine;Swimsuit','Haitoku Sensei',4.13),
+(2352,'Blowjob;Cheating;Hairy;Large Breasts;Nakadashi;Netori;Paizuri;Uncensored','Iburo.',4.09),
+(2353,'Ahegao;Blindfold;Blowjob;Body Modification;Bodysuit;Bondage;Breast Expansion;Corruption;Dick Growth;Eyepatch;Futanari;Gokkun;Huge Breasts;Impregnation;Lactation;Large Breasts;Machine;Magical Girl;Mind Control;Mouth Gag;Nakadashi;Paizuri;Sex Toys;Stockings;Symbol Shaped Pupils;Tattoo;X-ray','Ikameshi',3.83),
+(2354,'Handjob;School Uniform;Stockings','Fumi Miyabi',4.52),
+(2355,'Crossdressing;Maid;Threesome;Trap;Yuri','Tsukai You',4.14),
+(2356,'Happy Sex;Large Breasts;Nakadashi','Akiduki Akina',4.61),
+(2357,'Anal;Big Ass;Bikini;Blowjob;Decensored;Dirty Old Man;Emotionless Sex;Full Color;Large Breasts;School Swimsuit;School Uniform;Short Hair;Stockings;Swimsuit;Teacher','Mogudan',3.88),
+(2358,'Anal;Big Ass;Bloomers;Blowjob;Cunnilingus;Decensored;Emotionless Sex;Full Color;Large Breasts;Maledom;Short Hair','Mogudan',3.8),
+(2359,'Blowjob;Cheating;Cunnilingus;Incest;Large Breasts;Paizuri;Short Hair;Uncensored','Picao',4.31),
+(2360,'Cunnilingus;Dirty Old Man;Group Sex;Large Breasts;Nakadashi;Short Hair;Squirting;Stockings','Satetsu',3.94),
+(2361,'Blowjob;Happy Sex;Impregnation;Large Breasts;Loli;Nakadashi;Oppai Loli;Paizuri;Stockings','Arui Ryou',4.77),
+(2362,'Blowjob;Happy Sex;Large Breasts;School Uniform;Sweating','Nakano Sora',4.61),
+(2363,'BBM / Fat Man;Bikini;Large Breasts;Pettanko;Prostitution;Royalty;Swimsuit','Tomose Shunsaku',2.81),
+(2364,'Anal;Blindfold;Blowjob;Exhibitionism;Happy Sex;Large Breasts;Maledom;Naked Apron;Short Hair','Mukoujima Tenro',3.63),
+(2365,'Ahegao;Anal;Bikini;Blowjob;Bunnygirl;Collar;Cosplay;Dark Skin;Femdom;Hairy;Hat;Large Breasts;Leotard;Pantyhose;Phimosis;Ponytail;Prostitution;Smegma;Spreading;Stockings;Swimsuit;Twintails','Motsu',4.19),
+(2366,'Anal;Blowjob;Dick Growth;Futa on Male;Futanari;Pantyhose;Prostate Massage;Smell','Runrun',3.89),
+(2367,'Anal;Masturbation;MILF;Sex Toys;Solo Action;Stockings;Straight Shota;X-ray','Saigado',4.4),
+(2368,'Anal;Anilingus;Big Ass;Face Sitting;Femdom;Happy Sex;Large Breasts;Stockings','Kageshio',4.73),
+(2369,'Anal;Anilingus;Big Areola;Big Ass;Blowjob;Fingering;Gaping;Gokkun;Large Breasts;Nakadashi;Paizuri;Sex Toys;Stockings','Kageshio',4.73),
+(2370,'Ahegao;Anal;Anilingus;Animal Girl;Armpit;Big Ass;Large Breasts;Licking;School Uniform;Sex Toys;Stockings;Sweating','Puyocha | YO',4.72),
+(2371,'Anal;Blowjob;Childhood Friend;Crossdressing;Males only;Miko;Nakadashi;Shota;Trap;Yaoi','Senbazuru',4.47),
+(2372,'Bodysuit;Large Breasts;MILF;Nakadashi;Oni;Short Hair;Threesome','UNIKURA',4.22),
+(2373,'Cow Girl;Happy Sex;Large Breasts;Nakadashi;Paizuri;Symbol Shaped Pupils','Tabigarasu',4.47),
+(2374,'Blowjob;Defloration;Idol;Large Breasts;Maid;Nakadashi;Stockings;Straight Shota;Watersports','Kamishiro Ryuu',4.34),
+(2375,'Animal Girl;Blowjob;Crossdressing;Large Breasts;Loli;Nakadashi;Paizuri;Pettanko;School Uniform;Threesome;Trap','Gunnjou',4.31),
+(2376,'Big Areola;Big Ass;Huge Penis;Large Breasts;Straight Shota;Watersports','Oshii Rei',3.88),
+(2377,'Anilingus;Blowjob;Decensored;Elder Sister;Femdom;French Kissing;Handjob;Incest;Inseki;Large Breasts;Nakadashi;Virginity (Male)','Sakai Ringo',4.0),
+(2378,'Ahegao;Anal;Anilingus;Collar;Crotchless / Breastless;Double Penetration;Exhibitionism;Fingering;French Kissing;Group Sex;Happy Sex;Harem;Huge Penis;Imouto;Incest;Leotard;Lingerie;Mind Break;Sex Toys;Squirting;Uncensored','Fukuyama Naoto',4.61),
+(2379,'Ahegao;Bathroom Sex;Big Areola;Big Ass;Blowjob;Breast Sucking;Bukkake;Chikan;Deepthroat;Exhibitionism;Fingering;Full Color;Gokkun;Happy Sex;Hotpants;Huge Breasts;Huge Penis;Large Breasts;Licking;Nakadashi;Rape;School Uniform;Shimapan;Squirting;Uncensored;X-ray','Erodezain Koubou;Toilet Komoru',4.74),
+(2380,'Anal;Crossdressing;Males only;Pantyhose;Shota;Spats;Sweating;Symbol Shaped Pupils;Trap;Yaoi','Dibi',4.39),
+(2381,'Ahegao;BDSM;Blindfold;Cunnilingus;Exhibitionism;Fingering;French Kissing;Happy Sex;Hat;Large Breasts;Maledom;Nakadashi;Short Hair;Sweating;Symbol Shaped Pupils;Tall Girl','Bakuya',4.66),
+(2382,'Ahegao;Bikini;Blowjob;Happy Sex;Large Breasts;Nakadashi;Swimsuit;Tanlines','soba',4.48),
+(2383,'Ahegao;Anal;Femdom;Footjob;Huge Breasts;Imouto;Incest;Large Breasts;Megane;Mind Break;Nakadashi;Stockings;Stomach Bulge;Twintails','Nuku Nuku Orange',3.77),
+(2384,'Ahegao;Anal;BBM / Fat Man;Bikini;Enema;Fingering;Group Sex;Huge Breasts;Large Breasts;Mind Break;Nakadashi;Sex Toys;Swimsuit','Shibuki Oroshi',3.76),
+(2385,'BBM / Fat Man;Cheating;Condom;Prostitution;School Uniform','ShAKe',3.73),
+(2386,'Animal Girl;Blowjob;Collar;Dog Girl;Fangs;Group Sex;Inverted Nipples;Loli;Nakadashi;Oppai Loli;Short Hair;Symbol Shaped Pupils;Threesome;X-ray','Nanao Yukiji',4.48),
+(2387,'BBW;Big Areola;Big Ass;Cheating;Incest;Large Breasts;MILF;Mother;Nakadashi;Netori;Rape','Bifidus',4.32),
+(2388,'Blowjob;Bunnygirl;Collar;Leotard;Nakadashi;Pantyhose;Stockings;Symbol Shaped Pupils','Son Yohsyu',3.58),
+(2389,'Anal;Crossdressing;Femdom;Footjob;Full Color;School Uniform;Sex Toys;Shimapan;Stockings;Straight Shota;Trap','Asazuki Norito',4.28),
+(2390,'Condom;Exhibitionism;Hairy;Humiliation;Pettanko;Stockings;Uncensored;Watersports','Nishi Iori',4.39),
+(2391,'Ahegao;Blowjob;Double Penetration;Drunk;Femdom;Footjob;French Kissing;Gangbang;Group Sex;Handjob;Large Breasts;Masturbation;Nakadashi;Office Lady;Pantyhose;Spitroast;Sweating;Threesome;Torn Clothing','Mizuryu Kei',3.92),
+(2392,'Ahegao;Happy Sex;Large Breasts;Squirting;Uncensored','Koppori Nama Beer',4.61),
+(2393,'Anilingus;Blowjob;Happy Sex;Large Breasts;Nakadashi;Naked Apron;Paizuri;Uncensored;X-ray','Oohira Sunset',4.8),
+(2394,'Ahegao;BBW;Hairy;Huge Breasts;Large Breasts;Paizuri;Straight Shota','Ozy',4.24),
+(2395,'Blowjob;Cheating;Large Breasts;Lingerie;Nakadashi;Sex Toys;Uncensored;X-ray','Kaitenfude',4.29),
+(2396,'Blowjob;Large Breasts;Nakadashi;Paizuri;Stockings;Straight Shota;X-ray','Aoi Manabu',4.4),
+(2397,'Ahegao;Breast Sucking;Dirty Old Man;French Kissing;Full Color;Large Breasts;MILF;Nakadashi;Rape','Negurie',3.7),
+(2398,'Aunt;Blowjob;Cunnilingus;Dirty Old Man;Double Penetration;Full Color;Group Sex;Incest;Large Breasts;Megane;MILF;Mother;Nakadashi;Pantyhose;Rape;Spitroast;Straight Shota;Torn Clothing','Negurie',3.81),
+(2399,'Anal;Cheating;Crossdressing;Males only;School Uniform;Shota;Stockings;Trap;Yaoi','Hanamaki Kaeru',3.95),
+(2400,'Cunnilingus;Femdom;Megane;Nakadashi;Nurse;Short Hair;Stockings;Virginity (Male);X-ray','Teri-Terio',4.65),
+(2401,'Happy Sex;Hat;Large Breasts;Nakadashi;Sweating;Swimsuit;Tan;Tanlines;X-ray','Yo-shu Ohepe',4.25),
+(2402,'Ahegao;Bondage;Cunnilingus;Fangs;Fingering;Happy Sex;Pettanko;Tomboy;Uncensored','fu-ta',4.78),
+(2403,'Anal;Bikini;Blowjob;Defloration;Double Penetration;Gangbang;Group Sex;Handjob;Large Breasts;MILF;Mind Control;Paizuri;Swimsuit','KEN',3.67),
+(2404,'Ahegao;Anal;Blindfold;Blowjob;Bondage;Breast Sucking;Bukkake;Collar;Dark Skin;Deepthroat;Defloration;Dick Growth;Double Penetration;Drugs;Elf;Fingering;Futa on Female;Futanari;Gangbang;Gloves;Group Sex;Handjob;Huge Penis;Human Toilet;Imouto;Incest;Large Breasts;Mind Break;Monster;Mouth Gag;Nakadashi;Nun;Orc;Rape;Royalty;Sex Toys;Slave;Stockings;Stomach Bulge;Story Arc;Tankoubon;Tattoo;Tentacles;X-ray','Ootsuki Wataru',4.33),
+(2405,'Big Ass;Defloration;Happy Sex;Megane;Nakadashi;Paizuri;School Uniform;Stockings;Story Arc;Yandere','Morimiya Masayuki',4.56),
+(2406,'Bondage;Defloration;Femdom;Group Sex;Harem;Impregnation;Maid;MILF;Nakadashi;Pantyhose;Pettanko;School Uniform;Stockings;Story Arc;Teacher;Threesome','Nishikawa Kou',4.57),
+(2407,'Ahegao;Femdom;Footjob;Happy Sex;Large Breasts;Maid;Nakadashi;Orgasm Denial;Stockings','Oroneko',4.68),
+(2408,'Bikini;Blowjob;Childhood Friend;Cunnilingus;Happy Sex;Large Breasts;Nakadashi;Paizuri;Sixty-Nine;Swimsuit;X-ray','Oroneko',4.71),
+(2409,'Big Ass;Blowjob;Condom;Large Breasts;School Uniform;Short Hair;Uncensored','Takahashiya Takabee',4.59),
+(2410,'Blowjob;Childhood Friend;Happy Sex;Nakadashi;Short Hair;Spats;Tomboy;Uncensored','Nippa Takahide',4.59),
+(2411,'Anilingus;Femdom;Large Breasts;MILF;Mind Control;Nakadashi;Pantyhose;Yandere','YOSHIKI | Endo Yoshiki',4.28),
+(2412,'Anal;Blowjob;Crossdressing;Femdom;Futa on Male;Futanari;Huge Penis;Large Breasts;Prostate Massage;School Uniform;Trap','Piririnegi',4.1),
+(2413,'BBW;Idol;Large Breasts;Nakadashi;Plump;Short Hair;Sleeping','EBA',4.6),
+(2414,'Anal;Animal Boy;Crossdressing;Happy Sex;Males only;School Uniform;Shota;Stockings;Trap;Yaoi','Palco Nagashima',4.57),
+(2415,'Anilingus;BBM / Fat Man;Blowjob;Exhibitionism;Idol;Leg Lock;Lingerie;Lowleg;Masturbation;Megane;Mind Break;Nakadashi;Sex Toys;Stockings;Symbol Shaped Pupils;X-ray','Ninoko',4.32),
+(2416,'Big Ass;Blowjob;Bukkake;Dirty Old Man;Double Penetration;Gangbang;Group Sex;Handjob;Large Breasts;Megane;Nurse;Prostitution;Slut;Straight Shota;Uncensored','E-Musu Aki',4.17),
+(2417,'Ahegao;Big Ass;Blowjob;Bondage;Femdom;Handjob;Large Breasts;Nakadashi;Uncensored','Mario',4.63),
+(2418,'Bikini;Blowjob;Cow Girl;Dark Skin;Lactation;Large Breasts;Monster Girl;Nakadashi;Paizuri;Swimsuit','Yukiyanagi',4.36),
+(2419,'BBW;Big Areola;Big Ass;Bloomers;Bunnygirl;Huge Breasts;Large Breasts;Leotard;School Uniform;Twintails','Dorachefu',4.69),
+(2420,'Ahegao;Asphyxiation;Bodysuit;Bondage;Collar;Full Color;Group Sex;Rape;Slave;Stockings;Threesome','Yuran',4.2),
+(2421,'Anal;Bisexual;Blowjob;Group Sex;Lingerie;Nakadashi;Stockings;Threesome','Yuran',4.64),
+(2422,'Ahegao;Blowjob;School Uniform','Ootsuka Mahiro',4.66),
+(2423,'Ahegao;BBM / Fat Man;Blowjob;Bunnygirl;Corruption;Drugs;Gokkun;Huge Penis;Impregnation;Large Breasts;Monster;Nakadashi;Pantyhose;Pregnant','Misonou',3.7),
+(2424,'BBW;Blowjob;Breast Sucking;Cunnilingus;Handjob;Happy Sex;Lactation;Large Breasts;Nakadashi;Plump;School Uniform;Sixty-Nine;Tall Girl;Watersports','Higashino Mikan',4.41),
+(2425,'Animal Girl;Catgirl;Dog Girl;Happy Sex;Large Breasts;Paizuri;Stockings','Fuurai',4.61),
+(2426,'Blowjob;Cunnilingus;Handjob;Happy Sex;Large Breasts;Lingerie;Nakadashi;Sex Toys;Stockings;Straight Shota;Uncensored','Fukumaaya',4.65),
+(2427,'Big Ass;Cunnilingus;Hairy;Happy Sex;Large Breasts;Nakadashi;Uncensored;X-ray','Shimetta Seiya',4.55),
+(2428,'Big Ass;Blowjob;Decensored;Fingering;Hairy;Large Breasts;Nakadashi;Paizuri;Pantyhose;Short Hair;Stockings','Shimantogawa',4.64),
+(2429,'Blowjob;Fisting;Gaping;Hairy;Harem;Huge Penis;Large Breasts;School Uniform;Virginity (Male)','Saiyazumi',4.11),
+(2430,'Ahegao;Anal;Cheating;Double Penetration;Group Sex;Idol;Impregnation;Large Breasts;Nakadashi;Pregnant','Azukiko',3.3),
+(2431,'Big Areola;Blowjob;Cosplay;Dark Skin;Huge Breasts;Large Breasts;Monster Girl;Nakadashi;Oni;Paizuri;Tall Girl','Onomeshin',4.42),
+(2432,'Anal;Cosplay;Crossdressing;Fisting;Full Color;Males only;Shota;Trap;Yaoi','Apocrine.',4.3),
+(2433,'BBM / Fat Man;Hypnosis;Large Breasts;Mind Control;School Uniform','Aiue Oka',4.3),
+(2434,'Blowjob;Cunnilingus;Footjob;Full Color;Handjob;MILF;Paizuri;Straight Shota','Ponfaz',3.87),
+(2435,'Bloomers;Cousin;Incest;Large Breasts;Paizuri;Short Hair','Kawase Seiki',4.65),
+(2436,'Blowjob;Comedy;Drugs;Happy Sex;Hat;Large Breasts;Leg Lock;Maledom;Paizuri;Pettanko;Rape','J-MAX JAPAN',4.37),
+(2437,'Cosplay;Crossdressing;Nakadashi;Pettanko;Stockings;Straight Shota;Trap','Kozi;Shuffle',4.54),
+(2438,'Anal;Crossdressing;Footjob;Leg Lock;Males only;Nakadashi;Pantyhose;Shota;Symbol Shaped Pupils;Trap;Yaoi','Chonko',4.11),
+(2439,'Blackmail;Blowjob;Cheating;Impregnation;Incest;Inseki;Large Breasts;MILF;Nakadashi;Netori;Paizuri;Rape;Sleeping','Tukisiro Saya',3.96),
+(2440,'Blowjob;Happy Sex;Large Breasts;Nakadashi;X-ray','Nanase Mizuho',4.5),
+(2441,'Blowjob;Defloration;Drunk;Happy Sex;Large Breasts;Megane;Nakadashi;Paizuri','Natsumikan',4.72),
+(2442,'Blindfold;Blowjob;Bondage;Breast Sucking;Gokkun;Kimono / Yukata;Large Breasts;Maledom;Nakadashi;Short Hair','Koza',4.61),
+(2443,'Big Ass;Blowjob;Footjob;French Kissing;Idol;Large Breasts;Masturbation;Nakadashi;Paizuri;Reverse Rape;Sleeping;Smell','Saki Chisuzu',4.48),
+(2444,'Anal;Males only;Shota;Small Penis;Yaoi','Ryome Gantai',3.78),
+(2445,'Ahegao;Anal;Bikini;Blackmail;Blowjob;Bukkake;Catgirl;Cheating;Collar;Cunnilingus;Defloration;Filming;Fingering;Group Sex;Harem;Large Breasts;Maledom;MILF;Nakadashi;Office Lady;Sex Toys;Stockings;Sumata;Sweating;Swimsuit;Symbol Shaped Pupils;Threesome;X-ray','Katsurai Yoshiaki',4.55),
+(2446,'Blowjob;Group Sex;Large Breasts;Straight Shota;Symbol Shaped Pupils;Threesome','Amamitu Kousuke',4.5),
+(2447,'Ahegao;Big Ass;Blowjob;Femdom;French Kissing;Hairy;Large Breasts;Nakadashi;Paizuri;Tsundere','Hori Hiroaki;Polinky',4.48),
+(2448,'Big Ass;Blowjob;Body Writing;Cheating;Filming;Full Color;Gokkun;Large Breasts;Maid;MILF;Nakadashi;Prostitution;Sex Toys;Slave;Stockings;Watersports','Yojouhan Shobou',3.64),
+(2449,'Cousin;Elf;Incest;Large Breasts;Nakadashi;School Uniform;Stockings;Straight Shota','Kawase Seiki',4.45),
+(2450,'Condom;Happy Sex;Large Breasts;Maid;Stockings','Ootsuka Mahiro',4.59),
+(2451,'Ahegao;Anal;Big Areola;Blowjob;Breast Sucking;Double Penetration;Group Sex;Hairy;Large Breasts;Megane;Nakadashi;Office Lady;Pantyhose;Spitroast;Threesome','Zonda',4.06),
+(2452,'Ahegao;Anal;Bisexual;Corruption;Double Penetration;Femdom;Large Breasts;Latex;Mind Break;Nun;Rape;Tattoo;Tentacles;Vampire;Yuri','luku',4.25),
+(2453,'Childhood Friend;Comedy;Condom;Defloration;Happy Sex;Nakadashi;Uncensored;Virginity (Male)','Ootsuka Reika',4.74),
+(2454,'Blowjob;French Kissing;Large Breasts;Nakadashi;Transparent Clothing','Tsukitokage',4.54),
+(2455,'Ahegao;Anal;Anilingus;Blindfold;Blowjob;Bondage;Double Penetration;Group Sex;Idol;Large Breasts;Mind Break;Mouth Gag;Nakadashi;Paizuri;Rape;Sex Toys;Squirting;Stockings;Symbol Shaped Pupils','Karasu',3.76),
+(2456,'Ahegao;Comedy;Condom;Happy Sex;Maledom;Nakadashi;Pettanko;School Uniform;Sex Toys;Spats;Uncensored','fu-ta',4.8),
+(2457,'Braids;Defloration;Exhibitionism;Happy Sex;Large Breasts;Nakadashi;Paizuri;Pantyhose;Symbol Shaped Pupils;Twintails','Oroneko',4.56),
+(2458,'Big Ass;Blowjob;Comedy;Cosplay;Deepthroat;Large Breasts;Magical Girl;Stockings;Tsundere;Twintails','Miitoban | Nikuman Umeew',4.71),
+(2459,'Anal;Blowjob;Defloration;Happy Sex;Large Breasts;Lingerie;Nakadashi;Stockings;Twintails;Virginity (Male);Watersports','Sankuro',4.56),
+(2460,'Ahegao;Anal;Blowjob;Bondage;Deepthroat;Drugs;Enema;Group Sex;Large Breasts;Mouth Gag;Nakadashi;Rape;Stockings;Stomach Bulge;Symbol Shaped Pupils;Tall Girl','kinntarou',3.85),
+(2461,'Ahegao;Blowjob;Gokkun;Invisible;Nakadashi;Rape;School Uniform;Short Hair','BANG-YOU | Didori',3.64),
+(2462,'Cheating;Collar;Cow Girl;Group Sex;Large Breasts;MILF;Oyakodon;Paizuri;Stockings;Symbol Shaped Pupils;Threesome;X-ray','Kanno Takanori | Minamino Sazan',4.72),
+(2463,'BBW;Big Areola;Big Ass;Blowjob;Cheating;Gokkun;Incest;Inseki;Large Breasts;Lingerie;MILF;Mother;Nakadashi;Netori','Etuzan Jakusui',4.25),
+(2464,'Anilingus;Bisexual;Dark Skin;Group Sex;Gyaru;Happy Sex;Impregnation;Large Breasts;Short Hair;Straight Shota;Threesome','Nanakagi Satoshi',4.57),
+(2465,'Blackmail;Blowjob;Crotchless / Breastless;Cunnilingus;Fingering;Large Breasts;Leotard;Maledom;Nakadashi;Short Hair;Symbol Shaped Pupils;X-ray','Meganei',4.4),
+(2466,'Ahegao;Big Areola;Big Ass;Blowjob;Elder Sister;Huge Breasts;Incest;Large Breasts;Nakadashi;Paizuri;School Uniform;Transparent Clothing;Twintails;X-ray','Hakaishin',4.73),
+(2467,'BBW;Blowjob;Breast Sucking;Bukkake;Cheating;Incest;Large Breasts;MILF;Mother;Nakadashi;Straight Shota','Hyji',4.51),
+(2468,'Big Ass;Hairy;Incest;Kimono / Yukata;Large Breasts;MILF;Mother;Nakadashi;Short Hair','Natsu no Oyatsu',4.54),
+(2469,'Blowjob;Ghost;Huge Breasts;Large Breasts;Nakadashi;Paizuri;School Uniform','Iwasaki Yuuki',4.16),
+(2470,'Anal;Crossdressing;Males only;Mind Break;Rape;Sex Toys;Shota;Spanking;Stockings;Trap;Yaoi','Dynamite Moca',4.38),
+(2471,'Animal Girl;Blowjob;Cunnilingus;Fox Girl;French Kissing;Hairy;Nakadashi;Stockings;Symbol Shaped Pupils','Jino',4.75),
+(2472,'Blowjob;Happy Sex;Nakadashi;Pettanko;School Uniform;Transparent Clothing;Twintails','Chicken',4.66),
+(2473,'Big Ass;Blowjob;Breast Sucking;Dandere;Defloration;French Kissing;Large Breasts;Nakadashi;Straight Shota;Tall Girl','Kemuri Haku',4.71),
+(2474,'Ahegao;Anal;Band-Aid / Pasties;BBM / Fat Man;Blackmail;Collar;Elf;Lingerie;Maebari;Masturbation;Mind Break;Rape;Smell;Squirting;Stockings;Symbol Shaped Pupils;Watersports','Nanahara Fuyuki',4.04),
+(2475,'Ahegao;Anal;BBM / Fat Man;Big Ass;Bisexual;Blowjob;Bukkake;Double Penetration;French Kissing;Gokkun;Group Sex;Kunoichi;Large Breasts;Military Uniform;Nakadashi;Robot Girl;Sweating;Symbol Shaped Pupils','wakamesan',4.02),
+(2476,'Ahegao;Blowjob;Chikan;Condom;Hairy;Happy Sex;Large Breasts;Lingerie;School Uniform;Uncensored','Dagashi',4.7),
+(2477,'Bikini;Defloration;Femdom;Footjob;Happy Sex;Nakadashi;Swimsuit;Uncensored','Hissatsukun',4.31),
+(2478,'','',3.43),
+(2479,'Blowjob;Femdom;Hairy;Happy Sex;Nakadashi;Pettanko;School Uniform;Short Hair;Uncensored','Honryou Hanaru',4.6),
+(2480,'Blowjob;Lingerie;MILF;Nakadashi;Paizuri;Teacher;Uncensored;X-ray','Tokie Hirohito',4.59),
+(2481,'Ahegao;BBM / Fat Man;Condom;Cunnilingus;Hairy;Happy Sex;Large Breasts;Shimapan;Uncensored','Azuma Tesshin',4.57),
+(2482,'Cunnilingus;Footjob;Ghost;Happy Sex;Large Breasts;Maledom;Monster Girl;Nakadashi;Smug;Twintails;Uncensored;X-ray','Shiba Nanasei',4.75),
+(2483,'Ahegao;Blowjob;Christmas;Defloration;Happy Sex;Large Breasts;Masturbation;Nakadashi;Sex Toys;Uncensored;Voyeurism;X-ray','Sasachinn',4.74),
+(2484,'Ahegao;Autofellatio;Condom;Futanari;Gokkun;Group Sex;Huge Penis;Large Breasts;Masturbation;School Uniform;Sex Toys;Solo Action;Squirting;Stomach Bulge;Sweating;Vomit','Yoshida Inuhito',4.17),
+(2485,'BBM / Fat Man;BBW;Big Areola;Bikini;Blowjob;Bunnygirl;Collar;Cosplay;Crotchless / Breastless;Cunnilingus;Gokkun;Hairy;Happy Sex;Hat;Huge Breasts;Huge Penis;Impregnation;Large Breasts;Licking;Nakadashi;Plump;Sleeping;Stockings;Sweating;Symbol Shaped Pupils;X-ray','Akikusa Peperon',4.37),
+(2486,'Blowjob;Catgirl;Dark Skin;Femdom;Gyaru;Nakadashi;Stockings;Straight Shota;X-ray','Kanta.',3.78),
+(2487,'Anal;Blowjob;Drugs;Males only;Orgasm Denial;Rape;Shota;Yaoi','Kai Maruko',3.5),
+(2488,'Blowjob;Exhibitionism;Full Color;Hat;Males only;Prostate Massage;Royalty;Shota;Yaoi','Pocchi',3.67),
+(2489,'Ahegao;Anal;BBM / Fat Man;Blindfold;Group Sex;Idol;Large Breasts;Mind Control;Nakadashi;Rape;Symbol Shaped Pupils;Threesome','sian',3.77),
+(2490,'Anal;Armpit;Blowjob;Collar;Double Penetration;Group Sex;Large Breasts;Megane;Rape;Sex Toys;Straight Shota','Saigado',4.27),
+(2491,'Ahegao;Anal;Blowjob;Hairy;Large Breasts;Nakadashi;Short Hair;Stockings;X-ray','Uguisu Kagura',4.47),
+(2492,'Ahegao;BBM / Fat Man;Blowjob;Deepthroat;Defloration;French Kissing;Gokkun;Large Breasts;Mind Control;Nakadashi;Short Hair','wakamesan',4.23),
+(2493,'Big Areola;Big Ass;Blowjob;French Kissing;Happy Sex;Large Breasts;Paizuri;Short Hair;Stockings','Jean Louis',4.42),
+(2494,'Blowjob;Cheating;Deepthroat;Femdom;Footjob;Gyaru;Huge Penis;Leg Lock;Nakadashi;Netori;School Uniform;Symbol Shaped Pupils;Virginity (Male);X-ray','SAKULA',4.58),
+(2495,'Cheating;Crossdressing;Femdom;Hairy;Nakadashi;Prostate Massage;Reverse Rape;Sex Toys;Short Hair;Stockings;Tattoo;Trap','Ginhaha',4.18),
+(2496,'Collar;DILF;Exhibitionism;Group Sex;Megane;MILF;Office Lady;Stockings;Story Arc;Swinging / Netorase;Tankoubon;Virginity (Male)','Saigado',3.58),
+(2497,'Armpit;Bride;Cheating;Double Penetration;Group Sex;Large Breasts;Megane;MILF;Prostitution;Story Arc;Tankoubon;Threesome','Saigado',3.86),
+(2498,'Ahegao;Anal;Blowjob;Deepthroat;Drugs;Happy Sex;Huge Penis;Large Breasts;Nakadashi;School Uniform;Slut;Smell;Symbol Shaped Pupils;Twintails;X-ray','Dekosuke 18gou',4.62),
+(2499,'BBW;Big Ass;Blackmail;Collar;Defloration;Exhibitionism;French Kissing;Huge Breasts;Large Breasts;Paizuri;School Uniform;Sex Toys;Symbol Shaped Pupils','Ichinomiya Yuu',4.16),
+(2500,'Blowjob;Deepthroat;Defloration;Fingering;Hairy;Imouto;Incest;Inseki;Large Breasts;School Uniform;Virginity (Male)','Saemon',4.42),
+(2501,'Anal;Angel;Blowjob;Bukkake;Double Penetration;Gangbang;Group Sex;Large Breasts;Nakadashi;Paizuri;Spitroast;Wings','ryoma',4.22),
+(2502,'Ahegao;Breast Sucking;Femdom;Lactation;Large Breasts;Nakadashi;Paizuri;Short Hair;Straight Shota;Tall Girl','Suihei Sen',4.4),
+(2503,'Blowjob;Defloration;Lactation;Large Breasts;Nakadashi;Paizuri;Sleeping;Spreading;Watersports','Iso Nogi',4.32),
+(2504,'Cunnilingus;Hairy;Handjob;Happy Sex;Nakadashi;Pajamas','Miyama',4.74),
+(2505,'Anal;Animal Boy;Full Color;Kimono / Yukata;Males only;Shota;Trap;Yaoi','Kazushi',3.74),
+(2506,'Cunnilingus;Emotionless Sex;French Kissing;Gloves;Licking;Mind Control;Short Hair;Vampire;X-ray','Rojione',4.33),
+(2507,'Cow Girl;Handjob;Happy Sex;Large Breasts;Paizuri','Hijiri Tsukasa',4.59),
+(2508,'Ahegao;Band-Aid / Pasties;Bunnygirl;Filming;Group Sex;Large Breasts;Leotard;Nakadashi;Pantyhose;Symbol Shaped Pupils;Threesome','Nanahara Fuyuki',4.09),
+(2509,'Anal;Collar;Crossdressing;Latex;Males only;Sex Toys;Shota;Slave;Trap;Twintails;Yaoi','Shindou Hajime',3.91),
+(2510,'BBW;Face Sitting;Femdom;Handjob;Large Breasts;Megane;Nakadashi;Plump;Sixty-Nine;Straight Shota;Teacher;Uncensored;X-ray','Tachibana Aruto',4.37),
+(2511,'Breast Sucking;Group Sex;Hairy;Handjob;Kimono / Yukata;Large Breasts;Onsen;Paizuri;Prostitution;Threesome;Uncensored','Kizuka Kazuki',4.77),
+(2512,'Anal;Crossdressing;Fundoshi;Males only;Megane;Miko;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Hirota',4.43),
+(2513,'Blowjob;Bodysuit;Large Breasts;Nakadashi;Paizuri;Symbol Shaped Pupils','Ribyuhki',4.39),
+(2514,'Exhibitionism;Group Sex;Large Breasts;Megane;MILF;Multiple Insertion;Straight Shota;Threesome;X-ray','Kawazuko Chouji',3.92),
+(2515,'Anal;Crossdressing;Incest;Inseki;Males only;Otouto;Shota;Stockings;Trap;Yaoi','Aoi Takayuki',3.49),
+(2516,'Blowjob;Bondage;Femdom;Handjob;Nakadashi;Reverse Rape;Straight Shota;Teacher;Trap;Yandere','Okyuuri',4.46),
+(2517,'Armpit;Defloration;Hairy;Hairy Armpits;Happy Sex;Huge Breasts;Large Breasts;Licking;MILF;Office Lady;Pantyhose;Sweating','Tanishi',4.69),
+(2518,'Blowjob;French Kissing;Hairy;Happy Sex;Impregnation;Large Breasts;Leg Lock;Masturbation;Nakadashi;Pantyhose;Teacher;X-ray','Waves',4.52),
+(2519,'Blowjob;Hairy;Happy Sex;Impregnation;Large Breasts;Lingerie;MILF;Nakadashi','Saemon',4.71),
+(2520,'Anal;Incest;Males only;Otouto;Shota;Trap;Yaoi','Mareo',4.3),
+(2521,'Ahegao;Blowjob;Chikan;Condom;Hairy;Handjob;Large Breasts;Megane;Prostitution;School Uniform;Slut;Uncensored;X-ray','Ryo',3.87),
+(2522,'Blowjob;Cunnilingus;Defloration;Hairy;Happy Sex;Large Breasts;Leg Lock;Nakadashi;School Uniform;Stockings;Uncensored;X-ray','SAVAN',4.64),
+(2523,'Big Ass;Blowjob;Condom;Cunnilingus;Dandere;Hairy;Happy Sex;School Uniform;Uncensored','Key',4.8),
+(2524,'Ahegao;Anal;Anilingus;Cunnilingus;Hairy;Happy Sex;Incest;Large Breasts;MILF;Mother;Nakadashi;Straight Shota;Watersports','Sarunote Isao',3.64),
+(2525,'Blowjob;Defloration;Happy Sex;Large Breasts;Nakadashi;Paizuri;Stockings;Twintails;Uncensored','Petenshi',4.62),
+(2526,'Animal Girl;Big Ass;Fox Girl;French Kissing;Full Color;Handjob;Happy Sex;Impregnation;Large Breasts;Masturbation;Nakadashi','Yukibuster-Z',4.73),
+(2527,'Cunnilingus;Defloration;French Kissing;Hairy;Happy Sex;Large Breasts;Maledom;Nakadashi','Art Post',4.75),
+(2528,'Childhood Friend;Defloration;French Kissing;Happy Sex;Leg Lock;Nakadashi;Pettanko;School Uniform;Tomboy;Tsundere;Virginity (Male);X-ray','Harenochiame',4.76),
+(2529,'Ahegao;Anal;Animal Girl;Blowjob;Collar;Deepthroat;Defloration;Dog Girl;Drugs;French Kissing;Large Breasts;Mind Break;Mind Control;Nakadashi;Pet Girl;Rape;School Uniform;Sex Toys;Slave;Stockings','581',3.97),
+(2530,'Anal;Animal Boy;Bikini;Crossdressing;Filming;Rape;Royalty;Shota;Swimsuit;Trap;Yaoi','Okino Matsushiro',3.8),
+(2531,'Blowjob;Handjob;Large Breasts;Megane;Nakadashi;Paizuri;Teacher','Hisama Kumako',4.14),
+(2532,'Blowjob;Fangs;Fingering;Happy Sex;Megane;Nakadashi;Pettanko','MARUTA',4.62),
+(2533,'Anal;Maid;Rape;Short Hair;Stockings;Watersports','Summer',3.47),
+(2534,'Blowjob;Femdom;French Kissing;Happy Sex;Nakadashi;Oni;Pantyhose;School Uniform','Akizora Momidi',4.4),
+(2535,'Collar;Cunnilingus;Fingering;French Kissing;Nakadashi;Paizuri;Symbol Shaped Pupils','Takaharu',4.72),
+(2536,'Blowjob;Group Sex;Large Breasts;Short Hair;Threesome','Ayakawa Riku',4.79),
+(2537,'Masturbation;Nakadashi;X-ray','Katou Fuguo',4.67),
+(2538,'Condom;Fingering;Hairy;Happy Sex;Large Breasts;Maledom;Nakadashi;School Uniform;Straight Shota;X-ray','Ootsuka Mahiro',4.68),
+(2539,'Armpit;BBW;Big Ass;Cheating;Hairy;Large Breasts;MILF;Sumata;Sweating','Yoshiura Kazuya',4.48),
+(2540,'Bikini;Footjob;Idol;Swimsuit','Tsurui',4.5),
+(2541,'Anal;Animal Boy;Bisexual;Blowjob;Crossdressing;Double Penetration;Futa on Male;Group Sex;Huge Penis;Sex Toys;Shemale;Shota;Stockings;Threesome;Trap;Watersports;Yaoi','Katou Chakichi',3.94),
+(2542,'Ahegao;Anal;Anilingus;BBM / Fat Man;Blackmail;Blowjob;Crossdressing;Filming;Gangbang;Group Sex;Handjob;Lingerie;Males only;Nakadashi;Stockings;Trap;X-ray;Yaoi','Tonikaku',4.02),
+(2543,'Anal;Anilingus;Blowjob;Dark Skin;Elf;Males only;Megane;Shota;Trap;Yaoi','Takatsu | Takatsu Keita',4.52),
+(2544,'Anal;Crossdressing;Dark Skin;Elf;Shemale;Shota;Trap;Yaoi','SIRPENT',4.54),
+(2545,'Anal;Crossdressing;Dark Skin;Elf;Group Sex;Shota;Stockings;Trap;Yaoi','SIRPENT',4.73),
+(2546,'Anal;Bikini;Crossdressing;Futa on Male;Futanari;Group Sex;Incest;Large Breasts;MILF;Shota;Swimsuit;Threesome;Trap;Yaoi','SIRPENT',3.43),
+(2547,'Childhood Friend;Elder Sister;Incest;Inseki;Large Breasts;Megane;Short Hair;Straight Shota;Virginity (Male)','Haritama Hiroki',4.47),
+(2548,'Ahegao;Anal;Double Penetration;Gangbang;Group Sex;Mind Break;Sex Toys;Stockings;Symbol Shaped Pupils','Puyocha | YO',3.85),
+(2549,'Band-Aid / Pasties;Blowjob;Defloration;Exhibitionism;Imouto;Incest;Loli;Stockings;Twintails','Rico',4.12),
+(2550,'Ahegao;Anal;Double Penetration;Group Sex;Large Breasts;Magical Girl;Miko;Mind Break;Rape;School Uniform;Stockings;Tentacles','Punita',2.58),
+(2551,'Ahegao;Cervical Penetration;Dark Skin;Gender Bender;Large Breasts;Nakadashi;School Swimsuit;X-ray','Shiraha Mato',3.39),
+(2552,'Fingering;Idol;Large Breasts;Nakadashi;Short Hair','Shimao Kazu',4.67),
+(2553,'Comedy;Exhibitionism;Nakadashi;Pettanko;Short Hair','Souichi | Watanabe Souichi',3.53),
+(2554,'Bukkake;Gangbang;Group Sex;Large Breasts;Nakadashi;Sleeping','Souichi | Watanabe Souichi',3.4),
+(2555,'Ahegao;Anal;Bondage;Double Penetration;Drugs;Group Sex;Impregnation;Loli;Nakadashi;Rape;Stockings;Stomach Bulge;Threesome;X-ray','Nanjou Asuka',3.67),
+(2556,'Ahegao;Idol;Nakadashi','Spiritus Tarou',4.28),
+(2557,'Animal Girl;Big Ass;Blowjob;Catgirl;Defloration;Happy Sex;Kimono / Yukata;Large Breasts;Monster Girl;Transparent Clothing;Virginity (Male)','Tokiwa Midori',4.83),
+(2558,'Blowjob;Femdom;French Kissing;Gyaru;Happy Sex;Large Breasts;School Uniform;Virginity (Male)','Mikuni Mizuki',4.58),
+(2559,'Ahegao;Condom;Happy Sex;Nakadashi;School Uniform;X-ray','Mikuni Mizuki',4.52),
+(2560,'Blowjob;Comedy;Condom;Defloration;Group Sex;Happy Sex;Long Tongue;School Uniform;Short Hair;Threesome;Virginity (Male)','Takenaka Hideo',4.4),
+(2561,'Anal;Bondage;Crossdressing;Femdom;Humiliation;Maid;MILF;Pegging;Sex Toys;Small Penis;Straight Shota;Trap;Watersports','Itami',4.31),
+(2562,'Blackmail;Blowjob;Large Breasts;Masturbation;Megane;Nakadashi;Short Hair;Small Penis;Straight Shota','Hiru Okita',4.32),
+(2563,'Femdom;Gender Bender;Straight Shota','Takenaka Hideo',3.68),
+(2564,'Blowjob;Loli;Nakadashi;School Uniform;Watersports','Shirane Taito',4.46),
+(2565,'Blowjob;Bondage;Defloration;Femdom;French Kissing;Kimono / Yukata;Maledom;Megane;Monster Girl;Spanking;Virginity (Male)','Takenaka Hideo',4.54),
+(2566,'Blowjob;Deepthroat;Group Sex;Incest;Inseki;Loli;Nakadashi;Niece;Shimaidon;X-ray','Shimao Kazu',4.42),
+(2567,'Blowjob;Breast Sucking;Happy Sex;Hat;Idol;Large Breasts;Nakadashi;Pantyhose;Short Hair','Shimao Kazu',4.43),
+(2568,'Blowjob;Condom;Demon Girl | Succubus;Freckles;Loli;Nakadashi;Prostitution','Leonard 16 Sei',4.07),
+(2569,'Cousin;Footjob;Incest;Kotatsu;Large Breasts;Megane;School Uniform;Uncensored','Shinkai',4.37),
+(2570,'Anal;Blowjob;Double Penetration;Group Sex;Handjob;Mind Break;Nakadashi;Prostitution;Reverse Harem;Short Hair;Stockings;X-ray','St.germain-sal',3.95),
+(2571,'Ahegao;Anal;Blowjob;Defloration;Drugs;Mind Control;Nose Hook;Pet Girl;Sex Toys;Stockings;Symbol Shaped Pupils;Witch','Kenpi',3.9),
+(2572,'Age Regression;Ahegao;BBM / Fat Man;Blowjob;Corruption;Defloration;French Kissing;Impregnation;Loli;Mind Break;Monster;Nakadashi;Rape;Symbol Shaped Pupils;Tattoo;X-ray','nalvas',3.68),
+(2573,'Drugs;Large Breasts;Nakadashi;Pantyhose;Sex Toys;Short Hair;Uncensored;Watersports','Kyockcho',4.16),
+(2574,'Anal;Blowjob;Loli;Monster Girl;Nakadashi;Sex Toys;Stockings;Uncensored;Vampire','Booch',4.21),
+(2575,'Anal;Blowjob;Catgirl;Group Sex;Nakadashi;Squirting;Swimsuit;Uncensored','Booch',3.7),
+(2576,'Anal;Bestiality;Collar;Dog;Double Penetration;Group Sex;Megane;Rape;X-ray','H9',3.54),
+(2577,'BBM / Fat Man;Bikini;Loli;Rape;Swimsuit','Molokonomi | Hiraya Nobori',3.71),
+(2578,'Age Regression;Crossdressing;Defloration;Gangbang;Gender Bender;Large Breasts;Megane;Nakadashi;Rape;School Uniform;Transformation;Virginity (Male)','H9',3.66),
+(2579,'Ahegao;Bestiality;Bondage;Cervical Penetration;Defloration;Group Sex;Loli;Prolapse;Rape;Sleeping;Stomach Bulge;X-ray','H9',2.55),
+(2580,'Ahegao;Anal;Bikini;Blowjob;Crossdressing;Decensored;Males only;Sex Toys;Shota;Smell;Stockings;Swimsuit;Trap;Yaoi','Mario',4.44),
+(2581,'Ahegao;Blowjob;Cervical Penetration;Deepthroat;Exhibitionism;French Kissing;Full Color;Inverted Nipples;Large Breasts;Leotard;Masturbation;Nakadashi;Stockings;Symbol Shaped Pupils;X-ray','Mimonel',4.63),
+(2582,'Ahegao;Anal;Decensored;Defloration;Fingering;Group Sex;Happy Sex;Harem;Large Breasts;Loli;Masturbation;Oppai Loli;Sleeping;Stockings;Straight Shota;Virginity (Male);X-ray','Kousaka Jun',4.32),
+(2583,'Animal Girl;BBW;Big Ass;Cunnilingus;Dog Girl;Furry;Large Breasts;MILF;Nakadashi;X-ray','Nme',4.55),
+(2584,'Ahegao;Cheating;Full Color;Incest;Large Breasts;MILF;Mother;Short Hair','Kogaku Kazuya',4.47),
+(2585,'Ahegao;Big Areola;Big Ass;Blowjob;Deepthroat;Double Penetration;Gokkun;Hypnosis;Mind Control;Nakadashi;Oppai Loli;Rape;School Swimsuit;Short Hair;Squirting;Swimsuit;Symbol Shaped Pupils;Threesome','Hisui',3.32),
+(2586,'Big Ass;Cunnilingus;Defloration;Dirty Old Man;Exhibitionism;Filming;Hairy;Handjob;Large Breasts;Megane;Nakadashi;School Uniform;Uncensored;Virginity (Male)','Hatimoto',3.2),
+(2587,'Animal Girl;Bunnygirl;Condom;Femdom;Footjob;Group Sex;Happy Sex;Impregnation;Lactation;Large Breasts;Nakadashi;Paizuri;Pregnant;Swinging / Netorase;Symbol Shaped Pupils;Threesome','Diisuke',4.75),
+(2588,'Blowjob;Happy Sex;Large Breasts;Megane;Nakadashi;Paizuri;School Uniform','Kemigawa Mondo',4.86),
+(2589,'Animal Girl;Fox Girl;Happy Sex;Large Breasts;Loli;Nakadashi','Sameda Koban',4.16),
+(2590,'Ahegao;Anal;Big Areola;Bikini;Blowjob;Breast Sucking;Bukkake;Collar;Condom;Cunnilingus;Decensored;Defloration;Fingering;French Kissing;Hairy;Handjob;Harem;Large Breasts;Leg Lock;Lingerie;Masturbation;Mind Control;Nakadashi;Orgasm Denial;Paizuri;Short Hair;Stockings;Swimsuit;Symbol Shaped Pupils;X-ray','TRY | Hougen',4.71),
+(2591,'Bukkake;Crossdressing;Drugs;Femdom;Futa on Male;Gokkun;Reverse Rape;Shemale;Threesome;Trap','Sukiyoshi Shinji',3.67),
+(2592,'Bikini;Blowjob;Idol;Large Breasts;Swimsuit;Symbol Shaped Pupils','Maru.',4.38),
+(2593,'Anal;Blowjob;Condom;Demon Girl | Succubus;Double Penetration;Group Sex;Large Breasts;Megane;MILF;Nakadashi;Prostate Massage;Prostitution;Virginity (Male)','Takatsu | Takatsu Keita',3.58),
+(2594,'Large Breasts;Paizuri;Smegma;Straight Shota;Trap','Tachikawa Negoro',3.67),
+(2595,'Anal;Crossdressing;Futa on Male;Futanari;Shota;Trap','Nmasse',4.25),
+(2596,'Anal;Bikini;Blowjob;Crossdressing;Femdom;Futa on Male;Futanari;Maid;Nakadashi;Sex Toys;Trap;X-ray','Nmasse',4.32),
+(2597,'Ahegao;Asphyxiation;Blowjob;Femdom;Nakadashi;Pettanko;School Uniform;Squirting;Uncensored;Western;X-ray','Kid',4.43),
+(2598,'Ahegao;BBM / Fat Man;Cervical Penetration;Huge Penis;Loli;Masturbation;Nakadashi;Oppai Loli;Prostitution;Rape;Sleeping;Smell;Watersports;Witch;X-ray','Akatsuki Katsuie',4.14),
+(2599,'Blowjob;French Kissing;Happy Sex;Idol;Nakadashi;Paizuri','Meganei',4.48),
+(2600,'Big Areola;Big Ass;Blowjob;Chikan;French Kissing;Gloves;Group Sex;Happy Sex;Huge Breasts;Huge Penis;Impregnation;Inverted Nipples;Large Breasts;Lingerie;MILF;Muscle;Nakadashi;Robot Girl;Stockings;Sweating;Threesome;X-ray','Uron Rei',4.73),
+(2601,'Big Areola;Big Ass;Blindfold;Blowjob;French Kissing;Happy Sex;Huge Breasts;Impregnation;Inverted Nipples;Large Breasts;Muscle;Nakadashi;Robot Girl;Short Hair;Stockings','Uron Rei',4.73),
+(2602,'BBW;Bikini;Large Breasts;Nakadashi;Plump;School Uniform;Short Hair;Spreading;Swimsuit','Shigekix',4.35),
+(2603,'Imouto;Incest;Loli;Nakadashi;School Uniform;Sweating;Tsundere;Twintails','Yukiu Con',4.69),
+(2604,'BBW;Blowjob;Breast Sucking;Hairy;Happy Sex;Large Breasts;Nakadashi;Office Lady;Plump;Uncensored;X-ray','Kirihara Yuu',4.86),
+(2605,'Ahegao;Anilingus;BBW;Big Ass;Handjob;Happy Sex;Large Breasts;MILF;Nakadashi;Plump;Uncensored','Rokkaku Yasosuke',4.65),
+(2606,'Big Ass;Blowjob;Cheating;Cunnilingus;Hairy;Large Breasts;Paizuri;School Uniform;Uncensored','Maki Tatsuki',4.22),
+(2607,'Blowjob;Childhood Friend;Happy Sex;Large Breasts;Nakadashi;Tall Girl;Uncensored','Napata',4.64),
+(2608,'Ahegao;Anal;Blowjob;Double Penetration;Group Sex;Gyaru;Large Breasts;Nakadashi;School Uniform;Spitroast;Stockings;Uncensored','Akuma',3.67),
+(2609,'Ahegao;Big Ass;Blowjob;Bondage;Defloration;Fingering;Gender Bender;Gyaru;Hairy;Huge Penis;Large Breasts;Maledom;School Uniform;Short Hair;Spreading;Stockings;Symbol Shaped Pupils;Threesome;Uncensored','Iketaki Ganguten',4.38),
+(2610,'Ahegao;Anal;Big Ass;Cosplay;Cunnilingus;Group Sex;Hairy;Large Breasts;Masturbation;School Swimsuit;School Uniform;Sex Toys;Slut;Stockings;Threesome;Uncensored','Abe Manabu',4.69),
+(2611,'Bathroom Sex;Blowjob;Catgirl;Happy Sex;Loli;Nakadashi;Uncensored','Tamano Kedama',4.66),
+(2612,'BBW;Big Ass;Blowjob;Childhood Friend;Happy Sex;Huge Breasts;Large Breasts;Megane;Nakadashi;Paizuri;Plump;Swimsuit;Uncensored','Muronaga Chaashuu',4.61),
+(2613,'Ahegao;Big Areola;Big Ass;Blowjob;Breast Sucking;Bukkake;Dark Skin;Femdom;Gyaru;Handjob;Happy Sex;Large Breasts;Leg Lock;Licking;Nakadashi;Paizuri;School Uniform;Slut;Smug;Symbol Shaped Pupils;Uncensored;Virginity (Male);X-ray','Blmanian',4.5),
+(2614,'Anilingus;Blowjob;Cunnilingus;Face Sitting;Femdom;Group Sex;Humiliation;Hypnosis;Nakadashi;School Uniform;Tan;Tanlines;Uncensored;X-ray','Aiue Oka',4.61),
+(2615,'Big Ass;Blowjob;Femdom;Harem;Humiliation;Hypnosis;Large Breasts;Masturbation;Megane;Nakadashi;School Uniform;Tanlines;Uncensored;X-ray','Aiue Oka',4.61),
+(2616,'Ahegao;Anal;Big Ass;Blowjob;Cosplay;Hairy;Harem;Hypnosis;Impregnation;Large Breasts;Masturbation;Nakadashi;School Uniform;Sex Toys;Tan;Uncensored;X-ray','Aiue Oka',4.7),
+(2617,'Ahegao;Amputee;Monster Girl;Nakadashi;Pettanko;Sweating;X-ray','Barakey',4.67),
+(2618,'Ahegao;Amputee;Blowjob;French Kissing;Monster Girl;Nakadashi;Pettanko;School Uniform;Short Hair;Sweating;X-ray','Barakey',4.45),
+(2619,'Loli;Nakadashi;Short Hair;Swimsuit;Tanlines','Molokonomi | Hiraya Nobori',4.44),
+(2620,'Defloration;Incest;Loli;Niece;Prostitution;Tanlines','Molokonomi | Hiraya Nobori',4.0),
+(2621,'BBM / Fat Man;Blackmail;Loli;Megane','Molokonomi | Hiraya Nobori',4.13),
+(2622,'Decensored;Elder Sister;Full Color;Gokkun;Incest;Large Breasts;Nakadashi;Paizuri;Pantyhose;Prostitution','Sanom;Uraha',4.04),
+(2623,'Dark Skin;Demon Girl | Succubus;Femdom;Furry;Loli;Monster Girl;Nakadashi;Straight Shota','Uchuu Ika',4.43),
+(2624,'Ahegao;Anal;Animal Girl;Blowjob;Corruption;Dick Growth;Dog Girl;Double Penetration;Egg Laying;Futa on Female;Futanari;Hat;Lactation;Large Breasts;Licking;Mind Break;Mind Control;Monster;Monster Girl;Nakadashi;Parasite;Rape;Spats;Spitroast;Symbol Shaped Pupils;Tengu;Tentacles;Twintails','Kenpi',3.5),
+(2625,'Ahegao;Cheating;Full Color;Megane;MILF;Slut;Stockings','Mizuryu Kei',4.08),
+(2626,'Ahegao;Anal;Blowjob;Full Color;Idol;Large Breasts;Sex Toys;Straight Shota','Jabara Tornado',4.25),
+(2627,'Animal Girl;Double Penetration;Group Sex;Loli;Mouse Girl;Short Hair;Straight Shota;Threesome','Harukaze Unipo',3.58),
+(2628,'Ahegao;BBM / Fat Man;Blowjob;Deepthroat;Group Sex;Kunoichi;Large Breasts;Multiple Insertion;X-ray','Souichi | Watanabe Souichi',3.0),
+(2629,'DILF;Happy Sex;Impregnation;Large Breasts;Monster Girl;Nakadashi;Plant Girl;Squirting;X-ray','Mizone',4.82),
+(2630,'Ahegao;Big Ass;DILF;Emotionless Sex;Happy Sex;Kuudere;Large Breasts;Monster Girl;Nakadashi;Plant Girl;X-ray','Mizone',4.8),
+(2631,'Ahegao;Anal;Bestiality;Big Areola;Big Ass;Bikini;Cervical Penetration;Comedy;Double Penetration;Gaping;Group Sex;Hairy;Huge Breasts;Inverted Nipples;Large Breasts;Multiple Insertion;Nipple Penetration;Prolapse;Short Hair;Spitroast;Stomach Bulge;Swimsuit;Symbol Shaped Pupils;Tan;Tanlines;Tentacles;Urethra Insertion;Vomit;Watersports;X-ray','John K. Pe-ta',3.86),
+(2632,'Femdom;Full Color;Happy Sex;Large Breasts;Monster Girl;Nakadashi;Slime Girl','Tama',4.72),
+(2633,'Animal Girl;Dark Skin;Fingering;French Kissing;Large Breasts;Leotard;Nakadashi;Paizuri;Swimsuit','Kekocha',4.68),
+(2634,'Big Areola;Blowjob;Deepthroat;Gokkun;Huge Penis;Inverted Nipples;Large Breasts;Nakadashi;Paizuri;Rape;Sleeping','Rama',4.53),
+(2635,'Anal;Daughter;Elder Sister;Group Sex;Incest;Large Breasts;Megane;MILF;Mother;Oyakodon;Paizuri;Sex Toys;Straight Shota;Threesome;Twintails','Kousaka Jun',4.32),
+(2636,'Animal Girl;BBW;Big Areola;Big Ass;Breast Sucking;Collar;Cow Girl;Handjob;Huge Breasts;Lactation;Large Breasts;Nakadashi;Plump;Straight Shota;Tanlines','Jun',4.6),
+(2637,'Breast Sucking;Condom;Cousin;Defloration;Drunk;Incest;Loli;Megane;Nakadashi;Rape;X-ray','Noise',4.5),
+(2638,'Ahegao;Bikini;Bloomers;Blowjob;Large Breasts;Sweating;Swimsuit;Twintails','Muneshiro',4.67),
+(2639,'Ahegao;Anal;Blowjob;Comedy;Double Penetration;Group Sex;Hat;Large Breasts;Mind Control;Monster Girl;Nakadashi;Paizuri;Parasite;Rape;Short Hair;Spats;Tengu;Threesome','Kenpi',3.44),
+(2640,'Collar;Dark Skin;Demon Girl | Succubus;Femdom;Large Breasts;Straight Shota','Navier Haruka 2T',4.71),
+(2641,'Blowjob;Happy Sex;Kimono / Yukata;Large Breasts;Nakadashi;X-ray','Yoshiura Kazuya',4.51),
+(2642,'Ahegao;Armpit;Cunnilingus;French Kissing;Handjob;Large Breasts;Nakadashi;Stockings','VT',4.3),
+(2643,'Blowjob;Bondage;CBT;Chastity Belt;Collar;Face Sitting;Femdom;Foot Fetish;Humiliation;Licking;Orgasm Denial;Smug;Symbol Shaped Pupils;X-ray','Akai Mato',4.0),
+(2644,'Hat;Impregnation;Legal Loli;Loli;Mind Break;Monster Girl;Rape;Short Hair;Stomach Bulge;Vampire;Wings','Obyaa',3.28),
+(2645,'Blowjob;Defloration;Happy Sex;Kunoichi;Large Breasts;Muscle;Nakadashi;Paizuri;School Uniform;Tanlines','Satou Souji',4.64),
+(2646,'Ahegao;Blowjob;Gloves;Hairy;Happy Sex;Maid;Muscle;Nakadashi;Stockings;Straight Shota','Katou Fuguo',4.42),
+(2647,'Bathroom Sex;Blowjob;Cunnilingus;Dark Skin;Deepthroat;Fingering;French Kissing;Gyaru;Happy Sex;Large Breasts;Lingerie;Nakadashi;Stockings;X-ray','Mushi',4.7),
+(2648,'Anal;Anilingus;Blowjob;CBT;Femdom;Futa on Male;Futanari;Huge Penis;Masturbation;Muscle;School Uniform','Tokimachi Eisei',4.23),
+(2649,'Big Ass;Blowjob;Bunnygirl;French Kissing;Group Sex;Happy Sex;Harem;Lactation;Large Breasts;Nakadashi;Prostate Massage;Stockings;Stomach Bulge;Symbol Shaped Pupils;Threesome;Twintails;X-ray','Tsukimiya Tsutomu',4.42),
+(2650,'Ahegao;Anal;Anilingus;Blowjob;Cunnilingus;Group Sex;Harem;Large Breasts;Megane;Mind Break;Nakadashi;Paizuri;Prostate Massage;X-ray','Motsu',3.44),
+(2651,'Ahegao;Chikan;DILF;Exhibitionism;Fingering;Large Breasts;School Uniform;Sumata;Sweating','Sugaishi',4.23),
+(2652,'Ahegao;BBM / Fat Man;Huge Penis;Loli;Mind Control;Rape;Symbol Shaped Pupils','mmm',3.84),
+(2653,'Collar;Dark Skin;Dog Girl;Furry;Nakadashi;Prostitution','Nme',4.47),
+(2654,'Big Ass;Blowjob;Fingering;Handjob;Large Breasts;Megane;Nakadashi;Paizuri;School Uniform;Symbol Shaped Pupils','Takeda Aranobu',4.73),
+(2655,'Bisexual;Dark Skin;Group Sex;Loli;Nakadashi;Straight Shota;Threesome','Kousaka Jun',4.5),
+(2656,'Defloration;Leg Lock;Loli;Nakadashi;School Swimsuit;Short Hair;Symbol Shaped Pupils;Watersports;X-ray','Kousaka Jun',4.45),
+(2657,'Ahegao;Bisexual;Breast Sucking;Dark Skin;Defloration;Fingering;Group Sex;Happy Sex;Harem;Lingerie;Loli;Nakadashi;Nurse;Oppai Loli;Stockings;Straight Shota;X-ray','Kousaka Jun',4.35),
+(2658,'Blowjob;Filming;Happy Sex;Kimono / Yukata;Large Breasts;Short Hair;Stockings;X-ray','Kousaka Jun',4.88),
+(2659,'Anal;Blowjob;Elder Sister;Group Sex;Incest;Large Breasts;Lingerie;Loli;Masturbation;MILF;Oppai Loli;Stockings;Straight Shota;Strap-on;Tribadism;Voyeurism;Watersports;Yuri','Kousaka Jun',4.45),
+(2660,'Dark Skin;Exhibitionism;Gender Bender;Loli;Nakadashi;Straight Shota;Sweating;Symbol Shaped Pupils;X-ray','Kousaka Jun',4.38),
+(2661,'Blowjob;Defloration;Drugs;Hairy;Hairy Armpits;Impregnation;Masturbation;Megane;Phimosis;Sleeping;Squirting;Watersports','Mizuki Haruto',3.08),
+(2662,'Blowjob;Femdom;Hairy;Happy Sex;Nakadashi;Short Hair;Swimsuit','Mikawaya',4.69),
+(2663,'Anilingus;Animal Girl;BBM / Fat Man;Blowjob;Bunnygirl;Condom;Footjob;Large Breasts;Nakadashi;Paizuri;Prostitution;Stockings','Satetsu',4.28),
+(2664,'Animal Girl;Blowjob;Dark Skin;Nakadashi;Squirting;Watersports','Nokoppa',4.46),
+(2665,'Ahegao;Bikini;Full Color;Happy Sex;Large Breasts;Nakadashi;Straight Shota;Swimsuit;Tall Girl','Suzutsuki Kurara',4.61),
+(2666,'Big Ass;Childhood Friend;Femdom;Footjob;Full Color;Happy Sex;Large Breasts;Masturbation;Straight Shota','Suzutsuki Kurara',4.71),
+(2667,'Ahegao;Anal;Blowjob;Double Penetration;Group Sex;Impregnation;Lactation;Large Breasts;MILF;Mind Control;Stomach Bulge','Hisui',3.76),
+(2668,'Blowjob;Breast Sucking;Condom;Decensored;Happy Sex;Large Breasts;Nakadashi;Paizuri;Spats;X-ray','Tamagoro',4.65),
+(2669,'Blowjob;Decensored;Group Sex;Large Breasts;Magical Girl;Nakadashi;Pettanko;Slut;Threesome;X-ray','Tamagoro',4.67),
+(2670,'Anal;Anilingus;BDSM;Blowjob;Bondage;Breast Sucking;Bukkake;Collar;Cunnilingus;Exhibitionism;Face Sitting;Femdom;Fingering;Gangbang;Group Sex;Hairy;Handjob;Happy Sex;Impregnation;Incest;Large Breasts;Lingerie;Loli;Masturbation;Megane;MILF;Nakadashi;Nurse;Oppai Loli;Police Uniform;Sex Toys;Small Penis;Soushuuhen;Spats;Stockings;Story Arc;Straight Shota;Strap-on;Tribadism;Voyeurism;Watersports;X-ray;Yuri','Kousaka Jun',4.22),
+(2671,'Ahegao;Anal;Big Ass;Blowjob;Dark Skin;Decensored;Exhibitionism;Fingering;Group Sex;Harem;Huge Penis;Large Breasts;Loli;Masturbation;Megane;Oppai Loli;Stockings;Straight Shota;Sweating;Voyeurism;Watersports;X-ray','Kousaka Jun',4.42),
+(2672,'Ahegao;Bestiality;Bisexual;Blowjob;Dandere;Decensored;Furry;Group Sex;Happy Sex;Large Breasts;Licking;Loli;Maid;Masturbation;Nakadashi;Paizuri;Sex Toys;Spanking;Strap-on;Twintails;X-ray;Yuri','Kousaka Jun',4.46),
+(2673,'Big Ass;Blowjob;Decensored;French Kissing;Large Breasts;Muscle;Nakadashi;Straight Shota;Tall Girl','JACKASSS | Sorahati Midoro',3.78),
+(2674,'Ahegao;Breast Sucking;Defloration;Happy Sex;Lactation;Large Breasts;Paizuri;Straight Shota;Vampire','Suzune Rai',3.82),
+(2675,'Ahegao;Breast Sucking;Handjob;Lactation;Large Breasts;Nakadashi;Straight Shota;Vampire;Virginity (Male)','Suzune Rai',3.85),
+(2676,'Ahegao;Anal;Armpit;BBW;Big Ass;Blowjob;Breast Sucking;Double Penetration;Drugs;French Kissing;Full Color;Group Sex;Hairy;Huge Breasts;Large Breasts;Licking;MILF;Nakadashi;Straight Shota;Tanlines;Threesome','',3.98),
+(2677,'Blackmail;Blowjob;Deepthroat;Exhibitionism;Fingering;Group Sex;Hairy;Harem;Large Breasts;Lingerie;Masturbation;MILF;Sex Toys;Squirting;Swinging / Netorase;Tanlines;Watersports','',2.56),
+(2678,'Ahegao;Anal;Anilingus;BDSM;Bisexual;Blindfold;Bondage;Chastity Belt;Crossdressing;Cunnilingus;Elder Sister;Enema;Femdom;Group Sex;Hairy;Hairy Armpits;Handjob;Humiliation;Incest;Inseki;Kimono / Yukata;Large Breasts;Megane;MILF;Mind Break;Mother;Nakadashi;Oyakodon;Piercings;Rape;Sex Toys;Slave;Squirting;Stockings;Story Arc;Straight Shota;Tankoubon;Threesome;Trap;Tribadism;Widow;X-ray;Yandere;Yuri','Kuroiwa Menou',4.23),
+(2679,'Ahegao;Anal;Animal Girl;BBM / Fat Man;Big Ass;Blackmail;Blowjob;Cervical Penetration;Cheating;Comedy;Deepthroat;Defloration;Dog Girl;Double Penetration;Femdom;Footjob;Futanari;Gender Bender;Ghost;Inverted Nipples;Large Breasts;Megane;Miko;Nakadashi;Oyakodon;Possession;Pregnant;Rape;Sex Toys;Short Hair;Stomach Bulge;Story Arc;Tankoubon;Transformation;Watersports;X-ray','Hinotsuki Neko',3.82),
+(2680,'Animal Girl;Blowjob;Cheating;Dark Skin;DILF;Fox Girl;Furry;Loli;Nakadashi','Nme',3.93),
+(2681,'Ahegao;Blowjob;Defloration;Huge Penis;Loli;Nakadashi;School Uniform;Symbol Shaped Pupils;X-ray','Kanyapyi',4.2),
+(2682,'Ahegao;Anal;Blowjob;Breast Sucking;Bukkake;Chikan;Double Penetration;Exhibitionism;Fingering;Gangbang;Group Sex;Happy Sex;Idol;Inverted Nipples;Large Breasts;Multiple Insertion;Multiple Penises;School Uniform;Squirting','Inue Shinsuke',3.95),
+(2683,'Ahegao;Anal;Bikini;Blowjob;Bukkake;Condom;Deepthroat;Dirty Old Man;Double Penetration;Gangbang;Group Sex;Idol;Impregnation;Inverted Nipples;Large Breasts;Masturbation;Mind Break;Nakadashi;School Uniform;Stockings;Swimsuit','Inue Shinsuke',4.16),
+(2684,'Anal;Big Areola;Bikini;Blowjob;Breast Sucking;Bukkake;Dark Skin;Double Penetration;Group Sex;Idol;Inverted Nipples;Large Breasts;Multiple Insertion;Nakadashi;Swimsuit;Threesome','Inue Shinsuke',3.76),
+(2685,'Amputee;Anal;Breast Expansion;Cow Girl;Defloration;DILF;Double Penetration;Drugs;Group Sex;Large Breasts;Loli;Mind Break;Nakadashi;Oppai Loli;Short Hair','Opanchu',2.16),
+(2686,'Ahegao;Anal;Blowjob;Double Penetration;Drunk;Group Sex;Loli;Nakadashi;Rape;Threesome','Henrybird',3.87),
+(2687,'Bodysuit;Happy Sex;Large Breasts;Nakadashi','Haruhisky',4.6),
+(2688,'Anal;Gender Bender;Large Breasts;Male on Futa;Shemale;Stomach Bulge','Yoshida Gorou',3.92),
+(2689,'Breast Expansion;Collar;Crossdressing;Gender Bender;Lactation;Shemale;Short Hair;Stockings;Straight Shota;Trap','Yoshida Gorou',3.81),
+(2690,'Blowjob;Group Sex;Idol;Nakadashi;Rape;Threesome','Zanzi',3.48),
+(2691,'Anal;Lactation;Rape;Shota;Spats;Tentacles;Yaoi','Nabenco',3.67),
+(2692,'Ahegao;Anal;Double Penetration;Futanari;Futanari on Futanari;Group Sex;Handjob;Huge Penis;Idol;Stockings','Gekka Kaguya',4.49),
+(2693,'Ahegao;Anal;Anilingus;Blackmail;Cheating;French Kissing;Gaping;Hairy;Handjob;Leg Lock;Males only;Masturbation;Nakadashi;Rape;Shota;Stockings;Trap;Voyeurism;Yaoi','Chinzurena',3.5),
+(2694,'Anal;Blowjob;Crossdressing;Gothic;Handjob;Happy Sex;Maid;Males only;Megane;Nakadashi;Prostate Massage;Shota;Stockings;Symbol Shaped Pupils;Trap;Yaoi','Sakura Puchilo | Nanahoshi Suama',4.68),
+(2695,'Anal;Blowjob;Crossdressing;DILF;French Kissing;Frotting;Group Sex;Handjob;Males only;Megane;Nakadashi;Prostate Massage;Prostitution;Shota;Spats;Trap;Yaoi','Sakura Puchilo | Nanahoshi Suama',3.86),
+(2696,'Anal;BBM / Fat Man;Delusion;Males only;Nakadashi;Shota;Teacher;Trap;Yaoi','Tekorun',4.26),
+(2697,'Anal;Anilingus;BBM / Fat Man;Crossdressing;Double Penetration;Group Sex;Humiliation;Males only;Nakadashi;Shota;Spats;Stockings;Trap;Watersports;Yaoi','Atage',4.38),
+(2698,'Ahegao;Anal;BBM / Fat Man;Blowjob;Deepthroat;Group Sex;Loli;Nakadashi','Obyaa',3.96),
+(2699,'Ahegao;Anal;BBM / Fat Man;Blackmail;Condom;Large Breasts;Prostitution','Momofuki Rio',4.16),
+(2700,'CBT;Femdom;Footjob;Group Sex;Humiliation;Large Breasts;Orgasm Denial;Prostitution;School Uniform;Tall Girl;Threesome','Doskoinpo',3.48),
+(2701,'Blowjob;CBT;Femdom;Footjob;Group Sex;Large Breasts;Orgasm Denial;Prostitution;School Uniform;Tall Girl;Threesome','Doskoinpo',3.18),
+(2702,'Ahegao;Anal;Asphyxiation;BDSM;Big Ass;Blowjob;Bondage;Bukkake;Collar;Corruption;Double Penetration;Gokkun;Group Sex;Hairy;Large Breasts;Latex;Mind Break;Nakadashi;Piercings;Prostitution;Rape;School Uniform;Sex Toys;Shibari;Slave;Slut','Shomu',3.7),
+(2703,'Bikini;Idol;Large Breasts;Nakadashi;Swimsuit','Tachiroku',4.76),
+(2704,'Big Ass;Bikini;Blowjob;Bodysuit;Defloration;Fingering;Happy Sex;Large Breasts;Masturbation;MILF;Nakadashi;Paizuri;Selfcest;Swimsuit;Symbol Shaped Pupils;Threesome','Akitsuki Karasu',4.78),
+(2705,'BBW;Blowjob;Condom;Handjob;Happy Sex;Large Breasts;Plump;Straight Shota;Virginity (Male)','Yukiusagi.',4.03),
+(2706,'Ahegao;Anal;Blowjob;Impregnation;Large Breasts;Mind Break;Pet Girl;Stockings;Symbol Shaped Pupils','Anda',4.54),
+(2707,'BBW;Comedy;Elder Sister;Huge Breasts;Hypnosis;Incest;Inverted Nipples;Large Breasts;Mind Control;Nakadashi;Plump;Sleeping;Straight Shota','Kakuzatou',4.61),
+(2708,'Footjob;Loli;Magical Girl;Nakadashi;School Uniform;Sleeping;Stockings','Momio',4.39),
+(2709,'Anal;Big Ass;Blackmail;Blowjob;Double Penetration;Drugs;French Kissing;Group Sex;Large Breasts;Military Uniform;Nakadashi;Pantyhose;Rape;Stockings;Threesome;X-ray','Kizuka Kazuki',3.84),
+(2710,'BBM / Fat Man;Blowjob;Deepthroat;Double Penetration;Gangbang;Group Sex;Loli;Monster Girl;Reverse Harem;Short Hair;Spreading;Vampire;Wings;X-ray','Obyaa',3.73),
+(2711,'Anal;Big Ass;Bikini;Bukkake;Double Penetration;Fingering;Gangbang;Group Sex;Large Breasts;Nakadashi;Paizuri;Swimsuit;Threesome;X-ray','Shinonome Ryu',3.69),
+(2712,'Ahegao;Anal;Blowjob;Double Penetration;Gangbang;Gokkun;Group Sex;Hairy;Large Breasts;Nakadashi;Reverse Harem;Stockings','Akuma',3.0),
+(2713,'Defloration;Exhibitionism;Footjob;Happy Sex;Large Breasts;Licking;Nakadashi;Sweating;Tsundere;Virginity (Male)','Doumou',4.81),
+(2714,'Big Ass;Blowjob;Breast Sucking;Hairy;Kimono / Yukata;Large Breasts;Symbol Shaped Pupils;Tall Girl','Ribyuhki',4.36),
+(2715,'Anal;Blowjob;Body Swap;Fingering;Gender Bender;Large Breasts;Squirting','Hirno',3.92),
+(2716,'Blowjob;Happy Sex;Large Breasts;Megane;Nakadashi;Teacher','Spiritus Tarou',4.79),
+(2717,'Blowjob;Dark Skin;Fingering;French Kissing;Large Breasts;Nakadashi;Paizuri;Sumata;Swimsuit;X-ray','Naha 78',4.64),
+(2718,'Ahegao;BBM / Fat Man;Comedy;Dark Skin;Gyaru;Happy Sex;Huge Penis;Impregnation;Large Breasts;Nakadashi;School Uniform;Sex on the Phone;Stockings;Virginity (Male);X-ray','Nimu',4.59),
+(2719,'BBM / Fat Man;Blowjob;Virginity (Male)','Fukunaga Yukito',3.56),
+(2720,'Ahegao;Anal;Anilingus;Big Ass;Blowjob;Dark Skin;Hairy;Large Breasts;Licking;Nakadashi;Rape;School Uniform;Smell','Kimura Naoki',3.98),
+(2721,'Anal;Cheating;Happy Sex;Large Breasts;Megane;MILF;Nakadashi;Oyakodon;School Uniform;Stockings;Tutor','utu',4.64),
+(2722,'Gender Bender;Gyaru;Impregnation;Lingerie;Nakadashi;School Uniform;Short Hair;Stockings','Haruhisky',4.24),
+(2723,'Animal Girl;Blowjob;Catgirl;Fangs;Group Sex;Handjob;Large Breasts;Masturbation;Nakadashi;Uncensored','Kamiya Zuzu',3.77),
+(2724,'Big Ass;Happy Sex;Large Breasts','sorani',4.63),
+(2725,'Ahegao;Childhood Friend;Cunnilingus;Defloration;Happy Sex;Nakadashi;Pettanko;Stockings;Symbol Shaped Pupils;Twintails;Uncensored;Virginity (Male);X-ray','Taira Issui',4.68),
+(2727,'Big Ass;Bondage;Happy Sex;Large Breasts;Maledom;Nakadashi;Orgasm Denial;Sex Toys;Shimapan;Stockings;Uncensored','fu-ta',4.74),
+(2728,'Blowjob;Defloration;Elder Sister;Hairy;Happy Sex;Incest;Large Breasts;Nakadashi;Rape;Stockings;Tsundere;Twintails;Uncensored','Azuma Tesshin',4.58),
+(2729,'Happy Sex;Large Breasts;Nakadashi;School Uniform;Uncensored;Virginity (Male)','Hazuki Yuuto',4.45),
+(2730,'Dark Skin;Femdom;Group Sex;Gyaru;Harem;Kimono / Yukata;Large Breasts;Nakadashi;Slut;Uncensored','Akagi Asahito',4.34),
+(2731,'Ahegao;Defloration;Hairy;Handjob;Happy Sex;Large Breasts;Nakadashi;Squirting;Uncensored;Virginity (Male);X-ray','212;581;774 / Nanashi;Minami',4.66),
+(2732,'Anal;BDSM;Bondage;Chastity Belt;Femdom;Footjob;Handjob;Happy Sex;Orgasm Denial;Pegging;Sex Toys;Straight Shota;Symbol Shaped Pupils;Tall Girl;Uncensored','Dibi',4.1),
+(2733,'Anal;Assjob;BDSM;Bondage;Crossdressing;Footjob;Josou Seme;Maledom;Males only;Royalty;Shota;Sweating;Trap;Yaoi','Dibi',4.35),
+(2734,'Ahegao;Anal;Elf;Femdom;Impregnation;Megane;Nakadashi;Prostate Massage;Reverse Rape;Straight Shota;Symbol Shaped Pupils','Dibi',4.22),
+(2735,'BDSM;Bondage;Femdom;Fingering;Handjob;Leg Lock;Nakadashi;Pegging;Prostate Massage;Sex Toys;Shota;Spanking;Straight Shota;Tall Girl;Uncensored','Dibi',4.07),
+(2736,'Ahegao;Anal;Big Ass;Bondage;Crossdressing;Exhibitionism;Femdom;Footjob;French Kissing;Handjob;Humiliation;Lingerie;Prostate Massage;Sex Toys;Straight Shota;Uncensored;Urethra Insertion','Dibi',3.943333333333334),
+(2737,'Big Ass;Blowjob;Comedy;Femdom;Group Sex;Large Breasts;Loli;MILF;Monster Girl;Nakadashi;Oyakodon;Short Hair;Symbol Shaped Pupils;Threesome;X-ray','Motsu Aki',4.57),
+(2738,'Ahegao;Anal;Anilingus;Bondage;Catgirl;Chastity Belt;Femdom;Maid;Orgasm Denial;Pegging;Prostate Massage;Straight Shota;Strap-on;Threesome','Dibi',4.59),
+(2742,'Age Regression;Anal;Blowjob;Butler;Defloration;Double Penetration;Hairy;Happy Sex;Impregnation;Large Breasts;Loli;Megane;Mouth Gag;Nakadashi;Rape;School Uniform;Short Hair;Stockings;Straight Shota;Tankoubon;Teacher;Tomboy;Virginity (Male)','Yuuki Homura',4.19),
+(2743,'Ahegao;Anal;BBM / Fat Man;Bisexual;Blindfold;Bloomers;Blowjob;Body Writing;Bodysuit;Bondage;Cunnilingus;Decensored;Defloration;Exhibitionism;French Kissing;Group Sex;Hairy;Hairy Armpits;Harem;Large Breasts;Lingerie;Masturbation;Mind Break;Mind Control;Mouth Gag;Nakadashi;Nun;Pantyhose;Rape;School Uniform;Slave;Stockings;Story Arc;Sweating;Symbol Shaped Pupils;Tankoubon;Threesome;Tomboy;Virginity (Male);X-ray','Nikusoukyuu.',3.97),
+(2744,'Ahegao;Anilingus;BBM / Fat Man;Blowjob;Cheating;Deepthroat;Dirty Old Man;French Kissing;Hairy;Huge Breasts;Large Breasts;Lingerie;Maledom;Nakadashi;Piercings;Prostitution;School Uniform;Slut','Soborogo',3.82),
+(2745,'Anilingus;Blowjob;Crotchless / Breastless;Cunnilingus;Fingering;Group Sex;Handjob;Large Breasts;Lingerie;Megane;Nakadashi;Paizuri;Swinging / Netorase;X-ray','Mahiruno Kagerou',3.98),
+(2746,'Ahegao;Anal;Animal Girl;BBW;Big Ass;Blowjob;Collar;Dog Girl;Fingering;Huge Breasts;Incest;Large Breasts;Leotard;MILF;Mother;Nakadashi;Pet Girl;Rape;Short Hair','Akikusa Peperon',NULL),
+(2747,'Ahegao;Anilingus;Armpit;BBW;Big Areola;Big Ass;Blindfold;Bloomers;Blowjob;Breast Sucking;Bukkake;Chikan;Cosplay;Cunnilingus;Dark Skin;Defloration;Elf;Exhibitionism;Fingering;French Kissing;Group Sex;Hairy;Hairy Armpits;Handjob;Harem;Huge Breasts;Huge Penis;Human Toilet;Impregnation;Inverted Nipples;Large Breasts;Leg Lock;Licking;Lingerie;Maid;Masturbation;Megane;MILF;Nakadashi;Paizuri;Pantyhose;Phimosis;Plump;Ponytail;School Uniform;Smegma;Smell;Sportswear;Squirting;Stockings;Sweating;Symbol Shaped Pupils;Teacher;Threesome;Twintails;Virginity (Male);Voyeurism;X-ray','Mifune Seijirou',NULL),
+(2748,'','',NULL),
+(2749,'Ahegao;Anal;Big Ass;Bondage;Crossdressing;Exhibitionism;Femdom;Footjob;French Kissing;Handjob;Humiliation;Lingerie;Prostate Massage;Sex Toys;Straight Shota;Uncensored;Urethra Insertion','Dibi',3.9580000000000006),
+(2750,'','',NULL),
+(2751,'','',4.55),
+(2752,'','',3.84),
+(2753,'','',4.37),
+(2754,'','',4.2),
+(2755,'','',4.49),
+(2756,'French Kissing;Happy Sex;Large Breasts;School Uniform','Heigani',4.36),
+(2757,'','',4.58),
+(2758,'','',3.5),
+(2759,'','',4.6),
+(2760,'','',4.65),
+(2761,'','',3.61),
+(2762,'','',4.16),
+(2763,'Femdom;Happy Sex;Large Breasts;Mermaid;Monster Girl;Nakadashi;School Swimsuit;Straight Shota;Swimsuit;Transformation','Horitomo',4.56),
+(2764,'Defloration;Hairy;Nakadashi;Rape;Sleeping','Yamayo',1.89),
+(2765,'Ahegao;BBM / Fat Man;Blowjob;Cunnilingus;Double Penetration;Fingering;Footjob;Full Color;Group Sex;Gyaru;Harem;Impregnation;Large Breasts;Megane;Mind Break;Nakadashi;Ponytail;Prostitution;School Uniform;Sex Toys;Sweating;Symbol Shaped Pupils;Threesome;Twintails;Virginity (Male)','Tomose Shunsaku',3.95),
+(2766,'Ahegao;Body Swap;Bondage;Dark Skin;Defloration;Elf;Filming;Futanari;Gender Bender;Large Breasts;Nakadashi','Taniguchi-san',4.16),
+(2767,'Ahegao;Anal;Blowjob;Huge Penis;Incest;Loli;Maledom;Nakadashi;Niece;Slut;Stockings;X-ray','Tanabe Kyou',4.71),
+(2768,'Anal;Crossdressing;Males only;Miko;Shota;Snuff;Trap;Yaoi','Coin RAND',3.31),
+(2769,'Ahegao;Blowjob;Group Sex;Happy Sex;Layer Cake;Megane;Selfcest;Threesome','bariun',4.49),
+(2770,'Anal;Anilingus;Crossdressing;Footjob;Males only;Masturbation;Nakadashi;Shota;Trap;Yaoi','Hanamaki Kaeru',3.96),
+(2771,'Anal;Blowjob;Group Sex;Males only;Muscle;Sex Toys;Symbol Shaped Pupils;Virginity (Male);Yaoi','Kakenari',3.9),
+(2772,'Footjob;Full Color;Large Breasts;Stockings;Textless','Yuuka Kazami',2.5),
+(2773,'DILF;Full Color;Kimono / Yukata;Netorare;X-ray','',2.68),
+(2774,'Anal;Blowjob;Dark Skin;Happy Sex;Males only;Shota;Yaoi','Utako',4.3),
+(2775,'Animal Girl;Femdom;Monster Girl;Reverse Rape;Straight Shota;Virginity (Male)','Tenamaru',4.59),
+(2776,'Dick Growth;Fangs;Futa on Female;Futanari;Happy Sex;Nakadashi;Witch','Yumoteliuce',4.59),
+(2777,'Bathroom Sex;Blowjob;Childhood Friend;Happy Sex;Large Breasts;Maid;Nakadashi;Stockings','Mizuyuki',4.56),
+(2778,'Anal;Full Color;Large Breasts;Nakadashi;Squirting;Textless;Twintails;Uncensored;X-ray','TrickSter',4.09),
+(2779,'Blowjob;Collar;Demon Girl | Succubus;Fangs;Femdom;Inverted Nipples;Large Breasts;Maledom;Nakadashi;Paizuri;Short Hair;Stockings;Straight Shota;Wings','Tomohiro Kai',4.62),
+(2780,'Collar;Maid;Stockings;Yandere','Ikura Nagisa',4.31),
+(2781,'Exhibitionism;Full Color;Imouto;Incest;Nakadashi;Sweating;Twintails;Watersports;X-ray','Yasuyuki',4.66),
+(2783,'Ahegao;Big Areola;French Kissing;Huge Breasts;Impregnation;Large Breasts;Lingerie;Nakadashi;Paizuri;Ponytail','Onomeshin',4.72),
+(2784,'Anal;Blowjob;Bukkake;Double Penetration;Full Color;Group Sex;Handjob;Large Breasts;Lingerie;MILF;Nakadashi;Netorare;Paizuri;Ponytail;Sex Toys;Sixty-Nine;Spitroast;Threesome','Kamitani',2.65),
+(2785,'','',NULL),
+(2786,'Big Areola;Breast Sucking;Collar;Cow Girl;Gyaru;Hotpants;Huge Breasts;Lactation;Large Breasts;Nakadashi;Paizuri;Stockings;Twintails','Kirome',4.21),
+(2787,'Anal;Double Penetration;Leg Lock;Orgasm Denial;Squirting;Symbol Shaped Pupils;Uncensored;Watersports;X-ray','Nunnu',3.84),
+(2788,'Age Progression;Ahegao;Anal;BBM / Fat Man;BDSM;Bisexual;Blindfold;Blowjob;Body Swap;Bondage;Bukkake;Catgirl;Crotchless / Breastless;Dark Skin;Deepthroat;Defloration;Dick Growth;Double Penetration;Egg Laying;Exhibitionism;Femdom;Fingering;Futanari;Futanari on Futanari;Gangbang;Gender Bender;Group Sex;Gyaru;Hairy;Handjob;Huge Penis;Impregnation;Large Breasts;Leg Lock;Lingerie;Maid;Masturbation;Mind Break;Mind Control;Monster;Monster Girl;Nakadashi;Pettanko;Phimosis;Piercings;Pregnant;Rape;Reverse Rape;School Uniform;Short Hair;Slut;Small Penis;Snuff;Spitroast;Squirting;Stockings;Stomach Bulge;Straight Shota;Strap-on;Swimsuit;Symbol Shaped Pupils;Tankoubon;Tattoo;Tentacles;Threesome;Vomit;X-ray;Yuri','Ikeshita Maue',4.02),
+(2789,'Blowjob;Cunnilingus;Fingering;Happy Sex;Nakadashi;Ponytail;Uncensored;Watersports;X-ray','Kyockcho',4.7),
+(2790,'Cosplay;Gangbang;Large Breasts;Nakadashi;Stockings','Ijima Yuu',3.05),
+(2791,'Ahegao;Anal;Animal Girl;Armpit;Big Areola;Blowjob;Bunnygirl;Catgirl;Cosplay;Dog Girl;French Kissing;Happy Sex;Huge Penis;Large Breasts;Nakadashi;Sex Toys','Kaenuco',4.68),
+(2792,'Anilingus;Blowjob;Cunnilingus;Demon | Incubus;French Kissing;Full Color;Group Sex;Hairy;Large Breasts;Mind Control;Muscle;Nakadashi;Rape;Short Hair;Tentacles','Homare',4.11),
+(2793,'Big Ass;Cosplay;Cunnilingus;Exhibitionism;Happy Sex;Hat;Large Breasts;Nakadashi;Stockings;Witch','Herio',4.69),
+(2794,'','',NULL),
+(2795,'','Chinbotsu;Rebis',NULL),
+(2796,'Ahegao;Big Breasts;Collar;Crown;Femdom;Futanari;Gender Bender;Horns;Impregnation;Leotard;Monster Girl;Sole Dickgirl;Sole Female;Sole Male;Unusual Teeth','Kirisaki Byakko',NULL),
+(2797,'Big Breasts;Bondage;Femdom;Full Color;Kissing;Leotard;Metal Armor;Nakadashi;Paizuri;Sole Male;Thigh High Boots;X-ray','YD',NULL),
+(2798,'Ahegao;Big Breasts;Big Penis;Blowjob;Femdom;Glasses;Gyaru;Mind Break;Mosaic Censorship;Nakadashi;Rape;Schoolboy Uniform;Schoolgirl Uniform;Sole Female;Sole Male;Unusual Pupils;Virginity;X-ray','Haguruma',NULL),
+(2799,'Big Breasts;Collar;Dark Skin;Elf;Femdom;Ffm Threesome;Group;Inverted Nipples;Lactation;Multi-Work Series;Multiple Paizuri;Nakadashi;Shotacon;Sole Male;Sweating;Vampire','Bizen Dorobune',NULL),
+(2800,'Big Breasts;Collar;Dark Skin;Elf;Inverted Nipples;Multi-Work Series;Nakadashi;Orgasm Denial;Paizuri;Shotacon;Sole Female;Sole Male;Stockings;Vampire;X-ray','Bizen Dorobune',NULL),
+(2801,'Big Breasts;Femdom;Glasses;Piss Drinking;Prostate Massage;Uncensored;Urination;X-ray','Tokimachi Eisei',NULL),
+(2802,'Bestiality;Big Ass;Big Breasts;Big Penis;Full Color;Horse;Smegma;Stomach Deformation;Uncensored','Metal Owl',NULL);
 INSERT INTO "BookTag" VALUES
 (1,1),
 (1,2),
@@ -56232,1195 +59034,1195 @@ INSERT INTO "Books" VALUES
 (2801,'2D Never Betrays You',NULL,2,24,1,NULL,NULL,'Full titles on nhentai.net: English ''[Tokimachi Eisei] 2D Never Betrays You [English][Decensored]'' Foreign ''''','2021-02-03',0,0.0,NULL,0),
 (2802,'Sunny-Sue-Ellen',NULL,2,9,1,NULL,NULL,'Full titles on nhentai.net: English ''[Metal Owl] Sunny-Sue-Ellen (Legend of Queen Opala)'' Foreign ''''','2021-02-03',0,0.0,NULL,0);
 INSERT INTO "Category" VALUES
-(1,'Doujinshi'),
-(2,'Manga'),
-(3,'Artist CG'),
-(4,'Game CG');
+(1,'Doujinshi',1469),
+(2,'Manga',1232),
+(3,'Artist CG',77),
+(4,'Game CG',1);
 INSERT INTO "Censorship" VALUES
 (1,'Unknown'),
 (2,'Censored'),
 (3,'Decensored'),
 (4,'Uncensored');
 INSERT INTO "Character" VALUES
-(1,'Minako Aino / Sailor Venus'),
-(2,'Usagi Tsukino / Sailor Moon'),
-(3,'Makoto Kino / Sailor Jupiter'),
-(4,'Pepperoni'),
-(5,'Centorea Shianus'),
-(6,'Kimihito Kurusu'),
-(7,'Himekaidou Hatate'),
-(8,'Boa Hancock'),
-(9,'Mahiru Koizumi'),
-(10,'Hiyoko Saionji'),
-(11,'Link'),
-(12,'Princess Zelda'),
-(13,'Yukari Kotozume / Cure Chocolat'),
-(14,'Gudao'),
-(15,'BB'),
-(16,'Passionlip'),
-(17,'Martina'),
-(18,'Senya'),
-(19,'Paya'),
-(20,'Takane Shijou'),
-(21,'Producer'),
-(22,'Yugi Mutou'),
-(23,'Yami Yugi'),
-(24,'Satori Komeiji'),
-(25,'Sanae Kochiya'),
-(26,'Kaenbyou Rin'),
-(27,'Akitsu Maru'),
-(28,'Nagato'),
-(29,'Ushio'),
-(30,'Shou Toramaru'),
-(31,'Nazrin'),
-(32,'Ajax'),
-(33,'Sarada Uchiha'),
-(34,'Naruto Uzumaki'),
-(35,'Sakura Haruno'),
-(36,'Ino Yamanaka'),
-(37,'Shizune'),
-(38,'Tenten'),
-(39,'Hinata Hyuga'),
-(40,'Mary Read'),
-(41,'Anne Bonny'),
-(42,'Rika Jougasaki'),
-(43,'Scheherazade'),
-(44,'Astolfo'),
-(45,'Jeanne d''Arc'),
-(46,'Victor Nikiforov'),
-(47,'Yuuri Katsuki'),
-(48,'Nitocris'),
-(49,'Ingrid'),
-(50,'Igawa Sakura'),
-(51,'Senkan Seiki'),
-(52,'Seaport Hime'),
-(53,'Nightingale'),
-(54,'Sturm'),
-(55,'Drang'),
-(56,'Sorceress'),
-(57,'Kazuichi Arai'),
-(58,'Admiral'),
-(59,'Kashima'),
-(60,'Shuten Douji'),
-(61,'Cagliostro'),
-(62,'Clarisse'),
-(63,'Aliza'),
-(64,'Mika'),
-(65,'Kay'),
-(66,'Erika Itsumi'),
-(67,'Arisu Shimada'),
-(68,'Maho Nishizumi'),
-(69,'Darjeeling'),
-(70,'Nonna'),
-(71,'Fina'),
-(72,'Yohko Asagiri'),
-(73,'Mari Illustrious Makinami'),
-(74,'Mii Konori'),
-(75,'Hacka Doll No. 3'),
-(76,'Nozomu Ezomori'),
-(77,'Chizuru Minamoto'),
-(78,'Assam'),
-(79,'Orange Pekoe'),
-(80,'Airi Totoki'),
-(81,'Kiawe'),
-(82,'Lana'),
-(83,'Kizuna Ai'),
-(84,'Shalltear Bloodfallen'),
-(85,'Albedo'),
-(86,'Momo Yaoyorozu'),
-(87,'Murakumo'),
-(88,'Gran'),
-(89,'Beatrix'),
-(90,'Tamamo-no-Mae'),
-(91,'Fumitan Admoss'),
-(92,'Kudelia Aina Bernstein'),
-(93,'Rider'),
-(94,'Shirou Emiya'),
-(95,'Takao'),
-(96,'Anne Takamaki'),
-(97,'Oboro'),
-(98,'Murasaki'),
-(99,'Asagi Igawa'),
-(100,'Annelotte Kreuz'),
-(101,'Farrah'),
-(102,'Hagakure Shidou'),
-(103,'Kirara Amanogawa / Cure Twinkle'),
-(104,'Lyria'),
-(105,'Minami Nitta'),
-(106,'Shiki Ichinose'),
-(107,'Chihiro Senkawa'),
-(108,'Mayu Sakuma'),
-(109,'Patchouli Knowledge'),
-(110,'Koakuma'),
-(111,'Eirin Yagokoro'),
-(112,'Reisen Udongein Inaba'),
-(113,'Hina Kagiyama'),
-(114,'Minoriko Aki'),
-(115,'Shizuka Aki'),
-(116,'Yasaka Kanako'),
-(117,'Suwako Moriya'),
-(118,'Nitori Kawashiro'),
-(119,'Cirno'),
-(120,'Aya Shameimaru'),
-(121,'Suzuya'),
-(122,'Phoebe'),
-(123,'Narumeia | Narmaya'),
-(124,'Jessica'),
-(125,'Lily'),
-(126,'Artoria Pendragon'),
-(127,'Samus Aran'),
-(128,'Nami'),
-(129,'Chi-Chi'),
-(130,'Koishi Komeiji'),
-(131,'Suguru Kamoshida'),
-(132,'Remilia Scarlet'),
-(133,'Iskandar / Alexander the Great'),
-(134,'Mai Shiranui'),
-(135,'Morrigan Aensland'),
-(136,'Iroha'),
-(137,'Rimururu'),
-(138,'Felicia'),
-(139,'Honey'),
-(140,'I-no'),
-(141,'Sheryl Nome'),
-(142,'Lilith Aensland'),
-(143,'Ranka Lee'),
-(144,'Ryuuko Matoi'),
-(145,'Saber'),
-(146,'Super Sonico'),
-(147,'Yoko Littner'),
-(148,'Mirai'),
-(149,'Vice'),
-(150,'Chun-Li'),
-(151,'Mature'),
-(152,'Iori Yagami'),
-(153,'Cammy White'),
-(154,'Kyouko Sakura'),
-(155,'Mami Tomoe'),
-(156,'Madoka Kaname'),
-(157,'Sayaka Miki'),
-(158,'Homura Akemi'),
-(159,'Elucia de Lute Lima'),
-(160,'Keima Katsuragi'),
-(161,'Haqua du Lot Herminium'),
-(162,'Souji Okita'),
-(163,'Yuuichi Aizawa'),
-(164,'Akiko Minase'),
-(165,'Kaede Akamatsu'),
-(166,'Illyasviel von Einzbern'),
-(167,'Hayashimo'),
-(168,'The Order Grande | Zooey'),
-(169,'Karluk Ayhan'),
-(170,'Amira Hergal'),
-(171,'Musashi'),
-(172,'Razia'),
-(173,'Shinji Ikari'),
-(174,'Rei Ayanami'),
-(175,'Asuka Langley Soryu'),
-(176,'Ayane'),
-(177,'Kanu Unchou'),
-(178,'Nera Briscoletti'),
-(179,'Bianca Whitaker'),
-(180,'Jessica Albert'),
-(181,'Elizabeth Joestar'),
-(182,'Hibiki Ganaha'),
-(183,'Chihaya Kisaragi'),
-(184,'Makoto Kikuchi'),
-(185,'Sage'),
-(186,'Warrior'),
-(187,'Eri Mizutani'),
-(188,'Miki Hoshii'),
-(189,'Hero'),
-(190,'Ender'),
-(191,'Agrias Oaks'),
-(192,'Pyramid Head'),
-(193,'Mariya Shidou'),
-(194,'Shizu Shidou'),
-(195,'Princess Devilotte De Deathsatan IX'),
-(196,'Crimson Viper'),
-(197,'Yukikaze Mizuki'),
-(198,'Shiranui Mizuki'),
-(199,'Elf'),
-(200,'Amazon'),
-(201,'Master Roshi'),
-(202,'Android 18'),
-(203,'Shimakaze'),
-(204,'Izuna'),
-(205,'Saki Mizushima'),
-(206,'Makio Uzuki'),
-(207,'Nyotengu'),
-(208,'Shut'),
-(209,'Shimei Ryomou'),
-(210,'Housen Ryofu'),
-(211,'Seija Kijin'),
-(212,'Youmu Konpaku'),
-(213,'Yuugi Hoshiguma'),
-(214,'Chouun Shiryuu'),
-(215,'Wriggle Nightbug'),
-(216,'Eijun Sawamura'),
-(217,'Haruichi Kominato'),
-(218,'Rei Hasekura'),
-(219,'Yoshino Shimazu'),
-(220,'Yumi Fukuzawa'),
-(221,'Sachiko Ogasawara'),
-(222,'Maya'),
-(223,'Cleric'),
-(224,'Hotaru Shidare'),
-(225,'Char Aznable'),
-(226,'Astraia Toa Deikun'),
-(227,'Galko-nee'),
-(228,'Galko'),
-(229,'Magisa'),
-(230,'Satsuki Kiryuuin'),
-(231,'Meena'),
-(232,'Iori Minase'),
-(233,'Mami Futami'),
-(234,'Ami Futami'),
-(235,'Poison'),
-(236,'Roxy'),
-(237,'Mayuri Shiina'),
-(238,'Rintarou Okabe'),
-(239,'Rumiho Akiha / Faris Nyannyan'),
-(240,'Kurisu Makise'),
-(241,'Suzuha Amane'),
-(242,'Kokonotsu Shikada'),
-(243,'Saika Totsuka'),
-(244,'Hachiman Hikigaya'),
-(245,'Morgiana'),
-(246,'Kirigaya Suguha'),
-(247,'Emi Yusa'),
-(248,'Sadao Maou'),
-(249,'Chiho Sasaki'),
-(250,'Rei Kagura'),
-(251,'Pierre'),
-(252,'Lili Rochefort'),
-(253,'Asuka Kazama'),
-(254,'Cindy Aurum'),
-(255,'Anna Nishikinomiya'),
-(256,'Sophia Nishikinomiya'),
-(257,'Motoko Kusanagi'),
-(258,'Naomi'),
-(259,'Kei'),
-(260,'Arisa'),
-(261,'Ami Mizuno / Sailor Mercury'),
-(262,'Rei Hino / Sailor Mars'),
-(263,'Himiko Toga'),
-(264,'Izuku Midoriya'),
-(265,'Melda Deitz'),
-(266,'Tenshi Hinanawi'),
-(267,'Yukari Yakumo'),
-(268,'Anchira | Andira'),
-(269,'Sen'),
-(270,'Yuel'),
-(271,'Forte'),
-(272,'Riko Izayoi / Cure Magical'),
-(273,'Love Momozono / Cure Peach'),
-(274,'Tenryuu'),
-(275,'Black Knight | Apollonia'),
-(276,'Heles'),
-(277,'Selvaria Bles'),
-(278,'Alicia Melchiott'),
-(279,'Maria Momoe'),
-(280,'Azusa Hanai'),
-(281,'Kazuki Nishina'),
-(282,'Nazuna Nito'),
-(283,'Vampy'),
-(284,'Veight'),
-(285,'Oda Nobunaga'),
-(286,'Riju'),
-(287,'Arslan'),
-(288,'Kobayashi'),
-(289,'Z1'),
-(290,'Z3'),
-(291,'Killua Zoldyck'),
-(292,'Hisoka'),
-(293,'Yumeko Sakurai'),
-(294,'Azusa Miura'),
-(295,'Haruka Amami'),
-(296,'Ryo Akizuki'),
-(297,'Yoichi Nasu no Suketaka'),
-(298,'Kinoshita Hideyoshi'),
-(299,'Mariandale'),
-(300,'Bayonetta'),
-(301,'Junko Enoshima'),
-(302,'Kyouko Kirigiri'),
-(303,'Yuyuko Saigyouji'),
-(304,'Katori'),
-(305,'Rangiku Matsumoto'),
-(306,'Meiko Shiraki'),
-(307,'Kaoruko Sakazaki'),
-(308,'Kaede Takagaki'),
-(309,'Kirishima'),
-(310,'Yuuya Sakaki'),
-(311,'Tatsuta'),
-(312,'Gudako'),
-(313,'Ladybug'),
-(314,'Cat Noir'),
-(315,'Mamori Tokonome'),
-(316,'Mirei Shikishima'),
-(317,'Valkyrie'),
-(318,'Lulu'),
-(319,'Poppy'),
-(320,'Nasus'),
-(321,'Tristana'),
-(322,'Varus'),
-(323,'Malzahar'),
-(324,'Jeanne d''Arc (Ruler)'),
-(325,'Haguro'),
-(326,'Feena'),
-(327,'Djeeta'),
-(328,'Rosetta'),
-(329,'Hisho'),
-(330,'Midori'),
-(331,'Shoukaku'),
-(332,'Lancelot'),
-(333,'Feower'),
-(334,'Nayuki Minase'),
-(335,'Kon the Knight'),
-(336,'Rita'),
-(337,'Rin Kaga'),
-(338,'Mei Hatsume'),
-(339,'Yuuka Izumi'),
-(340,'Sakuya Izayoi'),
-(341,'Camilla'),
-(342,'Sakura'),
-(343,'Kagero'),
-(344,'Hinoka'),
-(345,'Elise'),
-(346,'Sophitia Alexandra'),
-(347,'Cassandra Alexandra'),
-(348,'Tamaki Kousaka'),
-(349,'Tearju Lunatique'),
-(350,'Sephie Michaela Deviluke'),
-(351,'Mikado Ryouko'),
-(352,'Rana'),
-(353,'Cattleya'),
-(354,'Shirahoshi'),
-(355,'Nico Robin'),
-(356,'Tadashi Hamada'),
-(357,'Hiro Hamada'),
-(358,'Matthew Kyrielite (Mashu / Shielder)'),
-(359,'Ushiwakamaru'),
-(360,'Kiyohime'),
-(361,'Vivi'),
-(362,'Tsukasa Suou'),
-(363,'Kamishirasawa Keine'),
-(364,'Kaga'),
-(365,'YoRHa 9S'),
-(366,'YoRHa 2B'),
-(367,'Momiji Inubashiri'),
-(368,'Ran Yakumo'),
-(369,'Alice Margatroid'),
-(370,'Rosa'),
-(371,'Reimu Hakurei'),
-(372,'Sakie Satou'),
-(373,'Tetsuo Takahashi'),
-(374,'Yunyun'),
-(375,'Megumin'),
-(376,'Wiz'),
-(377,'Aqua'),
-(378,'Kazuma Satou'),
-(379,'Darkness | Lalatina Dustiness Ford'),
-(380,'Prinz Eugen'),
-(381,'Tanpopo Kuraishi'),
-(382,'Ishtar'),
-(383,'Ereshkigal'),
-(384,'Mahiro Yasaka'),
-(385,'Nyaruko'),
-(386,'Atago'),
-(387,'Hana Midorikawa'),
-(388,'Kiyoshi Fujino'),
-(389,'Mythra'),
-(390,'Pyra'),
-(391,'Hanekawa Tsubasa'),
-(392,'Cynthia'),
-(393,'Mio Honda'),
-(394,'Mika Jougasaki'),
-(395,'Little Red Riding Hood'),
-(396,'Boa Marigold'),
-(397,'Hayate Yagami'),
-(398,'Nanoha Takamachi'),
-(399,'Fate Testarossa'),
-(400,'Vivio Takamachi'),
-(401,'Hina'),
-(402,'Sadi'),
-(403,'Domino'),
-(404,'Furutaka'),
-(405,'Kirari Moroboshi'),
-(406,'Miku Maekawa'),
-(407,'Mina'),
-(408,'Sorn | Song | Tweyen'),
-(409,'Korwa'),
-(410,'Sayla Mass'),
-(411,'Mirai Yashima'),
-(412,'Fraw Bow'),
-(413,'Yui Ootsuki'),
-(414,'Milla Maxwell'),
-(415,'Muzet'),
-(416,'Ludger Will Kresnik'),
-(417,'Elise Lutus'),
-(418,'Leia Rolando'),
-(419,'Elle Mel Marta'),
-(420,'Victor'),
-(421,'Rin Tohsaka'),
-(422,'Rin Tosaka'),
-(423,'Yuuka Kazami'),
-(424,'Hanayo Koizumi'),
-(425,'Nico Yazawa'),
-(426,'Shun Kurosaki'),
-(427,'Yuuto'),
-(428,'Athena Asamiya'),
-(429,'Serval'),
-(430,'Mirai Asahina / Cure Miracle'),
-(431,'Kotonoha Akane'),
-(432,'Clownpiece'),
-(433,'Gaius'),
-(434,'Tharja'),
-(435,'Chloe "Kuro" von Einzbern'),
-(436,'Lucina'),
-(437,'Mallow'),
-(438,'Sun'),
-(439,'Misaka Mikoto'),
-(440,'Pantheon'),
-(441,'Leona'),
-(442,'Lucario'),
-(443,'Delphox'),
-(444,'Greninja'),
-(445,'Zoroark'),
-(446,'Lopunny'),
-(447,'Buizel'),
-(448,'Nidoqueen'),
-(449,'Ferry'),
-(450,'Metera'),
-(451,'Anabel'),
-(452,'Tatsuya Shiba'),
-(453,'Mayumi Saegusa'),
-(454,'Mari Watanabe'),
-(455,'Miyuki Shiba'),
-(456,'Bismarck'),
-(457,'Mio Akiyama'),
-(458,'Fumika Sagisawa'),
-(459,'Umi Sonoda'),
-(460,'Kotori Minami'),
-(461,'Honoka Kousaka'),
-(462,'Maki Nishikino'),
-(463,'Eri Ayase'),
-(464,'Kyouko Toshinou'),
-(465,'Saber Alter'),
-(466,'Zeta'),
-(467,'Wu Zetian'),
-(468,'Yuzuki Seo'),
-(469,'Hirotaka Wakamatsu'),
-(470,'Gaku Yashiro'),
-(471,'Satoru Fujinuma'),
-(472,'Chuck Norris'),
-(473,'Joel'),
-(474,'Ellie'),
-(475,'Hex Maniac'),
-(476,'Akizuki'),
-(477,'Teruzuki'),
-(478,'Hatsuzuki'),
-(479,'Amatsukaze'),
-(480,'Merry'),
-(481,'Yume'),
-(482,'Shihoru'),
-(483,'Haruhiro'),
-(484,'Hinata Kawamoto'),
-(485,'Kyouko Houda'),
-(486,'Rei Kiriyama'),
-(487,'Akari Kawamoto'),
-(488,'Hiro'),
-(489,'Zero Two'),
-(490,'Kasumi'),
-(491,'Isadora Finndottir'),
-(492,'Ichigo / 015'),
-(493,'Kaho Hinata'),
-(494,'Yuri Plisetsky'),
-(495,'Helena Blavatsky'),
-(496,'Jack the Ripper'),
-(497,'Laura Bodewig'),
-(498,'Ichika Orimura'),
-(499,'Ling Yin Huang'),
-(500,'Maya Yamada'),
-(501,'Houki Shinonono'),
-(502,'Charlotte Dunois'),
-(503,'Chifuyu Orimura'),
-(504,'Cecilia Alcott'),
-(505,'Lusamine'),
-(506,'Lillie'),
-(507,'Guzma'),
-(508,'D.va'),
-(509,'Minamoto no Raikou / Minamoto no Yorimitsu'),
-(510,'Anila | Anira'),
-(511,'Sengoku Nadeko'),
-(512,'Namazuo Toushirou'),
-(513,'Honebami Toushirou'),
-(514,'Neptune / Purple Heart'),
-(515,'Mamika Kirameki'),
-(516,'Shizuka Mogami'),
-(517,'Jabami Yumeko'),
-(518,'Sessyoin Kiara'),
-(519,'Lamretta'),
-(520,'Sarya'),
-(521,'Danua'),
-(522,'Usagi Saionji'),
-(523,'Mina Ashido'),
-(524,'Kagefusa Manyuu'),
-(525,'Chifusa Manyuu'),
-(526,'Kaede'),
-(527,'Sakura Matou'),
-(528,'Tsubaki Yayoi'),
-(529,'Charlotta'),
-(530,'Flandre Scarlet'),
-(531,'Len Kagamine'),
-(532,'Shikieiki Yamaxanadu'),
-(533,'Musashi Miyamoto'),
-(534,'Luigi Torelli'),
-(535,'Minamo Aoi'),
-(536,'Rin Shibuya'),
-(537,'Mika Ogino'),
-(538,'Yukina Shirahane'),
-(539,'Sophie Noel'),
-(540,'Megumi Kato'),
-(541,'Eas / Setsuna Higashi / Cure Passion'),
-(542,'Haruka Haruno / Cure Flora'),
-(543,'Minami Kaidou / Cure Mermaid'),
-(544,'Tokiko Zaizen'),
-(545,'Himari Arisugawa'),
-(546,'Ritsuko Akagi'),
-(547,'Maya Ibuki'),
-(548,'Elphelt Valentine'),
-(549,'Francis Drake'),
-(550,'Urakaze'),
-(551,'Isokaze'),
-(552,'Hamakaze'),
-(553,'Haruka'),
-(554,'Hibari'),
-(555,'Makoto Naegi'),
-(556,'Aoi Asahina'),
-(557,'Mirajane Strauss'),
-(558,'Anthuria'),
-(559,'Shino Sousaki'),
-(560,'Chihiro Komiya'),
-(561,'Toriel'),
-(562,'Frisk'),
-(563,'Mitsuki Bakugou'),
-(564,'Ririka Kato'),
-(565,'Mizuki Suzushiro'),
-(566,'Xuanzang'),
-(567,'Quetzalcoatl'),
-(568,'Artoria Alter'),
-(569,'Hans Christian Andersen'),
-(570,'Shiori Shinomiya'),
-(571,'Yoshino Koharu'),
-(572,'Elliot'),
-(573,'Riesz'),
-(574,'Ryuujou'),
-(575,'Mumei'),
-(576,'Tsuyu Asui'),
-(577,'Tone'),
-(578,'Anzu Kadotani'),
-(579,'Yuzu Koyama'),
-(580,'Momo Kawashima'),
-(581,'Rokuro Okajima'),
-(582,'Revy'),
-(583,'Nekone'),
-(584,'Haku'),
-(585,'Shizuka Hiratsuka'),
-(586,'Inko Midoriya'),
-(587,'Ochako Uraraka'),
-(588,'Taokaka'),
-(589,'Hajime Shino'),
-(590,'Camieux'),
-(591,'Cuilan'),
-(592,'Robin'),
-(593,'Joker'),
-(594,'Batman'),
-(595,'Ainz Ooal Gown'),
-(596,'Aladdin'),
-(597,'Genie'),
-(598,'Archangel'),
-(599,'Heavenly Herald'),
-(600,'Sanctuary Guardian'),
-(601,'Grape Dragon'),
-(602,'Akagi'),
-(603,'Ikazuchi'),
-(604,'Akashi'),
-(605,'Haruna'),
-(606,'Strength'),
-(607,'Chariot'),
-(608,'Societte'),
-(609,'Veronica'),
-(610,'Armin Arlert'),
-(611,'Laius'),
-(612,'Marcille'),
-(613,'Carmilla'),
-(614,'Yukari Yuzuki'),
-(615,'Mordred Pendragon'),
-(616,'YoRHa A2'),
-(617,'Hotaru Tomoe / Sailor Saturn'),
-(618,'Chibiusa / Sailor Chibi Moon'),
-(619,'Osakabehime'),
-(620,'Juri Han'),
-(621,'Danzou Katou'),
-(622,'Loran Cehack'),
-(623,'Jamil'),
-(624,'Tanya von Degurechaff'),
-(625,'Sae Kobayakawa'),
-(626,'Yukari Mizumoto'),
-(627,'Nozomi Toujou'),
-(628,'Tsubasa Kira'),
-(629,'Momoka Sakurai'),
-(630,'Kaoru Ryuzaki'),
-(631,'Nina Ichihara'),
-(632,'Yukimi Sajo'),
-(633,'Mai Fukuyama'),
-(634,'Miria Akagi'),
-(635,'Kanna Kamui'),
-(636,'Kamoi'),
-(637,'Hayasui'),
-(638,'Fujiwara no Mokou'),
-(639,'Haruka Tenoh / Sailor Uranus'),
-(640,'Bulma'),
-(641,'Chichi'),
-(642,'I-19'),
-(643,'Golden Darkness / Konjiki no Yami'),
-(644,'Kotonoha Aoi'),
-(645,'Haru Okumura'),
-(646,'Sadayo Kawakami'),
-(647,'Makoto Niijima'),
-(648,'Yukari Akiyama'),
-(649,'Gold Ship'),
-(650,'Marth'),
-(651,'Hata No Kokoro'),
-(652,'Shigure'),
-(653,'Rainbow Mika'),
-(654,'Byakuren Hijiri'),
-(655,'Kasen Ibaraki'),
-(656,'Joey Jones'),
-(657,'Kazuma Ikezawa'),
-(658,'Kouta Oyamada'),
-(659,'Cima Garahau'),
-(660,'Kycilia Zabi'),
-(661,'Kamatari Honjou'),
-(662,'Ai Asato'),
-(663,'Zangief'),
-(664,'Misaki Shokuhou'),
-(665,'Touma Kamijou'),
-(666,'Ro-500'),
-(667,'I-168'),
-(668,'Gareki'),
-(669,'Celes Chere'),
-(670,'Rikku'),
-(671,'Yuffie Kisaragi'),
-(672,'Tidus'),
-(673,'Cloud Strife'),
-(674,'Rosa Farrell'),
-(675,'Cecil'),
-(676,'Zidane Tribal'),
-(677,'Rydia'),
-(678,'Freya Crescent'),
-(679,'Locke Cole'),
-(680,'Kaori Sakuramori'),
-(681,'Seiga Kaku'),
-(682,'Riko Sakurauchi'),
-(683,'Rizu Ogata'),
-(684,'Nariyuki Yuiga'),
-(685,'Mafuyu Kirisu'),
-(686,'Fumino Furuhashi'),
-(687,'Kaito Shion'),
-(688,'Belfast'),
-(689,'Illustrious'),
-(690,'Matsurika Shinouji'),
-(691,'Kanako Miyamae'),
-(692,'Isuzu Sento'),
-(693,'Latifa Fleuranza'),
-(694,'Miyako Shiina'),
-(695,'Yamato Naoe'),
-(696,'Misato Katsuragi'),
-(697,'Yoshiko Tsushima'),
-(698,'Yae Sakura'),
-(699,'Honoka Mitsui'),
-(700,'Sae Niijima'),
-(701,'Takeru Amato'),
-(702,'Inu-tan'),
-(703,'Kii-tan'),
-(704,'Aki Nijou'),
-(705,'Fubuki'),
-(706,'Elizabeth Bathory'),
-(707,'Scathach'),
-(708,'Medb'),
-(709,'Reina Prowler'),
-(710,'Mikumo Guynemer'),
-(711,'Makina Nakajima'),
-(712,'Freyja Wion'),
-(713,'Kaname Buccaneer'),
-(714,'Kirigaya Kazuto "Kirito"'),
-(715,'Vira'),
-(716,'Bill Cipher'),
-(717,'Dipper Pines'),
-(718,'Kaguya Houraisan'),
-(719,'Lyfa'),
-(720,'Ikki Kurogane'),
-(721,'Stella Vermillion'),
-(722,'Iowa'),
-(723,'Stan'),
-(724,'Alicia'),
-(725,'Izmir'),
-(726,'Takumi Mukai'),
-(727,'Blue Mary'),
-(728,'Kaoru Watabe'),
-(729,'Chris'),
-(730,'Rock Howard'),
-(731,'Kensou Sie'),
-(732,'Rex'),
-(733,'Clementine'),
-(734,'Jeanne d''Arc (Alternate)'),
-(735,'Astraea'),
-(736,'Black / Hilbert'),
-(737,'Skyla'),
-(738,'Hibiki Tachibana'),
-(739,'Gaul Galette dos Rois'),
-(740,'Tomoya Aki'),
-(741,'Eriri Spencer Sawamura'),
-(742,'Yuudachi'),
-(743,'Gardenia'),
-(744,'Dark Precure'),
-(745,'Rinne Inaba'),
-(746,'Nao Kamiya'),
-(747,'Koume Shirasaka'),
-(748,'Nana Abe'),
-(749,'Marulk'),
-(750,'Ozen'),
-(751,'Rikuo Nura'),
-(752,'Tsurara Oikawa'),
-(753,'Miu Takanashi'),
-(754,'Sora Takanashi'),
-(755,'Jigoku no Fubuki'),
-(756,'Marisa Kirisame'),
-(757,'Lenna Charlotte Tycoon'),
-(758,'Penelo'),
-(759,'Aerith Gainsborough'),
-(760,'Bartz Klauser'),
-(761,'Vaan'),
-(762,'Tifa Lockhart'),
-(763,'Faris Scherwiz'),
-(764,'Krile Mayer Baldesion'),
-(765,'Bonnie'),
-(766,'Clement'),
-(767,'Ash Ketchum'),
-(768,'Misty'),
-(769,'Dawn'),
-(770,'May'),
-(771,'Serena'),
-(772,'Shoubou'),
-(773,'Kent'),
-(774,'Boudica'),
-(775,'Suiko Tatsunagi'),
-(776,'Aichi Sendou'),
-(777,'Katsuki Bakugou'),
-(778,'Atsuko Kagari'),
-(779,'Sucy Manbavaran'),
-(780,'Regu'),
-(781,'Yae'),
-(782,'Fuyuki Hinata'),
-(783,'Natsumi Hinata'),
-(784,'Aki Hinata'),
-(785,'Red Saber (Nero)'),
-(786,'Saint Martha'),
-(787,'Homura'),
-(788,'Hong Meiling'),
-(789,'Tenko Chabashira'),
-(790,'Shuuichi Saihara'),
-(791,'FAL'),
-(792,'Ouroboros'),
-(793,'Five-seveN'),
-(794,'Futaba Sakura'),
-(795,'Karen Kohiruimaki "Llenn"'),
-(796,'Nurse Joy'),
-(797,'Officer Jenny'),
-(798,'Iris'),
-(799,'Savanah'),
-(800,'Caroline'),
-(801,'Professor Oak'),
-(802,'Delia Ketchum'),
-(803,'Brock'),
-(804,'Max'),
-(805,'Chitose Serikawa'),
-(806,'Haruma Kawagoe'),
-(807,'Sekai Kamiki'),
-(808,'Fumina Hoshino'),
-(809,'Megumi Aino / Cure Lovely'),
-(810,'Yuki Omori / Cure Honey'),
-(811,'Zoey'),
-(812,'Todd Snap'),
-(813,'Kenny'),
-(814,'Professor Ivy'),
-(815,'Shauna'),
-(816,'Trevor'),
-(817,'Sophie'),
-(818,'Tierno'),
-(819,'Professor Sycamore'),
-(820,'Carla'),
-(821,'Virgo'),
-(822,'Wendy Marvell'),
-(823,'Happy'),
-(824,'Lucy Heartfilia'),
-(825,'Erza Scarlet'),
-(826,'Natsu Dragneel'),
-(827,'Thief'),
-(828,'Aoi Tategami / Cure Gelato'),
-(829,'Yaia'),
-(830,'Siro'),
-(831,'Kaguya Luna'),
-(832,'Mirai Akari'),
-(833,'Nekomiya Hinata'),
-(834,'Lecia'),
-(835,'Monika'),
-(836,'Yamato'),
-(837,'Sybilla'),
-(838,'Kotoha Hanami'),
-(839,'Akira Kurusu'),
-(840,'Kagerou Imaizumi'),
-(841,'Hatoba Tsugu'),
-(842,'Mario'),
-(843,'Princess Peach'),
-(844,'Super Crown Bowser'),
-(845,'Artoria Pendragon Alter');
+(1,'Minako Aino / Sailor Venus',4),
+(2,'Usagi Tsukino / Sailor Moon',4),
+(3,'Makoto Kino / Sailor Jupiter',4),
+(4,'Pepperoni',1),
+(5,'Centorea Shianus',1),
+(6,'Kimihito Kurusu',1),
+(7,'Himekaidou Hatate',2),
+(8,'Boa Hancock',4),
+(9,'Mahiru Koizumi',2),
+(10,'Hiyoko Saionji',2),
+(11,'Link',8),
+(12,'Princess Zelda',2),
+(13,'Yukari Kotozume / Cure Chocolat',1),
+(14,'Gudao',53),
+(15,'BB',1),
+(16,'Passionlip',1),
+(17,'Martina',14),
+(18,'Senya',3),
+(19,'Paya',1),
+(20,'Takane Shijou',3),
+(21,'Producer',29),
+(22,'Yugi Mutou',1),
+(23,'Yami Yugi',1),
+(24,'Satori Komeiji',3),
+(25,'Sanae Kochiya',4),
+(26,'Kaenbyou Rin',1),
+(27,'Akitsu Maru',1),
+(28,'Nagato',1),
+(29,'Ushio',3),
+(30,'Shou Toramaru',2),
+(31,'Nazrin',3),
+(32,'Ajax',1),
+(33,'Sarada Uchiha',5),
+(34,'Naruto Uzumaki',10),
+(35,'Sakura Haruno',6),
+(36,'Ino Yamanaka',3),
+(37,'Shizune',1),
+(38,'Tenten',1),
+(39,'Hinata Hyuga',5),
+(40,'Mary Read',1),
+(41,'Anne Bonny',1),
+(42,'Rika Jougasaki',5),
+(43,'Scheherazade',4),
+(44,'Astolfo',21),
+(45,'Jeanne d''Arc',2),
+(46,'Victor Nikiforov',2),
+(47,'Yuuri Katsuki',2),
+(48,'Nitocris',3),
+(49,'Ingrid',1),
+(50,'Igawa Sakura',2),
+(51,'Senkan Seiki',1),
+(52,'Seaport Hime',3),
+(53,'Nightingale',8),
+(54,'Sturm',5),
+(55,'Drang',3),
+(56,'Sorceress',6),
+(57,'Kazuichi Arai',1),
+(58,'Admiral',39),
+(59,'Kashima',7),
+(60,'Shuten Douji',6),
+(61,'Cagliostro',4),
+(62,'Clarisse',2),
+(63,'Aliza',5),
+(64,'Mika',2),
+(65,'Kay',3),
+(66,'Erika Itsumi',2),
+(67,'Arisu Shimada',2),
+(68,'Maho Nishizumi',3),
+(69,'Darjeeling',3),
+(70,'Nonna',1),
+(71,'Fina',1),
+(72,'Yohko Asagiri',1),
+(73,'Mari Illustrious Makinami',4),
+(74,'Mii Konori',1),
+(75,'Hacka Doll No. 3',3),
+(76,'Nozomu Ezomori',1),
+(77,'Chizuru Minamoto',2),
+(78,'Assam',1),
+(79,'Orange Pekoe',2),
+(80,'Airi Totoki',1),
+(81,'Kiawe',1),
+(82,'Lana',8),
+(83,'Kizuna Ai',2),
+(84,'Shalltear Bloodfallen',1),
+(85,'Albedo',2),
+(86,'Momo Yaoyorozu',2),
+(87,'Murakumo',2),
+(88,'Gran',25),
+(89,'Beatrix',6),
+(90,'Tamamo-no-Mae',1),
+(91,'Fumitan Admoss',2),
+(92,'Kudelia Aina Bernstein',2),
+(93,'Rider',2),
+(94,'Shirou Emiya',3),
+(95,'Takao',4),
+(96,'Anne Takamaki',5),
+(97,'Oboro',4),
+(98,'Murasaki',1),
+(99,'Asagi Igawa',3),
+(100,'Annelotte Kreuz',1),
+(101,'Farrah',2),
+(102,'Hagakure Shidou',1),
+(103,'Kirara Amanogawa / Cure Twinkle',3),
+(104,'Lyria',1),
+(105,'Minami Nitta',7),
+(106,'Shiki Ichinose',2),
+(107,'Chihiro Senkawa',2),
+(108,'Mayu Sakuma',4),
+(109,'Patchouli Knowledge',9),
+(110,'Koakuma',2),
+(111,'Eirin Yagokoro',2),
+(112,'Reisen Udongein Inaba',4),
+(113,'Hina Kagiyama',1),
+(114,'Minoriko Aki',1),
+(115,'Shizuka Aki',1),
+(116,'Yasaka Kanako',1),
+(117,'Suwako Moriya',2),
+(118,'Nitori Kawashiro',3),
+(119,'Cirno',2),
+(120,'Aya Shameimaru',7),
+(121,'Suzuya',1),
+(122,'Phoebe',1),
+(123,'Narumeia | Narmaya',9),
+(124,'Jessica',3),
+(125,'Lily',1),
+(126,'Artoria Pendragon',8),
+(127,'Samus Aran',3),
+(128,'Nami',11),
+(129,'Chi-Chi',1),
+(130,'Koishi Komeiji',2),
+(131,'Suguru Kamoshida',1),
+(132,'Remilia Scarlet',3),
+(133,'Iskandar / Alexander the Great',1),
+(134,'Mai Shiranui',5),
+(135,'Morrigan Aensland',2),
+(136,'Iroha',1),
+(137,'Rimururu',1),
+(138,'Felicia',1),
+(139,'Honey',1),
+(140,'I-no',1),
+(141,'Sheryl Nome',1),
+(142,'Lilith Aensland',1),
+(143,'Ranka Lee',1),
+(144,'Ryuuko Matoi',1),
+(145,'Saber',3),
+(146,'Super Sonico',1),
+(147,'Yoko Littner',1),
+(148,'Mirai',1),
+(149,'Vice',1),
+(150,'Chun-Li',8),
+(151,'Mature',1),
+(152,'Iori Yagami',2),
+(153,'Cammy White',4),
+(154,'Kyouko Sakura',1),
+(155,'Mami Tomoe',2),
+(156,'Madoka Kaname',1),
+(157,'Sayaka Miki',1),
+(158,'Homura Akemi',1),
+(159,'Elucia de Lute Lima',1),
+(160,'Keima Katsuragi',1),
+(161,'Haqua du Lot Herminium',1),
+(162,'Souji Okita',1),
+(163,'Yuuichi Aizawa',20),
+(164,'Akiko Minase',20),
+(165,'Kaede Akamatsu',1),
+(166,'Illyasviel von Einzbern',4),
+(167,'Hayashimo',1),
+(168,'The Order Grande | Zooey',1),
+(169,'Karluk Ayhan',1),
+(170,'Amira Hergal',1),
+(171,'Musashi',3),
+(172,'Razia',1),
+(173,'Shinji Ikari',5),
+(174,'Rei Ayanami',6),
+(175,'Asuka Langley Soryu',3),
+(176,'Ayane',1),
+(177,'Kanu Unchou',4),
+(178,'Nera Briscoletti',3),
+(179,'Bianca Whitaker',4),
+(180,'Jessica Albert',1),
+(181,'Elizabeth Joestar',1),
+(182,'Hibiki Ganaha',4),
+(183,'Chihaya Kisaragi',2),
+(184,'Makoto Kikuchi',1),
+(185,'Sage',3),
+(186,'Warrior',5),
+(187,'Eri Mizutani',1),
+(188,'Miki Hoshii',5),
+(189,'Hero',1),
+(190,'Ender',1),
+(191,'Agrias Oaks',1),
+(192,'Pyramid Head',1),
+(193,'Mariya Shidou',2),
+(194,'Shizu Shidou',1),
+(195,'Princess Devilotte De Deathsatan IX',1),
+(196,'Crimson Viper',2),
+(197,'Yukikaze Mizuki',1),
+(198,'Shiranui Mizuki',2),
+(199,'Elf',3),
+(200,'Amazon',3),
+(201,'Master Roshi',3),
+(202,'Android 18',3),
+(203,'Shimakaze',11),
+(204,'Izuna',1),
+(205,'Saki Mizushima',5),
+(206,'Makio Uzuki',2),
+(207,'Nyotengu',1),
+(208,'Shut',1),
+(209,'Shimei Ryomou',1),
+(210,'Housen Ryofu',2),
+(211,'Seija Kijin',1),
+(212,'Youmu Konpaku',6),
+(213,'Yuugi Hoshiguma',1),
+(214,'Chouun Shiryuu',1),
+(215,'Wriggle Nightbug',4),
+(216,'Eijun Sawamura',1),
+(217,'Haruichi Kominato',1),
+(218,'Rei Hasekura',2),
+(219,'Yoshino Shimazu',1),
+(220,'Yumi Fukuzawa',2),
+(221,'Sachiko Ogasawara',2),
+(222,'Maya',7),
+(223,'Cleric',3),
+(224,'Hotaru Shidare',5),
+(225,'Char Aznable',1),
+(226,'Astraia Toa Deikun',1),
+(227,'Galko-nee',1),
+(228,'Galko',6),
+(229,'Magisa',2),
+(230,'Satsuki Kiryuuin',1),
+(231,'Meena',1),
+(232,'Iori Minase',1),
+(233,'Mami Futami',1),
+(234,'Ami Futami',1),
+(235,'Poison',7),
+(236,'Roxy',1),
+(237,'Mayuri Shiina',1),
+(238,'Rintarou Okabe',1),
+(239,'Rumiho Akiha / Faris Nyannyan',1),
+(240,'Kurisu Makise',1),
+(241,'Suzuha Amane',1),
+(242,'Kokonotsu Shikada',4),
+(243,'Saika Totsuka',1),
+(244,'Hachiman Hikigaya',2),
+(245,'Morgiana',1),
+(246,'Kirigaya Suguha',2),
+(247,'Emi Yusa',1),
+(248,'Sadao Maou',1),
+(249,'Chiho Sasaki',1),
+(250,'Rei Kagura',2),
+(251,'Pierre',2),
+(252,'Lili Rochefort',2),
+(253,'Asuka Kazama',3),
+(254,'Cindy Aurum',1),
+(255,'Anna Nishikinomiya',1),
+(256,'Sophia Nishikinomiya',1),
+(257,'Motoko Kusanagi',1),
+(258,'Naomi',1),
+(259,'Kei',1),
+(260,'Arisa',1),
+(261,'Ami Mizuno / Sailor Mercury',2),
+(262,'Rei Hino / Sailor Mars',3),
+(263,'Himiko Toga',2),
+(264,'Izuku Midoriya',8),
+(265,'Melda Deitz',1),
+(266,'Tenshi Hinanawi',1),
+(267,'Yukari Yakumo',3),
+(268,'Anchira | Andira',1),
+(269,'Sen',1),
+(270,'Yuel',3),
+(271,'Forte',4),
+(272,'Riko Izayoi / Cure Magical',3),
+(273,'Love Momozono / Cure Peach',1),
+(274,'Tenryuu',3),
+(275,'Black Knight | Apollonia',1),
+(276,'Heles',3),
+(277,'Selvaria Bles',1),
+(278,'Alicia Melchiott',1),
+(279,'Maria Momoe',1),
+(280,'Azusa Hanai',1),
+(281,'Kazuki Nishina',1),
+(282,'Nazuna Nito',1),
+(283,'Vampy',3),
+(284,'Veight',2),
+(285,'Oda Nobunaga',1),
+(286,'Riju',1),
+(287,'Arslan',2),
+(288,'Kobayashi',2),
+(289,'Z1',6),
+(290,'Z3',4),
+(291,'Killua Zoldyck',1),
+(292,'Hisoka',1),
+(293,'Yumeko Sakurai',1),
+(294,'Azusa Miura',2),
+(295,'Haruka Amami',3),
+(296,'Ryo Akizuki',1),
+(297,'Yoichi Nasu no Suketaka',1),
+(298,'Kinoshita Hideyoshi',1),
+(299,'Mariandale',1),
+(300,'Bayonetta',1),
+(301,'Junko Enoshima',1),
+(302,'Kyouko Kirigiri',1),
+(303,'Yuyuko Saigyouji',2),
+(304,'Katori',2),
+(305,'Rangiku Matsumoto',3),
+(306,'Meiko Shiraki',1),
+(307,'Kaoruko Sakazaki',1),
+(308,'Kaede Takagaki',3),
+(309,'Kirishima',1),
+(310,'Yuuya Sakaki',1),
+(311,'Tatsuta',1),
+(312,'Gudako',6),
+(313,'Ladybug',1),
+(314,'Cat Noir',1),
+(315,'Mamori Tokonome',1),
+(316,'Mirei Shikishima',1),
+(317,'Valkyrie',3),
+(318,'Lulu',1),
+(319,'Poppy',1),
+(320,'Nasus',1),
+(321,'Tristana',1),
+(322,'Varus',1),
+(323,'Malzahar',1),
+(324,'Jeanne d''Arc (Ruler)',1),
+(325,'Haguro',1),
+(326,'Feena',1),
+(327,'Djeeta',2),
+(328,'Rosetta',1),
+(329,'Hisho',1),
+(330,'Midori',1),
+(331,'Shoukaku',1),
+(332,'Lancelot',2),
+(333,'Feower',1),
+(334,'Nayuki Minase',3),
+(335,'Kon the Knight',1),
+(336,'Rita',1),
+(337,'Rin Kaga',1),
+(338,'Mei Hatsume',1),
+(339,'Yuuka Izumi',1),
+(340,'Sakuya Izayoi',4),
+(341,'Camilla',1),
+(342,'Sakura',1),
+(343,'Kagero',1),
+(344,'Hinoka',1),
+(345,'Elise',1),
+(346,'Sophitia Alexandra',2),
+(347,'Cassandra Alexandra',1),
+(348,'Tamaki Kousaka',1),
+(349,'Tearju Lunatique',1),
+(350,'Sephie Michaela Deviluke',1),
+(351,'Mikado Ryouko',1),
+(352,'Rana',1),
+(353,'Cattleya',1),
+(354,'Shirahoshi',1),
+(355,'Nico Robin',7),
+(356,'Tadashi Hamada',3),
+(357,'Hiro Hamada',5),
+(358,'Matthew Kyrielite (Mashu / Shielder)',5),
+(359,'Ushiwakamaru',1),
+(360,'Kiyohime',3),
+(361,'Vivi',1),
+(362,'Tsukasa Suou',1),
+(363,'Kamishirasawa Keine',3),
+(364,'Kaga',4),
+(365,'YoRHa 9S',7),
+(366,'YoRHa 2B',7),
+(367,'Momiji Inubashiri',2),
+(368,'Ran Yakumo',5),
+(369,'Alice Margatroid',3),
+(370,'Rosa',1),
+(371,'Reimu Hakurei',2),
+(372,'Sakie Satou',1),
+(373,'Tetsuo Takahashi',1),
+(374,'Yunyun',2),
+(375,'Megumin',3),
+(376,'Wiz',1),
+(377,'Aqua',3),
+(378,'Kazuma Satou',4),
+(379,'Darkness | Lalatina Dustiness Ford',2),
+(380,'Prinz Eugen',2),
+(381,'Tanpopo Kuraishi',1),
+(382,'Ishtar',3),
+(383,'Ereshkigal',2),
+(384,'Mahiro Yasaka',1),
+(385,'Nyaruko',1),
+(386,'Atago',6),
+(387,'Hana Midorikawa',2),
+(388,'Kiyoshi Fujino',1),
+(389,'Mythra',3),
+(390,'Pyra',4),
+(391,'Hanekawa Tsubasa',1),
+(392,'Cynthia',1),
+(393,'Mio Honda',1),
+(394,'Mika Jougasaki',4),
+(395,'Little Red Riding Hood',1),
+(396,'Boa Marigold',1),
+(397,'Hayate Yagami',1),
+(398,'Nanoha Takamachi',1),
+(399,'Fate Testarossa',1),
+(400,'Vivio Takamachi',1),
+(401,'Hina',1),
+(402,'Sadi',1),
+(403,'Domino',1),
+(404,'Furutaka',1),
+(405,'Kirari Moroboshi',1),
+(406,'Miku Maekawa',2),
+(407,'Mina',1),
+(408,'Sorn | Song | Tweyen',1),
+(409,'Korwa',2),
+(410,'Sayla Mass',1),
+(411,'Mirai Yashima',1),
+(412,'Fraw Bow',1),
+(413,'Yui Ootsuki',1),
+(414,'Milla Maxwell',2),
+(415,'Muzet',2),
+(416,'Ludger Will Kresnik',2),
+(417,'Elise Lutus',1),
+(418,'Leia Rolando',1),
+(419,'Elle Mel Marta',1),
+(420,'Victor',1),
+(421,'Rin Tohsaka',1),
+(422,'Rin Tosaka',1),
+(423,'Yuuka Kazami',4),
+(424,'Hanayo Koizumi',2),
+(425,'Nico Yazawa',3),
+(426,'Shun Kurosaki',1),
+(427,'Yuuto',1),
+(428,'Athena Asamiya',2),
+(429,'Serval',1),
+(430,'Mirai Asahina / Cure Miracle',2),
+(431,'Kotonoha Akane',2),
+(432,'Clownpiece',1),
+(433,'Gaius',1),
+(434,'Tharja',2),
+(435,'Chloe "Kuro" von Einzbern',3),
+(436,'Lucina',1),
+(437,'Mallow',4),
+(438,'Sun',4),
+(439,'Misaka Mikoto',2),
+(440,'Pantheon',1),
+(441,'Leona',1),
+(442,'Lucario',1),
+(443,'Delphox',1),
+(444,'Greninja',1),
+(445,'Zoroark',1),
+(446,'Lopunny',1),
+(447,'Buizel',1),
+(448,'Nidoqueen',1),
+(449,'Ferry',2),
+(450,'Metera',2),
+(451,'Anabel',1),
+(452,'Tatsuya Shiba',3),
+(453,'Mayumi Saegusa',3),
+(454,'Mari Watanabe',1),
+(455,'Miyuki Shiba',2),
+(456,'Bismarck',1),
+(457,'Mio Akiyama',1),
+(458,'Fumika Sagisawa',3),
+(459,'Umi Sonoda',5),
+(460,'Kotori Minami',5),
+(461,'Honoka Kousaka',4),
+(462,'Maki Nishikino',3),
+(463,'Eri Ayase',4),
+(464,'Kyouko Toshinou',1),
+(465,'Saber Alter',3),
+(466,'Zeta',3),
+(467,'Wu Zetian',1),
+(468,'Yuzuki Seo',1),
+(469,'Hirotaka Wakamatsu',1),
+(470,'Gaku Yashiro',1),
+(471,'Satoru Fujinuma',1),
+(472,'Chuck Norris',1),
+(473,'Joel',1),
+(474,'Ellie',1),
+(475,'Hex Maniac',4),
+(476,'Akizuki',3),
+(477,'Teruzuki',3),
+(478,'Hatsuzuki',1),
+(479,'Amatsukaze',1),
+(480,'Merry',1),
+(481,'Yume',1),
+(482,'Shihoru',1),
+(483,'Haruhiro',1),
+(484,'Hinata Kawamoto',1),
+(485,'Kyouko Houda',1),
+(486,'Rei Kiriyama',1),
+(487,'Akari Kawamoto',1),
+(488,'Hiro',3),
+(489,'Zero Two',3),
+(490,'Kasumi',2),
+(491,'Isadora Finndottir',2),
+(492,'Ichigo / 015',1),
+(493,'Kaho Hinata',1),
+(494,'Yuri Plisetsky',1),
+(495,'Helena Blavatsky',1),
+(496,'Jack the Ripper',1),
+(497,'Laura Bodewig',1),
+(498,'Ichika Orimura',2),
+(499,'Ling Yin Huang',1),
+(500,'Maya Yamada',1),
+(501,'Houki Shinonono',1),
+(502,'Charlotte Dunois',2),
+(503,'Chifuyu Orimura',1),
+(504,'Cecilia Alcott',1),
+(505,'Lusamine',5),
+(506,'Lillie',4),
+(507,'Guzma',1),
+(508,'D.va',1),
+(509,'Minamoto no Raikou / Minamoto no Yorimitsu',11),
+(510,'Anila | Anira',1),
+(511,'Sengoku Nadeko',1),
+(512,'Namazuo Toushirou',1),
+(513,'Honebami Toushirou',1),
+(514,'Neptune / Purple Heart',1),
+(515,'Mamika Kirameki',1),
+(516,'Shizuka Mogami',1),
+(517,'Jabami Yumeko',1),
+(518,'Sessyoin Kiara',1),
+(519,'Lamretta',2),
+(520,'Sarya',2),
+(521,'Danua',1),
+(522,'Usagi Saionji',1),
+(523,'Mina Ashido',2),
+(524,'Kagefusa Manyuu',1),
+(525,'Chifusa Manyuu',1),
+(526,'Kaede',1),
+(527,'Sakura Matou',1),
+(528,'Tsubaki Yayoi',1),
+(529,'Charlotta',1),
+(530,'Flandre Scarlet',2),
+(531,'Len Kagamine',1),
+(532,'Shikieiki Yamaxanadu',1),
+(533,'Musashi Miyamoto',4),
+(534,'Luigi Torelli',2),
+(535,'Minamo Aoi',1),
+(536,'Rin Shibuya',1),
+(537,'Mika Ogino',1),
+(538,'Yukina Shirahane',1),
+(539,'Sophie Noel',1),
+(540,'Megumi Kato',1),
+(541,'Eas / Setsuna Higashi / Cure Passion',1),
+(542,'Haruka Haruno / Cure Flora',1),
+(543,'Minami Kaidou / Cure Mermaid',1),
+(544,'Tokiko Zaizen',1),
+(545,'Himari Arisugawa',1),
+(546,'Ritsuko Akagi',1),
+(547,'Maya Ibuki',1),
+(548,'Elphelt Valentine',1),
+(549,'Francis Drake',1),
+(550,'Urakaze',1),
+(551,'Isokaze',1),
+(552,'Hamakaze',3),
+(553,'Haruka',1),
+(554,'Hibari',1),
+(555,'Makoto Naegi',1),
+(556,'Aoi Asahina',1),
+(557,'Mirajane Strauss',1),
+(558,'Anthuria',1),
+(559,'Shino Sousaki',1),
+(560,'Chihiro Komiya',1),
+(561,'Toriel',1),
+(562,'Frisk',1),
+(563,'Mitsuki Bakugou',3),
+(564,'Ririka Kato',1),
+(565,'Mizuki Suzushiro',1),
+(566,'Xuanzang',3),
+(567,'Quetzalcoatl',1),
+(568,'Artoria Alter',1),
+(569,'Hans Christian Andersen',1),
+(570,'Shiori Shinomiya',1),
+(571,'Yoshino Koharu',1),
+(572,'Elliot',1),
+(573,'Riesz',1),
+(574,'Ryuujou',2),
+(575,'Mumei',1),
+(576,'Tsuyu Asui',3),
+(577,'Tone',1),
+(578,'Anzu Kadotani',1),
+(579,'Yuzu Koyama',1),
+(580,'Momo Kawashima',1),
+(581,'Rokuro Okajima',1),
+(582,'Revy',1),
+(583,'Nekone',1),
+(584,'Haku',1),
+(585,'Shizuka Hiratsuka',1),
+(586,'Inko Midoriya',1),
+(587,'Ochako Uraraka',2),
+(588,'Taokaka',1),
+(589,'Hajime Shino',1),
+(590,'Camieux',1),
+(591,'Cuilan',1),
+(592,'Robin',1),
+(593,'Joker',1),
+(594,'Batman',1),
+(595,'Ainz Ooal Gown',1),
+(596,'Aladdin',1),
+(597,'Genie',1),
+(598,'Archangel',1),
+(599,'Heavenly Herald',1),
+(600,'Sanctuary Guardian',1),
+(601,'Grape Dragon',1),
+(602,'Akagi',2),
+(603,'Ikazuchi',1),
+(604,'Akashi',1),
+(605,'Haruna',1),
+(606,'Strength',2),
+(607,'Chariot',1),
+(608,'Societte',2),
+(609,'Veronica',3),
+(610,'Armin Arlert',1),
+(611,'Laius',1),
+(612,'Marcille',2),
+(613,'Carmilla',2),
+(614,'Yukari Yuzuki',1),
+(615,'Mordred Pendragon',1),
+(616,'YoRHa A2',2),
+(617,'Hotaru Tomoe / Sailor Saturn',1),
+(618,'Chibiusa / Sailor Chibi Moon',1),
+(619,'Osakabehime',1),
+(620,'Juri Han',1),
+(621,'Danzou Katou',2),
+(622,'Loran Cehack',2),
+(623,'Jamil',2),
+(624,'Tanya von Degurechaff',1),
+(625,'Sae Kobayakawa',1),
+(626,'Yukari Mizumoto',1),
+(627,'Nozomi Toujou',2),
+(628,'Tsubasa Kira',1),
+(629,'Momoka Sakurai',1),
+(630,'Kaoru Ryuzaki',1),
+(631,'Nina Ichihara',1),
+(632,'Yukimi Sajo',1),
+(633,'Mai Fukuyama',1),
+(634,'Miria Akagi',1),
+(635,'Kanna Kamui',1),
+(636,'Kamoi',1),
+(637,'Hayasui',1),
+(638,'Fujiwara no Mokou',3),
+(639,'Haruka Tenoh / Sailor Uranus',1),
+(640,'Bulma',1),
+(641,'Chichi',1),
+(642,'I-19',2),
+(643,'Golden Darkness / Konjiki no Yami',1),
+(644,'Kotonoha Aoi',1),
+(645,'Haru Okumura',2),
+(646,'Sadayo Kawakami',1),
+(647,'Makoto Niijima',3),
+(648,'Yukari Akiyama',1),
+(649,'Gold Ship',1),
+(650,'Marth',1),
+(651,'Hata No Kokoro',1),
+(652,'Shigure',1),
+(653,'Rainbow Mika',2),
+(654,'Byakuren Hijiri',1),
+(655,'Kasen Ibaraki',1),
+(656,'Joey Jones',1),
+(657,'Kazuma Ikezawa',1),
+(658,'Kouta Oyamada',1),
+(659,'Cima Garahau',1),
+(660,'Kycilia Zabi',1),
+(661,'Kamatari Honjou',1),
+(662,'Ai Asato',1),
+(663,'Zangief',1),
+(664,'Misaki Shokuhou',1),
+(665,'Touma Kamijou',1),
+(666,'Ro-500',1),
+(667,'I-168',1),
+(668,'Gareki',1),
+(669,'Celes Chere',1),
+(670,'Rikku',1),
+(671,'Yuffie Kisaragi',1),
+(672,'Tidus',1),
+(673,'Cloud Strife',2),
+(674,'Rosa Farrell',1),
+(675,'Cecil',1),
+(676,'Zidane Tribal',1),
+(677,'Rydia',1),
+(678,'Freya Crescent',1),
+(679,'Locke Cole',1),
+(680,'Kaori Sakuramori',1),
+(681,'Seiga Kaku',1),
+(682,'Riko Sakurauchi',1),
+(683,'Rizu Ogata',1),
+(684,'Nariyuki Yuiga',1),
+(685,'Mafuyu Kirisu',1),
+(686,'Fumino Furuhashi',1),
+(687,'Kaito Shion',1),
+(688,'Belfast',2),
+(689,'Illustrious',1),
+(690,'Matsurika Shinouji',1),
+(691,'Kanako Miyamae',1),
+(692,'Isuzu Sento',1),
+(693,'Latifa Fleuranza',1),
+(694,'Miyako Shiina',1),
+(695,'Yamato Naoe',1),
+(696,'Misato Katsuragi',1),
+(697,'Yoshiko Tsushima',1),
+(698,'Yae Sakura',1),
+(699,'Honoka Mitsui',1),
+(700,'Sae Niijima',1),
+(701,'Takeru Amato',1),
+(702,'Inu-tan',1),
+(703,'Kii-tan',1),
+(704,'Aki Nijou',1),
+(705,'Fubuki',1),
+(706,'Elizabeth Bathory',1),
+(707,'Scathach',4),
+(708,'Medb',1),
+(709,'Reina Prowler',1),
+(710,'Mikumo Guynemer',1),
+(711,'Makina Nakajima',1),
+(712,'Freyja Wion',1),
+(713,'Kaname Buccaneer',1),
+(714,'Kirigaya Kazuto "Kirito"',2),
+(715,'Vira',1),
+(716,'Bill Cipher',1),
+(717,'Dipper Pines',1),
+(718,'Kaguya Houraisan',1),
+(719,'Lyfa',1),
+(720,'Ikki Kurogane',1),
+(721,'Stella Vermillion',1),
+(722,'Iowa',1),
+(723,'Stan',1),
+(724,'Alicia',1),
+(725,'Izmir',1),
+(726,'Takumi Mukai',1),
+(727,'Blue Mary',1),
+(728,'Kaoru Watabe',1),
+(729,'Chris',1),
+(730,'Rock Howard',1),
+(731,'Kensou Sie',1),
+(732,'Rex',2),
+(733,'Clementine',1),
+(734,'Jeanne d''Arc (Alternate)',4),
+(735,'Astraea',1),
+(736,'Black / Hilbert',1),
+(737,'Skyla',1),
+(738,'Hibiki Tachibana',1),
+(739,'Gaul Galette dos Rois',1),
+(740,'Tomoya Aki',1),
+(741,'Eriri Spencer Sawamura',1),
+(742,'Yuudachi',1),
+(743,'Gardenia',1),
+(744,'Dark Precure',1),
+(745,'Rinne Inaba',1),
+(746,'Nao Kamiya',1),
+(747,'Koume Shirasaka',1),
+(748,'Nana Abe',1),
+(749,'Marulk',1),
+(750,'Ozen',1),
+(751,'Rikuo Nura',1),
+(752,'Tsurara Oikawa',1),
+(753,'Miu Takanashi',1),
+(754,'Sora Takanashi',1),
+(755,'Jigoku no Fubuki',1),
+(756,'Marisa Kirisame',1),
+(757,'Lenna Charlotte Tycoon',1),
+(758,'Penelo',1),
+(759,'Aerith Gainsborough',1),
+(760,'Bartz Klauser',1),
+(761,'Vaan',1),
+(762,'Tifa Lockhart',1),
+(763,'Faris Scherwiz',1),
+(764,'Krile Mayer Baldesion',1),
+(765,'Bonnie',2),
+(766,'Clement',2),
+(767,'Ash Ketchum',8),
+(768,'Misty',6),
+(769,'Dawn',4),
+(770,'May',5),
+(771,'Serena',4),
+(772,'Shoubou',1),
+(773,'Kent',1),
+(774,'Boudica',1),
+(775,'Suiko Tatsunagi',1),
+(776,'Aichi Sendou',1),
+(777,'Katsuki Bakugou',1),
+(778,'Atsuko Kagari',2),
+(779,'Sucy Manbavaran',2),
+(780,'Regu',1),
+(781,'Yae',1),
+(782,'Fuyuki Hinata',1),
+(783,'Natsumi Hinata',1),
+(784,'Aki Hinata',1),
+(785,'Red Saber (Nero)',1),
+(786,'Saint Martha',1),
+(787,'Homura',1),
+(788,'Hong Meiling',1),
+(789,'Tenko Chabashira',1),
+(790,'Shuuichi Saihara',1),
+(791,'FAL',1),
+(792,'Ouroboros',1),
+(793,'Five-seveN',1),
+(794,'Futaba Sakura',2),
+(795,'Karen Kohiruimaki "Llenn"',1),
+(796,'Nurse Joy',3),
+(797,'Officer Jenny',3),
+(798,'Iris',2),
+(799,'Savanah',2),
+(800,'Caroline',2),
+(801,'Professor Oak',2),
+(802,'Delia Ketchum',2),
+(803,'Brock',2),
+(804,'Max',2),
+(805,'Chitose Serikawa',1),
+(806,'Haruma Kawagoe',1),
+(807,'Sekai Kamiki',1),
+(808,'Fumina Hoshino',1),
+(809,'Megumi Aino / Cure Lovely',1),
+(810,'Yuki Omori / Cure Honey',1),
+(811,'Zoey',1),
+(812,'Todd Snap',1),
+(813,'Kenny',1),
+(814,'Professor Ivy',1),
+(815,'Shauna',1),
+(816,'Trevor',1),
+(817,'Sophie',1),
+(818,'Tierno',1),
+(819,'Professor Sycamore',1),
+(820,'Carla',1),
+(821,'Virgo',1),
+(822,'Wendy Marvell',1),
+(823,'Happy',1),
+(824,'Lucy Heartfilia',1),
+(825,'Erza Scarlet',1),
+(826,'Natsu Dragneel',1),
+(827,'Thief',1),
+(828,'Aoi Tategami / Cure Gelato',1),
+(829,'Yaia',1),
+(830,'Siro',1),
+(831,'Kaguya Luna',1),
+(832,'Mirai Akari',1),
+(833,'Nekomiya Hinata',1),
+(834,'Lecia',1),
+(835,'Monika',1),
+(836,'Yamato',1),
+(837,'Sybilla',1),
+(838,'Kotoha Hanami',1),
+(839,'Akira Kurusu',1),
+(840,'Kagerou Imaizumi',1),
+(841,'Hatoba Tsugu',0),
+(842,'Mario',1),
+(843,'Princess Peach',1),
+(844,'Super Crown Bowser',1),
+(845,'Artoria Pendragon Alter',1);
 INSERT INTO "Collection" VALUES
-(1,'Getsu Ka Sui Moku Kin Do Nichi Full Color'),
-(2,'Mister Enkou'),
-(3,'DELIGHTFULLY FUCKABLE AND UNREFINED'),
-(4,'Reishuu'),
-(5,'Wagaya no Otengu-sama'),
-(6,'Energy Kyo-ka!!'),
-(7,'P.O.M'),
-(8,'Gyakushuu! Otoko no Maron'),
-(9,'Futei Koubi Zuma Honoka | Cheating Wife Honoka'),
-(10,'The Commander''s Submission'),
-(11,'Reisou Shinki Illusion'),
-(12,'Soto no Sekai wa Kiken de Ippai!!'),
-(13,'Konoha Donburi'),
-(14,'The Slut Next Door'),
-(15,'Naked Princess Honoka'),
-(16,'Over ❤︎ Drive (FAKKU)'),
-(17,'Intention'),
-(18,'That Cutie is a Predatory Futanari Girl'),
-(19,'Gareki'),
-(20,'GuP Hside'),
-(21,'Living with Succubus'),
-(22,'Toaru Anime no Yorozu Hon'),
-(23,'Boku no Shiawase na Shumi'),
-(24,'Oideyo! Mizuryu Kei Land'),
-(25,'Tutor Sex Life'),
-(26,'Nighttime Lover'),
-(27,'Shounen Succubus'),
-(28,'Layers of White'),
-(29,'Calligraphy'),
-(30,'Microne Magazine'),
-(31,'Enjo Kouhai'),
-(32,'An Elder Sister'),
-(33,'My Aunt''s Body is Irresistible'),
-(34,'Shingeki no Orc'),
-(35,'Slutty Bitchcock'),
-(36,'Trans B Maid'),
-(37,'Rider Or Die'),
-(38,'Daily Sisters'),
-(39,'We Kunoichi Fell Into Darkness'),
-(40,'Animal Girl Hotline'),
-(41,'Amamori''s Spear'),
-(42,'Uchi no Yome ni wa Shippo ga Atte'),
-(43,'Kaya-Nee at'),
-(44,'Magical Insence'),
-(45,'idolize'),
-(46,'Kuro Gyaru Gensoukyou'),
-(47,'Sorako No Tabi'),
-(48,'Jingai Shunman'),
-(49,'Aniya-san Change!'),
-(50,'Everyday Life When All Girls Have Turned Into Trashy Bitches'),
-(51,'The Legend of Chun-Li'),
-(52,'She''s My Family And My Lover'),
-(53,'Akiko-san to Issho'),
-(54,'Awa no Ohime-sama'),
-(55,'Wagaya no Liliana-san'),
-(56,'Solo Hunter no Seitai'),
-(57,'Love My Roommate ♡'),
-(58,'A Sister For Each Season'),
-(59,'President Exposed'),
-(60,'A Male Middle Schooler...'),
-(61,'Dolls'),
-(62,'Dragon Queen''s'),
-(63,'TOKYO Charismatic Public Lavatory'),
-(64,'Hunter farm'),
-(65,'Suki Suki! Onii-chan'),
-(66,'After School Sex Slave Club'),
-(67,'MC High'),
-(68,'THE ANiMALM@STER'),
-(69,'Futanari Roshutsu Mania Plus'),
-(70,'GYU-DON!'),
-(71,'INDEXGIRLS'),
-(72,'Hyakki Yakou'),
-(73,'FUCK!!'),
-(74,'Prina the Dungeoneering Princess'),
-(75,'Boku dake no Bakunyuu Ona-maid'),
-(76,'NIPPON'),
-(77,'Emergence'),
-(78,'FuckBuddy Collection'),
-(79,'Teisou Kannen ZERO'),
-(80,'Inbreeding of an Era'),
-(81,'Shinoburedo'),
-(82,'Resort Island of Women Who Love It When You Cum Inside Them'),
-(83,'Haishin! Shimakaze-kun no Heya'),
-(84,'Haijo DD Chou'),
-(85,'sideMess'),
-(86,'Yuugatou Club'),
-(87,'Shokukan Mankan Zenseki'),
-(88,'My Care Lady'),
-(89,'Maria-sama ga Miteru Baishun'),
-(90,'High Elf × High School'),
-(91,'Kuro Gal Bakunyuu Cosplayers'),
-(92,'Manya-Ita!'),
-(93,'EMPIRE HARD CORE'),
-(94,'FutaKyo! ~Futanari Kyouko-chan~'),
-(95,'Cumming Inside Mommy''s Hole'),
-(96,'LiLiM''s'),
-(97,'Pee Fundraiser'),
-(98,'Oroshi Ninniku, Atari'),
-(99,'Otona No Dagashi'),
-(100,'Suguha-chan Nikki'),
-(101,'Sister Crisis'),
-(102,'Milk Sister'),
-(103,'Monster Shoukan'),
-(104,'Josou Shounen Mesuochi Saimin'),
-(105,'TEKKEN'),
-(106,'Gekkan Web Otoko no Ko-llection! S'),
-(107,'Ojisan to Boku'),
-(108,'Aniki to Enkou'),
-(109,'FAIRY PARANOIA'),
-(110,'Nikubenki Hime o Tsukuri Kata'),
-(111,'SDPO'),
-(112,'KAITEN'),
-(113,'Mousouten Granblue Fantasy'),
-(114,'The Daily Life of the Souma Family'),
-(115,'Nyotaika Pandemic'),
-(116,'TSF Monogatari'),
-(117,'Shiranui Mai FC Event'),
-(118,'Date Docking!'),
-(119,'Nuru Never Drain'),
-(120,'Momokan'),
-(121,'Onoko to.'),
-(122,'Kuzu no Fukushuu'),
-(123,'Mama ni Narussu!'),
-(124,'...Itsumodoori'),
-(125,'Niedenka'),
-(126,'Josounin'),
-(127,'Mesu Ochi'),
-(128,'METAL SLUG'),
-(129,'Yui'),
-(130,'Who I Really Am'),
-(131,'Yoru no Kao wa Enkou Shounen'),
-(132,'Anyway, I Want to Have Sex With...'),
-(133,'NH-san to AF Zanmai'),
-(134,'Survival Game'),
-(135,'Senpai (♂) Kanojo'),
-(136,'Kaname'),
-(137,'Futa Quest'),
-(138,'ICE BOXXX'),
-(139,'Futanari Masturbation Festival'),
-(140,'A Certain Futanari Girl''s Masturbation Diary'),
-(141,'ASS Horufo-kun'),
-(142,'Kari no Ojikan'),
-(143,'Welcome to the Demi-Human Medical Center!'),
-(144,'ININ Renmei'),
-(145,'Sailor Freak'),
-(146,'Mittsu Me wa Betsu no Kao'),
-(147,'kakuzatouichi'),
-(148,'Ippai Itte ne, Yuusha-sama'),
-(149,'Summer Fun with Three Sisters'),
-(150,'Double Face'),
-(151,'Massive Cock Appreciation Club'),
-(152,'Girls Lacrosse Club'),
-(153,'My Next door Neighbor Anette-san'),
-(154,'Thicker Than Water'),
-(155,'Master-Slave Complex'),
-(156,'Omnivorous Hero'),
-(157,'Kuroshiki'),
-(158,'Decadence Soul'),
-(159,'Popuni Kei Joshi Panic!'),
-(160,'Forbidden Fruit'),
-(161,'Bessatsu Comic Unreal Ningen Bokujou Hen'),
-(162,'Meniku Ninpouchou'),
-(163,'Futanari Inma to Reizoku Danshi'),
-(164,'MILF of STEEL'),
-(165,'Joint Futanari Practice'),
-(166,'Kore Ijou wa Yurushite...'),
-(167,'C9'),
-(168,'It''s a Beautiful Flower'),
-(169,'Midarezaki Joshuu Kaizoku'),
-(170,'Omakase Fudeoroshi Galko-chan'),
-(171,'Kikuushi no Seikatsu'),
-(172,'JS Gakuen'),
-(173,'Makotoni Zannen desu ga Bouken no Sho'),
-(174,'Kotori'),
-(175,'Gal Shota Cinderella'),
-(176,'Mahou Shoujo Saimin PakopaCause'),
-(177,'MAO FRIENDS'),
-(178,'Inaka o Urouro Suru'),
-(179,'Suikan!'),
-(180,'Short Distance Relationship'),
-(181,'My Friend''s Little Sister'),
-(182,'Haha wa Odoru'),
-(183,'Sasuoni!'),
-(184,'Bullied ~Revenge Hypnosis~'),
-(185,'The Woman Who Wants to Know About Anal'),
-(186,'Chizuru-chan Development Diary'),
-(187,'Seitokaichou no Himitsu'),
-(188,'GIRLFriend’s'),
-(189,'I Saved a Loli Elf in Another World and This Happened'),
-(190,'T-XX'),
-(191,'Critical Kaname Demonology'),
-(192,'Arcana Tales'),
-(193,'Monzetsu'),
-(194,'Geki!! Monzetsu Operation'),
-(195,'Black Lily'),
-(196,'Friend? Maniac'),
-(197,'Marked-girls'),
-(198,'Nikuhisyo Yukiko'),
-(199,'Tonari no Chinatsu-chan R'),
-(200,'Ultra Beast nante Nakatta'),
-(201,'Phallic Girls'),
-(202,'Kimeseku ni Maketa Shounen'),
-(203,'Souyuu Reisou'),
-(204,'Boku no Kanojo o Shoukai Shimasu'),
-(205,'Cocytus no Atatamekata'),
-(206,'Yotogi no Ojikan'),
-(207,'SIDE OTOKONOKO IDOL'),
-(208,'Different World Girl'),
-(209,'Angel''s Stroke'),
-(210,'Senpai-chan to Ore'),
-(211,'Unparalleled Girlfriend'),
-(212,'1st Love'),
-(213,'Jukujoshikousei'),
-(214,'Momohime'),
-(215,'Ano! Okaa-san no Shousai'),
-(216,'Izure'),
-(217,'Mama ni Seishi Ippai Choudai'),
-(218,'Fuck&Slash!'),
-(219,'New Girl''s Part-Time Job'),
-(220,'Raw ♥ Broadcast'),
-(221,'Hanky-Panky Rinarin'),
-(222,'Ikumonogakari Deluxe Ban'),
-(223,'Princess Sakusei Lesson'),
-(224,'Succubus Stayed Life'),
-(225,'Kaa-san Ja Nakya Dame Nan Da!!'),
-(226,'Lil'' Devil Academy Sex Ed Life'),
-(227,'Ayanami Rei'),
-(228,'Newbie Editor Tsukimoto-san'),
-(229,'Ayanami Dai Kai'),
-(230,'Mika-ppoi no!'),
-(231,'Imouto wa Amnesia'),
-(232,'Senran Chichi Ninmai'),
-(233,'Tiny Evil'),
-(234,'Shigeru Mansion'),
-(235,'Daily Life'),
-(236,'Nami SAGA'),
-(237,'Hey! Are You Trying to Have Sex With Your Mother!?'),
-(238,'Saimin Gakuen Rankou-ka'),
-(239,'Houjou no Reizoku Elf'),
-(240,'The Elf Onee-Shota Author'),
-(241,'Mama Shot-ime'),
-(242,'My Dear Maid'),
-(243,'TS Gakuen Wonderful'),
-(244,'Playing with Onee-san'),
-(245,'Futagiku'),
-(246,'Roshutsu Sex Soldier Satsuki'),
-(247,'LITTLE BITCH PLANET'),
-(248,'Bath-Loli Education'),
-(249,'My Little Sister Is a Kiss Fiend'),
-(250,'Zettai Fukujuu Camera'),
-(251,'Kitsune-san no H na Hon'),
-(252,'Boku no Harem Academia'),
-(253,'Hitozuma Audrey-san no Himitsu'),
-(254,'Internship!'),
-(255,'Mating with Oni'),
-(256,'Strength and'),
-(257,'Marcille Meshi'),
-(258,'I''ve Obtained a Hypnotic Power That Lets Me Turn Any Girl Into a Sex Friend!?'),
-(259,'The Rumored Hostess-kun'),
-(260,'How to Raise Plants'),
-(261,'Tayottemo Iiyo...?'),
-(262,'Amakan Settai'),
-(263,'Kiyohii no Hon'),
-(264,'Maid Live!'),
-(265,'SURUDAKE'),
-(266,'Kaki Hoshuu'),
-(267,'Cocksleeve Classroom'),
-(268,'Lucky Pervert'),
-(269,'Victim Girls (FAKKU)'),
-(270,'Hybrid Tsuushin'),
-(271,'Shiawase Usagi no Shiawase'),
-(272,'Demon''s Forest'),
-(273,'Inu no Kimochi Ii'),
-(274,'Boku wa Imouto to Tsukiaenai.'),
-(275,'Inmakon no Nie'),
-(276,'Tales of a Harem in Another World'),
-(277,'Nakama to Issen Koechau Hon ~FF Hen~'),
-(278,'Do You Wanna Do Lewd Things With Sapphire (FAKKU)'),
-(279,'Hachidori no Yuuwaku / ハチドリの誘惑'),
-(280,'Netorare Mousou Syndrome'),
-(281,'What do you like?'),
-(282,'No one Does it Like You Brother'),
-(283,'Tachibana Yukina Enkou Nisshi'),
-(284,'Runaway Girls'' Nest'),
-(285,'Karamitsuku Shisen'),
-(286,'Look at Me'),
-(287,'Futanari! Oshioki Time'),
-(288,'HOP'),
-(289,'MAKIPET'),
-(290,'Masturbation Princess'),
-(291,'Yukiyanagi no Hon'),
-(292,'moon phase material'),
-(293,'Fuwatoro'),
-(294,'Hypnosis Sex Guidance!'),
-(295,'Sister Affection'),
-(296,'Angel Academy'),
-(297,'Mokou Onee-chan to Shota ga Ecchi Suru Hon'),
-(298,'Kinjo Yuuwaku Teruhiko to Okaa-san Hen'),
-(299,'HONEY CAGE'),
-(300,'First Time Mission!'),
-(301,'Shinai Max Mattanashi!'),
-(302,'Haken No Muuko-san'),
-(303,'Part Time Manaka-san'),
-(304,'Buttobi Girl to Motto Ii Koto'),
-(305,'Iruikonintan'),
-(306,'The Two Sides of the Honour Student Ayaka'),
-(307,'Stay by Me'),
-(308,'Oshiete MY HONEY'),
-(309,'SISTER BOY'),
-(310,'Naisho no Gao Gao Ecchi'),
-(311,'Haiboku Saimin'),
-(312,'PM GALS'),
-(313,'Kimi no Egao ga Boku no Hoshi'),
-(314,'Picking up and Raising a Cyclops-chan Manga'),
-(315,'Sasami'),
-(316,'Shokubutsu no Sodatekata'),
-(317,'Autumn'),
-(318,'Scarlet Hearts'),
-(319,'The Virgin Morals Committee Member''s Request She Can''t Tell Anyone Else'),
-(320,'sparkling vacation'),
-(321,'Chibikko Bitch'),
-(322,'OneShota Kyuunyuuki'),
-(323,'Festa!'),
-(324,'Futana Live!'),
-(325,'My First Training Session as a Tribute-Masochist'),
-(326,'Yamato-san wa Se ga Takai.'),
-(327,'The Owl''s Mansion'),
-(328,'The Days'),
-(329,'Monster Girl Transformation Go!'),
-(330,'Kuu ka, Kuwareru ka?'),
-(331,'The Evil of Commons'),
-(332,'Toile ga Nai! | There''s No Toilet!'),
-(333,'Bakunyuu Gal');
+(1,'Getsu Ka Sui Moku Kin Do Nichi Full Color',2),
+(2,'Mister Enkou',1),
+(3,'DELIGHTFULLY FUCKABLE AND UNREFINED',1),
+(4,'Reishuu',1),
+(5,'Wagaya no Otengu-sama',1),
+(6,'Energy Kyo-ka!!',7),
+(7,'P.O.M',2),
+(8,'Gyakushuu! Otoko no Maron',2),
+(9,'Futei Koubi Zuma Honoka | Cheating Wife Honoka',1),
+(10,'The Commander''s Submission',1),
+(11,'Reisou Shinki Illusion',1),
+(12,'Soto no Sekai wa Kiken de Ippai!!',1),
+(13,'Konoha Donburi',5),
+(14,'The Slut Next Door',2),
+(15,'Naked Princess Honoka',3),
+(16,'Over ❤︎ Drive (FAKKU)',2),
+(17,'Intention',1),
+(18,'That Cutie is a Predatory Futanari Girl',2),
+(19,'Gareki',2),
+(20,'GuP Hside',2),
+(21,'Living with Succubus',5),
+(22,'Toaru Anime no Yorozu Hon',2),
+(23,'Boku no Shiawase na Shumi',2),
+(24,'Oideyo! Mizuryu Kei Land',8),
+(25,'Tutor Sex Life',2),
+(26,'Nighttime Lover',2),
+(27,'Shounen Succubus',5),
+(28,'Layers of White',1),
+(29,'Calligraphy',1),
+(30,'Microne Magazine',6),
+(31,'Enjo Kouhai',1),
+(32,'An Elder Sister',4),
+(33,'My Aunt''s Body is Irresistible',3),
+(34,'Shingeki no Orc',1),
+(35,'Slutty Bitchcock',1),
+(36,'Trans B Maid',1),
+(37,'Rider Or Die',1),
+(38,'Daily Sisters',1),
+(39,'We Kunoichi Fell Into Darkness',2),
+(40,'Animal Girl Hotline',7),
+(41,'Amamori''s Spear',4),
+(42,'Uchi no Yome ni wa Shippo ga Atte',2),
+(43,'Kaya-Nee at',3),
+(44,'Magical Insence',1),
+(45,'idolize',5),
+(46,'Kuro Gyaru Gensoukyou',3),
+(47,'Sorako No Tabi',2),
+(48,'Jingai Shunman',4),
+(49,'Aniya-san Change!',3),
+(50,'Everyday Life When All Girls Have Turned Into Trashy Bitches',6),
+(51,'The Legend of Chun-Li',3),
+(52,'She''s My Family And My Lover',2),
+(53,'Akiko-san to Issho',20),
+(54,'Awa no Ohime-sama',9),
+(55,'Wagaya no Liliana-san',1),
+(56,'Solo Hunter no Seitai',11),
+(57,'Love My Roommate ♡',5),
+(58,'A Sister For Each Season',5),
+(59,'President Exposed',2),
+(60,'A Male Middle Schooler...',2),
+(61,'Dolls',3),
+(62,'Dragon Queen''s',4),
+(63,'TOKYO Charismatic Public Lavatory',3),
+(64,'Hunter farm',2),
+(65,'Suki Suki! Onii-chan',1),
+(66,'After School Sex Slave Club',1),
+(67,'MC High',6),
+(68,'THE ANiMALM@STER',3),
+(69,'Futanari Roshutsu Mania Plus',1),
+(70,'GYU-DON!',1),
+(71,'INDEXGIRLS',1),
+(72,'Hyakki Yakou',1),
+(73,'FUCK!!',2),
+(74,'Prina the Dungeoneering Princess',12),
+(75,'Boku dake no Bakunyuu Ona-maid',4),
+(76,'NIPPON',8),
+(77,'Emergence',7),
+(78,'FuckBuddy Collection',1),
+(79,'Teisou Kannen ZERO',1),
+(80,'Inbreeding of an Era',1),
+(81,'Shinoburedo',1),
+(82,'Resort Island of Women Who Love It When You Cum Inside Them',1),
+(83,'Haishin! Shimakaze-kun no Heya',3),
+(84,'Haijo DD Chou',1),
+(85,'sideMess',2),
+(86,'Yuugatou Club',1),
+(87,'Shokukan Mankan Zenseki',2),
+(88,'My Care Lady',3),
+(89,'Maria-sama ga Miteru Baishun',3),
+(90,'High Elf × High School',5),
+(91,'Kuro Gal Bakunyuu Cosplayers',2),
+(92,'Manya-Ita!',2),
+(93,'EMPIRE HARD CORE',1),
+(94,'FutaKyo! ~Futanari Kyouko-chan~',2),
+(95,'Cumming Inside Mommy''s Hole',2),
+(96,'LiLiM''s',1),
+(97,'Pee Fundraiser',1),
+(98,'Oroshi Ninniku, Atari',1),
+(99,'Otona No Dagashi',2),
+(100,'Suguha-chan Nikki',1),
+(101,'Sister Crisis',2),
+(102,'Milk Sister',2),
+(103,'Monster Shoukan',1),
+(104,'Josou Shounen Mesuochi Saimin',2),
+(105,'TEKKEN',1),
+(106,'Gekkan Web Otoko no Ko-llection! S',4),
+(107,'Ojisan to Boku',2),
+(108,'Aniki to Enkou',2),
+(109,'FAIRY PARANOIA',1),
+(110,'Nikubenki Hime o Tsukuri Kata',2),
+(111,'SDPO',2),
+(112,'KAITEN',2),
+(113,'Mousouten Granblue Fantasy',1),
+(114,'The Daily Life of the Souma Family',3),
+(115,'Nyotaika Pandemic',1),
+(116,'TSF Monogatari',2),
+(117,'Shiranui Mai FC Event',1),
+(118,'Date Docking!',1),
+(119,'Nuru Never Drain',2),
+(120,'Momokan',1),
+(121,'Onoko to.',3),
+(122,'Kuzu no Fukushuu',2),
+(123,'Mama ni Narussu!',3),
+(124,'...Itsumodoori',3),
+(125,'Niedenka',2),
+(126,'Josounin',2),
+(127,'Mesu Ochi',3),
+(128,'METAL SLUG',2),
+(129,'Yui',1),
+(130,'Who I Really Am',3),
+(131,'Yoru no Kao wa Enkou Shounen',1),
+(132,'Anyway, I Want to Have Sex With...',2),
+(133,'NH-san to AF Zanmai',2),
+(134,'Survival Game',1),
+(135,'Senpai (♂) Kanojo',1),
+(136,'Kaname',1),
+(137,'Futa Quest',1),
+(138,'ICE BOXXX',1),
+(139,'Futanari Masturbation Festival',4),
+(140,'A Certain Futanari Girl''s Masturbation Diary',1),
+(141,'ASS Horufo-kun',3),
+(142,'Kari no Ojikan',3),
+(143,'Welcome to the Demi-Human Medical Center!',1),
+(144,'ININ Renmei',1),
+(145,'Sailor Freak',1),
+(146,'Mittsu Me wa Betsu no Kao',2),
+(147,'kakuzatouichi',1),
+(148,'Ippai Itte ne, Yuusha-sama',1),
+(149,'Summer Fun with Three Sisters',1),
+(150,'Double Face',1),
+(151,'Massive Cock Appreciation Club',2),
+(152,'Girls Lacrosse Club',2),
+(153,'My Next door Neighbor Anette-san',1),
+(154,'Thicker Than Water',2),
+(155,'Master-Slave Complex',2),
+(156,'Omnivorous Hero',2),
+(157,'Kuroshiki',6),
+(158,'Decadence Soul',2),
+(159,'Popuni Kei Joshi Panic!',6),
+(160,'Forbidden Fruit',2),
+(161,'Bessatsu Comic Unreal Ningen Bokujou Hen',1),
+(162,'Meniku Ninpouchou',1),
+(163,'Futanari Inma to Reizoku Danshi',2),
+(164,'MILF of STEEL',1),
+(165,'Joint Futanari Practice',3),
+(166,'Kore Ijou wa Yurushite...',1),
+(167,'C9',1),
+(168,'It''s a Beautiful Flower',2),
+(169,'Midarezaki Joshuu Kaizoku',3),
+(170,'Omakase Fudeoroshi Galko-chan',2),
+(171,'Kikuushi no Seikatsu',2),
+(172,'JS Gakuen',3),
+(173,'Makotoni Zannen desu ga Bouken no Sho',3),
+(174,'Kotori',1),
+(175,'Gal Shota Cinderella',7),
+(176,'Mahou Shoujo Saimin PakopaCause',2),
+(177,'MAO FRIENDS',2),
+(178,'Inaka o Urouro Suru',1),
+(179,'Suikan!',1),
+(180,'Short Distance Relationship',5),
+(181,'My Friend''s Little Sister',2),
+(182,'Haha wa Odoru',5),
+(183,'Sasuoni!',2),
+(184,'Bullied ~Revenge Hypnosis~',5),
+(185,'The Woman Who Wants to Know About Anal',4),
+(186,'Chizuru-chan Development Diary',1),
+(187,'Seitokaichou no Himitsu',1),
+(188,'GIRLFriend’s',2),
+(189,'I Saved a Loli Elf in Another World and This Happened',2),
+(190,'T-XX',1),
+(191,'Critical Kaname Demonology',1),
+(192,'Arcana Tales',2),
+(193,'Monzetsu',3),
+(194,'Geki!! Monzetsu Operation',2),
+(195,'Black Lily',2),
+(196,'Friend? Maniac',3),
+(197,'Marked-girls',4),
+(198,'Nikuhisyo Yukiko',2),
+(199,'Tonari no Chinatsu-chan R',2),
+(200,'Ultra Beast nante Nakatta',3),
+(201,'Phallic Girls',1),
+(202,'Kimeseku ni Maketa Shounen',2),
+(203,'Souyuu Reisou',2),
+(204,'Boku no Kanojo o Shoukai Shimasu',1),
+(205,'Cocytus no Atatamekata',1),
+(206,'Yotogi no Ojikan',1),
+(207,'SIDE OTOKONOKO IDOL',2),
+(208,'Different World Girl',4),
+(209,'Angel''s Stroke',1),
+(210,'Senpai-chan to Ore',3),
+(211,'Unparalleled Girlfriend',2),
+(212,'1st Love',1),
+(213,'Jukujoshikousei',1),
+(214,'Momohime',2),
+(215,'Ano! Okaa-san no Shousai',3),
+(216,'Izure',1),
+(217,'Mama ni Seishi Ippai Choudai',2),
+(218,'Fuck&Slash!',1),
+(219,'New Girl''s Part-Time Job',4),
+(220,'Raw ♥ Broadcast',2),
+(221,'Hanky-Panky Rinarin',4),
+(222,'Ikumonogakari Deluxe Ban',1),
+(223,'Princess Sakusei Lesson',2),
+(224,'Succubus Stayed Life',2),
+(225,'Kaa-san Ja Nakya Dame Nan Da!!',3),
+(226,'Lil'' Devil Academy Sex Ed Life',2),
+(227,'Ayanami Rei',3),
+(228,'Newbie Editor Tsukimoto-san',2),
+(229,'Ayanami Dai Kai',1),
+(230,'Mika-ppoi no!',2),
+(231,'Imouto wa Amnesia',3),
+(232,'Senran Chichi Ninmai',1),
+(233,'Tiny Evil',3),
+(234,'Shigeru Mansion',1),
+(235,'Daily Life',3),
+(236,'Nami SAGA',3),
+(237,'Hey! Are You Trying to Have Sex With Your Mother!?',4),
+(238,'Saimin Gakuen Rankou-ka',1),
+(239,'Houjou no Reizoku Elf',3),
+(240,'The Elf Onee-Shota Author',1),
+(241,'Mama Shot-ime',8),
+(242,'My Dear Maid',2),
+(243,'TS Gakuen Wonderful',3),
+(244,'Playing with Onee-san',2),
+(245,'Futagiku',2),
+(246,'Roshutsu Sex Soldier Satsuki',3),
+(247,'LITTLE BITCH PLANET',3),
+(248,'Bath-Loli Education',5),
+(249,'My Little Sister Is a Kiss Fiend',2),
+(250,'Zettai Fukujuu Camera',5),
+(251,'Kitsune-san no H na Hon',1),
+(252,'Boku no Harem Academia',3),
+(253,'Hitozuma Audrey-san no Himitsu',1),
+(254,'Internship!',2),
+(255,'Mating with Oni',4),
+(256,'Strength and',2),
+(257,'Marcille Meshi',2),
+(258,'I''ve Obtained a Hypnotic Power That Lets Me Turn Any Girl Into a Sex Friend!?',2),
+(259,'The Rumored Hostess-kun',1),
+(260,'How to Raise Plants',2),
+(261,'Tayottemo Iiyo...?',2),
+(262,'Amakan Settai',2),
+(263,'Kiyohii no Hon',2),
+(264,'Maid Live!',4),
+(265,'SURUDAKE',5),
+(266,'Kaki Hoshuu',1),
+(267,'Cocksleeve Classroom',1),
+(268,'Lucky Pervert',1),
+(269,'Victim Girls (FAKKU)',3),
+(270,'Hybrid Tsuushin',2),
+(271,'Shiawase Usagi no Shiawase',1),
+(272,'Demon''s Forest',2),
+(273,'Inu no Kimochi Ii',2),
+(274,'Boku wa Imouto to Tsukiaenai.',1),
+(275,'Inmakon no Nie',1),
+(276,'Tales of a Harem in Another World',1),
+(277,'Nakama to Issen Koechau Hon ~FF Hen~',2),
+(278,'Do You Wanna Do Lewd Things With Sapphire (FAKKU)',2),
+(279,'Hachidori no Yuuwaku / ハチドリの誘惑',1),
+(280,'Netorare Mousou Syndrome',1),
+(281,'What do you like?',2),
+(282,'No one Does it Like You Brother',1),
+(283,'Tachibana Yukina Enkou Nisshi',1),
+(284,'Runaway Girls'' Nest',1),
+(285,'Karamitsuku Shisen',2),
+(286,'Look at Me',1),
+(287,'Futanari! Oshioki Time',1),
+(288,'HOP',1),
+(289,'MAKIPET',1),
+(290,'Masturbation Princess',1),
+(291,'Yukiyanagi no Hon',1),
+(292,'moon phase material',2),
+(293,'Fuwatoro',1),
+(294,'Hypnosis Sex Guidance!',1),
+(295,'Sister Affection',2),
+(296,'Angel Academy',1),
+(297,'Mokou Onee-chan to Shota ga Ecchi Suru Hon',1),
+(298,'Kinjo Yuuwaku Teruhiko to Okaa-san Hen',1),
+(299,'HONEY CAGE',1),
+(300,'First Time Mission!',1),
+(301,'Shinai Max Mattanashi!',1),
+(302,'Haken No Muuko-san',1),
+(303,'Part Time Manaka-san',1),
+(304,'Buttobi Girl to Motto Ii Koto',1),
+(305,'Iruikonintan',1),
+(306,'The Two Sides of the Honour Student Ayaka',1),
+(307,'Stay by Me',1),
+(308,'Oshiete MY HONEY',1),
+(309,'SISTER BOY',2),
+(310,'Naisho no Gao Gao Ecchi',1),
+(311,'Haiboku Saimin',1),
+(312,'PM GALS',9),
+(313,'Kimi no Egao ga Boku no Hoshi',2),
+(314,'Picking up and Raising a Cyclops-chan Manga',2),
+(315,'Sasami',2),
+(316,'Shokubutsu no Sodatekata',2),
+(317,'Autumn',1),
+(318,'Scarlet Hearts',3),
+(319,'The Virgin Morals Committee Member''s Request She Can''t Tell Anyone Else',1),
+(320,'sparkling vacation',2),
+(321,'Chibikko Bitch',2),
+(322,'OneShota Kyuunyuuki',2),
+(323,'Festa!',3),
+(324,'Futana Live!',1),
+(325,'My First Training Session as a Tribute-Masochist',2),
+(326,'Yamato-san wa Se ga Takai.',1),
+(327,'The Owl''s Mansion',0),
+(328,'The Days',1),
+(329,'Monster Girl Transformation Go!',1),
+(330,'Kuu ka, Kuwareru ka?',1),
+(331,'The Evil of Commons',1),
+(332,'Toile ga Nai! | There''s No Toilet!',1),
+(333,'Bakunyuu Gal',1);
 INSERT INTO "ExternalInfo" VALUES
 (1,1,'27372',1,'2017-02-02','sehki',2,4.27,44,502,1,'2017-01-01',0),
 (2,2,'31421',1,'2017-06-26','sehki',2,4.01,78,859,1,'2017-01-01',0),
@@ -60215,793 +63017,793 @@ INSERT INTO "ExternalInfo" VALUES
 (2799,2749,'27535',1,'2017-01-27','sehki',4,3.96,78,540,0,'2019-01-03',1),
 (2800,2749,'27535',1,'2017-01-27','sehki',4,3.96,78,540,0,'2019-01-03',0);
 INSERT INTO "Groups" VALUES
-(1,'Majimeya'),
-(2,'Yojouhan Shobou'),
-(3,'Kasumi Eater'),
-(4,'Kurohonyasan'),
-(5,'EROQUIS!'),
-(6,'Tiramisu Tart'),
-(7,'Bomb Shelter'),
-(8,'WindArTeam'),
-(9,'Norakukari'),
-(10,'Kocho Kocho Koukou'),
-(11,'Temparing'),
-(12,'UU-ZONE'),
-(13,'Vadass'),
-(14,'Morittokoke'),
-(15,'Akuochisukii Kyoushitsu'),
-(16,'Kinqhassin'),
-(17,'Alice no Takarabako'),
-(18,'ERECT TOUCH'),
-(19,'Jabarand'),
-(20,'Quartzshow'),
-(21,'Ruu Kikaku'),
-(22,'HEATWAVE'),
-(23,'JACK-POT'),
-(24,'Niikyuu'),
-(25,'Hadairo Roobois Tea'),
-(26,'ARC/TURBINE'),
-(27,'Aoba Q Madou'),
-(28,'Flying Chicken'),
-(29,'Cheese Company'),
-(30,'Fatalpulse'),
-(31,'Karakishi Youhei-dan Shinga'),
-(32,'Syunkan Saidaihusoku'),
-(33,'Aneko no Techo'),
-(34,'United States Netamecol'),
-(35,'STUDIO TIAMAT'),
-(36,'Ijimaya'),
-(37,'Baraneko Yougashi-ten'),
-(38,'Booch'),
-(39,'TUKIBUTO'),
-(40,'Ginjou Maggots'),
-(41,'Gate of XIII'),
-(42,'COMEX'),
-(43,'Hachimitsu Romance'),
-(44,'774 House'),
-(45,'Once Only'),
-(46,'Usubeniya'),
-(47,'A Gokuburi'),
-(48,'Selvage Fisheries'),
-(49,'Rosetta Stone'),
-(50,'NANIMOSHINAI'),
-(51,'Ten no Katsuraya'),
-(52,'Aimaitei'),
-(53,'YA-ZY'),
-(54,'Molossan'),
-(55,'HBO'),
-(56,'Yorando'),
-(57,'Hanyan.'),
-(58,'R*kaffy'),
-(59,'Nightmare Express'),
-(60,'Ishimura-ya'),
-(61,'Sakekan Memorial'),
-(62,'Ankoku Marimokan'),
-(63,'SlapStickStrike'),
-(64,'Yuasa Rengou'),
-(65,'I-Raf-you'),
-(66,'Rorinoutage'),
-(67,'Athome Shuka'),
-(68,'Pochi-Goya.'),
-(69,'Xration'),
-(70,'Amarini Senpaku!'),
-(71,'Sasumata Seven'),
-(72,'Kuroneko Smith'),
-(73,'Ambivalence'),
-(74,'Haraheridou'),
-(75,'Lyricbox'),
-(76,'Ichigosize'),
-(77,'Jukusei Kakuzatou'),
-(78,'Stemun'),
-(79,'SAGasile'),
-(80,'Kirintei'),
-(81,'Cannabis'),
-(82,'L.P.E.G.'),
-(83,'Magetarudou'),
-(84,'downbeat'),
-(85,'Kaiki Nisshoku'),
-(86,'Butagoya'),
-(87,'Kunaboto'),
-(88,'R.c.W.d'),
-(89,'Milk Boy'),
-(90,'MEAN MACHINE'),
-(91,'Chirimozuku Cha'),
-(92,'S.O.M'),
-(93,'DIGITAL ACCEL WORKS'),
-(94,'Mayoineko'),
-(95,'Asgo'),
-(96,'40Denier'),
-(97,'NULL Mayu'),
-(98,'WaToSaTo'),
-(99,'Seniman Kartun'),
-(100,'Ikaring'),
-(101,'Manguri Cannon'),
-(102,'NOSEBLEED'),
-(103,'Stapspats'),
-(104,'Takemama Iinkai'),
-(105,'Umi no Sachi'),
-(106,'Otaku Beam'),
-(107,'Service Heaven'),
-(108,'Water Drop'),
-(109,'Platinum Label'),
-(110,'gugumugu'),
-(111,'Kakuzatou'),
-(112,'Niku Drill'),
-(113,'Ruki Ruki EXISS'),
-(114,'Futanarun'),
-(115,'Kakukonoka'),
-(116,'Shouchuu MAC'),
-(117,'ClownCulture'),
-(118,'mega w'),
-(119,'Spicy Loves Heaven'),
-(120,'chunlieater'),
-(121,'Katamari-ya'),
-(122,'Penpengusa Club'),
-(123,'Mugen@WORKS'),
-(124,'Mitarashi Club'),
-(125,'Kitsune'),
-(126,'LemonMaiden'),
-(127,'Can Do Now!'),
-(128,'Zero Ni Kaeru Tsuki'),
-(129,'Bourgeois Ice Cream'),
-(130,'Tendou'),
-(131,'uraya'),
-(132,'Yokohama Junky'),
-(133,'Karuwani'),
-(134,'Viento Campanilla'),
-(135,'Mochi-ya'),
-(136,'drill''n girl'),
-(137,'SIRIUS.'),
-(138,'Motsu Ryouri'),
-(139,'Ozashiki'),
-(140,'Aodouhu'),
-(141,'Pish Lover'),
-(142,'DOZA Village'),
-(143,'Aroma Gaeru'),
-(144,'DT Koubou'),
-(145,'Ringo Gakuen'),
-(146,'Finecraft69'),
-(147,'Nagaredamaya'),
-(148,'chocolate Lv.5'),
-(149,'Desk Drawer'),
-(150,'Hannama'),
-(151,'IndexACG'),
-(152,'Hyakki Yakou'),
-(153,'V-SLASH'),
-(154,'Mine Noujou'),
-(155,'Mesu Gorilla.'),
-(156,'Neutral Boy'),
-(157,'Double Deck Seisakujo'),
-(158,'BLAZE'),
-(159,'Arsenothelus'),
-(160,'Insert'),
-(161,'Niku Ringo'),
-(162,'Studio Rakkyou'),
-(163,'Nine''s Graphics'),
-(164,'Inariya'),
-(165,'Gujira 4 Gou'),
-(166,'Memeya'),
-(167,'NCP'),
-(168,'nWa'),
-(169,'Wisteria'),
-(170,'99mg'),
-(171,'Zenra QQ'),
-(172,'Saigado'),
-(173,'Syumatsusyorijou'),
-(174,'Aomizuan'),
-(175,'SHD'),
-(176,'Granada Sky'),
-(177,'Yadokugaeru'),
-(178,'Tonikaku'),
-(179,'Diogenes Club'),
-(180,'Nanakorobi Yaoki'),
-(181,'Rorororomo'),
-(182,'Musashi-Dou'),
-(183,'Nyuu Koubou'),
-(184,'Cr-R'),
-(185,'Shoot The Moon'),
-(186,'Sakusaku Kangen Noushuku'),
-(187,'Dodo Fuguri'),
-(188,'Daihonei'),
-(189,'Kakumei Seifu Kouhoushitsu'),
-(190,'Mebius no Wa'),
-(191,'Nounanka Sedai'),
-(192,'San Se Fang'),
-(193,'Bundosuiko'),
-(194,'brilliant thunder'),
-(195,'Chotto Dake Aruyo'),
-(196,'Sengoku Joketsu Emaki'),
-(197,'"Tsu" ga Mittsu'),
-(198,'EIGHT BEAT'),
-(199,'CHINZURI BOP'),
-(200,'Deastim'),
-(201,'Waterwheel'),
-(202,'High Fly Flow'),
-(203,'Yuugengaisha Mach Spin'),
-(204,'Kinokoya(Kari)'),
-(205,'Jinsukeya'),
-(206,'Azi Dahaka'),
-(207,'Bakuretsu Fusen'),
-(208,'Porika'),
-(209,'Umasugiyu'),
-(210,'Atelier Dr.HEAD''S'),
-(211,'BRIO'),
-(212,'candy paddle'),
-(213,'Honey QP'),
-(214,'Tateyoko Issen'),
-(215,'Maltese'),
-(216,'dameningen+'),
-(217,'Tamago No Kara'),
-(218,'Kiyokawa Zaidan'),
-(219,'ROJIURA JACK'),
-(220,'Happouvijin'),
-(221,'Torano Ori'),
-(222,'spermation'),
-(223,'Kaiten Sommelier'),
-(224,'PIANIISHIMO'),
-(225,'LongHornTrain'),
-(226,'Erotibot'),
-(227,'Akatsuki Katsuie no Circle'),
-(228,'DA HOOTCH'),
-(229,'Drill Biyori'),
-(230,'Sanbaizu'),
-(231,'Suginami Sakura'),
-(232,'nul_Neverland'),
-(233,'TETRODOTOXIN'),
-(234,'Shotaian'),
-(235,'Hinahara Yashiki'),
-(236,'Mesuman Teikoku'),
-(237,'Inarizushi'),
-(238,'Akaeboshi'),
-(239,'SoundVillage'),
-(240,'Jisyakunyudo'),
-(241,'Seki Sabato'),
-(242,'Kudamono Monogatari'),
-(243,'Shinsei Lolishota'),
-(244,'Plateau Soft'),
-(245,'Kuromisa Kaijou'),
-(246,'Nanairo Koubou'),
-(247,'Kome Nouka'),
-(248,'Minmin'),
-(249,'Fullswing Otome'),
-(250,'Trans Tribune'),
-(251,'Yuzuya'),
-(252,'Youjo Sentai Loliconger'),
-(253,'Ego Dance'),
-(254,'MARIO ALMANAC'),
-(255,'Datsuryoku Kenkyuukai'),
-(256,'Aomori Ringo'),
-(257,'IrodoRIP'),
-(258,'ELEPHANT.GIRAFFE'),
-(259,'Calm Atmosphere'),
-(260,'Daiichi Yutakasou'),
-(261,'NOWHERE'),
-(262,'Negishiomeron'),
-(263,'Yuunagi no Senryokugai Butai'),
-(264,'Echo View'),
-(265,'Magenta Rose'),
-(266,'Goma Brothers'),
-(267,'Onsoku Ebifly'),
-(268,'Akiba Maou'),
-(269,'Herohero Hospital'),
-(270,'Majimadou'),
-(271,'serious graphics'),
-(272,'Team Harenchi'),
-(273,'Konnyaku Nabe'),
-(274,'Senya Sabou'),
-(275,'trump'),
-(276,'Kamukamu!'),
-(277,'Sigma-Arts'),
-(278,'Doronuma Kyoudai'),
-(279,'21kg'),
-(280,'Tobihizageri'),
-(281,'Endless Requiem'),
-(282,'dix-sept'),
-(283,'Efuya'),
-(284,'AHOBAKA'),
-(285,'Obumanjuu'),
-(286,'TRY&Hougen Futari Shakai'),
-(287,'CreSpirit'),
-(288,'Ikameshi Shokudou'),
-(289,'Yukikagerou'),
-(290,'Akapenguin'),
-(291,'Celluloid-Acme'),
-(292,'Nippatsu Shika Ataranai'),
-(293,'.7'),
-(294,'Aoirokanata'),
-(295,'Sukoyaka Collagen'),
-(296,'A・S・G Group'),
-(297,'Cool Kyou Dai San Shibu'),
-(298,'Dangan Honey'),
-(299,'SHAY-CONE'),
-(300,'Squeeze Candy Heaven'),
-(301,'Futonton'),
-(302,'MOON RULER'),
-(303,'Daizu'),
-(304,'Manzokudou'),
-(305,'Hoyoyodou'),
-(306,'Totsugasa'),
-(307,'Neko-bus Tei'),
-(308,'Kamoshireya'),
-(309,'Morimori Runrun'),
-(310,'Kurohiko'),
-(311,'Kedama Gyuunyuu'),
-(312,'Wolkenkratzer'),
-(313,'SERVICE BOY'),
-(314,'Higuma-ya'),
-(315,'Jukujuku Juvenile'),
-(316,'DangerouS ThoughtS'),
-(317,'Ring Memo'),
-(318,'SGPT'),
-(319,'Potato Salad'),
-(320,'Jet-Black Baselarde'),
-(321,'Ani ga Saru'),
-(322,'Modae Tei'),
-(323,'Tactical Notes'),
-(324,'Illumination.'),
-(325,'Wokasiya'),
-(326,'Tamakiya'),
-(327,'Kuromisakaijou'),
-(328,'Mada Maniau Kamo'),
-(329,'Rocket Chousashitsu'),
-(330,'Satellites'),
-(331,'Nipponbashi Dennougumi'),
-(332,'carbonate'),
-(333,'Mix Fry'),
-(334,'Midnight Muumus'),
-(335,'Anmitsuyomogitei'),
-(336,'WIREFRAME'),
-(337,'Nekonokone'),
-(338,'Nanbou Hitogakushiki'),
-(339,'Hanairogaeru'),
-(340,'Crazy9'),
-(341,'Kodomo Beer'),
-(342,'Kissyoudo'),
-(343,'HECHOCHO'),
-(344,'odin'),
-(345,'C.N.P'),
-(346,'Ahemaru'),
-(347,'Armament Calcium'),
-(348,'YuKi-IRo'),
-(349,'Ueninarumikan'),
-(350,'L5EX'),
-(351,'Super Ichigo-chan'),
-(352,'OrangeMaru'),
-(353,'Tamokuteki Hall'),
-(354,'Circle Eden'),
-(355,'Gessyu'),
-(356,'Inu to Kotatsu'),
-(357,'Kyougetsutei'),
-(358,'Nazunaya Honpo'),
-(359,'Zetsubou Shiromuji'),
-(360,'KAMINENDO.CORP'),
-(361,'Asaiumi'),
-(362,'Abarenbow Tengu'),
-(363,'Isada-ke'),
-(364,'G-panda'),
-(365,'Takane no Hanazono'),
-(366,'Cotton100%'),
-(367,'Haitoku Sensei'),
-(368,'DUAL BEAT'),
-(369,'Entelekheia'),
-(370,'Ririo Gatto'),
-(371,'Nanatsu no Kagiana'),
-(372,'condiment moderately'),
-(373,'Area14'),
-(374,'Handful☆Happiness!'),
-(375,'Tori no Sanpomichi'),
-(376,'Yashiya'),
-(377,'Ranshi to Kimi to'),
-(378,'Garland'),
-(379,'Circle Nuruma-ya'),
-(380,'Funi Funi Lab'),
-(381,'Awatake'),
-(382,'Moenai Gomi Bukuro'),
-(383,'Saiga Dou'),
-(384,'Electric_Dragon'),
-(385,'B.B.T.T.'),
-(386,'M-ya'),
-(387,'Tamanokoshi'),
-(388,'Haruharutei'),
-(389,'Ichinose'),
-(390,'Quick Kick Lee'),
-(391,'Akusei-Shinseibutsu'),
-(392,'Zenmai Kourogi'),
-(393,'nounanka'),
-(394,'50on!'),
-(395,'Akausagi'),
-(396,'Kyockchokyock'),
-(397,'Commamion'),
-(398,'Makino Eki'),
-(399,'pooca'),
-(400,'Muchakai'),
-(401,'Mariana Kaikou Kikaku'),
-(402,'Kyokutou Koumuten'),
-(403,'Mikan Dou'),
-(404,'ROCK CLIME'),
-(405,'E-lse'),
-(406,'Uruujima'),
-(407,'Cyclone'),
-(408,'Idenshi no Fune'),
-(409,'Studio Paya'),
-(410,'Great Akuta'),
-(411,'Roubai-tei'),
-(412,'Hardblush'),
-(413,'Shiroi Shinoshino'),
-(414,'Klotski'),
-(415,'SOUND MILK'),
-(416,'Sugahouse'),
-(417,'Dai 6 Kichi'),
-(418,'Hiatari Ryoukou / Toudori no Su'),
-(419,'Tanuking Sleep'),
-(420,'Marked-two'),
-(421,'Fuketsudan'),
-(422,'Ofuton de Suyaa'),
-(423,'Metro Notes'),
-(424,'T-NORTH'),
-(425,'Kuragamo'),
-(426,'Kimagu Restaurant'),
-(427,'Hayo-Cinema'),
-(428,'Yonsai Books'),
-(429,'PLANT'),
-(430,'Rojiurakan'),
-(431,'Hirani'),
-(432,'Kodoku Intelligence'),
-(433,'AMP'),
-(434,'Sheepfold'),
-(435,'Attamaro.'),
-(436,'Wata 120 Percent'),
-(437,'Inran Shounen'),
-(438,'Kemono Ekaki no Kousoku 2'),
-(439,'Tsukiguni'),
-(440,'ZUZUZU'),
-(441,'Behind Moon'),
-(442,'40010 1-GO'),
-(443,'Galley'),
-(444,'Nyankone'),
-(445,'Chocolate Synapse'),
-(446,'Surume Milk'),
-(447,'CotesDeNoix'),
-(448,'Souchou Bazooka'),
-(449,'Oregun'),
-(450,'Kamepotel'),
-(451,'BISMARCHO!'),
-(452,'HYLOISM'),
-(453,'heavenLy'),
-(454,'Yaki Tomahawk Steak'),
-(455,'M'),
-(456,'INFINITY DRIVE'),
-(457,'Rafflesia'),
-(458,'Danball Man'),
-(459,'AMR'),
-(460,'Goromenz'),
-(461,'AXZ'),
-(462,'HEADROOM'),
-(463,'HMA'),
-(464,'Milky Paint'),
-(465,'Magic Fortune Hachioujiten'),
-(466,'Enuma Elish'),
-(467,'Sorabatake'),
-(468,'Kankyokusetsu'),
-(469,'MegaSoundOrchestra'),
-(470,'Calpis Koubou'),
-(471,'Yomosugara'),
-(472,'Gouon'),
-(473,'ENNUI'),
-(474,'ORICOMPLEX'),
-(475,'Nurebairo'),
-(476,'Neko wa Manma ga Utsukushii'),
-(477,'Watanuki Shinguten'),
-(478,'Crips'),
-(479,'Golden Zombie'),
-(480,'Rock Steady'),
-(481,'Eromazun'),
-(482,'antyuumosaku'),
-(483,'MC'),
-(484,'Nacchuushou'),
-(485,'Nyankoromochimochi'),
-(486,'A-WALKs'),
-(487,'Bear Hand'),
-(488,'Horsetail'),
-(489,'In The Sky'),
-(490,'Mousou Engine'),
-(491,'Nakayohi Mogudan'),
-(492,'WLHO'),
-(493,'SHIS'),
-(494,'Kanten Jigenryuu'),
-(495,'Haikibutsu'),
-(496,'Rokumarusou'),
-(497,'Suzuki Dogezaemon'),
-(498,'Cat Food'),
-(499,'Amulai Sweet Factory'),
-(500,'Mugenya Honpo'),
-(501,'Kotoshiki'),
-(502,'Kuwaikuwa'),
-(503,'NAVY'),
-(504,'MonsieuR'),
-(505,'Nekoyashiki'),
-(506,'crossray'),
-(507,'Matsunoan'),
-(508,'Kaientai'),
-(509,'Side Buy Side'),
-(510,'Naruho-dou'),
-(511,'Kashiwa-ya'),
-(512,'Puppukupu'),
-(513,'0-PARTS'),
-(514,'broccoholic'),
-(515,'Nanairo Shichihenge'),
-(516,'L.G.C.'),
-(517,'Izanagi'),
-(518,'Brand Nyu'),
-(519,'Oneekyou'),
-(520,'H.B.A'),
-(521,'Camrism'),
-(522,'Itoh Kani'),
-(523,'Vanilla Type'),
-(524,'Maruiro Kikou'),
-(525,'Ashima Sandou'),
-(526,'SAZ'),
-(527,'Kureura Seisakujo'),
-(528,'pink-noise'),
-(529,'Usamimi Syndrome'),
-(530,'ParadiseGom'),
-(531,'Yuzuponz'),
-(532,'Magono-Tei'),
-(533,'Carburetor'),
-(534,'Semimogura'),
-(535,'GreenHouse'),
-(536,'Tanic Ya'),
-(537,'Starmine18'),
-(538,'ONEGROSS'),
-(539,'Mizuwari Neko'),
-(540,'Tuzi Laoda'),
-(541,'ONEONE1'),
-(542,'Mahjong Yugen Co. Ltd 58'),
-(543,'Momoiro-Rip'),
-(544,'Chinchintei'),
-(545,'Tokyo Tsunamushi Land'),
-(546,'popin''rabbit'),
-(547,'Gachinko Shobou'),
-(548,'Arutana'),
-(549,'Fujiya'),
-(550,'Nekomataya'),
-(551,'Aokihoshi'),
-(552,'Asatsuki Dou'),
-(553,'AZASUKE WIND'),
-(554,'Forever and ever...'),
-(555,'U-RaL'),
-(556,'Buttyakedo'),
-(557,'Lemon Cake'),
-(558,'Hi-PER PINCH'),
-(559,'Meshikutteneru.'),
-(560,'Juna Juna Juice'),
-(561,'Juicebox Koujou'),
-(562,'Umikaidou'),
-(563,'High-Spirit'),
-(564,'ATTIC WORK SPACE'),
-(565,'Alkaloid no Baketu'),
-(566,'wakamaker'),
-(567,'Hidebou House'),
-(568,'Kuzuya'),
-(569,'Uradoori no Nukemichi'),
-(570,'Kamaros'),
-(571,'Denkishiki'),
-(572,'Flock Blue'),
-(573,'CLUTCH SHOT KING'),
-(574,'Sekigaiken'),
-(575,'Tottoko Mtarou'),
-(576,'NIGHT FUCKERS'),
-(577,'life'),
-(578,'Digital Flyer'),
-(579,'Geosiphon'),
-(580,'Asaki Blog Branch Office'),
-(581,'F.W.ZHolic'),
-(582,'Oboro and Tempo Gensui Dou'),
-(583,'Hitsuji Kikaku'),
-(584,'B:side'),
-(585,'K.F.D.'),
-(586,'RIN'),
-(587,'Yuunabe Shinkouchuu'),
-(588,'Execio'),
-(589,'Kokoro Metro'),
-(590,'Zensoku Rider'),
-(591,'Spiral Brain'),
-(592,'IRON GRIMOIRE'),
-(593,'mi'),
-(594,'TSF no F'),
-(595,'AKYS Honpo'),
-(596,'Shironegiya'),
-(597,'Shikoneru Mix'),
-(598,'110-GROOVE'),
-(599,'Shichimen Soka'),
-(600,'Takemasaya'),
-(601,'Shikkoku no Voltecker'),
-(602,'NOTONE'),
-(603,'Itou Life'),
-(604,'ASTRONOMY'),
-(605,'Kuroneko Aka Ribbon'),
-(606,'Taikan Kyohougumi'),
-(607,'Matagitei'),
-(608,'Bizensiki Roroppu'),
-(609,'CrowView'),
-(610,'Fugudoku'),
-(611,'Hito no Fundoshi'),
-(612,'Namakemono Kishidan'),
-(613,'Circle Roman Hikou'),
-(614,'Bottle Ship Bottler'),
-(615,'BKG'),
-(616,'GREONE'),
-(617,'Shiawase Kanmiryou'),
-(618,'Dr.Vermilion'),
-(619,'Fugodoku'),
-(620,'Maron ☆ Maron'),
-(621,'Shimapan'),
-(622,'Zandaka-77yen'),
-(623,'DEAR LIFE'),
-(624,'Kabayakiya'),
-(625,'Danekoya Gunekodou'),
-(626,'Temple Knights'),
-(627,'Fukutsuu Okosu'),
-(628,'Kuronisiki'),
-(629,'Hybrid Jimushitsu'),
-(630,'Noraya'),
-(631,'Mikezoutei'),
-(632,'Arakiya-san'),
-(633,'lionoil'),
-(634,'Tokage Juukou'),
-(635,'Izakaya Yocchan'),
-(636,'Darumasan Koronda'),
-(637,'@mousse'),
-(638,'Urakaryuu'),
-(639,'Triangle!'),
-(640,'Chinjao Girl.'),
-(641,'zero-sen'),
-(642,'P:P'),
-(643,'Fleur 9 pri'),
-(644,'Sora wa Chimidoro'),
-(645,'studio A'),
-(646,'Mimoneland'),
-(647,'Otukimi Koubo'),
-(648,'telomereNA'),
-(649,'Gentsuki Okiba'),
-(650,'Kitsune to Budou'),
-(651,'UROBOROS'),
-(652,'Shiashiya'),
-(653,'Aiwa'),
-(654,'REI''S ROOM'),
-(655,'Sweets Planet'),
-(656,'J.D.World'),
-(657,'BAKA to HASA me'),
-(658,''),
-(659,'MIX-EDGE'),
-(660,'Mugenkidou A'),
-(661,'Hizatora'),
-(662,'Unizo'),
-(663,'Esebateira'),
-(664,'shakestyle'),
-(665,'North70'),
-(666,'Yohsyuan'),
-(667,'Anko ni Gohan'),
-(668,'BONjin'),
-(669,'BlueMage'),
-(670,'Amazake Hatosyo-ten'),
-(671,'EXTENDED PART'),
-(672,'Oshiruko Kan'),
-(673,'Furansowa'),
-(674,'Ninokoya'),
-(675,'Shallot Coco'),
-(676,'MoonPhase'),
-(677,'Cow Lipid'),
-(678,'Apocrine.'),
-(679,'Ponpharse'),
-(680,'Primal Gym'),
-(681,'Bad End RST'),
-(682,'cc'),
-(683,'Berry!16'),
-(684,'HighDrug'),
-(685,'Amamitu Hakushi'),
-(686,'SOLID AIR'),
-(687,'AGOITEI'),
-(688,'Urasazan'),
-(689,'Hy-dou'),
-(690,'GALAXY STYLE'),
-(691,'Nikuniku Italian'),
-(692,'X-TEI'),
-(693,'CHIN-UP'),
-(694,'Uguisuya'),
-(695,'Hiramani'),
-(696,'Ichibocchi'),
-(697,'PilotStar'),
-(698,'Rideshion'),
-(699,'Lunacy'),
-(700,'Shin Hijiridou Honpo'),
-(701,'Road map'),
-(702,'Studio Zealot'),
-(703,'Anegaoka Sanchoume'),
-(704,'Tonpuuratei'),
-(705,'Mysp5cm'),
-(706,'Team Koinaka'),
-(707,'185 Souko'),
-(708,'Tamafuwa'),
-(709,'Moco Chouchou'),
-(710,'MARUTA Production'),
-(711,'Kaki no Tane'),
-(712,'Aigamodou'),
-(713,'Kazuya'),
-(714,'Studio N.BALL'),
-(715,'Shoujo Gesshoku'),
-(716,'Draw Go'),
-(717,'Pikorin!'),
-(718,'ARKADIA'),
-(719,'Hibon'),
-(720,'Aozora Shoujo'),
-(721,'Tekokids'),
-(722,'Shinnihon Pepsitou'),
-(723,'Imomaru'),
-(724,'HellDevice'),
-(725,'Gambler Club'),
-(726,'CELTRANCE'),
-(727,'Koban Dou'),
-(728,'Cyclo-'),
-(729,'Kabushikigaisha Toranoana'),
-(730,'Megabox'),
-(731,'Monmo Bokujou'),
-(732,'Auroramix'),
-(733,'Akuheki'),
-(734,'hlz'),
-(735,'Ikasumiya'),
-(736,'Candy Pop'),
-(737,'CHIBIKKO KINGDOM'),
-(738,'YtoH2'),
-(739,'Fukazume Kizoku'),
-(740,'Happiness Milk'),
-(741,'Shijou Misaki'),
-(742,'Noblegene'),
-(743,'ManiacStreet'),
-(744,'Batten Kariba'),
-(745,'Labomagi!'),
-(746,'OTOGIYA X-9'),
-(747,'pinvise'),
-(748,'Suzune Rai Chikashitsu'),
-(749,'Rapurando'),
-(750,'Katou Suzuki'),
-(751,'Kaniya'),
-(752,'Jingai Makyou'),
-(753,'Hakusen'),
-(754,'Royal Bitch'),
-(755,'Yoshida Gorou Shoukai'),
-(756,'Nikomutoko'),
-(757,'Kaguya Hime Koubou'),
-(758,'Unagigoya'),
-(759,'Mangetsu Ujiya'),
-(760,'Blitzkrieg'),
-(761,'Knuckle Head'),
-(762,'Rokusyoku Mikan'),
-(763,'Kuroshiro Desire'),
-(764,'Himepuchitei'),
-(765,'Hisagoya'),
-(766,'Ikkizuka'),
-(767,'ZIGZAG'),
-(768,'Salt choc'),
-(769,'Chronicle'),
-(770,'Kikuya'),
-(771,'Dibi'),
-(772,'A''s Maria'),
-(773,'PULIN Nabe'),
-(774,'Iris art'),
-(775,'Utachan Honpo'),
-(776,'Genkei Yuugi'),
-(777,'Renaidou'),
-(778,'Ink Complex'),
-(779,'PigPanPan'),
-(780,'Kamikire Basami'),
-(781,'02'),
-(782,'Appetite'),
-(783,'7-Ban no Okimono'),
-(784,'Kilometer'),
-(785,'Sarugaso'),
-(786,'Seafox'),
-(787,'Bizen Dorobune Koubou');
+(1,'Majimeya',1),
+(2,'Yojouhan Shobou',2),
+(3,'Kasumi Eater',1),
+(4,'Kurohonyasan',2),
+(5,'EROQUIS!',4),
+(6,'Tiramisu Tart',1),
+(7,'Bomb Shelter',1),
+(8,'WindArTeam',1),
+(9,'Norakukari',1),
+(10,'Kocho Kocho Koukou',2),
+(11,'Temparing',8),
+(12,'UU-ZONE',4),
+(13,'Vadass',1),
+(14,'Morittokoke',2),
+(15,'Akuochisukii Kyoushitsu',2),
+(16,'Kinqhassin',1),
+(17,'Alice no Takarabako',24),
+(18,'ERECT TOUCH',2),
+(19,'Jabarand',2),
+(20,'Quartzshow',1),
+(21,'Ruu Kikaku',2),
+(22,'HEATWAVE',2),
+(23,'JACK-POT',8),
+(24,'Niikyuu',1),
+(25,'Hadairo Roobois Tea',1),
+(26,'ARC/TURBINE',1),
+(27,'Aoba Q Madou',5),
+(28,'Flying Chicken',1),
+(29,'Cheese Company',2),
+(30,'Fatalpulse',8),
+(31,'Karakishi Youhei-dan Shinga',5),
+(32,'Syunkan Saidaihusoku',1),
+(33,'Aneko no Techo',2),
+(34,'United States Netamecol',1),
+(35,'STUDIO TIAMAT',1),
+(36,'Ijimaya',2),
+(37,'Baraneko Yougashi-ten',2),
+(38,'Booch',7),
+(39,'TUKIBUTO',1),
+(40,'Ginjou Maggots',1),
+(41,'Gate of XIII',1),
+(42,'COMEX',1),
+(43,'Hachimitsu Romance',3),
+(44,'774 House',3),
+(45,'Once Only',1),
+(46,'Usubeniya',1),
+(47,'A Gokuburi',2),
+(48,'Selvage Fisheries',2),
+(49,'Rosetta Stone',2),
+(50,'NANIMOSHINAI',7),
+(51,'Ten no Katsuraya',2),
+(52,'Aimaitei',5),
+(53,'YA-ZY',2),
+(54,'Molossan',1),
+(55,'HBO',4),
+(56,'Yorando',2),
+(57,'Hanyan.',1),
+(58,'R*kaffy',6),
+(59,'Nightmare Express',1),
+(60,'Ishimura-ya',2),
+(61,'Sakekan Memorial',1),
+(62,'Ankoku Marimokan',1),
+(63,'SlapStickStrike',1),
+(64,'Yuasa Rengou',3),
+(65,'I-Raf-you',6),
+(66,'Rorinoutage',2),
+(67,'Athome Shuka',1),
+(68,'Pochi-Goya.',6),
+(69,'Xration',1),
+(70,'Amarini Senpaku!',1),
+(71,'Sasumata Seven',2),
+(72,'Kuroneko Smith',5),
+(73,'Ambivalence',1),
+(74,'Haraheridou',2),
+(75,'Lyricbox',1),
+(76,'Ichigosize',1),
+(77,'Jukusei Kakuzatou',4),
+(78,'Stemun',1),
+(79,'SAGasile',1),
+(80,'Kirintei',2),
+(81,'Cannabis',5),
+(82,'L.P.E.G.',1),
+(83,'Magetarudou',2),
+(84,'downbeat',1),
+(85,'Kaiki Nisshoku',1),
+(86,'Butagoya',2),
+(87,'Kunaboto',2),
+(88,'R.c.W.d',2),
+(89,'Milk Boy',1),
+(90,'MEAN MACHINE',2),
+(91,'Chirimozuku Cha',1),
+(92,'S.O.M',1),
+(93,'DIGITAL ACCEL WORKS',3),
+(94,'Mayoineko',3),
+(95,'Asgo',3),
+(96,'40Denier',6),
+(97,'NULL Mayu',2),
+(98,'WaToSaTo',3),
+(99,'Seniman Kartun',1),
+(100,'Ikaring',2),
+(101,'Manguri Cannon',2),
+(102,'NOSEBLEED',3),
+(103,'Stapspats',3),
+(104,'Takemama Iinkai',1),
+(105,'Umi no Sachi',2),
+(106,'Otaku Beam',6),
+(107,'Service Heaven',2),
+(108,'Water Drop',2),
+(109,'Platinum Label',1),
+(110,'gugumugu',1),
+(111,'Kakuzatou',1),
+(112,'Niku Drill',4),
+(113,'Ruki Ruki EXISS',1),
+(114,'Futanarun',2),
+(115,'Kakukonoka',3),
+(116,'Shouchuu MAC',2),
+(117,'ClownCulture',3),
+(118,'mega w',6),
+(119,'Spicy Loves Heaven',1),
+(120,'chunlieater',2),
+(121,'Katamari-ya',3),
+(122,'Penpengusa Club',1),
+(123,'Mugen@WORKS',2),
+(124,'Mitarashi Club',20),
+(125,'Kitsune',6),
+(126,'LemonMaiden',1),
+(127,'Can Do Now!',1),
+(128,'Zero Ni Kaeru Tsuki',1),
+(129,'Bourgeois Ice Cream',1),
+(130,'Tendou',1),
+(131,'uraya',2),
+(132,'Yokohama Junky',12),
+(133,'Karuwani',2),
+(134,'Viento Campanilla',2),
+(135,'Mochi-ya',1),
+(136,'drill''n girl',3),
+(137,'SIRIUS.',1),
+(138,'Motsu Ryouri',6),
+(139,'Ozashiki',5),
+(140,'Aodouhu',8),
+(141,'Pish Lover',14),
+(142,'DOZA Village',3),
+(143,'Aroma Gaeru',3),
+(144,'DT Koubou',2),
+(145,'Ringo Gakuen',4),
+(146,'Finecraft69',1),
+(147,'Nagaredamaya',2),
+(148,'chocolate Lv.5',2),
+(149,'Desk Drawer',1),
+(150,'Hannama',1),
+(151,'IndexACG',1),
+(152,'Hyakki Yakou',1),
+(153,'V-SLASH',2),
+(154,'Mine Noujou',3),
+(155,'Mesu Gorilla.',1),
+(156,'Neutral Boy',1),
+(157,'Double Deck Seisakujo',1),
+(158,'BLAZE',3),
+(159,'Arsenothelus',26),
+(160,'Insert',5),
+(161,'Niku Ringo',7),
+(162,'Studio Rakkyou',1),
+(163,'Nine''s Graphics',1),
+(164,'Inariya',7),
+(165,'Gujira 4 Gou',6),
+(166,'Memeya',4),
+(167,'NCP',2),
+(168,'nWa',2),
+(169,'Wisteria',1),
+(170,'99mg',1),
+(171,'Zenra QQ',6),
+(172,'Saigado',6),
+(173,'Syumatsusyorijou',1),
+(174,'Aomizuan',4),
+(175,'SHD',2),
+(176,'Granada Sky',9),
+(177,'Yadokugaeru',4),
+(178,'Tonikaku',1),
+(179,'Diogenes Club',5),
+(180,'Nanakorobi Yaoki',2),
+(181,'Rorororomo',1),
+(182,'Musashi-Dou',8),
+(183,'Nyuu Koubou',1),
+(184,'Cr-R',1),
+(185,'Shoot The Moon',5),
+(186,'Sakusaku Kangen Noushuku',1),
+(187,'Dodo Fuguri',9),
+(188,'Daihonei',2),
+(189,'Kakumei Seifu Kouhoushitsu',1),
+(190,'Mebius no Wa',1),
+(191,'Nounanka Sedai',1),
+(192,'San Se Fang',1),
+(193,'Bundosuiko',2),
+(194,'brilliant thunder',1),
+(195,'Chotto Dake Aruyo',3),
+(196,'Sengoku Joketsu Emaki',5),
+(197,'"Tsu" ga Mittsu',1),
+(198,'EIGHT BEAT',4),
+(199,'CHINZURI BOP',2),
+(200,'Deastim',1),
+(201,'Waterwheel',1),
+(202,'High Fly Flow',1),
+(203,'Yuugengaisha Mach Spin',1),
+(204,'Kinokoya(Kari)',1),
+(205,'Jinsukeya',1),
+(206,'Azi Dahaka',1),
+(207,'Bakuretsu Fusen',2),
+(208,'Porika',1),
+(209,'Umasugiyu',1),
+(210,'Atelier Dr.HEAD''S',4),
+(211,'BRIO',3),
+(212,'candy paddle',8),
+(213,'Honey QP',4),
+(214,'Tateyoko Issen',2),
+(215,'Maltese',3),
+(216,'dameningen+',2),
+(217,'Tamago No Kara',2),
+(218,'Kiyokawa Zaidan',1),
+(219,'ROJIURA JACK',1),
+(220,'Happouvijin',3),
+(221,'Torano Ori',1),
+(222,'spermation',1),
+(223,'Kaiten Sommelier',3),
+(224,'PIANIISHIMO',2),
+(225,'LongHornTrain',1),
+(226,'Erotibot',1),
+(227,'Akatsuki Katsuie no Circle',2),
+(228,'DA HOOTCH',2),
+(229,'Drill Biyori',1),
+(230,'Sanbaizu',1),
+(231,'Suginami Sakura',1),
+(232,'nul_Neverland',5),
+(233,'TETRODOTOXIN',1),
+(234,'Shotaian',5),
+(235,'Hinahara Yashiki',1),
+(236,'Mesuman Teikoku',2),
+(237,'Inarizushi',3),
+(238,'Akaeboshi',5),
+(239,'SoundVillage',5),
+(240,'Jisyakunyudo',1),
+(241,'Seki Sabato',5),
+(242,'Kudamono Monogatari',1),
+(243,'Shinsei Lolishota',3),
+(244,'Plateau Soft',1),
+(245,'Kuromisa Kaijou',2),
+(246,'Nanairo Koubou',3),
+(247,'Kome Nouka',3),
+(248,'Minmin',1),
+(249,'Fullswing Otome',1),
+(250,'Trans Tribune',2),
+(251,'Yuzuya',1),
+(252,'Youjo Sentai Loliconger',1),
+(253,'Ego Dance',2),
+(254,'MARIO ALMANAC',2),
+(255,'Datsuryoku Kenkyuukai',3),
+(256,'Aomori Ringo',1),
+(257,'IrodoRIP',1),
+(258,'ELEPHANT.GIRAFFE',2),
+(259,'Calm Atmosphere',2),
+(260,'Daiichi Yutakasou',1),
+(261,'NOWHERE',1),
+(262,'Negishiomeron',1),
+(263,'Yuunagi no Senryokugai Butai',4),
+(264,'Echo View',1),
+(265,'Magenta Rose',1),
+(266,'Goma Brothers',2),
+(267,'Onsoku Ebifly',3),
+(268,'Akiba Maou',1),
+(269,'Herohero Hospital',2),
+(270,'Majimadou',2),
+(271,'serious graphics',1),
+(272,'Team Harenchi',1),
+(273,'Konnyaku Nabe',8),
+(274,'Senya Sabou',2),
+(275,'trump',4),
+(276,'Kamukamu!',3),
+(277,'Sigma-Arts',1),
+(278,'Doronuma Kyoudai',1),
+(279,'21kg',1),
+(280,'Tobihizageri',3),
+(281,'Endless Requiem',2),
+(282,'dix-sept',1),
+(283,'Efuya',1),
+(284,'AHOBAKA',3),
+(285,'Obumanjuu',5),
+(286,'TRY&Hougen Futari Shakai',2),
+(287,'CreSpirit',1),
+(288,'Ikameshi Shokudou',2),
+(289,'Yukikagerou',2),
+(290,'Akapenguin',2),
+(291,'Celluloid-Acme',1),
+(292,'Nippatsu Shika Ataranai',1),
+(293,'.7',1),
+(294,'Aoirokanata',1),
+(295,'Sukoyaka Collagen',1),
+(296,'A・S・G Group',2),
+(297,'Cool Kyou Dai San Shibu',1),
+(298,'Dangan Honey',3),
+(299,'SHAY-CONE',2),
+(300,'Squeeze Candy Heaven',4),
+(301,'Futonton',1),
+(302,'MOON RULER',1),
+(303,'Daizu',1),
+(304,'Manzokudou',1),
+(305,'Hoyoyodou',5),
+(306,'Totsugasa',1),
+(307,'Neko-bus Tei',1),
+(308,'Kamoshireya',1),
+(309,'Morimori Runrun',1),
+(310,'Kurohiko',6),
+(311,'Kedama Gyuunyuu',2),
+(312,'Wolkenkratzer',2),
+(313,'SERVICE BOY',3),
+(314,'Higuma-ya',1),
+(315,'Jukujuku Juvenile',1),
+(316,'DangerouS ThoughtS',1),
+(317,'Ring Memo',3),
+(318,'SGPT',5),
+(319,'Potato Salad',6),
+(320,'Jet-Black Baselarde',1),
+(321,'Ani ga Saru',1),
+(322,'Modae Tei',1),
+(323,'Tactical Notes',1),
+(324,'Illumination.',1),
+(325,'Wokasiya',1),
+(326,'Tamakiya',2),
+(327,'Kuromisakaijou',1),
+(328,'Mada Maniau Kamo',3),
+(329,'Rocket Chousashitsu',3),
+(330,'Satellites',3),
+(331,'Nipponbashi Dennougumi',1),
+(332,'carbonate',1),
+(333,'Mix Fry',1),
+(334,'Midnight Muumus',1),
+(335,'Anmitsuyomogitei',1),
+(336,'WIREFRAME',1),
+(337,'Nekonokone',1),
+(338,'Nanbou Hitogakushiki',2),
+(339,'Hanairogaeru',1),
+(340,'Crazy9',1),
+(341,'Kodomo Beer',2),
+(342,'Kissyoudo',1),
+(343,'HECHOCHO',1),
+(344,'odin',1),
+(345,'C.N.P',2),
+(346,'Ahemaru',1),
+(347,'Armament Calcium',1),
+(348,'YuKi-IRo',2),
+(349,'Ueninarumikan',1),
+(350,'L5EX',1),
+(351,'Super Ichigo-chan',2),
+(352,'OrangeMaru',4),
+(353,'Tamokuteki Hall',1),
+(354,'Circle Eden',2),
+(355,'Gessyu',1),
+(356,'Inu to Kotatsu',2),
+(357,'Kyougetsutei',1),
+(358,'Nazunaya Honpo',1),
+(359,'Zetsubou Shiromuji',4),
+(360,'KAMINENDO.CORP',2),
+(361,'Asaiumi',1),
+(362,'Abarenbow Tengu',1),
+(363,'Isada-ke',1),
+(364,'G-panda',1),
+(365,'Takane no Hanazono',1),
+(366,'Cotton100%',1),
+(367,'Haitoku Sensei',5),
+(368,'DUAL BEAT',1),
+(369,'Entelekheia',1),
+(370,'Ririo Gatto',2),
+(371,'Nanatsu no Kagiana',7),
+(372,'condiment moderately',1),
+(373,'Area14',1),
+(374,'Handful☆Happiness!',3),
+(375,'Tori no Sanpomichi',1),
+(376,'Yashiya',1),
+(377,'Ranshi to Kimi to',2),
+(378,'Garland',1),
+(379,'Circle Nuruma-ya',1),
+(380,'Funi Funi Lab',7),
+(381,'Awatake',1),
+(382,'Moenai Gomi Bukuro',1),
+(383,'Saiga Dou',1),
+(384,'Electric_Dragon',1),
+(385,'B.B.T.T.',1),
+(386,'M-ya',1),
+(387,'Tamanokoshi',2),
+(388,'Haruharutei',2),
+(389,'Ichinose',1),
+(390,'Quick Kick Lee',2),
+(391,'Akusei-Shinseibutsu',1),
+(392,'Zenmai Kourogi',15),
+(393,'nounanka',1),
+(394,'50on!',2),
+(395,'Akausagi',3),
+(396,'Kyockchokyock',2),
+(397,'Commamion',1),
+(398,'Makino Eki',1),
+(399,'pooca',1),
+(400,'Muchakai',1),
+(401,'Mariana Kaikou Kikaku',1),
+(402,'Kyokutou Koumuten',2),
+(403,'Mikan Dou',4),
+(404,'ROCK CLIME',1),
+(405,'E-lse',4),
+(406,'Uruujima',1),
+(407,'Cyclone',1),
+(408,'Idenshi no Fune',2),
+(409,'Studio Paya',1),
+(410,'Great Akuta',3),
+(411,'Roubai-tei',1),
+(412,'Hardblush',3),
+(413,'Shiroi Shinoshino',1),
+(414,'Klotski',1),
+(415,'SOUND MILK',8),
+(416,'Sugahouse',1),
+(417,'Dai 6 Kichi',1),
+(418,'Hiatari Ryoukou / Toudori no Su',3),
+(419,'Tanuking Sleep',2),
+(420,'Marked-two',4),
+(421,'Fuketsudan',1),
+(422,'Ofuton de Suyaa',1),
+(423,'Metro Notes',2),
+(424,'T-NORTH',2),
+(425,'Kuragamo',2),
+(426,'Kimagu Restaurant',1),
+(427,'Hayo-Cinema',3),
+(428,'Yonsai Books',2),
+(429,'PLANT',2),
+(430,'Rojiurakan',1),
+(431,'Hirani',1),
+(432,'Kodoku Intelligence',3),
+(433,'AMP',3),
+(434,'Sheepfold',1),
+(435,'Attamaro.',1),
+(436,'Wata 120 Percent',1),
+(437,'Inran Shounen',1),
+(438,'Kemono Ekaki no Kousoku 2',1),
+(439,'Tsukiguni',1),
+(440,'ZUZUZU',1),
+(441,'Behind Moon',1),
+(442,'40010 1-GO',2),
+(443,'Galley',2),
+(444,'Nyankone',2),
+(445,'Chocolate Synapse',1),
+(446,'Surume Milk',1),
+(447,'CotesDeNoix',1),
+(448,'Souchou Bazooka',1),
+(449,'Oregun',1),
+(450,'Kamepotel',1),
+(451,'BISMARCHO!',1),
+(452,'HYLOISM',1),
+(453,'heavenLy',1),
+(454,'Yaki Tomahawk Steak',1),
+(455,'M',1),
+(456,'INFINITY DRIVE',1),
+(457,'Rafflesia',1),
+(458,'Danball Man',4),
+(459,'AMR',1),
+(460,'Goromenz',1),
+(461,'AXZ',1),
+(462,'HEADROOM',1),
+(463,'HMA',1),
+(464,'Milky Paint',1),
+(465,'Magic Fortune Hachioujiten',1),
+(466,'Enuma Elish',2),
+(467,'Sorabatake',4),
+(468,'Kankyokusetsu',1),
+(469,'MegaSoundOrchestra',1),
+(470,'Calpis Koubou',1),
+(471,'Yomosugara',1),
+(472,'Gouon',1),
+(473,'ENNUI',2),
+(474,'ORICOMPLEX',1),
+(475,'Nurebairo',1),
+(476,'Neko wa Manma ga Utsukushii',1),
+(477,'Watanuki Shinguten',1),
+(478,'Crips',2),
+(479,'Golden Zombie',1),
+(480,'Rock Steady',1),
+(481,'Eromazun',2),
+(482,'antyuumosaku',1),
+(483,'MC',1),
+(484,'Nacchuushou',1),
+(485,'Nyankoromochimochi',1),
+(486,'A-WALKs',1),
+(487,'Bear Hand',1),
+(488,'Horsetail',3),
+(489,'In The Sky',4),
+(490,'Mousou Engine',2),
+(491,'Nakayohi Mogudan',4),
+(492,'WLHO',1),
+(493,'SHIS',1),
+(494,'Kanten Jigenryuu',1),
+(495,'Haikibutsu',1),
+(496,'Rokumarusou',1),
+(497,'Suzuki Dogezaemon',1),
+(498,'Cat Food',2),
+(499,'Amulai Sweet Factory',1),
+(500,'Mugenya Honpo',1),
+(501,'Kotoshiki',2),
+(502,'Kuwaikuwa',1),
+(503,'NAVY',1),
+(504,'MonsieuR',3),
+(505,'Nekoyashiki',1),
+(506,'crossray',1),
+(507,'Matsunoan',1),
+(508,'Kaientai',2),
+(509,'Side Buy Side',1),
+(510,'Naruho-dou',3),
+(511,'Kashiwa-ya',1),
+(512,'Puppukupu',1),
+(513,'0-PARTS',1),
+(514,'broccoholic',1),
+(515,'Nanairo Shichihenge',1),
+(516,'L.G.C.',3),
+(517,'Izanagi',1),
+(518,'Brand Nyu',1),
+(519,'Oneekyou',1),
+(520,'H.B.A',1),
+(521,'Camrism',1),
+(522,'Itoh Kani',1),
+(523,'Vanilla Type',1),
+(524,'Maruiro Kikou',1),
+(525,'Ashima Sandou',2),
+(526,'SAZ',2),
+(527,'Kureura Seisakujo',1),
+(528,'pink-noise',10),
+(529,'Usamimi Syndrome',1),
+(530,'ParadiseGom',1),
+(531,'Yuzuponz',1),
+(532,'Magono-Tei',1),
+(533,'Carburetor',1),
+(534,'Semimogura',5),
+(535,'GreenHouse',1),
+(536,'Tanic Ya',1),
+(537,'Starmine18',1),
+(538,'ONEGROSS',1),
+(539,'Mizuwari Neko',3),
+(540,'Tuzi Laoda',2),
+(541,'ONEONE1',4),
+(542,'Mahjong Yugen Co. Ltd 58',2),
+(543,'Momoiro-Rip',1),
+(544,'Chinchintei',1),
+(545,'Tokyo Tsunamushi Land',1),
+(546,'popin''rabbit',6),
+(547,'Gachinko Shobou',1),
+(548,'Arutana',1),
+(549,'Fujiya',1),
+(550,'Nekomataya',1),
+(551,'Aokihoshi',1),
+(552,'Asatsuki Dou',1),
+(553,'AZASUKE WIND',1),
+(554,'Forever and ever...',1),
+(555,'U-RaL',1),
+(556,'Buttyakedo',1),
+(557,'Lemon Cake',1),
+(558,'Hi-PER PINCH',1),
+(559,'Meshikutteneru.',2),
+(560,'Juna Juna Juice',2),
+(561,'Juicebox Koujou',1),
+(562,'Umikaidou',1),
+(563,'High-Spirit',1),
+(564,'ATTIC WORK SPACE',1),
+(565,'Alkaloid no Baketu',1),
+(566,'wakamaker',4),
+(567,'Hidebou House',1),
+(568,'Kuzuya',1),
+(569,'Uradoori no Nukemichi',1),
+(570,'Kamaros',1),
+(571,'Denkishiki',1),
+(572,'Flock Blue',1),
+(573,'CLUTCH SHOT KING',1),
+(574,'Sekigaiken',1),
+(575,'Tottoko Mtarou',2),
+(576,'NIGHT FUCKERS',1),
+(577,'life',1),
+(578,'Digital Flyer',1),
+(579,'Geosiphon',1),
+(580,'Asaki Blog Branch Office',2),
+(581,'F.W.ZHolic',1),
+(582,'Oboro and Tempo Gensui Dou',1),
+(583,'Hitsuji Kikaku',2),
+(584,'B:side',4),
+(585,'K.F.D.',1),
+(586,'RIN',1),
+(587,'Yuunabe Shinkouchuu',1),
+(588,'Execio',2),
+(589,'Kokoro Metro',1),
+(590,'Zensoku Rider',1),
+(591,'Spiral Brain',7),
+(592,'IRON GRIMOIRE',1),
+(593,'mi',1),
+(594,'TSF no F',1),
+(595,'AKYS Honpo',1),
+(596,'Shironegiya',1),
+(597,'Shikoneru Mix',2),
+(598,'110-GROOVE',2),
+(599,'Shichimen Soka',1),
+(600,'Takemasaya',1),
+(601,'Shikkoku no Voltecker',3),
+(602,'NOTONE',1),
+(603,'Itou Life',1),
+(604,'ASTRONOMY',2),
+(605,'Kuroneko Aka Ribbon',5),
+(606,'Taikan Kyohougumi',1),
+(607,'Matagitei',1),
+(608,'Bizensiki Roroppu',1),
+(609,'CrowView',1),
+(610,'Fugudoku',4),
+(611,'Hito no Fundoshi',1),
+(612,'Namakemono Kishidan',1),
+(613,'Circle Roman Hikou',1),
+(614,'Bottle Ship Bottler',1),
+(615,'BKG',1),
+(616,'GREONE',4),
+(617,'Shiawase Kanmiryou',1),
+(618,'Dr.Vermilion',1),
+(619,'Fugodoku',1),
+(620,'Maron ☆ Maron',1),
+(621,'Shimapan',2),
+(622,'Zandaka-77yen',1),
+(623,'DEAR LIFE',1),
+(624,'Kabayakiya',1),
+(625,'Danekoya Gunekodou',1),
+(626,'Temple Knights',2),
+(627,'Fukutsuu Okosu',1),
+(628,'Kuronisiki',2),
+(629,'Hybrid Jimushitsu',2),
+(630,'Noraya',1),
+(631,'Mikezoutei',1),
+(632,'Arakiya-san',1),
+(633,'lionoil',1),
+(634,'Tokage Juukou',2),
+(635,'Izakaya Yocchan',1),
+(636,'Darumasan Koronda',1),
+(637,'@mousse',1),
+(638,'Urakaryuu',1),
+(639,'Triangle!',2),
+(640,'Chinjao Girl.',1),
+(641,'zero-sen',2),
+(642,'P:P',1),
+(643,'Fleur 9 pri',1),
+(644,'Sora wa Chimidoro',2),
+(645,'studio A',1),
+(646,'Mimoneland',2),
+(647,'Otukimi Koubo',2),
+(648,'telomereNA',1),
+(649,'Gentsuki Okiba',1),
+(650,'Kitsune to Budou',1),
+(651,'UROBOROS',1),
+(652,'Shiashiya',1),
+(653,'Aiwa',1),
+(654,'REI''S ROOM',1),
+(655,'Sweets Planet',1),
+(656,'J.D.World',1),
+(657,'BAKA to HASA me',1),
+(658,'',1),
+(659,'MIX-EDGE',1),
+(660,'Mugenkidou A',2),
+(661,'Hizatora',2),
+(662,'Unizo',1),
+(663,'Esebateira',1),
+(664,'shakestyle',1),
+(665,'North70',1),
+(666,'Yohsyuan',1),
+(667,'Anko ni Gohan',1),
+(668,'BONjin',1),
+(669,'BlueMage',1),
+(670,'Amazake Hatosyo-ten',1),
+(671,'EXTENDED PART',1),
+(672,'Oshiruko Kan',1),
+(673,'Furansowa',1),
+(674,'Ninokoya',1),
+(675,'Shallot Coco',1),
+(676,'MoonPhase',2),
+(677,'Cow Lipid',1),
+(678,'Apocrine.',1),
+(679,'Ponpharse',1),
+(680,'Primal Gym',2),
+(681,'Bad End RST',1),
+(682,'cc',1),
+(683,'Berry!16',1),
+(684,'HighDrug',1),
+(685,'Amamitu Hakushi',1),
+(686,'SOLID AIR',1),
+(687,'AGOITEI',1),
+(688,'Urasazan',1),
+(689,'Hy-dou',1),
+(690,'GALAXY STYLE',1),
+(691,'Nikuniku Italian',1),
+(692,'X-TEI',1),
+(693,'CHIN-UP',1),
+(694,'Uguisuya',1),
+(695,'Hiramani',1),
+(696,'Ichibocchi',1),
+(697,'PilotStar',1),
+(698,'Rideshion',1),
+(699,'Lunacy',1),
+(700,'Shin Hijiridou Honpo',1),
+(701,'Road map',1),
+(702,'Studio Zealot',1),
+(703,'Anegaoka Sanchoume',1),
+(704,'Tonpuuratei',1),
+(705,'Mysp5cm',1),
+(706,'Team Koinaka',1),
+(707,'185 Souko',1),
+(708,'Tamafuwa',1),
+(709,'Moco Chouchou',1),
+(710,'MARUTA Production',1),
+(711,'Kaki no Tane',1),
+(712,'Aigamodou',1),
+(713,'Kazuya',1),
+(714,'Studio N.BALL',1),
+(715,'Shoujo Gesshoku',3),
+(716,'Draw Go',3),
+(717,'Pikorin!',1),
+(718,'ARKADIA',3),
+(719,'Hibon',1),
+(720,'Aozora Shoujo',1),
+(721,'Tekokids',1),
+(722,'Shinnihon Pepsitou',1),
+(723,'Imomaru',3),
+(724,'HellDevice',1),
+(725,'Gambler Club',11),
+(726,'CELTRANCE',1),
+(727,'Koban Dou',1),
+(728,'Cyclo-',1),
+(729,'Kabushikigaisha Toranoana',1),
+(730,'Megabox',1),
+(731,'Monmo Bokujou',2),
+(732,'Auroramix',1),
+(733,'Akuheki',2),
+(734,'hlz',1),
+(735,'Ikasumiya',1),
+(736,'Candy Pop',1),
+(737,'CHIBIKKO KINGDOM',1),
+(738,'YtoH2',1),
+(739,'Fukazume Kizoku',1),
+(740,'Happiness Milk',3),
+(741,'Shijou Misaki',1),
+(742,'Noblegene',1),
+(743,'ManiacStreet',1),
+(744,'Batten Kariba',1),
+(745,'Labomagi!',1),
+(746,'OTOGIYA X-9',1),
+(747,'pinvise',2),
+(748,'Suzune Rai Chikashitsu',2),
+(749,'Rapurando',1),
+(750,'Katou Suzuki',1),
+(751,'Kaniya',1),
+(752,'Jingai Makyou',1),
+(753,'Hakusen',1),
+(754,'Royal Bitch',2),
+(755,'Yoshida Gorou Shoukai',1),
+(756,'Nikomutoko',1),
+(757,'Kaguya Hime Koubou',1),
+(758,'Unagigoya',2),
+(759,'Mangetsu Ujiya',1),
+(760,'Blitzkrieg',2),
+(761,'Knuckle Head',1),
+(762,'Rokusyoku Mikan',1),
+(763,'Kuroshiro Desire',1),
+(764,'Himepuchitei',1),
+(765,'Hisagoya',1),
+(766,'Ikkizuka',1),
+(767,'ZIGZAG',1),
+(768,'Salt choc',1),
+(769,'Chronicle',1),
+(770,'Kikuya',1),
+(771,'Dibi',5),
+(772,'A''s Maria',1),
+(773,'PULIN Nabe',1),
+(774,'Iris art',1),
+(775,'Utachan Honpo',1),
+(776,'Genkei Yuugi',1),
+(777,'Renaidou',1),
+(778,'Ink Complex',1),
+(779,'PigPanPan',1),
+(780,'Kamikire Basami',1),
+(781,'02',0),
+(782,'Appetite',1),
+(783,'7-Ban no Okimono',1),
+(784,'Kilometer',1),
+(785,'Sarugaso',1),
+(786,'Seafox',1),
+(787,'Bizen Dorobune Koubou',2);
 INSERT INTO "Languages" VALUES
 (1,'Unknown'),
 (2,'English'),
@@ -61040,264 +63842,264 @@ INSERT INTO "Languages" VALUES
 (35,'Ukrainian'),
 (36,'Vietnamese');
 INSERT INTO "List" VALUES
-(1,'to-read'),
-(2,'downloaded'),
-(3,'prob-good'),
-(4,'trap'),
-(5,'straight shota'),
-(6,'monster'),
-(7,'good futa'),
-(8,'good'),
-(9,'best'),
-(10,'vanilla'),
-(11,'femdom'),
-(12,'test'),
-(13,'+to-read');
+(1,'to-read',1995),
+(2,'downloaded',2289),
+(3,'prob-good',275),
+(4,'trap',154),
+(5,'straight shota',28),
+(6,'monster',28),
+(7,'good futa',58),
+(8,'good',68),
+(9,'best',0),
+(10,'vanilla',6),
+(11,'femdom',11),
+(12,'test',3),
+(13,'+to-read',0);
 INSERT INTO "MDB_Version" VALUES
-(6,0);
+(11,0);
 INSERT INTO "Parody" VALUES
-(1,'Bishoujo Senshi Sailor Moon / 美少女戦士セーラームーン'),
-(2,'Girls und Panzer / ガールズ&パンツァー'),
-(3,'Monster Musume no Iru Nichijou / モンスター娘のいる日常'),
-(4,'Touhou Project / 東方Project'),
-(5,'One Piece / ワンピース'),
-(6,'Danganronpa / ダンガンロンパ'),
-(7,'The Legend of Zelda / ゼルダの伝説'),
-(8,'Kirakira PreCure a La Mode / キラキラ☆プリキュアアラモー'),
-(9,'Fate/Grand Order'),
-(10,'Dragon Quest / ドラゴンクエスト'),
-(11,'Dragon Quest XI (11) / ドラゴンクエストXI'),
-(12,'THE iDOLM@STER / アイドルマスター'),
-(13,'Yu-Gi-Oh / 遊☆戯☆王'),
-(14,'Kantai Collection / 艦隊これくしょん'),
-(15,'Azur Lane / 碧蓝航线'),
-(16,'Girls Frontline / 少女前線'),
-(17,'Naruto / ナルト'),
-(18,'Fate/Apocrypha'),
-(19,'Yuri on Ice / ユーリ!!! on ICE'),
-(20,'Taimanin Asagi / 対魔忍アサギ'),
-(21,'Granblue Fantasy / グランブルーファンタジー'),
-(22,'Dragon''s Crown / ドラゴンズクラウン'),
-(23,'Eromanga Sensei - Imouto to Akazu no Ma / エロマンガ先生 妹と開かずの間'),
-(24,'Toaru Kagaku no Railgun / とある科学の超電磁砲'),
-(25,'Chaos Breaker | Dark Awake / カオスブレイカー'),
-(26,'Neon Genesis Evangelion / 新世紀エヴァンゲリオン'),
-(27,'Genmu Senki Leda / 幻夢戦記レダ'),
-(28,'Hacka Doll The Animation / ハッカドール THE・あにめーしょん'),
-(29,'Kanokon / かのこん'),
-(30,'Pokemon / ポケモン'),
-(31,'Ane Naru Mono / 姉なるもの'),
-(32,'Overlord / オーバーロード'),
-(33,'Boku no Hero Academia / 僕のヒーローアカデミア'),
-(34,'Mobile Suit Gundam: Iron-Blooded Orphans / 機動戦士ガンダム 鉄血のオルフェンズ外月鋼'),
-(35,'Kemono Friends / けものフレンズ'),
-(36,'Fate/stay night / フェイト/ステイナイト'),
-(37,'Persona 5 / ペルソナ5'),
-(38,'Queen''s Blade / クイーンズブレイド'),
-(39,'Battle Spirits / 最強銀河 究極ゼロ'),
-(40,'Go! Princess PreCure / Go!プリンセスプリキュア'),
-(41,'Metroid / メトロイド'),
-(42,'Dragon Ball / ドラゴンボール'),
-(43,'Monster Hunter / モンスターハンター'),
-(44,'Darkstalkers / ヴァンパイア'),
-(45,'Macross Frontier / マクロスFRONTIER'),
-(46,'Kill la Kill / キルラキル'),
-(47,'Splatoon / スプラトゥーン'),
-(48,'Tekken / 鉄拳'),
-(49,'Tengen Toppa Gurren Lagann / 天元突破グレンラガン'),
-(50,'Senran Kagura / 閃乱カグラ'),
-(51,'Street Fighter / ストリートファイター'),
-(52,'The King of Fighters / ザ・キング・オブ・ファイターズ'),
-(53,'Puella Magi Madoka Magica / 魔法少女まどか☆マギカ'),
-(54,'The World God Only Knows / 神のみぞ知るセカイ'),
-(55,'Kanon / カノン'),
-(56,'Otoyomegatari / 乙嫁語り'),
-(57,'Dead or Alive / デッド・オア・アライブ'),
-(58,'Ikkitousen / 一騎当千'),
-(59,'Dragon Quest V (5) / ドラゴンクエスト V'),
-(60,'Jojo''s Bizarre Adventure / ジョジョの奇妙な冒険'),
-(61,'.hack'),
-(62,'Final Fantasy Tactics / ファイナルファンタジータクティクス'),
-(63,'Shinrabansho / 神羅万象'),
-(64,'Taimanin Asagi Kessen Arena / 対魔忍アサギ～決戦アリーナ'),
-(65,'Silent Hill / サイレントヒル'),
-(66,'Maria†Holic / まりあ†ほりっく'),
-(67,'Mamoru-kun wa Norowarete Shimatta! / まもるクンは呪われてしまった！'),
-(68,'Taimanin Yukikaze / 対魔忍ユキカゼ'),
-(69,'Dragon Quest III (3) / ドラゴンクエスト III'),
-(70,'Izuna: Legend of the Unemployed Ninja / 降魔霊符伝イヅナ'),
-(71,'THE iDOLM@STER SideM / アイドルマスターSideM'),
-(72,'Daiya no Ace / ダイヤのA'),
-(73,'Maria-sama ga Miteru / マリア様がみてる'),
-(74,'Dragon Quest IV (4) / ドラゴンクエストIV'),
-(75,'Dagashi Kashi / だがしかし'),
-(76,'Mobile Suit Gundam The Origin / 機動戦士ガンダム THE ORIGIN'),
-(77,'Oshiete! Galko-chan / おしえて! ギャル子ちゃん'),
-(78,'Final Fight / ファイナルファイト'),
-(79,'Steins;Gate / シュタインズ・ゲート'),
-(80,'Yahari Ore no Seishun Love Come wa Machigatteiru / やはり俺の青春ラブコメはまちがっている。'),
-(81,'Magi: The Labyrinth of Magic / マギ'),
-(82,'Sword Art Online / ソードアート・オンライン'),
-(83,'Hataraku Maou-sama! / はたらく魔王さま!'),
-(84,'The Elder Scrolls'),
-(85,'Final Fantasy XV (15) / ファイナルファンタジーXV'),
-(86,'Shimoneta to Iu Gainen ga Sonzai Shinai Taikutsu na Sekai / 下ネタという概念が存在しない退屈な世界'),
-(87,'Ghost in the Shell / 攻殻機動隊'),
-(88,'Space Battleship Yamato 2199 / 宇宙戦艦ヤマト2199'),
-(89,'Maho Girls Precure! | Mahou Tsukai Precure! / 魔法つかいプリキュア!'),
-(90,'King of Fighters / キング･オブ･ファイターズ'),
-(91,'Valkyria Chronicles / 戦場のヴァルキュリア'),
-(92,'Ookiku Furikabutte / おおきく振りかぶって'),
-(93,'Pretty Rhythm / プリティーリズム'),
-(94,'Ensemble Stars! / あんさんぶるスターズ!'),
-(95,'Arslan Senki / アルスラーン戦記'),
-(96,'Rampo Kitan: Game of Laplace / 乱歩奇譚 Game of Laplace'),
-(97,'Hunter × Hunter ハンターハンター'),
-(98,'Ragnarok Online'),
-(99,'Drifters / ドリフターズ'),
-(100,'Baka to Test to Shoukanjuu / バカとテストと召喚獣'),
-(101,'Ixion Saga Dimension Transfer / イクシオンサーガDT'),
-(102,'Bayonetta / ベヨネッタ'),
-(103,'Gundam Build Fighters / ガンダムビルドファイターズ'),
-(104,'Saki / 咲-Saki-'),
-(105,'Bleach / ブリーチ'),
-(106,'Prison School / 監獄学園'),
-(107,'Yu-Gi-Oh! ARC-V / 遊☆戯☆王ARC-V'),
-(108,'Miraculous Ladybug / ミラキュラス・レディバグ'),
-(109,'Valkyrie Drive: Mermaid / ヴァルキリードライヴ　マーメイド'),
-(110,'Puzzle & Dragons / パズル&ドラゴンズ'),
-(111,'League of Legends (LoL)'),
-(112,'Space Patrol Luluco / 宇宙パトロールルル子'),
-(113,'Sunohara-sou no Kanrinin-san / すのはら荘の管理人さん'),
-(114,'Rage of Bahamut / 神撃のバハムート'),
-(115,'Usagi Drop / うさぎドロップ'),
-(116,'Fire Emblem / ファイアーエムブレム'),
-(117,'Final Fantasy XI (11) / ファイナルファンタジー XI'),
-(118,'Soul Calibur / ソウルキャリバー'),
-(119,'To Heart 2 / トゥハート2'),
-(120,'To Love-Ru / To LOVEる'),
-(121,'Big Hero 6 / ベイマックス'),
-(122,'Uchi no Musume ni Te o Dasuna! / 苗床イオウチのムスメに手を出すな!'),
-(123,'NieR / ニーアレ'),
-(124,'Demi-chan wa Kataritai / 亜人ちゃんは語りたい'),
-(125,'Kono Subarashii Sekai ni Shukufuku wo! / この素晴らしい世界に祝福を！'),
-(126,'Witch Craft Works / ウィッチクラフトワークス'),
-(127,'Haiyore! Nyaruko-san / 這いよれ! ニャル子さん'),
-(128,'Xenoblade / ゼノブレイド'),
-(129,'Monogatari / 物語'),
-(130,'Little Red Riding Hood'),
-(131,'Mahou Shoujo Lyrical Nanoha / 魔法少女リリカルなのは'),
-(132,'Mobile Suit Gundam / 機動戦士ガンダム'),
-(133,'Tales of Xillia / テイルズ オブ エクシリア'),
-(134,'Love Live! / ラブライブ!'),
-(135,'Dragon''s Dogma /ドラゴンズ ドグマ'),
-(136,'Vocaloid / ボーカロイド'),
-(137,'Fate/kaleid liner Prisma☆Illya / プリズマ☆イリヤ'),
-(138,'Mahouka Koukou no Rettousei / 魔法科高校の劣等生'),
-(139,'K-ON! / けいおん!,'),
-(140,'Mitsuboshi Colors / 三ツ星カラーズ'),
-(141,'Yuru Yuri / ゆるゆり'),
-(142,'Arc The Lad | アークザラッド'),
-(143,'Gekkan Shoujo Nozaki-kun / 月刊少女野崎くん'),
-(144,'Boku dake ga Inai Machi / 僕だけがいない街'),
-(145,'The Last Of Us'),
-(146,'Hai to Gensou no Grimgar / 灰と幻想のグリムガル'),
-(147,'3-gatsu no Lion / 3月のライオン'),
-(148,'Darling in the Franxx / ダーリン・イン・ザ・フランキス'),
-(149,'Lotte no Omocha! / ロッテのおもちゃ!'),
-(150,'Blend S / ブレンド・S'),
-(151,'Princess Principal / プリンセス・プリンシパル'),
-(152,'IS (Infinite Stratos) / インフィニット・ストラトス'),
-(153,'Starcraft'),
-(154,'Overwatch'),
-(155,'Touken Ranbu / 刀剣乱舞'),
-(156,'Hinabita / ひなビタ♪'),
-(157,'Hyperdimension Neptunia / 超次元ゲイム ネプテューヌ'),
-(158,'Sennen Sensou Aigis / 千年戦争アイギス'),
-(159,'Re:CREATORS'),
-(160,'Kakegurui / 賭ケグルイ'),
-(161,'Taimadou Gakuen 35 Shiken Shoutai / 対魔導学園35試験小隊'),
-(162,'Manyuu Hikenchou / 魔乳秘剣帖'),
-(163,'BlazBlue / ブレイブルー'),
-(164,'Real Drive / RD 潜脳調査室'),
-(165,'Kuromukuro / クロムクロ'),
-(166,'Saenai Heroine no Sodatekata / 冴えない彼女ヒロインの育てかた'),
-(167,'Fresh Precure! / フレッシュプリキュア！'),
-(168,'Mahou Tsukai no Yoru / 魔法使いの夜'),
-(169,'Guilty Gear / ギルテイギア'),
-(170,'Fairy Tail / フェアリーテイル'),
-(171,'Shounen Maid / 少年メイド'),
-(172,'Undertale'),
-(173,'Kaiju Girls / 怪獣娘'),
-(174,'Mouretsu Pirates / モーレツ宇宙海賊'),
-(175,'Boku Girl / ボクガール'),
-(176,'Sakura Quest / サクラクエスト'),
-(177,'Seiken Densetsu 3 / 聖剣伝説3'),
-(178,'Koutetsujou no Kabaneri / 甲鉄城のカバネリ'),
-(179,'Kuroinu ~Kedakaki Seijo wa Hakudaku ni Somaru~ / 黒獣～気高き聖女は白濁に染まる～'),
-(180,'Black Lagoon / ブラック・ラグーン'),
-(181,'Utawarerumono / うたわれるもの'),
-(182,'Senko no Ronde / 旋光の輪舞'),
-(183,'THE'),
-(184,'Batman'),
-(185,'Aladdin'),
-(186,'Black★Rock Shooter / ブラック★ロックシューター'),
-(187,'Attack on Titan / Shingeki no Kyojin / 進撃の巨人'),
-(188,'Dungeon Meshi / ダンジョン飯'),
-(189,'Turn A Gundam (∀) / ∀ガンダム'),
-(190,'Youjo Senki / 幼女戦記'),
-(191,'Miss Kobayashi''s Dragon Maid / 小林さんちのメイドラゴン'),
-(192,'Quiz Magic Academy / クイズマジックアカデミー'),
-(193,'Voiceroid / ボイスロイド'),
-(194,'Uma Musume Pretty Derby / ウマ娘 プリティーダービー'),
-(195,'Final Fantasy XIV (14) / ファイナルファンタジーXIV'),
-(196,'Heroman / ヒーローマン'),
-(197,'Summer Wars / サマーウォーズ'),
-(198,'Gundam 0083 / 機動戦士ガンダム0083'),
-(199,'Rurouni Kenshin / るろうに剣心'),
-(200,'Kochikame / こち亀'),
-(201,'Final Fantasy IV (4) / ファイナルファンタジー IV'),
-(202,'Final Fantasy IX (9) / ファイナルファンタジー IX'),
-(203,'Final Fantasy VII (7) / ファイナルファンタジー VII'),
-(204,'Final Fantasy X (10) / ファイナルファンタジー X'),
-(205,'Final Fantasy VI (6) / ファイナルファンタジーVI'),
-(206,'Last Period / ラストピリオド'),
-(207,'Love Live! Sunshine!! / ラブライブ! サンシャイン!!'),
-(208,'Bokutachi wa Benkyou ga Dekinai / ぼくたちは勉強ができない'),
-(209,'Amagi Brilliant Park / 甘城ブリリアントパーク'),
-(210,'Maji de Watashi ni Koi Shinsai! / 真剣で私に恋しなさい!'),
-(211,'Houkai Impact 3 / 崩坏3'),
-(212,'Etotama / えとたま'),
-(213,'Maken-ki! / マケン姫っ!'),
-(214,'Macross Delta / マクロスΔ'),
-(215,'Gravity Falls'),
-(216,'Rakudai Kishi no Cavalry / 落第騎士の英雄譚《キャバルリィ》'),
-(217,'MOTHER'),
-(218,'Sora no Otoshimono / そらのおとしもの'),
-(219,'Senki Zesshou Symphogear / 戦姫絶唱シンフォギア'),
-(220,'DOG DAYS'),
-(221,'HeartCatch Precure! / ハートキャッチプリキュア!'),
-(222,'Chousoku Henkei Gyrozetter / 超速変形ジャイロゼッター'),
-(223,'Made in Abyss / メイドインアビス'),
-(224,'Shut Hell / シュトヘル'),
-(225,'Nurarihyon no Mago / ぬらりひょんの孫'),
-(226,'Papa no Iukoto Wo Kinasai! / パパのいうことを聞きなさい！'),
-(227,'One-Punch Man / ワンパンマン'),
-(228,'Final Fantasy XII (12) / ファイナルファンタジー XII'),
-(229,'Final Fantasy V (5) / ファイナルファンタジー V'),
-(230,'Cardfight Vanguard / カードファイト!! ヴァンガード'),
-(231,'Little Witch Academia / リトルウィッチアカデミア'),
-(232,'Ganbare Goemon / がんばれゴエモン'),
-(233,'Keroro Gunsou / ケロロ軍曹'),
-(234,'Sword Art Online Alternative Gun Gale Online / ソードアート・オンライン オルタナティブ ガンゲイル・オンライン'),
-(235,'Chokotto Sister / ちょこッとSister'),
-(236,'Gundam Build Fighters Try / ガンダムビルドファイターズトライ'),
-(237,'HappinessCharge Precure! / ハピネスチャージプリキュア!'),
-(238,'Virtual Youtuber / バーチャルYouTuber'),
-(239,'Original'),
-(240,'Super Mario Brothers'),
-(241,'Fate Grand Order'),
-(242,'Legend Of Queen Opala');
+(1,'Bishoujo Senshi Sailor Moon / 美少女戦士セーラームーン',6),
+(2,'Girls und Panzer / ガールズ&パンツァー',13),
+(3,'Monster Musume no Iru Nichijou / モンスター娘のいる日常',1),
+(4,'Touhou Project / 東方Project',78),
+(5,'One Piece / ワンピース',14),
+(6,'Danganronpa / ダンガンロンパ',6),
+(7,'The Legend of Zelda / ゼルダの伝説',9),
+(8,'Kirakira PreCure a La Mode / キラキラ☆プリキュアアラモー',3),
+(9,'Fate/Grand Order',95),
+(10,'Dragon Quest / ドラゴンクエスト',8),
+(11,'Dragon Quest XI (11) / ドラゴンクエストXI',17),
+(12,'THE iDOLM@STER / アイドルマスター',35),
+(13,'Yu-Gi-Oh / 遊☆戯☆王',1),
+(14,'Kantai Collection / 艦隊これくしょん',63),
+(15,'Azur Lane / 碧蓝航线',11),
+(16,'Girls Frontline / 少女前線',2),
+(17,'Naruto / ナルト',10),
+(18,'Fate/Apocrypha',2),
+(19,'Yuri on Ice / ユーリ!!! on ICE',2),
+(20,'Taimanin Asagi / 対魔忍アサギ',3),
+(21,'Granblue Fantasy / グランブルーファンタジー',54),
+(22,'Dragon''s Crown / ドラゴンズクラウン',7),
+(23,'Eromanga Sensei - Imouto to Akazu no Ma / エロマンガ先生 妹と開かずの間',1),
+(24,'Toaru Kagaku no Railgun / とある科学の超電磁砲',3),
+(25,'Chaos Breaker | Dark Awake / カオスブレイカー',1),
+(26,'Neon Genesis Evangelion / 新世紀エヴァンゲリオン',11),
+(27,'Genmu Senki Leda / 幻夢戦記レダ',1),
+(28,'Hacka Doll The Animation / ハッカドール THE・あにめーしょん',3),
+(29,'Kanokon / かのこん',2),
+(30,'Pokemon / ポケモン',31),
+(31,'Ane Naru Mono / 姉なるもの',4),
+(32,'Overlord / オーバーロード',3),
+(33,'Boku no Hero Academia / 僕のヒーローアカデミア',12),
+(34,'Mobile Suit Gundam: Iron-Blooded Orphans / 機動戦士ガンダム 鉄血のオルフェンズ外月鋼',2),
+(35,'Kemono Friends / けものフレンズ',2),
+(36,'Fate/stay night / フェイト/ステイナイト',5),
+(37,'Persona 5 / ペルソナ5',7),
+(38,'Queen''s Blade / クイーンズブレイド',2),
+(39,'Battle Spirits / 最強銀河 究極ゼロ',1),
+(40,'Go! Princess PreCure / Go!プリンセスプリキュア',4),
+(41,'Metroid / メトロイド',3),
+(42,'Dragon Ball / ドラゴンボール',5),
+(43,'Monster Hunter / モンスターハンター',18),
+(44,'Darkstalkers / ヴァンパイア',3),
+(45,'Macross Frontier / マクロスFRONTIER',1),
+(46,'Kill la Kill / キルラキル',2),
+(47,'Splatoon / スプラトゥーン',1),
+(48,'Tekken / 鉄拳',3),
+(49,'Tengen Toppa Gurren Lagann / 天元突破グレンラガン',1),
+(50,'Senran Kagura / 閃乱カグラ',3),
+(51,'Street Fighter / ストリートファイター',15),
+(52,'The King of Fighters / ザ・キング・オブ・ファイターズ',1),
+(53,'Puella Magi Madoka Magica / 魔法少女まどか☆マギカ',2),
+(54,'The World God Only Knows / 神のみぞ知るセカイ',1),
+(55,'Kanon / カノン',20),
+(56,'Otoyomegatari / 乙嫁語り',2),
+(57,'Dead or Alive / デッド・オア・アライブ',2),
+(58,'Ikkitousen / 一騎当千',4),
+(59,'Dragon Quest V (5) / ドラゴンクエスト V',4),
+(60,'Jojo''s Bizarre Adventure / ジョジョの奇妙な冒険',1),
+(61,'.hack',1),
+(62,'Final Fantasy Tactics / ファイナルファンタジータクティクス',1),
+(63,'Shinrabansho / 神羅万象',2),
+(64,'Taimanin Asagi Kessen Arena / 対魔忍アサギ～決戦アリーナ',2),
+(65,'Silent Hill / サイレントヒル',1),
+(66,'Maria†Holic / まりあ†ほりっく',2),
+(67,'Mamoru-kun wa Norowarete Shimatta! / まもるクンは呪われてしまった！',1),
+(68,'Taimanin Yukikaze / 対魔忍ユキカゼ',2),
+(69,'Dragon Quest III (3) / ドラゴンクエスト III',2),
+(70,'Izuna: Legend of the Unemployed Ninja / 降魔霊符伝イヅナ',1),
+(71,'THE iDOLM@STER SideM / アイドルマスターSideM',5),
+(72,'Daiya no Ace / ダイヤのA',1),
+(73,'Maria-sama ga Miteru / マリア様がみてる',3),
+(74,'Dragon Quest IV (4) / ドラゴンクエストIV',6),
+(75,'Dagashi Kashi / だがしかし',5),
+(76,'Mobile Suit Gundam The Origin / 機動戦士ガンダム THE ORIGIN',1),
+(77,'Oshiete! Galko-chan / おしえて! ギャル子ちゃん',6),
+(78,'Final Fight / ファイナルファイト',2),
+(79,'Steins;Gate / シュタインズ・ゲート',1),
+(80,'Yahari Ore no Seishun Love Come wa Machigatteiru / やはり俺の青春ラブコメはまちがっている。',2),
+(81,'Magi: The Labyrinth of Magic / マギ',1),
+(82,'Sword Art Online / ソードアート・オンライン',3),
+(83,'Hataraku Maou-sama! / はたらく魔王さま!',1),
+(84,'The Elder Scrolls',2),
+(85,'Final Fantasy XV (15) / ファイナルファンタジーXV',1),
+(86,'Shimoneta to Iu Gainen ga Sonzai Shinai Taikutsu na Sekai / 下ネタという概念が存在しない退屈な世界',1),
+(87,'Ghost in the Shell / 攻殻機動隊',1),
+(88,'Space Battleship Yamato 2199 / 宇宙戦艦ヤマト2199',1),
+(89,'Maho Girls Precure! | Mahou Tsukai Precure! / 魔法つかいプリキュア!',4),
+(90,'King of Fighters / キング･オブ･ファイターズ',4),
+(91,'Valkyria Chronicles / 戦場のヴァルキュリア',1),
+(92,'Ookiku Furikabutte / おおきく振りかぶって',1),
+(93,'Pretty Rhythm / プリティーリズム',1),
+(94,'Ensemble Stars! / あんさんぶるスターズ!',3),
+(95,'Arslan Senki / アルスラーン戦記',2),
+(96,'Rampo Kitan: Game of Laplace / 乱歩奇譚 Game of Laplace',1),
+(97,'Hunter × Hunter ハンターハンター',1),
+(98,'Ragnarok Online',1),
+(99,'Drifters / ドリフターズ',1),
+(100,'Baka to Test to Shoukanjuu / バカとテストと召喚獣',1),
+(101,'Ixion Saga Dimension Transfer / イクシオンサーガDT',1),
+(102,'Bayonetta / ベヨネッタ',1),
+(103,'Gundam Build Fighters / ガンダムビルドファイターズ',1),
+(104,'Saki / 咲-Saki-',1),
+(105,'Bleach / ブリーチ',3),
+(106,'Prison School / 監獄学園',3),
+(107,'Yu-Gi-Oh! ARC-V / 遊☆戯☆王ARC-V',2),
+(108,'Miraculous Ladybug / ミラキュラス・レディバグ',1),
+(109,'Valkyrie Drive: Mermaid / ヴァルキリードライヴ　マーメイド',1),
+(110,'Puzzle & Dragons / パズル&ドラゴンズ',4),
+(111,'League of Legends (LoL)',2),
+(112,'Space Patrol Luluco / 宇宙パトロールルル子',1),
+(113,'Sunohara-sou no Kanrinin-san / すのはら荘の管理人さん',1),
+(114,'Rage of Bahamut / 神撃のバハムート',1),
+(115,'Usagi Drop / うさぎドロップ',1),
+(116,'Fire Emblem / ファイアーエムブレム',4),
+(117,'Final Fantasy XI (11) / ファイナルファンタジー XI',6),
+(118,'Soul Calibur / ソウルキャリバー',2),
+(119,'To Heart 2 / トゥハート2',1),
+(120,'To Love-Ru / To LOVEる',2),
+(121,'Big Hero 6 / ベイマックス',5),
+(122,'Uchi no Musume ni Te o Dasuna! / 苗床イオウチのムスメに手を出すな!',1),
+(123,'NieR / ニーアレ',8),
+(124,'Demi-chan wa Kataritai / 亜人ちゃんは語りたい',1),
+(125,'Kono Subarashii Sekai ni Shukufuku wo! / この素晴らしい世界に祝福を！',4),
+(126,'Witch Craft Works / ウィッチクラフトワークス',1),
+(127,'Haiyore! Nyaruko-san / 這いよれ! ニャル子さん',1),
+(128,'Xenoblade / ゼノブレイド',4),
+(129,'Monogatari / 物語',2),
+(130,'Little Red Riding Hood',1),
+(131,'Mahou Shoujo Lyrical Nanoha / 魔法少女リリカルなのは',1),
+(132,'Mobile Suit Gundam / 機動戦士ガンダム',1),
+(133,'Tales of Xillia / テイルズ オブ エクシリア',3),
+(134,'Love Live! / ラブライブ!',11),
+(135,'Dragon''s Dogma /ドラゴンズ ドグマ',1),
+(136,'Vocaloid / ボーカロイド',4),
+(137,'Fate/kaleid liner Prisma☆Illya / プリズマ☆イリヤ',4),
+(138,'Mahouka Koukou no Rettousei / 魔法科高校の劣等生',3),
+(139,'K-ON! / けいおん!,',1),
+(140,'Mitsuboshi Colors / 三ツ星カラーズ',1),
+(141,'Yuru Yuri / ゆるゆり',1),
+(142,'Arc The Lad | アークザラッド',2),
+(143,'Gekkan Shoujo Nozaki-kun / 月刊少女野崎くん',1),
+(144,'Boku dake ga Inai Machi / 僕だけがいない街',1),
+(145,'The Last Of Us',1),
+(146,'Hai to Gensou no Grimgar / 灰と幻想のグリムガル',1),
+(147,'3-gatsu no Lion / 3月のライオン',1),
+(148,'Darling in the Franxx / ダーリン・イン・ザ・フランキス',3),
+(149,'Lotte no Omocha! / ロッテのおもちゃ!',2),
+(150,'Blend S / ブレンド・S',1),
+(151,'Princess Principal / プリンセス・プリンシパル',1),
+(152,'IS (Infinite Stratos) / インフィニット・ストラトス',2),
+(153,'Starcraft',1),
+(154,'Overwatch',1),
+(155,'Touken Ranbu / 刀剣乱舞',1),
+(156,'Hinabita / ひなビタ♪',1),
+(157,'Hyperdimension Neptunia / 超次元ゲイム ネプテューヌ',1),
+(158,'Sennen Sensou Aigis / 千年戦争アイギス',2),
+(159,'Re:CREATORS',1),
+(160,'Kakegurui / 賭ケグルイ',1),
+(161,'Taimadou Gakuen 35 Shiken Shoutai / 対魔導学園35試験小隊',1),
+(162,'Manyuu Hikenchou / 魔乳秘剣帖',1),
+(163,'BlazBlue / ブレイブルー',2),
+(164,'Real Drive / RD 潜脳調査室',1),
+(165,'Kuromukuro / クロムクロ',1),
+(166,'Saenai Heroine no Sodatekata / 冴えない彼女ヒロインの育てかた',2),
+(167,'Fresh Precure! / フレッシュプリキュア！',1),
+(168,'Mahou Tsukai no Yoru / 魔法使いの夜',1),
+(169,'Guilty Gear / ギルテイギア',1),
+(170,'Fairy Tail / フェアリーテイル',2),
+(171,'Shounen Maid / 少年メイド',1),
+(172,'Undertale',1),
+(173,'Kaiju Girls / 怪獣娘',1),
+(174,'Mouretsu Pirates / モーレツ宇宙海賊',1),
+(175,'Boku Girl / ボクガール',1),
+(176,'Sakura Quest / サクラクエスト',1),
+(177,'Seiken Densetsu 3 / 聖剣伝説3',1),
+(178,'Koutetsujou no Kabaneri / 甲鉄城のカバネリ',1),
+(179,'Kuroinu ~Kedakaki Seijo wa Hakudaku ni Somaru~ / 黒獣～気高き聖女は白濁に染まる～',1),
+(180,'Black Lagoon / ブラック・ラグーン',1),
+(181,'Utawarerumono / うたわれるもの',1),
+(182,'Senko no Ronde / 旋光の輪舞',1),
+(183,'THE',21),
+(184,'Batman',1),
+(185,'Aladdin',1),
+(186,'Black★Rock Shooter / ブラック★ロックシューター',2),
+(187,'Attack on Titan / Shingeki no Kyojin / 進撃の巨人',1),
+(188,'Dungeon Meshi / ダンジョン飯',2),
+(189,'Turn A Gundam (∀) / ∀ガンダム',2),
+(190,'Youjo Senki / 幼女戦記',1),
+(191,'Miss Kobayashi''s Dragon Maid / 小林さんちのメイドラゴン',1),
+(192,'Quiz Magic Academy / クイズマジックアカデミー',1),
+(193,'Voiceroid / ボイスロイド',1),
+(194,'Uma Musume Pretty Derby / ウマ娘 プリティーダービー',1),
+(195,'Final Fantasy XIV (14) / ファイナルファンタジーXIV',1),
+(196,'Heroman / ヒーローマン',1),
+(197,'Summer Wars / サマーウォーズ',1),
+(198,'Gundam 0083 / 機動戦士ガンダム0083',1),
+(199,'Rurouni Kenshin / るろうに剣心',1),
+(200,'Kochikame / こち亀',1),
+(201,'Final Fantasy IV (4) / ファイナルファンタジー IV',1),
+(202,'Final Fantasy IX (9) / ファイナルファンタジー IX',1),
+(203,'Final Fantasy VII (7) / ファイナルファンタジー VII',2),
+(204,'Final Fantasy X (10) / ファイナルファンタジー X',1),
+(205,'Final Fantasy VI (6) / ファイナルファンタジーVI',1),
+(206,'Last Period / ラストピリオド',2),
+(207,'Love Live! Sunshine!! / ラブライブ! サンシャイン!!',2),
+(208,'Bokutachi wa Benkyou ga Dekinai / ぼくたちは勉強ができない',1),
+(209,'Amagi Brilliant Park / 甘城ブリリアントパーク',1),
+(210,'Maji de Watashi ni Koi Shinsai! / 真剣で私に恋しなさい!',1),
+(211,'Houkai Impact 3 / 崩坏3',1),
+(212,'Etotama / えとたま',1),
+(213,'Maken-ki! / マケン姫っ!',1),
+(214,'Macross Delta / マクロスΔ',1),
+(215,'Gravity Falls',1),
+(216,'Rakudai Kishi no Cavalry / 落第騎士の英雄譚《キャバルリィ》',1),
+(217,'MOTHER',1),
+(218,'Sora no Otoshimono / そらのおとしもの',1),
+(219,'Senki Zesshou Symphogear / 戦姫絶唱シンフォギア',1),
+(220,'DOG DAYS',1),
+(221,'HeartCatch Precure! / ハートキャッチプリキュア!',1),
+(222,'Chousoku Henkei Gyrozetter / 超速変形ジャイロゼッター',1),
+(223,'Made in Abyss / メイドインアビス',2),
+(224,'Shut Hell / シュトヘル',1),
+(225,'Nurarihyon no Mago / ぬらりひょんの孫',1),
+(226,'Papa no Iukoto Wo Kinasai! / パパのいうことを聞きなさい！',1),
+(227,'One-Punch Man / ワンパンマン',1),
+(228,'Final Fantasy XII (12) / ファイナルファンタジー XII',1),
+(229,'Final Fantasy V (5) / ファイナルファンタジー V',1),
+(230,'Cardfight Vanguard / カードファイト!! ヴァンガード',1),
+(231,'Little Witch Academia / リトルウィッチアカデミア',2),
+(232,'Ganbare Goemon / がんばれゴエモン',1),
+(233,'Keroro Gunsou / ケロロ軍曹',1),
+(234,'Sword Art Online Alternative Gun Gale Online / ソードアート・オンライン オルタナティブ ガンゲイル・オンライン',1),
+(235,'Chokotto Sister / ちょこッとSister',1),
+(236,'Gundam Build Fighters Try / ガンダムビルドファイターズトライ',1),
+(237,'HappinessCharge Precure! / ハピネスチャージプリキュア!',1),
+(238,'Virtual Youtuber / バーチャルYouTuber',1),
+(239,'Original',3),
+(240,'Super Mario Brothers',1),
+(241,'Fate Grand Order',1),
+(242,'Legend Of Queen Opala',1);
 INSERT INTO "Sites" VALUES
 (1,'tsumino.com'),
 (2,'nhentai.net'),
@@ -61314,386 +64116,409 @@ INSERT INTO "Status" VALUES
 (5,'Hiatus'),
 (6,'Cancelled');
 INSERT INTO "Tag" VALUES
-(1,'Ahegao'),
-(2,'BBM / Fat Man'),
-(3,'Blowjob'),
-(4,'Bukkake'),
-(5,'Cunnilingus'),
-(6,'Full Color'),
-(7,'Group Sex'),
-(8,'Harem'),
-(9,'Large Breasts'),
-(10,'Magical Girl'),
-(11,'Prostitution'),
-(12,'Virginity (Male)'),
-(13,'Condom'),
-(14,'Defloration'),
-(15,'Loli'),
-(16,'MILF'),
-(17,'Oppai Loli'),
-(18,'Rape'),
-(19,'School Uniform'),
-(20,'Tanlines'),
-(21,'Teacher'),
-(22,'Nakadashi'),
-(23,'Threesome'),
-(24,'Crotchless / Breastless'),
-(25,'Pantyhose'),
-(26,'Short Hair'),
-(27,'Slut'),
-(28,'Smug'),
-(29,'Anal'),
-(30,'Dark Skin'),
-(31,'Elf'),
-(32,'Gyaru'),
-(33,'Happy Sex'),
-(34,'Pettanko'),
-(35,'Bathroom Sex'),
-(36,'Big Ass'),
-(37,'Blindfold'),
-(38,'Body Painting'),
-(39,'Cheating'),
-(40,'Double Penetration'),
-(41,'Freckles'),
-(42,'Gokkun'),
-(43,'Hairy'),
-(44,'Handjob'),
-(45,'Hotpants'),
-(46,'Lactation'),
-(47,'Layer Cake'),
-(48,'Megane'),
-(49,'Mouth Gag'),
-(50,'Paizuri'),
-(51,'Sex Toys'),
-(52,'Sweating'),
-(53,'Transparent Clothing'),
-(54,'Twintails'),
-(55,'Waitress'),
-(56,'Birth'),
-(57,'Body Modification'),
-(58,'Corruption'),
-(59,'Dick Growth'),
-(60,'Egg Laying'),
-(61,'Futanari'),
-(62,'Huge Breasts'),
-(63,'Huge Penis'),
-(64,'Impregnation'),
-(65,'Mind Break'),
-(66,'Monster'),
-(67,'Pregnant'),
-(68,'Stockings'),
-(69,'Stomach Bulge'),
-(70,'Yuri'),
-(71,'Anilingus'),
-(72,'Centaur'),
-(73,'Fisting'),
-(74,'Monster Girl'),
-(75,'Comedy'),
-(76,'Deepthroat'),
-(77,'Femdom'),
-(78,'Squirting'),
-(79,'Tengu'),
-(80,'Tsundere'),
-(81,'X-ray'),
-(82,'Animal Girl'),
-(83,'Cervical Penetration'),
-(84,'Collar'),
-(85,'Cow Girl'),
-(86,'Devil'),
-(87,'Enema'),
-(88,'Imouto'),
-(89,'Incest'),
-(90,'Kimono / Yukata'),
-(91,'Mother'),
-(92,'Netorare'),
-(93,'Oni'),
-(94,'Parasite'),
-(95,'Prostate Massage'),
-(96,'Ryona'),
-(97,'Story Arc'),
-(98,'Tankoubon'),
-(99,'Uncensored'),
-(100,'Yaoi'),
-(101,'Inverted Nipples'),
-(102,'Tall Girl'),
-(103,'Office Lady'),
-(104,'Elder Sister'),
-(105,'Fangs'),
-(106,'Hairy Armpits'),
-(107,'Lingerie'),
-(108,'Smegma'),
-(109,'Soushuuhen'),
-(110,'Straight Shota'),
-(111,'Swinging / Netorase'),
-(112,'Urethra Insertion'),
-(113,'Yandere'),
-(114,'Big Areola'),
-(115,'Gangbang'),
-(116,'Mind Control'),
-(117,'Bondage'),
-(118,'CBT'),
-(119,'Face Sitting'),
-(120,'Footjob'),
-(121,'Shibari'),
-(122,'Spanking'),
-(123,'French Kissing'),
-(124,'Leg Lock'),
-(125,'Maledom'),
-(126,'Royalty'),
-(127,'Torn Clothing'),
-(128,'Assjob'),
-(129,'Reverse NTR'),
-(130,'Netori'),
-(131,'Masturbation'),
-(132,'BDSM'),
-(133,'Breast Expansion'),
-(134,'Crossdressing'),
-(135,'Male on Futa'),
-(136,'Bunnygirl'),
-(137,'Exhibitionism'),
-(138,'Symbol Shaped Pupils'),
-(139,'BBW'),
-(140,'Muscle'),
-(141,'Nose Hook'),
-(142,'Plump'),
-(143,'Scat'),
-(144,'Tentacles'),
-(145,'Breast Sucking'),
-(146,'Tan'),
-(147,'Tomboy'),
-(148,'Bikini'),
-(149,'Drunk'),
-(150,'Nipple Penetration'),
-(151,'Piercings'),
-(152,'Swimsuit'),
-(153,'Idol'),
-(154,'Males only'),
-(155,'Multiple Penises'),
-(156,'Shota'),
-(157,'Bisexual'),
-(158,'Gender Bender'),
-(159,'Humiliation'),
-(160,'Tribadism'),
-(161,'Trap'),
-(162,'Fingering'),
-(163,'Fox Girl'),
-(164,'Futa on Female'),
-(165,'Catgirl'),
-(166,'Females only'),
-(167,'Leotard'),
-(168,'Miko'),
-(169,'Armpit'),
-(170,'Hypnosis'),
-(171,'Smell'),
-(172,'Decensored'),
-(173,'Futanari on Futanari'),
-(174,'Onahole'),
-(175,'Asphyxiation'),
-(176,'Bloomers'),
-(177,'Drugs'),
-(178,'Futa on Male'),
-(179,'Nurse'),
-(180,'Shemale'),
-(181,'Small Penis'),
-(182,'Spats'),
-(183,'Spitroast'),
-(184,'Mouse Girl'),
-(185,'Sleeping'),
-(186,'Cheerleader'),
-(187,'DILF'),
-(188,'Hat'),
-(189,'Cosplay'),
-(190,'Witch'),
-(191,'Oyakodon'),
-(192,'Filming'),
-(193,'Slave'),
-(194,'Daughter'),
-(195,'Kunoichi'),
-(196,'Age Regression'),
-(197,'Maebari'),
-(198,'Possession'),
-(199,'Blackmail'),
-(200,'Lamia'),
-(201,'Long Tongue'),
-(202,'Naked Apron'),
-(203,'Nun'),
-(204,'Shared Senses'),
-(205,'Transformation'),
-(206,'Giantess'),
-(207,'Mermaid'),
-(208,'Frotting'),
-(209,'Maid'),
-(210,'Age Progression'),
-(211,'Dirty Old Man'),
-(212,'Emotionless Sex'),
-(213,'Gloves'),
-(214,'Inseki'),
-(215,'Invisible'),
-(216,'Time Stop'),
-(217,'Ghost'),
-(218,'Watersports'),
-(219,'Licking'),
-(220,'Succubus'),
-(221,'Eyepatch'),
-(222,'Tattoo'),
-(223,'Reverse Rape'),
-(224,'Animal Boy'),
-(225,'Bestiality'),
-(226,'Pig'),
-(227,'Vomit'),
-(228,'Pegging'),
-(229,'Strap-on'),
-(230,'Legal Loli'),
-(231,'Shimaidon'),
-(232,'Sixty-Nine'),
-(233,'Prolapse'),
-(234,'Multiple Insertion'),
-(235,'Reverse Harem'),
-(236,'Chastity Belt'),
-(237,'Brain Fuck'),
-(238,'Amputee'),
-(239,'Guro'),
-(240,'Band-Aid / Pasties'),
-(241,'Childhood Friend'),
-(242,'Snuff'),
-(243,'Twins'),
-(244,'Bodysuit'),
-(245,'Human Cattle'),
-(246,'Orc'),
-(247,'Pet Girl'),
-(248,'Zombie'),
-(249,'Diaper'),
-(250,'Body Writing'),
-(251,'Lowleg'),
-(252,'Shimapan'),
-(253,'Latex'),
-(254,'Wings'),
-(255,'Human Toilet'),
-(256,'Tutor'),
-(257,'Vampire'),
-(258,'Dog Girl'),
-(259,'Mask'),
-(260,'Dog'),
-(261,'Bride'),
-(262,'Grandmother'),
-(263,'Angel'),
-(264,'Voyeurism'),
-(265,'Unbirthing'),
-(266,'Foot Fetish'),
-(267,'Dragon Girl'),
-(268,'Aunt'),
-(269,'Father'),
-(270,'Sumata'),
-(271,'Stuck in Wall'),
-(272,'Onsen'),
-(273,'Niece'),
-(274,'Furry'),
-(275,'Uncle'),
-(276,'Horse'),
-(277,'Christmas'),
-(278,'Orgasm Denial'),
-(279,'Randoseru'),
-(280,'Delusion'),
-(281,'Chikan'),
-(282,'Harpy'),
-(283,'Fundoshi'),
-(284,'Cousin'),
-(285,'Ear Fuck'),
-(286,'Spreading'),
-(287,'Fairy'),
-(288,'Petrification'),
-(289,'Selfcest'),
-(290,'Micro'),
-(291,'Body Swap'),
-(292,'Military Uniform'),
-(293,'Insect Girl'),
-(294,'Vore'),
-(295,'Chinese Dress'),
-(296,'Stalking'),
-(297,'Robot Girl'),
-(298,'Multiple Breasts'),
-(299,'Torture'),
-(300,'School Swimsuit'),
-(301,'Phimosis'),
-(302,'Nyotaimori'),
-(303,'Doctor'),
-(304,'Gothic'),
-(305,'Autofellatio'),
-(306,'Sex on the Phone'),
-(307,'Otouto'),
-(308,'Doll'),
-(309,'Pajamas'),
-(310,'NEET / Hikkikomori'),
-(311,'Penis Birth'),
-(312,'Slime Girl'),
-(313,'Menstruation'),
-(314,'Arachne'),
-(315,'Widow'),
-(316,'Tailjob'),
-(317,'Anthology'),
-(318,'Police Uniform'),
-(319,'Dojikko'),
-(320,'Alien'),
-(321,'Solo Action'),
-(322,'Dandere'),
-(323,'Hairjob'),
-(324,'Western'),
-(325,'Wakamezake'),
-(326,'Race Queen'),
-(327,'Gaping'),
-(328,'Living Clothes'),
-(329,'Prison'),
-(330,'All the Way through'),
-(331,'Heterochromia'),
-(332,'Kuudere'),
-(333,'Demon | Incubus'),
-(334,'Demon Girl | Succubus'),
-(335,'Insect'),
-(336,'Toddler'),
-(337,'Plant Girl'),
-(338,'Butler'),
-(339,'Massage'),
-(340,'Kotatsu'),
-(341,'Granddaughter'),
-(342,'Wormhole'),
-(343,'Blindness'),
-(344,'Slime'),
-(345,'Braids'),
-(346,'Machine'),
-(347,'Ponytail'),
-(348,'Josou Seme'),
-(349,'Glory Hole'),
-(350,'Sportswear'),
-(351,'Textless'),
-(352,'Unusual Teeth'),
-(353,'Big Breasts'),
-(354,'Crown'),
-(355,'Sole Female'),
-(356,'Sole Male'),
-(357,'Sole Dickgirl'),
-(358,'Horns'),
-(359,'Kissing'),
-(360,'Metal Armor'),
-(361,'Thigh High Boots'),
-(362,'Virginity'),
-(363,'Unusual Pupils'),
-(364,'Schoolboy Uniform'),
-(365,'Glasses'),
-(366,'Schoolgirl Uniform'),
-(367,'Mosaic Censorship'),
-(368,'Big Penis'),
-(369,'Group'),
-(370,'Ffm Threesome'),
-(371,'Multiple Paizuri'),
-(372,'Multi-Work Series'),
-(373,'Shotacon'),
-(374,'Piss Drinking'),
-(375,'Urination'),
-(376,'Stomach Deformation');
+(1,'Ahegao',831),
+(2,'BBM / Fat Man',181),
+(3,'Blowjob',1363),
+(4,'Bukkake',148),
+(5,'Cunnilingus',268),
+(6,'Full Color',240),
+(7,'Group Sex',870),
+(8,'Harem',124),
+(9,'Large Breasts',1641),
+(10,'Magical Girl',33),
+(11,'Prostitution',213),
+(12,'Virginity (Male)',201),
+(13,'Condom',129),
+(14,'Defloration',380),
+(15,'Loli',314),
+(16,'MILF',372),
+(17,'Oppai Loli',41),
+(18,'Rape',408),
+(19,'School Uniform',541),
+(20,'Tanlines',95),
+(21,'Teacher',139),
+(22,'Nakadashi',1532),
+(23,'Threesome',341),
+(24,'Crotchless / Breastless',42),
+(25,'Pantyhose',169),
+(26,'Short Hair',347),
+(27,'Slut',115),
+(28,'Smug',17),
+(29,'Anal',1033),
+(30,'Dark Skin',377),
+(31,'Elf',92),
+(32,'Gyaru',148),
+(33,'Happy Sex',670),
+(34,'Pettanko',126),
+(35,'Bathroom Sex',56),
+(36,'Big Ass',491),
+(37,'Blindfold',73),
+(38,'Body Painting',5),
+(39,'Cheating',226),
+(40,'Double Penetration',300),
+(41,'Freckles',15),
+(42,'Gokkun',89),
+(43,'Hairy',329),
+(44,'Handjob',303),
+(45,'Hotpants',43),
+(46,'Lactation',164),
+(47,'Layer Cake',19),
+(48,'Megane',393),
+(49,'Mouth Gag',54),
+(50,'Paizuri',452),
+(51,'Sex Toys',300),
+(52,'Sweating',144),
+(53,'Transparent Clothing',26),
+(54,'Twintails',209),
+(55,'Waitress',13),
+(56,'Birth',43),
+(57,'Body Modification',16),
+(58,'Corruption',42),
+(59,'Dick Growth',50),
+(60,'Egg Laying',19),
+(61,'Futanari',211),
+(62,'Huge Breasts',249),
+(63,'Huge Penis',319),
+(64,'Impregnation',323),
+(65,'Mind Break',311),
+(66,'Monster',105),
+(67,'Pregnant',108),
+(68,'Stockings',839),
+(69,'Stomach Bulge',174),
+(70,'Yuri',62),
+(71,'Anilingus',175),
+(72,'Centaur',15),
+(73,'Fisting',39),
+(74,'Monster Girl',172),
+(75,'Comedy',60),
+(76,'Deepthroat',213),
+(77,'Femdom',510),
+(78,'Squirting',158),
+(79,'Tengu',8),
+(80,'Tsundere',52),
+(81,'X-ray',729),
+(82,'Animal Girl',106),
+(83,'Cervical Penetration',71),
+(84,'Collar',202),
+(85,'Cow Girl',34),
+(86,'Devil',63),
+(87,'Enema',25),
+(88,'Imouto',78),
+(89,'Incest',433),
+(90,'Kimono / Yukata',56),
+(91,'Mother',142),
+(92,'Netorare',44),
+(93,'Oni',35),
+(94,'Parasite',11),
+(95,'Prostate Massage',77),
+(96,'Ryona',16),
+(97,'Story Arc',90),
+(98,'Tankoubon',113),
+(99,'Uncensored',386),
+(100,'Yaoi',384),
+(101,'Inverted Nipples',87),
+(102,'Tall Girl',58),
+(103,'Office Lady',35),
+(104,'Elder Sister',89),
+(105,'Fangs',66),
+(106,'Hairy Armpits',61),
+(107,'Lingerie',193),
+(108,'Smegma',48),
+(109,'Soushuuhen',3),
+(110,'Straight Shota',416),
+(111,'Swinging / Netorase',20),
+(112,'Urethra Insertion',53),
+(113,'Yandere',48),
+(114,'Big Areola',119),
+(115,'Gangbang',138),
+(116,'Mind Control',132),
+(117,'Bondage',297),
+(118,'CBT',28),
+(119,'Face Sitting',71),
+(120,'Footjob',141),
+(121,'Shibari',14),
+(122,'Spanking',46),
+(123,'French Kissing',226),
+(124,'Leg Lock',106),
+(125,'Maledom',113),
+(126,'Royalty',15),
+(127,'Torn Clothing',16),
+(128,'Assjob',17),
+(129,'Reverse NTR',14),
+(130,'Netori',42),
+(131,'Masturbation',231),
+(132,'BDSM',65),
+(133,'Breast Expansion',34),
+(134,'Crossdressing',408),
+(135,'Male on Futa',67),
+(136,'Bunnygirl',54),
+(137,'Exhibitionism',220),
+(138,'Symbol Shaped Pupils',281),
+(139,'BBW',170),
+(140,'Muscle',103),
+(141,'Nose Hook',13),
+(142,'Plump',54),
+(143,'Scat',30),
+(144,'Tentacles',93),
+(145,'Breast Sucking',208),
+(146,'Tan',56),
+(147,'Tomboy',58),
+(148,'Bikini',192),
+(149,'Drunk',42),
+(150,'Nipple Penetration',33),
+(151,'Piercings',68),
+(152,'Swimsuit',271),
+(153,'Idol',63),
+(154,'Males only',313),
+(155,'Multiple Penises',23),
+(156,'Shota',350),
+(157,'Bisexual',61),
+(158,'Gender Bender',79),
+(159,'Humiliation',42),
+(160,'Tribadism',7),
+(161,'Trap',430),
+(162,'Fingering',237),
+(163,'Fox Girl',35),
+(164,'Futa on Female',17),
+(165,'Catgirl',74),
+(166,'Females only',3),
+(167,'Leotard',48),
+(168,'Miko',19),
+(169,'Armpit',51),
+(170,'Hypnosis',28),
+(171,'Smell',51),
+(172,'Decensored',99),
+(173,'Futanari on Futanari',54),
+(174,'Onahole',29),
+(175,'Asphyxiation',10),
+(176,'Bloomers',44),
+(177,'Drugs',143),
+(178,'Futa on Male',90),
+(179,'Nurse',48),
+(180,'Shemale',43),
+(181,'Small Penis',45),
+(182,'Spats',50),
+(183,'Spitroast',89),
+(184,'Mouse Girl',3),
+(185,'Sleeping',74),
+(186,'Cheerleader',15),
+(187,'DILF',59),
+(188,'Hat',43),
+(189,'Cosplay',78),
+(190,'Witch',23),
+(191,'Oyakodon',46),
+(192,'Filming',74),
+(193,'Slave',72),
+(194,'Daughter',36),
+(195,'Kunoichi',25),
+(196,'Age Regression',9),
+(197,'Maebari',4),
+(198,'Possession',18),
+(199,'Blackmail',81),
+(200,'Lamia',14),
+(201,'Long Tongue',22),
+(202,'Naked Apron',26),
+(203,'Nun',17),
+(204,'Shared Senses',5),
+(205,'Transformation',35),
+(206,'Giantess',20),
+(207,'Mermaid',4),
+(208,'Frotting',40),
+(209,'Maid',105),
+(210,'Age Progression',10),
+(211,'Dirty Old Man',75),
+(212,'Emotionless Sex',29),
+(213,'Gloves',45),
+(214,'Inseki',58),
+(215,'Invisible',6),
+(216,'Time Stop',9),
+(217,'Ghost',12),
+(218,'Watersports',156),
+(219,'Licking',116),
+(220,'Succubus',29),
+(221,'Eyepatch',16),
+(222,'Tattoo',43),
+(223,'Reverse Rape',96),
+(224,'Animal Boy',39),
+(225,'Bestiality',54),
+(226,'Pig',8),
+(227,'Vomit',46),
+(228,'Pegging',62),
+(229,'Strap-on',40),
+(230,'Legal Loli',10),
+(231,'Shimaidon',14),
+(232,'Sixty-Nine',62),
+(233,'Prolapse',22),
+(234,'Multiple Insertion',62),
+(235,'Reverse Harem',10),
+(236,'Chastity Belt',20),
+(237,'Brain Fuck',9),
+(238,'Amputee',8),
+(239,'Guro',12),
+(240,'Band-Aid / Pasties',30),
+(241,'Childhood Friend',77),
+(242,'Snuff',30),
+(243,'Twins',23),
+(244,'Bodysuit',50),
+(245,'Human Cattle',14),
+(246,'Orc',20),
+(247,'Pet Girl',28),
+(248,'Zombie',7),
+(249,'Diaper',9),
+(250,'Body Writing',24),
+(251,'Lowleg',19),
+(252,'Shimapan',41),
+(253,'Latex',37),
+(254,'Wings',21),
+(255,'Human Toilet',35),
+(256,'Tutor',11),
+(257,'Vampire',23),
+(258,'Dog Girl',27),
+(259,'Mask',12),
+(260,'Dog',9),
+(261,'Bride',8),
+(262,'Grandmother',6),
+(263,'Angel',8),
+(264,'Voyeurism',47),
+(265,'Unbirthing',5),
+(266,'Foot Fetish',31),
+(267,'Dragon Girl',3),
+(268,'Aunt',40),
+(269,'Father',9),
+(270,'Sumata',42),
+(271,'Stuck in Wall',20),
+(272,'Onsen',19),
+(273,'Niece',12),
+(274,'Furry',32),
+(275,'Uncle',6),
+(276,'Horse',14),
+(277,'Christmas',9),
+(278,'Orgasm Denial',45),
+(279,'Randoseru',6),
+(280,'Delusion',8),
+(281,'Chikan',38),
+(282,'Harpy',4),
+(283,'Fundoshi',12),
+(284,'Cousin',23),
+(285,'Ear Fuck',3),
+(286,'Spreading',21),
+(287,'Fairy',5),
+(288,'Petrification',1),
+(289,'Selfcest',12),
+(290,'Micro',6),
+(291,'Body Swap',5),
+(292,'Military Uniform',19),
+(293,'Insect Girl',2),
+(294,'Vore',19),
+(295,'Chinese Dress',7),
+(296,'Stalking',2),
+(297,'Robot Girl',9),
+(298,'Multiple Breasts',3),
+(299,'Torture',20),
+(300,'School Swimsuit',44),
+(301,'Phimosis',37),
+(302,'Nyotaimori',3),
+(303,'Doctor',4),
+(304,'Gothic',6),
+(305,'Autofellatio',6),
+(306,'Sex on the Phone',7),
+(307,'Otouto',24),
+(308,'Doll',4),
+(309,'Pajamas',4),
+(310,'NEET / Hikkikomori',6),
+(311,'Penis Birth',1),
+(312,'Slime Girl',9),
+(313,'Menstruation',2),
+(314,'Arachne',3),
+(315,'Widow',9),
+(316,'Tailjob',7),
+(317,'Anthology',6),
+(318,'Police Uniform',4),
+(319,'Dojikko',8),
+(320,'Alien',11),
+(321,'Solo Action',9),
+(322,'Dandere',6),
+(323,'Hairjob',4),
+(324,'Western',12),
+(325,'Wakamezake',2),
+(326,'Race Queen',1),
+(327,'Gaping',18),
+(328,'Living Clothes',2),
+(329,'Prison',1),
+(330,'All the Way through',3),
+(331,'Heterochromia',3),
+(332,'Kuudere',5),
+(333,'Demon | Incubus',24),
+(334,'Demon Girl | Succubus',52),
+(335,'Insect',1),
+(336,'Toddler',5),
+(337,'Plant Girl',5),
+(338,'Butler',4),
+(339,'Massage',2),
+(340,'Kotatsu',2),
+(341,'Granddaughter',1),
+(342,'Wormhole',4),
+(343,'Blindness',1),
+(344,'Slime',1),
+(345,'Braids',2),
+(346,'Machine',1),
+(347,'Ponytail',6),
+(348,'Josou Seme',1),
+(349,'Glory Hole',1),
+(350,'Sportswear',1),
+(351,'Textless',2),
+(352,'Unusual Teeth',1),
+(353,'Big Breasts',7),
+(354,'Crown',1),
+(355,'Sole Female',3),
+(356,'Sole Male',5),
+(357,'Sole Dickgirl',1),
+(358,'Horns',1),
+(359,'Kissing',1),
+(360,'Metal Armor',1),
+(361,'Thigh High Boots',1),
+(362,'Virginity',1),
+(363,'Unusual Pupils',1),
+(364,'Schoolboy Uniform',1),
+(365,'Glasses',2),
+(366,'Schoolgirl Uniform',1),
+(367,'Mosaic Censorship',1),
+(368,'Big Penis',2),
+(369,'Group',1),
+(370,'Ffm Threesome',1),
+(371,'Multiple Paizuri',1),
+(372,'Multi-Work Series',2),
+(373,'Shotacon',2),
+(374,'Piss Drinking',1),
+(375,'Urination',1),
+(376,'Stomach Deformation',1);
+INSERT INTO "BooksTitleFts"("BooksTitleFts") VALUES ('rebuild');
 CREATE UNIQUE INDEX idx_artist_name ON Artist (name COLLATE NOCASE);
+CREATE INDEX idx_bookartist_artist_id_book_id
+        ON BookArtist (artist_id, book_id);
+CREATE INDEX idx_bookcategory_category_id_book_id
+        ON BookCategory (category_id, book_id);
+CREATE INDEX idx_bookcharacter_character_id_book_id
+        ON BookCharacter (character_id, book_id);
+CREATE INDEX idx_bookcollection_collection_id_book_id
+        ON BookCollection (collection_id, book_id);
+CREATE INDEX idx_bookgroups_group_id_book_id
+        ON BookGroups (group_id, book_id);
+CREATE INDEX idx_booklist_list_id_book_id
+        ON BookList (list_id, book_id);
+CREATE INDEX idx_bookparody_parody_id_book_id
+        ON BookParody (parody_id, book_id);
+CREATE INDEX idx_books_last_change_id ON Books (last_change, id);
+CREATE INDEX idx_books_my_rating_id ON Books (my_rating, id);
+CREATE INDEX idx_books_pages_id ON Books (pages, id);
+CREATE INDEX idx_books_title_eng_id ON Books (title_eng, id);
+CREATE INDEX idx_books_title_foreign_id ON Books (title_foreign, id);
+CREATE INDEX idx_booktag_tag_id_book_id
+        ON BookTag (tag_id, book_id);
 CREATE UNIQUE INDEX idx_category_name ON Category (name COLLATE NOCASE);
 CREATE UNIQUE INDEX idx_character_name ON Character (name COLLATE NOCASE);
 CREATE UNIQUE INDEX idx_collection_name ON Collection (name COLLATE NOCASE);
+CREATE INDEX idx_externalinfo_book_id ON ExternalInfo (book_id);
 CREATE UNIQUE INDEX idx_groups_name ON Groups (name COLLATE NOCASE);
 CREATE INDEX idx_id_onpage_imported_from ON ExternalInfo (id_onpage, imported_from);
 CREATE UNIQUE INDEX idx_list_name ON List (name COLLATE NOCASE);
@@ -61703,6 +64528,236 @@ CREATE UNIQUE INDEX "idx_title_eng_foreign" ON "Books" (
 	"title_eng",
 	"title_foreign"
 );
+CREATE TRIGGER book_summary_artist_rename
+            AFTER UPDATE OF name ON Artist
+            BEGIN
+                UPDATE BookSummary SET artists = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookArtist bx, Artist x
+                    WHERE bx.book_id = BookSummary.book_id AND x.id = bx.artist_id
+                    ORDER BY x.name
+                )
+            ), '')
+                WHERE book_id IN (
+                    SELECT book_id FROM BookArtist WHERE artist_id = NEW.id);
+            END;
+CREATE TRIGGER book_summary_bookartist_delete
+                AFTER DELETE ON BookArtist
+                BEGIN
+                    UPDATE BookSummary SET artists = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookArtist bx, Artist x
+                    WHERE bx.book_id = OLD.book_id AND x.id = bx.artist_id
+                    ORDER BY x.name
+                )
+            ), '')
+                    WHERE book_id = OLD.book_id;
+                END;
+CREATE TRIGGER book_summary_bookartist_insert
+                AFTER INSERT ON BookArtist
+                BEGIN
+                    UPDATE BookSummary SET artists = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookArtist bx, Artist x
+                    WHERE bx.book_id = NEW.book_id AND x.id = bx.artist_id
+                    ORDER BY x.name
+                )
+            ), '')
+                    WHERE book_id = NEW.book_id;
+                END;
+CREATE TRIGGER book_summary_books_delete
+        AFTER DELETE ON Books
+        BEGIN
+            DELETE FROM BookSummary WHERE book_id = OLD.id;
+        END;
+CREATE TRIGGER book_summary_books_insert
+        AFTER INSERT ON Books
+        BEGIN
+            INSERT OR REPLACE INTO BookSummary(book_id) VALUES (NEW.id);
+        END;
+CREATE TRIGGER book_summary_booktag_delete
+                AFTER DELETE ON BookTag
+                BEGIN
+                    UPDATE BookSummary SET tags = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookTag bx, Tag x
+                    WHERE bx.book_id = OLD.book_id AND x.id = bx.tag_id
+                    ORDER BY x.name
+                )
+            ), '')
+                    WHERE book_id = OLD.book_id;
+                END;
+CREATE TRIGGER book_summary_booktag_insert
+                AFTER INSERT ON BookTag
+                BEGIN
+                    UPDATE BookSummary SET tags = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookTag bx, Tag x
+                    WHERE bx.book_id = NEW.book_id AND x.id = bx.tag_id
+                    ORDER BY x.name
+                )
+            ), '')
+                    WHERE book_id = NEW.book_id;
+                END;
+CREATE TRIGGER book_summary_externalinfo_delete
+            AFTER DELETE ON ExternalInfo
+            BEGIN
+                UPDATE BookSummary SET avg_ext_rating = (
+        SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo WHERE book_id = OLD.book_id)
+                WHERE book_id = OLD.book_id;
+            END;
+CREATE TRIGGER book_summary_externalinfo_insert
+            AFTER INSERT ON ExternalInfo
+            BEGIN
+                UPDATE BookSummary SET avg_ext_rating = (
+        SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo WHERE book_id = NEW.book_id)
+                WHERE book_id = NEW.book_id;
+            END;
+CREATE TRIGGER book_summary_externalinfo_update
+        AFTER UPDATE OF rating, book_id ON ExternalInfo
+        BEGIN
+            UPDATE BookSummary SET avg_ext_rating = (
+        SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo WHERE book_id = OLD.book_id)
+            WHERE book_id = OLD.book_id;
+            UPDATE BookSummary SET avg_ext_rating = (
+        SELECT AVG(NULLIF(rating, 0)) FROM ExternalInfo WHERE book_id = NEW.book_id)
+            WHERE book_id = NEW.book_id;
+        END;
+CREATE TRIGGER book_summary_tag_rename
+            AFTER UPDATE OF name ON Tag
+            BEGIN
+                UPDATE BookSummary SET tags = 
+            COALESCE((
+                SELECT group_concat(name, ';') FROM (
+                    SELECT x.name AS name FROM BookTag bx, Tag x
+                    WHERE bx.book_id = BookSummary.book_id AND x.id = bx.tag_id
+                    ORDER BY x.name
+                )
+            ), '')
+                WHERE book_id IN (
+                    SELECT book_id FROM BookTag WHERE tag_id = NEW.id);
+            END;
+CREATE TRIGGER bookartist_count_delete
+            AFTER DELETE ON BookArtist
+            BEGIN
+                UPDATE Artist SET book_count = book_count - 1
+                WHERE id = OLD.artist_id;
+            END;
+CREATE TRIGGER bookartist_count_insert
+            AFTER INSERT ON BookArtist
+            BEGIN
+                UPDATE Artist SET book_count = book_count + 1
+                WHERE id = NEW.artist_id;
+            END;
+CREATE TRIGGER bookcategory_count_delete
+            AFTER DELETE ON BookCategory
+            BEGIN
+                UPDATE Category SET book_count = book_count - 1
+                WHERE id = OLD.category_id;
+            END;
+CREATE TRIGGER bookcategory_count_insert
+            AFTER INSERT ON BookCategory
+            BEGIN
+                UPDATE Category SET book_count = book_count + 1
+                WHERE id = NEW.category_id;
+            END;
+CREATE TRIGGER bookcharacter_count_delete
+            AFTER DELETE ON BookCharacter
+            BEGIN
+                UPDATE Character SET book_count = book_count - 1
+                WHERE id = OLD.character_id;
+            END;
+CREATE TRIGGER bookcharacter_count_insert
+            AFTER INSERT ON BookCharacter
+            BEGIN
+                UPDATE Character SET book_count = book_count + 1
+                WHERE id = NEW.character_id;
+            END;
+CREATE TRIGGER bookcollection_count_delete
+            AFTER DELETE ON BookCollection
+            BEGIN
+                UPDATE Collection SET book_count = book_count - 1
+                WHERE id = OLD.collection_id;
+            END;
+CREATE TRIGGER bookcollection_count_insert
+            AFTER INSERT ON BookCollection
+            BEGIN
+                UPDATE Collection SET book_count = book_count + 1
+                WHERE id = NEW.collection_id;
+            END;
+CREATE TRIGGER bookgroups_count_delete
+            AFTER DELETE ON BookGroups
+            BEGIN
+                UPDATE Groups SET book_count = book_count - 1
+                WHERE id = OLD.group_id;
+            END;
+CREATE TRIGGER bookgroups_count_insert
+            AFTER INSERT ON BookGroups
+            BEGIN
+                UPDATE Groups SET book_count = book_count + 1
+                WHERE id = NEW.group_id;
+            END;
+CREATE TRIGGER booklist_count_delete
+            AFTER DELETE ON BookList
+            BEGIN
+                UPDATE List SET book_count = book_count - 1
+                WHERE id = OLD.list_id;
+            END;
+CREATE TRIGGER booklist_count_insert
+            AFTER INSERT ON BookList
+            BEGIN
+                UPDATE List SET book_count = book_count + 1
+                WHERE id = NEW.list_id;
+            END;
+CREATE TRIGGER bookparody_count_delete
+            AFTER DELETE ON BookParody
+            BEGIN
+                UPDATE Parody SET book_count = book_count - 1
+                WHERE id = OLD.parody_id;
+            END;
+CREATE TRIGGER bookparody_count_insert
+            AFTER INSERT ON BookParody
+            BEGIN
+                UPDATE Parody SET book_count = book_count + 1
+                WHERE id = NEW.parody_id;
+            END;
+CREATE TRIGGER books_title_fts_delete
+        AFTER DELETE ON Books
+        BEGIN
+            INSERT INTO BooksTitleFts(BooksTitleFts, rowid, title_eng, title_foreign)
+            VALUES ('delete', OLD.id, OLD.title_eng, OLD.title_foreign);
+        END;
+CREATE TRIGGER books_title_fts_insert
+        AFTER INSERT ON Books
+        BEGIN
+            INSERT INTO BooksTitleFts(rowid, title_eng, title_foreign)
+            VALUES (NEW.id, NEW.title_eng, NEW.title_foreign);
+        END;
+CREATE TRIGGER books_title_fts_update
+        AFTER UPDATE OF title_eng, title_foreign ON Books
+        BEGIN
+            INSERT INTO BooksTitleFts(BooksTitleFts, rowid, title_eng, title_foreign)
+            VALUES ('delete', OLD.id, OLD.title_eng, OLD.title_foreign);
+            INSERT INTO BooksTitleFts(rowid, title_eng, title_foreign)
+            VALUES (NEW.id, NEW.title_eng, NEW.title_foreign);
+        END;
+CREATE TRIGGER booktag_count_delete
+            AFTER DELETE ON BookTag
+            BEGIN
+                UPDATE Tag SET book_count = book_count - 1
+                WHERE id = OLD.tag_id;
+            END;
+CREATE TRIGGER booktag_count_insert
+            AFTER INSERT ON BookTag
+            BEGIN
+                UPDATE Tag SET book_count = book_count + 1
+                WHERE id = NEW.tag_id;
+            END;
 CREATE TRIGGER set_books_last_change
     AFTER UPDATE ON Books
     BEGIN
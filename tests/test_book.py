@@ -9,6 +9,7 @@ from manga_db.manga_db import MangaDB
 from manga_db.manga import Book
 from manga_db.ext_info import ExternalInfo
 from manga_db.constants import LANG_IDS
+from manga_db.db.constants import NOT_LOADED
 
 @pytest.mark.parametrize("title_eng, title_foreign, expected", [
     ("English", "Foreign", "English / Foreign"),
@@ -55,6 +56,49 @@ def test_fetch_assoc_col(monkeypatch, setup_mdb_dir):
     assert b._fetch_associated_column("artist") == ["Fan no Hitori"]
 
 
+def test_lazy_assoc_col(monkeypatch, setup_mdb_dir):
+    tmpdir = setup_mdb_dir
+    os.chdir(tmpdir)
+    mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    memdb = load_db_from_sql_file(mdb_file, ":memory:", True)
+    monkeypatch.setattr("manga_db.manga_db.MangaDB._load_or_create_sql_db",
+                        lambda x, y, z: (memdb, None))
+    mdb = MangaDB(tmpdir, mdb_file)
+
+    statements = []
+    memdb.set_trace_callback(statements.append)
+    b = mdb.get_book(14)
+    # only the Books row was queried
+    assert len(statements) == 1
+    for col in Book.ASSOCIATED_COLUMNS:
+        assert vars(b)[col] is NOT_LOADED
+        assert not getattr(Book, col).is_loaded(b)
+
+    assert b.artist == ["Fan no Hitori"]
+    assert len(statements) == 2
+    assert Book.artist.is_loaded(b)
+    # loading doesn't count as change
+    assert not b._committed_state
+    # already loaded -> no additional query
+    assert b.artist == ["Fan no Hitori"]
+    assert len(statements) == 2
+    assert not Book.tag.is_loaded(b)
+
+    # assigning to an unloaded column loads it first so we have a committed state to diff against
+    b.character = ["Char1"]
+    assert b._committed_state["character"] == []
+    b.tag.append("Test")
+    assert "Test" not in b._committed_state["tag"]
+    assert len(b._committed_state["tag"]) == 13
+
+    # expiring discards changes
+    b.update_assoc_columns_from_db()
+    assert not b._committed_state
+    assert vars(b)["tag"] is NOT_LOADED
+    assert b.character == []
+    memdb.set_trace_callback(None)
+
+
 def test_upd_assoc_col(monkeypatch, setup_mdb_dir):
     # update_assoc_columns/get_assoc_cols
     tmpdir = setup_mdb_dir
@@ -0,0 +1,87 @@
+import os
+import sqlite3
+import pytest
+
+from utils import TESTS_DIR, setup_tmpdir, load_db_from_sql_file
+
+from manga_db.db.backup import backup_db, snapshot_db, compact_db, AUTO_VACUUM_INCREMENTAL
+
+
+def _nr_books(db_filename):
+    db_con = sqlite3.connect(db_filename)
+    try:
+        return db_con.execute("SELECT count(*) FROM Books").fetchone()[0]
+    finally:
+        db_con.close()
+
+
+def test_backup_db(setup_tmpdir):
+    tmpdir = setup_tmpdir
+    sql_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    db_filename = os.path.join(tmpdir, "manga_db.sqlite")
+    db_con = load_db_from_sql_file(sql_file, db_filename)
+    db_con.execute("PRAGMA journal_mode=WAL")
+    # stays in the WAL since the connection is kept open
+    db_con.execute("DELETE FROM Books WHERE id > 5")
+    db_con.commit()
+    nr_books = db_con.execute("SELECT count(*) FROM Books").fetchone()[0]
+
+    backup_filename = os.path.join(tmpdir, "backup.sqlite")
+    with open(backup_filename, "w") as f:
+        f.write("replaced")
+    progress = []
+    backup_db(db_filename, backup_filename, pages=2,
+              progress=lambda copied, total: progress.append((copied, total)))
+    assert _nr_books(backup_filename) == nr_books
+    assert len(progress) > 1
+    total_pages = progress[-1][1]
+    assert progress[-1] == (total_pages, total_pages)
+    assert not os.path.exists(f"{backup_filename}.tmp")
+
+    with pytest.raises(ValueError):
+        backup_db(db_filename, backup_filename, pages=0)
+
+    # connection as source and dest
+    restored = sqlite3.connect(":memory:")
+    backup_db(db_con, restored)
+    assert restored.execute("SELECT count(*) FROM Books").fetchone()[0] == nr_books
+    restored.close()
+
+    snapshot_filename = os.path.join(tmpdir, "snapshot.sqlite")
+    snapshot_db(db_filename, snapshot_filename)
+    assert _nr_books(snapshot_filename) == nr_books
+    with pytest.raises(FileExistsError):
+        snapshot_db(db_filename, snapshot_filename)
+    db_con.close()
+
+
+def test_compact_db(setup_tmpdir):
+    tmpdir = setup_tmpdir
+    db_filename = os.path.join(tmpdir, "compact.sqlite")
+    db_con = sqlite3.connect(db_filename)
+    db_con.execute("CREATE TABLE t (val TEXT)")
+    db_con.executemany("INSERT INTO t VALUES (?)", [("x" * 1000,) for _ in range(500)])
+    db_con.commit()
+    db_con.execute("DELETE FROM t")
+    db_con.commit()
+
+    # not enough free pages for the one-time full VACUUM
+    compact_db(db_con, min_free_full_vacuum=1.1)
+    assert db_con.execute("PRAGMA auto_vacuum").fetchone()[0] != AUTO_VACUUM_INCREMENTAL
+    assert db_con.execute("PRAGMA freelist_count").fetchone()[0] > 0
+
+    compact_db(db_con)
+    assert db_con.execute("PRAGMA auto_vacuum").fetchone()[0] == AUTO_VACUUM_INCREMENTAL
+    assert db_con.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    db_con.executemany("INSERT INTO t VALUES (?)", [("x" * 1000,) for _ in range(500)])
+    db_con.commit()
+    db_con.execute("DELETE FROM t")
+    db_con.commit()
+    free_pages = db_con.execute("PRAGMA freelist_count").fetchone()[0]
+    # releases at most max_pages
+    compact_db(db_con, max_pages=10)
+    assert db_con.execute("PRAGMA freelist_count").fetchone()[0] == free_pages - 10
+    compact_db(db_con)
+    assert db_con.execute("PRAGMA freelist_count").fetchone()[0] == 0
+    db_con.close()
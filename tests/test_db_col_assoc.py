@@ -1,6 +1,7 @@
 import pytest
 
 from manga_db.db.column_associated import trackable_type, AssociatedColumnOne, AssociatedColumnMany
+from manga_db.db.column import committed_state_callback, needs_committed_state
 from manga_db.db.constants import Relationship
 
 
@@ -96,3 +97,27 @@ def test_trackable_type():
     assert o.revisions == [[], [1], [1, 2], [1, 2, 3, 4, 5], [1, 3, 4, 5]]
 
 
+def test_trackable_type_class_reused():
+    class WithTrackable:
+        def __init__(self, trackable):
+            self._committed_state = {}
+            self.trackable = trackable_type(self, "trackable", list, committed_state_callback,
+                                            trackable, needs_before=needs_committed_state)
+    o1 = WithTrackable([1, 2])
+    o2 = WithTrackable([3])
+    assert type(o1.trackable) is type(o2.trackable)
+    assert type(o1.trackable).__name__ == "trackable_list"
+
+    # non-mutating methods and mutations without effect don't count as change
+    assert 1 in o1.trackable and o1.trackable.index(2) == 1
+    o1.trackable.sort()
+    assert not o1._committed_state
+
+    o1.trackable.append(3)
+    assert o1._committed_state == {"trackable": [1, 2]}
+    assert type(o1._committed_state["trackable"]) is list
+    o1.trackable.remove(1)
+    # only first change is recorded
+    assert o1._committed_state == {"trackable": [1, 2]}
+    assert o1.trackable == [2, 3]
+    assert not o2._committed_state
@@ -0,0 +1,106 @@
+import os
+import sqlite3
+
+from utils import TESTS_DIR, load_db_from_sql_file, read_file
+
+from manga_db.manga_db import MangaDB
+from manga_db.db.query_stats import (
+        normalize_sql, statement_shape, explain_query_plan, query_plan_report,
+        connect, ProfilingConnection, STATEMENT_CACHE_SIZE
+        )
+
+
+def test_normalize_sql():
+    assert normalize_sql("""
+        SELECT *  FROM Books -- comment with 'quote
+        WHERE title_eng = 'two  spaces -- no comment'
+        /* block
+           comment */ AND id = ?""") == (
+        "SELECT * FROM Books WHERE title_eng = 'two  spaces -- no comment' AND id = ?")
+    assert normalize_sql("SELECT \"a  b\"\n,-1 FROM x") == "SELECT \"a  b\" ,-1 FROM x"
+    assert statement_shape("SELECT * FROM Tag WHERE name IN (?, ?,?) AND id = ?") == (
+        "SELECT * FROM Tag WHERE name IN (?, ...) AND id = ?")
+
+
+def test_statement_stats(monkeypatch):
+    mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    memdb = connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+    memdb.row_factory = sqlite3.Row
+    memdb.executescript(read_file(mdb_file))
+    monkeypatch.setattr("manga_db.manga_db.MangaDB._load_or_create_sql_db",
+                        lambda x, y, z: (memdb, None))
+    mdb = MangaDB(os.path.dirname(mdb_file), mdb_file)
+    assert isinstance(mdb.db_con, ProfilingConnection)
+    mdb.db_con.reset_statement_stats()
+
+    for tags in (["Large Breasts"], ["Large Breasts", "Big Ass"], ["Nakadashi"]):
+        mdb.search(f"tag:{';'.join(tags)}")
+    mdb.db_con.execute("SELECT * FROM Books WHERE status_id > ?", (0,)).fetchall()
+
+    stats = mdb.db_con.statement_stats
+    assert stats["SELECT * FROM Books WHERE status_id > ?"].count == 1
+    # single tag searches have the same shape
+    search_stats = [s for shape, s in stats.items() if "FROM BookTag WHERE tag_id" in shape]
+    assert len(search_stats) == 2
+    assert sorted(s.count for s in search_stats) == [1, 2]
+    assert all(s.total_time > 0 for s in search_stats)
+
+    plan = explain_query_plan(mdb.db_con, "SELECT * FROM Books WHERE status_id > ?", (0,))
+    assert plan[0].startswith("|--SCAN")
+    assert plan[0].endswith("<- full scan")
+
+    report = query_plan_report(mdb.db_con, 3)
+    assert report.count("ms total") == 3
+    # explaining doesn't get recorded
+    assert not any(shape.startswith("EXPLAIN") for shape in stats)
+
+    mdb.db_con.close()
+    assert STATEMENT_CACHE_SIZE > 128
+
+
+def test_query_plan_report_plain_connection():
+    db_con = load_db_from_sql_file(
+        os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql"), ":memory:", True)
+    assert query_plan_report(db_con) == "Statement stats are not recorded for this connection!"
+
+
+def test_main_page_query_plans(monkeypatch):
+    mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    memdb = connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+    memdb.row_factory = sqlite3.Row
+    memdb.executescript(read_file(mdb_file))
+    monkeypatch.setattr("manga_db.manga_db.MangaDB._load_or_create_sql_db",
+                        lambda x, y, z: (memdb, None))
+    mdb = MangaDB(os.path.dirname(mdb_file), mdb_file)
+
+    for col in ("id", "title_eng", "title_foreign", "pages", "my_rating", "last_change"):
+        for direction in ("ASC", "DESC"):
+            order_by = f"Books.{col} {direction}"
+            books = mdb.get_x_books(5, order_by=order_by)
+            last, first = books[-1], books[0]
+            if col == "id":
+                after, before = (last.id,), (first.id,)
+            else:
+                after = (getattr(last, col), last.id)
+                before = (getattr(first, col), first.id)
+            mdb.get_x_books(5, after=after, order_by=order_by)
+            mdb.get_x_books(5, before=before, order_by=order_by)
+            # ids are unique so books are always in the id_map afterwards
+            mdb.id_map.clear()
+
+    checked = 0
+    for shape, stats in mdb.db_con.statement_stats.items():
+        if stats.params is None or shape.startswith("PRAGMA"):
+            continue
+        plan = explain_query_plan(mdb.db_con, stats.sql, stats.params)
+        assert not any("TEMP B-TREE" in line for line in plan), (shape, plan)
+        for line in plan:
+            if "SCAN Books" in line:
+                # walking the rowid b-tree when sorting by id is fine since it stops
+                # after LIMIT rows
+                assert "USING" in line or shape.startswith(
+                    "SELECT * FROM Books ORDER BY Books.id"), (shape, plan)
+        checked += 1
+    assert checked > 10
+
+    mdb.db_con.close()
@@ -5,6 +5,8 @@ import datetime
 import shutil
 import sqlite3
 import importlib
+import gzip
+import csv
 
 from utils import load_db_from_sql_file, TESTS_DIR, setup_tmpdir, load_db
 from manga_db.manga_db import MangaDB
@@ -13,7 +15,7 @@ from manga_db.ext_info import ExternalInfo
 # from manga_db.db.column import Column
 # from manga_db.db.column_associated import AssociatedColumnBase
 from manga_db.db.constants import Relationship
-from manga_db.db.export import export_to_sql
+from manga_db.db.export import export_to_sql, export_csv_from_sql
 import manga_db.db.migrate as migrate
 
 
@@ -85,8 +87,10 @@ def test_created_db_matches_row_classes():
             'REAL': float,
             'DATE': datetime.date,
             }
+    # fts5 shadow tables (BooksTitleFts_*) are managed by sqlite itself
     all_expected_tables = mdb.db_con.execute(
-            "SELECT tbl_name FROM sqlite_master WHERE type = 'table' ORDER BY name").fetchall()
+            "SELECT tbl_name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'BooksTitleFts\\_%' ESCAPE '\\' ORDER BY name").fetchall()
     all_expected_tables = sorted([r[0] for r in all_expected_tables])
 
     all_tables = []
@@ -152,11 +156,12 @@ def test_created_db_matches_row_classes():
 
     # Censorship, Languages, Sites and Status are extra tables not used by any DBRow object
     # they're used in MangaDB class directly (manual sql code)
+    # BooksTitleFts is the full-text index on the Books' titles
     # make unique since we might have duplicate entries: one for the TableName(DBRow) class
     # and one or more as associated column
     all_tables = list(set(all_tables))
     assert sorted(all_tables +
-                  ["Censorship", "Languages", "Sites", "Status",
+                  ["BookSummary", "BooksTitleFts", "Censorship", "Languages", "Sites", "Status",
                    migrate.VERSION_TABLE]) == all_expected_tables
 
 
@@ -789,3 +794,46 @@ def test_gather_migrations(setup_tmpdir, monkeypatch):
     assert migrations[v].version_id == v and migrations[v].filename == found[2]
     v = 5432
     assert migrations[v].version_id == v and migrations[v].filename == found[3]
+
+
+def test_export_streaming(setup_tmpdir, monkeypatch):
+    tmpdir = setup_tmpdir
+    # multiple chunks per table
+    monkeypatch.setattr("manga_db.db.export.EXPORT_CHUNK_SIZE", 3)
+
+    sql_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    with open(sql_file, "r", encoding="UTF-8") as f:
+        expected = f.read()
+    db_file = os.path.join(tmpdir, "manga_db.sqlite")
+    db_con = load_db_from_sql_file(sql_file, db_file)
+
+    exported_sql = os.path.join(tmpdir, "exported.sql")
+    progress = []
+    export_to_sql(exported_sql, db_con, progress=lambda *args: progress.append(args))
+    with open(exported_sql, "r", encoding="UTF-8") as f:
+        assert f.read() == expected
+    # reports every chunk and ends with the total of every table
+    nr_books = db_con.execute("SELECT count(*) FROM Books").fetchone()[0]
+    assert ("Books", 3, nr_books) in progress
+    assert ("Books", nr_books, nr_books) in progress
+    assert len(progress) > len({tbl for tbl, _, _ in progress})
+
+    # parallel dump over separate connections produces the same script
+    exported_gz = os.path.join(tmpdir, "exported.sql.gz")
+    export_to_sql(exported_gz, db_con, compression="gzip", parallel=True, max_workers=3)
+    with gzip.open(exported_gz, "rt", encoding="UTF-8") as f:
+        assert f.read() == expected
+
+    with pytest.raises(ValueError):
+        export_to_sql(exported_sql, db_con, compression="rar")
+
+    exported_csv = os.path.join(tmpdir, "exported.csv.gz")
+    export_csv_from_sql(exported_csv, db_con, compression="gzip")
+    with gzip.open(exported_csv, "rt", encoding="UTF-8", newline="") as f:
+        rows = list(csv.reader(f, dialect="excel", delimiter=";"))
+    nr_rows = db_con.execute(
+        "SELECT count(*) FROM Books LEFT JOIN ExternalInfo ei ON Books.id = ei.book_id"
+    ).fetchone()[0]
+    assert rows[0][:2] == ["id", "title_eng"]
+    assert len(rows) == nr_rows + 1
+    db_con.close()
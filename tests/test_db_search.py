@@ -1,10 +1,12 @@
 import os
+import pytest
+
 from utils import setup_mdb_dir, TESTS_DIR, load_db_from_sql_file
 
 from manga_db.manga_db import MangaDB
 from manga_db.db.search import (
         search_assoc_col_string_parse, validate_order_by_str, search_book_by_title,
-        search_normal_mult_assoc, keyset_pagination_statment
+        search_normal_mult_assoc, keyset_pagination_statment, title_fts_match_query
         )
 
 
@@ -61,6 +63,50 @@ def test_search_book_by_title(monkeypatch, setup_mdb_dir):
             assert len(rows) == nr
 
 
+def test_title_fts_match_query():
+    assert title_fts_match_query("atsu", "trigram") == '"atsu"'
+    assert title_fts_match_query(' say "hi" ', "trigram") == '"say ""hi"""'
+    # too short for trigrams -> fall back to LIKE
+    assert title_fts_match_query("at", "trigram") is None
+    assert title_fts_match_query("top atsu", "unicode61") == '"top"* "atsu"*'
+    assert title_fts_match_query("  ", "unicode61") is None
+    assert title_fts_match_query("atsu", None) is None
+
+
+def test_search_book_by_title_fts(monkeypatch, setup_mdb_dir):
+    tmpdir = setup_mdb_dir
+    mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    memdb = load_db_from_sql_file(mdb_file, ":memory:", True)
+    monkeypatch.setattr("manga_db.manga_db.MangaDB._load_or_create_sql_db",
+                        lambda x, y, z: (memdb, None))
+    mdb = MangaDB(tmpdir, mdb_file)
+
+    def like_ids(title):
+        return [r[0] for r in mdb.db_con.execute(
+            "SELECT id FROM Books WHERE title_eng LIKE ? OR title_foreign LIKE ? "
+            "ORDER BY id DESC", (f"%{title}%", f"%{title}%"))]
+
+    # same results as LIKE
+    for title in ("atsu", "top", "Top", "にな", "at", "afhnksagjoiks"):
+        rows = search_book_by_title(mdb.db_con, title)
+        assert [r["id"] for r in rows] == like_ids(title)
+
+    rows = search_book_by_title(mdb.db_con, "atsu", "rank")
+    assert sorted(r["id"] for r in rows) == [2, 6]
+    with pytest.raises(ValueError):
+        search_book_by_title(mdb.db_con, "atsu", "rank", -1, 6)
+
+    # index is kept in sync by triggers
+    mdb.db_con.execute("UPDATE Books SET title_eng = 'Completely Qwxyz' WHERE id = 2")
+    assert [r["id"] for r in search_book_by_title(mdb.db_con, "qwxyz")] == [2]
+    assert [r["id"] for r in search_book_by_title(mdb.db_con, "atsu")] == like_ids("atsu")
+    mdb.db_con.execute("DELETE FROM Books WHERE id = 2")
+    assert not search_book_by_title(mdb.db_con, "qwxyz")
+
+    rows = search_normal_mult_assoc(mdb.db_con, {"title": "top"}, {}, {})
+    assert [r["id"] for r in rows] == like_ids("top")
+
+
 def test_keyset_pagination(monkeypatch):
     db_file = os.path.join(TESTS_DIR, "db_test_files", "manga_db.sqlite.sql")
     memdb = load_db_from_sql_file(db_file, ":memory:", True)
@@ -238,8 +284,8 @@ def test_keyset_pagination_statement():
                   "ORDER BY Books.pages ASC"], [], (20, 25), None, "Books.pages ASC", True),
                 ("""SELECT *
                 FROM Books
-                WHERE (Books.pages > ? OR (Books.pages == ? AND Books.id > ?) )
-                ORDER BY Books.pages ASC, Books.id ASC""", [20, 20, 25])  # empty tuple is () not (,)
+                WHERE (Books.pages, Books.id) > (?, ?)
+                ORDER BY Books.pages ASC, Books.id ASC""", [20, 25])  # empty tuple is () not (,)
             ),
             # assoc col after
             (
@@ -311,8 +357,8 @@ def test_keyset_pagination_statement():
                  "Books.title_foreign ASC", True),
                 ("""SELECT *
                 FROM Books
-                WHERE (Books.title_foreign > ? OR (Books.title_foreign == ? AND Books.id > ?) )
-                ORDER BY Books.title_foreign ASC, Books.id ASC""", ["test", "test", 250])
+                WHERE (Books.title_foreign, Books.id) > (?, ?)
+                ORDER BY Books.title_foreign ASC, Books.id ASC""", ["test", 250])
             ),
             # forwards(after), DESC, NULL value as primary
             (
@@ -400,11 +446,11 @@ def test_keyset_pagination_statement():
                     FROM (
                        SELECT *
                        FROM Books
-                       WHERE (Books.title_foreign > ? OR (Books.title_foreign == ? AND Books.id > ?) )
+                       WHERE (Books.title_foreign, Books.id) > (?, ?)
                        ORDER BY Books.title_foreign ASC, Books.id ASC
                    ) AS t
                    ORDER BY t.title_foreign DESC, t.id DESC
-                """, ["test", "test", 250])
+                """, ["test", 250])
             ),
             ]
 
@@ -573,3 +619,80 @@ def test_search_normal_mult_assoc(monkeypatch, setup_mdb_dir):
         # iterate over expected since no rows returned would just pass otherwise
         for i, exp_id in enumerate(expected):
             assert rows[i]["id"] == exp_id
+
+
+def test_search_normal_mult_assoc_intersect(monkeypatch):
+    db_file = os.path.join(TESTS_DIR, "db_test_files", "manga_db.sqlite.sql")
+    memdb = load_db_from_sql_file(db_file, ":memory:", True)
+    monkeypatch.setattr("manga_db.manga_db.MangaDB._load_or_create_sql_db",
+                        lambda x, y, z: (memdb, None))
+    mdb = MangaDB(os.path.dirname(db_file), db_file, read_only=True)
+
+    tags = ['Large Breasts', 'Anal', 'Blowjob']
+    expected = [r[0] for r in mdb.db_con.execute(f"""
+        SELECT Books.id FROM Books, Tag, BookTag
+        WHERE Books.id = BookTag.book_id
+        AND Tag.id = BookTag.tag_id
+        AND Tag.name IN (?,?,?)
+        AND Books.id NOT IN (
+            SELECT BookList.book_id FROM BookList, List
+            WHERE List.id = BookList.list_id AND List.name = ?
+        )
+        GROUP BY Books.id HAVING COUNT(Books.id) = 3
+        ORDER BY Books.id DESC""", (*tags, 'downloaded'))]
+    assert expected
+
+    statements = []
+    mdb.db_con.set_trace_callback(statements.append)
+    rows = search_normal_mult_assoc(mdb.db_con, {}, {"tag": tags}, {"list": ["downloaded"]})
+    mdb.db_con.set_trace_callback(None)
+    assert [r["id"] for r in rows] == expected
+
+    # unbound parameters are NULL
+    plan = [r[3] for r in mdb.db_con.execute(f"EXPLAIN QUERY PLAN {statements[-1]}")]
+    # reverse index is used for the included tags and no temp b-tree for grouping
+    assert any("idx_booktag_tag_id_book_id" in detail for detail in plan)
+    assert not any("GROUP BY" in detail for detail in plan)
+
+
+def test_iter_search(monkeypatch):
+    db_file = os.path.join(TESTS_DIR, "db_test_files", "manga_db.sqlite.sql")
+    memdb = load_db_from_sql_file(db_file, ":memory:", True)
+    monkeypatch.setattr("manga_db.manga_db.MangaDB._load_or_create_sql_db",
+                        lambda x, y, z: (memdb, None))
+    mdb = MangaDB(os.path.dirname(db_file), db_file, read_only=True)
+
+    for search_str in ("", "tag:Nakadashi", "tag:Nakadashi;!Stockings list:!to-read",
+                       "title:girl"):
+        for order_by in ("Books.id DESC", "Books.id ASC", "Books.title_eng ASC",
+                         "Books.pages DESC", "Books.my_rating DESC", "Books.my_rating ASC"):
+            if search_str:
+                expected = [b.id for b in mdb.search(search_str, order_by=order_by, eager=(),
+                                                     limit=-1)]
+            else:
+                expected = [b.id for b in mdb.get_x_books(-1, order_by=order_by, eager=())]
+            assert expected
+            # a few batches each (the whole library has ~2800 books)
+            for batch_size in ((1, 3) if len(expected) < 50 else
+                               (len(expected) // 4 + 1, 5000)):
+                rows = list(mdb.iter_search(search_str, order_by=order_by,
+                                            batch_size=batch_size))
+                assert [r["id"] for r in rows] == expected
+
+    # only the ids of the current batch are requested
+    statements = []
+    mdb.db_con.set_trace_callback(statements.append)
+    it = mdb.iter_search("tag:Nakadashi", batch_size=2, books=True, eager=("tag",))
+    first = next(it)
+    assert first.__class__.__name__ == "Book"
+    assert "Nakadashi" in first.tag
+    nr_statements = len(statements)
+    next(it)
+    # 2nd book is from the same batch
+    assert len(statements) == nr_statements
+    next(it)
+    mdb.db_con.set_trace_callback(None)
+    assert len(statements) > nr_statements
+
+    with pytest.raises(ValueError):
+        next(mdb.iter_search("", batch_size=0))
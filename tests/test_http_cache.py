@@ -0,0 +1,162 @@
+import os
+import json
+import datetime
+import threading
+import pytest
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from utils import setup_tmpdir
+
+from manga_db import http_cache
+from manga_db.http_cache import HTTPCache
+from manga_db.extractor.base import BaseMangaExtractor, MangaExtractorData
+
+
+class CachingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # path -> (etag, body)
+    pages = {}
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path not in self.pages:
+            self.requests.append((self.path, 404))
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag, body = self.pages[self.path]
+        if self.headers.get("If-None-Match") == etag:
+            self.requests.append((self.path, 304))
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.requests.append((self.path, 200))
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    CachingHandler.pages = {}
+    CachingHandler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), CachingHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def cache(setup_tmpdir):
+    cache = http_cache.configure(os.path.join(setup_tmpdir, "http_cache"))
+    yield cache
+    http_cache.configure(None)
+
+
+class StandInExtractor(BaseMangaExtractor):
+    site_name = "Stand-in"
+    site_id = 99
+    cache_ttl = 0
+    nr_parsed = 0
+
+    def extract(self):
+        StandInExtractor.nr_parsed += 1
+        data = json.loads(self.get_html(self.url))
+        return MangaExtractorData(
+            title_eng=data["title"], title_foreign=None, language="English", pages=1,
+            status_id=1, nsfw=0, note=None, category=[], collection=[], groups=[],
+            artist=[], parody=[], character=[], tag=[], url=self.url, id_onpage="1",
+            imported_from=self.site_id, censor_id=1, upload_date=datetime.date(2020, 1, 1),
+            uploader=None, rating=None, ratings=None, favorites=None)
+
+    def get_cover(self):
+        return f"{self.url}/cover"
+
+
+def test_get_html_revalidation(server, cache, monkeypatch):
+    CachingHandler.pages["/a"] = ('"v1"', b'{"title": "A"}')
+    url = f"{server}/a"
+
+    monkeypatch.setattr(StandInExtractor, "cache_ttl", 3600)
+    assert StandInExtractor.get_html(url) == '{"title": "A"}'
+    # fresh -> no request at all
+    assert StandInExtractor.get_html(url) == '{"title": "A"}'
+    assert CachingHandler.requests == [("/a", 200)]
+
+    monkeypatch.setattr(StandInExtractor, "cache_ttl", 0)
+    assert StandInExtractor.get_html(url) == '{"title": "A"}'
+    assert CachingHandler.requests[-1] == ("/a", 304)
+    assert cache.version(url) == 1
+
+    CachingHandler.pages["/a"] = ('"v2"', b'{"title": "A2"}')
+    assert StandInExtractor.get_html(url) == '{"title": "A2"}'
+    assert CachingHandler.requests[-1] == ("/a", 200)
+    assert cache.version(url) == 2
+
+
+def test_extract_cached(server, cache):
+    StandInExtractor.nr_parsed = 0
+    CachingHandler.pages["/b"] = ('"v1"', b'{"title": "B"}')
+    url = f"{server}/b"
+
+    data, cover = StandInExtractor(url).extract_cached()
+    assert data.title_eng == "B"
+    assert cover == f"{url}/cover"
+    assert StandInExtractor.nr_parsed == 1
+
+    # unchanged (304) -> parse result gets re-used
+    data2, cover2 = StandInExtractor(url).extract_cached()
+    assert CachingHandler.requests[-1] == ("/b", 304)
+    assert data2 == data
+    assert cover2 == cover
+    assert StandInExtractor.nr_parsed == 1
+
+    CachingHandler.pages["/b"] = ('"v2"', b'{"title": "B2"}')
+    data3, _ = StandInExtractor(url).extract_cached()
+    assert data3.title_eng == "B2"
+    assert StandInExtractor.nr_parsed == 2
+
+    # gone -> stale parse result isn't used
+    del CachingHandler.pages["/b"]
+    assert StandInExtractor(url).extract_cached() == (None, None)
+    assert CachingHandler.requests[-1] == ("/b", 404)
+    assert StandInExtractor.nr_parsed == 2
+    CachingHandler.pages["/b"] = ('"v2"', b'{"title": "B2"}')
+
+    # no cache configured
+    http_cache.configure(None)
+    data4, _ = StandInExtractor(url).extract_cached()
+    assert data4.title_eng == "B2"
+    assert StandInExtractor.nr_parsed == 3
+
+
+def test_http_cache_lru_eviction(setup_tmpdir):
+    cache = HTTPCache(os.path.join(setup_tmpdir, "lru"), max_size=250)
+    cache.store("http://x/1", b"1" * 100, etag='"1"')
+    cache.store("http://x/2", b"2" * 100)
+    # access makes 1 the most recently used
+    assert cache.get("http://x/1").etag == '"1"'
+    cache.store("http://x/3", b"3" * 100)
+    assert cache.get("http://x/2") is None
+    assert cache.get("http://x/1") is not None
+    assert cache.get("http://x/3") is not None
+    assert cache.total_size() <= 250
+
+    # same body keeps the version
+    assert cache.store("http://x/1", b"1" * 100) == 1
+    assert cache.store("http://x/1", b"changed") == 2
+
+    cache.store_parsed("http://x/1", {"http://x/1": 2}, ("data", None))
+    assert cache.get_parsed("http://x/1") == ({"http://x/1": 2}, ("data", None))
+    cache.close()
@@ -0,0 +1,147 @@
+import os
+import gzip
+import threading
+import urllib.error
+import pytest
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from utils import setup_tmpdir
+
+from manga_db.http_session import HTTPSession, decode_content
+from manga_db.manga_db import MangaDB
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    # keep-alive needs HTTP/1.1
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body, status=200, headers=()):
+        self.send_response(status)
+        for name, val in headers:
+            self.send_header(name, val)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with self.lock:
+            self.connections.add(self.client_address)
+        if self.path == "/gzip":
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                self._send(gzip.compress(b"compressed body"),
+                           headers=[("Content-Encoding", "gzip")])
+            else:
+                self._send(b"compressed body")
+        elif self.path == "/set_cookie":
+            self._send(b"ok", headers=[("Set-Cookie", "session=abc123; Path=/")])
+        elif self.path == "/echo":
+            self._send(f"{self.headers.get('User-Agent')}|{self.headers.get('Cookie')}"
+                       .encode("utf-8"), headers=[("Content-Type", "text/plain; charset=utf-8")])
+        elif self.path == "/close":
+            self._send(b"closing", headers=[("Connection", "close")])
+            self.close_connection = True
+        elif self.path == "/drop":
+            # closes the connection without telling the client
+            self._send(b"dropped")
+            self.close_connection = True
+        elif self.path == "/cover":
+            self._send(b"\x89PNG fake cover", headers=[("Content-Type", "image/png")])
+        else:
+            self._send(b"not found", status=404)
+
+
+@pytest.fixture
+def server():
+    StandInHandler.connections = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_http_session_keep_alive(server):
+    session = HTTPSession(user_agent="MangaDB Test")
+    for _ in range(5):
+        assert session.get(f"{server}/echo").startswith(b"MangaDB Test|")
+    # all requests used the same connection
+    assert session.pool.nr_opened == 1
+    assert len(StandInHandler.connections) == 1
+
+    # server closes the connection -> new one gets opened
+    assert session.get(f"{server}/close") == b"closing"
+    assert session.get(f"{server}/echo").startswith(b"MangaDB Test|")
+    assert session.pool.nr_opened == 2
+
+    # pooled connection was closed by the server in the meantime -> re-sent
+    assert session.get(f"{server}/drop") == b"dropped"
+    assert session.get(f"{server}/echo").startswith(b"MangaDB Test|")
+    assert session.pool.nr_opened == 3
+
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        session.get(f"{server}/missing")
+    assert exc.value.code == 404
+    # connection still usable after an error response
+    nr_opened = session.pool.nr_opened
+    assert session.get(f"{server}/echo").startswith(b"MangaDB Test|")
+    assert session.pool.nr_opened == nr_opened
+    session.close()
+
+
+def test_http_session_decoding_and_cookies(server):
+    session = HTTPSession(user_agent="MangaDB Test")
+    with session.open(f"{server}/gzip") as resp:
+        assert resp.read() == b"compressed body"
+        assert resp.headers.get("Content-Encoding") is None
+        assert resp.headers.get("Content-Length") == str(len(b"compressed body"))
+
+    session.get(f"{server}/set_cookie")
+    assert session.get(f"{server}/echo") == b"MangaDB Test|session=abc123"
+    # explicitly passed headers overwrite the defaults
+    assert session.get(f"{server}/echo", headers={"User-Agent": "Other"}).startswith(b"Other|")
+    session.close()
+
+    assert decode_content(b"plain", None) == b"plain"
+    assert decode_content(gzip.compress(b"x"), "gzip") == b"x"
+    with pytest.raises(ValueError):
+        decode_content(b"x", "compress")
+
+
+def test_http_session_threads(server):
+    session = HTTPSession(max_idle_per_host=4)
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(10):
+                assert session.get(f"{server}/gzip") == b"compressed body"
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    # connections were re-used between requests
+    assert session.pool.nr_opened < 60
+    session.close()
+
+
+def test_download_cover(server, setup_tmpdir):
+    tmpdir = setup_tmpdir
+    assert MangaDB.download_cover(f"{server}/cover", tmpdir, 5, generate_thumbs=False)
+    with open(os.path.join(tmpdir, "5_0"), "rb") as f:
+        assert f.read() == b"\x89PNG fake cover"
+    # exists already
+    assert MangaDB.download_cover(f"{server}/cover", tmpdir, 5, generate_thumbs=False) is None
+    assert MangaDB.download_cover(f"{server}/missing", tmpdir, 6,
+                                  generate_thumbs=False) is False
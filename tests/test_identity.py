@@ -1,11 +1,13 @@
 import os.path
+import time
 import pytest
 
 from utils import setup_mdb_dir, load_db_from_sql_file, TESTS_DIR
 from manga_db.db.id_map import IndentityMap
-from manga_db.db.loading import load_instance
+from manga_db.db.loading import load_instance, load_instances
 from manga_db.manga_db import MangaDB
 from manga_db.manga import Book
+from manga_db.ext_info import ExternalInfo
 
 
 class Obj:
@@ -57,6 +59,83 @@ def test_id_map():
     assert not id_map.get(o2.key)
 
 
+def test_id_map_lru(monkeypatch):
+    id_map = IndentityMap(lru_size=2, lru_max_age=60)
+    # weakref needs a gc-able obj
+    id_map.add(Obj(1))
+    id_map.add(Obj(2))
+    assert len(id_map) == 2
+    # makes 1 the most recently used
+    assert id_map.get((Obj, (1,))) is not None
+    id_map.add(Obj(3))
+    # 2 lost its only reference
+    assert id_map.get((Obj, (2,))) is None
+    assert id_map.get((Obj, (1,))) is not None
+    assert id_map.get((Obj, (3,))) is not None
+    assert id_map.stats() == {"hits": 3, "misses": 1, "size": 2, "lru_size": 2}
+
+    id_map.remove((Obj, (1,)))
+    assert id_map.stats()["lru_size"] == 1
+
+    now = time.monotonic()
+    monkeypatch.setattr("manga_db.db.id_map.time.monotonic", lambda: now + 61)
+    # expired
+    assert id_map.get((Obj, (3,))) is None
+    assert len(id_map) == 0
+
+    # still alive outside the map -> stays in it even if it was dropped from the lru
+    o4 = Obj(4)
+    id_map.add(o4)
+    id_map.add(Obj(5))
+    id_map.add(Obj(6))
+    assert id_map.get(o4.key) is o4
+    id_map.clear()
+    assert id_map.stats()["size"] == 0
+
+    # disabled by default
+    id_map = IndentityMap()
+    id_map.add(Obj(1))
+    assert len(id_map) == 0
+
+
+def test_mdb_id_map_lru(setup_mdb_dir):
+    tmpdir = setup_mdb_dir
+    mdb_file = os.path.join(tmpdir, "manga_db.sqlite")
+    db_con = load_db_from_sql_file(
+        os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql"), mdb_file, True)
+    db_con.close()
+    mdb = MangaDB(tmpdir, mdb_file, id_map_lru_size=8)
+    other = MangaDB(tmpdir, mdb_file)
+
+    b_id = id(mdb.get_book(5))
+    ei_id = id(mdb.get_ext_info(5))
+    # hits although nothing referenced them
+    assert id(mdb.get_book(5)) == b_id
+    assert id(mdb.get_ext_info(5)) == ei_id
+    assert mdb.id_map.stats()["hits"] == 2
+
+    # changes by our own instance keep the cached book
+    mdb.update_tag_name("tag", 1, "Renamed")
+    b = mdb.get_book(5)
+    assert id(b) == b_id
+    assert mdb.id_map.stats()["hits"] == 3
+    del b
+
+    # changed by another connection -> reloaded
+    with other.db_con:
+        other.db_con.execute("UPDATE Books SET pages = 1234 WHERE id = 5")
+    b = mdb.get_book(5)
+    assert b.pages == 1234
+    assert mdb.get_ext_info(5).book_id == 5
+    assert [b.id for b in mdb.get_x_books(3)] == [17, 16, 15]
+
+    b.remove()
+    assert mdb.get_book(5) is None
+    assert mdb.get_ext_info(5) is None
+    mdb.close()
+    other.close()
+
+
 def get_book_row(mdb, _id):
     c = mdb.db_con.execute("SELECT * FROM Books WHERE id = ?", (_id,))
     row = c.fetchone()
@@ -87,3 +166,79 @@ def test_load_instance(monkeypatch, setup_mdb_dir):
     b_2 = load_instance(mdb, Book, b_2)
     assert b_2._in_db
     assert mdb.id_map.get(b_2.key) is b_2
+
+
+def test_load_instances(monkeypatch, setup_mdb_dir):
+    tmpdir = setup_mdb_dir
+    mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    memdb = load_db_from_sql_file(mdb_file, ":memory:", True)
+    monkeypatch.setattr("manga_db.manga_db.MangaDB._load_or_create_sql_db",
+                        lambda x, y, z: (memdb, None))
+    mdb = MangaDB(tmpdir, mdb_file)
+
+    # already in id_map with tag loaded -> won't be re-fetched
+    in_id_map = mdb.get_book(14)
+    in_id_map.tag.append("Unsaved")
+
+    rows = memdb.execute("SELECT * FROM Books ORDER BY id").fetchall()
+    statements = []
+    memdb.set_trace_callback(statements.append)
+    books = load_instances(mdb, Book, rows, eager=["tag", "artist", "ext_infos"])
+    memdb.set_trace_callback(None)
+    # one query per eager column
+    assert len(statements) == 3
+    assert [b.id for b in books] == [r["id"] for r in rows]
+    assert books[13] is in_id_map
+    assert "Unsaved" in in_id_map.tag
+
+    for b in books:
+        assert Book.tag.is_loaded(b)
+        assert Book.artist.is_loaded(b)
+        assert Book.ext_infos.is_loaded(b)
+        assert not Book.parody.is_loaded(b)
+        if b is in_id_map:
+            continue
+        assert not b._committed_state
+        assert sorted(b.tag) == sorted(b._fetch_associated_column("tag"))
+        assert sorted(b.artist) == sorted(b._fetch_associated_column("artist"))
+        assert b.ext_infos == b._fetch_external_infos()
+        assert all(ei.book is b for ei in b.ext_infos)
+
+
+def test_from_row(monkeypatch, setup_mdb_dir):
+    tmpdir = setup_mdb_dir
+    mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    memdb = load_db_from_sql_file(mdb_file, ":memory:", True)
+    monkeypatch.setattr("manga_db.manga_db.MangaDB._load_or_create_sql_db",
+                        lambda x, y, z: (memdb, None))
+    mdb = MangaDB(tmpdir, mdb_file)
+
+    for row in memdb.execute("SELECT * FROM Books").fetchall():
+        fast = Book.from_row(mdb, row)
+        slow = Book(mdb, **row, in_db=True)
+        assert vars(fast) == vars(slow)
+        assert not fast._committed_state
+        assert fast._in_db
+
+    book = Book.from_row(mdb, memdb.execute("SELECT * FROM Books WHERE id = 5").fetchone())
+    for row in memdb.execute("SELECT * FROM ExternalInfo").fetchall():
+        fast = ExternalInfo.from_row(mdb, row, book)
+        slow = ExternalInfo(mdb, book, **row, in_db=True)
+        assert vars(fast) == vars(slow)
+        assert fast.book is book
+
+    # changes still get tracked after loading
+    book.pages = 1000
+    book.tag.append("Added")
+    assert set(book._committed_state) == {"pages", "tag"}
+    assert "Added" not in book._committed_state["tag"]
+    # missing columns are None like with __init__
+    assert Book.from_row(mdb, {"id": 1, "title_eng": "Partial"}).pages is None
+
+    # columns that aren't lazy are fetched right away
+    monkeypatch.setattr(Book.tag, "lazy", False)
+    row = memdb.execute("SELECT * FROM Books WHERE id = 6").fetchone()
+    for book in (Book.from_row(mdb, row), Book(mdb, **row, in_db=True)):
+        assert Book.tag.is_loaded(book)
+        assert not Book.artist.is_loaded(book)
+        assert sorted(vars(book)["tag"]) == sorted(book._fetch_associated_column("tag"))
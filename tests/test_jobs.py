@@ -0,0 +1,257 @@
+import os
+import time
+import datetime
+import threading
+import urllib.error
+import pytest
+
+from utils import setup_tmpdir
+
+from manga_db import jobs
+from manga_db.jobs import (
+    JobQueue, JobError, PENDING, RUNNING, DONE, FAILED, JOBS_FILENAME, backoff_delay,
+    extr_data_to_json, extr_data_from_json
+)
+from manga_db.extractor.base import MangaExtractorData
+
+
+def wait_finished(queue, job_id, timeout=10):
+    start = time.time()
+    while time.time() - start < timeout:
+        job = queue.get(job_id)
+        if job.finished:
+            return job
+        time.sleep(0.01)
+    raise TimeoutError(f"Job {job_id} didn't finish")
+
+
+def test_job_retry_backoff(setup_tmpdir):
+    assert backoff_delay(1) == jobs.BACKOFF_BASE
+    assert backoff_delay(3) == jobs.BACKOFF_BASE * 4
+    assert backoff_delay(100) == jobs.BACKOFF_MAX
+
+    calls = []
+
+    def flaky(job):
+        calls.append(time.time())
+        if len(calls) < 3:
+            raise JobError("try again", retry=True)
+        return {"value": job.payload["value"] * 2}
+
+    def broken(job):
+        raise JobError("permanent", result={"http_code": 404})
+
+    queue = JobQueue(os.path.join(setup_tmpdir, JOBS_FILENAME),
+                     {"flaky": flaky, "broken": broken}, workers=2, backoff_base=0.05)
+    queue.start()
+    with pytest.raises(ValueError):
+        queue.submit("unknown", {})
+
+    job = wait_finished(queue, queue.submit("flaky", {"value": 21}).id)
+    assert job.status == DONE
+    assert job.attempts == 3
+    assert job.result == {"value": 42}
+    # waited 0.05 then 0.1 secs between attempts
+    assert calls[1] - calls[0] >= 0.05
+    assert calls[2] - calls[1] >= 0.1
+
+    # not retried
+    job = wait_finished(queue, queue.submit("broken", {}).id)
+    assert job.status == FAILED
+    assert job.attempts == 1
+    assert job.error == "permanent"
+    assert job.result == {"http_code": 404}
+
+    # gives up after max_attempts
+    calls.clear()
+    job = wait_finished(queue, queue.submit("flaky", {"value": 1}, max_attempts=2).id)
+    assert job.status == FAILED
+    assert job.attempts == 2
+    assert job.error == "try again"
+    assert queue.counts() == {DONE: 1, FAILED: 2}
+    queue.stop()
+
+
+def test_job_site_concurrency(setup_tmpdir):
+    lock = threading.Lock()
+    running = {1: 0, 2: 0}
+    max_running = {1: 0, 2: 0}
+
+    def work(job):
+        site_id = job.site_id
+        with lock:
+            running[site_id] += 1
+            max_running[site_id] = max(max_running[site_id], running[site_id])
+        time.sleep(0.05)
+        with lock:
+            running[site_id] -= 1
+
+    queue = JobQueue(os.path.join(setup_tmpdir, JOBS_FILENAME), {"work": work}, workers=6,
+                     concurrency=lambda site_id: site_id)
+    queue.start()
+    job_ids = [queue.submit("work", {}, site_id=1 + i % 2).id for i in range(8)]
+    for job_id in job_ids:
+        assert wait_finished(queue, job_id).status == DONE
+    assert max_running == {1: 1, 2: 2}
+    queue.stop()
+
+
+def test_job_blocked_workers_wait(setup_tmpdir):
+    def work(job):
+        time.sleep(0.2)
+
+    queue = JobQueue(os.path.join(setup_tmpdir, JOBS_FILENAME), {"work": work}, workers=3,
+                     concurrency=lambda site_id: 1)
+    nr_claims = 0
+    claim = queue._claim
+
+    def counting_claim(*args, **kwargs):
+        nonlocal nr_claims
+        nr_claims += 1
+        return claim(*args, **kwargs)
+
+    queue._claim = counting_claim
+    queue.start()
+    job_ids = [queue.submit("work", {}, site_id=1).id for _ in range(3)]
+    for job_id in job_ids:
+        assert wait_finished(queue, job_id).status == DONE
+    # workers blocked by the site's limit wait till a job finishes instead of polling
+    assert nr_claims < 30
+    queue.stop()
+
+
+def test_job_persistence(setup_tmpdir):
+    db_path = os.path.join(setup_tmpdir, JOBS_FILENAME)
+    done = []
+
+    def work(job):
+        done.append(job.payload["nr"])
+        return {"nr": job.payload["nr"]}
+
+    # not started -> jobs stay pending
+    queue = JobQueue(db_path, {"work": work})
+    pending_id = queue.submit("work", {"nr": 1}).id
+    running_id = queue.submit("work", {"nr": 2}).id
+    # simulate a process that exited while working on the job
+    queue.db_con.execute("UPDATE Jobs SET status = ? WHERE id = ?", (RUNNING, running_id))
+    queue.stop()
+
+    queue = JobQueue(db_path, {"work": work}, workers=1)
+    assert queue.get(pending_id).status == PENDING
+    assert queue.get(running_id).status == RUNNING
+    queue.start()
+    assert wait_finished(queue, pending_id).result == {"nr": 1}
+    assert wait_finished(queue, running_id).result == {"nr": 2}
+    assert sorted(done) == [1, 2]
+    queue.stop()
+
+    # finished jobs are pruned after a while
+    queue = JobQueue(db_path, {"work": work}, inline=True)
+    queue.db_con.execute("UPDATE Jobs SET updated_at = ? WHERE id = ?",
+                         (time.time() - jobs.KEEP_FINISHED_SECS - 1, pending_id))
+    queue.start()
+    assert queue.get(pending_id) is None
+    assert queue.get(running_id).status == DONE
+    queue.stop()
+
+
+def test_job_lease(setup_tmpdir, monkeypatch):
+    # notice changes by the other "process" quickly
+    monkeypatch.setattr(jobs, "POLL_SECS", 0.1)
+    db_path = os.path.join(setup_tmpdir, JOBS_FILENAME)
+    started = threading.Event()
+    finish = threading.Event()
+
+    def work(job):
+        started.set()
+        finish.wait(5)
+
+    # e.g. another process that shares jobs.sqlite
+    other = JobQueue(db_path, {"work": work}, workers=1, lease_secs=0.3)
+    other.start()
+    job_id = other.submit("work", {}).id
+    assert started.wait(5)
+
+    done = []
+    queue = JobQueue(db_path, {"work": lambda job: done.append(job.id)}, workers=1,
+                     lease_secs=0.3)
+    queue.start()
+    # lease gets renewed while the other queue is working on it
+    time.sleep(1)
+    assert done == []
+    assert queue.get(job_id).status == RUNNING
+    finish.set()
+    assert wait_finished(queue, job_id).status == DONE
+    assert done == []
+    other.stop()
+
+    # lease ran out without being renewed -> taken over
+    job_id = queue.submit("work", {}).id
+    wait_finished(queue, job_id)
+    queue.db_con.execute("UPDATE Jobs SET status = ?, owner = ?, lease_until = ? WHERE id = ?",
+                         (RUNNING, "exited", time.time() + 0.3, job_id))
+    assert wait_finished(queue, job_id).status == DONE
+    assert done == [job_id, job_id]
+    queue.stop()
+
+
+def test_job_inline(setup_tmpdir):
+    attempts = []
+
+    def flaky(job):
+        attempts.append(job.attempts)
+        if job.attempts < 2:
+            raise ValueError("not yet")
+        return {"ok": True}
+
+    queue = JobQueue(os.path.join(setup_tmpdir, JOBS_FILENAME), {"flaky": flaky}, inline=True)
+    queue.start()
+    # finished when submit returns, retries without waiting
+    job = queue.submit("flaky", {})
+    assert job.status == DONE
+    assert job.result == {"ok": True}
+    assert attempts == [1, 2]
+    queue.stop()
+
+
+def test_retrieve_book_data_job(setup_tmpdir, monkeypatch):
+    data = MangaExtractorData(
+        title_eng="Title", title_foreign=None, language="English", pages=1, status_id=1,
+        nsfw=0, note=None, category=[], collection=[], groups=[], artist=["Artist"], parody=[],
+        character=[], tag=["Tag"], url="https://www.tsumino.com/entry/1", id_onpage="1",
+        imported_from=1, censor_id=1, upload_date=datetime.date(2020, 1, 2), uploader=None,
+        rating=None, ratings=None, favorites=None)
+    assert extr_data_from_json(extr_data_to_json(data)) == data
+
+    errors = []
+
+    def extract_cached(self):
+        if errors:
+            raise errors.pop()
+        return data, "https://www.tsumino.com/cover.jpg"
+
+    monkeypatch.setattr("manga_db.extractor.base.BaseMangaExtractor.extract_cached",
+                        extract_cached)
+    queue = jobs.open_job_queue(setup_tmpdir, inline=True)
+    job = queue.submit(jobs.JOB_IMPORT, {"url": data.url},
+                       site_id=jobs.site_id_for_url(data.url))
+    assert job.site_id == 1
+    assert job.status == DONE
+    assert job.result["thumb_url"] == "https://www.tsumino.com/cover.jpg"
+    assert job.result["extr_data"]["upload_date"] == "2020-01-02"
+
+    # temporary errors are retried
+    errors.append(urllib.error.HTTPError(data.url, 429, "Too Many Requests", {}, None))
+    job = queue.submit(jobs.JOB_IMPORT, {"url": data.url})
+    assert job.status == DONE
+    assert job.attempts == 2
+
+    errors.append(urllib.error.HTTPError(data.url, 503, "Service Unavailable", {}, None))
+    job = queue.submit(jobs.JOB_IMPORT, {"url": data.url})
+    assert job.status == FAILED
+    assert job.attempts == 1
+    assert job.result == {"http_code": 503}
+
+    job = queue.submit(jobs.JOB_IMPORT, {"url": "https://unsupported.site/1"})
+    assert job.status == FAILED
+    queue.stop()
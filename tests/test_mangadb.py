@@ -13,6 +13,7 @@ from manga_db.manga_db import (
      set_default_user_agent, update_cookies_from_file
 )
 from manga_db.constants import LANG_IDS
+from manga_db.book_view import BOOK_VIEW_ASSOCIATIONS
 
 
 TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -356,7 +357,7 @@ def test_update_in_collection_order(setup_tmpdir):
     other_con = load_db(tmp_db_file)
     actual = other_con.execute(
         "SELECT book_id, in_collection_idx FROM BookCollection "
-        "WHERE collection_id = 1").fetchall()
+        "WHERE collection_id = 1 ORDER BY in_collection_idx").fetchall()
     other_con.close()
     assert actual == book_id_new_coll_idx
 
@@ -439,6 +440,195 @@ def test_update_tag_name(setup_tmpdir):
     assert b4 == mdb.get_collection_info(new_coll_name)
     mdb.db_con.close()
 
+def test_tag_maps(setup_tmpdir):
+    tmpdir = setup_tmpdir
+    mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    tmp_db_file = os.path.join(tmpdir, "manga_db.slite")
+    load_db_from_sql_file(mdb_file, tmp_db_file, True).close()
+
+    mdb = MangaDB(tmpdir, tmp_db_file)
+    # e.g. the webGUI's per-thread connections
+    other = MangaDB(tmpdir, tmp_db_file)
+    coll_map = mdb.get_tag_map("Collection")
+    assert coll_map[1] == "Dolls"
+    assert coll_map["Dolls"] == 1
+    assert mdb.get_tag_map("Collection") is coll_map
+    assert other.get_tag_options("Collection")[0] == (1, "Dolls")
+    with pytest.raises(ValueError):
+        mdb.get_tag_map("Books")
+
+    # missing names are resolved using the DB (case-insensitively)
+    assert mdb.get_tag_ids("Collection", ["Dolls", "dolls", "Not A Coll"]) == [1, 1, None]
+
+    # inserting invalidates the other instance's maps once committed
+    other_tag_map = other.get_tag_map("Tag")
+    book = mdb.get_book(_id=1)
+    book.tag.append("Brand New Tag")
+    book.save()
+    new_tag_id = mdb.get_tag_map("Tag")["Brand New Tag"]
+    assert other.get_tag_map("Tag") is not other_tag_map
+    assert other.get_tag_map("Tag")[new_tag_id] == "Brand New Tag"
+
+    mdb.update_tag_name("tag", new_tag_id, "Renamed Tag")
+    assert other.get_tag_map("Tag")[new_tag_id] == "Renamed Tag"
+    assert "Brand New Tag" not in mdb.get_tag_map("Tag")
+
+    mdb.delete_tag("tag", new_tag_id)
+    assert new_tag_id not in other.get_tag_map("Tag")
+    # other tables were not invalidated
+    assert other.get_tag_map("Collection") is other._tag_maps["Collection"][1]
+    assert mdb.get_tag_map("Collection") is coll_map
+
+    mdb.close()
+    other.close()
+
+
+def test_book_summaries(setup_tmpdir):
+    tmpdir = setup_tmpdir
+    mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    tmp_db_file = os.path.join(tmpdir, "manga_db.slite")
+    load_db_from_sql_file(mdb_file, tmp_db_file, True).close()
+    mdb = MangaDB(tmpdir, tmp_db_file)
+
+    def assert_matches_book(summary):
+        book = mdb.get_book(_id=summary.id)
+        book.update_assoc_columns_from_db()
+        book.update_ext_infos()
+        assert summary.title_eng == book.title_eng
+        assert summary.pages == book.pages
+        assert summary.tag == sorted(book.tag, key=str.lower)
+        assert summary.artist == sorted(book.artist, key=str.lower)
+        assert summary.avg_ext_rating == pytest.approx(book.avg_ext_rating)
+
+    # populated by the migration
+    summaries = mdb.get_x_book_summaries(100)
+    assert [s.id for s in summaries] == [
+        r[0] for r in mdb.db_con.execute("SELECT id FROM Books ORDER BY id DESC")]
+    for summary in summaries:
+        assert_matches_book(summary)
+
+    # same keyset pagination as get_x_books
+    page = mdb.get_x_book_summaries(3, after=(summaries[2].id,),
+                                    order_by="Books.id DESC")
+    assert [s.id for s in page] == [s.id for s in summaries[3:6]]
+    page = mdb.get_x_book_summaries(3, before=(summaries[5].id,),
+                                    order_by="Books.id DESC")
+    assert [s.id for s in page] == [s.id for s in summaries[2:5]]
+    assert [s.id for s in mdb.get_book_summaries([3, 1, 12345, 2])] == [3, 1, 2]
+
+    # same results as search, also when using the tag index
+    tag, other_tag = [r[0] for r in mdb.db_con.execute("""
+        SELECT Tag.name FROM Tag JOIN BookTag bt ON bt.tag_id = Tag.id
+        GROUP BY Tag.id HAVING COUNT(*) BETWEEN 4 AND 6 ORDER BY Tag.id LIMIT 2""")]
+    indexed = MangaDB(tmpdir, tmp_db_file, tag_index=True)
+    for search_str in (f"tag:{tag}", f"tag:{tag};!{other_tag}", f"tag:!{other_tag}",
+                       f"tag:{tag} the"):
+        for order_by in ("Books.id DESC", "Books.pages ASC"):
+            ids = [b.id for b in mdb.search(search_str, order_by=order_by)]
+            assert ids
+            for db in (mdb, indexed):
+                assert [s.id for s in db.search_summaries(
+                    search_str, order_by=order_by)] == ids
+            if len(ids) < 3:
+                continue
+            cursor = ((ids[0],) if order_by.startswith("Books.id") else
+                      (mdb.get_book(_id=ids[0]).pages, ids[0]))
+            for db in (mdb, indexed):
+                assert [s.id for s in db.search_summaries(
+                    search_str, order_by=order_by, limit=1, after=cursor)] == ids[1:2]
+    indexed.close()
+
+    book = mdb.get_book(_id=1)
+    book.tag.append("Aaa New Tag")
+    book.artist = []
+    book.save()
+    summary, = mdb.get_book_summaries([1])
+    assert "Aaa New Tag" in summary.tag
+    assert summary.artist == []
+    assert_matches_book(summary)
+
+    tag_id = mdb.get_tag_map("Tag")["Aaa New Tag"]
+    mdb.update_tag_name("tag", tag_id, "Zzz Renamed")
+    summary, = mdb.get_book_summaries([1])
+    assert summary.tag[-1] == "Zzz Renamed"
+    assert_matches_book(summary)
+
+    ei = book.ext_infos[0]
+    ei.rating = 1.5
+    ei.save()
+    summary, = mdb.get_book_summaries([1])
+    assert_matches_book(summary)
+
+    book.remove()
+    assert mdb.get_book_summaries([1]) == []
+    assert mdb.db_con.execute(
+        "SELECT COUNT(*) FROM BookSummary").fetchone()[0] == len(summaries) - 1
+
+    mdb.close()
+
+
+def test_facet_counts(setup_tmpdir):
+    tmpdir = setup_tmpdir
+    mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    tmp_db_file = os.path.join(tmpdir, "manga_db.slite")
+    load_db_from_sql_file(mdb_file, tmp_db_file, True).close()
+    mdb = MangaDB(tmpdir, tmp_db_file)
+
+    def expected_counts(table_name, book_ids=None):
+        bridge_col = "group_id" if table_name == "Groups" else f"{table_name.lower()}_id"
+        rows = mdb.db_con.execute(f"""
+            SELECT x.id, x.name, bx.book_id FROM {table_name} x
+            JOIN Book{table_name} bx ON bx.{bridge_col} = x.id""").fetchall()
+        counts = {}
+        for _id, name, book_id in rows:
+            if book_ids is None or book_id in book_ids:
+                counts[(_id, name)] = counts.get((_id, name), 0) + 1
+        return counts
+
+    # populated by the migration
+    for table_name in ("Tag", "Artist", "Groups", "List"):
+        assert {(i, n): c for i, n, c in mdb.get_facet_counts(table_name)} == \
+            expected_counts(table_name)
+    tag_counts = mdb.get_facet_counts("Tag")
+    assert [c for _, _, c in tag_counts] == sorted((c for _, _, c in tag_counts), reverse=True)
+    with pytest.raises(ValueError):
+        mdb.get_facet_counts("Books")
+
+    # maintained by the triggers
+    book = mdb.get_book(_id=1)
+    removed_tag = book.tag[0]
+    removed_before = mdb.get_tag_map("Tag")[removed_tag]
+    book.tag.remove(removed_tag)
+    book.tag.append("Brand New Tag")
+    book.save()
+    assert {(i, n): c for i, n, c in mdb.get_facet_counts("Tag")} == expected_counts("Tag")
+    assert ("Brand New Tag", 1) in [(n, c) for _, n, c in mdb.get_facet_counts("Tag")]
+    assert {(i, n): c for i, n, c in mdb.get_facet_counts("Tag", min_count=0)}[
+        (removed_before, removed_tag)] == expected_counts("Tag").get(
+            (removed_before, removed_tag), 0)
+    mdb.get_book(_id=2).remove()
+    assert {(i, n): c for i, n, c in mdb.get_facet_counts("Tag")} == expected_counts("Tag")
+
+    # per search
+    search_str = 'tag:"Nakadashi" artist:!Taniguchi-san'
+    book_ids = {b.id for b in mdb.search(search_str)}
+    assert book_ids
+    facets = mdb.get_search_facets(search_str, tables=("Tag", "Artist"))
+    assert set(facets) == {"Tag", "Artist"}
+    for table_name, values in facets.items():
+        assert {(i, n): c for i, n, c in values} == expected_counts(table_name, book_ids)
+    # no search conditions -> whole library
+    assert mdb.get_search_facets("", tables=("Tag",)) == {"Tag": mdb.get_facet_counts("Tag")}
+
+    # using the same column multiple times refines the search
+    refined = {b.id for b in mdb.search('tag:Nakadashi tag:Stockings')}
+    assert refined
+    assert refined == {b.id for b in mdb.search('tag:Nakadashi;Stockings')}
+    assert refined < {b.id for b in mdb.search('tag:Nakadashi')}
+
+    mdb.close()
+
+
 def test_delete_tag(setup_tmpdir):
     tmpdir = setup_tmpdir
     mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
@@ -479,7 +669,6 @@ def test_delete_tag(setup_tmpdir):
     
     coll_name = "Dolls"
     mdb.delete_tag('collection', 1)
-    mdb.db_con.close()
 
     other_con = load_db(tmp_db_file)
     actual = other_con.execute("SELECT name FROM Collection WHERE id = 1").fetchone()
@@ -513,3 +702,88 @@ def test_delete_tag(setup_tmpdir):
     # already removed so it should be empty
     assert in_id_map[4].collection == []
     assert 'collection' not in in_id_map[4]._committed_state
+
+    # lazily loaded columns of books that weren't in the idmap need the connection
+    mdb.db_con.close()
+
+
+def test_migration_check_skipped(setup_tmpdir, monkeypatch):
+    tmpdir = setup_tmpdir
+    sql_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    db_file = os.path.join(tmpdir, "manga_db.sqlite")
+    # db was migrated before the version was mirrored in user_version
+    load_db_from_sql_file(sql_file, db_file).close()
+
+    import manga_db.db.migrate as migrate
+    opened = []
+    unpatched_init = migrate.Database.__init__
+
+    def patched_init(self, filename):
+        opened.append(filename)
+        unpatched_init(self, filename)
+
+    monkeypatch.setattr("manga_db.db.migrate.Database.__init__", patched_init)
+
+    mdb = MangaDB(tmpdir, db_file)
+    assert opened == [db_file]
+    assert mdb.db_con.execute("PRAGMA user_version").fetchone()[0] == migrate.LATEST_VERSION
+    mdb.close()
+
+    # version is read from the db header -> no migration handshake
+    for _ in range(3):
+        MangaDB(tmpdir, db_file).close()
+    assert opened == [db_file]
+
+    # newly created dbs are marked as current as well
+    new_file = os.path.join(tmpdir, "new.sqlite")
+    MangaDB(tmpdir, new_file).close()
+    MangaDB(tmpdir, new_file).close()
+    assert opened == [db_file]
+
+    # outdated version still gets migrated
+    monkeypatch.setattr("manga_db.db.migrate.LATEST_VERSION", migrate.LATEST_VERSION + 1)
+    with pytest.raises(migrate.MigrationMissing):
+        MangaDB(tmpdir, new_file)
+    assert opened == [db_file, new_file]
+
+
+def test_book_views(monkeypatch, setup_mdb_dir):
+    tmpdir = setup_mdb_dir
+    mdb_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    memdb = load_db_from_sql_file(mdb_file, ":memory:", True)
+    monkeypatch.setattr("manga_db.manga_db.MangaDB._load_or_create_sql_db",
+                        lambda x, y, z: (memdb, None))
+    mdb = MangaDB(tmpdir, mdb_file)
+    ids = [r[0] for r in memdb.execute("SELECT id FROM Books ORDER BY id")]
+
+    views = mdb.get_book_views(ids, associations=BOOK_VIEW_ASSOCIATIONS)
+    assert [v.id for v in views] == ids
+    # bypass the id_map
+    assert len(mdb.id_map) == 0
+    for view in views:
+        book = mdb.get_book(view.id)
+        assert view.to_export_string(mdb.language_map) == book.to_export_string()
+        assert view.title == book.title
+        assert view.cover_timestamp == book.cover_timestamp
+        assert list(view.tag) == book.tag
+        assert [ei.url for ei in view.ext_infos] == [ei.url for ei in book.ext_infos]
+
+    view, = mdb.get_book_views([5], columns=("title_eng", "pages"), associations=("tag",))
+    assert view._fields == ("id", "title_eng", "pages", "tag")
+    assert view == (5, mdb.get_book(5).title_eng, mdb.get_book(5).pages,
+                    tuple(mdb.get_book(5).tag))
+    with pytest.raises(AttributeError):
+        view.pages = 5
+    with pytest.raises(AttributeError):
+        view.note
+
+    # unsaved changes to loaded books aren't visible
+    book = mdb.get_book(5)
+    book.pages = 1000
+    assert mdb.get_book_view(5, columns=("pages",)).pages != 1000
+    assert [v.id for v in mdb.get_book_views([3, 12345, 1], columns=())] == [3, 1]
+    assert mdb.get_book_view(12345) is None
+    with pytest.raises(ValueError):
+        mdb.get_book_views([1], columns=("id; DROP TABLE Books",))
+    with pytest.raises(ValueError):
+        mdb.get_book_views([1], associations=("foo",))
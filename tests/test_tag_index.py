@@ -0,0 +1,136 @@
+import os
+import sqlite3
+import pytest
+
+from utils import TESTS_DIR, load_db_from_sql_file
+
+from manga_db.manga_db import MangaDB
+from manga_db.manga import Book
+from manga_db.db.tag_index import TagIndex, ids_to_bitmap, bitmap_to_ids
+
+
+def test_bitmap_conversion():
+    ids = [0, 1, 7, 8, 9, 63, 64, 1000]
+    bitmap = ids_to_bitmap(ids)
+    assert bitmap == sum(1 << i for i in ids)
+    assert bitmap_to_ids(bitmap) == ids
+    assert ids_to_bitmap([]) == 0
+    assert bitmap_to_ids(0) == []
+
+
+def test_tag_index_add_remove(monkeypatch):
+    monkeypatch.setattr("manga_db.db.tag_index.SPARSE_MAX_BOOKS", 2)
+    idx = TagIndex(["Tag", "List"])
+    idx._values = {"Tag": {}, "List": {}}
+    idx._counts = {"Tag": {}, "List": {}}
+
+    idx.add("Tag", [(1, 10), (2, 10), (2, 11)])
+    assert idx._values["Tag"] == {10: {1, 2}, 11: {2}}
+    # exceeds SPARSE_MAX_BOOKS -> converted to a bitmap
+    idx.add("Tag", [(5, 10), (5, 10)])
+    assert idx._values["Tag"][10] == ids_to_bitmap([1, 2, 5])
+    assert idx._counts["Tag"][10] == 3
+    idx.add("List", [(5, 1)])
+
+    assert idx.evaluate([("Tag", 10)]) == [1, 2, 5]
+    assert idx.evaluate([("Tag", 10), ("Tag", 11)]) == [2]
+    assert idx.evaluate([("Tag", 10)], [("Tag", 11)]) == [1, 5]
+    assert idx.evaluate([("Tag", 10)], [("Tag", 11), ("List", 1)]) == [1]
+    assert idx.evaluate([("Tag", 11)], [("Tag", 10)]) == []
+    assert idx.evaluate([("Tag", 10), ("Tag", 12)]) == []
+    with pytest.raises(ValueError):
+        idx.evaluate([], [("Tag", 10)])
+
+    idx.remove("Tag", [(2, 10), (2, 11), (3, 10)])
+    assert idx.evaluate([("Tag", 10)]) == [1, 5]
+    assert idx._counts["Tag"][10] == 2
+    assert 11 not in idx._values["Tag"]
+    idx.remove_value("Tag", 10)
+    assert idx.evaluate([("Tag", 10)]) == []
+
+
+@pytest.mark.parametrize("sparse_max_books", [256, 1])
+def test_search_tag_index(monkeypatch, sparse_max_books):
+    monkeypatch.setattr("manga_db.db.tag_index.SPARSE_MAX_BOOKS", sparse_max_books)
+    db_file = os.path.join(TESTS_DIR, "db_test_files", "manga_db.sqlite.sql")
+    memdb = load_db_from_sql_file(db_file, ":memory:", True)
+    monkeypatch.setattr("manga_db.manga_db.MangaDB._load_or_create_sql_db",
+                        lambda x, y, z: (memdb, None))
+    mdb = MangaDB(os.path.dirname(db_file), db_file, tag_index=True)
+    tag_index = mdb.tag_index
+    assert tag_index is not None
+
+    def search_ids(search_str, **kwargs):
+        mdb.tag_index = None
+        expected = [b.id for b in mdb.search(search_str, eager=(), **kwargs)]
+        mdb.tag_index = tag_index
+        actual = [b.id for b in mdb.search(search_str, eager=(), **kwargs)]
+        assert actual == expected
+        return actual
+
+    searches = [
+        "tag:Nakadashi",
+        "tag:Nakadashi;Stockings",
+        "tag:Nakadashi;!Stockings list:!to-read",
+        "tag:Nakadashi artist:!Taniguchi-san",
+        'tag:"Large Breasts;Anal" list:!downloaded',
+        "tag:Nakadashi title:dolls",
+        "tag:Nakadashi nsfw:1",
+        "tag:Nakadashi;Not A Tag",
+        "tag:Nakadashi;!Not A Tag",
+    ]
+    for search_str in searches:
+        for order_by in ("Books.id DESC", "Books.id ASC", "Books.title_eng ASC",
+                         "Books.pages DESC", "Books.my_rating DESC"):
+            search_ids(search_str, order_by=order_by)
+
+    # paging
+    all_ids = search_ids("tag:Nakadashi")
+    assert len(all_ids) > 6
+    assert search_ids("tag:Nakadashi", limit=3) == all_ids[:3]
+    assert search_ids("tag:Nakadashi", limit=3, after=(all_ids[2],)) == all_ids[3:6]
+    assert search_ids("tag:Nakadashi", limit=3, before=(all_ids[5],)) == all_ids[2:5]
+    by_pages = search_ids("tag:Nakadashi", order_by="Books.pages ASC")
+    pages = {r[0]: r[1] for r in mdb.db_con.execute("SELECT id, pages FROM Books")}
+    assert search_ids("tag:Nakadashi", order_by="Books.pages ASC", limit=3,
+                      after=(pages[by_pages[1]], by_pages[1])) == by_pages[2:5]
+    # the temp table doesn't leave a transaction open
+    assert not mdb.db_con.in_transaction
+
+    # changes through the save/delete paths are applied to the index
+    book = mdb.get_book(_id=all_ids[0])
+    book.tag.remove("Nakadashi")
+    book.tag.append("Brand New Tag")
+    book.save()
+    assert all_ids[0] not in search_ids("tag:Nakadashi")
+    assert search_ids('tag:"Brand New Tag"') == [all_ids[0]]
+    assert not tag_index.stale
+
+    # changes of a save that gets rolled back never reach the index
+    update_assoc_cols = Book._update_associated_columns
+
+    def failing_update(self):
+        update_assoc_cols(self)
+        raise sqlite3.OperationalError("disk I/O error")
+
+    failed = all_ids[2]
+    book = mdb.get_book(_id=failed)
+    book.tag.remove("Nakadashi")
+    with monkeypatch.context() as m:
+        m.setattr(Book, "_update_associated_columns", failing_update)
+        with pytest.raises(sqlite3.OperationalError):
+            book.save()
+    mdb.id_map.clear()
+    # next commit doesn't apply the discarded changes
+    book = mdb.get_book(_id=all_ids[0])
+    book.tag.append("Another New Tag")
+    book.save()
+    assert failed in search_ids("tag:Nakadashi")
+
+    other = all_ids[1]
+    book = mdb.get_book(_id=other)
+    book.remove()
+    assert tag_index.stale
+    assert other not in search_ids("tag:Nakadashi")
+
+    mdb.close()
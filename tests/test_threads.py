@@ -1,11 +1,16 @@
 import os
+import time
+import asyncio
 import shutil
 import logging
 import pytest
 import sqlite3
+import datetime
 
 from utils import setup_mdb_dir, import_json, gen_hash_from_file, load_db_from_sql_file
-from manga_db.threads import import_multiple
+from manga_db.threads import import_multiple, TokenBucket, SiteLimiter, BatchImporter
+from manga_db.manga_db import MangaDB
+from manga_db.extractor.base import BaseMangaExtractor, MangaExtractorData
 
 TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
 
@@ -94,6 +99,152 @@ def test_import_multiple(setup_mdb_dir, monkeypatch, caplog):
         assert actual == expected
 
 
+def test_token_bucket():
+    async def take(bucket, n):
+        start = time.monotonic()
+        for _ in range(n):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # burst is available immediately
+    assert asyncio.run(take(TokenBucket(10, 3), 3)) < 0.05
+    # afterwards one token every 1/rate seconds
+    assert asyncio.run(take(TokenBucket(10, 1), 3)) >= 0.18
+    # unlimited
+    assert asyncio.run(take(TokenBucket(0, 1), 100)) < 0.05
+
+
+def test_site_limiters_independent():
+    class SlowExtractor(BaseMangaExtractor):
+        max_concurrency = 1
+        rate_limit = 0.01
+        rate_limit_burst = 1
+
+    class FastExtractor(BaseMangaExtractor):
+        max_concurrency = 3
+        rate_limit = 0
+        rate_limit_burst = 1
+
+    async def run():
+        slow, fast = SiteLimiter(SlowExtractor), SiteLimiter(FastExtractor)
+        in_flight = max_in_flight = 0
+
+        async def request(limiter):
+            nonlocal in_flight, max_in_flight
+            async with limiter:
+                in_flight += 1
+                max_in_flight = max(in_flight, max_in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        async with slow:
+            pass
+        # slow site has no tokens left -> blocks for 100s
+        blocked = asyncio.ensure_future(request(slow))
+        # fast site isn't throttled by the slow one
+        await asyncio.wait_for(asyncio.gather(*(request(fast) for _ in range(9))), 1)
+        assert not blocked.done()
+        blocked.cancel()
+        # concurrency of the fast site was limited
+        return max_in_flight
+
+    assert asyncio.run(run()) == 3
+
+
+def extr_data(title_eng, id_onpage, **kwargs):
+    data = dict(
+        title_eng=title_eng, title_foreign=None, language="English", pages=10, status_id=1,
+        nsfw=0, note=None, category=[], collection=[], groups=[], artist=[], parody=[],
+        character=[], tag=[], url=f"https://www.tsumino.com/entry/{id_onpage}",
+        id_onpage=id_onpage, imported_from=1, censor_id=1, upload_date=datetime.date.min,
+        uploader=None, rating=None, ratings=None, favorites=None)
+    data.update(kwargs)
+    return MangaExtractorData(**data)
+
+
+def test_batch_importer(setup_mdb_dir):
+    tmpdir = setup_mdb_dir
+    mdb_file = os.path.join(tmpdir, "manga_db.sqlite")
+    load_db_from_sql_file(os.path.join(
+        TESTS_DIR, "threads_test_files", "manga_db_base.sqlite.sql"), mdb_file).close()
+    mdb = MangaDB(tmpdir, mdb_file)
+    nr_books = mdb.db_con.execute("SELECT COUNT(*) FROM Books").fetchone()[0]
+
+    batch = BatchImporter(mdb, batch_size=3, batch_ms=60000)
+    assert batch.add("url1", extr_data("Batch Book 1", "900001", tag=["New Batch Tag"],
+                                       language="Batch Language"), ["to-read"], True)
+    # fails when inserting the ext info (no such site) after its tags were inserted
+    assert not batch.add("url2", extr_data("Batch Book 2", "900002", imported_from=999,
+                                           tag=["New Batch Tag", "Failed Batch Tag"]),
+                         ["to-read"], False)
+    assert batch.add("url3", extr_data("Batch Book 3", "900003", tag=["New Batch Tag"],
+                                       collection=["Batch Collection"]), [], False)
+    # same title -> only adds the ext info
+    assert batch.add("url4", extr_data("Batch Book 1", "900004", imported_from=2), [], False)
+    assert len(batch) == 3
+    assert batch.due
+    # nothing committed yet
+    other_con = sqlite3.connect(mdb_file)
+    assert not other_con.execute(
+        "SELECT 1 FROM Books WHERE title_eng LIKE 'Batch Book%'").fetchall()
+
+    new_books = batch.commit()
+    assert [url for url, _ in new_books] == ["url1", "url3"]
+    assert not len(batch) and not batch.due
+    assert not mdb.db_con.in_transaction
+
+    c = mdb.db_con.execute("SELECT COUNT(*) FROM Books")
+    assert c.fetchone()[0] == nr_books + 2
+    assert "Failed Batch Tag" not in batch.name_ids["Tag"]
+    assert not mdb.db_con.execute(
+        "SELECT 1 FROM Tag WHERE name = 'Failed Batch Tag'").fetchall()
+
+    b1 = mdb.get_book(_id=new_books[0][1])
+    assert b1.tag == ["New Batch Tag"]
+    assert b1.list == ["to-read"]
+    assert b1.language == "Batch Language"
+    assert sorted(ei.id_onpage for ei in b1.ext_infos) == ["900001", "900004"]
+    assert [ei.downloaded for ei in b1.ext_infos if ei.id_onpage == "900001"] == [1]
+    b3 = mdb.get_book(_id=new_books[1][1])
+    assert b3.tag == ["New Batch Tag"]
+    assert b3.collection == ["Batch Collection"]
+    assert len(other_con.execute(
+        "SELECT 1 FROM Books WHERE title_eng LIKE 'Batch Book%'").fetchall()) == 2
+    other_con.close()
+    mdb.close()
+
+
+
+def test_batch_importer_bridge_row_failure(setup_mdb_dir):
+    tmpdir = setup_mdb_dir
+    mdb_file = os.path.join(tmpdir, "manga_db.sqlite")
+    load_db_from_sql_file(os.path.join(
+        TESTS_DIR, "threads_test_files", "manga_db_base.sqlite.sql"), mdb_file).close()
+    mdb = MangaDB(tmpdir, mdb_file)
+    nr_books = mdb.db_con.execute("SELECT COUNT(*) FROM Books").fetchone()[0]
+    # makes inserting the bridge row of the tag fail
+    mdb.db_con.execute("""
+        CREATE TEMP TRIGGER fail_bad_tag BEFORE INSERT ON BookTag
+        WHEN NEW.tag_id = (SELECT id FROM Tag WHERE name = 'Bad Batch Tag')
+        BEGIN SELECT RAISE(ABORT, 'bad tag'); END""")
+
+    batch = BatchImporter(mdb, batch_size=10, batch_ms=60000)
+    # duplicates get de-duplicated
+    assert batch.add("url1", extr_data("Good Book 1", "910001",
+                                       tag=["Good Tag", "Good Tag", "good tag"]), [], False)
+    assert not batch.add("url2", extr_data("Bad Book", "910002",
+                                           tag=["Good Tag", "Bad Batch Tag"]), [], False)
+    assert batch.add("url3", extr_data("Good Book 2", "910003", tag=["Good Tag"]), [], False)
+
+    new_books = batch.commit()
+    assert [url for url, _ in new_books] == ["url1", "url3"]
+    assert mdb.db_con.execute("SELECT COUNT(*) FROM Books").fetchone()[0] == nr_books + 2
+    assert not mdb.db_con.execute(
+        "SELECT 1 FROM Books WHERE title_eng = 'Bad Book'").fetchall()
+    for _, bid in new_books:
+        assert mdb.get_book(_id=bid).tag == ["Good Tag"]
+    mdb.close()
+
 def all_table_cells(db_con):
     # dont get id since ids wont match since order changes every time
     # same for dates
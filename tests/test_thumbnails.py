@@ -0,0 +1,87 @@
+import os
+
+from PIL import Image
+
+from utils import TESTS_DIR, setup_tmpdir, load_db_from_sql_file
+
+from manga_db.thumbnails import (
+    THUMB_SIZES, THUMB_FORMATS, derivative_path, all_derivative_paths, generate_derivatives,
+    remove_derivatives, has_derivatives, backfill_derivatives, ThumbnailWorker
+)
+
+
+def _save_cover(thumbs_dir, cover_fn, size=(500, 930), mode="RGB", fmt="PNG"):
+    img = Image.new(mode, size, color="red")
+    img.save(os.path.join(thumbs_dir, cover_fn), format=fmt)
+    img.close()
+
+
+def test_generate_derivatives(setup_tmpdir):
+    thumbs_dir = setup_tmpdir
+    _save_cover(thumbs_dir, "1_0")
+    # transparent gif
+    _save_cover(thumbs_dir, "2_0", size=(100, 150), mode="RGBA", fmt="GIF")
+
+    assert not has_derivatives(thumbs_dir, "1_0")
+    assert generate_derivatives(thumbs_dir, "1_0") == len(THUMB_SIZES) * len(THUMB_FORMATS)
+    assert has_derivatives(thumbs_dir, "1_0")
+    for size, (max_w, max_h) in THUMB_SIZES.items():
+        for fmt in THUMB_FORMATS:
+            with Image.open(derivative_path(thumbs_dir, "1_0", size, fmt)) as img:
+                assert img.format == fmt
+                assert img.width <= max_w and img.height <= max_h
+                # keeps aspect ratio
+                assert img.height == max_h
+    # existing ones are skipped
+    assert generate_derivatives(thumbs_dir, "1_0") == 0
+    assert generate_derivatives(thumbs_dir, "1_0", overwrite=True) == 4
+
+    assert generate_derivatives(thumbs_dir, "2_0") == 4
+    # never enlarged
+    with Image.open(derivative_path(thumbs_dir, "2_0", "detail", "WEBP")) as img:
+        assert img.size == (100, 150)
+
+    remove_derivatives(thumbs_dir, "1_0")
+    assert not any(os.path.isfile(p) for p in all_derivative_paths(thumbs_dir, "1_0"))
+    assert has_derivatives(thumbs_dir, "2_0")
+
+
+def test_thumbnail_worker(setup_tmpdir):
+    thumbs_dir = setup_tmpdir
+    _save_cover(thumbs_dir, "1_0")
+    with open(os.path.join(thumbs_dir, "2_0"), "w") as f:
+        f.write("not an image")
+
+    worker = ThumbnailWorker(max_workers=1)
+    future = worker.submit(thumbs_dir, "1_0")
+    # failures are logged and don't raise
+    failed = worker.submit(thumbs_dir, "2_0")
+    worker.wait()
+    assert future.result() == 4
+    assert failed.result() == 0
+    assert has_derivatives(thumbs_dir, "1_0")
+    worker.shutdown()
+
+
+def test_backfill_derivatives(setup_tmpdir):
+    thumbs_dir = setup_tmpdir
+    sql_file = os.path.join(TESTS_DIR, "all_test_files", "manga_db.sqlite.sql")
+    db_con = load_db_from_sql_file(sql_file, ":memory:")
+    db_con.execute("UPDATE Books SET cover_timestamp = 1234 WHERE id = 3")
+    _save_cover(thumbs_dir, "1_0")
+    _save_cover(thumbs_dir, "3_1234")
+    # outdated cover of book 3
+    _save_cover(thumbs_dir, "3_0")
+    generate_derivatives(thumbs_dir, "1_0")
+
+    progress = []
+    written = backfill_derivatives(thumbs_dir, db_con, max_workers=2,
+                                   progress=lambda done, total: progress.append((done, total)))
+    assert written == 4
+    assert progress == [(1, 1)]
+    assert has_derivatives(thumbs_dir, "3_1234")
+    assert not has_derivatives(thumbs_dir, "3_0")
+
+    assert backfill_derivatives(thumbs_dir, db_con) == 0
+    assert backfill_derivatives(thumbs_dir, db_con, overwrite=True) == 8
+    db_con.close()
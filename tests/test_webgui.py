@@ -14,9 +14,12 @@ from werkzeug.security import generate_password_hash, check_password_hash
 
 from manga_db.webGUI import create_app
 from manga_db.ext_info import ExternalInfo
-from manga_db.webGUI.mdb import t_local
+from manga_db.webGUI.mdb import close_mdb_pool, MangaDBPool
+from manga_db.webGUI.job_queue import close_job_queue, get_job_queue
+from manga_db import jobs
 from manga_db.webGUI.json_custom import to_serializable
 from manga_db.constants import LANG_IDS
+from manga_db.thumbnails import get_thumbnail_worker
 from utils import all_book_info, gen_hash_from_file, load_db_from_sql_file
 
 TESTS_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -50,17 +53,19 @@ def app_setup():
 
     # setup flask app for testing
     app = create_app(
-            test_config={"TESTING": True, "DEBUG": False, "SERVER_NAME": "test.test"},
+            # run jobs in the request that submitted them
+            # without the process-wide http cache that would outlive the app
+            test_config={"TESTING": True, "DEBUG": False, "SERVER_NAME": "test.test",
+                         "JOBS_INLINE": True, "HTTP_CACHE_SIZE": 0},
             instance_path=tmpdir
             )
     client = app.test_client()
 
     yield tmpdir, app, client
 
-    # clean up thread local so we avoid a re-used thread using an old mdb connection
-    # from the thread local    
-    t_local.mdb_init = False
-    t_local.mdb = None
+    # close the app's db connections
+    close_job_queue(app)
+    close_mdb_pool(app)
 
 
 def test_login_required(app_setup):
@@ -613,6 +618,50 @@ def test_upload_cover(app_setup):
         # since we overwrite anyway we don't need to check for deletion
 
 
+def test_thumb_static(app_setup):
+    tmpdir, app, client = app_setup
+    setup_authenticated_sess(app, client)
+    thumbs_dir = os.path.join(tmpdir, "thumbs")
+    img = Image.new('RGB', (500, 930), color='red')
+    img.save(os.path.join(thumbs_dir, "1_0"), format="PNG")
+    img.close()
+
+    with app.app_context():
+        url = url_for("main.thumb_static", filename=1, cover_timestamp=0, size="grid")
+        # no derivatives yet -> original gets served and derivatives are generated
+        resp = client.get(url, headers={"Accept": "image/webp,*/*"})
+        assert resp.status_code == 200
+        # originals don't have an extension
+        assert resp.mimetype == "application/octet-stream"
+        # fallback mustn't be cached in place of the derivative
+        assert resp.headers["Cache-Control"] == "no-cache"
+        get_thumbnail_worker().wait()
+
+        resp = client.get(url, headers={"Accept": "image/webp,*/*"})
+        assert resp.mimetype == "image/webp"
+        assert "immutable" in resp.headers["Cache-Control"]
+        assert "Accept" in resp.headers["Vary"]
+        etag = resp.headers["ETag"]
+        assert not etag.startswith("W/")
+        with Image.open(BytesIO(resp.data)) as thumb:
+            assert thumb.height <= 360
+
+        resp = client.get(url, headers={"Accept": "image/webp,*/*",
+                                        "If-None-Match": etag})
+        assert resp.status_code == 304
+
+        # no explicit webp support
+        resp = client.get(url, headers={"Accept": "*/*"})
+        assert resp.mimetype == "image/jpeg"
+        assert resp.headers["ETag"] != etag
+
+        # original without cache busting timestamp isn't cached forever
+        resp = client.get(url_for("main.thumb_static", filename=1))
+        assert resp.mimetype == "application/octet-stream"
+        assert "immutable" not in resp.headers.get("Cache-Control", "")
+        resp.close()
+
+
 tsu_extr_data = {
         'title_eng': 'Sono Shiroki Utsuwa ni Odei o Sosogu', 'title_foreign': 'その白き器に汚泥を注ぐ',
         'uploader': 'MrOverlord12', 'upload_date': datetime.date(2018, 10, 13), 'pages': 20,
@@ -847,6 +896,35 @@ def test_add_book(app_setup):
                 follow_redirects=True)
     assert not os.path.isfile(tmpcov_path)
 
+    # cover of an imported book is only used once its download job is done
+    cover_fn = os.path.join(TESTS_DIR, "webgui_test_files",
+                            "tsumino_43492_mirai-tantei-nankin-jiken")
+    cover_payload = {"dir_path": os.path.join(tmpdir, "thumbs"), "book_id": None,
+                     "overwrite": True, "forced_filename": "temp_cover_0"}
+    with open(tmpcov_path, "w") as f:
+        f.write("Stale temp cover of an abandoned import")
+    with app.app_context():
+        failed_job = get_job_queue().submit(
+            jobs.JOB_DOWNLOAD_COVER, {**cover_payload, "url": "http://127.0.0.1:1/cover"})
+        done_job = get_job_queue().submit(
+            jobs.JOB_DOWNLOAD_COVER,
+            {**cover_payload, "url": f"file:///{cover_fn}".replace("\\", "/")})
+        assert failed_job.status == jobs.FAILED
+        assert done_job.status == jobs.DONE
+
+        for title, job in (("Cover Job Failed", failed_job), ("Cover Job Done", done_job)):
+            with client.session_transaction() as sess:
+                sess["_csrf_token"] = "token123"
+            data.update({"title_eng": title, "cover_job_id": job.id})
+            resp = client.post(url_for("main.add_book"), data=data)
+            assert (b"Cover was not added" in resp.data) is (job is failed_job)
+        bid_failed, bid_done = [db_con.execute(
+            "SELECT id FROM Books WHERE title_eng = ?", (title,)).fetchone()[0]
+            for title in ("Cover Job Failed", "Cover Job Done")]
+        assert not os.path.isfile(os.path.join(tmpdir, "thumbs", f"{bid_failed}_0"))
+        assert os.path.isfile(os.path.join(tmpdir, "thumbs", f"{bid_done}_0"))
+        assert not os.path.isfile(tmpcov_path)
+
 
 def test_add_ext_info(app_setup, monkeypatch):
     tmpdir, app, client = app_setup
@@ -1015,3 +1093,157 @@ def test_update_book_ext_info(app_setup, monkeypatch):
         # downloaded reset
         assert r[4] == 0
         assert r[5:] == expected
+
+        # the job applied the update, re-loading its result page doesn't apply it again
+        with db_con:
+            db_con.execute("UPDATE ExternalInfo SET downloaded = 1 WHERE id = 6")
+        resp = client.get(resp.request.path)
+        assert b"Differences from Book at external link" in resp.data
+        assert db_con.execute(
+            "SELECT downloaded FROM ExternalInfo WHERE id = 6").fetchone()[0] == 1
+
+
+
+def test_job_status(app_setup):
+    tmpdir, app, client = app_setup
+    setup_authenticated_sess(app, client)
+
+    with app.app_context():
+        queue = get_job_queue()
+        cover_job = queue.submit(jobs.JOB_DOWNLOAD_COVER, {
+            "url": "http://127.0.0.1:1/cover", "dir_path": os.path.join(tmpdir, "thumbs"),
+            "book_id": None, "overwrite": True, "forced_filename": "temp_cover_0"})
+        resp = client.get(url_for("main.job_status", job_id=cover_job.id))
+        assert resp.is_json
+        status = resp.get_json()
+        assert status["status"] == jobs.FAILED
+        assert status["finished"]
+        assert status["attempts"] == jobs.DEFAULT_MAX_ATTEMPTS
+        assert status["error"].startswith("Downloading the cover failed")
+        # cover jobs don't have a page that shows their result
+        assert status["result_url"] is None
+        resp = client.get(url_for("main.show_job", job_id=cover_job.id))
+        assert resp.status_code == 200
+        assert b"Downloading cover" in resp.data
+
+        resp = client.get(url_for("main.job_status", job_id=999))
+        assert resp.status_code == 404
+        resp = client.get(url_for("main.show_job", job_id=999))
+        assert b"No job with id 999 was found" in resp.data
+
+        # finished -> redirected to its result
+        import_job = queue.submit(jobs.JOB_IMPORT, {"url": "https://unsupported.site/1"})
+        result_url = url_for("main.import_book_result", job_id=import_job.id)
+        assert result_url.endswith(client.get(
+            url_for("main.job_status", job_id=import_job.id)).get_json()["result_url"])
+        resp = client.get(url_for("main.show_job", job_id=import_job.id))
+        assert resp.status_code == 302
+        assert result_url.endswith(resp.location)
+        resp = client.get(result_url, follow_redirects=True)
+        assert b"Failed getting book" in resp.data
+
+def test_show_query_plans(app_setup):
+    tmpdir, app, client = app_setup
+    setup_authenticated_sess(app, client)
+
+    with app.app_context():
+        client.get(url_for("main.search_books", q="tag:Large Breasts"))
+        resp = client.get(url_for("main.show_query_plans", n=100))
+        assert resp.mimetype == "text/plain"
+        report = resp.data.decode("utf-8")
+        assert "FROM BookTag WHERE tag_id" in report
+        assert "|--" in report
+
+
+def test_mdb_pool(app_setup):
+    tmpdir, app, client = app_setup
+    pool = MangaDBPool(tmpdir, os.path.join(tmpdir, "manga_db.sqlite"), max_readers=1,
+                       id_map_lru_size=8)
+    assert pool.writer.db_con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    # unsaved changes to the writer's books mustn't outlive the request
+    writer = pool.acquire_writer()
+    writer.get_book(5).title_eng = "Unsaved"
+    pool.release_writer()
+    assert writer.id_map.lru_size == 0
+    assert pool.acquire_writer().get_book(5).title_eng != "Unsaved"
+    pool.release_writer()
+
+    reader = pool.acquire_reader()
+    with pytest.raises(TimeoutError):
+        pool.acquire_reader(timeout=0.01)
+    book = reader.get_book(5)
+    title = book.title_eng
+
+    writer = pool.acquire_writer()
+    writer.db_con.execute("UPDATE Books SET title_eng = 'Changed' WHERE id = 5")
+    assert writer.db_con.in_transaction
+    # writer holds a write transaction but the reader isn't blocked
+    assert reader.db_con.execute(
+        "SELECT title_eng FROM Books WHERE id = 5").fetchone()[0] == title
+    writer.db_con.commit()
+    pool.release_writer()
+    pool.release_reader(reader)
+
+    # re-used reader, but cached book is dropped since the db changed
+    reader = pool.acquire_reader()
+    assert pool.readers == [reader]
+    assert reader.get_book(5).title_eng == "Changed"
+    pool.release_reader(reader)
+    pool.close()
+
+
+def test_mdb_pool_tag_index(app_setup, monkeypatch):
+    tmpdir, app, client = app_setup
+    db_path = os.path.join(tmpdir, "manga_db.sqlite")
+    pool = MangaDBPool(tmpdir, db_path, max_readers=2, tag_index=True)
+    tag_index = pool.tag_index
+    builds = []
+    build = tag_index.build
+
+    def counting_build(*args, **kwargs):
+        builds.append(True)
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(tag_index, "build", counting_build)
+
+    def search_ids(search_str):
+        reader = pool.acquire_reader()
+        assert reader.tag_index is tag_index
+        ids = [b.id for b in reader.search(search_str, eager=())]
+        pool.release_reader(reader)
+        return ids
+
+    assert 5 in search_ids("tag:Femdom")
+    # writer's changes are applied to the shared index without rebuilding it
+    writer = pool.acquire_writer()
+    assert writer.tag_index is tag_index
+    book = writer.get_book(5)
+    book.tag.remove("Femdom")
+    book.tag.append("Shared Index Tag")
+    book.save()
+    pool.release_writer()
+    assert 5 not in search_ids("tag:Femdom")
+    assert search_ids('tag:"Shared Index Tag"') == [5]
+    assert not builds
+
+    # changes by another process lead to a rebuild
+    other = sqlite3.connect(db_path)
+    with other:
+        other.execute("DELETE FROM BookTag WHERE book_id = 5")
+    other.close()
+    assert search_ids('tag:"Shared Index Tag"') == []
+    assert len(builds) == 1
+
+    # same when the writer is in use while the readers notice them, it checks on release
+    writer = pool.acquire_writer()
+    other = sqlite3.connect(db_path)
+    with other:
+        other.execute("INSERT INTO BookTag (book_id, tag_id) SELECT 5, id FROM Tag "
+                      "WHERE name = 'Shared Index Tag'")
+    other.close()
+    assert search_ids('tag:"Shared Index Tag"') == []
+    pool.release_writer()
+    assert search_ids('tag:"Shared Index Tag"') == [5]
+    assert len(builds) == 2
+    pool.close()